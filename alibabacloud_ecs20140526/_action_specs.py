@@ -0,0 +1,4864 @@
+# -*- coding: utf-8 -*-
+# This file is generated by tools/generate_tables.py from the models; don't
+# edit it, rerun the script instead.
+from __future__ import annotations
+
+from typing import NamedTuple, Tuple
+
+class ActionSpec(NamedTuple):
+    method: str
+    style: str
+    # (attribute, wire name) pairs copied into the query when not None.
+    query: Tuple[Tuple[str, str], ...]
+    # (attribute, wire name, style) of complex fields serialized into
+    # `<attribute>_shrink` on the matching *ShrinkRequest.
+    shrink: Tuple[Tuple[str, str, str], ...] = ()
+
+ACTION_SPECS = {
+    'AcceptInquiredSystemEvent': ActionSpec('POST', 'RPC', (
+        ('choice', 'Choice'),
+        ('event_id', 'EventId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ActivateRouterInterface': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+    )),
+    'AddBandwidthPackageIps': ActionSpec('POST', 'RPC', (
+        ('bandwidth_package_id', 'BandwidthPackageId'),
+        ('client_token', 'ClientToken'),
+        ('ip_count', 'IpCount'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AddTags': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'AllocateDedicatedHosts': ActionSpec('POST', 'RPC', (
+        ('network_attributes', 'NetworkAttributes'),
+        ('action_on_maintenance', 'ActionOnMaintenance'),
+        ('auto_placement', 'AutoPlacement'),
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('charge_type', 'ChargeType'),
+        ('client_token', 'ClientToken'),
+        ('cpu_over_commit_ratio', 'CpuOverCommitRatio'),
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('dedicated_host_name', 'DedicatedHostName'),
+        ('dedicated_host_type', 'DedicatedHostType'),
+        ('description', 'Description'),
+        ('min_quantity', 'MinQuantity'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('quantity', 'Quantity'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'AllocateEipAddress': ActionSpec('POST', 'RPC', (
+        ('activity_id', 'ActivityId'),
+        ('bandwidth', 'Bandwidth'),
+        ('client_token', 'ClientToken'),
+        ('isp', 'ISP'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AllocatePublicIpAddress': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('ip_address', 'IpAddress'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vlan_id', 'VlanId'),
+    )),
+    'ApplyAutoSnapshotPolicy': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('auto_snapshot_policy_id', 'autoSnapshotPolicyId'),
+        ('disk_ids', 'diskIds'),
+        ('region_id', 'regionId'),
+    )),
+    'AssignIpv6Addresses': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('ipv_6address', 'Ipv6Address'),
+        ('ipv_6address_count', 'Ipv6AddressCount'),
+        ('ipv_6prefix', 'Ipv6Prefix'),
+        ('ipv_6prefix_count', 'Ipv6PrefixCount'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AssignPrivateIpAddresses': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('ipv_4prefix', 'Ipv4Prefix'),
+        ('ipv_4prefix_count', 'Ipv4PrefixCount'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('secondary_private_ip_address_count', 'SecondaryPrivateIpAddressCount'),
+    )),
+    'AssociateEipAddress': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AssociateHaVip': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('ha_vip_id', 'HaVipId'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AttachClassicLinkVpc': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'AttachDisk': ActionSpec('POST', 'RPC', (
+        ('bootable', 'Bootable'),
+        ('delete_with_instance', 'DeleteWithInstance'),
+        ('device', 'Device'),
+        ('disk_id', 'DiskId'),
+        ('force', 'Force'),
+        ('instance_id', 'InstanceId'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AttachInstanceRamRole': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('owner_id', 'OwnerId'),
+        ('policy', 'Policy'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AttachKeyPair': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'AttachNetworkInterface': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('network_card_index', 'NetworkCardIndex'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('trunk_network_instance_id', 'TrunkNetworkInstanceId'),
+        ('wait_for_network_configuration_ready', 'WaitForNetworkConfigurationReady'),
+    )),
+    'AuthorizeSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('permissions', 'Permissions'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_group_id', 'SourceGroupId'),
+        ('source_group_owner_account', 'SourceGroupOwnerAccount'),
+        ('source_group_owner_id', 'SourceGroupOwnerId'),
+        ('source_port_range', 'SourcePortRange'),
+        ('source_prefix_list_id', 'SourcePrefixListId'),
+    )),
+    'AuthorizeSecurityGroupEgress': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('dest_group_id', 'DestGroupId'),
+        ('dest_group_owner_account', 'DestGroupOwnerAccount'),
+        ('dest_group_owner_id', 'DestGroupOwnerId'),
+        ('dest_prefix_list_id', 'DestPrefixListId'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('permissions', 'Permissions'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_port_range', 'SourcePortRange'),
+    )),
+    'CancelAutoSnapshotPolicy': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('auto_snapshot_policy_id', 'autoSnapshotPolicyId'),
+        ('disk_ids', 'diskIds'),
+        ('region_id', 'regionId'),
+    )),
+    'CancelCopyImage': ActionSpec('POST', 'RPC', (
+        ('image_id', 'ImageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CancelImagePipelineExecution': ActionSpec('POST', 'RPC', (
+        ('execution_id', 'ExecutionId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('template_tag', 'TemplateTag'),
+    )),
+    'CancelPhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'CancelSimulatedSystemEvents': ActionSpec('POST', 'RPC', (
+        ('event_id', 'EventId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CancelTask': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('task_id', 'TaskId'),
+    )),
+    'ConnectRouterInterface': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+    )),
+    'ConvertNatPublicIpToEip': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CopyImage': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('destination_description', 'DestinationDescription'),
+        ('destination_image_name', 'DestinationImageName'),
+        ('destination_region_id', 'DestinationRegionId'),
+        ('dry_run', 'DryRun'),
+        ('encrypt_algorithm', 'EncryptAlgorithm'),
+        ('encrypted', 'Encrypted'),
+        ('image_id', 'ImageId'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'CopySnapshot': ActionSpec('POST', 'RPC', (
+        ('arn', 'Arn'),
+        ('client_token', 'ClientToken'),
+        ('destination_region_id', 'DestinationRegionId'),
+        ('destination_snapshot_description', 'DestinationSnapshotDescription'),
+        ('destination_snapshot_name', 'DestinationSnapshotName'),
+        ('destination_storage_location_arn', 'DestinationStorageLocationArn'),
+        ('encrypted', 'Encrypted'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('retention_days', 'RetentionDays'),
+        ('snapshot_id', 'SnapshotId'),
+        ('tag', 'Tag'),
+    )),
+    'CreateActivation': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('instance_count', 'InstanceCount'),
+        ('instance_name', 'InstanceName'),
+        ('ip_address_range', 'IpAddressRange'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('time_to_live_in_hours', 'TimeToLiveInHours'),
+    )),
+    'CreateAutoProvisioningGroup': ActionSpec('POST', 'RPC', (
+        ('launch_configuration', 'LaunchConfiguration'),
+        ('auto_provisioning_group_name', 'AutoProvisioningGroupName'),
+        ('auto_provisioning_group_type', 'AutoProvisioningGroupType'),
+        ('client_token', 'ClientToken'),
+        ('data_disk_config', 'DataDiskConfig'),
+        ('default_target_capacity_type', 'DefaultTargetCapacityType'),
+        ('description', 'Description'),
+        ('excess_capacity_termination_policy', 'ExcessCapacityTerminationPolicy'),
+        ('execution_mode', 'ExecutionMode'),
+        ('hibernation_options_configured', 'HibernationOptionsConfigured'),
+        ('launch_template_config', 'LaunchTemplateConfig'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_version', 'LaunchTemplateVersion'),
+        ('max_spot_price', 'MaxSpotPrice'),
+        ('min_target_capacity', 'MinTargetCapacity'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('pay_as_you_go_allocation_strategy', 'PayAsYouGoAllocationStrategy'),
+        ('pay_as_you_go_target_capacity', 'PayAsYouGoTargetCapacity'),
+        ('pre_paid_options', 'PrePaidOptions'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_pool_options_shrink', 'ResourcePoolOptions'),
+        ('spot_allocation_strategy', 'SpotAllocationStrategy'),
+        ('spot_instance_interruption_behavior', 'SpotInstanceInterruptionBehavior'),
+        ('spot_instance_pools_to_use_count', 'SpotInstancePoolsToUseCount'),
+        ('spot_target_capacity', 'SpotTargetCapacity'),
+        ('system_disk_config', 'SystemDiskConfig'),
+        ('tag', 'Tag'),
+        ('terminate_instances', 'TerminateInstances'),
+        ('terminate_instances_with_expiration', 'TerminateInstancesWithExpiration'),
+        ('total_target_capacity', 'TotalTargetCapacity'),
+        ('valid_from', 'ValidFrom'),
+        ('valid_until', 'ValidUntil'),
+    ), (
+        ('resource_pool_options', 'ResourcePoolOptions', 'json'),
+    )),
+    'CreateAutoSnapshotPolicy': ActionSpec('POST', 'RPC', (
+        ('copied_snapshots_retention_days', 'CopiedSnapshotsRetentionDays'),
+        ('copy_encryption_configuration', 'CopyEncryptionConfiguration'),
+        ('enable_cross_region_copy', 'EnableCrossRegionCopy'),
+        ('owner_id', 'OwnerId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_location_arn', 'StorageLocationArn'),
+        ('tag', 'Tag'),
+        ('target_copy_regions', 'TargetCopyRegions'),
+        ('auto_snapshot_policy_name', 'autoSnapshotPolicyName'),
+        ('region_id', 'regionId'),
+        ('repeat_weekdays', 'repeatWeekdays'),
+        ('retention_days', 'retentionDays'),
+        ('time_points', 'timePoints'),
+    )),
+    'CreateCapacityReservation': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('end_time', 'EndTime'),
+        ('end_time_type', 'EndTimeType'),
+        ('instance_amount', 'InstanceAmount'),
+        ('instance_type', 'InstanceType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateCommand': ActionSpec('POST', 'RPC', (
+        ('command_content', 'CommandContent'),
+        ('content_encoding', 'ContentEncoding'),
+        ('description', 'Description'),
+        ('enable_parameter', 'EnableParameter'),
+        ('launcher', 'Launcher'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('timeout', 'Timeout'),
+        ('type', 'Type'),
+        ('working_dir', 'WorkingDir'),
+    )),
+    'CreateDedicatedHostCluster': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_cluster_name', 'DedicatedHostClusterName'),
+        ('description', 'Description'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateDeploymentSet': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('deployment_set_name', 'DeploymentSetName'),
+        ('description', 'Description'),
+        ('domain', 'Domain'),
+        ('granularity', 'Granularity'),
+        ('group_count', 'GroupCount'),
+        ('on_unable_to_redeploy_failed_instance', 'OnUnableToRedeployFailedInstance'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('strategy', 'Strategy'),
+    )),
+    'CreateDiagnosticMetricSet': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('metric_ids', 'MetricIds'),
+        ('metric_set_name', 'MetricSetName'),
+        ('region_id', 'RegionId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'CreateDiagnosticReport': ActionSpec('POST', 'RPC', (
+        ('end_time', 'EndTime'),
+        ('metric_set_id', 'MetricSetId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('start_time', 'StartTime'),
+    )),
+    'CreateDisk': ActionSpec('POST', 'RPC', (
+        ('advanced_features', 'AdvancedFeatures'),
+        ('arn', 'Arn'),
+        ('bursting_enabled', 'BurstingEnabled'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('disk_category', 'DiskCategory'),
+        ('disk_name', 'DiskName'),
+        ('encrypt_algorithm', 'EncryptAlgorithm'),
+        ('encrypted', 'Encrypted'),
+        ('instance_id', 'InstanceId'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('multi_attach', 'MultiAttach'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('performance_level', 'PerformanceLevel'),
+        ('provisioned_iops', 'ProvisionedIops'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('size', 'Size'),
+        ('snapshot_id', 'SnapshotId'),
+        ('storage_cluster_id', 'StorageClusterId'),
+        ('storage_set_id', 'StorageSetId'),
+        ('storage_set_partition_number', 'StorageSetPartitionNumber'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateElasticityAssurance': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('assurance_times', 'AssuranceTimes'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('instance_amount', 'InstanceAmount'),
+        ('instance_cpu_core_count', 'InstanceCpuCoreCount'),
+        ('instance_type', 'InstanceType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('recurrence_rules', 'RecurrenceRules'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateForwardEntry': ActionSpec('POST', 'RPC', (
+        ('external_ip', 'ExternalIp'),
+        ('external_port', 'ExternalPort'),
+        ('forward_table_id', 'ForwardTableId'),
+        ('internal_ip', 'InternalIp'),
+        ('internal_port', 'InternalPort'),
+        ('ip_protocol', 'IpProtocol'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CreateHaVip': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('ip_address', 'IpAddress'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('v_switch_id', 'VSwitchId'),
+    )),
+    'CreateHpcCluster': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CreateImage': ActionSpec('POST', 'RPC', (
+        ('architecture', 'Architecture'),
+        ('boot_mode', 'BootMode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('detection_strategy', 'DetectionStrategy'),
+        ('disk_device_mapping', 'DiskDeviceMapping'),
+        ('dry_run', 'DryRun'),
+        ('features', 'Features'),
+        ('image_family', 'ImageFamily'),
+        ('image_name', 'ImageName'),
+        ('image_version', 'ImageVersion'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+        ('tag', 'Tag'),
+    )),
+    'CreateImageComponent': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('component_type', 'ComponentType'),
+        ('component_version', 'ComponentVersion'),
+        ('content', 'Content'),
+        ('description', 'Description'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('system_type', 'SystemType'),
+        ('tag', 'Tag'),
+    )),
+    'CreateImagePipeline': ActionSpec('POST', 'RPC', (
+        ('add_account', 'AddAccount'),
+        ('advanced_options', 'AdvancedOptions'),
+        ('base_image', 'BaseImage'),
+        ('base_image_type', 'BaseImageType'),
+        ('build_content', 'BuildContent'),
+        ('client_token', 'ClientToken'),
+        ('delete_instance_on_failure', 'DeleteInstanceOnFailure'),
+        ('description', 'Description'),
+        ('image_family', 'ImageFamily'),
+        ('image_name', 'ImageName'),
+        ('image_options', 'ImageOptions'),
+        ('import_image_options', 'ImportImageOptions'),
+        ('instance_type', 'InstanceType'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('name', 'Name'),
+        ('nvme_support', 'NvmeSupport'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('repair_mode', 'RepairMode'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('system_disk_size', 'SystemDiskSize'),
+        ('tag', 'Tag'),
+        ('test_content', 'TestContent'),
+        ('to_region_id', 'ToRegionId'),
+        ('v_switch_id', 'VSwitchId'),
+    )),
+    'CreateInstance': ActionSpec('POST', 'RPC', (
+        ('hibernation_options', 'HibernationOptions'),
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('system_disk', 'SystemDisk'),
+        ('affinity', 'Affinity'),
+        ('arn', 'Arn'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('cluster_id', 'ClusterId'),
+        ('credit_specification', 'CreditSpecification'),
+        ('data_disk', 'DataDisk'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('deletion_protection', 'DeletionProtection'),
+        ('deployment_set_group_no', 'DeploymentSetGroupNo'),
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('description', 'Description'),
+        ('dry_run', 'DryRun'),
+        ('host_name', 'HostName'),
+        ('hpc_cluster_id', 'HpcClusterId'),
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('image_family', 'ImageFamily'),
+        ('image_id', 'ImageId'),
+        ('inner_ip_address', 'InnerIpAddress'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_name', 'InstanceName'),
+        ('instance_type', 'InstanceType'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('io_optimized', 'IoOptimized'),
+        ('key_pair_name', 'KeyPairName'),
+        ('node_controller_id', 'NodeControllerId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('password_inherit', 'PasswordInherit'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_interruption_behavior', 'SpotInterruptionBehavior'),
+        ('spot_price_limit', 'SpotPriceLimit'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('storage_set_id', 'StorageSetId'),
+        ('storage_set_partition_number', 'StorageSetPartitionNumber'),
+        ('tag', 'Tag'),
+        ('tenancy', 'Tenancy'),
+        ('use_additional_service', 'UseAdditionalService'),
+        ('user_data', 'UserData'),
+        ('v_switch_id', 'VSwitchId'),
+        ('vlan_id', 'VlanId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateKeyPair': ActionSpec('POST', 'RPC', (
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'CreateLaunchTemplate': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('credit_specification', 'CreditSpecification'),
+        ('data_disk', 'DataDisk'),
+        ('deletion_protection', 'DeletionProtection'),
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('description', 'Description'),
+        ('enable_vm_os_config', 'EnableVmOsConfig'),
+        ('host_name', 'HostName'),
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('image_id', 'ImageId'),
+        ('image_options', 'ImageOptions'),
+        ('image_owner_alias', 'ImageOwnerAlias'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_name', 'InstanceName'),
+        ('instance_type', 'InstanceType'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('io_optimized', 'IoOptimized'),
+        ('ipv_6address_count', 'Ipv6AddressCount'),
+        ('key_pair_name', 'KeyPairName'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('network_interface', 'NetworkInterface'),
+        ('network_type', 'NetworkType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password_inherit', 'PasswordInherit'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('security_options', 'SecurityOptions'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_price_limit', 'SpotPriceLimit'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('tag', 'Tag'),
+        ('template_resource_group_id', 'TemplateResourceGroupId'),
+        ('template_tag', 'TemplateTag'),
+        ('user_data', 'UserData'),
+        ('v_switch_id', 'VSwitchId'),
+        ('version_description', 'VersionDescription'),
+        ('vpc_id', 'VpcId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateLaunchTemplateVersion': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('credit_specification', 'CreditSpecification'),
+        ('data_disk', 'DataDisk'),
+        ('deletion_protection', 'DeletionProtection'),
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('description', 'Description'),
+        ('enable_vm_os_config', 'EnableVmOsConfig'),
+        ('host_name', 'HostName'),
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('image_id', 'ImageId'),
+        ('image_options', 'ImageOptions'),
+        ('image_owner_alias', 'ImageOwnerAlias'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_name', 'InstanceName'),
+        ('instance_type', 'InstanceType'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('io_optimized', 'IoOptimized'),
+        ('ipv_6address_count', 'Ipv6AddressCount'),
+        ('key_pair_name', 'KeyPairName'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('network_interface', 'NetworkInterface'),
+        ('network_type', 'NetworkType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password_inherit', 'PasswordInherit'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('security_options', 'SecurityOptions'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_price_limit', 'SpotPriceLimit'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('tag', 'Tag'),
+        ('user_data', 'UserData'),
+        ('v_switch_id', 'VSwitchId'),
+        ('version_description', 'VersionDescription'),
+        ('vpc_id', 'VpcId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateNatGateway': ActionSpec('POST', 'RPC', (
+        ('bandwidth_package', 'BandwidthPackage'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'CreateNetworkInterface': ActionSpec('POST', 'RPC', (
+        ('business_type', 'BusinessType'),
+        ('client_token', 'ClientToken'),
+        ('connection_tracking_configuration', 'ConnectionTrackingConfiguration'),
+        ('delete_on_release', 'DeleteOnRelease'),
+        ('description', 'Description'),
+        ('enhanced_network', 'EnhancedNetwork'),
+        ('instance_type', 'InstanceType'),
+        ('ipv_4prefix', 'Ipv4Prefix'),
+        ('ipv_4prefix_count', 'Ipv4PrefixCount'),
+        ('ipv_6address', 'Ipv6Address'),
+        ('ipv_6address_count', 'Ipv6AddressCount'),
+        ('ipv_6prefix', 'Ipv6Prefix'),
+        ('ipv_6prefix_count', 'Ipv6PrefixCount'),
+        ('network_interface_name', 'NetworkInterfaceName'),
+        ('network_interface_traffic_config', 'NetworkInterfaceTrafficConfig'),
+        ('network_interface_traffic_mode', 'NetworkInterfaceTrafficMode'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('primary_ip_address', 'PrimaryIpAddress'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('queue_number', 'QueueNumber'),
+        ('queue_pair_number', 'QueuePairNumber'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('rx_queue_size', 'RxQueueSize'),
+        ('secondary_private_ip_address_count', 'SecondaryPrivateIpAddressCount'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('source_dest_check', 'SourceDestCheck'),
+        ('tag', 'Tag'),
+        ('tx_queue_size', 'TxQueueSize'),
+        ('v_switch_id', 'VSwitchId'),
+        ('visible', 'Visible'),
+    )),
+    'CreateNetworkInterfacePermission': ActionSpec('POST', 'RPC', (
+        ('account_id', 'AccountId'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('permission', 'Permission'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CreatePhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('access_point_id', 'AccessPointId'),
+        ('circuit_code', 'CircuitCode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('line_operator', 'LineOperator'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('peer_location', 'PeerLocation'),
+        ('port_type', 'PortType'),
+        ('redundant_physical_connection_id', 'RedundantPhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('type', 'Type'),
+        ('user_cidr', 'UserCidr'),
+        ('bandwidth', 'bandwidth'),
+    )),
+    'CreatePortRangeList': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('entry', 'Entry'),
+        ('max_entries', 'MaxEntries'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_name', 'PortRangeListName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'CreatePrefixList': ActionSpec('POST', 'RPC', (
+        ('address_family', 'AddressFamily'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('entry', 'Entry'),
+        ('max_entries', 'MaxEntries'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_name', 'PrefixListName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'CreateRouteEntry': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('destination_cidr_block', 'DestinationCidrBlock'),
+        ('next_hop_id', 'NextHopId'),
+        ('next_hop_list', 'NextHopList'),
+        ('next_hop_type', 'NextHopType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('route_table_id', 'RouteTableId'),
+    )),
+    'CreateRouterInterface': ActionSpec('POST', 'RPC', (
+        ('access_point_id', 'AccessPointId'),
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('health_check_source_ip', 'HealthCheckSourceIp'),
+        ('health_check_target_ip', 'HealthCheckTargetIp'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('name', 'Name'),
+        ('opposite_access_point_id', 'OppositeAccessPointId'),
+        ('opposite_interface_id', 'OppositeInterfaceId'),
+        ('opposite_interface_owner_id', 'OppositeInterfaceOwnerId'),
+        ('opposite_region_id', 'OppositeRegionId'),
+        ('opposite_router_id', 'OppositeRouterId'),
+        ('opposite_router_type', 'OppositeRouterType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('pricing_cycle', 'PricingCycle'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('role', 'Role'),
+        ('router_id', 'RouterId'),
+        ('router_type', 'RouterType'),
+        ('spec', 'Spec'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'CreateSavingsPlan': ActionSpec('POST', 'RPC', (
+        ('charge_type', 'ChargeType'),
+        ('committed_amount', 'CommittedAmount'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('instance_type_family_group', 'InstanceTypeFamilyGroup'),
+        ('offering_type', 'OfferingType'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('plan_type', 'PlanType'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+    )),
+    'CreateSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_name', 'SecurityGroupName'),
+        ('security_group_type', 'SecurityGroupType'),
+        ('service_managed', 'ServiceManaged'),
+        ('tag', 'Tag'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'CreateSimulatedSystemEvents': ActionSpec('POST', 'RPC', (
+        ('event_type', 'EventType'),
+        ('instance_id', 'InstanceId'),
+        ('not_before', 'NotBefore'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'CreateSnapshot': ActionSpec('POST', 'RPC', (
+        ('category', 'Category'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('disk_id', 'DiskId'),
+        ('instant_access', 'InstantAccess'),
+        ('instant_access_retention_days', 'InstantAccessRetentionDays'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('retention_days', 'RetentionDays'),
+        ('snapshot_name', 'SnapshotName'),
+        ('storage_location_arn', 'StorageLocationArn'),
+        ('tag', 'Tag'),
+    )),
+    'CreateSnapshotGroup': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('disk_id', 'DiskId'),
+        ('exclude_disk_id', 'ExcludeDiskId'),
+        ('instance_id', 'InstanceId'),
+        ('instant_access', 'InstantAccess'),
+        ('instant_access_retention_days', 'InstantAccessRetentionDays'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_location_arn', 'StorageLocationArn'),
+        ('tag', 'Tag'),
+    )),
+    'CreateStorageSet': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('max_partition_number', 'MaxPartitionNumber'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_set_name', 'StorageSetName'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateVSwitch': ActionSpec('POST', 'RPC', (
+        ('cidr_block', 'CidrBlock'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('v_switch_name', 'VSwitchName'),
+        ('vpc_id', 'VpcId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'CreateVirtualBorderRouter': ActionSpec('POST', 'RPC', (
+        ('circuit_code', 'CircuitCode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('local_gateway_ip', 'LocalGatewayIp'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('peer_gateway_ip', 'PeerGatewayIp'),
+        ('peering_subnet_mask', 'PeeringSubnetMask'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vbr_owner_id', 'VbrOwnerId'),
+        ('vlan_id', 'VlanId'),
+    )),
+    'CreateVpc': ActionSpec('POST', 'RPC', (
+        ('cidr_block', 'CidrBlock'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vpc_name', 'VpcName'),
+    )),
+    'DeactivateRouterInterface': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+    )),
+    'DeleteActivation': ActionSpec('POST', 'RPC', (
+        ('activation_id', 'ActivationId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteAutoProvisioningGroup': ActionSpec('POST', 'RPC', (
+        ('auto_provisioning_group_id', 'AutoProvisioningGroupId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('terminate_instances', 'TerminateInstances'),
+    )),
+    'DeleteAutoSnapshotPolicy': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('auto_snapshot_policy_id', 'autoSnapshotPolicyId'),
+        ('region_id', 'regionId'),
+    )),
+    'DeleteBandwidthPackage': ActionSpec('POST', 'RPC', (
+        ('bandwidth_package_id', 'BandwidthPackageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteCommand': ActionSpec('POST', 'RPC', (
+        ('command_id', 'CommandId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteDedicatedHostCluster': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteDeploymentSet': ActionSpec('POST', 'RPC', (
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteDiagnosticMetricSets': ActionSpec('POST', 'RPC', (
+        ('metric_set_ids', 'MetricSetIds'),
+        ('region_id', 'RegionId'),
+    )),
+    'DeleteDiagnosticReports': ActionSpec('POST', 'RPC', (
+        ('region_id', 'RegionId'),
+        ('report_ids', 'ReportIds'),
+    )),
+    'DeleteDisk': ActionSpec('POST', 'RPC', (
+        ('disk_id', 'DiskId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteForwardEntry': ActionSpec('POST', 'RPC', (
+        ('forward_entry_id', 'ForwardEntryId'),
+        ('forward_table_id', 'ForwardTableId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteHaVip': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('ha_vip_id', 'HaVipId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteHpcCluster': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('hpc_cluster_id', 'HpcClusterId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteImage': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('force', 'Force'),
+        ('image_id', 'ImageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteImageComponent': ActionSpec('POST', 'RPC', (
+        ('image_component_id', 'ImageComponentId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteImagePipeline': ActionSpec('POST', 'RPC', (
+        ('image_pipeline_id', 'ImagePipelineId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteInstance': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('force', 'Force'),
+        ('force_stop', 'ForceStop'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('terminate_subscription', 'TerminateSubscription'),
+    )),
+    'DeleteInstances': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('dry_run', 'DryRun'),
+        ('force', 'Force'),
+        ('force_stop', 'ForceStop'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('terminate_subscription', 'TerminateSubscription'),
+    )),
+    'DeleteKeyPairs': ActionSpec('POST', 'RPC', (
+        ('key_pair_names', 'KeyPairNames'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteLaunchTemplate': ActionSpec('POST', 'RPC', (
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteLaunchTemplateVersion': ActionSpec('POST', 'RPC', (
+        ('delete_version', 'DeleteVersion'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteNatGateway': ActionSpec('POST', 'RPC', (
+        ('nat_gateway_id', 'NatGatewayId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteNetworkInterface': ActionSpec('POST', 'RPC', (
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteNetworkInterfacePermission': ActionSpec('POST', 'RPC', (
+        ('force', 'Force'),
+        ('network_interface_permission_id', 'NetworkInterfacePermissionId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeletePhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeletePortRangeList': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeletePrefixList': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_id', 'PrefixListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DeleteRouteEntry': ActionSpec('POST', 'RPC', (
+        ('destination_cidr_block', 'DestinationCidrBlock'),
+        ('next_hop_id', 'NextHopId'),
+        ('next_hop_list', 'NextHopList'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('route_table_id', 'RouteTableId'),
+    )),
+    'DeleteRouterInterface': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'DeleteSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'DeleteSnapshot': ActionSpec('POST', 'RPC', (
+        ('force', 'Force'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'DeleteSnapshotGroup': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_group_id', 'SnapshotGroupId'),
+    )),
+    'DeleteStorageSet': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_set_id', 'StorageSetId'),
+    )),
+    'DeleteVSwitch': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('v_switch_id', 'VSwitchId'),
+    )),
+    'DeleteVirtualBorderRouter': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vbr_id', 'VbrId'),
+    )),
+    'DeleteVpc': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DeregisterManagedInstance': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeAccessPoints': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('type', 'Type'),
+    )),
+    'DescribeAccountAttributes': ActionSpec('POST', 'RPC', (
+        ('attribute_name', 'AttributeName'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeActivations': ActionSpec('POST', 'RPC', (
+        ('activation_id', 'ActivationId'),
+        ('instance_name', 'InstanceName'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeAutoProvisioningGroupHistory': ActionSpec('POST', 'RPC', (
+        ('auto_provisioning_group_id', 'AutoProvisioningGroupId'),
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeAutoProvisioningGroupInstances': ActionSpec('POST', 'RPC', (
+        ('auto_provisioning_group_id', 'AutoProvisioningGroupId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeAutoProvisioningGroups': ActionSpec('POST', 'RPC', (
+        ('auto_provisioning_group_id', 'AutoProvisioningGroupId'),
+        ('auto_provisioning_group_name', 'AutoProvisioningGroupName'),
+        ('auto_provisioning_group_status', 'AutoProvisioningGroupStatus'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeAutoSnapshotPolicyAssociations': ActionSpec('POST', 'RPC', (
+        ('auto_snapshot_policy_id', 'AutoSnapshotPolicyId'),
+        ('disk_id', 'DiskId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeAutoSnapshotPolicyEx': ActionSpec('POST', 'RPC', (
+        ('auto_snapshot_policy_id', 'AutoSnapshotPolicyId'),
+        ('auto_snapshot_policy_name', 'AutoSnapshotPolicyName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeAvailableResource': ActionSpec('POST', 'RPC', (
+        ('cores', 'Cores'),
+        ('data_disk_category', 'DataDiskCategory'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('destination_resource', 'DestinationResource'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_type', 'InstanceType'),
+        ('io_optimized', 'IoOptimized'),
+        ('memory', 'Memory'),
+        ('network_category', 'NetworkCategory'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('scope', 'Scope'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('system_disk_category', 'SystemDiskCategory'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeBandwidthLimitation': ActionSpec('POST', 'RPC', (
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_type', 'InstanceType'),
+        ('operation_type', 'OperationType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('spot_strategy', 'SpotStrategy'),
+    )),
+    'DescribeBandwidthPackages': ActionSpec('POST', 'RPC', (
+        ('bandwidth_package_id', 'BandwidthPackageId'),
+        ('nat_gateway_id', 'NatGatewayId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeCapacityReservationInstances': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeCapacityReservations': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_type', 'InstanceType'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeClassicLinkInstances': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DescribeCloudAssistantSettings': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('setting_type', 'SettingType'),
+    )),
+    'DescribeCloudAssistantStatus': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('ostype', 'OSType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeClusters': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeCommands': ActionSpec('POST', 'RPC', (
+        ('command_id', 'CommandId'),
+        ('content_encoding', 'ContentEncoding'),
+        ('description', 'Description'),
+        ('latest', 'Latest'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('provider', 'Provider'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('type', 'Type'),
+    )),
+    'DescribeDedicatedHostAutoRenew': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_ids', 'DedicatedHostIds'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeDedicatedHostClusters': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_cluster_ids', 'DedicatedHostClusterIds'),
+        ('dedicated_host_cluster_name', 'DedicatedHostClusterName'),
+        ('lock_reason', 'LockReason'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeDedicatedHostTypes': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_type', 'DedicatedHostType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('supported_instance_type_family', 'SupportedInstanceTypeFamily'),
+    )),
+    'DescribeDedicatedHosts': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('dedicated_host_ids', 'DedicatedHostIds'),
+        ('dedicated_host_name', 'DedicatedHostName'),
+        ('dedicated_host_type', 'DedicatedHostType'),
+        ('lock_reason', 'LockReason'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('query_inventory', 'QueryInventory'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('socket_details', 'SocketDetails'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeDeploymentSetSupportedInstanceTypeFamily': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('strategy', 'Strategy'),
+    )),
+    'DescribeDeploymentSets': ActionSpec('POST', 'RPC', (
+        ('deployment_set_ids', 'DeploymentSetIds'),
+        ('deployment_set_name', 'DeploymentSetName'),
+        ('domain', 'Domain'),
+        ('granularity', 'Granularity'),
+        ('network_type', 'NetworkType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('strategy', 'Strategy'),
+    )),
+    'DescribeDiagnosticMetricSets': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('metric_set_ids', 'MetricSetIds'),
+        ('next_token', 'NextToken'),
+        ('region_id', 'RegionId'),
+        ('resource_type', 'ResourceType'),
+        ('type', 'Type'),
+    )),
+    'DescribeDiagnosticMetrics': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('metric_ids', 'MetricIds'),
+        ('next_token', 'NextToken'),
+        ('region_id', 'RegionId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'DescribeDiagnosticReportAttributes': ActionSpec('POST', 'RPC', (
+        ('region_id', 'RegionId'),
+        ('report_id', 'ReportId'),
+    )),
+    'DescribeDiagnosticReports': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('region_id', 'RegionId'),
+        ('report_ids', 'ReportIds'),
+        ('resource_ids', 'ResourceIds'),
+        ('severity', 'Severity'),
+        ('status', 'Status'),
+    )),
+    'DescribeDiskDefaultKMSKeyId': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeDiskEncryptionByDefaultStatus': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeDiskMonitorData': ActionSpec('POST', 'RPC', (
+        ('disk_id', 'DiskId'),
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeDisks': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('additional_attributes', 'AdditionalAttributes'),
+        ('auto_snapshot_policy_id', 'AutoSnapshotPolicyId'),
+        ('category', 'Category'),
+        ('delete_auto_snapshot', 'DeleteAutoSnapshot'),
+        ('delete_with_instance', 'DeleteWithInstance'),
+        ('disk_charge_type', 'DiskChargeType'),
+        ('disk_ids', 'DiskIds'),
+        ('disk_name', 'DiskName'),
+        ('disk_type', 'DiskType'),
+        ('dry_run', 'DryRun'),
+        ('enable_auto_snapshot', 'EnableAutoSnapshot'),
+        ('enable_automated_snapshot_policy', 'EnableAutomatedSnapshotPolicy'),
+        ('enable_shared', 'EnableShared'),
+        ('encrypted', 'Encrypted'),
+        ('instance_id', 'InstanceId'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('lock_reason', 'LockReason'),
+        ('max_results', 'MaxResults'),
+        ('multi_attach', 'MultiAttach'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('portable', 'Portable'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeDisksFullStatus': ActionSpec('POST', 'RPC', (
+        ('event_time', 'EventTime'),
+        ('disk_id', 'DiskId'),
+        ('event_id', 'EventId'),
+        ('event_type', 'EventType'),
+        ('health_status', 'HealthStatus'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeEipAddresses': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('allocation_id', 'AllocationId'),
+        ('associated_instance_id', 'AssociatedInstanceId'),
+        ('associated_instance_type', 'AssociatedInstanceType'),
+        ('charge_type', 'ChargeType'),
+        ('eip_address', 'EipAddress'),
+        ('isp', 'ISP'),
+        ('lock_reason', 'LockReason'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+    )),
+    'DescribeEipMonitorData': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeElasticityAssuranceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeElasticityAssuranceInstances': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeElasticityAssurances': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_type', 'InstanceType'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('package_type', 'PackageType'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeEniMonitorData': ActionSpec('POST', 'RPC', (
+        ('end_time', 'EndTime'),
+        ('eni_id', 'EniId'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeForwardTableEntries': ActionSpec('POST', 'RPC', (
+        ('forward_entry_id', 'ForwardEntryId'),
+        ('forward_table_id', 'ForwardTableId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeHaVips': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeHpcClusters': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('hpc_cluster_ids', 'HpcClusterIds'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeImageComponents': ActionSpec('POST', 'RPC', (
+        ('component_type', 'ComponentType'),
+        ('component_version', 'ComponentVersion'),
+        ('image_component_id', 'ImageComponentId'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner', 'Owner'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('system_type', 'SystemType'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeImageFromFamily': ActionSpec('POST', 'RPC', (
+        ('image_family', 'ImageFamily'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeImagePipelineExecutions': ActionSpec('POST', 'RPC', (
+        ('execution_id', 'ExecutionId'),
+        ('image_pipeline_id', 'ImagePipelineId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeImagePipelines': ActionSpec('POST', 'RPC', (
+        ('image_pipeline_id', 'ImagePipelineId'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeImageSharePermission': ActionSpec('POST', 'RPC', (
+        ('image_id', 'ImageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeImageSupportInstanceTypes': ActionSpec('POST', 'RPC', (
+        ('action_type', 'ActionType'),
+        ('filter', 'Filter'),
+        ('image_id', 'ImageId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeImages': ActionSpec('POST', 'RPC', (
+        ('action_type', 'ActionType'),
+        ('architecture', 'Architecture'),
+        ('dry_run', 'DryRun'),
+        ('filter', 'Filter'),
+        ('image_family', 'ImageFamily'),
+        ('image_id', 'ImageId'),
+        ('image_name', 'ImageName'),
+        ('image_owner_alias', 'ImageOwnerAlias'),
+        ('image_owner_id', 'ImageOwnerId'),
+        ('instance_type', 'InstanceType'),
+        ('is_public', 'IsPublic'),
+        ('is_support_cloudinit', 'IsSupportCloudinit'),
+        ('is_support_io_optimized', 'IsSupportIoOptimized'),
+        ('ostype', 'OSType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('show_expired', 'ShowExpired'),
+        ('snapshot_id', 'SnapshotId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('usage', 'Usage'),
+    )),
+    'DescribeInstanceAttachmentAttributes': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceAttribute': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('renewal_status', 'RenewalStatus'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceHistoryEvents': ActionSpec('POST', 'RPC', (
+        ('event_publish_time', 'EventPublishTime'),
+        ('not_before', 'NotBefore'),
+        ('event_cycle_status', 'EventCycleStatus'),
+        ('event_id', 'EventId'),
+        ('event_type', 'EventType'),
+        ('impact_level', 'ImpactLevel'),
+        ('instance_event_cycle_status', 'InstanceEventCycleStatus'),
+        ('instance_event_type', 'InstanceEventType'),
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeInstanceMaintenanceAttributes': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceModificationPrice': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('data_disk', 'DataDisk'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceMonitorData': ActionSpec('POST', 'RPC', (
+        ('end_time', 'EndTime'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeInstanceRamRole': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceStatus': ActionSpec('POST', 'RPC', (
+        ('cluster_id', 'ClusterId'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeInstanceTopology': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceTypeFamilies': ActionSpec('POST', 'RPC', (
+        ('generation', 'Generation'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceTypes': ActionSpec('POST', 'RPC', (
+        ('additional_attributes', 'AdditionalAttributes'),
+        ('cpu_architecture', 'CpuArchitecture'),
+        ('cpu_architectures', 'CpuArchitectures'),
+        ('gpuspec', 'GPUSpec'),
+        ('gpu_specs', 'GpuSpecs'),
+        ('instance_categories', 'InstanceCategories'),
+        ('instance_category', 'InstanceCategory'),
+        ('instance_family_level', 'InstanceFamilyLevel'),
+        ('instance_type_families', 'InstanceTypeFamilies'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('instance_types', 'InstanceTypes'),
+        ('local_storage_categories', 'LocalStorageCategories'),
+        ('local_storage_category', 'LocalStorageCategory'),
+        ('max_results', 'MaxResults'),
+        ('maximum_cpu_core_count', 'MaximumCpuCoreCount'),
+        ('maximum_cpu_speed_frequency', 'MaximumCpuSpeedFrequency'),
+        ('maximum_cpu_turbo_frequency', 'MaximumCpuTurboFrequency'),
+        ('maximum_gpuamount', 'MaximumGPUAmount'),
+        ('maximum_memory_size', 'MaximumMemorySize'),
+        ('minimum_baseline_credit', 'MinimumBaselineCredit'),
+        ('minimum_cpu_core_count', 'MinimumCpuCoreCount'),
+        ('minimum_cpu_speed_frequency', 'MinimumCpuSpeedFrequency'),
+        ('minimum_cpu_turbo_frequency', 'MinimumCpuTurboFrequency'),
+        ('minimum_disk_quantity', 'MinimumDiskQuantity'),
+        ('minimum_eni_ipv_6address_quantity', 'MinimumEniIpv6AddressQuantity'),
+        ('minimum_eni_private_ip_address_quantity', 'MinimumEniPrivateIpAddressQuantity'),
+        ('minimum_eni_quantity', 'MinimumEniQuantity'),
+        ('minimum_eri_quantity', 'MinimumEriQuantity'),
+        ('minimum_gpuamount', 'MinimumGPUAmount'),
+        ('minimum_initial_credit', 'MinimumInitialCredit'),
+        ('minimum_instance_bandwidth_rx', 'MinimumInstanceBandwidthRx'),
+        ('minimum_instance_bandwidth_tx', 'MinimumInstanceBandwidthTx'),
+        ('minimum_instance_pps_rx', 'MinimumInstancePpsRx'),
+        ('minimum_instance_pps_tx', 'MinimumInstancePpsTx'),
+        ('minimum_local_storage_amount', 'MinimumLocalStorageAmount'),
+        ('minimum_local_storage_capacity', 'MinimumLocalStorageCapacity'),
+        ('minimum_memory_size', 'MinimumMemorySize'),
+        ('minimum_primary_eni_queue_number', 'MinimumPrimaryEniQueueNumber'),
+        ('minimum_queue_pair_number', 'MinimumQueuePairNumber'),
+        ('minimum_secondary_eni_queue_number', 'MinimumSecondaryEniQueueNumber'),
+        ('next_token', 'NextToken'),
+        ('nvme_support', 'NvmeSupport'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('physical_processor_model', 'PhysicalProcessorModel'),
+        ('physical_processor_models', 'PhysicalProcessorModels'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstanceVncUrl': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeInstances': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('additional_attributes', 'AdditionalAttributes'),
+        ('device_available', 'DeviceAvailable'),
+        ('dry_run', 'DryRun'),
+        ('eip_addresses', 'EipAddresses'),
+        ('hpc_cluster_id', 'HpcClusterId'),
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('image_id', 'ImageId'),
+        ('inner_ip_addresses', 'InnerIpAddresses'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_ids', 'InstanceIds'),
+        ('instance_name', 'InstanceName'),
+        ('instance_network_type', 'InstanceNetworkType'),
+        ('instance_type', 'InstanceType'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('io_optimized', 'IoOptimized'),
+        ('ipv_6address', 'Ipv6Address'),
+        ('key_pair_name', 'KeyPairName'),
+        ('lock_reason', 'LockReason'),
+        ('max_results', 'MaxResults'),
+        ('need_sale_cycle', 'NeedSaleCycle'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('private_ip_addresses', 'PrivateIpAddresses'),
+        ('public_ip_addresses', 'PublicIpAddresses'),
+        ('rdma_ip_addresses', 'RdmaIpAddresses'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('v_switch_id', 'VSwitchId'),
+        ('vpc_id', 'VpcId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeInstancesFullStatus': ActionSpec('POST', 'RPC', (
+        ('event_publish_time', 'EventPublishTime'),
+        ('not_before', 'NotBefore'),
+        ('event_id', 'EventId'),
+        ('event_type', 'EventType'),
+        ('health_status', 'HealthStatus'),
+        ('instance_event_type', 'InstanceEventType'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+    )),
+    'DescribeInvocationResults': ActionSpec('POST', 'RPC', (
+        ('command_id', 'CommandId'),
+        ('content_encoding', 'ContentEncoding'),
+        ('include_history', 'IncludeHistory'),
+        ('instance_id', 'InstanceId'),
+        ('invoke_id', 'InvokeId'),
+        ('invoke_record_status', 'InvokeRecordStatus'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeInvocations': ActionSpec('POST', 'RPC', (
+        ('command_id', 'CommandId'),
+        ('command_name', 'CommandName'),
+        ('command_type', 'CommandType'),
+        ('content_encoding', 'ContentEncoding'),
+        ('include_output', 'IncludeOutput'),
+        ('instance_id', 'InstanceId'),
+        ('invoke_id', 'InvokeId'),
+        ('invoke_status', 'InvokeStatus'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('repeat_mode', 'RepeatMode'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('timed', 'Timed'),
+    )),
+    'DescribeKeyPairs': ActionSpec('POST', 'RPC', (
+        ('include_public_key', 'IncludePublicKey'),
+        ('key_pair_finger_print', 'KeyPairFingerPrint'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeLaunchTemplateVersions': ActionSpec('POST', 'RPC', (
+        ('default_version', 'DefaultVersion'),
+        ('detail_flag', 'DetailFlag'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('launch_template_version', 'LaunchTemplateVersion'),
+        ('max_version', 'MaxVersion'),
+        ('min_version', 'MinVersion'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeLaunchTemplates': ActionSpec('POST', 'RPC', (
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('template_resource_group_id', 'TemplateResourceGroupId'),
+        ('template_tag', 'TemplateTag'),
+    )),
+    'DescribeLimitation': ActionSpec('POST', 'RPC', (
+        ('limitation', 'Limitation'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeLockedSnapshots': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('lock_status', 'LockStatus'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_ids', 'SnapshotIds'),
+    )),
+    'DescribeManagedInstances': ActionSpec('POST', 'RPC', (
+        ('activation_id', 'ActivationId'),
+        ('connected', 'Connected'),
+        ('instance_id', 'InstanceId'),
+        ('instance_ip', 'InstanceIp'),
+        ('instance_name', 'InstanceName'),
+        ('machine_id', 'MachineId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('os_type', 'OsType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeNatGateways': ActionSpec('POST', 'RPC', (
+        ('nat_gateway_id', 'NatGatewayId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DescribeNetworkInterfaceAttribute': ActionSpec('POST', 'RPC', (
+        ('attribute', 'Attribute'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeNetworkInterfacePermissions': ActionSpec('POST', 'RPC', (
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('network_interface_permission_id', 'NetworkInterfacePermissionId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeNetworkInterfaces': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('ipv_6address', 'Ipv6Address'),
+        ('max_results', 'MaxResults'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('network_interface_name', 'NetworkInterfaceName'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('primary_ip_address', 'PrimaryIpAddress'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('service_managed', 'ServiceManaged'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('type', 'Type'),
+        ('v_switch_id', 'VSwitchId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DescribeNewProjectEipMonitorData': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribePhysicalConnections': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('filter', 'Filter'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'DescribePortRangeListAssociations': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribePortRangeListEntries': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribePortRangeLists': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('port_range_list_name', 'PortRangeListName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribePrefixListAssociations': ActionSpec('POST', 'RPC', (
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_id', 'PrefixListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribePrefixListAttributes': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_id', 'PrefixListId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribePrefixLists': ActionSpec('POST', 'RPC', (
+        ('address_family', 'AddressFamily'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_id', 'PrefixListId'),
+        ('prefix_list_name', 'PrefixListName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribePrice': ActionSpec('POST', 'RPC', (
+        ('data_disk', 'DataDisk'),
+        ('scheduler_options', 'SchedulerOptions'),
+        ('system_disk', 'SystemDisk'),
+        ('amount', 'Amount'),
+        ('assurance_times', 'AssuranceTimes'),
+        ('capacity', 'Capacity'),
+        ('dedicated_host_type', 'DedicatedHostType'),
+        ('image_id', 'ImageId'),
+        ('instance_amount', 'InstanceAmount'),
+        ('instance_cpu_core_count', 'InstanceCpuCoreCount'),
+        ('instance_network_type', 'InstanceNetworkType'),
+        ('instance_type', 'InstanceType'),
+        ('instance_type_list', 'InstanceTypeList'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('io_optimized', 'IoOptimized'),
+        ('isp', 'Isp'),
+        ('offering_type', 'OfferingType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('platform', 'Platform'),
+        ('price_unit', 'PriceUnit'),
+        ('recurrence_rules', 'RecurrenceRules'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('scope', 'Scope'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('start_time', 'StartTime'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeRecommendInstanceType': ActionSpec('POST', 'RPC', (
+        ('cores', 'Cores'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_family_level', 'InstanceFamilyLevel'),
+        ('instance_type', 'InstanceType'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('io_optimized', 'IoOptimized'),
+        ('max_price', 'MaxPrice'),
+        ('memory', 'Memory'),
+        ('network_type', 'NetworkType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('priority_strategy', 'PriorityStrategy'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('scene', 'Scene'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('system_disk_category', 'SystemDiskCategory'),
+        ('zone_id', 'ZoneId'),
+        ('zone_match_mode', 'ZoneMatchMode'),
+    )),
+    'DescribeRegions': ActionSpec('POST', 'RPC', (
+        ('accept_language', 'AcceptLanguage'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'DescribeRenewalPrice': ActionSpec('POST', 'RPC', (
+        ('expected_renew_day', 'ExpectedRenewDay'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('price_unit', 'PriceUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'DescribeReservedInstanceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeReservedInstances': ActionSpec('POST', 'RPC', (
+        ('allocation_type', 'AllocationType'),
+        ('instance_type', 'InstanceType'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('lock_reason', 'LockReason'),
+        ('offering_type', 'OfferingType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('reserved_instance_name', 'ReservedInstanceName'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('scope', 'Scope'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeResourceByTags': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeResourcesModification': ActionSpec('POST', 'RPC', (
+        ('conditions', 'Conditions'),
+        ('cores', 'Cores'),
+        ('destination_resource', 'DestinationResource'),
+        ('instance_type', 'InstanceType'),
+        ('memory', 'Memory'),
+        ('migrate_across_zone', 'MigrateAcrossZone'),
+        ('operation_type', 'OperationType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeRouteTables': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('route_table_id', 'RouteTableId'),
+        ('route_table_name', 'RouteTableName'),
+        ('router_id', 'RouterId'),
+        ('router_type', 'RouterType'),
+        ('vrouter_id', 'VRouterId'),
+    )),
+    'DescribeRouterInterfaces': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeSavingsPlanEstimation': ActionSpec('POST', 'RPC', (
+        ('estimation_resource', 'EstimationResource'),
+        ('instance_type_scope', 'InstanceTypeScope'),
+        ('offering_type', 'OfferingType'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('plan_type', 'PlanType'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+    )),
+    'DescribeSavingsPlanPrice': ActionSpec('POST', 'RPC', (
+        ('committed_amount', 'CommittedAmount'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('instance_type_family_group', 'InstanceTypeFamilyGroup'),
+        ('offering_type', 'OfferingType'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('plan_type', 'PlanType'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+    )),
+    'DescribeSecurityGroupAttribute': ActionSpec('POST', 'RPC', (
+        ('attribute', 'Attribute'),
+        ('direction', 'Direction'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'DescribeSecurityGroupReferences': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'DescribeSecurityGroups': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('fuzzy_query', 'FuzzyQuery'),
+        ('is_query_ecs_count', 'IsQueryEcsCount'),
+        ('max_results', 'MaxResults'),
+        ('network_type', 'NetworkType'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('security_group_name', 'SecurityGroupName'),
+        ('security_group_type', 'SecurityGroupType'),
+        ('service_managed', 'ServiceManaged'),
+        ('tag', 'Tag'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DescribeSendFileResults': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('invocation_status', 'InvocationStatus'),
+        ('invoke_id', 'InvokeId'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeSnapshotGroups': ActionSpec('POST', 'RPC', (
+        ('additional_attributes', 'AdditionalAttributes'),
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_group_id', 'SnapshotGroupId'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeSnapshotLinks': ActionSpec('POST', 'RPC', (
+        ('disk_ids', 'DiskIds'),
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_link_ids', 'SnapshotLinkIds'),
+    )),
+    'DescribeSnapshotMonitorData': ActionSpec('POST', 'RPC', (
+        ('category', 'Category'),
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'DescribeSnapshotPackage': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeSnapshots': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('category', 'Category'),
+        ('disk_id', 'DiskId'),
+        ('dry_run', 'DryRun'),
+        ('encrypted', 'Encrypted'),
+        ('instance_id', 'InstanceId'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_ids', 'SnapshotIds'),
+        ('snapshot_link_id', 'SnapshotLinkId'),
+        ('snapshot_name', 'SnapshotName'),
+        ('snapshot_type', 'SnapshotType'),
+        ('source_disk_type', 'SourceDiskType'),
+        ('status', 'Status'),
+        ('tag', 'Tag'),
+        ('usage', 'Usage'),
+    )),
+    'DescribeSnapshotsUsage': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeSpotAdvice': ActionSpec('POST', 'RPC', (
+        ('cores', 'Cores'),
+        ('gpu_amount', 'GpuAmount'),
+        ('gpu_spec', 'GpuSpec'),
+        ('instance_family_level', 'InstanceFamilyLevel'),
+        ('instance_type_family', 'InstanceTypeFamily'),
+        ('instance_types', 'InstanceTypes'),
+        ('memory', 'Memory'),
+        ('min_cores', 'MinCores'),
+        ('min_memory', 'MinMemory'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeSpotPriceHistory': ActionSpec('POST', 'RPC', (
+        ('end_time', 'EndTime'),
+        ('instance_type', 'InstanceType'),
+        ('io_optimized', 'IoOptimized'),
+        ('network_type', 'NetworkType'),
+        ('ostype', 'OSType'),
+        ('offset', 'Offset'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('spot_duration', 'SpotDuration'),
+        ('start_time', 'StartTime'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeStorageCapacityUnits': ActionSpec('POST', 'RPC', (
+        ('allocation_type', 'AllocationType'),
+        ('capacity', 'Capacity'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+        ('storage_capacity_unit_id', 'StorageCapacityUnitId'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeStorageSetDetails': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('disk_ids', 'DiskIds'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_set_id', 'StorageSetId'),
+        ('storage_set_partition_number', 'StorageSetPartitionNumber'),
+    )),
+    'DescribeStorageSets': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_set_ids', 'StorageSetIds'),
+        ('storage_set_name', 'StorageSetName'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeTags': ActionSpec('POST', 'RPC', (
+        ('category', 'Category'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'DescribeTaskAttribute': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('task_id', 'TaskId'),
+    )),
+    'DescribeTasks': ActionSpec('POST', 'RPC', (
+        ('end_time', 'EndTime'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_ids', 'ResourceIds'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+        ('task_action', 'TaskAction'),
+        ('task_ids', 'TaskIds'),
+        ('task_status', 'TaskStatus'),
+    )),
+    'DescribeTerminalSessions': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('session_id', 'SessionId'),
+    )),
+    'DescribeUserBusinessBehavior': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status_key', 'statusKey'),
+    )),
+    'DescribeUserData': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeVRouters': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vrouter_id', 'VRouterId'),
+    )),
+    'DescribeVSwitches': ActionSpec('POST', 'RPC', (
+        ('is_default', 'IsDefault'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('v_switch_id', 'VSwitchId'),
+        ('vpc_id', 'VpcId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'DescribeVirtualBorderRouters': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeVirtualBorderRoutersForPhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('filter', 'Filter'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DescribeVpcs': ActionSpec('POST', 'RPC', (
+        ('is_default', 'IsDefault'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DescribeZones': ActionSpec('POST', 'RPC', (
+        ('accept_language', 'AcceptLanguage'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('verbose', 'Verbose'),
+    )),
+    'DetachClassicLinkVpc': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'DetachDisk': ActionSpec('POST', 'RPC', (
+        ('delete_with_instance', 'DeleteWithInstance'),
+        ('disk_id', 'DiskId'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DetachInstanceRamRole': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('owner_id', 'OwnerId'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DetachKeyPair': ActionSpec('POST', 'RPC', (
+        ('instance_ids', 'InstanceIds'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DetachNetworkInterface': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('trunk_network_instance_id', 'TrunkNetworkInstanceId'),
+    )),
+    'DisableActivation': ActionSpec('POST', 'RPC', (
+        ('activation_id', 'ActivationId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DisableDiskEncryptionByDefault': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'DisableNetworkInterfaceQoS': ActionSpec('POST', 'RPC', (
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'EnableDiskEncryptionByDefault': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'EnableNetworkInterfaceQoS': ActionSpec('POST', 'RPC', (
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('qo_s', 'QoS'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'EnablePhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'EndTerminalSession': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('session_id', 'SessionId'),
+    )),
+    'ExportImage': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('image_format', 'ImageFormat'),
+        ('image_id', 'ImageId'),
+        ('ossbucket', 'OSSBucket'),
+        ('ossprefix', 'OSSPrefix'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('role_name', 'RoleName'),
+    )),
+    'ExportSnapshot': ActionSpec('POST', 'RPC', (
+        ('oss_bucket', 'OssBucket'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('role_name', 'RoleName'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'GetInstanceConsoleOutput': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('remove_symbols', 'RemoveSymbols'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'GetInstanceScreenshot': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('wake_up', 'WakeUp'),
+    )),
+    'ImportImage': ActionSpec('POST', 'RPC', (
+        ('architecture', 'Architecture'),
+        ('boot_mode', 'BootMode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('detection_strategy', 'DetectionStrategy'),
+        ('disk_device_mapping', 'DiskDeviceMapping'),
+        ('dry_run', 'DryRun'),
+        ('features', 'Features'),
+        ('image_name', 'ImageName'),
+        ('license_type', 'LicenseType'),
+        ('ostype', 'OSType'),
+        ('owner_id', 'OwnerId'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('role_name', 'RoleName'),
+        ('storage_location_arn', 'StorageLocationArn'),
+        ('tag', 'Tag'),
+    )),
+    'ImportKeyPair': ActionSpec('POST', 'RPC', (
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_id', 'OwnerId'),
+        ('public_key_body', 'PublicKeyBody'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+    )),
+    'InstallCloudAssistant': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'InvokeCommand': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('command_id', 'CommandId'),
+        ('container_id', 'ContainerId'),
+        ('container_name', 'ContainerName'),
+        ('frequency', 'Frequency'),
+        ('instance_id', 'InstanceId'),
+        ('launcher', 'Launcher'),
+        ('oss_output_delivery', 'OssOutputDelivery'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('parameters_shrink', 'Parameters'),
+        ('region_id', 'RegionId'),
+        ('repeat_mode', 'RepeatMode'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_tag', 'ResourceTag'),
+        ('tag', 'Tag'),
+        ('termination_mode', 'TerminationMode'),
+        ('timed', 'Timed'),
+        ('timeout', 'Timeout'),
+        ('username', 'Username'),
+        ('windows_password_name', 'WindowsPasswordName'),
+        ('working_dir', 'WorkingDir'),
+    ), (
+        ('parameters', 'Parameters', 'json'),
+    )),
+    'JoinResourceGroup': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'JoinSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'LeaveSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'ListPluginStatus': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('max_results', 'MaxResults'),
+        ('name', 'Name'),
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('page_number', 'PageNumber'),
+        ('page_size', 'PageSize'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ListTagResources': ActionSpec('POST', 'RPC', (
+        ('next_token', 'NextToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+        ('tag_filter', 'TagFilter'),
+    )),
+    'LockSnapshot': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('cool_off_period', 'CoolOffPeriod'),
+        ('dry_run', 'DryRun'),
+        ('lock_duration', 'LockDuration'),
+        ('lock_mode', 'LockMode'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'ModifyAutoProvisioningGroup': ActionSpec('POST', 'RPC', (
+        ('auto_provisioning_group_id', 'AutoProvisioningGroupId'),
+        ('auto_provisioning_group_name', 'AutoProvisioningGroupName'),
+        ('default_target_capacity_type', 'DefaultTargetCapacityType'),
+        ('excess_capacity_termination_policy', 'ExcessCapacityTerminationPolicy'),
+        ('launch_template_config', 'LaunchTemplateConfig'),
+        ('max_spot_price', 'MaxSpotPrice'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('pay_as_you_go_target_capacity', 'PayAsYouGoTargetCapacity'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('spot_target_capacity', 'SpotTargetCapacity'),
+        ('terminate_instances_with_expiration', 'TerminateInstancesWithExpiration'),
+        ('total_target_capacity', 'TotalTargetCapacity'),
+    )),
+    'ModifyAutoSnapshotPolicyEx': ActionSpec('POST', 'RPC', (
+        ('copied_snapshots_retention_days', 'CopiedSnapshotsRetentionDays'),
+        ('copy_encryption_configuration', 'CopyEncryptionConfiguration'),
+        ('enable_cross_region_copy', 'EnableCrossRegionCopy'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('target_copy_regions', 'TargetCopyRegions'),
+        ('auto_snapshot_policy_id', 'autoSnapshotPolicyId'),
+        ('auto_snapshot_policy_name', 'autoSnapshotPolicyName'),
+        ('region_id', 'regionId'),
+        ('repeat_weekdays', 'repeatWeekdays'),
+        ('retention_days', 'retentionDays'),
+        ('time_points', 'timePoints'),
+    )),
+    'ModifyBandwidthPackageSpec': ActionSpec('POST', 'RPC', (
+        ('bandwidth', 'Bandwidth'),
+        ('bandwidth_package_id', 'BandwidthPackageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyCapacityReservation': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('description', 'Description'),
+        ('end_time', 'EndTime'),
+        ('end_time_type', 'EndTimeType'),
+        ('instance_amount', 'InstanceAmount'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'ModifyCloudAssistantSettings': ActionSpec('POST', 'RPC', (
+        ('agent_upgrade_config_shrink', 'AgentUpgradeConfig'),
+        ('oss_delivery_config_shrink', 'OssDeliveryConfig'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('session_manager_config_shrink', 'SessionManagerConfig'),
+        ('setting_type', 'SettingType'),
+        ('sls_delivery_config_shrink', 'SlsDeliveryConfig'),
+    ), (
+        ('agent_upgrade_config', 'AgentUpgradeConfig', 'json'),
+        ('oss_delivery_config', 'OssDeliveryConfig', 'json'),
+        ('session_manager_config', 'SessionManagerConfig', 'json'),
+        ('sls_delivery_config', 'SlsDeliveryConfig', 'json'),
+    )),
+    'ModifyCommand': ActionSpec('POST', 'RPC', (
+        ('command_content', 'CommandContent'),
+        ('command_id', 'CommandId'),
+        ('description', 'Description'),
+        ('launcher', 'Launcher'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('timeout', 'Timeout'),
+        ('working_dir', 'WorkingDir'),
+    )),
+    'ModifyDedicatedHostAttribute': ActionSpec('POST', 'RPC', (
+        ('network_attributes', 'NetworkAttributes'),
+        ('action_on_maintenance', 'ActionOnMaintenance'),
+        ('auto_placement', 'AutoPlacement'),
+        ('cpu_over_commit_ratio', 'CpuOverCommitRatio'),
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('dedicated_host_name', 'DedicatedHostName'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDedicatedHostAutoReleaseTime': ActionSpec('POST', 'RPC', (
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDedicatedHostAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_with_ecs', 'AutoRenewWithEcs'),
+        ('dedicated_host_ids', 'DedicatedHostIds'),
+        ('duration', 'Duration'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('renewal_status', 'RenewalStatus'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDedicatedHostClusterAttribute': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('dedicated_host_cluster_name', 'DedicatedHostClusterName'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDedicatedHostsChargeType': ActionSpec('POST', 'RPC', (
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('dedicated_host_charge_type', 'DedicatedHostChargeType'),
+        ('dedicated_host_ids', 'DedicatedHostIds'),
+        ('detail_fee', 'DetailFee'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDeploymentSetAttribute': ActionSpec('POST', 'RPC', (
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('deployment_set_name', 'DeploymentSetName'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDiagnosticMetricSet': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('metric_ids', 'MetricIds'),
+        ('metric_set_id', 'MetricSetId'),
+        ('metric_set_name', 'MetricSetName'),
+        ('region_id', 'RegionId'),
+        ('resource_type', 'ResourceType'),
+    )),
+    'ModifyDiskAttribute': ActionSpec('POST', 'RPC', (
+        ('bursting_enabled', 'BurstingEnabled'),
+        ('delete_auto_snapshot', 'DeleteAutoSnapshot'),
+        ('delete_with_instance', 'DeleteWithInstance'),
+        ('description', 'Description'),
+        ('disk_id', 'DiskId'),
+        ('disk_ids', 'DiskIds'),
+        ('disk_name', 'DiskName'),
+        ('enable_auto_snapshot', 'EnableAutoSnapshot'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDiskChargeType': ActionSpec('POST', 'RPC', (
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('disk_charge_type', 'DiskChargeType'),
+        ('disk_ids', 'DiskIds'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDiskDefaultKMSKeyId': ActionSpec('POST', 'RPC', (
+        ('kmskey_id', 'KMSKeyId'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyDiskDeployment': ActionSpec('POST', 'RPC', (
+        ('disk_category', 'DiskCategory'),
+        ('disk_id', 'DiskId'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('performance_level', 'PerformanceLevel'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_cluster_id', 'StorageClusterId'),
+    )),
+    'ModifyDiskSpec': ActionSpec('POST', 'RPC', (
+        ('destination_zone_id', 'DestinationZoneId'),
+        ('disk_category', 'DiskCategory'),
+        ('disk_id', 'DiskId'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('performance_control_options', 'PerformanceControlOptions'),
+        ('performance_level', 'PerformanceLevel'),
+        ('provisioned_iops', 'ProvisionedIops'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyEipAddressAttribute': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('bandwidth', 'Bandwidth'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyElasticityAssurance': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('instance_amount', 'InstanceAmount'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('recurrence_rules', 'RecurrenceRules'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyElasticityAssuranceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('renewal_status', 'RenewalStatus'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyForwardEntry': ActionSpec('POST', 'RPC', (
+        ('external_ip', 'ExternalIp'),
+        ('external_port', 'ExternalPort'),
+        ('forward_entry_id', 'ForwardEntryId'),
+        ('forward_table_id', 'ForwardTableId'),
+        ('internal_ip', 'InternalIp'),
+        ('internal_port', 'InternalPort'),
+        ('ip_protocol', 'IpProtocol'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyHaVipAttribute': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('ha_vip_id', 'HaVipId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyHpcClusterAttribute': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('hpc_cluster_id', 'HpcClusterId'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyImageAttribute': ActionSpec('POST', 'RPC', (
+        ('boot_mode', 'BootMode'),
+        ('description', 'Description'),
+        ('dry_run', 'DryRun'),
+        ('features', 'Features'),
+        ('image_family', 'ImageFamily'),
+        ('image_id', 'ImageId'),
+        ('image_name', 'ImageName'),
+        ('license_type', 'LicenseType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status', 'Status'),
+    )),
+    'ModifyImageShareGroupPermission': ActionSpec('POST', 'RPC', (
+        ('add_group', 'AddGroup'),
+        ('remove_group', 'RemoveGroup'),
+        ('image_id', 'ImageId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyImageSharePermission': ActionSpec('POST', 'RPC', (
+        ('add_account', 'AddAccount'),
+        ('dry_run', 'DryRun'),
+        ('image_id', 'ImageId'),
+        ('is_public', 'IsPublic'),
+        ('launch_permission', 'LaunchPermission'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('remove_account', 'RemoveAccount'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceAttachmentAttributes': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceAttribute': ActionSpec('POST', 'RPC', (
+        ('cpu_options', 'CpuOptions'),
+        ('credit_specification', 'CreditSpecification'),
+        ('deletion_protection', 'DeletionProtection'),
+        ('description', 'Description'),
+        ('enable_jumbo_frame', 'EnableJumboFrame'),
+        ('enable_network_encryption', 'EnableNetworkEncryption'),
+        ('host_name', 'HostName'),
+        ('instance_id', 'InstanceId'),
+        ('instance_name', 'InstanceName'),
+        ('network_interface_queue_number', 'NetworkInterfaceQueueNumber'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('private_dns_name_options', 'PrivateDnsNameOptions'),
+        ('recyclable', 'Recyclable'),
+        ('remote_connection_options', 'RemoteConnectionOptions'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('user_data', 'UserData'),
+    )),
+    'ModifyInstanceAutoReleaseTime': ActionSpec('POST', 'RPC', (
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('auto_renew', 'AutoRenew'),
+        ('duration', 'Duration'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('renewal_status', 'RenewalStatus'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceChargeType': ActionSpec('POST', 'RPC', (
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('dry_run', 'DryRun'),
+        ('include_data_disks', 'IncludeDataDisks'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_ids', 'InstanceIds'),
+        ('is_detail_fee', 'IsDetailFee'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceClockOptions': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('dry_run', 'DryRun'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('ptp_status', 'PtpStatus'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceDeployment': ActionSpec('POST', 'RPC', (
+        ('affinity', 'Affinity'),
+        ('dedicated_host_cluster_id', 'DedicatedHostClusterId'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('deployment_set_group_no', 'DeploymentSetGroupNo'),
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('force', 'Force'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('migration_type', 'MigrationType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('remove_from_deployment_set', 'RemoveFromDeploymentSet'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tenancy', 'Tenancy'),
+    )),
+    'ModifyInstanceMaintenanceAttributes': ActionSpec('POST', 'RPC', (
+        ('action_on_maintenance', 'ActionOnMaintenance'),
+        ('instance_id', 'InstanceId'),
+        ('maintenance_window', 'MaintenanceWindow'),
+        ('notify_on_maintenance', 'NotifyOnMaintenance'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceMetadataOptions': ActionSpec('POST', 'RPC', (
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('instance_id', 'InstanceId'),
+        ('instance_metadata_tags', 'InstanceMetadataTags'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceNetworkOptions': ActionSpec('POST', 'RPC', (
+        ('bandwidth_weighting', 'BandwidthWeighting'),
+        ('instance_id', 'InstanceId'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceNetworkSpec': ActionSpec('POST', 'RPC', (
+        ('allocate_public_ip', 'AllocatePublicIp'),
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('end_time', 'EndTime'),
+        ('isp', 'ISP'),
+        ('instance_id', 'InstanceId'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('network_charge_type', 'NetworkChargeType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'ModifyInstanceSpec': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('temporary', 'Temporary'),
+        ('allow_migrate_across_zone', 'AllowMigrateAcrossZone'),
+        ('async_', 'Async'),
+        ('client_token', 'ClientToken'),
+        ('disk', 'Disk'),
+        ('dry_run', 'DryRun'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('modify_mode', 'ModifyMode'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyInstanceVncPasswd': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vnc_password', 'VncPassword'),
+    )),
+    'ModifyInstanceVpcAttribute': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('v_switch_id', 'VSwitchId'),
+        ('vpc_id', 'VpcId'),
+    )),
+    'ModifyInvocationAttribute': ActionSpec('POST', 'RPC', (
+        ('command_content', 'CommandContent'),
+        ('content_encoding', 'ContentEncoding'),
+        ('enable_parameter', 'EnableParameter'),
+        ('frequency', 'Frequency'),
+        ('instance_id', 'InstanceId'),
+        ('invoke_id', 'InvokeId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('parameters_shrink', 'Parameters'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    ), (
+        ('parameters', 'Parameters', 'json'),
+    )),
+    'ModifyLaunchTemplateDefaultVersion': ActionSpec('POST', 'RPC', (
+        ('default_version_number', 'DefaultVersionNumber'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyManagedInstance': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('instance_name', 'InstanceName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyNetworkInterfaceAttribute': ActionSpec('POST', 'RPC', (
+        ('connection_tracking_configuration', 'ConnectionTrackingConfiguration'),
+        ('delete_on_release', 'DeleteOnRelease'),
+        ('description', 'Description'),
+        ('enhanced_network', 'EnhancedNetwork'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('network_interface_name', 'NetworkInterfaceName'),
+        ('network_interface_traffic_config', 'NetworkInterfaceTrafficConfig'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('queue_number', 'QueueNumber'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('rx_queue_size', 'RxQueueSize'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('source_dest_check', 'SourceDestCheck'),
+        ('tx_queue_size', 'TxQueueSize'),
+    )),
+    'ModifyPhysicalConnectionAttribute': ActionSpec('POST', 'RPC', (
+        ('circuit_code', 'CircuitCode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('line_operator', 'LineOperator'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('peer_location', 'PeerLocation'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('port_type', 'PortType'),
+        ('redundant_physical_connection_id', 'RedundantPhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('bandwidth', 'bandwidth'),
+    )),
+    'ModifyPortRangeList': ActionSpec('POST', 'RPC', (
+        ('add_entry', 'AddEntry'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('port_range_list_name', 'PortRangeListName'),
+        ('region_id', 'RegionId'),
+        ('remove_entry', 'RemoveEntry'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyPrefixList': ActionSpec('POST', 'RPC', (
+        ('add_entry', 'AddEntry'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('prefix_list_id', 'PrefixListId'),
+        ('prefix_list_name', 'PrefixListName'),
+        ('region_id', 'RegionId'),
+        ('remove_entry', 'RemoveEntry'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyPrepayInstanceSpec': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('auto_pay', 'AutoPay'),
+        ('client_token', 'ClientToken'),
+        ('disk', 'Disk'),
+        ('end_time', 'EndTime'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('migrate_across_zone', 'MigrateAcrossZone'),
+        ('modify_mode', 'ModifyMode'),
+        ('operator_type', 'OperatorType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('reboot_time', 'RebootTime'),
+        ('reboot_when_finished', 'RebootWhenFinished'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyReservedInstanceAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('reserved_instance_name', 'ReservedInstanceName'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyReservedInstanceAutoRenewAttribute': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('renewal_status', 'RenewalStatus'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyReservedInstances': ActionSpec('POST', 'RPC', (
+        ('configuration', 'Configuration'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ModifyRouterInterfaceAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('health_check_source_ip', 'HealthCheckSourceIp'),
+        ('health_check_target_ip', 'HealthCheckTargetIp'),
+        ('name', 'Name'),
+        ('opposite_interface_id', 'OppositeInterfaceId'),
+        ('opposite_interface_owner_id', 'OppositeInterfaceOwnerId'),
+        ('opposite_router_id', 'OppositeRouterId'),
+        ('opposite_router_type', 'OppositeRouterType'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+    )),
+    'ModifyRouterInterfaceSpec': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('router_interface_id', 'RouterInterfaceId'),
+        ('spec', 'Spec'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'ModifySecurityGroupAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_name', 'SecurityGroupName'),
+    )),
+    'ModifySecurityGroupEgressRule': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('dest_group_id', 'DestGroupId'),
+        ('dest_group_owner_account', 'DestGroupOwnerAccount'),
+        ('dest_group_owner_id', 'DestGroupOwnerId'),
+        ('dest_prefix_list_id', 'DestPrefixListId'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_rule_id', 'SecurityGroupRuleId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_port_range', 'SourcePortRange'),
+    )),
+    'ModifySecurityGroupPolicy': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('inner_access_policy', 'InnerAccessPolicy'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+    )),
+    'ModifySecurityGroupRule': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('port_range_list_id', 'PortRangeListId'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_rule_id', 'SecurityGroupRuleId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_group_id', 'SourceGroupId'),
+        ('source_group_owner_account', 'SourceGroupOwnerAccount'),
+        ('source_group_owner_id', 'SourceGroupOwnerId'),
+        ('source_port_range', 'SourcePortRange'),
+        ('source_prefix_list_id', 'SourcePrefixListId'),
+    )),
+    'ModifySnapshotAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('disable_instant_access', 'DisableInstantAccess'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('retention_days', 'RetentionDays'),
+        ('snapshot_id', 'SnapshotId'),
+        ('snapshot_name', 'SnapshotName'),
+    )),
+    'ModifySnapshotCategory': ActionSpec('POST', 'RPC', (
+        ('category', 'Category'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('retention_days', 'RetentionDays'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'ModifySnapshotGroup': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_group_id', 'SnapshotGroupId'),
+    )),
+    'ModifyStorageCapacityUnitAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_capacity_unit_id', 'StorageCapacityUnitId'),
+    )),
+    'ModifyStorageSetAttribute': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('storage_set_id', 'StorageSetId'),
+        ('storage_set_name', 'StorageSetName'),
+    )),
+    'ModifyUserBusinessBehavior': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('status_key', 'statusKey'),
+        ('status_value', 'statusValue'),
+    )),
+    'ModifyVRouterAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('vrouter_id', 'VRouterId'),
+        ('vrouter_name', 'VRouterName'),
+    )),
+    'ModifyVSwitchAttribute': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('v_switch_id', 'VSwitchId'),
+        ('v_switch_name', 'VSwitchName'),
+    )),
+    'ModifyVirtualBorderRouterAttribute': ActionSpec('POST', 'RPC', (
+        ('circuit_code', 'CircuitCode'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('local_gateway_ip', 'LocalGatewayIp'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('peer_gateway_ip', 'PeerGatewayIp'),
+        ('peering_subnet_mask', 'PeeringSubnetMask'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vbr_id', 'VbrId'),
+        ('vlan_id', 'VlanId'),
+    )),
+    'ModifyVpcAttribute': ActionSpec('POST', 'RPC', (
+        ('cidr_block', 'CidrBlock'),
+        ('description', 'Description'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vpc_id', 'VpcId'),
+        ('vpc_name', 'VpcName'),
+    )),
+    'OpenSnapshotService': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'PurchaseElasticityAssurance': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'PurchaseReservedInstancesOffering': ActionSpec('POST', 'RPC', (
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('instance_amount', 'InstanceAmount'),
+        ('instance_type', 'InstanceType'),
+        ('offering_type', 'OfferingType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('platform', 'Platform'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_name', 'ReservedInstanceName'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('scope', 'Scope'),
+        ('start_time', 'StartTime'),
+        ('tag', 'Tag'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'PurchaseStorageCapacityUnit': ActionSpec('POST', 'RPC', (
+        ('amount', 'Amount'),
+        ('capacity', 'Capacity'),
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('from_app', 'FromApp'),
+        ('name', 'Name'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+        ('tag', 'Tag'),
+    )),
+    'ReActivateInstances': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ReInitDisk': ActionSpec('POST', 'RPC', (
+        ('auto_start_instance', 'AutoStartInstance'),
+        ('disk_id', 'DiskId'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+    )),
+    'RebootInstance': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('force_stop', 'ForceStop'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RebootInstances': ActionSpec('POST', 'RPC', (
+        ('batch_optimization', 'BatchOptimization'),
+        ('dry_run', 'DryRun'),
+        ('force_reboot', 'ForceReboot'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RecoverVirtualBorderRouter': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vbr_id', 'VbrId'),
+    )),
+    'RedeployDedicatedHost': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('migration_type', 'MigrationType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RedeployInstance': ActionSpec('POST', 'RPC', (
+        ('force_stop', 'ForceStop'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ReleaseCapacityReservation': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ReleaseDedicatedHost': ActionSpec('POST', 'RPC', (
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('terminate_subscription', 'TerminateSubscription'),
+    )),
+    'ReleaseEipAddress': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ReleasePublicIpAddress': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('instance_id', 'InstanceId'),
+        ('public_ip_address', 'PublicIpAddress'),
+        ('region_id', 'RegionId'),
+    )),
+    'RemoveBandwidthPackageIps': ActionSpec('POST', 'RPC', (
+        ('bandwidth_package_id', 'BandwidthPackageId'),
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('removed_ip_addresses', 'RemovedIpAddresses'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RemoveTags': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'RenewDedicatedHosts': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('dedicated_host_ids', 'DedicatedHostIds'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RenewElasticityAssurances': ActionSpec('POST', 'RPC', (
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('auto_pay', 'AutoPay'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RenewInstance': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('expected_renew_day', 'ExpectedRenewDay'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'RenewReservedInstances': ActionSpec('POST', 'RPC', (
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('region_id', 'RegionId'),
+        ('reserved_instance_id', 'ReservedInstanceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ReplaceSystemDisk': ActionSpec('POST', 'RPC', (
+        ('system_disk', 'SystemDisk'),
+        ('architecture', 'Architecture'),
+        ('arn', 'Arn'),
+        ('client_token', 'ClientToken'),
+        ('disk_id', 'DiskId'),
+        ('encrypt_algorithm', 'EncryptAlgorithm'),
+        ('encrypted', 'Encrypted'),
+        ('image_id', 'ImageId'),
+        ('instance_id', 'InstanceId'),
+        ('kmskey_id', 'KMSKeyId'),
+        ('key_pair_name', 'KeyPairName'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('password_inherit', 'PasswordInherit'),
+        ('platform', 'Platform'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+        ('use_additional_service', 'UseAdditionalService'),
+    )),
+    'ReportInstancesStatus': ActionSpec('POST', 'RPC', (
+        ('description', 'Description'),
+        ('device', 'Device'),
+        ('disk_id', 'DiskId'),
+        ('end_time', 'EndTime'),
+        ('instance_id', 'InstanceId'),
+        ('issue_category', 'IssueCategory'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('reason', 'Reason'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('start_time', 'StartTime'),
+    )),
+    'ResetDisk': ActionSpec('POST', 'RPC', (
+        ('disk_id', 'DiskId'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'ResetDiskDefaultKMSKeyId': ActionSpec('POST', 'RPC', (
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ResetDisks': ActionSpec('POST', 'RPC', (
+        ('disk', 'Disk'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'ResizeDisk': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('disk_id', 'DiskId'),
+        ('new_size', 'NewSize'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('type', 'Type'),
+    )),
+    'RevokeSecurityGroup': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('permissions', 'Permissions'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_rule_id', 'SecurityGroupRuleId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_group_id', 'SourceGroupId'),
+        ('source_group_owner_account', 'SourceGroupOwnerAccount'),
+        ('source_group_owner_id', 'SourceGroupOwnerId'),
+        ('source_port_range', 'SourcePortRange'),
+        ('source_prefix_list_id', 'SourcePrefixListId'),
+    )),
+    'RevokeSecurityGroupEgress': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('description', 'Description'),
+        ('dest_cidr_ip', 'DestCidrIp'),
+        ('dest_group_id', 'DestGroupId'),
+        ('dest_group_owner_account', 'DestGroupOwnerAccount'),
+        ('dest_group_owner_id', 'DestGroupOwnerId'),
+        ('dest_prefix_list_id', 'DestPrefixListId'),
+        ('ip_protocol', 'IpProtocol'),
+        ('ipv_6dest_cidr_ip', 'Ipv6DestCidrIp'),
+        ('ipv_6source_cidr_ip', 'Ipv6SourceCidrIp'),
+        ('nic_type', 'NicType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('permissions', 'Permissions'),
+        ('policy', 'Policy'),
+        ('port_range', 'PortRange'),
+        ('priority', 'Priority'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_rule_id', 'SecurityGroupRuleId'),
+        ('source_cidr_ip', 'SourceCidrIp'),
+        ('source_port_range', 'SourcePortRange'),
+    )),
+    'RunCommand': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('command_content', 'CommandContent'),
+        ('container_id', 'ContainerId'),
+        ('container_name', 'ContainerName'),
+        ('content_encoding', 'ContentEncoding'),
+        ('description', 'Description'),
+        ('enable_parameter', 'EnableParameter'),
+        ('frequency', 'Frequency'),
+        ('instance_id', 'InstanceId'),
+        ('keep_command', 'KeepCommand'),
+        ('launcher', 'Launcher'),
+        ('name', 'Name'),
+        ('oss_output_delivery', 'OssOutputDelivery'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('parameters_shrink', 'Parameters'),
+        ('region_id', 'RegionId'),
+        ('repeat_mode', 'RepeatMode'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_tag', 'ResourceTag'),
+        ('tag', 'Tag'),
+        ('termination_mode', 'TerminationMode'),
+        ('timed', 'Timed'),
+        ('timeout', 'Timeout'),
+        ('type', 'Type'),
+        ('username', 'Username'),
+        ('windows_password_name', 'WindowsPasswordName'),
+        ('working_dir', 'WorkingDir'),
+    ), (
+        ('parameters', 'Parameters', 'json'),
+    )),
+    'RunInstances': ActionSpec('POST', 'RPC', (
+        ('cpu_options', 'CpuOptions'),
+        ('hibernation_options', 'HibernationOptions'),
+        ('private_pool_options', 'PrivatePoolOptions'),
+        ('scheduler_options', 'SchedulerOptions'),
+        ('security_options', 'SecurityOptions'),
+        ('system_disk', 'SystemDisk'),
+        ('affinity', 'Affinity'),
+        ('amount', 'Amount'),
+        ('arn', 'Arn'),
+        ('auto_pay', 'AutoPay'),
+        ('auto_release_time', 'AutoReleaseTime'),
+        ('auto_renew', 'AutoRenew'),
+        ('auto_renew_period', 'AutoRenewPeriod'),
+        ('client_token', 'ClientToken'),
+        ('clock_options', 'ClockOptions'),
+        ('credit_specification', 'CreditSpecification'),
+        ('data_disk', 'DataDisk'),
+        ('dedicated_host_id', 'DedicatedHostId'),
+        ('deletion_protection', 'DeletionProtection'),
+        ('deployment_set_group_no', 'DeploymentSetGroupNo'),
+        ('deployment_set_id', 'DeploymentSetId'),
+        ('description', 'Description'),
+        ('dry_run', 'DryRun'),
+        ('host_name', 'HostName'),
+        ('host_names', 'HostNames'),
+        ('hpc_cluster_id', 'HpcClusterId'),
+        ('http_endpoint', 'HttpEndpoint'),
+        ('http_put_response_hop_limit', 'HttpPutResponseHopLimit'),
+        ('http_tokens', 'HttpTokens'),
+        ('image_family', 'ImageFamily'),
+        ('image_id', 'ImageId'),
+        ('image_options', 'ImageOptions'),
+        ('instance_charge_type', 'InstanceChargeType'),
+        ('instance_name', 'InstanceName'),
+        ('instance_type', 'InstanceType'),
+        ('internet_charge_type', 'InternetChargeType'),
+        ('internet_max_bandwidth_in', 'InternetMaxBandwidthIn'),
+        ('internet_max_bandwidth_out', 'InternetMaxBandwidthOut'),
+        ('io_optimized', 'IoOptimized'),
+        ('ipv_6address', 'Ipv6Address'),
+        ('ipv_6address_count', 'Ipv6AddressCount'),
+        ('isp', 'Isp'),
+        ('key_pair_name', 'KeyPairName'),
+        ('launch_template_id', 'LaunchTemplateId'),
+        ('launch_template_name', 'LaunchTemplateName'),
+        ('launch_template_version', 'LaunchTemplateVersion'),
+        ('min_amount', 'MinAmount'),
+        ('network_interface', 'NetworkInterface'),
+        ('network_interface_queue_number', 'NetworkInterfaceQueueNumber'),
+        ('network_options', 'NetworkOptions'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password', 'Password'),
+        ('password_inherit', 'PasswordInherit'),
+        ('period', 'Period'),
+        ('period_unit', 'PeriodUnit'),
+        ('private_dns_name_options', 'PrivateDnsNameOptions'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('ram_role_name', 'RamRoleName'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('security_enhancement_strategy', 'SecurityEnhancementStrategy'),
+        ('security_group_id', 'SecurityGroupId'),
+        ('security_group_ids', 'SecurityGroupIds'),
+        ('spot_duration', 'SpotDuration'),
+        ('spot_interruption_behavior', 'SpotInterruptionBehavior'),
+        ('spot_price_limit', 'SpotPriceLimit'),
+        ('spot_strategy', 'SpotStrategy'),
+        ('storage_set_id', 'StorageSetId'),
+        ('storage_set_partition_number', 'StorageSetPartitionNumber'),
+        ('tag', 'Tag'),
+        ('tenancy', 'Tenancy'),
+        ('unique_suffix', 'UniqueSuffix'),
+        ('user_data', 'UserData'),
+        ('v_switch_id', 'VSwitchId'),
+        ('zone_id', 'ZoneId'),
+    )),
+    'SendFile': ActionSpec('POST', 'RPC', (
+        ('content', 'Content'),
+        ('content_type', 'ContentType'),
+        ('description', 'Description'),
+        ('file_group', 'FileGroup'),
+        ('file_mode', 'FileMode'),
+        ('file_owner', 'FileOwner'),
+        ('instance_id', 'InstanceId'),
+        ('name', 'Name'),
+        ('overwrite', 'Overwrite'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_group_id', 'ResourceGroupId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('target_dir', 'TargetDir'),
+        ('timeout', 'Timeout'),
+    )),
+    'StartImagePipelineExecution': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('image_pipeline_id', 'ImagePipelineId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('tag', 'Tag'),
+        ('template_tag', 'TemplateTag'),
+    )),
+    'StartInstance': ActionSpec('POST', 'RPC', (
+        ('dry_run', 'DryRun'),
+        ('init_local_disk', 'InitLocalDisk'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'StartInstances': ActionSpec('POST', 'RPC', (
+        ('batch_optimization', 'BatchOptimization'),
+        ('dry_run', 'DryRun'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'StartTerminalSession': ActionSpec('POST', 'RPC', (
+        ('command_line', 'CommandLine'),
+        ('connection_type', 'ConnectionType'),
+        ('encryption_options_shrink', 'EncryptionOptions'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('password_name', 'PasswordName'),
+        ('port_number', 'PortNumber'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('target_server', 'TargetServer'),
+        ('username', 'Username'),
+    ), (
+        ('encryption_options', 'EncryptionOptions', 'json'),
+    )),
+    'StopInstance': ActionSpec('POST', 'RPC', (
+        ('confirm_stop', 'ConfirmStop'),
+        ('dry_run', 'DryRun'),
+        ('force_stop', 'ForceStop'),
+        ('hibernate', 'Hibernate'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('stopped_mode', 'StoppedMode'),
+    )),
+    'StopInstances': ActionSpec('POST', 'RPC', (
+        ('batch_optimization', 'BatchOptimization'),
+        ('dry_run', 'DryRun'),
+        ('force_stop', 'ForceStop'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('stopped_mode', 'StoppedMode'),
+    )),
+    'StopInvocation': ActionSpec('POST', 'RPC', (
+        ('instance_id', 'InstanceId'),
+        ('invoke_id', 'InvokeId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'TagResources': ActionSpec('POST', 'RPC', (
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_type', 'ResourceType'),
+        ('tag', 'Tag'),
+    )),
+    'TerminatePhysicalConnection': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('physical_connection_id', 'PhysicalConnectionId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+    )),
+    'TerminateVirtualBorderRouter': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('user_cidr', 'UserCidr'),
+        ('vbr_id', 'VbrId'),
+    )),
+    'UnassignIpv6Addresses': ActionSpec('POST', 'RPC', (
+        ('ipv_6address', 'Ipv6Address'),
+        ('ipv_6prefix', 'Ipv6Prefix'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'UnassignPrivateIpAddresses': ActionSpec('POST', 'RPC', (
+        ('ipv_4prefix', 'Ipv4Prefix'),
+        ('network_interface_id', 'NetworkInterfaceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('private_ip_address', 'PrivateIpAddress'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'UnassociateEipAddress': ActionSpec('POST', 'RPC', (
+        ('allocation_id', 'AllocationId'),
+        ('instance_id', 'InstanceId'),
+        ('instance_type', 'InstanceType'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'UnassociateHaVip': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('force', 'Force'),
+        ('ha_vip_id', 'HaVipId'),
+        ('instance_id', 'InstanceId'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+    )),
+    'UnlockSnapshot': ActionSpec('POST', 'RPC', (
+        ('client_token', 'ClientToken'),
+        ('dry_run', 'DryRun'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('snapshot_id', 'SnapshotId'),
+    )),
+    'UntagResources': ActionSpec('POST', 'RPC', (
+        ('all', 'All'),
+        ('owner_account', 'OwnerAccount'),
+        ('owner_id', 'OwnerId'),
+        ('region_id', 'RegionId'),
+        ('resource_id', 'ResourceId'),
+        ('resource_owner_account', 'ResourceOwnerAccount'),
+        ('resource_owner_id', 'ResourceOwnerId'),
+        ('resource_type', 'ResourceType'),
+        ('tag_key', 'TagKey'),
+    ))
+}
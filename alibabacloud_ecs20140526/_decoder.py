@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS, MODEL, SCALAR
+from darabonba.core import DaraCore
+from darabonba.model import DaraModel
+
+T = TypeVar('T', bound=DaraModel)
+
+# (model class, compact) -> compiled decode(m) function
+_DECODERS = {}
+# model class -> __slots__ subclass
+_COMPACT_CLASSES = {}
+
+def _restore_compact(model_class: type, values: tuple, extra: Dict[str, Any]) -> DaraModel:
+    model = object.__new__(compact_class(model_class))
+    for name, value in zip(model.__slots__, values):
+        setattr(model, name, value)
+    model.__dict__.update(extra)
+    return model
+
+def _reduce_compact(model: DaraModel) -> tuple:
+    # The compact class shares the generated class's qualified name, so
+    # pickle has to rebuild it through compact_class.
+    values = tuple(getattr(model, name) for name in model.__slots__)
+    return _restore_compact, (type(model).__bases__[0], values, vars(model))
+
+def compact_class(model_class: Type[T]) -> Type[T]:
+    """
+    Return a subclass of the generated `model_class` that keeps its fields
+    in `__slots__` instead of the instance dict. It is a `model_class`, so
+    to_map/from_map/validate behave the same.
+    """
+    compact = _COMPACT_CLASSES.get(model_class)
+    if compact is None:
+        compact = _COMPACT_CLASSES[model_class] = type(model_class.__name__, (model_class,), {
+            '__slots__': tuple(vars(model_class())),
+            '__module__': model_class.__module__,
+            '__qualname__': model_class.__qualname__,
+            '__reduce__': _reduce_compact,
+        })
+    return compact
+
+def _compile(model_class: type, compact: bool) -> Callable[[Optional[Dict[str, Any]]], DaraModel]:
+    # Emits one straight-line function per model: a single m.get per field,
+    # assigned in __init__ order, without running __init__ or from_map.
+    fields = {}
+    for wire_name, name, kind, nested in MODEL_FIELDS[model_class.__name__]:
+        fields[name] = (wire_name, kind, nested)
+    names = list(vars(model_class()))
+    names += [name for name in fields if name not in names]
+    namespace = {
+        '_new': object.__new__,
+        '_model_class': compact_class(model_class) if compact else model_class,
+    }
+    lines = [
+        'def decode(m):',
+        '    if not m:',
+        '        m = {}',
+        '    model = _new(_model_class)',
+    ]
+    nested_classes = {}
+    for i, name in enumerate(names):
+        if name not in fields:
+            lines.append(f'    model.{name} = None')
+            continue
+        wire_name, kind, nested = fields[name]
+        if kind == SCALAR:
+            lines.append(f'    model.{name} = m.get({wire_name!r})')
+            continue
+        nested_classes[f'_decode_{i}'] = getattr(main_models, nested)
+        lines.append(f'    value = m.get({wire_name!r})')
+        if kind == MODEL:
+            lines.append(f'    model.{name} = None if value is None else _decode_{i}(value)')
+        else:
+            lines.append(f'    model.{name} = [] if value is None else list(map(_decode_{i}, value))')
+    lines.append('    return model')
+    exec('\n'.join(lines), namespace)
+    decode = _DECODERS[model_class, compact] = namespace['decode']
+    for key, nested_class in nested_classes.items():
+        nested_decode = _DECODERS.get((nested_class, compact))
+        if nested_decode is None:
+            nested_decode = _compile(nested_class, compact)
+        namespace[key] = nested_decode
+    return decode
+
+def _is_generated(model_class: type) -> bool:
+    name = model_class.__name__
+    return name in MODEL_FIELDS and getattr(main_models, name, None) is model_class
+
+def from_map(
+    model_class: Type[T],
+    m: Optional[Dict[str, Any]],
+    compact: bool = False,
+) -> T:
+    """
+    Build `model_class` from `m`, giving the same object as
+    `DaraCore.from_map(model_class(), m)`. With `compact`, the model and
+    every nested model are built from their `compact_class`.
+    """
+    decode = _DECODERS.get((model_class, compact))
+    if decode is None and _is_generated(model_class):
+        decode = _compile(model_class, compact)
+    if decode is not None:
+        try:
+            return decode(m)
+        except Exception:
+            # Malformed payloads take the generated path, which keeps the
+            # partially decoded model and the raw map.
+            pass
+    return DaraCore.from_map(model_class(), m)
+
+# model class -> attribute -> (wire name, kind, nested model name)
+_ATTRIBUTE_FIELDS = {}
+
+def _attribute_fields(model_class: type) -> Dict[str, tuple]:
+    fields = _ATTRIBUTE_FIELDS.get(model_class)
+    if fields is None:
+        fields = _ATTRIBUTE_FIELDS[model_class] = {
+            name: (wire_name, kind, nested)
+            for wire_name, name, kind, nested in MODEL_FIELDS[model_class.__name__]
+        }
+    return fields
+
+class LazyModel:
+    """
+    Read-only view of a response map shaped like `model_class`. A field is
+    looked up in the map only when it is read, and nested models are
+    wrapped the same way, so unread parts of the response are never built.
+    """
+    __slots__ = ('_model_class', '_m', '_values')
+
+    def __init__(
+        self,
+        model_class: type,
+        m: Optional[Dict[str, Any]],
+    ):
+        self._model_class = model_class
+        self._m = m or {}
+        self._values = {}
+
+    def __getattr__(self, name: str) -> Any:
+        values = self._values
+        if name in values:
+            return values[name]
+        field = _attribute_fields(self._model_class).get(name)
+        if field is None:
+            raise AttributeError(f'{self._model_class.__name__!r} has no attribute {name!r}')
+        wire_name, kind, nested = field
+        value = self._m.get(wire_name)
+        if kind == MODEL:
+            if value is not None:
+                value = LazyModel(getattr(main_models, nested), value)
+        elif kind != SCALAR:
+            nested_class = getattr(main_models, nested)
+            value = [] if value is None else [LazyModel(nested_class, item) for item in value]
+        values[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f'LazyModel({self._model_class.__name__}, {self._m!r})'
+
+    def to_model(self) -> DaraModel:
+        return from_map(self._model_class, self._m)
+
+    def to_map(self) -> Dict[str, Any]:
+        return self.to_model().to_map()
+
+    def raw(self) -> Dict[str, Any]:
+        return self._m
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS, MODEL_LIST, SCALAR
+from alibabacloud_ecs20140526.paginator import Paginator, _find, _get_path, pagination_spec
+from darabonba.model import DaraModel
+from darabonba.runtime import RuntimeOptions
+
+# Action -> (request attribute holding the ID list, maximum IDs per call,
+# whether the attribute is a JSON array string like DescribeInstances.InstanceIds).
+BATCH_PARAMS = {
+    'DeleteInstances': ('instance_id', 100, False),
+    'DescribeDedicatedHosts': ('dedicated_host_ids', 100, True),
+    'DescribeDisks': ('disk_ids', 100, True),
+    'DescribeInstanceStatus': ('instance_id', 100, False),
+    'DescribeInstances': ('instance_ids', 100, True),
+    'DescribeNetworkInterfaces': ('network_interface_id', 100, False),
+    'DescribeSecurityGroups': ('security_group_ids', 100, True),
+    'DescribeSnapshots': ('snapshot_ids', 100, True),
+    'ListTagResources': ('resource_id', 50, False),
+    'RebootInstances': ('instance_id', 100, False),
+    'StartInstances': ('instance_id', 100, False),
+    'StopInstances': ('instance_id', 100, False),
+    'TagResources': ('resource_id', 50, False),
+    'UntagResources': ('resource_id', 50, False),
+}
+
+# Largest page each paginated action of BATCH_PARAMS returns. Chunks ask
+# for pages as large as themselves (at least 10, the smallest minimum), so
+# a chunk is read in one call instead of in pages of the default 10.
+BATCH_PAGE_SIZES = {
+    'DescribeDedicatedHosts': 100,
+    'DescribeDisks': 500,
+    'DescribeInstanceStatus': 50,
+    'DescribeInstances': 100,
+    'DescribeNetworkInterfaces': 500,
+    'DescribeSecurityGroups': 100,
+    'DescribeSnapshots': 100,
+}
+
+class ChunkError(NamedTuple):
+    index: int
+    ids: List[str]
+    error: Exception
+
+class BatchResult(NamedTuple):
+    # Responses of every chunk merged into one, None when every chunk failed.
+    response: Optional[Any]
+    # One entry per chunk, in chunk order: the list of page responses, or
+    # None for chunks that failed.
+    responses: List[Optional[List[Any]]]
+    errors: List[ChunkError]
+
+def batch_param(action: str) -> Optional[Tuple[str, int, bool]]:
+    return BATCH_PARAMS.get(action)
+
+def _set_page_size(action: str, request: DaraModel, count: int) -> None:
+    spec = pagination_spec(action)
+    max_size = BATCH_PAGE_SIZES.get(action)
+    if spec is None or max_size is None:
+        return
+    names = [name for name in (spec.max_results, spec.page_size) if name is not None]
+    if any(getattr(request, name) is not None for name in names):
+        return
+    use_token = spec.next_token is not None and (spec.page_number is None or getattr(request, spec.page_number) is None)
+    name = spec.max_results if use_token else spec.page_size
+    if name is not None:
+        setattr(request, name, min(max(count, 10), max_size))
+
+def _split(action: str, request: DaraModel, ids: Optional[Sequence[str]], chunk_size: Optional[int]) -> List[Tuple[List[str], DaraModel]]:
+    param = BATCH_PARAMS.get(action)
+    if param is None:
+        raise ValueError(f'{action} does not take a batched ID list')
+    name, limit, as_json = param
+    if ids is None:
+        value = getattr(request, name)
+        ids = json.loads(value) if as_json and value else value or []
+    ids = list(dict.fromkeys(ids))
+    size = min(chunk_size or limit, limit)
+    chunks = []
+    for start in range(0, len(ids), size):
+        chunk = ids[start:start + size]
+        chunk_request = copy.copy(request)
+        setattr(chunk_request, name, json.dumps(chunk) if as_json else chunk)
+        _set_page_size(action, chunk_request, len(chunk))
+        chunks.append((chunk, chunk_request))
+    return chunks
+
+def _items_path(action: str) -> Optional[Tuple[str, ...]]:
+    spec = pagination_spec(action)
+    if spec is not None:
+        return spec.items_path
+    return _find(f'{action}ResponseBody', None, MODEL_LIST)
+
+def response_with_items(action: str, response: Any, items: List[Any]) -> Any:
+    """
+    Return a copy of a decoded `action` response whose item list is
+    `items`, with TotalCount matching and the paging fields cleared.
+    `response` itself is left unchanged.
+    """
+    merged = copy.copy(response)
+    merged.body = body = copy.copy(response.body)
+    path = _items_path(action)
+    if path is None:
+        return merged
+    # Copy the containers down to the list so the original stays intact.
+    parent = body
+    for name in path[:-1]:
+        child = copy.copy(getattr(parent, name))
+        setattr(parent, name, child)
+        parent = child
+    setattr(parent, path[-1], items)
+    for wire_name, name, kind, nested in MODEL_FIELDS[f'{action}ResponseBody']:
+        if kind != SCALAR:
+            continue
+        if wire_name == 'TotalCount':
+            setattr(body, name, len(items))
+        elif wire_name in ('NextToken', 'PageNumber', 'PageSize'):
+            setattr(body, name, None)
+    return merged
+
+def page_items(action: str, response: Any) -> List[Any]:
+    path = _items_path(action)
+    if path is None:
+        return []
+    return _get_path(response.body, path) or []
+
+def _merge(action: str, responses: List[Optional[List[Any]]]) -> Optional[Any]:
+    # Lazy responses are read-only, so they are merged as regular models.
+    pages = [
+        page if isinstance(page, DaraModel) else page.to_model()
+        for chunk in responses if chunk is not None for page in chunk
+    ]
+    if not pages:
+        return None
+    items = []
+    for page in pages:
+        items.extend(page_items(action, page))
+    return response_with_items(action, pages[0], items)
+
+def _call_chunk(client: Any, action: str, request: DaraModel, runtime: RuntimeOptions) -> List[Any]:
+    if pagination_spec(action) is not None:
+        return list(Paginator(client, action, request, runtime).pages())
+    return [client.call_action(action, request, runtime)]
+
+async def _call_chunk_async(client: Any, action: str, request: DaraModel, runtime: RuntimeOptions) -> List[Any]:
+    if pagination_spec(action) is not None:
+        return [page async for page in Paginator(client, action, request, runtime).pages_async()]
+    return [await client.call_action_async(action, request, runtime)]
+
+def call_batched(
+    client: Any,
+    action: str,
+    request: DaraModel,
+    ids: Sequence[str] = None,
+    concurrency: int = 4,
+    runtime: RuntimeOptions = None,
+    chunk_size: int = None,
+) -> BatchResult:
+    """
+    Call `action` for any number of IDs, split into chunks no larger than
+    the action accepts and run on up to `concurrency` threads. `ids`
+    defaults to the list already set on `request`. Paginated actions read
+    every page of a chunk. A failed chunk is reported in `errors` and does
+    not stop the others.
+    """
+    runtime = runtime or RuntimeOptions()
+    chunks = _split(action, request, ids, chunk_size)
+    responses = [None] * len(chunks)
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [
+            executor.submit(_call_chunk, client, action, chunk_request, runtime)
+            for chunk, chunk_request in chunks
+        ]
+        for index, future in enumerate(futures):
+            try:
+                responses[index] = future.result()
+            except Exception as error:
+                errors.append(ChunkError(index, chunks[index][0], error))
+    return BatchResult(_merge(action, responses), responses, errors)
+
+async def call_batched_async(
+    client: Any,
+    action: str,
+    request: DaraModel,
+    ids: Sequence[str] = None,
+    concurrency: int = 4,
+    runtime: RuntimeOptions = None,
+    chunk_size: int = None,
+) -> BatchResult:
+    """
+    Async version of `call_batched`, with at most `concurrency` chunks in
+    flight.
+    """
+    runtime = runtime or RuntimeOptions()
+    chunks = _split(action, request, ids, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def call(chunk_request: DaraModel) -> List[Any]:
+        async with semaphore:
+            return await _call_chunk_async(client, action, chunk_request, runtime)
+
+    results = await asyncio.gather(
+        *(call(chunk_request) for chunk, chunk_request in chunks),
+        return_exceptions=True,
+    )
+    responses = []
+    errors = []
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors.append(ChunkError(index, chunks[index][0], result))
+            result = None
+        responses.append(result)
+    return BatchResult(_merge(action, responses), responses, errors)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.batch import batch_param, call_batched, call_batched_async, page_items
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.tag_index import ResourceRef, TagIndex
+from darabonba.runtime import RuntimeOptions
+
+# TagResources takes at most 20 tags and UntagResources at most 20 keys per
+# call; the resource ID limits are in BATCH_PARAMS.
+MAX_TAGS = 20
+
+# Keys set by Alibaba Cloud itself, which cannot be added or removed.
+SYSTEM_TAG_PREFIXES = ('acs:', 'aliyun')
+
+class TagChange(NamedTuple):
+    ref: ResourceRef
+    # Tags to add or overwrite, by key.
+    tag: Dict[str, str]
+    # Keys to remove.
+    untag: Tuple[str, ...]
+
+class TagCall(NamedTuple):
+    # TagResources or UntagResources.
+    action: str
+    region_id: str
+    resource_type: str
+    resource_ids: Tuple[str, ...]
+    # (key, value) pairs for TagResources, empty for UntagResources.
+    tags: Tuple[Tuple[str, str], ...]
+    # Keys for UntagResources, empty for TagResources.
+    keys: Tuple[str, ...]
+
+class TagPlan(NamedTuple):
+    # One entry per resource whose tags differ from the desired ones.
+    changes: List[TagChange]
+    calls: List[TagCall]
+    # Resources whose current tags could not be listed; they are left out
+    # of the plan.
+    errors: Dict[ResourceRef, Exception]
+
+class TagOutcome(NamedTuple):
+    ref: ResourceRef
+    # Tags and keys that were applied.
+    tagged: Dict[str, str]
+    untagged: List[str]
+    # Errors of the calls covering this resource that failed.
+    errors: List[Exception]
+
+Progress = Callable[[TagCall, Optional[Exception], int, int], None]
+
+def _system(key: str) -> bool:
+    return key.startswith(SYSTEM_TAG_PREFIXES)
+
+def diff_tags(
+    ref: ResourceRef,
+    current: Mapping[str, Optional[str]],
+    desired: Mapping[str, Optional[str]],
+    prune: bool = False,
+) -> Optional[TagChange]:
+    """
+    The change taking `ref` from `current` to `desired` tags, or None when
+    there is nothing to do. A desired value of None removes the key; with
+    `prune`, current keys missing from `desired` are removed as well.
+    System tags are never touched.
+    """
+    tag = {key: value for key, value in desired.items()
+           if value is not None and current.get(key, None) != value and not _system(key)}
+    untag = [key for key in current if not _system(key) and (
+        (key in desired and desired[key] is None) or (prune and key not in desired))]
+    if not tag and not untag:
+        return None
+    return TagChange(ref, tag, tuple(sorted(untag)))
+
+def _chunks(values: Sequence[Any], size: int) -> List[Tuple[Any, ...]]:
+    return [tuple(values[start:start + size]) for start in range(0, len(values), size)]
+
+def plan_calls(
+    changes: Sequence[TagChange],
+) -> List[TagCall]:
+    """
+    Batched TagResources and UntagResources calls applying `changes`.
+    Resources of one region and type that need exactly the same tags (or
+    key removals) share calls of up to the per-call resource limit; more
+    than MAX_TAGS tags are split over several calls.
+    """
+    groups: Dict[tuple, List[str]] = {}
+    for change in changes:
+        ref = change.ref
+        if change.tag:
+            groups.setdefault(('TagResources', ref.region_id, ref.resource_type, tuple(sorted(change.tag.items()))),
+                              []).append(ref.resource_id)
+        if change.untag:
+            groups.setdefault(('UntagResources', ref.region_id, ref.resource_type, change.untag),
+                              []).append(ref.resource_id)
+    calls = []
+    for (action, region_id, resource_type, tags), resource_ids in sorted(groups.items()):
+        max_ids = batch_param(action)[1]
+        for tag_chunk in _chunks(tags, MAX_TAGS):
+            for id_chunk in _chunks(resource_ids, max_ids):
+                if action == 'TagResources':
+                    calls.append(TagCall(action, region_id, resource_type, id_chunk, tag_chunk, ()))
+                else:
+                    calls.append(TagCall(action, region_id, resource_type, id_chunk, (), tag_chunk))
+    return calls
+
+class BulkTagger:
+    """
+    Moves many resources to a desired tag state with as few TagResources
+    and UntagResources calls as it can. Current tags come from `index` for
+    resources it holds, and from ListTagResources (50 resources per call)
+    for the rest. Calls run on up to `concurrency` workers across regions;
+    set a RateLimiter on `clients` to keep them within the API limits.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        index: TagIndex = None,
+        concurrency: int = 8,
+        runtime: RuntimeOptions = None,
+    ):
+        self.clients = clients
+        self.index = index
+        self.concurrency = concurrency
+        self.runtime = runtime or RuntimeOptions()
+
+    def _known(self, refs: Sequence[ResourceRef]) -> Tuple[Dict[ResourceRef, Dict[str, Optional[str]]], Dict[tuple, List[str]]]:
+        current = {}
+        missing: Dict[tuple, List[str]] = {}
+        for ref in refs:
+            tags = self.index.tags(ref) if self.index is not None else None
+            if tags is not None:
+                current[ref] = tags
+            else:
+                missing.setdefault((ref.region_id, ref.resource_type), []).append(ref.resource_id)
+        return current, missing
+
+    @staticmethod
+    def _list_request(region_id: str, resource_type: str) -> main_models.ListTagResourcesRequest:
+        return main_models.ListTagResourcesRequest(region_id=region_id, resource_type=resource_type)
+
+    @staticmethod
+    def _collect(
+        region_id: str,
+        resource_type: str,
+        resource_ids: List[str],
+        result: Any,
+        current: Dict[ResourceRef, Dict[str, Optional[str]]],
+        errors: Dict[ResourceRef, Exception],
+    ) -> None:
+        if isinstance(result, Exception):
+            failed = {resource_id: result for resource_id in resource_ids}
+        else:
+            failed = {resource_id: error.error for error in result.errors for resource_id in error.ids}
+        for resource_id in resource_ids:
+            ref = ResourceRef(region_id, resource_type, resource_id)
+            if resource_id in failed:
+                errors[ref] = failed[resource_id]
+            else:
+                # Untagged resources are not listed at all.
+                current[ref] = {}
+        if isinstance(result, Exception) or result.response is None:
+            return
+        for item in page_items('ListTagResources', result.response):
+            ref = ResourceRef(region_id, resource_type, item.resource_id)
+            if ref in current:
+                current[ref][item.tag_key] = item.tag_value
+
+    def _plan(
+        self,
+        desired: Mapping[ResourceRef, Mapping[str, Optional[str]]],
+        current: Dict[ResourceRef, Dict[str, Optional[str]]],
+        errors: Dict[ResourceRef, Exception],
+        prune: bool,
+    ) -> TagPlan:
+        changes = []
+        for ref, tags in desired.items():
+            if ref in errors:
+                continue
+            change = diff_tags(ref, current[ref], tags, prune)
+            if change is not None:
+                changes.append(change)
+        return TagPlan(changes, plan_calls(changes), errors)
+
+    def plan(
+        self,
+        desired: Mapping[ResourceRef, Mapping[str, Optional[str]]],
+        prune: bool = False,
+    ) -> TagPlan:
+        """
+        Diff `desired` tags (by resource; a value of None removes the key)
+        against the current ones and batch the differences into calls. With
+        `prune`, every other non-system tag is removed too.
+        """
+        current, missing = self._known(list(desired))
+        errors: Dict[ResourceRef, Exception] = {}
+
+        def list_tags(group: Tuple[tuple, List[str]]) -> Any:
+            (region_id, resource_type), resource_ids = group
+            try:
+                return call_batched(self.clients.client(region_id), 'ListTagResources',
+                                    self._list_request(region_id, resource_type), resource_ids,
+                                    concurrency=self.concurrency, runtime=self.runtime)
+            except Exception as error:
+                return error
+
+        groups = list(missing.items())
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(groups) or 1))) as executor:
+            for ((region_id, resource_type), resource_ids), result in zip(groups, executor.map(list_tags, groups)):
+                self._collect(region_id, resource_type, resource_ids, result, current, errors)
+        return self._plan(desired, current, errors, prune)
+
+    async def plan_async(
+        self,
+        desired: Mapping[ResourceRef, Mapping[str, Optional[str]]],
+        prune: bool = False,
+    ) -> TagPlan:
+        """
+        Async version of `plan`.
+        """
+        current, missing = self._known(list(desired))
+        errors: Dict[ResourceRef, Exception] = {}
+        groups = list(missing.items())
+        results = await asyncio.gather(*(
+            call_batched_async(self.clients.client(region_id), 'ListTagResources',
+                               self._list_request(region_id, resource_type), resource_ids,
+                               concurrency=self.concurrency, runtime=self.runtime)
+            for (region_id, resource_type), resource_ids in groups
+        ), return_exceptions=True)
+        for ((region_id, resource_type), resource_ids), result in zip(groups, results):
+            self._collect(region_id, resource_type, resource_ids, result, current, errors)
+        return self._plan(desired, current, errors, prune)
+
+    @staticmethod
+    def _request(call: TagCall) -> Any:
+        if call.action == 'TagResources':
+            return main_models.TagResourcesRequest(
+                region_id=call.region_id,
+                resource_type=call.resource_type,
+                resource_id=list(call.resource_ids),
+                tag=[main_models.TagResourcesRequestTag(key=key, value=value) for key, value in call.tags],
+            )
+        return main_models.UntagResourcesRequest(
+            region_id=call.region_id,
+            resource_type=call.resource_type,
+            resource_id=list(call.resource_ids),
+            tag_key=list(call.keys),
+        )
+
+    @staticmethod
+    def _outcomes(plan: TagPlan) -> Dict[ResourceRef, TagOutcome]:
+        outcomes = {change.ref: TagOutcome(change.ref, {}, [], []) for change in plan.changes}
+        for ref, error in plan.errors.items():
+            outcomes[ref] = TagOutcome(ref, {}, [], [error])
+        return outcomes
+
+    @staticmethod
+    def _record(outcomes: Dict[ResourceRef, TagOutcome], call: TagCall, error: Optional[Exception]) -> None:
+        for resource_id in call.resource_ids:
+            outcome = outcomes[ResourceRef(call.region_id, call.resource_type, resource_id)]
+            if error is not None:
+                outcome.errors.append(error)
+            elif call.action == 'TagResources':
+                outcome.tagged.update(call.tags)
+            else:
+                outcome.untagged.extend(call.keys)
+
+    def apply(
+        self,
+        plan: TagPlan,
+        progress: Progress = None,
+    ) -> Dict[ResourceRef, TagOutcome]:
+        """
+        Run the calls of `plan`. A failed call does not stop the others; its
+        error is reported on every resource it covered. `progress` is called
+        after each call with the call, its error or None, and the number of
+        calls done and in total. Returns an outcome per changed or failed
+        resource.
+        """
+        outcomes = self._outcomes(plan)
+        lock = threading.Lock()
+        done = 0
+
+        def run(call: TagCall) -> Optional[Exception]:
+            try:
+                self.clients.client(call.region_id).call_action(call.action, self._request(call), self.runtime)
+            except Exception as error:
+                return error
+            return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(plan.calls) or 1))) as executor:
+            futures = {executor.submit(run, call): call for call in plan.calls}
+            for future in as_completed(futures):
+                call, error = futures[future], future.result()
+                with lock:
+                    self._record(outcomes, call, error)
+                    done += 1
+                if progress is not None:
+                    progress(call, error, done, len(plan.calls))
+        return outcomes
+
+    async def apply_async(
+        self,
+        plan: TagPlan,
+        progress: Progress = None,
+    ) -> Dict[ResourceRef, TagOutcome]:
+        """
+        Async version of `apply`.
+        """
+        outcomes = self._outcomes(plan)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        done = 0
+
+        async def run(call: TagCall) -> None:
+            nonlocal done
+            error = None
+            async with semaphore:
+                try:
+                    await self.clients.client(call.region_id).call_action_async(call.action, self._request(call), self.runtime)
+                except Exception as e:
+                    error = e
+            self._record(outcomes, call, error)
+            done += 1
+            if progress is not None:
+                progress(call, error, done, len(plan.calls))
+
+        await asyncio.gather(*(run(call) for call in plan.calls))
+        return outcomes
+
+    def sync(
+        self,
+        desired: Mapping[ResourceRef, Mapping[str, Optional[str]]],
+        prune: bool = False,
+        progress: Progress = None,
+    ) -> Dict[ResourceRef, TagOutcome]:
+        """
+        `plan` then `apply`.
+        """
+        return self.apply(self.plan(desired, prune), progress)
+
+    async def sync_async(
+        self,
+        desired: Mapping[ResourceRef, Mapping[str, Optional[str]]],
+        prune: bool = False,
+        progress: Progress = None,
+    ) -> Dict[ResourceRef, TagOutcome]:
+        """
+        Async version of `sync`.
+        """
+        return await self.apply_async(await self.plan_async(desired, prune), progress)
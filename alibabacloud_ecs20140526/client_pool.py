@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Type, Union
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client import Client
+from alibabacloud_ecs20140526.coalescing import RequestCoalescer
+from alibabacloud_ecs20140526.rate_limiter import RateLimiter
+from alibabacloud_ecs20140526.response_cache import ResponseCache
+from alibabacloud_ecs20140526.retry import RetryPolicy
+from alibabacloud_tea_openapi import utils_models as open_api_util_models
+from darabonba.model import DaraModel
+from darabonba.runtime import RuntimeOptions
+
+# Region used for DescribeRegions when the config does not name one.
+DEFAULT_REGION_ID = 'cn-hangzhou'
+
+class RegionResult(NamedTuple):
+    region_id: str
+    request: DaraModel
+    # The decoded response, or None when the call failed.
+    response: Any
+    error: Optional[Exception]
+
+RequestFactory = Callable[[str], Union[None, DaraModel, Iterable[DaraModel]]]
+
+def _region_requests(request_factory: RequestFactory, region_ids: Sequence[str]) -> List[tuple]:
+    # A factory returns one request, several, or None to skip the region.
+    calls = []
+    for region_id in region_ids:
+        requests = request_factory(region_id)
+        if requests is None:
+            continue
+        if isinstance(requests, DaraModel):
+            requests = (requests,)
+        calls.extend((region_id, request) for request in requests)
+    return calls
+
+class RegionalClientPool:
+    """
+    Per-region ECS clients built lazily from one `Config`. Every client
+    shares the credential of the first one, so a refreshing provider (STS,
+    ECS RAM role) is asked for credentials once instead of once per region
+    and the keys are never copied out of it. Endpoints are resolved once per
+    region through `Client.get_endpoint`. Sync requests to the same host
+    reuse one connection pool, since darabonba keys its HTTP sessions by
+    host; `hosts()` shows which regions share one. A `rate_limiter` and a
+    `retry_policy` are set on every client, so all regions share the same
+    buckets and retry budget. `client_token_mode`, if given, turns on
+    ClientToken injection on every client (see
+    `Client.set_client_token_mode`).
+    """
+
+    def __init__(
+        self,
+        config: open_api_util_models.Config,
+        client_class: Type[Client] = Client,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        client_token_mode: str = None,
+        response_cache: ResponseCache = None,
+        request_coalescer: RequestCoalescer = None,
+    ):
+        self._config = config
+        self._client_class = client_class
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._client_token_mode = client_token_mode
+        self._response_cache = response_cache
+        self._request_coalescer = request_coalescer
+        self._clients: Dict[str, Client] = {}
+        self._endpoints: Dict[str, str] = {}
+        self._credential = None
+        self._region_ids: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    def endpoint(
+        self,
+        region_id: str,
+    ) -> str:
+        endpoint = self._endpoints.get(region_id)
+        if endpoint is None:
+            client = self.client(region_id)
+            endpoint = self._endpoints[region_id] = client._endpoint
+        return endpoint
+
+    def client(
+        self,
+        region_id: str,
+    ) -> Client:
+        client = self._clients.get(region_id)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(region_id)
+            if client is None:
+                config = copy.copy(self._config)
+                config.region_id = region_id
+                if self._credential is not None:
+                    # Reuse the first client's credential rather than
+                    # building one per region from the access keys.
+                    config.access_key_id = None
+                    config.access_key_secret = None
+                    config.security_token = None
+                    config.bearer_token = None
+                    config.credential = self._credential
+                client = self._client_class(config)
+                if self._rate_limiter is not None:
+                    client.set_rate_limiter(self._rate_limiter)
+                if self._retry_policy is not None:
+                    client.set_retry_policy(self._retry_policy)
+                if self._client_token_mode is not None:
+                    client.set_client_token_mode(self._client_token_mode)
+                if self._response_cache is not None:
+                    client.set_response_cache(self._response_cache)
+                if self._request_coalescer is not None:
+                    client.set_request_coalescer(self._request_coalescer)
+                if self._credential is None:
+                    self._credential = client._credential
+                self._endpoints[region_id] = client._endpoint
+                self._clients[region_id] = client
+        return client
+
+    def __getitem__(
+        self,
+        region_id: str,
+    ) -> Client:
+        return self.client(region_id)
+
+    def regions(self) -> List[str]:
+        return list(self._clients)
+
+    def hosts(self) -> Dict[str, List[str]]:
+        hosts = {}
+        for region_id, endpoint in self._endpoints.items():
+            hosts.setdefault(endpoint, []).append(region_id)
+        return hosts
+
+    def _home_region(self) -> str:
+        return self._config.region_id or DEFAULT_REGION_ID
+
+    def _set_region_ids(
+        self,
+        response: Any,
+    ) -> List[str]:
+        regions = response.body.regions.region if response.body.regions else []
+        self._region_ids = [region.region_id for region in regions]
+        return self._region_ids
+
+    def region_ids(
+        self,
+        refresh: bool = False,
+    ) -> List[str]:
+        """
+        Return the regions reported by DescribeRegions, fetched once.
+        """
+        if self._region_ids is None or refresh:
+            client = self.client(self._home_region())
+            response = client.call_action('DescribeRegions', main_models.DescribeRegionsRequest(), RuntimeOptions())
+            self._set_region_ids(response)
+        return list(self._region_ids)
+
+    async def region_ids_async(
+        self,
+        refresh: bool = False,
+    ) -> List[str]:
+        if self._region_ids is None or refresh:
+            client = self.client(self._home_region())
+            response = await client.call_action_async('DescribeRegions', main_models.DescribeRegionsRequest(), RuntimeOptions())
+            self._set_region_ids(response)
+        return list(self._region_ids)
+
+    def fan_out(
+        self,
+        action: str,
+        request_factory: RequestFactory,
+        regions: Sequence[str] = None,
+        concurrency: int = 16,
+        region_concurrency: int = 4,
+        timeout: float = None,
+        runtime: RuntimeOptions = None,
+    ) -> List[RegionResult]:
+        """
+        Call `action` in every region of `regions` (all regions from
+        DescribeRegions by default) with the requests `request_factory`
+        builds for it. At most `concurrency` calls run at once, and at most
+        `region_concurrency` in any one region so a region's throttling
+        quota is not spent by a single fan-out. `timeout` (seconds) bounds
+        each call's connect and read time. Failures are returned in the
+        results, in request order, instead of being raised.
+        """
+        if regions is None:
+            regions = self.region_ids()
+        runtime = copy.copy(runtime) if runtime is not None else RuntimeOptions()
+        if timeout is not None:
+            runtime.connect_timeout = runtime.read_timeout = int(timeout * 1000)
+        calls = _region_requests(request_factory, regions)
+        semaphores = {region_id: threading.Semaphore(max(1, region_concurrency)) for region_id in regions}
+
+        def call(region_id: str, request: DaraModel) -> RegionResult:
+            with semaphores[region_id]:
+                try:
+                    response = self.client(region_id).call_action(action, request, runtime)
+                except Exception as error:
+                    return RegionResult(region_id, request, None, error)
+            return RegionResult(region_id, request, response, None)
+
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(calls)))) as executor:
+            return list(executor.map(lambda args: call(*args), calls))
+
+    async def fan_out_async(
+        self,
+        action: str,
+        request_factory: RequestFactory,
+        regions: Sequence[str] = None,
+        concurrency: int = 16,
+        region_concurrency: int = 4,
+        timeout: float = None,
+        runtime: RuntimeOptions = None,
+    ) -> List[RegionResult]:
+        """
+        Async version of `fan_out`. `timeout` bounds each call as a whole,
+        including the time spent retrying.
+        """
+        if regions is None:
+            regions = await self.region_ids_async()
+        runtime = runtime or RuntimeOptions()
+        calls = _region_requests(request_factory, regions)
+        limit = asyncio.Semaphore(max(1, concurrency))
+        semaphores = {region_id: asyncio.Semaphore(max(1, region_concurrency)) for region_id in regions}
+
+        async def call(region_id: str, request: DaraModel) -> RegionResult:
+            async with semaphores[region_id], limit:
+                try:
+                    response = await asyncio.wait_for(
+                        self.client(region_id).call_action_async(action, request, runtime),
+                        timeout,
+                    )
+                except Exception as error:
+                    return RegionResult(region_id, request, None, error)
+            return RegionResult(region_id, request, response, None)
+
+        return list(await asyncio.gather(*(call(region_id, request) for region_id, request in calls)))
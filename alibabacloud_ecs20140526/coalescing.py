@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from typing import Any, Dict, List, Optional, Set
+
+from alibabacloud_ecs20140526.batch import BATCH_PARAMS, page_items, response_with_items
+from alibabacloud_ecs20140526.paginator import Paginator, pagination_spec
+from alibabacloud_ecs20140526.retry import is_read_action
+from darabonba.model import DaraModel
+from darabonba.runtime import RuntimeOptions
+
+# Page size for merged calls that leave it unset; every ID-list action
+# accepts at least 50 items per page.
+MERGED_PAGE_SIZE = 50
+
+# ID-list read action (see batch.BATCH_PARAMS) -> attribute of a response
+# item holding the ID that was sent, used to hand each caller of a merged
+# call only its own items.
+MERGED_ITEM_IDS = {
+    'DescribeDedicatedHosts': 'dedicated_host_id',
+    'DescribeDisks': 'disk_id',
+    'DescribeInstanceStatus': 'instance_id',
+    'DescribeInstances': 'instance_id',
+    'DescribeNetworkInterfaces': 'network_interface_id',
+    'DescribeSecurityGroups': 'security_group_id',
+    'DescribeSnapshots': 'snapshot_id',
+    'ListTagResources': 'resource_id',
+}
+
+# Result of an in-flight call whose caller was cancelled before it got a
+# response; calls sharing it send the request again.
+_ABANDONED = object()
+
+class _Direct:
+    # Lets the paginator page through a merged call without coalescing it
+    # again.
+    def __init__(self, client: Any):
+        self.client = client
+
+    async def call_action_async(self, action: str, request: DaraModel, runtime: RuntimeOptions) -> Any:
+        return await self.client._call_action_uncoalesced_async(action, request, runtime)
+
+class _Batch:
+    __slots__ = ('ids', 'future', 'closed')
+
+    def __init__(self, future: asyncio.Future):
+        self.ids: Dict[str, None] = {}
+        self.future = future
+        self.closed = False
+
+class RequestCoalescer:
+    """
+    Coalesces concurrent async read calls (Describe*, List*, Get*):
+
+    - identical calls in flight at the same time share one request;
+    - calls to an ID-list action (see batch.BATCH_PARAMS) that differ only
+      in their IDs and do not page are gathered for `window` seconds and
+      sent as one call, up to the action's ID limit, and each caller gets
+      a response holding only the items of its own IDs.
+
+    Only `call_action_async` and the async action methods coalesce; sync
+    calls are sent as they are.
+    """
+
+    def __init__(
+        self,
+        window: float = 0.002,
+        merge_ids: bool = True,
+    ):
+        self.window = window
+        self.merge_ids = merge_ids
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._batches: Dict[str, _Batch] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, action: str, name: str) -> None:
+        stats = self._stats.setdefault(action, {})
+        stats[name] = stats.get(name, 0) + 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per action: calls sent, calls that shared an in-flight request and
+        calls that were merged into another.
+        """
+        return {action: dict(stats) for action, stats in self._stats.items()}
+
+    def coalesces(
+        self,
+        action: str,
+    ) -> bool:
+        return is_read_action(action)
+
+    def _merge_ids(self, action: str, request: DaraModel) -> Optional[List[str]]:
+        if not self.merge_ids or action not in MERGED_ITEM_IDS:
+            return None
+        spec = pagination_spec(action)
+        if spec is not None and (
+            spec.next_token is not None and getattr(request, spec.next_token) is not None
+            or spec.page_number is not None and getattr(request, spec.page_number) is not None
+        ):
+            return None
+        name, limit, as_json = BATCH_PARAMS[action]
+        ids = getattr(request, name)
+        if as_json and ids:
+            ids = json.loads(ids)
+        if not ids or len(ids) > limit:
+            return None
+        return list(ids)
+
+    async def call(
+        self,
+        client: Any,
+        action: str,
+        request: DaraModel,
+        runtime: RuntimeOptions,
+    ) -> Any:
+        ids = self._merge_ids(action, request)
+        if ids is not None:
+            return await self._call_merged(client, action, request, runtime, ids)
+        params, req = client._build_action_request(action, request)
+        key = json.dumps([client._endpoint, runtime.to_map(), action, sorted(req.query.items())], sort_keys=True, default=str)
+        future = self._inflight.get(key)
+        while future is not None:
+            self._count(action, 'shared')
+            response = await asyncio.shield(future)
+            if response is not _ABANDONED:
+                return client._decode_response(action, json.loads(json.dumps(response, default=str)))
+            # The caller that sent it was cancelled; the first sharer to get
+            # here sends it again and the others share that.
+            future = self._inflight.get(key)
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        self._count(action, 'sent')
+        try:
+            response = await client.call_api_async(params, req, runtime)
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every sharer too.
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            del self._inflight[key]
+        return client._decode_response(action, response)
+
+    async def _call_merged(
+        self,
+        client: Any,
+        action: str,
+        request: DaraModel,
+        runtime: RuntimeOptions,
+        ids: List[str],
+    ) -> Any:
+        name, limit, as_json = BATCH_PARAMS[action]
+        template = copy.copy(request)
+        setattr(template, name, None)
+        # The generated *_async methods build a new RuntimeOptions for every
+        # call, so calls are grouped (and shared above) by the runtime's
+        # settings, not by the object.
+        group = json.dumps([id(client), runtime.to_map(), action, template.to_map()], sort_keys=True, default=str)
+        batch = self._batches.get(group)
+        if batch is None or batch.closed or len(batch.ids.keys() | ids) > limit:
+            batch = self._batches[group] = _Batch(asyncio.get_running_loop().create_future())
+            asyncio.ensure_future(self._send(client, action, template, runtime, group, batch))
+        else:
+            self._count(action, 'merged')
+        batch.ids.update(dict.fromkeys(ids))
+        first, items = await asyncio.shield(batch.future)
+        wanted: Set[str] = set(ids)
+        item_id = MERGED_ITEM_IDS[action]
+        return response_with_items(action, first, [item for item in items if getattr(item, item_id) in wanted])
+
+    async def _send(
+        self,
+        client: Any,
+        action: str,
+        template: DaraModel,
+        runtime: RuntimeOptions,
+        group: str,
+        batch: _Batch,
+    ) -> None:
+        try:
+            await asyncio.sleep(self.window)
+            self._close(group, batch)
+            name, limit, as_json = BATCH_PARAMS[action]
+            request = copy.copy(template)
+            ids = list(batch.ids)
+            setattr(request, name, json.dumps(ids) if as_json else ids)
+            self._count(action, 'sent')
+            spec = pagination_spec(action)
+            if spec is not None:
+                size_attr = spec.max_results if spec.next_token is not None else spec.page_size
+                if size_attr is not None and getattr(request, size_attr) is None:
+                    setattr(request, size_attr, MERGED_PAGE_SIZE)
+            direct = _Direct(client)
+            if spec is not None:
+                pages = [page async for page in Paginator(direct, action, request, runtime).pages_async()]
+            else:
+                pages = [await direct.call_action_async(action, request, runtime)]
+            pages = [page if isinstance(page, DaraModel) else page.to_model() for page in pages]
+            items = [item for page in pages for item in page_items(action, page)]
+        except Exception as error:
+            batch.future.set_exception(error)
+            batch.future.exception()
+        else:
+            batch.future.set_result((pages[0], items))
+        finally:
+            self._close(group, batch)
+            if not batch.future.done():
+                # Cancelled, e.g. at loop shutdown: callers still get an
+                # error they can catch instead of waiting forever.
+                batch.future.set_exception(RuntimeError(f'merged {action} call was cancelled'))
+                batch.future.exception()
+
+    def _close(self, group: str, batch: _Batch) -> None:
+        batch.closed = True
+        if self._batches.get(group) is batch:
+            del self._batches[group]
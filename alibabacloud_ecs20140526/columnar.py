@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # optional: numeric columns stay lists without it
+    numpy = None
+
+def _missing(value: Any) -> bool:
+    return value is None or isinstance(value, float) and math.isnan(value)
+
+def _to_float(value: Any) -> Optional[float]:
+    return None if _missing(value) else float(value)
+
+class Table:
+    """
+    Equal-length columns by name. Numeric columns are float64 NumPy arrays
+    (NaN for missing values) when NumPy is installed, and lists of floats
+    (None for missing values) otherwise; other columns are lists. Rows are
+    never materialized unless asked for, so sorting and argmin stay
+    vectorized with NumPy.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Sequence[Any]],
+        numeric: Collection[str] = (),
+    ):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'columns differ in length: {sorted(lengths)}')
+        self.numeric = frozenset(name for name in numeric if name in columns)
+        self.columns: Dict[str, Any] = {}
+        for name, values in columns.items():
+            if name in self.numeric:
+                if _is_array(values):
+                    values = values.astype(numpy.float64, copy=False)
+                else:
+                    values = [_to_float(value) for value in values]
+                    if numpy is not None:
+                        values = numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+            else:
+                values = list(values)
+            self.columns[name] = values
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        names: Sequence[str],
+        numeric: Collection[str] = (),
+    ) -> Table:
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        for row in rows:
+            for name in names:
+                columns[name].append(row.get(name))
+        return cls(columns, numeric)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        for values in self.columns.values():
+            return len(values)
+        return 0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f'Table({len(self)} rows, columns={self.names})'
+
+    def row(self, index: int) -> Dict[str, Any]:
+        row = {}
+        for name, values in self.columns.items():
+            value = values[index]
+            if name in self.numeric:
+                value = _to_float(value)
+            row[name] = value
+        return row
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def take(
+        self,
+        indices: Sequence[int],
+    ) -> Table:
+        """
+        A new table holding the rows at `indices`, in that order.
+        """
+        columns = {}
+        for name, values in self.columns.items():
+            if _is_array(values):
+                columns[name] = values[numpy.asarray(indices, dtype=numpy.intp)]
+            else:
+                columns[name] = [values[index] for index in indices]
+        return Table(columns, self.numeric)
+
+    def where(
+        self,
+        mask: Union[Sequence[bool], Callable[[Dict[str, Any]], bool]],
+    ) -> Table:
+        """
+        The rows where `mask` (a boolean sequence or a predicate on rows) is
+        true.
+        """
+        if callable(mask):
+            mask = [mask(row) for row in self.rows()]
+        return self.take([index for index, keep in enumerate(mask) if keep])
+
+    def argsort(
+        self,
+        by: Union[str, Sequence[str]],
+        descending: bool = False,
+    ) -> List[int]:
+        """
+        Row indices ordered by the columns `by`; missing values go last.
+        Sorting is stable.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        if numpy is not None and all(_is_array(self.columns[name]) for name in names):
+            # lexsort sorts by its last key first.
+            keys = [-self.columns[name] if descending else self.columns[name] for name in reversed(names)]
+            return numpy.lexsort(keys).tolist()
+
+        # One stable pass per column, last column first, like lexsort, so a
+        # missing value only goes last within its own column.
+        order = list(range(len(self)))
+        for name in reversed(names):
+            values = self.columns[name]
+            present = [index for index in order if not _missing(values[index])]
+            missing = [index for index in order if _missing(values[index])]
+            # sort() stays stable with reverse=True.
+            present.sort(key=values.__getitem__, reverse=descending)
+            order = present + missing
+        return order
+
+    def sort(
+        self,
+        by: Union[str, Sequence[str]],
+        descending: bool = False,
+    ) -> Table:
+        return self.take(self.argsort(by, descending))
+
+    def argmin(
+        self,
+        name: str,
+    ) -> Optional[int]:
+        """
+        Index of the smallest value of a numeric column, or None if every
+        value is missing.
+        """
+        values = self.columns[name]
+        if _is_array(values):
+            if len(values) == 0 or numpy.isnan(values).all():
+                return None
+            return int(numpy.nanargmin(values))
+        present = [(value, index) for index, value in enumerate(values) if not _missing(value)]
+        return min(present)[1] if present else None
+
+def _is_array(values: Any) -> bool:
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+def concat(
+    tables: Sequence[Table],
+    names: Sequence[str],
+) -> Table:
+    """
+    The rows of `tables`, one after the other, in the columns `names`.
+    """
+    numeric = frozenset(name for table in tables for name in table.numeric)
+    columns: Dict[str, Any] = {}
+    for name in names:
+        parts = [table[name] for table in tables]
+        if parts and all(_is_array(part) for part in parts):
+            columns[name] = numpy.concatenate(parts)
+        else:
+            columns[name] = [value for part in parts for value in part]
+    return Table(columns, numeric)
+
+def outer_join(
+    tables: Sequence[Table],
+    on: Sequence[str],
+) -> Table:
+    """
+    Full outer join of `tables` on the key columns `on`: one row per key
+    found in any table, ordered by key, with the other columns of every
+    table. Keys must be unique within a table and the other column names
+    across tables. A table without a row for a key leaves its columns
+    missing in that row.
+
+    Each table's rows are mapped to their row in the result once, and its
+    columns are then scattered as a whole (one NumPy assignment per
+    numeric column when NumPy is installed).
+    """
+    keys = [list(zip(*(table[name] for name in on))) if len(table) else [] for table in tables]
+    union = sorted(set().union(*keys))
+    position = {key: index for index, key in enumerate(union)}
+    columns: Dict[str, Any] = {name: [key[index] for key in union] for index, name in enumerate(on)}
+    numeric = set()
+    for table, table_keys in zip(tables, keys):
+        if len(set(table_keys)) != len(table_keys):
+            raise ValueError(f'duplicate keys in a table joined on {list(on)}')
+        rows = [position[key] for key in table_keys]
+        for name, values in table.columns.items():
+            if name in on:
+                continue
+            if name in columns:
+                raise ValueError(f'column {name!r} is in more than one table')
+            if _is_array(values):
+                joined = numpy.full(len(union), numpy.nan)
+                joined[numpy.asarray(rows, dtype=numpy.intp)] = values
+            else:
+                joined = [None] * len(union)
+                for row, value in zip(rows, values):
+                    joined[row] = value
+            columns[name] = joined
+            if name in table.numeric:
+                numeric.add(name)
+    return Table(columns, numeric)
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.batch import call_batched, call_batched_async, page_items
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.paginator import Paginator, pagination_spec
+from darabonba.runtime import RuntimeOptions
+
+class InventorySpec(NamedTuple):
+    action: str
+    # Wire name of the resource ID in a listed item.
+    id_field: str
+    # Wire paths of the VPC and vSwitch IDs, if the resource has them.
+    vpc_path: Tuple[str, ...] = ()
+    vswitch_path: Tuple[str, ...] = ()
+    # Extra request parameters for a full crawl.
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+INVENTORY_SPECS = {
+    'instance': InventorySpec(
+        'DescribeInstances', 'InstanceId', ('VpcAttributes', 'VpcId'), ('VpcAttributes', 'VSwitchId'),
+    ),
+    'disk': InventorySpec('DescribeDisks', 'DiskId'),
+    'network_interface': InventorySpec('DescribeNetworkInterfaces', 'NetworkInterfaceId', ('VpcId',), ('VSwitchId',)),
+    'security_group': InventorySpec('DescribeSecurityGroups', 'SecurityGroupId', ('VpcId',)),
+    # Only the account's own images, not the public and marketplace ones.
+    'image': InventorySpec('DescribeImages', 'ImageId', params=(('image_owner_alias', 'self'),)),
+    'snapshot': InventorySpec('DescribeSnapshots', 'SnapshotId'),
+}
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS inventory ('
+    ' resource_type TEXT NOT NULL, resource_id TEXT NOT NULL, region_id TEXT NOT NULL,'
+    ' zone_id TEXT, vpc_id TEXT, vswitch_id TEXT, status TEXT, data TEXT NOT NULL, synced_at REAL NOT NULL,'
+    ' PRIMARY KEY (resource_type, resource_id))',
+    'CREATE INDEX IF NOT EXISTS inventory_id ON inventory (resource_id)',
+    'CREATE INDEX IF NOT EXISTS inventory_region ON inventory (region_id, resource_type)',
+    'CREATE INDEX IF NOT EXISTS inventory_zone ON inventory (zone_id, resource_type)',
+    'CREATE INDEX IF NOT EXISTS inventory_vpc ON inventory (vpc_id, resource_type)',
+    'CREATE INDEX IF NOT EXISTS inventory_vswitch ON inventory (vswitch_id, resource_type)',
+    'CREATE INDEX IF NOT EXISTS inventory_status ON inventory (status, resource_type)',
+    'CREATE TABLE IF NOT EXISTS inventory_tag ('
+    ' resource_type TEXT NOT NULL, resource_id TEXT NOT NULL, tag_key TEXT NOT NULL, tag_value TEXT,'
+    ' PRIMARY KEY (resource_type, resource_id, tag_key))',
+    'CREATE INDEX IF NOT EXISTS inventory_tag_key ON inventory_tag (tag_key, tag_value)',
+    'CREATE TABLE IF NOT EXISTS inventory_sync ('
+    ' region_id TEXT NOT NULL, resource_type TEXT NOT NULL, mode TEXT NOT NULL, synced_at REAL NOT NULL,'
+    ' PRIMARY KEY (region_id, resource_type, mode))',
+)
+
+_COLUMNS = ('resource_type', 'resource_id', 'region_id', 'zone_id', 'vpc_id', 'vswitch_id', 'status')
+
+class InventoryRecord(NamedTuple):
+    resource_type: str
+    resource_id: str
+    region_id: str
+    zone_id: Optional[str]
+    vpc_id: Optional[str]
+    vswitch_id: Optional[str]
+    status: Optional[str]
+    # The listed item as returned by ECS, with wire names.
+    data: Dict[str, Any]
+
+class SyncReport(NamedTuple):
+    region_id: str
+    resource_type: str
+    # 'full' for a crawl, 'incremental' for an instance status refresh.
+    mode: str
+    upserted: int
+    deleted: int
+    error: Optional[Exception]
+
+def _path(item: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    if not path:
+        return None
+    for name in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(name)
+    return item
+
+def _iso(epoch: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
+class InventoryStore:
+    """
+    ECS resources of several regions in sqlite, indexed by ID, region, zone,
+    VPC, vSwitch, status and tag, so they can be looked up without calling
+    ECS. Written by InventorySync.
+    """
+
+    def __init__(
+        self,
+        path: str = ':memory:',
+    ):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+    def _rows(self, resource_type: str, region_id: str, items: Iterable[Dict[str, Any]], now: float) -> Tuple[list, list]:
+        spec = INVENTORY_SPECS[resource_type]
+        rows, tags = [], []
+        for item in items:
+            resource_id = item[spec.id_field]
+            rows.append((
+                resource_type, resource_id, region_id, item.get('ZoneId'), _path(item, spec.vpc_path) or None,
+                _path(item, spec.vswitch_path) or None, item.get('Status'),
+                json.dumps(item, ensure_ascii=False, default=str), now,
+            ))
+            for tag in _path(item, ('Tags', 'Tag')) or []:
+                tags.append((resource_type, resource_id, tag.get('TagKey'), tag.get('TagValue')))
+        return rows, tags
+
+    def write(
+        self,
+        resource_type: str,
+        region_id: str,
+        items: Sequence[Dict[str, Any]],
+        deleted: Iterable[str] = (),
+        full: bool = False,
+        mode: str = None,
+        synced_at: float = None,
+    ) -> Tuple[int, int]:
+        """
+        Upsert `items` (wire maps) and drop `deleted` IDs in one
+        transaction. With `full`, `items` is everything the region holds,
+        and stored resources missing from it are dropped too. With `mode`,
+        the sync time is recorded as `synced_at` (now by default). Returns
+        the number of upserted and deleted resources.
+        """
+        now = time.time()
+        rows, tags = self._rows(resource_type, region_id, items, now)
+        ids = [row[1] for row in rows]
+        with self._lock:
+            connection = self._connection
+            connection.execute('BEGIN')
+            try:
+                deleted = set(deleted)
+                if full:
+                    stored = connection.execute(
+                        'SELECT resource_id FROM inventory WHERE region_id = ? AND resource_type = ?',
+                        (region_id, resource_type),
+                    ).fetchall()
+                    deleted |= {row[0] for row in stored} - set(ids)
+                for chunk in (ids, list(deleted)):
+                    connection.executemany(
+                        'DELETE FROM inventory_tag WHERE resource_type = ? AND resource_id = ?',
+                        [(resource_type, resource_id) for resource_id in chunk],
+                    )
+                connection.executemany(
+                    'DELETE FROM inventory WHERE resource_type = ? AND resource_id = ?',
+                    [(resource_type, resource_id) for resource_id in deleted],
+                )
+                connection.executemany('INSERT OR REPLACE INTO inventory VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                connection.executemany('INSERT OR REPLACE INTO inventory_tag VALUES (?, ?, ?, ?)', tags)
+                if mode is not None:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO inventory_sync VALUES (?, ?, ?, ?)', (region_id, resource_type, mode, synced_at or now),
+                    )
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+        return len(rows), len(deleted)
+
+    def last_sync(
+        self,
+        region_id: str,
+        resource_type: str,
+        mode: str = 'full',
+    ) -> Optional[float]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT synced_at FROM inventory_sync WHERE region_id = ? AND resource_type = ? AND mode = ?',
+                (region_id, resource_type, mode),
+            ).fetchone()
+        return row[0] if row else None
+
+    def statuses(
+        self,
+        region_id: str,
+        resource_type: str,
+    ) -> Dict[str, Optional[str]]:
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT resource_id, status FROM inventory WHERE region_id = ? AND resource_type = ?',
+                (region_id, resource_type),
+            ).fetchall()
+        return dict(rows)
+
+    def get(
+        self,
+        resource_type: str,
+        resource_id: str,
+    ) -> Optional[InventoryRecord]:
+        records = self.find(resource_type, resource_id=resource_id)
+        return records[0] if records else None
+
+    def find(
+        self,
+        resource_type: str = None,
+        resource_id: str = None,
+        region_id: str = None,
+        zone_id: str = None,
+        vpc_id: str = None,
+        vswitch_id: str = None,
+        status: str = None,
+        tags: Dict[str, Optional[str]] = None,
+        limit: int = None,
+    ) -> List[InventoryRecord]:
+        """
+        Stored resources matching every given filter. `tags` maps tag keys
+        to the value required, or to None to accept any value.
+        """
+        clauses, params = [], []
+        for name, value in (('resource_type', resource_type), ('resource_id', resource_id), ('region_id', region_id),
+                            ('zone_id', zone_id), ('vpc_id', vpc_id), ('vswitch_id', vswitch_id), ('status', status)):
+            if value is not None:
+                clauses.append(f'i.{name} = ?')
+                params.append(value)
+        for key, value in (tags or {}).items():
+            clause = ('EXISTS (SELECT 1 FROM inventory_tag t WHERE t.resource_type = i.resource_type'
+                      ' AND t.resource_id = i.resource_id AND t.tag_key = ?')
+            params.append(key)
+            if value is not None:
+                clause += ' AND t.tag_value = ?'
+                params.append(value)
+            clauses.append(clause + ')')
+        query = f'SELECT {", ".join("i." + name for name in _COLUMNS)}, i.data FROM inventory i'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [InventoryRecord(*row[:-1], json.loads(row[-1])) for row in rows]
+
+class InventorySync:
+    """
+    Keeps an InventoryStore current for the regions of a RegionalClientPool.
+
+    Each resource type is crawled in full when its last full crawl is older
+    than `full_interval` seconds. In between, instances get an incremental
+    refresh: a DescribeInstancesFullStatus listing (IDs and statuses only,
+    100 per page) shows new, removed and changed instances,
+    DescribeInstanceHistoryEvents names instances with system events since
+    the last refresh started, and only those are described again, 100 IDs
+    per call. Other changes, such as new tags, are picked up by the next
+    full crawl.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        store: InventoryStore,
+        resource_types: Sequence[str] = tuple(INVENTORY_SPECS),
+        full_interval: float = 3600,
+        concurrency: int = 8,
+        runtime: RuntimeOptions = None,
+    ):
+        unknown = set(resource_types) - set(INVENTORY_SPECS)
+        if unknown:
+            raise ValueError(f'unknown resource types {sorted(unknown)}, expected some of {sorted(INVENTORY_SPECS)}')
+        self.clients = clients
+        self.store = store
+        self.resource_types = list(resource_types)
+        self.full_interval = full_interval
+        self.concurrency = concurrency
+        self.runtime = runtime or RuntimeOptions()
+
+    def _crawl_request(self, resource_type: str, region_id: str) -> Any:
+        spec = INVENTORY_SPECS[resource_type]
+        request = getattr(main_models, f'{spec.action}Request')(region_id=region_id, **dict(spec.params))
+        page_spec = pagination_spec(spec.action)
+        setattr(request, page_spec.max_results if page_spec.next_token else page_spec.page_size, 100)
+        return request
+
+    def _events_request(self, region_id: str, since: float) -> main_models.DescribeInstanceHistoryEventsRequest:
+        return main_models.DescribeInstanceHistoryEventsRequest(
+            region_id=region_id,
+            event_publish_time=main_models.DescribeInstanceHistoryEventsRequestEventPublishTime(start=_iso(since)),
+            max_results=100,
+        )
+
+    def _statuses_request(self, region_id: str) -> main_models.DescribeInstancesFullStatusRequest:
+        # Its page size goes up to 100, twice DescribeInstanceStatus's, so
+        # the listing takes no more calls than a full crawl of instances.
+        return main_models.DescribeInstancesFullStatusRequest(region_id=region_id, page_size=100)
+
+    def _plan(self, regions: Sequence[str], force_full: bool) -> List[Tuple[str, str, str]]:
+        now = time.time()
+        jobs = []
+        for region_id in regions:
+            for resource_type in self.resource_types:
+                last = self.store.last_sync(region_id, resource_type)
+                due = force_full or last is None or now - last >= self.full_interval
+                if due or resource_type == 'instance':
+                    jobs.append((region_id, resource_type, 'full' if due else 'incremental'))
+        return jobs
+
+    def _changed(self, region_id: str, statuses: List[Any], events: List[Any]) -> Tuple[Set[str], Set[str]]:
+        # Instances to describe again, and instances that are gone.
+        stored = self.store.statuses(region_id, 'instance')
+        current = {item.instance_id: item.status.name if item.status else None for item in statuses}
+        refresh = {instance_id for instance_id, status in current.items() if stored.get(instance_id, ()) != status}
+        refresh |= {event.instance_id for event in events if event.instance_id in current}
+        return refresh, set(stored) - set(current)
+
+    def _report(self, region_id: str, resource_type: str, mode: str, counts: Any) -> SyncReport:
+        if isinstance(counts, Exception):
+            return SyncReport(region_id, resource_type, mode, 0, 0, counts)
+        return SyncReport(region_id, resource_type, mode, counts[0], counts[1], None)
+
+    def _sync_one(self, region_id: str, resource_type: str, mode: str) -> Tuple[int, int]:
+        client = self.clients.client(region_id)
+        # The next refresh asks for events published since this one started,
+        # so none published while it runs are missed.
+        started = time.time()
+        if mode == 'full':
+            items = Paginator(client, INVENTORY_SPECS[resource_type].action, self._crawl_request(resource_type, region_id), self.runtime).items()
+            counts = self.store.write(resource_type, region_id, [item.to_map() for item in items], full=True, mode='full',
+                                      synced_at=started)
+            self.store.write(resource_type, region_id, [], mode='incremental', synced_at=started)
+            return counts
+        since = self.store.last_sync(region_id, 'instance', 'incremental') or started - self.full_interval
+        statuses = list(Paginator(client, 'DescribeInstancesFullStatus', self._statuses_request(region_id), self.runtime).items())
+        events = list(Paginator(client, 'DescribeInstanceHistoryEvents', self._events_request(region_id, since), self.runtime).items())
+        refresh, deleted = self._changed(region_id, statuses, events)
+        items = []
+        if refresh:
+            result = call_batched(client, 'DescribeInstances', self._crawl_request('instance', region_id), sorted(refresh),
+                                  runtime=self.runtime)
+            if result.errors:
+                raise result.errors[0].error
+            items = [item.to_map() for item in page_items('DescribeInstances', result.response)]
+        return self.store.write('instance', region_id, items, deleted, mode='incremental', synced_at=started)
+
+    async def _sync_one_async(self, region_id: str, resource_type: str, mode: str) -> Tuple[int, int]:
+        client = self.clients.client(region_id)
+        started = time.time()
+        if mode == 'full':
+            paginator = Paginator(client, INVENTORY_SPECS[resource_type].action, self._crawl_request(resource_type, region_id), self.runtime)
+            items = [item.to_map() async for item in paginator.items_async()]
+            counts = self.store.write(resource_type, region_id, items, full=True, mode='full', synced_at=started)
+            self.store.write(resource_type, region_id, [], mode='incremental', synced_at=started)
+            return counts
+        since = self.store.last_sync(region_id, 'instance', 'incremental') or started - self.full_interval
+        statuses = [item async for item in Paginator(
+            client, 'DescribeInstancesFullStatus', self._statuses_request(region_id), self.runtime).items_async()]
+        events = [item async for item in Paginator(
+            client, 'DescribeInstanceHistoryEvents', self._events_request(region_id, since), self.runtime).items_async()]
+        refresh, deleted = self._changed(region_id, statuses, events)
+        items = []
+        if refresh:
+            result = await call_batched_async(client, 'DescribeInstances', self._crawl_request('instance', region_id),
+                                              sorted(refresh), runtime=self.runtime)
+            if result.errors:
+                raise result.errors[0].error
+            items = [item.to_map() for item in page_items('DescribeInstances', result.response)]
+        return self.store.write('instance', region_id, items, deleted, mode='incremental', synced_at=started)
+
+    def refresh(
+        self,
+        regions: Sequence[str] = None,
+        force_full: bool = False,
+    ) -> List[SyncReport]:
+        """
+        Bring the store up to date for `regions` (all regions by default),
+        `concurrency` (region, resource type) jobs at a time. Failures are
+        reported, not raised, and leave that job's stored data as it was.
+        """
+        jobs = self._plan(regions if regions is not None else self.clients.region_ids(), force_full)
+
+        def run(job: Tuple[str, str, str]) -> SyncReport:
+            try:
+                return self._report(*job, self._sync_one(*job))
+            except Exception as error:
+                return self._report(*job, error)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(jobs) or 1))) as executor:
+            return list(executor.map(run, jobs))
+
+    async def refresh_async(
+        self,
+        regions: Sequence[str] = None,
+        force_full: bool = False,
+    ) -> List[SyncReport]:
+        """
+        Async version of `refresh`.
+        """
+        jobs = self._plan(regions if regions is not None else await self.clients.region_ids_async(), force_full)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def run(job: Tuple[str, str, str]) -> SyncReport:
+            async with semaphore:
+                try:
+                    return self._report(*job, await self._sync_one_async(*job))
+                except Exception as error:
+                    return self._report(*job, error)
+
+        return list(await asyncio.gather(*(run(job) for job in jobs)))
@@ -2,4010 +2,6032 @@
 # This file is auto-generated, don't edit it. Thanks.
 from __future__ import annotations
 
-from ._accept_inquired_system_event_request import AcceptInquiredSystemEventRequest
-from ._accept_inquired_system_event_response_body import AcceptInquiredSystemEventResponseBody
-from ._accept_inquired_system_event_response import AcceptInquiredSystemEventResponse
-from ._activate_router_interface_request import ActivateRouterInterfaceRequest
-from ._activate_router_interface_response_body import ActivateRouterInterfaceResponseBody
-from ._activate_router_interface_response import ActivateRouterInterfaceResponse
-from ._add_bandwidth_package_ips_request import AddBandwidthPackageIpsRequest
-from ._add_bandwidth_package_ips_response_body import AddBandwidthPackageIpsResponseBody
-from ._add_bandwidth_package_ips_response import AddBandwidthPackageIpsResponse
-from ._add_tags_request import AddTagsRequest
-from ._add_tags_response_body import AddTagsResponseBody
-from ._add_tags_response import AddTagsResponse
-from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequest
-from ._allocate_dedicated_hosts_response_body import AllocateDedicatedHostsResponseBody
-from ._allocate_dedicated_hosts_response import AllocateDedicatedHostsResponse
-from ._allocate_eip_address_request import AllocateEipAddressRequest
-from ._allocate_eip_address_response_body import AllocateEipAddressResponseBody
-from ._allocate_eip_address_response import AllocateEipAddressResponse
-from ._allocate_public_ip_address_request import AllocatePublicIpAddressRequest
-from ._allocate_public_ip_address_response_body import AllocatePublicIpAddressResponseBody
-from ._allocate_public_ip_address_response import AllocatePublicIpAddressResponse
-from ._apply_auto_snapshot_policy_request import ApplyAutoSnapshotPolicyRequest
-from ._apply_auto_snapshot_policy_response_body import ApplyAutoSnapshotPolicyResponseBody
-from ._apply_auto_snapshot_policy_response import ApplyAutoSnapshotPolicyResponse
-from ._assign_ipv_6addresses_request import AssignIpv6AddressesRequest
-from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBody
-from ._assign_ipv_6addresses_response import AssignIpv6AddressesResponse
-from ._assign_private_ip_addresses_request import AssignPrivateIpAddressesRequest
-from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBody
-from ._assign_private_ip_addresses_response import AssignPrivateIpAddressesResponse
-from ._associate_eip_address_request import AssociateEipAddressRequest
-from ._associate_eip_address_response_body import AssociateEipAddressResponseBody
-from ._associate_eip_address_response import AssociateEipAddressResponse
-from ._associate_ha_vip_request import AssociateHaVipRequest
-from ._associate_ha_vip_response_body import AssociateHaVipResponseBody
-from ._associate_ha_vip_response import AssociateHaVipResponse
-from ._attach_classic_link_vpc_request import AttachClassicLinkVpcRequest
-from ._attach_classic_link_vpc_response_body import AttachClassicLinkVpcResponseBody
-from ._attach_classic_link_vpc_response import AttachClassicLinkVpcResponse
-from ._attach_disk_request import AttachDiskRequest
-from ._attach_disk_response_body import AttachDiskResponseBody
-from ._attach_disk_response import AttachDiskResponse
-from ._attach_instance_ram_role_request import AttachInstanceRamRoleRequest
-from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBody
-from ._attach_instance_ram_role_response import AttachInstanceRamRoleResponse
-from ._attach_key_pair_request import AttachKeyPairRequest
-from ._attach_key_pair_response_body import AttachKeyPairResponseBody
-from ._attach_key_pair_response import AttachKeyPairResponse
-from ._attach_network_interface_request import AttachNetworkInterfaceRequest
-from ._attach_network_interface_response_body import AttachNetworkInterfaceResponseBody
-from ._attach_network_interface_response import AttachNetworkInterfaceResponse
-from ._authorize_security_group_request import AuthorizeSecurityGroupRequest
-from ._authorize_security_group_response_body import AuthorizeSecurityGroupResponseBody
-from ._authorize_security_group_response import AuthorizeSecurityGroupResponse
-from ._authorize_security_group_egress_request import AuthorizeSecurityGroupEgressRequest
-from ._authorize_security_group_egress_response_body import AuthorizeSecurityGroupEgressResponseBody
-from ._authorize_security_group_egress_response import AuthorizeSecurityGroupEgressResponse
-from ._cancel_auto_snapshot_policy_request import CancelAutoSnapshotPolicyRequest
-from ._cancel_auto_snapshot_policy_response_body import CancelAutoSnapshotPolicyResponseBody
-from ._cancel_auto_snapshot_policy_response import CancelAutoSnapshotPolicyResponse
-from ._cancel_copy_image_request import CancelCopyImageRequest
-from ._cancel_copy_image_response_body import CancelCopyImageResponseBody
-from ._cancel_copy_image_response import CancelCopyImageResponse
-from ._cancel_image_pipeline_execution_request import CancelImagePipelineExecutionRequest
-from ._cancel_image_pipeline_execution_response_body import CancelImagePipelineExecutionResponseBody
-from ._cancel_image_pipeline_execution_response import CancelImagePipelineExecutionResponse
-from ._cancel_physical_connection_request import CancelPhysicalConnectionRequest
-from ._cancel_physical_connection_response_body import CancelPhysicalConnectionResponseBody
-from ._cancel_physical_connection_response import CancelPhysicalConnectionResponse
-from ._cancel_simulated_system_events_request import CancelSimulatedSystemEventsRequest
-from ._cancel_simulated_system_events_response_body import CancelSimulatedSystemEventsResponseBody
-from ._cancel_simulated_system_events_response import CancelSimulatedSystemEventsResponse
-from ._cancel_task_request import CancelTaskRequest
-from ._cancel_task_response_body import CancelTaskResponseBody
-from ._cancel_task_response import CancelTaskResponse
-from ._connect_router_interface_request import ConnectRouterInterfaceRequest
-from ._connect_router_interface_response_body import ConnectRouterInterfaceResponseBody
-from ._connect_router_interface_response import ConnectRouterInterfaceResponse
-from ._convert_nat_public_ip_to_eip_request import ConvertNatPublicIpToEipRequest
-from ._convert_nat_public_ip_to_eip_response_body import ConvertNatPublicIpToEipResponseBody
-from ._convert_nat_public_ip_to_eip_response import ConvertNatPublicIpToEipResponse
-from ._copy_image_request import CopyImageRequest
-from ._copy_image_response_body import CopyImageResponseBody
-from ._copy_image_response import CopyImageResponse
-from ._copy_snapshot_request import CopySnapshotRequest
-from ._copy_snapshot_response_body import CopySnapshotResponseBody
-from ._copy_snapshot_response import CopySnapshotResponse
-from ._create_activation_request import CreateActivationRequest
-from ._create_activation_response_body import CreateActivationResponseBody
-from ._create_activation_response import CreateActivationResponse
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequest
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequest
-from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBody
-from ._create_auto_provisioning_group_response import CreateAutoProvisioningGroupResponse
-from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequest
-from ._create_auto_snapshot_policy_response_body import CreateAutoSnapshotPolicyResponseBody
-from ._create_auto_snapshot_policy_response import CreateAutoSnapshotPolicyResponse
-from ._create_capacity_reservation_request import CreateCapacityReservationRequest
-from ._create_capacity_reservation_response_body import CreateCapacityReservationResponseBody
-from ._create_capacity_reservation_response import CreateCapacityReservationResponse
-from ._create_command_request import CreateCommandRequest
-from ._create_command_response_body import CreateCommandResponseBody
-from ._create_command_response import CreateCommandResponse
-from ._create_dedicated_host_cluster_request import CreateDedicatedHostClusterRequest
-from ._create_dedicated_host_cluster_response_body import CreateDedicatedHostClusterResponseBody
-from ._create_dedicated_host_cluster_response import CreateDedicatedHostClusterResponse
-from ._create_deployment_set_request import CreateDeploymentSetRequest
-from ._create_deployment_set_response_body import CreateDeploymentSetResponseBody
-from ._create_deployment_set_response import CreateDeploymentSetResponse
-from ._create_diagnostic_metric_set_request import CreateDiagnosticMetricSetRequest
-from ._create_diagnostic_metric_set_response_body import CreateDiagnosticMetricSetResponseBody
-from ._create_diagnostic_metric_set_response import CreateDiagnosticMetricSetResponse
-from ._create_diagnostic_report_request import CreateDiagnosticReportRequest
-from ._create_diagnostic_report_response_body import CreateDiagnosticReportResponseBody
-from ._create_diagnostic_report_response import CreateDiagnosticReportResponse
-from ._create_disk_request import CreateDiskRequest
-from ._create_disk_response_body import CreateDiskResponseBody
-from ._create_disk_response import CreateDiskResponse
-from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequest
-from ._create_elasticity_assurance_response_body import CreateElasticityAssuranceResponseBody
-from ._create_elasticity_assurance_response import CreateElasticityAssuranceResponse
-from ._create_forward_entry_request import CreateForwardEntryRequest
-from ._create_forward_entry_response_body import CreateForwardEntryResponseBody
-from ._create_forward_entry_response import CreateForwardEntryResponse
-from ._create_ha_vip_request import CreateHaVipRequest
-from ._create_ha_vip_response_body import CreateHaVipResponseBody
-from ._create_ha_vip_response import CreateHaVipResponse
-from ._create_hpc_cluster_request import CreateHpcClusterRequest
-from ._create_hpc_cluster_response_body import CreateHpcClusterResponseBody
-from ._create_hpc_cluster_response import CreateHpcClusterResponse
-from ._create_image_request import CreateImageRequest
-from ._create_image_response_body import CreateImageResponseBody
-from ._create_image_response import CreateImageResponse
-from ._create_image_component_request import CreateImageComponentRequest
-from ._create_image_component_response_body import CreateImageComponentResponseBody
-from ._create_image_component_response import CreateImageComponentResponse
-from ._create_image_pipeline_request import CreateImagePipelineRequest
-from ._create_image_pipeline_response_body import CreateImagePipelineResponseBody
-from ._create_image_pipeline_response import CreateImagePipelineResponse
-from ._create_instance_request import CreateInstanceRequest
-from ._create_instance_response_body import CreateInstanceResponseBody
-from ._create_instance_response import CreateInstanceResponse
-from ._create_key_pair_request import CreateKeyPairRequest
-from ._create_key_pair_response_body import CreateKeyPairResponseBody
-from ._create_key_pair_response import CreateKeyPairResponse
-from ._create_launch_template_request import CreateLaunchTemplateRequest
-from ._create_launch_template_response_body import CreateLaunchTemplateResponseBody
-from ._create_launch_template_response import CreateLaunchTemplateResponse
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequest
-from ._create_launch_template_version_response_body import CreateLaunchTemplateVersionResponseBody
-from ._create_launch_template_version_response import CreateLaunchTemplateVersionResponse
-from ._create_nat_gateway_request import CreateNatGatewayRequest
-from ._create_nat_gateway_response_body import CreateNatGatewayResponseBody
-from ._create_nat_gateway_response import CreateNatGatewayResponse
-from ._create_network_interface_request import CreateNetworkInterfaceRequest
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBody
-from ._create_network_interface_response import CreateNetworkInterfaceResponse
-from ._create_network_interface_permission_request import CreateNetworkInterfacePermissionRequest
-from ._create_network_interface_permission_response_body import CreateNetworkInterfacePermissionResponseBody
-from ._create_network_interface_permission_response import CreateNetworkInterfacePermissionResponse
-from ._create_physical_connection_request import CreatePhysicalConnectionRequest
-from ._create_physical_connection_response_body import CreatePhysicalConnectionResponseBody
-from ._create_physical_connection_response import CreatePhysicalConnectionResponse
-from ._create_port_range_list_request import CreatePortRangeListRequest
-from ._create_port_range_list_response_body import CreatePortRangeListResponseBody
-from ._create_port_range_list_response import CreatePortRangeListResponse
-from ._create_prefix_list_request import CreatePrefixListRequest
-from ._create_prefix_list_response_body import CreatePrefixListResponseBody
-from ._create_prefix_list_response import CreatePrefixListResponse
-from ._create_route_entry_request import CreateRouteEntryRequest
-from ._create_route_entry_response_body import CreateRouteEntryResponseBody
-from ._create_route_entry_response import CreateRouteEntryResponse
-from ._create_router_interface_request import CreateRouterInterfaceRequest
-from ._create_router_interface_response_body import CreateRouterInterfaceResponseBody
-from ._create_router_interface_response import CreateRouterInterfaceResponse
-from ._create_savings_plan_request import CreateSavingsPlanRequest
-from ._create_savings_plan_response_body import CreateSavingsPlanResponseBody
-from ._create_savings_plan_response import CreateSavingsPlanResponse
-from ._create_security_group_request import CreateSecurityGroupRequest
-from ._create_security_group_response_body import CreateSecurityGroupResponseBody
-from ._create_security_group_response import CreateSecurityGroupResponse
-from ._create_simulated_system_events_request import CreateSimulatedSystemEventsRequest
-from ._create_simulated_system_events_response_body import CreateSimulatedSystemEventsResponseBody
-from ._create_simulated_system_events_response import CreateSimulatedSystemEventsResponse
-from ._create_snapshot_request import CreateSnapshotRequest
-from ._create_snapshot_response_body import CreateSnapshotResponseBody
-from ._create_snapshot_response import CreateSnapshotResponse
-from ._create_snapshot_group_request import CreateSnapshotGroupRequest
-from ._create_snapshot_group_response_body import CreateSnapshotGroupResponseBody
-from ._create_snapshot_group_response import CreateSnapshotGroupResponse
-from ._create_storage_set_request import CreateStorageSetRequest
-from ._create_storage_set_response_body import CreateStorageSetResponseBody
-from ._create_storage_set_response import CreateStorageSetResponse
-from ._create_vswitch_request import CreateVSwitchRequest
-from ._create_vswitch_response_body import CreateVSwitchResponseBody
-from ._create_vswitch_response import CreateVSwitchResponse
-from ._create_virtual_border_router_request import CreateVirtualBorderRouterRequest
-from ._create_virtual_border_router_response_body import CreateVirtualBorderRouterResponseBody
-from ._create_virtual_border_router_response import CreateVirtualBorderRouterResponse
-from ._create_vpc_request import CreateVpcRequest
-from ._create_vpc_response_body import CreateVpcResponseBody
-from ._create_vpc_response import CreateVpcResponse
-from ._deactivate_router_interface_request import DeactivateRouterInterfaceRequest
-from ._deactivate_router_interface_response_body import DeactivateRouterInterfaceResponseBody
-from ._deactivate_router_interface_response import DeactivateRouterInterfaceResponse
-from ._delete_activation_request import DeleteActivationRequest
-from ._delete_activation_response_body import DeleteActivationResponseBody
-from ._delete_activation_response import DeleteActivationResponse
-from ._delete_auto_provisioning_group_request import DeleteAutoProvisioningGroupRequest
-from ._delete_auto_provisioning_group_response_body import DeleteAutoProvisioningGroupResponseBody
-from ._delete_auto_provisioning_group_response import DeleteAutoProvisioningGroupResponse
-from ._delete_auto_snapshot_policy_request import DeleteAutoSnapshotPolicyRequest
-from ._delete_auto_snapshot_policy_response_body import DeleteAutoSnapshotPolicyResponseBody
-from ._delete_auto_snapshot_policy_response import DeleteAutoSnapshotPolicyResponse
-from ._delete_bandwidth_package_request import DeleteBandwidthPackageRequest
-from ._delete_bandwidth_package_response_body import DeleteBandwidthPackageResponseBody
-from ._delete_bandwidth_package_response import DeleteBandwidthPackageResponse
-from ._delete_command_request import DeleteCommandRequest
-from ._delete_command_response_body import DeleteCommandResponseBody
-from ._delete_command_response import DeleteCommandResponse
-from ._delete_dedicated_host_cluster_request import DeleteDedicatedHostClusterRequest
-from ._delete_dedicated_host_cluster_response_body import DeleteDedicatedHostClusterResponseBody
-from ._delete_dedicated_host_cluster_response import DeleteDedicatedHostClusterResponse
-from ._delete_deployment_set_request import DeleteDeploymentSetRequest
-from ._delete_deployment_set_response_body import DeleteDeploymentSetResponseBody
-from ._delete_deployment_set_response import DeleteDeploymentSetResponse
-from ._delete_diagnostic_metric_sets_request import DeleteDiagnosticMetricSetsRequest
-from ._delete_diagnostic_metric_sets_response_body import DeleteDiagnosticMetricSetsResponseBody
-from ._delete_diagnostic_metric_sets_response import DeleteDiagnosticMetricSetsResponse
-from ._delete_diagnostic_reports_request import DeleteDiagnosticReportsRequest
-from ._delete_diagnostic_reports_response_body import DeleteDiagnosticReportsResponseBody
-from ._delete_diagnostic_reports_response import DeleteDiagnosticReportsResponse
-from ._delete_disk_request import DeleteDiskRequest
-from ._delete_disk_response_body import DeleteDiskResponseBody
-from ._delete_disk_response import DeleteDiskResponse
-from ._delete_forward_entry_request import DeleteForwardEntryRequest
-from ._delete_forward_entry_response_body import DeleteForwardEntryResponseBody
-from ._delete_forward_entry_response import DeleteForwardEntryResponse
-from ._delete_ha_vip_request import DeleteHaVipRequest
-from ._delete_ha_vip_response_body import DeleteHaVipResponseBody
-from ._delete_ha_vip_response import DeleteHaVipResponse
-from ._delete_hpc_cluster_request import DeleteHpcClusterRequest
-from ._delete_hpc_cluster_response_body import DeleteHpcClusterResponseBody
-from ._delete_hpc_cluster_response import DeleteHpcClusterResponse
-from ._delete_image_request import DeleteImageRequest
-from ._delete_image_response_body import DeleteImageResponseBody
-from ._delete_image_response import DeleteImageResponse
-from ._delete_image_component_request import DeleteImageComponentRequest
-from ._delete_image_component_response_body import DeleteImageComponentResponseBody
-from ._delete_image_component_response import DeleteImageComponentResponse
-from ._delete_image_pipeline_request import DeleteImagePipelineRequest
-from ._delete_image_pipeline_response_body import DeleteImagePipelineResponseBody
-from ._delete_image_pipeline_response import DeleteImagePipelineResponse
-from ._delete_instance_request import DeleteInstanceRequest
-from ._delete_instance_response_body import DeleteInstanceResponseBody
-from ._delete_instance_response import DeleteInstanceResponse
-from ._delete_instances_request import DeleteInstancesRequest
-from ._delete_instances_response_body import DeleteInstancesResponseBody
-from ._delete_instances_response import DeleteInstancesResponse
-from ._delete_key_pairs_request import DeleteKeyPairsRequest
-from ._delete_key_pairs_response_body import DeleteKeyPairsResponseBody
-from ._delete_key_pairs_response import DeleteKeyPairsResponse
-from ._delete_launch_template_request import DeleteLaunchTemplateRequest
-from ._delete_launch_template_response_body import DeleteLaunchTemplateResponseBody
-from ._delete_launch_template_response import DeleteLaunchTemplateResponse
-from ._delete_launch_template_version_request import DeleteLaunchTemplateVersionRequest
-from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBody
-from ._delete_launch_template_version_response import DeleteLaunchTemplateVersionResponse
-from ._delete_nat_gateway_request import DeleteNatGatewayRequest
-from ._delete_nat_gateway_response_body import DeleteNatGatewayResponseBody
-from ._delete_nat_gateway_response import DeleteNatGatewayResponse
-from ._delete_network_interface_request import DeleteNetworkInterfaceRequest
-from ._delete_network_interface_response_body import DeleteNetworkInterfaceResponseBody
-from ._delete_network_interface_response import DeleteNetworkInterfaceResponse
-from ._delete_network_interface_permission_request import DeleteNetworkInterfacePermissionRequest
-from ._delete_network_interface_permission_response_body import DeleteNetworkInterfacePermissionResponseBody
-from ._delete_network_interface_permission_response import DeleteNetworkInterfacePermissionResponse
-from ._delete_physical_connection_request import DeletePhysicalConnectionRequest
-from ._delete_physical_connection_response_body import DeletePhysicalConnectionResponseBody
-from ._delete_physical_connection_response import DeletePhysicalConnectionResponse
-from ._delete_port_range_list_request import DeletePortRangeListRequest
-from ._delete_port_range_list_response_body import DeletePortRangeListResponseBody
-from ._delete_port_range_list_response import DeletePortRangeListResponse
-from ._delete_prefix_list_request import DeletePrefixListRequest
-from ._delete_prefix_list_response_body import DeletePrefixListResponseBody
-from ._delete_prefix_list_response import DeletePrefixListResponse
-from ._delete_route_entry_request import DeleteRouteEntryRequest
-from ._delete_route_entry_response_body import DeleteRouteEntryResponseBody
-from ._delete_route_entry_response import DeleteRouteEntryResponse
-from ._delete_router_interface_request import DeleteRouterInterfaceRequest
-from ._delete_router_interface_response_body import DeleteRouterInterfaceResponseBody
-from ._delete_router_interface_response import DeleteRouterInterfaceResponse
-from ._delete_security_group_request import DeleteSecurityGroupRequest
-from ._delete_security_group_response_body import DeleteSecurityGroupResponseBody
-from ._delete_security_group_response import DeleteSecurityGroupResponse
-from ._delete_snapshot_request import DeleteSnapshotRequest
-from ._delete_snapshot_response_body import DeleteSnapshotResponseBody
-from ._delete_snapshot_response import DeleteSnapshotResponse
-from ._delete_snapshot_group_request import DeleteSnapshotGroupRequest
-from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBody
-from ._delete_snapshot_group_response import DeleteSnapshotGroupResponse
-from ._delete_storage_set_request import DeleteStorageSetRequest
-from ._delete_storage_set_response_body import DeleteStorageSetResponseBody
-from ._delete_storage_set_response import DeleteStorageSetResponse
-from ._delete_vswitch_request import DeleteVSwitchRequest
-from ._delete_vswitch_response_body import DeleteVSwitchResponseBody
-from ._delete_vswitch_response import DeleteVSwitchResponse
-from ._delete_virtual_border_router_request import DeleteVirtualBorderRouterRequest
-from ._delete_virtual_border_router_response_body import DeleteVirtualBorderRouterResponseBody
-from ._delete_virtual_border_router_response import DeleteVirtualBorderRouterResponse
-from ._delete_vpc_request import DeleteVpcRequest
-from ._delete_vpc_response_body import DeleteVpcResponseBody
-from ._delete_vpc_response import DeleteVpcResponse
-from ._deregister_managed_instance_request import DeregisterManagedInstanceRequest
-from ._deregister_managed_instance_response_body import DeregisterManagedInstanceResponseBody
-from ._deregister_managed_instance_response import DeregisterManagedInstanceResponse
-from ._describe_access_points_request import DescribeAccessPointsRequest
-from ._describe_access_points_response_body import DescribeAccessPointsResponseBody
-from ._describe_access_points_response import DescribeAccessPointsResponse
-from ._describe_account_attributes_request import DescribeAccountAttributesRequest
-from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBody
-from ._describe_account_attributes_response import DescribeAccountAttributesResponse
-from ._describe_activations_request import DescribeActivationsRequest
-from ._describe_activations_response_body import DescribeActivationsResponseBody
-from ._describe_activations_response import DescribeActivationsResponse
-from ._describe_auto_provisioning_group_history_request import DescribeAutoProvisioningGroupHistoryRequest
-from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBody
-from ._describe_auto_provisioning_group_history_response import DescribeAutoProvisioningGroupHistoryResponse
-from ._describe_auto_provisioning_group_instances_request import DescribeAutoProvisioningGroupInstancesRequest
-from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBody
-from ._describe_auto_provisioning_group_instances_response import DescribeAutoProvisioningGroupInstancesResponse
-from ._describe_auto_provisioning_groups_request import DescribeAutoProvisioningGroupsRequest
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBody
-from ._describe_auto_provisioning_groups_response import DescribeAutoProvisioningGroupsResponse
-from ._describe_auto_snapshot_policy_associations_request import DescribeAutoSnapshotPolicyAssociationsRequest
-from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBody
-from ._describe_auto_snapshot_policy_associations_response import DescribeAutoSnapshotPolicyAssociationsResponse
-from ._describe_auto_snapshot_policy_ex_request import DescribeAutoSnapshotPolicyExRequest
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBody
-from ._describe_auto_snapshot_policy_ex_response import DescribeAutoSnapshotPolicyExResponse
-from ._describe_available_resource_request import DescribeAvailableResourceRequest
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBody
-from ._describe_available_resource_response import DescribeAvailableResourceResponse
-from ._describe_bandwidth_limitation_request import DescribeBandwidthLimitationRequest
-from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBody
-from ._describe_bandwidth_limitation_response import DescribeBandwidthLimitationResponse
-from ._describe_bandwidth_packages_request import DescribeBandwidthPackagesRequest
-from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBody
-from ._describe_bandwidth_packages_response import DescribeBandwidthPackagesResponse
-from ._describe_capacity_reservation_instances_request import DescribeCapacityReservationInstancesRequest
-from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBody
-from ._describe_capacity_reservation_instances_response import DescribeCapacityReservationInstancesResponse
-from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequest
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBody
-from ._describe_capacity_reservations_response import DescribeCapacityReservationsResponse
-from ._describe_classic_link_instances_request import DescribeClassicLinkInstancesRequest
-from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBody
-from ._describe_classic_link_instances_response import DescribeClassicLinkInstancesResponse
-from ._describe_cloud_assistant_settings_request import DescribeCloudAssistantSettingsRequest
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBody
-from ._describe_cloud_assistant_settings_response import DescribeCloudAssistantSettingsResponse
-from ._describe_cloud_assistant_status_request import DescribeCloudAssistantStatusRequest
-from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBody
-from ._describe_cloud_assistant_status_response import DescribeCloudAssistantStatusResponse
-from ._describe_clusters_request import DescribeClustersRequest
-from ._describe_clusters_response_body import DescribeClustersResponseBody
-from ._describe_clusters_response import DescribeClustersResponse
-from ._describe_commands_request import DescribeCommandsRequest
-from ._describe_commands_response_body import DescribeCommandsResponseBody
-from ._describe_commands_response import DescribeCommandsResponse
-from ._describe_dedicated_host_auto_renew_request import DescribeDedicatedHostAutoRenewRequest
-from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBody
-from ._describe_dedicated_host_auto_renew_response import DescribeDedicatedHostAutoRenewResponse
-from ._describe_dedicated_host_clusters_request import DescribeDedicatedHostClustersRequest
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBody
-from ._describe_dedicated_host_clusters_response import DescribeDedicatedHostClustersResponse
-from ._describe_dedicated_host_types_request import DescribeDedicatedHostTypesRequest
-from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBody
-from ._describe_dedicated_host_types_response import DescribeDedicatedHostTypesResponse
-from ._describe_dedicated_hosts_request import DescribeDedicatedHostsRequest
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBody
-from ._describe_dedicated_hosts_response import DescribeDedicatedHostsResponse
-from ._describe_deployment_set_supported_instance_type_family_request import DescribeDeploymentSetSupportedInstanceTypeFamilyRequest
-from ._describe_deployment_set_supported_instance_type_family_response_body import DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody
-from ._describe_deployment_set_supported_instance_type_family_response import DescribeDeploymentSetSupportedInstanceTypeFamilyResponse
-from ._describe_deployment_sets_request import DescribeDeploymentSetsRequest
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBody
-from ._describe_deployment_sets_response import DescribeDeploymentSetsResponse
-from ._describe_diagnostic_metric_sets_request import DescribeDiagnosticMetricSetsRequest
-from ._describe_diagnostic_metric_sets_response_body import DescribeDiagnosticMetricSetsResponseBody
-from ._describe_diagnostic_metric_sets_response import DescribeDiagnosticMetricSetsResponse
-from ._describe_diagnostic_metrics_request import DescribeDiagnosticMetricsRequest
-from ._describe_diagnostic_metrics_response_body import DescribeDiagnosticMetricsResponseBody
-from ._describe_diagnostic_metrics_response import DescribeDiagnosticMetricsResponse
-from ._describe_diagnostic_report_attributes_request import DescribeDiagnosticReportAttributesRequest
-from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBody
-from ._describe_diagnostic_report_attributes_response import DescribeDiagnosticReportAttributesResponse
-from ._describe_diagnostic_reports_request import DescribeDiagnosticReportsRequest
-from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBody
-from ._describe_diagnostic_reports_response import DescribeDiagnosticReportsResponse
-from ._describe_disk_default_kmskey_id_request import DescribeDiskDefaultKMSKeyIdRequest
-from ._describe_disk_default_kmskey_id_response_body import DescribeDiskDefaultKMSKeyIdResponseBody
-from ._describe_disk_default_kmskey_id_response import DescribeDiskDefaultKMSKeyIdResponse
-from ._describe_disk_encryption_by_default_status_request import DescribeDiskEncryptionByDefaultStatusRequest
-from ._describe_disk_encryption_by_default_status_response_body import DescribeDiskEncryptionByDefaultStatusResponseBody
-from ._describe_disk_encryption_by_default_status_response import DescribeDiskEncryptionByDefaultStatusResponse
-from ._describe_disk_monitor_data_request import DescribeDiskMonitorDataRequest
-from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBody
-from ._describe_disk_monitor_data_response import DescribeDiskMonitorDataResponse
-from ._describe_disks_request import DescribeDisksRequest
-from ._describe_disks_response_body import DescribeDisksResponseBody
-from ._describe_disks_response import DescribeDisksResponse
-from ._describe_disks_full_status_request import DescribeDisksFullStatusRequest
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBody
-from ._describe_disks_full_status_response import DescribeDisksFullStatusResponse
-from ._describe_eip_addresses_request import DescribeEipAddressesRequest
-from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBody
-from ._describe_eip_addresses_response import DescribeEipAddressesResponse
-from ._describe_eip_monitor_data_request import DescribeEipMonitorDataRequest
-from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBody
-from ._describe_eip_monitor_data_response import DescribeEipMonitorDataResponse
-from ._describe_elasticity_assurance_auto_renew_attribute_request import DescribeElasticityAssuranceAutoRenewAttributeRequest
-from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBody
-from ._describe_elasticity_assurance_auto_renew_attribute_response import DescribeElasticityAssuranceAutoRenewAttributeResponse
-from ._describe_elasticity_assurance_instances_request import DescribeElasticityAssuranceInstancesRequest
-from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBody
-from ._describe_elasticity_assurance_instances_response import DescribeElasticityAssuranceInstancesResponse
-from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequest
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBody
-from ._describe_elasticity_assurances_response import DescribeElasticityAssurancesResponse
-from ._describe_eni_monitor_data_request import DescribeEniMonitorDataRequest
-from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBody
-from ._describe_eni_monitor_data_response import DescribeEniMonitorDataResponse
-from ._describe_forward_table_entries_request import DescribeForwardTableEntriesRequest
-from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBody
-from ._describe_forward_table_entries_response import DescribeForwardTableEntriesResponse
-from ._describe_ha_vips_request import DescribeHaVipsRequest
-from ._describe_ha_vips_response_body import DescribeHaVipsResponseBody
-from ._describe_ha_vips_response import DescribeHaVipsResponse
-from ._describe_hpc_clusters_request import DescribeHpcClustersRequest
-from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBody
-from ._describe_hpc_clusters_response import DescribeHpcClustersResponse
-from ._describe_image_components_request import DescribeImageComponentsRequest
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBody
-from ._describe_image_components_response import DescribeImageComponentsResponse
-from ._describe_image_from_family_request import DescribeImageFromFamilyRequest
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBody
-from ._describe_image_from_family_response import DescribeImageFromFamilyResponse
-from ._describe_image_pipeline_executions_request import DescribeImagePipelineExecutionsRequest
-from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBody
-from ._describe_image_pipeline_executions_response import DescribeImagePipelineExecutionsResponse
-from ._describe_image_pipelines_request import DescribeImagePipelinesRequest
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBody
-from ._describe_image_pipelines_response import DescribeImagePipelinesResponse
-from ._describe_image_share_permission_request import DescribeImageSharePermissionRequest
-from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBody
-from ._describe_image_share_permission_response import DescribeImageSharePermissionResponse
-from ._describe_image_support_instance_types_request import DescribeImageSupportInstanceTypesRequest
-from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBody
-from ._describe_image_support_instance_types_response import DescribeImageSupportInstanceTypesResponse
-from ._describe_images_request import DescribeImagesRequest
-from ._describe_images_response_body import DescribeImagesResponseBody
-from ._describe_images_response import DescribeImagesResponse
-from ._describe_instance_attachment_attributes_request import DescribeInstanceAttachmentAttributesRequest
-from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBody
-from ._describe_instance_attachment_attributes_response import DescribeInstanceAttachmentAttributesResponse
-from ._describe_instance_attribute_request import DescribeInstanceAttributeRequest
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBody
-from ._describe_instance_attribute_response import DescribeInstanceAttributeResponse
-from ._describe_instance_auto_renew_attribute_request import DescribeInstanceAutoRenewAttributeRequest
-from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBody
-from ._describe_instance_auto_renew_attribute_response import DescribeInstanceAutoRenewAttributeResponse
-from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequest
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBody
-from ._describe_instance_history_events_response import DescribeInstanceHistoryEventsResponse
-from ._describe_instance_maintenance_attributes_request import DescribeInstanceMaintenanceAttributesRequest
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBody
-from ._describe_instance_maintenance_attributes_response import DescribeInstanceMaintenanceAttributesResponse
-from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequest
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBody
-from ._describe_instance_modification_price_response import DescribeInstanceModificationPriceResponse
-from ._describe_instance_monitor_data_request import DescribeInstanceMonitorDataRequest
-from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBody
-from ._describe_instance_monitor_data_response import DescribeInstanceMonitorDataResponse
-from ._describe_instance_ram_role_request import DescribeInstanceRamRoleRequest
-from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBody
-from ._describe_instance_ram_role_response import DescribeInstanceRamRoleResponse
-from ._describe_instance_status_request import DescribeInstanceStatusRequest
-from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBody
-from ._describe_instance_status_response import DescribeInstanceStatusResponse
-from ._describe_instance_topology_request import DescribeInstanceTopologyRequest
-from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBody
-from ._describe_instance_topology_response import DescribeInstanceTopologyResponse
-from ._describe_instance_type_families_request import DescribeInstanceTypeFamiliesRequest
-from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBody
-from ._describe_instance_type_families_response import DescribeInstanceTypeFamiliesResponse
-from ._describe_instance_types_request import DescribeInstanceTypesRequest
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBody
-from ._describe_instance_types_response import DescribeInstanceTypesResponse
-from ._describe_instance_vnc_url_request import DescribeInstanceVncUrlRequest
-from ._describe_instance_vnc_url_response_body import DescribeInstanceVncUrlResponseBody
-from ._describe_instance_vnc_url_response import DescribeInstanceVncUrlResponse
-from ._describe_instances_request import DescribeInstancesRequest
-from ._describe_instances_response_body import DescribeInstancesResponseBody
-from ._describe_instances_response import DescribeInstancesResponse
-from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequest
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBody
-from ._describe_instances_full_status_response import DescribeInstancesFullStatusResponse
-from ._describe_invocation_results_request import DescribeInvocationResultsRequest
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBody
-from ._describe_invocation_results_response import DescribeInvocationResultsResponse
-from ._describe_invocations_request import DescribeInvocationsRequest
-from ._describe_invocations_response_body import DescribeInvocationsResponseBody
-from ._describe_invocations_response import DescribeInvocationsResponse
-from ._describe_key_pairs_request import DescribeKeyPairsRequest
-from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBody
-from ._describe_key_pairs_response import DescribeKeyPairsResponse
-from ._describe_launch_template_versions_request import DescribeLaunchTemplateVersionsRequest
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBody
-from ._describe_launch_template_versions_response import DescribeLaunchTemplateVersionsResponse
-from ._describe_launch_templates_request import DescribeLaunchTemplatesRequest
-from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBody
-from ._describe_launch_templates_response import DescribeLaunchTemplatesResponse
-from ._describe_limitation_request import DescribeLimitationRequest
-from ._describe_limitation_response_body import DescribeLimitationResponseBody
-from ._describe_limitation_response import DescribeLimitationResponse
-from ._describe_locked_snapshots_request import DescribeLockedSnapshotsRequest
-from ._describe_locked_snapshots_response_body import DescribeLockedSnapshotsResponseBody
-from ._describe_locked_snapshots_response import DescribeLockedSnapshotsResponse
-from ._describe_managed_instances_request import DescribeManagedInstancesRequest
-from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBody
-from ._describe_managed_instances_response import DescribeManagedInstancesResponse
-from ._describe_nat_gateways_request import DescribeNatGatewaysRequest
-from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBody
-from ._describe_nat_gateways_response import DescribeNatGatewaysResponse
-from ._describe_network_interface_attribute_request import DescribeNetworkInterfaceAttributeRequest
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBody
-from ._describe_network_interface_attribute_response import DescribeNetworkInterfaceAttributeResponse
-from ._describe_network_interface_permissions_request import DescribeNetworkInterfacePermissionsRequest
-from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBody
-from ._describe_network_interface_permissions_response import DescribeNetworkInterfacePermissionsResponse
-from ._describe_network_interfaces_request import DescribeNetworkInterfacesRequest
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBody
-from ._describe_network_interfaces_response import DescribeNetworkInterfacesResponse
-from ._describe_new_project_eip_monitor_data_request import DescribeNewProjectEipMonitorDataRequest
-from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBody
-from ._describe_new_project_eip_monitor_data_response import DescribeNewProjectEipMonitorDataResponse
-from ._describe_physical_connections_request import DescribePhysicalConnectionsRequest
-from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBody
-from ._describe_physical_connections_response import DescribePhysicalConnectionsResponse
-from ._describe_port_range_list_associations_request import DescribePortRangeListAssociationsRequest
-from ._describe_port_range_list_associations_response_body import DescribePortRangeListAssociationsResponseBody
-from ._describe_port_range_list_associations_response import DescribePortRangeListAssociationsResponse
-from ._describe_port_range_list_entries_request import DescribePortRangeListEntriesRequest
-from ._describe_port_range_list_entries_response_body import DescribePortRangeListEntriesResponseBody
-from ._describe_port_range_list_entries_response import DescribePortRangeListEntriesResponse
-from ._describe_port_range_lists_request import DescribePortRangeListsRequest
-from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBody
-from ._describe_port_range_lists_response import DescribePortRangeListsResponse
-from ._describe_prefix_list_associations_request import DescribePrefixListAssociationsRequest
-from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBody
-from ._describe_prefix_list_associations_response import DescribePrefixListAssociationsResponse
-from ._describe_prefix_list_attributes_request import DescribePrefixListAttributesRequest
-from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBody
-from ._describe_prefix_list_attributes_response import DescribePrefixListAttributesResponse
-from ._describe_prefix_lists_request import DescribePrefixListsRequest
-from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBody
-from ._describe_prefix_lists_response import DescribePrefixListsResponse
-from ._describe_price_request import DescribePriceRequest
-from ._describe_price_response_body import DescribePriceResponseBody
-from ._describe_price_response import DescribePriceResponse
-from ._describe_recommend_instance_type_request import DescribeRecommendInstanceTypeRequest
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBody
-from ._describe_recommend_instance_type_response import DescribeRecommendInstanceTypeResponse
-from ._describe_regions_request import DescribeRegionsRequest
-from ._describe_regions_response_body import DescribeRegionsResponseBody
-from ._describe_regions_response import DescribeRegionsResponse
-from ._describe_renewal_price_request import DescribeRenewalPriceRequest
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBody
-from ._describe_renewal_price_response import DescribeRenewalPriceResponse
-from ._describe_reserved_instance_auto_renew_attribute_request import DescribeReservedInstanceAutoRenewAttributeRequest
-from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBody
-from ._describe_reserved_instance_auto_renew_attribute_response import DescribeReservedInstanceAutoRenewAttributeResponse
-from ._describe_reserved_instances_request import DescribeReservedInstancesRequest
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBody
-from ._describe_reserved_instances_response import DescribeReservedInstancesResponse
-from ._describe_resource_by_tags_request import DescribeResourceByTagsRequest
-from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBody
-from ._describe_resource_by_tags_response import DescribeResourceByTagsResponse
-from ._describe_resources_modification_request import DescribeResourcesModificationRequest
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBody
-from ._describe_resources_modification_response import DescribeResourcesModificationResponse
-from ._describe_route_tables_request import DescribeRouteTablesRequest
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBody
-from ._describe_route_tables_response import DescribeRouteTablesResponse
-from ._describe_router_interfaces_request import DescribeRouterInterfacesRequest
-from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBody
-from ._describe_router_interfaces_response import DescribeRouterInterfacesResponse
-from ._describe_savings_plan_estimation_request import DescribeSavingsPlanEstimationRequest
-from ._describe_savings_plan_estimation_response_body import DescribeSavingsPlanEstimationResponseBody
-from ._describe_savings_plan_estimation_response import DescribeSavingsPlanEstimationResponse
-from ._describe_savings_plan_price_request import DescribeSavingsPlanPriceRequest
-from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBody
-from ._describe_savings_plan_price_response import DescribeSavingsPlanPriceResponse
-from ._describe_security_group_attribute_request import DescribeSecurityGroupAttributeRequest
-from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBody
-from ._describe_security_group_attribute_response import DescribeSecurityGroupAttributeResponse
-from ._describe_security_group_references_request import DescribeSecurityGroupReferencesRequest
-from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBody
-from ._describe_security_group_references_response import DescribeSecurityGroupReferencesResponse
-from ._describe_security_groups_request import DescribeSecurityGroupsRequest
-from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBody
-from ._describe_security_groups_response import DescribeSecurityGroupsResponse
-from ._describe_send_file_results_request import DescribeSendFileResultsRequest
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBody
-from ._describe_send_file_results_response import DescribeSendFileResultsResponse
-from ._describe_snapshot_groups_request import DescribeSnapshotGroupsRequest
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBody
-from ._describe_snapshot_groups_response import DescribeSnapshotGroupsResponse
-from ._describe_snapshot_links_request import DescribeSnapshotLinksRequest
-from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBody
-from ._describe_snapshot_links_response import DescribeSnapshotLinksResponse
-from ._describe_snapshot_monitor_data_request import DescribeSnapshotMonitorDataRequest
-from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBody
-from ._describe_snapshot_monitor_data_response import DescribeSnapshotMonitorDataResponse
-from ._describe_snapshot_package_request import DescribeSnapshotPackageRequest
-from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBody
-from ._describe_snapshot_package_response import DescribeSnapshotPackageResponse
-from ._describe_snapshots_request import DescribeSnapshotsRequest
-from ._describe_snapshots_response_body import DescribeSnapshotsResponseBody
-from ._describe_snapshots_response import DescribeSnapshotsResponse
-from ._describe_snapshots_usage_request import DescribeSnapshotsUsageRequest
-from ._describe_snapshots_usage_response_body import DescribeSnapshotsUsageResponseBody
-from ._describe_snapshots_usage_response import DescribeSnapshotsUsageResponse
-from ._describe_spot_advice_request import DescribeSpotAdviceRequest
-from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBody
-from ._describe_spot_advice_response import DescribeSpotAdviceResponse
-from ._describe_spot_price_history_request import DescribeSpotPriceHistoryRequest
-from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBody
-from ._describe_spot_price_history_response import DescribeSpotPriceHistoryResponse
-from ._describe_storage_capacity_units_request import DescribeStorageCapacityUnitsRequest
-from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBody
-from ._describe_storage_capacity_units_response import DescribeStorageCapacityUnitsResponse
-from ._describe_storage_set_details_request import DescribeStorageSetDetailsRequest
-from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBody
-from ._describe_storage_set_details_response import DescribeStorageSetDetailsResponse
-from ._describe_storage_sets_request import DescribeStorageSetsRequest
-from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBody
-from ._describe_storage_sets_response import DescribeStorageSetsResponse
-from ._describe_tags_request import DescribeTagsRequest
-from ._describe_tags_response_body import DescribeTagsResponseBody
-from ._describe_tags_response import DescribeTagsResponse
-from ._describe_task_attribute_request import DescribeTaskAttributeRequest
-from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBody
-from ._describe_task_attribute_response import DescribeTaskAttributeResponse
-from ._describe_tasks_request import DescribeTasksRequest
-from ._describe_tasks_response_body import DescribeTasksResponseBody
-from ._describe_tasks_response import DescribeTasksResponse
-from ._describe_terminal_sessions_request import DescribeTerminalSessionsRequest
-from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBody
-from ._describe_terminal_sessions_response import DescribeTerminalSessionsResponse
-from ._describe_user_business_behavior_request import DescribeUserBusinessBehaviorRequest
-from ._describe_user_business_behavior_response_body import DescribeUserBusinessBehaviorResponseBody
-from ._describe_user_business_behavior_response import DescribeUserBusinessBehaviorResponse
-from ._describe_user_data_request import DescribeUserDataRequest
-from ._describe_user_data_response_body import DescribeUserDataResponseBody
-from ._describe_user_data_response import DescribeUserDataResponse
-from ._describe_vrouters_request import DescribeVRoutersRequest
-from ._describe_vrouters_response_body import DescribeVRoutersResponseBody
-from ._describe_vrouters_response import DescribeVRoutersResponse
-from ._describe_vswitches_request import DescribeVSwitchesRequest
-from ._describe_vswitches_response_body import DescribeVSwitchesResponseBody
-from ._describe_vswitches_response import DescribeVSwitchesResponse
-from ._describe_virtual_border_routers_request import DescribeVirtualBorderRoutersRequest
-from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBody
-from ._describe_virtual_border_routers_response import DescribeVirtualBorderRoutersResponse
-from ._describe_virtual_border_routers_for_physical_connection_request import DescribeVirtualBorderRoutersForPhysicalConnectionRequest
-from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody
-from ._describe_virtual_border_routers_for_physical_connection_response import DescribeVirtualBorderRoutersForPhysicalConnectionResponse
-from ._describe_vpcs_request import DescribeVpcsRequest
-from ._describe_vpcs_response_body import DescribeVpcsResponseBody
-from ._describe_vpcs_response import DescribeVpcsResponse
-from ._describe_zones_request import DescribeZonesRequest
-from ._describe_zones_response_body import DescribeZonesResponseBody
-from ._describe_zones_response import DescribeZonesResponse
-from ._detach_classic_link_vpc_request import DetachClassicLinkVpcRequest
-from ._detach_classic_link_vpc_response_body import DetachClassicLinkVpcResponseBody
-from ._detach_classic_link_vpc_response import DetachClassicLinkVpcResponse
-from ._detach_disk_request import DetachDiskRequest
-from ._detach_disk_response_body import DetachDiskResponseBody
-from ._detach_disk_response import DetachDiskResponse
-from ._detach_instance_ram_role_request import DetachInstanceRamRoleRequest
-from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBody
-from ._detach_instance_ram_role_response import DetachInstanceRamRoleResponse
-from ._detach_key_pair_request import DetachKeyPairRequest
-from ._detach_key_pair_response_body import DetachKeyPairResponseBody
-from ._detach_key_pair_response import DetachKeyPairResponse
-from ._detach_network_interface_request import DetachNetworkInterfaceRequest
-from ._detach_network_interface_response_body import DetachNetworkInterfaceResponseBody
-from ._detach_network_interface_response import DetachNetworkInterfaceResponse
-from ._disable_activation_request import DisableActivationRequest
-from ._disable_activation_response_body import DisableActivationResponseBody
-from ._disable_activation_response import DisableActivationResponse
-from ._disable_disk_encryption_by_default_request import DisableDiskEncryptionByDefaultRequest
-from ._disable_disk_encryption_by_default_response_body import DisableDiskEncryptionByDefaultResponseBody
-from ._disable_disk_encryption_by_default_response import DisableDiskEncryptionByDefaultResponse
-from ._disable_network_interface_qo_srequest import DisableNetworkInterfaceQoSRequest
-from ._disable_network_interface_qo_sresponse_body import DisableNetworkInterfaceQoSResponseBody
-from ._disable_network_interface_qo_sresponse import DisableNetworkInterfaceQoSResponse
-from ._enable_disk_encryption_by_default_request import EnableDiskEncryptionByDefaultRequest
-from ._enable_disk_encryption_by_default_response_body import EnableDiskEncryptionByDefaultResponseBody
-from ._enable_disk_encryption_by_default_response import EnableDiskEncryptionByDefaultResponse
-from ._enable_network_interface_qo_srequest import EnableNetworkInterfaceQoSRequest
-from ._enable_network_interface_qo_sresponse_body import EnableNetworkInterfaceQoSResponseBody
-from ._enable_network_interface_qo_sresponse import EnableNetworkInterfaceQoSResponse
-from ._enable_physical_connection_request import EnablePhysicalConnectionRequest
-from ._enable_physical_connection_response_body import EnablePhysicalConnectionResponseBody
-from ._enable_physical_connection_response import EnablePhysicalConnectionResponse
-from ._end_terminal_session_request import EndTerminalSessionRequest
-from ._end_terminal_session_response_body import EndTerminalSessionResponseBody
-from ._end_terminal_session_response import EndTerminalSessionResponse
-from ._export_image_request import ExportImageRequest
-from ._export_image_response_body import ExportImageResponseBody
-from ._export_image_response import ExportImageResponse
-from ._export_snapshot_request import ExportSnapshotRequest
-from ._export_snapshot_response_body import ExportSnapshotResponseBody
-from ._export_snapshot_response import ExportSnapshotResponse
-from ._get_instance_console_output_request import GetInstanceConsoleOutputRequest
-from ._get_instance_console_output_response_body import GetInstanceConsoleOutputResponseBody
-from ._get_instance_console_output_response import GetInstanceConsoleOutputResponse
-from ._get_instance_screenshot_request import GetInstanceScreenshotRequest
-from ._get_instance_screenshot_response_body import GetInstanceScreenshotResponseBody
-from ._get_instance_screenshot_response import GetInstanceScreenshotResponse
-from ._import_image_request import ImportImageRequest
-from ._import_image_response_body import ImportImageResponseBody
-from ._import_image_response import ImportImageResponse
-from ._import_key_pair_request import ImportKeyPairRequest
-from ._import_key_pair_response_body import ImportKeyPairResponseBody
-from ._import_key_pair_response import ImportKeyPairResponse
-from ._install_cloud_assistant_request import InstallCloudAssistantRequest
-from ._install_cloud_assistant_response_body import InstallCloudAssistantResponseBody
-from ._install_cloud_assistant_response import InstallCloudAssistantResponse
-from ._invoke_command_request import InvokeCommandRequest
-from ._invoke_command_shrink_request import InvokeCommandShrinkRequest
-from ._invoke_command_response_body import InvokeCommandResponseBody
-from ._invoke_command_response import InvokeCommandResponse
-from ._join_resource_group_request import JoinResourceGroupRequest
-from ._join_resource_group_response_body import JoinResourceGroupResponseBody
-from ._join_resource_group_response import JoinResourceGroupResponse
-from ._join_security_group_request import JoinSecurityGroupRequest
-from ._join_security_group_response_body import JoinSecurityGroupResponseBody
-from ._join_security_group_response import JoinSecurityGroupResponse
-from ._leave_security_group_request import LeaveSecurityGroupRequest
-from ._leave_security_group_response_body import LeaveSecurityGroupResponseBody
-from ._leave_security_group_response import LeaveSecurityGroupResponse
-from ._list_plugin_status_request import ListPluginStatusRequest
-from ._list_plugin_status_response_body import ListPluginStatusResponseBody
-from ._list_plugin_status_response import ListPluginStatusResponse
-from ._list_tag_resources_request import ListTagResourcesRequest
-from ._list_tag_resources_response_body import ListTagResourcesResponseBody
-from ._list_tag_resources_response import ListTagResourcesResponse
-from ._lock_snapshot_request import LockSnapshotRequest
-from ._lock_snapshot_response_body import LockSnapshotResponseBody
-from ._lock_snapshot_response import LockSnapshotResponse
-from ._modify_auto_provisioning_group_request import ModifyAutoProvisioningGroupRequest
-from ._modify_auto_provisioning_group_response_body import ModifyAutoProvisioningGroupResponseBody
-from ._modify_auto_provisioning_group_response import ModifyAutoProvisioningGroupResponse
-from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequest
-from ._modify_auto_snapshot_policy_ex_response_body import ModifyAutoSnapshotPolicyExResponseBody
-from ._modify_auto_snapshot_policy_ex_response import ModifyAutoSnapshotPolicyExResponse
-from ._modify_bandwidth_package_spec_request import ModifyBandwidthPackageSpecRequest
-from ._modify_bandwidth_package_spec_response_body import ModifyBandwidthPackageSpecResponseBody
-from ._modify_bandwidth_package_spec_response import ModifyBandwidthPackageSpecResponse
-from ._modify_capacity_reservation_request import ModifyCapacityReservationRequest
-from ._modify_capacity_reservation_response_body import ModifyCapacityReservationResponseBody
-from ._modify_capacity_reservation_response import ModifyCapacityReservationResponse
-from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequest
-from ._modify_cloud_assistant_settings_shrink_request import ModifyCloudAssistantSettingsShrinkRequest
-from ._modify_cloud_assistant_settings_response_body import ModifyCloudAssistantSettingsResponseBody
-from ._modify_cloud_assistant_settings_response import ModifyCloudAssistantSettingsResponse
-from ._modify_command_request import ModifyCommandRequest
-from ._modify_command_response_body import ModifyCommandResponseBody
-from ._modify_command_response import ModifyCommandResponse
-from ._modify_dedicated_host_attribute_request import ModifyDedicatedHostAttributeRequest
-from ._modify_dedicated_host_attribute_response_body import ModifyDedicatedHostAttributeResponseBody
-from ._modify_dedicated_host_attribute_response import ModifyDedicatedHostAttributeResponse
-from ._modify_dedicated_host_auto_release_time_request import ModifyDedicatedHostAutoReleaseTimeRequest
-from ._modify_dedicated_host_auto_release_time_response_body import ModifyDedicatedHostAutoReleaseTimeResponseBody
-from ._modify_dedicated_host_auto_release_time_response import ModifyDedicatedHostAutoReleaseTimeResponse
-from ._modify_dedicated_host_auto_renew_attribute_request import ModifyDedicatedHostAutoRenewAttributeRequest
-from ._modify_dedicated_host_auto_renew_attribute_response_body import ModifyDedicatedHostAutoRenewAttributeResponseBody
-from ._modify_dedicated_host_auto_renew_attribute_response import ModifyDedicatedHostAutoRenewAttributeResponse
-from ._modify_dedicated_host_cluster_attribute_request import ModifyDedicatedHostClusterAttributeRequest
-from ._modify_dedicated_host_cluster_attribute_response_body import ModifyDedicatedHostClusterAttributeResponseBody
-from ._modify_dedicated_host_cluster_attribute_response import ModifyDedicatedHostClusterAttributeResponse
-from ._modify_dedicated_hosts_charge_type_request import ModifyDedicatedHostsChargeTypeRequest
-from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBody
-from ._modify_dedicated_hosts_charge_type_response import ModifyDedicatedHostsChargeTypeResponse
-from ._modify_deployment_set_attribute_request import ModifyDeploymentSetAttributeRequest
-from ._modify_deployment_set_attribute_response_body import ModifyDeploymentSetAttributeResponseBody
-from ._modify_deployment_set_attribute_response import ModifyDeploymentSetAttributeResponse
-from ._modify_diagnostic_metric_set_request import ModifyDiagnosticMetricSetRequest
-from ._modify_diagnostic_metric_set_response_body import ModifyDiagnosticMetricSetResponseBody
-from ._modify_diagnostic_metric_set_response import ModifyDiagnosticMetricSetResponse
-from ._modify_disk_attribute_request import ModifyDiskAttributeRequest
-from ._modify_disk_attribute_response_body import ModifyDiskAttributeResponseBody
-from ._modify_disk_attribute_response import ModifyDiskAttributeResponse
-from ._modify_disk_charge_type_request import ModifyDiskChargeTypeRequest
-from ._modify_disk_charge_type_response_body import ModifyDiskChargeTypeResponseBody
-from ._modify_disk_charge_type_response import ModifyDiskChargeTypeResponse
-from ._modify_disk_default_kmskey_id_request import ModifyDiskDefaultKMSKeyIdRequest
-from ._modify_disk_default_kmskey_id_response_body import ModifyDiskDefaultKMSKeyIdResponseBody
-from ._modify_disk_default_kmskey_id_response import ModifyDiskDefaultKMSKeyIdResponse
-from ._modify_disk_deployment_request import ModifyDiskDeploymentRequest
-from ._modify_disk_deployment_response_body import ModifyDiskDeploymentResponseBody
-from ._modify_disk_deployment_response import ModifyDiskDeploymentResponse
-from ._modify_disk_spec_request import ModifyDiskSpecRequest
-from ._modify_disk_spec_response_body import ModifyDiskSpecResponseBody
-from ._modify_disk_spec_response import ModifyDiskSpecResponse
-from ._modify_eip_address_attribute_request import ModifyEipAddressAttributeRequest
-from ._modify_eip_address_attribute_response_body import ModifyEipAddressAttributeResponseBody
-from ._modify_eip_address_attribute_response import ModifyEipAddressAttributeResponse
-from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequest
-from ._modify_elasticity_assurance_response_body import ModifyElasticityAssuranceResponseBody
-from ._modify_elasticity_assurance_response import ModifyElasticityAssuranceResponse
-from ._modify_elasticity_assurance_auto_renew_attribute_request import ModifyElasticityAssuranceAutoRenewAttributeRequest
-from ._modify_elasticity_assurance_auto_renew_attribute_response_body import ModifyElasticityAssuranceAutoRenewAttributeResponseBody
-from ._modify_elasticity_assurance_auto_renew_attribute_response import ModifyElasticityAssuranceAutoRenewAttributeResponse
-from ._modify_forward_entry_request import ModifyForwardEntryRequest
-from ._modify_forward_entry_response_body import ModifyForwardEntryResponseBody
-from ._modify_forward_entry_response import ModifyForwardEntryResponse
-from ._modify_ha_vip_attribute_request import ModifyHaVipAttributeRequest
-from ._modify_ha_vip_attribute_response_body import ModifyHaVipAttributeResponseBody
-from ._modify_ha_vip_attribute_response import ModifyHaVipAttributeResponse
-from ._modify_hpc_cluster_attribute_request import ModifyHpcClusterAttributeRequest
-from ._modify_hpc_cluster_attribute_response_body import ModifyHpcClusterAttributeResponseBody
-from ._modify_hpc_cluster_attribute_response import ModifyHpcClusterAttributeResponse
-from ._modify_image_attribute_request import ModifyImageAttributeRequest
-from ._modify_image_attribute_response_body import ModifyImageAttributeResponseBody
-from ._modify_image_attribute_response import ModifyImageAttributeResponse
-from ._modify_image_share_group_permission_request import ModifyImageShareGroupPermissionRequest
-from ._modify_image_share_group_permission_response_body import ModifyImageShareGroupPermissionResponseBody
-from ._modify_image_share_group_permission_response import ModifyImageShareGroupPermissionResponse
-from ._modify_image_share_permission_request import ModifyImageSharePermissionRequest
-from ._modify_image_share_permission_response_body import ModifyImageSharePermissionResponseBody
-from ._modify_image_share_permission_response import ModifyImageSharePermissionResponse
-from ._modify_instance_attachment_attributes_request import ModifyInstanceAttachmentAttributesRequest
-from ._modify_instance_attachment_attributes_response_body import ModifyInstanceAttachmentAttributesResponseBody
-from ._modify_instance_attachment_attributes_response import ModifyInstanceAttachmentAttributesResponse
-from ._modify_instance_attribute_request import ModifyInstanceAttributeRequest
-from ._modify_instance_attribute_response_body import ModifyInstanceAttributeResponseBody
-from ._modify_instance_attribute_response import ModifyInstanceAttributeResponse
-from ._modify_instance_auto_release_time_request import ModifyInstanceAutoReleaseTimeRequest
-from ._modify_instance_auto_release_time_response_body import ModifyInstanceAutoReleaseTimeResponseBody
-from ._modify_instance_auto_release_time_response import ModifyInstanceAutoReleaseTimeResponse
-from ._modify_instance_auto_renew_attribute_request import ModifyInstanceAutoRenewAttributeRequest
-from ._modify_instance_auto_renew_attribute_response_body import ModifyInstanceAutoRenewAttributeResponseBody
-from ._modify_instance_auto_renew_attribute_response import ModifyInstanceAutoRenewAttributeResponse
-from ._modify_instance_charge_type_request import ModifyInstanceChargeTypeRequest
-from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBody
-from ._modify_instance_charge_type_response import ModifyInstanceChargeTypeResponse
-from ._modify_instance_clock_options_request import ModifyInstanceClockOptionsRequest
-from ._modify_instance_clock_options_response_body import ModifyInstanceClockOptionsResponseBody
-from ._modify_instance_clock_options_response import ModifyInstanceClockOptionsResponse
-from ._modify_instance_deployment_request import ModifyInstanceDeploymentRequest
-from ._modify_instance_deployment_response_body import ModifyInstanceDeploymentResponseBody
-from ._modify_instance_deployment_response import ModifyInstanceDeploymentResponse
-from ._modify_instance_maintenance_attributes_request import ModifyInstanceMaintenanceAttributesRequest
-from ._modify_instance_maintenance_attributes_response_body import ModifyInstanceMaintenanceAttributesResponseBody
-from ._modify_instance_maintenance_attributes_response import ModifyInstanceMaintenanceAttributesResponse
-from ._modify_instance_metadata_options_request import ModifyInstanceMetadataOptionsRequest
-from ._modify_instance_metadata_options_response_body import ModifyInstanceMetadataOptionsResponseBody
-from ._modify_instance_metadata_options_response import ModifyInstanceMetadataOptionsResponse
-from ._modify_instance_network_options_request import ModifyInstanceNetworkOptionsRequest
-from ._modify_instance_network_options_response_body import ModifyInstanceNetworkOptionsResponseBody
-from ._modify_instance_network_options_response import ModifyInstanceNetworkOptionsResponse
-from ._modify_instance_network_spec_request import ModifyInstanceNetworkSpecRequest
-from ._modify_instance_network_spec_response_body import ModifyInstanceNetworkSpecResponseBody
-from ._modify_instance_network_spec_response import ModifyInstanceNetworkSpecResponse
-from ._modify_instance_spec_request import ModifyInstanceSpecRequest
-from ._modify_instance_spec_response_body import ModifyInstanceSpecResponseBody
-from ._modify_instance_spec_response import ModifyInstanceSpecResponse
-from ._modify_instance_vnc_passwd_request import ModifyInstanceVncPasswdRequest
-from ._modify_instance_vnc_passwd_response_body import ModifyInstanceVncPasswdResponseBody
-from ._modify_instance_vnc_passwd_response import ModifyInstanceVncPasswdResponse
-from ._modify_instance_vpc_attribute_request import ModifyInstanceVpcAttributeRequest
-from ._modify_instance_vpc_attribute_response_body import ModifyInstanceVpcAttributeResponseBody
-from ._modify_instance_vpc_attribute_response import ModifyInstanceVpcAttributeResponse
-from ._modify_invocation_attribute_request import ModifyInvocationAttributeRequest
-from ._modify_invocation_attribute_shrink_request import ModifyInvocationAttributeShrinkRequest
-from ._modify_invocation_attribute_response_body import ModifyInvocationAttributeResponseBody
-from ._modify_invocation_attribute_response import ModifyInvocationAttributeResponse
-from ._modify_launch_template_default_version_request import ModifyLaunchTemplateDefaultVersionRequest
-from ._modify_launch_template_default_version_response_body import ModifyLaunchTemplateDefaultVersionResponseBody
-from ._modify_launch_template_default_version_response import ModifyLaunchTemplateDefaultVersionResponse
-from ._modify_managed_instance_request import ModifyManagedInstanceRequest
-from ._modify_managed_instance_response_body import ModifyManagedInstanceResponseBody
-from ._modify_managed_instance_response import ModifyManagedInstanceResponse
-from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequest
-from ._modify_network_interface_attribute_response_body import ModifyNetworkInterfaceAttributeResponseBody
-from ._modify_network_interface_attribute_response import ModifyNetworkInterfaceAttributeResponse
-from ._modify_physical_connection_attribute_request import ModifyPhysicalConnectionAttributeRequest
-from ._modify_physical_connection_attribute_response_body import ModifyPhysicalConnectionAttributeResponseBody
-from ._modify_physical_connection_attribute_response import ModifyPhysicalConnectionAttributeResponse
-from ._modify_port_range_list_request import ModifyPortRangeListRequest
-from ._modify_port_range_list_response_body import ModifyPortRangeListResponseBody
-from ._modify_port_range_list_response import ModifyPortRangeListResponse
-from ._modify_prefix_list_request import ModifyPrefixListRequest
-from ._modify_prefix_list_response_body import ModifyPrefixListResponseBody
-from ._modify_prefix_list_response import ModifyPrefixListResponse
-from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequest
-from ._modify_prepay_instance_spec_response_body import ModifyPrepayInstanceSpecResponseBody
-from ._modify_prepay_instance_spec_response import ModifyPrepayInstanceSpecResponse
-from ._modify_reserved_instance_attribute_request import ModifyReservedInstanceAttributeRequest
-from ._modify_reserved_instance_attribute_response_body import ModifyReservedInstanceAttributeResponseBody
-from ._modify_reserved_instance_attribute_response import ModifyReservedInstanceAttributeResponse
-from ._modify_reserved_instance_auto_renew_attribute_request import ModifyReservedInstanceAutoRenewAttributeRequest
-from ._modify_reserved_instance_auto_renew_attribute_response_body import ModifyReservedInstanceAutoRenewAttributeResponseBody
-from ._modify_reserved_instance_auto_renew_attribute_response import ModifyReservedInstanceAutoRenewAttributeResponse
-from ._modify_reserved_instances_request import ModifyReservedInstancesRequest
-from ._modify_reserved_instances_response_body import ModifyReservedInstancesResponseBody
-from ._modify_reserved_instances_response import ModifyReservedInstancesResponse
-from ._modify_router_interface_attribute_request import ModifyRouterInterfaceAttributeRequest
-from ._modify_router_interface_attribute_response_body import ModifyRouterInterfaceAttributeResponseBody
-from ._modify_router_interface_attribute_response import ModifyRouterInterfaceAttributeResponse
-from ._modify_router_interface_spec_request import ModifyRouterInterfaceSpecRequest
-from ._modify_router_interface_spec_response_body import ModifyRouterInterfaceSpecResponseBody
-from ._modify_router_interface_spec_response import ModifyRouterInterfaceSpecResponse
-from ._modify_security_group_attribute_request import ModifySecurityGroupAttributeRequest
-from ._modify_security_group_attribute_response_body import ModifySecurityGroupAttributeResponseBody
-from ._modify_security_group_attribute_response import ModifySecurityGroupAttributeResponse
-from ._modify_security_group_egress_rule_request import ModifySecurityGroupEgressRuleRequest
-from ._modify_security_group_egress_rule_response_body import ModifySecurityGroupEgressRuleResponseBody
-from ._modify_security_group_egress_rule_response import ModifySecurityGroupEgressRuleResponse
-from ._modify_security_group_policy_request import ModifySecurityGroupPolicyRequest
-from ._modify_security_group_policy_response_body import ModifySecurityGroupPolicyResponseBody
-from ._modify_security_group_policy_response import ModifySecurityGroupPolicyResponse
-from ._modify_security_group_rule_request import ModifySecurityGroupRuleRequest
-from ._modify_security_group_rule_response_body import ModifySecurityGroupRuleResponseBody
-from ._modify_security_group_rule_response import ModifySecurityGroupRuleResponse
-from ._modify_snapshot_attribute_request import ModifySnapshotAttributeRequest
-from ._modify_snapshot_attribute_response_body import ModifySnapshotAttributeResponseBody
-from ._modify_snapshot_attribute_response import ModifySnapshotAttributeResponse
-from ._modify_snapshot_category_request import ModifySnapshotCategoryRequest
-from ._modify_snapshot_category_response_body import ModifySnapshotCategoryResponseBody
-from ._modify_snapshot_category_response import ModifySnapshotCategoryResponse
-from ._modify_snapshot_group_request import ModifySnapshotGroupRequest
-from ._modify_snapshot_group_response_body import ModifySnapshotGroupResponseBody
-from ._modify_snapshot_group_response import ModifySnapshotGroupResponse
-from ._modify_storage_capacity_unit_attribute_request import ModifyStorageCapacityUnitAttributeRequest
-from ._modify_storage_capacity_unit_attribute_response_body import ModifyStorageCapacityUnitAttributeResponseBody
-from ._modify_storage_capacity_unit_attribute_response import ModifyStorageCapacityUnitAttributeResponse
-from ._modify_storage_set_attribute_request import ModifyStorageSetAttributeRequest
-from ._modify_storage_set_attribute_response_body import ModifyStorageSetAttributeResponseBody
-from ._modify_storage_set_attribute_response import ModifyStorageSetAttributeResponse
-from ._modify_user_business_behavior_request import ModifyUserBusinessBehaviorRequest
-from ._modify_user_business_behavior_response_body import ModifyUserBusinessBehaviorResponseBody
-from ._modify_user_business_behavior_response import ModifyUserBusinessBehaviorResponse
-from ._modify_vrouter_attribute_request import ModifyVRouterAttributeRequest
-from ._modify_vrouter_attribute_response_body import ModifyVRouterAttributeResponseBody
-from ._modify_vrouter_attribute_response import ModifyVRouterAttributeResponse
-from ._modify_vswitch_attribute_request import ModifyVSwitchAttributeRequest
-from ._modify_vswitch_attribute_response_body import ModifyVSwitchAttributeResponseBody
-from ._modify_vswitch_attribute_response import ModifyVSwitchAttributeResponse
-from ._modify_virtual_border_router_attribute_request import ModifyVirtualBorderRouterAttributeRequest
-from ._modify_virtual_border_router_attribute_response_body import ModifyVirtualBorderRouterAttributeResponseBody
-from ._modify_virtual_border_router_attribute_response import ModifyVirtualBorderRouterAttributeResponse
-from ._modify_vpc_attribute_request import ModifyVpcAttributeRequest
-from ._modify_vpc_attribute_response_body import ModifyVpcAttributeResponseBody
-from ._modify_vpc_attribute_response import ModifyVpcAttributeResponse
-from ._open_snapshot_service_request import OpenSnapshotServiceRequest
-from ._open_snapshot_service_response_body import OpenSnapshotServiceResponseBody
-from ._open_snapshot_service_response import OpenSnapshotServiceResponse
-from ._purchase_elasticity_assurance_request import PurchaseElasticityAssuranceRequest
-from ._purchase_elasticity_assurance_response_body import PurchaseElasticityAssuranceResponseBody
-from ._purchase_elasticity_assurance_response import PurchaseElasticityAssuranceResponse
-from ._purchase_reserved_instances_offering_request import PurchaseReservedInstancesOfferingRequest
-from ._purchase_reserved_instances_offering_response_body import PurchaseReservedInstancesOfferingResponseBody
-from ._purchase_reserved_instances_offering_response import PurchaseReservedInstancesOfferingResponse
-from ._purchase_storage_capacity_unit_request import PurchaseStorageCapacityUnitRequest
-from ._purchase_storage_capacity_unit_response_body import PurchaseStorageCapacityUnitResponseBody
-from ._purchase_storage_capacity_unit_response import PurchaseStorageCapacityUnitResponse
-from ._re_activate_instances_request import ReActivateInstancesRequest
-from ._re_activate_instances_response_body import ReActivateInstancesResponseBody
-from ._re_activate_instances_response import ReActivateInstancesResponse
-from ._re_init_disk_request import ReInitDiskRequest
-from ._re_init_disk_response_body import ReInitDiskResponseBody
-from ._re_init_disk_response import ReInitDiskResponse
-from ._reboot_instance_request import RebootInstanceRequest
-from ._reboot_instance_response_body import RebootInstanceResponseBody
-from ._reboot_instance_response import RebootInstanceResponse
-from ._reboot_instances_request import RebootInstancesRequest
-from ._reboot_instances_response_body import RebootInstancesResponseBody
-from ._reboot_instances_response import RebootInstancesResponse
-from ._recover_virtual_border_router_request import RecoverVirtualBorderRouterRequest
-from ._recover_virtual_border_router_response_body import RecoverVirtualBorderRouterResponseBody
-from ._recover_virtual_border_router_response import RecoverVirtualBorderRouterResponse
-from ._redeploy_dedicated_host_request import RedeployDedicatedHostRequest
-from ._redeploy_dedicated_host_response_body import RedeployDedicatedHostResponseBody
-from ._redeploy_dedicated_host_response import RedeployDedicatedHostResponse
-from ._redeploy_instance_request import RedeployInstanceRequest
-from ._redeploy_instance_response_body import RedeployInstanceResponseBody
-from ._redeploy_instance_response import RedeployInstanceResponse
-from ._release_capacity_reservation_request import ReleaseCapacityReservationRequest
-from ._release_capacity_reservation_response_body import ReleaseCapacityReservationResponseBody
-from ._release_capacity_reservation_response import ReleaseCapacityReservationResponse
-from ._release_dedicated_host_request import ReleaseDedicatedHostRequest
-from ._release_dedicated_host_response_body import ReleaseDedicatedHostResponseBody
-from ._release_dedicated_host_response import ReleaseDedicatedHostResponse
-from ._release_eip_address_request import ReleaseEipAddressRequest
-from ._release_eip_address_response_body import ReleaseEipAddressResponseBody
-from ._release_eip_address_response import ReleaseEipAddressResponse
-from ._release_public_ip_address_request import ReleasePublicIpAddressRequest
-from ._release_public_ip_address_response_body import ReleasePublicIpAddressResponseBody
-from ._release_public_ip_address_response import ReleasePublicIpAddressResponse
-from ._remove_bandwidth_package_ips_request import RemoveBandwidthPackageIpsRequest
-from ._remove_bandwidth_package_ips_response_body import RemoveBandwidthPackageIpsResponseBody
-from ._remove_bandwidth_package_ips_response import RemoveBandwidthPackageIpsResponse
-from ._remove_tags_request import RemoveTagsRequest
-from ._remove_tags_response_body import RemoveTagsResponseBody
-from ._remove_tags_response import RemoveTagsResponse
-from ._renew_dedicated_hosts_request import RenewDedicatedHostsRequest
-from ._renew_dedicated_hosts_response_body import RenewDedicatedHostsResponseBody
-from ._renew_dedicated_hosts_response import RenewDedicatedHostsResponse
-from ._renew_elasticity_assurances_request import RenewElasticityAssurancesRequest
-from ._renew_elasticity_assurances_response_body import RenewElasticityAssurancesResponseBody
-from ._renew_elasticity_assurances_response import RenewElasticityAssurancesResponse
-from ._renew_instance_request import RenewInstanceRequest
-from ._renew_instance_response_body import RenewInstanceResponseBody
-from ._renew_instance_response import RenewInstanceResponse
-from ._renew_reserved_instances_request import RenewReservedInstancesRequest
-from ._renew_reserved_instances_response_body import RenewReservedInstancesResponseBody
-from ._renew_reserved_instances_response import RenewReservedInstancesResponse
-from ._replace_system_disk_request import ReplaceSystemDiskRequest
-from ._replace_system_disk_response_body import ReplaceSystemDiskResponseBody
-from ._replace_system_disk_response import ReplaceSystemDiskResponse
-from ._report_instances_status_request import ReportInstancesStatusRequest
-from ._report_instances_status_response_body import ReportInstancesStatusResponseBody
-from ._report_instances_status_response import ReportInstancesStatusResponse
-from ._reset_disk_request import ResetDiskRequest
-from ._reset_disk_response_body import ResetDiskResponseBody
-from ._reset_disk_response import ResetDiskResponse
-from ._reset_disk_default_kmskey_id_request import ResetDiskDefaultKMSKeyIdRequest
-from ._reset_disk_default_kmskey_id_response_body import ResetDiskDefaultKMSKeyIdResponseBody
-from ._reset_disk_default_kmskey_id_response import ResetDiskDefaultKMSKeyIdResponse
-from ._reset_disks_request import ResetDisksRequest
-from ._reset_disks_response_body import ResetDisksResponseBody
-from ._reset_disks_response import ResetDisksResponse
-from ._resize_disk_request import ResizeDiskRequest
-from ._resize_disk_response_body import ResizeDiskResponseBody
-from ._resize_disk_response import ResizeDiskResponse
-from ._revoke_security_group_request import RevokeSecurityGroupRequest
-from ._revoke_security_group_response_body import RevokeSecurityGroupResponseBody
-from ._revoke_security_group_response import RevokeSecurityGroupResponse
-from ._revoke_security_group_egress_request import RevokeSecurityGroupEgressRequest
-from ._revoke_security_group_egress_response_body import RevokeSecurityGroupEgressResponseBody
-from ._revoke_security_group_egress_response import RevokeSecurityGroupEgressResponse
-from ._run_command_request import RunCommandRequest
-from ._run_command_shrink_request import RunCommandShrinkRequest
-from ._run_command_response_body import RunCommandResponseBody
-from ._run_command_response import RunCommandResponse
-from ._run_instances_request import RunInstancesRequest
-from ._run_instances_response_body import RunInstancesResponseBody
-from ._run_instances_response import RunInstancesResponse
-from ._send_file_request import SendFileRequest
-from ._send_file_response_body import SendFileResponseBody
-from ._send_file_response import SendFileResponse
-from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequest
-from ._start_image_pipeline_execution_response_body import StartImagePipelineExecutionResponseBody
-from ._start_image_pipeline_execution_response import StartImagePipelineExecutionResponse
-from ._start_instance_request import StartInstanceRequest
-from ._start_instance_response_body import StartInstanceResponseBody
-from ._start_instance_response import StartInstanceResponse
-from ._start_instances_request import StartInstancesRequest
-from ._start_instances_response_body import StartInstancesResponseBody
-from ._start_instances_response import StartInstancesResponse
-from ._start_terminal_session_request import StartTerminalSessionRequest
-from ._start_terminal_session_shrink_request import StartTerminalSessionShrinkRequest
-from ._start_terminal_session_response_body import StartTerminalSessionResponseBody
-from ._start_terminal_session_response import StartTerminalSessionResponse
-from ._stop_instance_request import StopInstanceRequest
-from ._stop_instance_response_body import StopInstanceResponseBody
-from ._stop_instance_response import StopInstanceResponse
-from ._stop_instances_request import StopInstancesRequest
-from ._stop_instances_response_body import StopInstancesResponseBody
-from ._stop_instances_response import StopInstancesResponse
-from ._stop_invocation_request import StopInvocationRequest
-from ._stop_invocation_response_body import StopInvocationResponseBody
-from ._stop_invocation_response import StopInvocationResponse
-from ._tag_resources_request import TagResourcesRequest
-from ._tag_resources_response_body import TagResourcesResponseBody
-from ._tag_resources_response import TagResourcesResponse
-from ._terminate_physical_connection_request import TerminatePhysicalConnectionRequest
-from ._terminate_physical_connection_response_body import TerminatePhysicalConnectionResponseBody
-from ._terminate_physical_connection_response import TerminatePhysicalConnectionResponse
-from ._terminate_virtual_border_router_request import TerminateVirtualBorderRouterRequest
-from ._terminate_virtual_border_router_response_body import TerminateVirtualBorderRouterResponseBody
-from ._terminate_virtual_border_router_response import TerminateVirtualBorderRouterResponse
-from ._unassign_ipv_6addresses_request import UnassignIpv6AddressesRequest
-from ._unassign_ipv_6addresses_response_body import UnassignIpv6AddressesResponseBody
-from ._unassign_ipv_6addresses_response import UnassignIpv6AddressesResponse
-from ._unassign_private_ip_addresses_request import UnassignPrivateIpAddressesRequest
-from ._unassign_private_ip_addresses_response_body import UnassignPrivateIpAddressesResponseBody
-from ._unassign_private_ip_addresses_response import UnassignPrivateIpAddressesResponse
-from ._unassociate_eip_address_request import UnassociateEipAddressRequest
-from ._unassociate_eip_address_response_body import UnassociateEipAddressResponseBody
-from ._unassociate_eip_address_response import UnassociateEipAddressResponse
-from ._unassociate_ha_vip_request import UnassociateHaVipRequest
-from ._unassociate_ha_vip_response_body import UnassociateHaVipResponseBody
-from ._unassociate_ha_vip_response import UnassociateHaVipResponse
-from ._unlock_snapshot_request import UnlockSnapshotRequest
-from ._unlock_snapshot_response_body import UnlockSnapshotResponseBody
-from ._unlock_snapshot_response import UnlockSnapshotResponse
-from ._untag_resources_request import UntagResourcesRequest
-from ._untag_resources_response_body import UntagResourcesResponseBody
-from ._untag_resources_response import UntagResourcesResponse
-from ._add_tags_request import AddTagsRequestTag
-from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequestNetworkAttributes
-from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequestTag
-from ._allocate_dedicated_hosts_response_body import AllocateDedicatedHostsResponseBodyDedicatedHostIdSets
-from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBodyIpv6PrefixSets
-from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBodyIpv6Sets
-from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet
-from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet
-from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet
-from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult
-from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults
-from ._attach_key_pair_response_body import AttachKeyPairResponseBodyResultsResult
-from ._attach_key_pair_response_body import AttachKeyPairResponseBodyResults
-from ._authorize_security_group_request import AuthorizeSecurityGroupRequestPermissions
-from ._authorize_security_group_egress_request import AuthorizeSecurityGroupEgressRequestPermissions
-from ._cancel_image_pipeline_execution_request import CancelImagePipelineExecutionRequestTemplateTag
-from ._copy_image_request import CopyImageRequestTag
-from ._copy_snapshot_request import CopySnapshotRequestArn
-from ._copy_snapshot_request import CopySnapshotRequestTag
-from ._create_activation_request import CreateActivationRequestTag
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationArn
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationTag
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfiguration
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestDataDiskConfig
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchTemplateConfig
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestPrePaidOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestResourcePoolOptions
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestSystemDiskConfig
-from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestTag
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestDataDiskConfig
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestPrePaidOptions
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig
-from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestTag
-from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds
-from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult
-from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResults
-from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn
-from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration
-from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestTag
-from ._create_capacity_reservation_request import CreateCapacityReservationRequestPrivatePoolOptions
-from ._create_capacity_reservation_request import CreateCapacityReservationRequestTag
-from ._create_command_request import CreateCommandRequestTag
-from ._create_dedicated_host_cluster_request import CreateDedicatedHostClusterRequestTag
-from ._create_disk_request import CreateDiskRequestArn
-from ._create_disk_request import CreateDiskRequestTag
-from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestPrivatePoolOptions
-from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestRecurrenceRules
-from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestTag
-from ._create_image_request import CreateImageRequestDiskDeviceMapping
-from ._create_image_request import CreateImageRequestFeatures
-from ._create_image_request import CreateImageRequestTag
-from ._create_image_component_request import CreateImageComponentRequestTag
-from ._create_image_pipeline_request import CreateImagePipelineRequestAdvancedOptions
-from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptionsImageFeatures
-from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptionsImageTags
-from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptions
-from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings
-from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsFeatures
-from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsImportImageTags
-from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptions
-from ._create_image_pipeline_request import CreateImagePipelineRequestTag
-from ._create_instance_request import CreateInstanceRequestHibernationOptions
-from ._create_instance_request import CreateInstanceRequestPrivatePoolOptions
-from ._create_instance_request import CreateInstanceRequestSystemDisk
-from ._create_instance_request import CreateInstanceRequestArn
-from ._create_instance_request import CreateInstanceRequestDataDisk
-from ._create_instance_request import CreateInstanceRequestTag
-from ._create_key_pair_request import CreateKeyPairRequestTag
-from ._create_launch_template_request import CreateLaunchTemplateRequestSystemDisk
-from ._create_launch_template_request import CreateLaunchTemplateRequestDataDisk
-from ._create_launch_template_request import CreateLaunchTemplateRequestImageOptions
-from ._create_launch_template_request import CreateLaunchTemplateRequestNetworkInterface
-from ._create_launch_template_request import CreateLaunchTemplateRequestSecurityOptions
-from ._create_launch_template_request import CreateLaunchTemplateRequestTag
-from ._create_launch_template_request import CreateLaunchTemplateRequestTemplateTag
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestSystemDisk
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestDataDisk
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestImageOptions
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestNetworkInterface
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestSecurityOptions
-from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestTag
-from ._create_nat_gateway_request import CreateNatGatewayRequestBandwidthPackage
-from ._create_nat_gateway_response_body import CreateNatGatewayResponseBodyBandwidthPackageIds
-from ._create_nat_gateway_response_body import CreateNatGatewayResponseBodyForwardTableIds
-from ._create_network_interface_request import CreateNetworkInterfaceRequestConnectionTrackingConfiguration
-from ._create_network_interface_request import CreateNetworkInterfaceRequestEnhancedNetwork
-from ._create_network_interface_request import CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig
-from ._create_network_interface_request import CreateNetworkInterfaceRequestTag
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv4PrefixSets
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6PrefixSets
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6Sets
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyPrivateIpSets
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodySecurityGroupIds
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyTagsTag
-from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyTags
-from ._create_network_interface_permission_response_body import CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission
-from ._create_port_range_list_request import CreatePortRangeListRequestEntry
-from ._create_port_range_list_request import CreatePortRangeListRequestTag
-from ._create_prefix_list_request import CreatePrefixListRequestEntry
-from ._create_prefix_list_request import CreatePrefixListRequestTag
-from ._create_route_entry_request import CreateRouteEntryRequestNextHopList
-from ._create_security_group_request import CreateSecurityGroupRequestTag
-from ._create_simulated_system_events_response_body import CreateSimulatedSystemEventsResponseBodyEventIdSet
-from ._create_snapshot_request import CreateSnapshotRequestTag
-from ._create_snapshot_group_request import CreateSnapshotGroupRequestTag
-from ._create_storage_set_request import CreateStorageSetRequestTag
-from ._delete_activation_response_body import DeleteActivationResponseBodyActivation
-from ._delete_launch_template_response_body import DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers
-from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion
-from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions
-from ._delete_route_entry_request import DeleteRouteEntryRequestNextHopList
-from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
-from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet
-from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress
-from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSet
-from ._deregister_managed_instance_response_body import DeregisterManagedInstanceResponseBodyInstance
-from ._describe_access_points_request import DescribeAccessPointsRequestFilter
-from ._describe_access_points_response_body import DescribeAccessPointsResponseBodyAccessPointSetAccessPointType
-from ._describe_access_points_response_body import DescribeAccessPointsResponseBodyAccessPointSet
-from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem
-from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues
-from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem
-from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItems
-from ._describe_activations_request import DescribeActivationsRequestTag
-from ._describe_activations_response_body import DescribeActivationsResponseBodyActivationListTags
-from ._describe_activations_response_body import DescribeActivationsResponseBodyActivationList
-from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail
-from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails
-from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory
-from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories
-from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance
-from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBodyInstances
-from ._describe_auto_provisioning_groups_request import DescribeAutoProvisioningGroupsRequestTag
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup
-from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups
-from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation
-from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations
-from ._describe_auto_snapshot_policy_ex_request import DescribeAutoSnapshotPolicyExRequestTag
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy
-from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone
-from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZones
-from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth
-from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBodyBandwidths
-from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse
-from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses
-from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage
-from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackages
-from ._describe_capacity_reservation_instances_request import DescribeCapacityReservationInstancesRequestPrivatePoolOptions
-from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet
-from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem
-from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequestPrivatePoolOptions
-from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequestTag
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem
-from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSet
-from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBodyLinksLink
-from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBodyLinks
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySessionManagerConfig
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig
-from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs
-from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus
-from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet
-from ._describe_clusters_response_body import DescribeClustersResponseBodyClustersCluster
-from ._describe_clusters_response_body import DescribeClustersResponseBodyClusters
-from ._describe_commands_request import DescribeCommandsRequestTag
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitions
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterNames
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandTagsTag
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandTags
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommand
-from ._describe_commands_response_body import DescribeCommandsResponseBodyCommands
-from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute
-from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes
-from ._describe_dedicated_host_clusters_request import DescribeDedicatedHostClustersRequestTag
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster
-from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters
-from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies
-from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList
-from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType
-from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes
-from ._describe_dedicated_hosts_request import DescribeDedicatedHostsRequestTag
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost
-from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHosts
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet
-from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSets
-from ._describe_diagnostic_metric_sets_response_body import DescribeDiagnosticMetricSetsResponseBodyMetricSets
-from ._describe_diagnostic_metrics_response_body import DescribeDiagnosticMetricsResponseBodyMetrics
-from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue
-from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues
-from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult
-from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResults
-from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue
-from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReportIssues
-from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReport
-from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReports
-from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData
-from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBodyMonitorData
-from ._describe_disks_request import DescribeDisksRequestFilter
-from ._describe_disks_request import DescribeDisksRequestTag
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskAttachmentsAttachment
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskAttachments
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskMountInstances
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskOperationLocks
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskPlacement
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskTagsTag
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskTags
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDisk
-from ._describe_disks_response_body import DescribeDisksResponseBodyDisks
-from ._describe_disks_full_status_request import DescribeDisksFullStatusRequestEventTime
-from ._describe_disks_full_status_request import DescribeDisksFullStatusRequestTag
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType
-from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSet
-from ._describe_eip_addresses_request import DescribeEipAddressesRequestFilter
-from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason
-from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks
-from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddress
-from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddresses
-from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData
-from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBodyEipMonitorDatas
-from ._describe_elasticity_assurance_auto_renew_attribute_request import DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions
-from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute
-from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes
-from ._describe_elasticity_assurance_instances_request import DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions
-from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet
-from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem
-from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequestPrivatePoolOptions
-from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequestTag
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem
-from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet
-from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData
-from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBodyMonitorData
-from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry
-from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBodyForwardTableEntries
-from ._describe_ha_vips_request import DescribeHaVipsRequestFilter
-from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses
-from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances
-from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVip
-from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVips
-from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBodyHpcClustersHpcCluster
-from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBodyHpcClusters
-from ._describe_image_components_request import DescribeImageComponentsRequestTag
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSet
-from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponent
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageTagsTag
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageTags
-from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImage
-from ._describe_image_pipeline_executions_request import DescribeImagePipelineExecutionsRequestTag
-from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag
-from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags
-from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet
-from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution
-from ._describe_image_pipelines_request import DescribeImagePipelinesRequestTag
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet
-from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipeline
-from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyAccountsAccount
-from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyAccounts
-from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyShareGroupsShareGroup
-from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyShareGroups
-from ._describe_image_support_instance_types_request import DescribeImageSupportInstanceTypesRequestFilter
-from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType
-from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBodyInstanceTypes
-from ._describe_images_request import DescribeImagesRequestFilter
-from ._describe_images_request import DescribeImagesRequestTag
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptionsItems
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptions
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDiskDeviceMappings
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageFeatures
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageTagsTag
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageTags
-from ._describe_images_response_body import DescribeImagesResponseBodyImagesImage
-from ._describe_images_response_body import DescribeImagesResponseBodyImages
-from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance
-from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBodyInstances
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyDedicatedHostAttribute
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyEipAddress
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyInnerIpAddress
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyNetworkOptions
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyOperationLocksLockReason
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyOperationLocks
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyPublicIpAddress
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodySecurityGroupIds
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress
-from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyVpcAttributes
-from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute
-from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes
-from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestEventPublishTime
-from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestNotBefore
-from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestTag
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType
-from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute
-from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes
-from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequestSystemDisk
-from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequestDataDisk
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPrice
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoRules
-from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfo
-from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData
-from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBodyMonitorData
-from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet
-from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets
-from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus
-from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBodyInstanceStatuses
-from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBodyTopologysTopology
-from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBodyTopologys
-from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily
-from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceType
-from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypes
-from ._describe_instances_request import DescribeInstancesRequestFilter
-from ._describe_instances_request import DescribeInstancesRequestTag
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceClockOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceCpuOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceEipAddress
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceHibernationOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceImageOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceMetadataOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceOperationLocks
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstancePublicIpAddress
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceTagsTag
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceTags
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceVpcAttributes
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstance
-from ._describe_instances_response_body import DescribeInstancesResponseBodyInstances
-from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequestEventPublishTime
-from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequestNotBefore
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType
-from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet
-from ._describe_invocation_results_request import DescribeInvocationResultsRequestTag
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResults
-from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocation
-from ._describe_invocations_request import DescribeInvocationsRequestTag
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationTagsTag
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationTags
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocation
-from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocations
-from ._describe_key_pairs_request import DescribeKeyPairsRequestTag
-from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag
-from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPairTags
-from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPair
-from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairs
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet
-from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets
-from ._describe_launch_templates_request import DescribeLaunchTemplatesRequestTemplateTag
-from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag
-from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags
-from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet
-from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSets
-from ._describe_locked_snapshots_response_body import DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo
-from ._describe_managed_instances_request import DescribeManagedInstancesRequestTag
-from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBodyInstancesTags
-from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBodyInstances
-from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds
-from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds
-from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGateway
-from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGateways
-from ._describe_network_interface_attribute_request import DescribeNetworkInterfaceAttributeRequestTag
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAttachment
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyQoSConfig
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyTagsTag
-from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyTags
-from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission
-from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions
-from ._describe_network_interfaces_request import DescribeNetworkInterfacesRequestTag
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet
-from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets
-from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData
-from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas
-from ._describe_physical_connections_request import DescribePhysicalConnectionsRequestFilter
-from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType
-from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet
-from ._describe_port_range_list_associations_response_body import DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations
-from ._describe_port_range_list_entries_response_body import DescribePortRangeListEntriesResponseBodyEntries
-from ._describe_port_range_lists_request import DescribePortRangeListsRequestTag
-from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBodyPortRangeListsTags
-from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBodyPortRangeLists
-from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation
-from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBodyPrefixListAssociations
-from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBodyEntriesEntry
-from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBodyEntries
-from ._describe_prefix_lists_request import DescribePrefixListsRequestTag
-from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag
-from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixListTags
-from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixList
-from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixLists
-from ._describe_price_request import DescribePriceRequestDataDisk
-from ._describe_price_request import DescribePriceRequestSchedulerOptions
-from ._describe_price_request import DescribePriceRequestSystemDisk
-from ._describe_price_request import DescribePriceRequestRecurrenceRules
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfos
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPrice
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRelatedPrice
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRulesRule
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRules
-from ._describe_price_response_body import DescribePriceResponseBodyPriceInfo
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType
-from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyData
-from ._describe_regions_response_body import DescribeRegionsResponseBodyRegionsRegion
-from ._describe_regions_response_body import DescribeRegionsResponseBodyRegions
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPrice
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoRulesRule
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoRules
-from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfo
-from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute
-from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes
-from ._describe_reserved_instances_request import DescribeReservedInstancesRequestTag
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance
-from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstances
-from ._describe_resource_by_tags_request import DescribeResourceByTagsRequestTag
-from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBodyResourcesResource
-from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBodyResources
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone
-from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZones
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTable
-from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTables
-from ._describe_router_interfaces_request import DescribeRouterInterfacesRequestFilter
-from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType
-from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBodyRouterInterfaceSet
-from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfoPrice
-from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfoRules
-from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfo
-from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodyPermissionsPermission
-from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodyPermissions
-from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds
-from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup
-from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups
-from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference
-from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences
-from ._describe_security_groups_request import DescribeSecurityGroupsRequestTag
-from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag
-from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags
-from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup
-from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroups
-from ._describe_send_file_results_request import DescribeSendFileResultsRequestTag
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationTags
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocation
-from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocations
-from ._describe_snapshot_groups_request import DescribeSnapshotGroupsRequestTag
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup
-from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroups
-from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink
-from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBodySnapshotLinks
-from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint
-from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBodyMonitorData
-from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage
-from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBodySnapshotPackages
-from ._describe_snapshots_request import DescribeSnapshotsRequestFilter
-from ._describe_snapshots_request import DescribeSnapshotsRequestTag
-from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag
-from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshotTags
-from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshot
-from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshots
-from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource
-from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources
-from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone
-from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZones
-from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType
-from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBodySpotPrices
-from ._describe_storage_capacity_units_request import DescribeStorageCapacityUnitsRequestTag
-from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag
-from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags
-from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit
-from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits
-from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBodyDisksDisk
-from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBodyDisks
-from ._describe_storage_sets_request import DescribeStorageSetsRequestTag
-from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag
-from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSetTags
-from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSet
-from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSets
-from ._describe_tags_request import DescribeTagsRequestTag
-from ._describe_tags_response_body import DescribeTagsResponseBodyTagsTagResourceTypeCount
-from ._describe_tags_response_body import DescribeTagsResponseBodyTagsTag
-from ._describe_tags_response_body import DescribeTagsResponseBodyTags
-from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
-from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet
-from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress
-from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSet
-from ._describe_tasks_response_body import DescribeTasksResponseBodyTaskSetTask
-from ._describe_tasks_response_body import DescribeTasksResponseBodyTaskSet
-from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection
-from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSessionConnections
-from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSession
-from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessions
-from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds
-from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRoutersVRouter
-from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRouters
-from ._describe_vswitches_response_body import DescribeVSwitchesResponseBodyVSwitchesVSwitch
-from ._describe_vswitches_response_body import DescribeVSwitchesResponseBodyVSwitches
-from ._describe_virtual_border_routers_request import DescribeVirtualBorderRoutersRequestFilter
-from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType
-from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet
-from ._describe_virtual_border_routers_for_physical_connection_request import DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter
-from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType
-from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet
-from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpcUserCidrs
-from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpcVSwitchIds
-from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpc
-from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcs
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableDiskCategories
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourceCreation
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResources
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations
-from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZone
-from ._describe_zones_response_body import DescribeZonesResponseBodyZones
-from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet
-from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets
-from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult
-from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults
-from ._detach_key_pair_response_body import DetachKeyPairResponseBodyResultsResult
-from ._detach_key_pair_response_body import DetachKeyPairResponseBodyResults
-from ._disable_activation_response_body import DisableActivationResponseBodyActivation
-from ._enable_network_interface_qo_srequest import EnableNetworkInterfaceQoSRequestQoS
-from ._import_image_request import ImportImageRequestDiskDeviceMapping
-from ._import_image_request import ImportImageRequestFeatures
-from ._import_image_request import ImportImageRequestTag
-from ._import_key_pair_request import ImportKeyPairRequestTag
-from ._invoke_command_request import InvokeCommandRequestResourceTag
-from ._invoke_command_request import InvokeCommandRequestTag
-from ._invoke_command_shrink_request import InvokeCommandShrinkRequestResourceTag
-from ._invoke_command_shrink_request import InvokeCommandShrinkRequestTag
-from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus
-from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet
-from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus
-from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSet
-from ._list_tag_resources_request import ListTagResourcesRequestTag
-from ._list_tag_resources_request import ListTagResourcesRequestTagFilter
-from ._list_tag_resources_response_body import ListTagResourcesResponseBodyTagResourcesTagResource
-from ._list_tag_resources_response_body import ListTagResourcesResponseBodyTagResources
-from ._lock_snapshot_response_body import LockSnapshotResponseBodyLockedSnapshotInfo
-from ._modify_auto_provisioning_group_request import ModifyAutoProvisioningGroupRequestLaunchTemplateConfig
-from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn
-from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration
-from ._modify_capacity_reservation_request import ModifyCapacityReservationRequestPrivatePoolOptions
-from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestAgentUpgradeConfig
-from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestOssDeliveryConfig
-from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestSessionManagerConfig
-from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestSlsDeliveryConfig
-from ._modify_dedicated_host_attribute_request import ModifyDedicatedHostAttributeRequestNetworkAttributes
-from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance
-from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances
-from ._modify_disk_spec_request import ModifyDiskSpecRequestPerformanceControlOptions
-from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequestPrivatePoolOptions
-from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequestRecurrenceRules
-from ._modify_elasticity_assurance_auto_renew_attribute_request import ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions
-from ._modify_image_attribute_request import ModifyImageAttributeRequestFeatures
-from ._modify_instance_attachment_attributes_request import ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions
-from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestCpuOptions
-from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestPrivateDnsNameOptions
-from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestRemoteConnectionOptions
-from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance
-from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBodyFeeOfInstances
-from ._modify_instance_maintenance_attributes_request import ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow
-from ._modify_instance_spec_request import ModifyInstanceSpecRequestSystemDisk
-from ._modify_instance_spec_request import ModifyInstanceSpecRequestTemporary
-from ._modify_instance_spec_request import ModifyInstanceSpecRequestDisk
-from ._modify_managed_instance_response_body import ModifyManagedInstanceResponseBodyInstance
-from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration
-from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestEnhancedNetwork
-from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig
-from ._modify_port_range_list_request import ModifyPortRangeListRequestAddEntry
-from ._modify_port_range_list_request import ModifyPortRangeListRequestRemoveEntry
-from ._modify_prefix_list_request import ModifyPrefixListRequestAddEntry
-from ._modify_prefix_list_request import ModifyPrefixListRequestRemoveEntry
-from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequestSystemDisk
-from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequestDisk
-from ._modify_reserved_instances_request import ModifyReservedInstancesRequestConfiguration
-from ._modify_reserved_instances_response_body import ModifyReservedInstancesResponseBodyReservedInstanceIdSets
-from ._purchase_elasticity_assurance_request import PurchaseElasticityAssuranceRequestPrivatePoolOptions
-from ._purchase_reserved_instances_offering_request import PurchaseReservedInstancesOfferingRequestTag
-from ._purchase_reserved_instances_offering_response_body import PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets
-from ._purchase_storage_capacity_unit_request import PurchaseStorageCapacityUnitRequestTag
-from ._purchase_storage_capacity_unit_response_body import PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds
-from ._reboot_instances_response_body import RebootInstancesResponseBodyInstanceResponsesInstanceResponse
-from ._reboot_instances_response_body import RebootInstancesResponseBodyInstanceResponses
-from ._release_capacity_reservation_request import ReleaseCapacityReservationRequestPrivatePoolOptions
-from ._remove_tags_request import RemoveTagsRequestTag
-from ._renew_elasticity_assurances_request import RenewElasticityAssurancesRequestPrivatePoolOptions
-from ._renew_elasticity_assurances_response_body import RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet
-from ._renew_reserved_instances_response_body import RenewReservedInstancesResponseBodyReservedInstanceIdSets
-from ._replace_system_disk_request import ReplaceSystemDiskRequestSystemDisk
-from ._replace_system_disk_request import ReplaceSystemDiskRequestArn
-from ._reset_disks_request import ResetDisksRequestDisk
-from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
-from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet
-from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgress
-from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSet
-from ._revoke_security_group_request import RevokeSecurityGroupRequestPermissions
-from ._revoke_security_group_egress_request import RevokeSecurityGroupEgressRequestPermissions
-from ._run_command_request import RunCommandRequestResourceTag
-from ._run_command_request import RunCommandRequestTag
-from ._run_command_shrink_request import RunCommandShrinkRequestResourceTag
-from ._run_command_shrink_request import RunCommandShrinkRequestTag
-from ._run_instances_request import RunInstancesRequestCpuOptions
-from ._run_instances_request import RunInstancesRequestHibernationOptions
-from ._run_instances_request import RunInstancesRequestPrivatePoolOptions
-from ._run_instances_request import RunInstancesRequestSchedulerOptions
-from ._run_instances_request import RunInstancesRequestSecurityOptions
-from ._run_instances_request import RunInstancesRequestSystemDisk
-from ._run_instances_request import RunInstancesRequestArn
-from ._run_instances_request import RunInstancesRequestClockOptions
-from ._run_instances_request import RunInstancesRequestDataDisk
-from ._run_instances_request import RunInstancesRequestImageOptions
-from ._run_instances_request import RunInstancesRequestNetworkInterface
-from ._run_instances_request import RunInstancesRequestNetworkOptions
-from ._run_instances_request import RunInstancesRequestPrivateDnsNameOptions
-from ._run_instances_request import RunInstancesRequestTag
-from ._run_instances_response_body import RunInstancesResponseBodyInstanceIdSets
-from ._send_file_request import SendFileRequestTag
-from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequestTag
-from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequestTemplateTag
-from ._start_instances_response_body import StartInstancesResponseBodyInstanceResponsesInstanceResponse
-from ._start_instances_response_body import StartInstancesResponseBodyInstanceResponses
-from ._start_terminal_session_request import StartTerminalSessionRequestEncryptionOptions
-from ._stop_instances_response_body import StopInstancesResponseBodyInstanceResponsesInstanceResponse
-from ._stop_instances_response_body import StopInstancesResponseBodyInstanceResponses
-from ._tag_resources_request import TagResourcesRequestTag
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._accept_inquired_system_event_request import AcceptInquiredSystemEventRequest
+    from ._accept_inquired_system_event_response_body import AcceptInquiredSystemEventResponseBody
+    from ._accept_inquired_system_event_response import AcceptInquiredSystemEventResponse
+    from ._activate_router_interface_request import ActivateRouterInterfaceRequest
+    from ._activate_router_interface_response_body import ActivateRouterInterfaceResponseBody
+    from ._activate_router_interface_response import ActivateRouterInterfaceResponse
+    from ._add_bandwidth_package_ips_request import AddBandwidthPackageIpsRequest
+    from ._add_bandwidth_package_ips_response_body import AddBandwidthPackageIpsResponseBody
+    from ._add_bandwidth_package_ips_response import AddBandwidthPackageIpsResponse
+    from ._add_tags_request import AddTagsRequest
+    from ._add_tags_response_body import AddTagsResponseBody
+    from ._add_tags_response import AddTagsResponse
+    from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequest
+    from ._allocate_dedicated_hosts_response_body import AllocateDedicatedHostsResponseBody
+    from ._allocate_dedicated_hosts_response import AllocateDedicatedHostsResponse
+    from ._allocate_eip_address_request import AllocateEipAddressRequest
+    from ._allocate_eip_address_response_body import AllocateEipAddressResponseBody
+    from ._allocate_eip_address_response import AllocateEipAddressResponse
+    from ._allocate_public_ip_address_request import AllocatePublicIpAddressRequest
+    from ._allocate_public_ip_address_response_body import AllocatePublicIpAddressResponseBody
+    from ._allocate_public_ip_address_response import AllocatePublicIpAddressResponse
+    from ._apply_auto_snapshot_policy_request import ApplyAutoSnapshotPolicyRequest
+    from ._apply_auto_snapshot_policy_response_body import ApplyAutoSnapshotPolicyResponseBody
+    from ._apply_auto_snapshot_policy_response import ApplyAutoSnapshotPolicyResponse
+    from ._assign_ipv_6addresses_request import AssignIpv6AddressesRequest
+    from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBody
+    from ._assign_ipv_6addresses_response import AssignIpv6AddressesResponse
+    from ._assign_private_ip_addresses_request import AssignPrivateIpAddressesRequest
+    from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBody
+    from ._assign_private_ip_addresses_response import AssignPrivateIpAddressesResponse
+    from ._associate_eip_address_request import AssociateEipAddressRequest
+    from ._associate_eip_address_response_body import AssociateEipAddressResponseBody
+    from ._associate_eip_address_response import AssociateEipAddressResponse
+    from ._associate_ha_vip_request import AssociateHaVipRequest
+    from ._associate_ha_vip_response_body import AssociateHaVipResponseBody
+    from ._associate_ha_vip_response import AssociateHaVipResponse
+    from ._attach_classic_link_vpc_request import AttachClassicLinkVpcRequest
+    from ._attach_classic_link_vpc_response_body import AttachClassicLinkVpcResponseBody
+    from ._attach_classic_link_vpc_response import AttachClassicLinkVpcResponse
+    from ._attach_disk_request import AttachDiskRequest
+    from ._attach_disk_response_body import AttachDiskResponseBody
+    from ._attach_disk_response import AttachDiskResponse
+    from ._attach_instance_ram_role_request import AttachInstanceRamRoleRequest
+    from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBody
+    from ._attach_instance_ram_role_response import AttachInstanceRamRoleResponse
+    from ._attach_key_pair_request import AttachKeyPairRequest
+    from ._attach_key_pair_response_body import AttachKeyPairResponseBody
+    from ._attach_key_pair_response import AttachKeyPairResponse
+    from ._attach_network_interface_request import AttachNetworkInterfaceRequest
+    from ._attach_network_interface_response_body import AttachNetworkInterfaceResponseBody
+    from ._attach_network_interface_response import AttachNetworkInterfaceResponse
+    from ._authorize_security_group_request import AuthorizeSecurityGroupRequest
+    from ._authorize_security_group_response_body import AuthorizeSecurityGroupResponseBody
+    from ._authorize_security_group_response import AuthorizeSecurityGroupResponse
+    from ._authorize_security_group_egress_request import AuthorizeSecurityGroupEgressRequest
+    from ._authorize_security_group_egress_response_body import AuthorizeSecurityGroupEgressResponseBody
+    from ._authorize_security_group_egress_response import AuthorizeSecurityGroupEgressResponse
+    from ._cancel_auto_snapshot_policy_request import CancelAutoSnapshotPolicyRequest
+    from ._cancel_auto_snapshot_policy_response_body import CancelAutoSnapshotPolicyResponseBody
+    from ._cancel_auto_snapshot_policy_response import CancelAutoSnapshotPolicyResponse
+    from ._cancel_copy_image_request import CancelCopyImageRequest
+    from ._cancel_copy_image_response_body import CancelCopyImageResponseBody
+    from ._cancel_copy_image_response import CancelCopyImageResponse
+    from ._cancel_image_pipeline_execution_request import CancelImagePipelineExecutionRequest
+    from ._cancel_image_pipeline_execution_response_body import CancelImagePipelineExecutionResponseBody
+    from ._cancel_image_pipeline_execution_response import CancelImagePipelineExecutionResponse
+    from ._cancel_physical_connection_request import CancelPhysicalConnectionRequest
+    from ._cancel_physical_connection_response_body import CancelPhysicalConnectionResponseBody
+    from ._cancel_physical_connection_response import CancelPhysicalConnectionResponse
+    from ._cancel_simulated_system_events_request import CancelSimulatedSystemEventsRequest
+    from ._cancel_simulated_system_events_response_body import CancelSimulatedSystemEventsResponseBody
+    from ._cancel_simulated_system_events_response import CancelSimulatedSystemEventsResponse
+    from ._cancel_task_request import CancelTaskRequest
+    from ._cancel_task_response_body import CancelTaskResponseBody
+    from ._cancel_task_response import CancelTaskResponse
+    from ._connect_router_interface_request import ConnectRouterInterfaceRequest
+    from ._connect_router_interface_response_body import ConnectRouterInterfaceResponseBody
+    from ._connect_router_interface_response import ConnectRouterInterfaceResponse
+    from ._convert_nat_public_ip_to_eip_request import ConvertNatPublicIpToEipRequest
+    from ._convert_nat_public_ip_to_eip_response_body import ConvertNatPublicIpToEipResponseBody
+    from ._convert_nat_public_ip_to_eip_response import ConvertNatPublicIpToEipResponse
+    from ._copy_image_request import CopyImageRequest
+    from ._copy_image_response_body import CopyImageResponseBody
+    from ._copy_image_response import CopyImageResponse
+    from ._copy_snapshot_request import CopySnapshotRequest
+    from ._copy_snapshot_response_body import CopySnapshotResponseBody
+    from ._copy_snapshot_response import CopySnapshotResponse
+    from ._create_activation_request import CreateActivationRequest
+    from ._create_activation_response_body import CreateActivationResponseBody
+    from ._create_activation_response import CreateActivationResponse
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequest
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequest
+    from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBody
+    from ._create_auto_provisioning_group_response import CreateAutoProvisioningGroupResponse
+    from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequest
+    from ._create_auto_snapshot_policy_response_body import CreateAutoSnapshotPolicyResponseBody
+    from ._create_auto_snapshot_policy_response import CreateAutoSnapshotPolicyResponse
+    from ._create_capacity_reservation_request import CreateCapacityReservationRequest
+    from ._create_capacity_reservation_response_body import CreateCapacityReservationResponseBody
+    from ._create_capacity_reservation_response import CreateCapacityReservationResponse
+    from ._create_command_request import CreateCommandRequest
+    from ._create_command_response_body import CreateCommandResponseBody
+    from ._create_command_response import CreateCommandResponse
+    from ._create_dedicated_host_cluster_request import CreateDedicatedHostClusterRequest
+    from ._create_dedicated_host_cluster_response_body import CreateDedicatedHostClusterResponseBody
+    from ._create_dedicated_host_cluster_response import CreateDedicatedHostClusterResponse
+    from ._create_deployment_set_request import CreateDeploymentSetRequest
+    from ._create_deployment_set_response_body import CreateDeploymentSetResponseBody
+    from ._create_deployment_set_response import CreateDeploymentSetResponse
+    from ._create_diagnostic_metric_set_request import CreateDiagnosticMetricSetRequest
+    from ._create_diagnostic_metric_set_response_body import CreateDiagnosticMetricSetResponseBody
+    from ._create_diagnostic_metric_set_response import CreateDiagnosticMetricSetResponse
+    from ._create_diagnostic_report_request import CreateDiagnosticReportRequest
+    from ._create_diagnostic_report_response_body import CreateDiagnosticReportResponseBody
+    from ._create_diagnostic_report_response import CreateDiagnosticReportResponse
+    from ._create_disk_request import CreateDiskRequest
+    from ._create_disk_response_body import CreateDiskResponseBody
+    from ._create_disk_response import CreateDiskResponse
+    from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequest
+    from ._create_elasticity_assurance_response_body import CreateElasticityAssuranceResponseBody
+    from ._create_elasticity_assurance_response import CreateElasticityAssuranceResponse
+    from ._create_forward_entry_request import CreateForwardEntryRequest
+    from ._create_forward_entry_response_body import CreateForwardEntryResponseBody
+    from ._create_forward_entry_response import CreateForwardEntryResponse
+    from ._create_ha_vip_request import CreateHaVipRequest
+    from ._create_ha_vip_response_body import CreateHaVipResponseBody
+    from ._create_ha_vip_response import CreateHaVipResponse
+    from ._create_hpc_cluster_request import CreateHpcClusterRequest
+    from ._create_hpc_cluster_response_body import CreateHpcClusterResponseBody
+    from ._create_hpc_cluster_response import CreateHpcClusterResponse
+    from ._create_image_request import CreateImageRequest
+    from ._create_image_response_body import CreateImageResponseBody
+    from ._create_image_response import CreateImageResponse
+    from ._create_image_component_request import CreateImageComponentRequest
+    from ._create_image_component_response_body import CreateImageComponentResponseBody
+    from ._create_image_component_response import CreateImageComponentResponse
+    from ._create_image_pipeline_request import CreateImagePipelineRequest
+    from ._create_image_pipeline_response_body import CreateImagePipelineResponseBody
+    from ._create_image_pipeline_response import CreateImagePipelineResponse
+    from ._create_instance_request import CreateInstanceRequest
+    from ._create_instance_response_body import CreateInstanceResponseBody
+    from ._create_instance_response import CreateInstanceResponse
+    from ._create_key_pair_request import CreateKeyPairRequest
+    from ._create_key_pair_response_body import CreateKeyPairResponseBody
+    from ._create_key_pair_response import CreateKeyPairResponse
+    from ._create_launch_template_request import CreateLaunchTemplateRequest
+    from ._create_launch_template_response_body import CreateLaunchTemplateResponseBody
+    from ._create_launch_template_response import CreateLaunchTemplateResponse
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequest
+    from ._create_launch_template_version_response_body import CreateLaunchTemplateVersionResponseBody
+    from ._create_launch_template_version_response import CreateLaunchTemplateVersionResponse
+    from ._create_nat_gateway_request import CreateNatGatewayRequest
+    from ._create_nat_gateway_response_body import CreateNatGatewayResponseBody
+    from ._create_nat_gateway_response import CreateNatGatewayResponse
+    from ._create_network_interface_request import CreateNetworkInterfaceRequest
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBody
+    from ._create_network_interface_response import CreateNetworkInterfaceResponse
+    from ._create_network_interface_permission_request import CreateNetworkInterfacePermissionRequest
+    from ._create_network_interface_permission_response_body import CreateNetworkInterfacePermissionResponseBody
+    from ._create_network_interface_permission_response import CreateNetworkInterfacePermissionResponse
+    from ._create_physical_connection_request import CreatePhysicalConnectionRequest
+    from ._create_physical_connection_response_body import CreatePhysicalConnectionResponseBody
+    from ._create_physical_connection_response import CreatePhysicalConnectionResponse
+    from ._create_port_range_list_request import CreatePortRangeListRequest
+    from ._create_port_range_list_response_body import CreatePortRangeListResponseBody
+    from ._create_port_range_list_response import CreatePortRangeListResponse
+    from ._create_prefix_list_request import CreatePrefixListRequest
+    from ._create_prefix_list_response_body import CreatePrefixListResponseBody
+    from ._create_prefix_list_response import CreatePrefixListResponse
+    from ._create_route_entry_request import CreateRouteEntryRequest
+    from ._create_route_entry_response_body import CreateRouteEntryResponseBody
+    from ._create_route_entry_response import CreateRouteEntryResponse
+    from ._create_router_interface_request import CreateRouterInterfaceRequest
+    from ._create_router_interface_response_body import CreateRouterInterfaceResponseBody
+    from ._create_router_interface_response import CreateRouterInterfaceResponse
+    from ._create_savings_plan_request import CreateSavingsPlanRequest
+    from ._create_savings_plan_response_body import CreateSavingsPlanResponseBody
+    from ._create_savings_plan_response import CreateSavingsPlanResponse
+    from ._create_security_group_request import CreateSecurityGroupRequest
+    from ._create_security_group_response_body import CreateSecurityGroupResponseBody
+    from ._create_security_group_response import CreateSecurityGroupResponse
+    from ._create_simulated_system_events_request import CreateSimulatedSystemEventsRequest
+    from ._create_simulated_system_events_response_body import CreateSimulatedSystemEventsResponseBody
+    from ._create_simulated_system_events_response import CreateSimulatedSystemEventsResponse
+    from ._create_snapshot_request import CreateSnapshotRequest
+    from ._create_snapshot_response_body import CreateSnapshotResponseBody
+    from ._create_snapshot_response import CreateSnapshotResponse
+    from ._create_snapshot_group_request import CreateSnapshotGroupRequest
+    from ._create_snapshot_group_response_body import CreateSnapshotGroupResponseBody
+    from ._create_snapshot_group_response import CreateSnapshotGroupResponse
+    from ._create_storage_set_request import CreateStorageSetRequest
+    from ._create_storage_set_response_body import CreateStorageSetResponseBody
+    from ._create_storage_set_response import CreateStorageSetResponse
+    from ._create_vswitch_request import CreateVSwitchRequest
+    from ._create_vswitch_response_body import CreateVSwitchResponseBody
+    from ._create_vswitch_response import CreateVSwitchResponse
+    from ._create_virtual_border_router_request import CreateVirtualBorderRouterRequest
+    from ._create_virtual_border_router_response_body import CreateVirtualBorderRouterResponseBody
+    from ._create_virtual_border_router_response import CreateVirtualBorderRouterResponse
+    from ._create_vpc_request import CreateVpcRequest
+    from ._create_vpc_response_body import CreateVpcResponseBody
+    from ._create_vpc_response import CreateVpcResponse
+    from ._deactivate_router_interface_request import DeactivateRouterInterfaceRequest
+    from ._deactivate_router_interface_response_body import DeactivateRouterInterfaceResponseBody
+    from ._deactivate_router_interface_response import DeactivateRouterInterfaceResponse
+    from ._delete_activation_request import DeleteActivationRequest
+    from ._delete_activation_response_body import DeleteActivationResponseBody
+    from ._delete_activation_response import DeleteActivationResponse
+    from ._delete_auto_provisioning_group_request import DeleteAutoProvisioningGroupRequest
+    from ._delete_auto_provisioning_group_response_body import DeleteAutoProvisioningGroupResponseBody
+    from ._delete_auto_provisioning_group_response import DeleteAutoProvisioningGroupResponse
+    from ._delete_auto_snapshot_policy_request import DeleteAutoSnapshotPolicyRequest
+    from ._delete_auto_snapshot_policy_response_body import DeleteAutoSnapshotPolicyResponseBody
+    from ._delete_auto_snapshot_policy_response import DeleteAutoSnapshotPolicyResponse
+    from ._delete_bandwidth_package_request import DeleteBandwidthPackageRequest
+    from ._delete_bandwidth_package_response_body import DeleteBandwidthPackageResponseBody
+    from ._delete_bandwidth_package_response import DeleteBandwidthPackageResponse
+    from ._delete_command_request import DeleteCommandRequest
+    from ._delete_command_response_body import DeleteCommandResponseBody
+    from ._delete_command_response import DeleteCommandResponse
+    from ._delete_dedicated_host_cluster_request import DeleteDedicatedHostClusterRequest
+    from ._delete_dedicated_host_cluster_response_body import DeleteDedicatedHostClusterResponseBody
+    from ._delete_dedicated_host_cluster_response import DeleteDedicatedHostClusterResponse
+    from ._delete_deployment_set_request import DeleteDeploymentSetRequest
+    from ._delete_deployment_set_response_body import DeleteDeploymentSetResponseBody
+    from ._delete_deployment_set_response import DeleteDeploymentSetResponse
+    from ._delete_diagnostic_metric_sets_request import DeleteDiagnosticMetricSetsRequest
+    from ._delete_diagnostic_metric_sets_response_body import DeleteDiagnosticMetricSetsResponseBody
+    from ._delete_diagnostic_metric_sets_response import DeleteDiagnosticMetricSetsResponse
+    from ._delete_diagnostic_reports_request import DeleteDiagnosticReportsRequest
+    from ._delete_diagnostic_reports_response_body import DeleteDiagnosticReportsResponseBody
+    from ._delete_diagnostic_reports_response import DeleteDiagnosticReportsResponse
+    from ._delete_disk_request import DeleteDiskRequest
+    from ._delete_disk_response_body import DeleteDiskResponseBody
+    from ._delete_disk_response import DeleteDiskResponse
+    from ._delete_forward_entry_request import DeleteForwardEntryRequest
+    from ._delete_forward_entry_response_body import DeleteForwardEntryResponseBody
+    from ._delete_forward_entry_response import DeleteForwardEntryResponse
+    from ._delete_ha_vip_request import DeleteHaVipRequest
+    from ._delete_ha_vip_response_body import DeleteHaVipResponseBody
+    from ._delete_ha_vip_response import DeleteHaVipResponse
+    from ._delete_hpc_cluster_request import DeleteHpcClusterRequest
+    from ._delete_hpc_cluster_response_body import DeleteHpcClusterResponseBody
+    from ._delete_hpc_cluster_response import DeleteHpcClusterResponse
+    from ._delete_image_request import DeleteImageRequest
+    from ._delete_image_response_body import DeleteImageResponseBody
+    from ._delete_image_response import DeleteImageResponse
+    from ._delete_image_component_request import DeleteImageComponentRequest
+    from ._delete_image_component_response_body import DeleteImageComponentResponseBody
+    from ._delete_image_component_response import DeleteImageComponentResponse
+    from ._delete_image_pipeline_request import DeleteImagePipelineRequest
+    from ._delete_image_pipeline_response_body import DeleteImagePipelineResponseBody
+    from ._delete_image_pipeline_response import DeleteImagePipelineResponse
+    from ._delete_instance_request import DeleteInstanceRequest
+    from ._delete_instance_response_body import DeleteInstanceResponseBody
+    from ._delete_instance_response import DeleteInstanceResponse
+    from ._delete_instances_request import DeleteInstancesRequest
+    from ._delete_instances_response_body import DeleteInstancesResponseBody
+    from ._delete_instances_response import DeleteInstancesResponse
+    from ._delete_key_pairs_request import DeleteKeyPairsRequest
+    from ._delete_key_pairs_response_body import DeleteKeyPairsResponseBody
+    from ._delete_key_pairs_response import DeleteKeyPairsResponse
+    from ._delete_launch_template_request import DeleteLaunchTemplateRequest
+    from ._delete_launch_template_response_body import DeleteLaunchTemplateResponseBody
+    from ._delete_launch_template_response import DeleteLaunchTemplateResponse
+    from ._delete_launch_template_version_request import DeleteLaunchTemplateVersionRequest
+    from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBody
+    from ._delete_launch_template_version_response import DeleteLaunchTemplateVersionResponse
+    from ._delete_nat_gateway_request import DeleteNatGatewayRequest
+    from ._delete_nat_gateway_response_body import DeleteNatGatewayResponseBody
+    from ._delete_nat_gateway_response import DeleteNatGatewayResponse
+    from ._delete_network_interface_request import DeleteNetworkInterfaceRequest
+    from ._delete_network_interface_response_body import DeleteNetworkInterfaceResponseBody
+    from ._delete_network_interface_response import DeleteNetworkInterfaceResponse
+    from ._delete_network_interface_permission_request import DeleteNetworkInterfacePermissionRequest
+    from ._delete_network_interface_permission_response_body import DeleteNetworkInterfacePermissionResponseBody
+    from ._delete_network_interface_permission_response import DeleteNetworkInterfacePermissionResponse
+    from ._delete_physical_connection_request import DeletePhysicalConnectionRequest
+    from ._delete_physical_connection_response_body import DeletePhysicalConnectionResponseBody
+    from ._delete_physical_connection_response import DeletePhysicalConnectionResponse
+    from ._delete_port_range_list_request import DeletePortRangeListRequest
+    from ._delete_port_range_list_response_body import DeletePortRangeListResponseBody
+    from ._delete_port_range_list_response import DeletePortRangeListResponse
+    from ._delete_prefix_list_request import DeletePrefixListRequest
+    from ._delete_prefix_list_response_body import DeletePrefixListResponseBody
+    from ._delete_prefix_list_response import DeletePrefixListResponse
+    from ._delete_route_entry_request import DeleteRouteEntryRequest
+    from ._delete_route_entry_response_body import DeleteRouteEntryResponseBody
+    from ._delete_route_entry_response import DeleteRouteEntryResponse
+    from ._delete_router_interface_request import DeleteRouterInterfaceRequest
+    from ._delete_router_interface_response_body import DeleteRouterInterfaceResponseBody
+    from ._delete_router_interface_response import DeleteRouterInterfaceResponse
+    from ._delete_security_group_request import DeleteSecurityGroupRequest
+    from ._delete_security_group_response_body import DeleteSecurityGroupResponseBody
+    from ._delete_security_group_response import DeleteSecurityGroupResponse
+    from ._delete_snapshot_request import DeleteSnapshotRequest
+    from ._delete_snapshot_response_body import DeleteSnapshotResponseBody
+    from ._delete_snapshot_response import DeleteSnapshotResponse
+    from ._delete_snapshot_group_request import DeleteSnapshotGroupRequest
+    from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBody
+    from ._delete_snapshot_group_response import DeleteSnapshotGroupResponse
+    from ._delete_storage_set_request import DeleteStorageSetRequest
+    from ._delete_storage_set_response_body import DeleteStorageSetResponseBody
+    from ._delete_storage_set_response import DeleteStorageSetResponse
+    from ._delete_vswitch_request import DeleteVSwitchRequest
+    from ._delete_vswitch_response_body import DeleteVSwitchResponseBody
+    from ._delete_vswitch_response import DeleteVSwitchResponse
+    from ._delete_virtual_border_router_request import DeleteVirtualBorderRouterRequest
+    from ._delete_virtual_border_router_response_body import DeleteVirtualBorderRouterResponseBody
+    from ._delete_virtual_border_router_response import DeleteVirtualBorderRouterResponse
+    from ._delete_vpc_request import DeleteVpcRequest
+    from ._delete_vpc_response_body import DeleteVpcResponseBody
+    from ._delete_vpc_response import DeleteVpcResponse
+    from ._deregister_managed_instance_request import DeregisterManagedInstanceRequest
+    from ._deregister_managed_instance_response_body import DeregisterManagedInstanceResponseBody
+    from ._deregister_managed_instance_response import DeregisterManagedInstanceResponse
+    from ._describe_access_points_request import DescribeAccessPointsRequest
+    from ._describe_access_points_response_body import DescribeAccessPointsResponseBody
+    from ._describe_access_points_response import DescribeAccessPointsResponse
+    from ._describe_account_attributes_request import DescribeAccountAttributesRequest
+    from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBody
+    from ._describe_account_attributes_response import DescribeAccountAttributesResponse
+    from ._describe_activations_request import DescribeActivationsRequest
+    from ._describe_activations_response_body import DescribeActivationsResponseBody
+    from ._describe_activations_response import DescribeActivationsResponse
+    from ._describe_auto_provisioning_group_history_request import DescribeAutoProvisioningGroupHistoryRequest
+    from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBody
+    from ._describe_auto_provisioning_group_history_response import DescribeAutoProvisioningGroupHistoryResponse
+    from ._describe_auto_provisioning_group_instances_request import DescribeAutoProvisioningGroupInstancesRequest
+    from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBody
+    from ._describe_auto_provisioning_group_instances_response import DescribeAutoProvisioningGroupInstancesResponse
+    from ._describe_auto_provisioning_groups_request import DescribeAutoProvisioningGroupsRequest
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBody
+    from ._describe_auto_provisioning_groups_response import DescribeAutoProvisioningGroupsResponse
+    from ._describe_auto_snapshot_policy_associations_request import DescribeAutoSnapshotPolicyAssociationsRequest
+    from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBody
+    from ._describe_auto_snapshot_policy_associations_response import DescribeAutoSnapshotPolicyAssociationsResponse
+    from ._describe_auto_snapshot_policy_ex_request import DescribeAutoSnapshotPolicyExRequest
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBody
+    from ._describe_auto_snapshot_policy_ex_response import DescribeAutoSnapshotPolicyExResponse
+    from ._describe_available_resource_request import DescribeAvailableResourceRequest
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBody
+    from ._describe_available_resource_response import DescribeAvailableResourceResponse
+    from ._describe_bandwidth_limitation_request import DescribeBandwidthLimitationRequest
+    from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBody
+    from ._describe_bandwidth_limitation_response import DescribeBandwidthLimitationResponse
+    from ._describe_bandwidth_packages_request import DescribeBandwidthPackagesRequest
+    from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBody
+    from ._describe_bandwidth_packages_response import DescribeBandwidthPackagesResponse
+    from ._describe_capacity_reservation_instances_request import DescribeCapacityReservationInstancesRequest
+    from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBody
+    from ._describe_capacity_reservation_instances_response import DescribeCapacityReservationInstancesResponse
+    from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequest
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBody
+    from ._describe_capacity_reservations_response import DescribeCapacityReservationsResponse
+    from ._describe_classic_link_instances_request import DescribeClassicLinkInstancesRequest
+    from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBody
+    from ._describe_classic_link_instances_response import DescribeClassicLinkInstancesResponse
+    from ._describe_cloud_assistant_settings_request import DescribeCloudAssistantSettingsRequest
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBody
+    from ._describe_cloud_assistant_settings_response import DescribeCloudAssistantSettingsResponse
+    from ._describe_cloud_assistant_status_request import DescribeCloudAssistantStatusRequest
+    from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBody
+    from ._describe_cloud_assistant_status_response import DescribeCloudAssistantStatusResponse
+    from ._describe_clusters_request import DescribeClustersRequest
+    from ._describe_clusters_response_body import DescribeClustersResponseBody
+    from ._describe_clusters_response import DescribeClustersResponse
+    from ._describe_commands_request import DescribeCommandsRequest
+    from ._describe_commands_response_body import DescribeCommandsResponseBody
+    from ._describe_commands_response import DescribeCommandsResponse
+    from ._describe_dedicated_host_auto_renew_request import DescribeDedicatedHostAutoRenewRequest
+    from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBody
+    from ._describe_dedicated_host_auto_renew_response import DescribeDedicatedHostAutoRenewResponse
+    from ._describe_dedicated_host_clusters_request import DescribeDedicatedHostClustersRequest
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBody
+    from ._describe_dedicated_host_clusters_response import DescribeDedicatedHostClustersResponse
+    from ._describe_dedicated_host_types_request import DescribeDedicatedHostTypesRequest
+    from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBody
+    from ._describe_dedicated_host_types_response import DescribeDedicatedHostTypesResponse
+    from ._describe_dedicated_hosts_request import DescribeDedicatedHostsRequest
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBody
+    from ._describe_dedicated_hosts_response import DescribeDedicatedHostsResponse
+    from ._describe_deployment_set_supported_instance_type_family_request import DescribeDeploymentSetSupportedInstanceTypeFamilyRequest
+    from ._describe_deployment_set_supported_instance_type_family_response_body import DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody
+    from ._describe_deployment_set_supported_instance_type_family_response import DescribeDeploymentSetSupportedInstanceTypeFamilyResponse
+    from ._describe_deployment_sets_request import DescribeDeploymentSetsRequest
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBody
+    from ._describe_deployment_sets_response import DescribeDeploymentSetsResponse
+    from ._describe_diagnostic_metric_sets_request import DescribeDiagnosticMetricSetsRequest
+    from ._describe_diagnostic_metric_sets_response_body import DescribeDiagnosticMetricSetsResponseBody
+    from ._describe_diagnostic_metric_sets_response import DescribeDiagnosticMetricSetsResponse
+    from ._describe_diagnostic_metrics_request import DescribeDiagnosticMetricsRequest
+    from ._describe_diagnostic_metrics_response_body import DescribeDiagnosticMetricsResponseBody
+    from ._describe_diagnostic_metrics_response import DescribeDiagnosticMetricsResponse
+    from ._describe_diagnostic_report_attributes_request import DescribeDiagnosticReportAttributesRequest
+    from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBody
+    from ._describe_diagnostic_report_attributes_response import DescribeDiagnosticReportAttributesResponse
+    from ._describe_diagnostic_reports_request import DescribeDiagnosticReportsRequest
+    from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBody
+    from ._describe_diagnostic_reports_response import DescribeDiagnosticReportsResponse
+    from ._describe_disk_default_kmskey_id_request import DescribeDiskDefaultKMSKeyIdRequest
+    from ._describe_disk_default_kmskey_id_response_body import DescribeDiskDefaultKMSKeyIdResponseBody
+    from ._describe_disk_default_kmskey_id_response import DescribeDiskDefaultKMSKeyIdResponse
+    from ._describe_disk_encryption_by_default_status_request import DescribeDiskEncryptionByDefaultStatusRequest
+    from ._describe_disk_encryption_by_default_status_response_body import DescribeDiskEncryptionByDefaultStatusResponseBody
+    from ._describe_disk_encryption_by_default_status_response import DescribeDiskEncryptionByDefaultStatusResponse
+    from ._describe_disk_monitor_data_request import DescribeDiskMonitorDataRequest
+    from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBody
+    from ._describe_disk_monitor_data_response import DescribeDiskMonitorDataResponse
+    from ._describe_disks_request import DescribeDisksRequest
+    from ._describe_disks_response_body import DescribeDisksResponseBody
+    from ._describe_disks_response import DescribeDisksResponse
+    from ._describe_disks_full_status_request import DescribeDisksFullStatusRequest
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBody
+    from ._describe_disks_full_status_response import DescribeDisksFullStatusResponse
+    from ._describe_eip_addresses_request import DescribeEipAddressesRequest
+    from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBody
+    from ._describe_eip_addresses_response import DescribeEipAddressesResponse
+    from ._describe_eip_monitor_data_request import DescribeEipMonitorDataRequest
+    from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBody
+    from ._describe_eip_monitor_data_response import DescribeEipMonitorDataResponse
+    from ._describe_elasticity_assurance_auto_renew_attribute_request import DescribeElasticityAssuranceAutoRenewAttributeRequest
+    from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBody
+    from ._describe_elasticity_assurance_auto_renew_attribute_response import DescribeElasticityAssuranceAutoRenewAttributeResponse
+    from ._describe_elasticity_assurance_instances_request import DescribeElasticityAssuranceInstancesRequest
+    from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBody
+    from ._describe_elasticity_assurance_instances_response import DescribeElasticityAssuranceInstancesResponse
+    from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequest
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBody
+    from ._describe_elasticity_assurances_response import DescribeElasticityAssurancesResponse
+    from ._describe_eni_monitor_data_request import DescribeEniMonitorDataRequest
+    from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBody
+    from ._describe_eni_monitor_data_response import DescribeEniMonitorDataResponse
+    from ._describe_forward_table_entries_request import DescribeForwardTableEntriesRequest
+    from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBody
+    from ._describe_forward_table_entries_response import DescribeForwardTableEntriesResponse
+    from ._describe_ha_vips_request import DescribeHaVipsRequest
+    from ._describe_ha_vips_response_body import DescribeHaVipsResponseBody
+    from ._describe_ha_vips_response import DescribeHaVipsResponse
+    from ._describe_hpc_clusters_request import DescribeHpcClustersRequest
+    from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBody
+    from ._describe_hpc_clusters_response import DescribeHpcClustersResponse
+    from ._describe_image_components_request import DescribeImageComponentsRequest
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBody
+    from ._describe_image_components_response import DescribeImageComponentsResponse
+    from ._describe_image_from_family_request import DescribeImageFromFamilyRequest
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBody
+    from ._describe_image_from_family_response import DescribeImageFromFamilyResponse
+    from ._describe_image_pipeline_executions_request import DescribeImagePipelineExecutionsRequest
+    from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBody
+    from ._describe_image_pipeline_executions_response import DescribeImagePipelineExecutionsResponse
+    from ._describe_image_pipelines_request import DescribeImagePipelinesRequest
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBody
+    from ._describe_image_pipelines_response import DescribeImagePipelinesResponse
+    from ._describe_image_share_permission_request import DescribeImageSharePermissionRequest
+    from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBody
+    from ._describe_image_share_permission_response import DescribeImageSharePermissionResponse
+    from ._describe_image_support_instance_types_request import DescribeImageSupportInstanceTypesRequest
+    from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBody
+    from ._describe_image_support_instance_types_response import DescribeImageSupportInstanceTypesResponse
+    from ._describe_images_request import DescribeImagesRequest
+    from ._describe_images_response_body import DescribeImagesResponseBody
+    from ._describe_images_response import DescribeImagesResponse
+    from ._describe_instance_attachment_attributes_request import DescribeInstanceAttachmentAttributesRequest
+    from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBody
+    from ._describe_instance_attachment_attributes_response import DescribeInstanceAttachmentAttributesResponse
+    from ._describe_instance_attribute_request import DescribeInstanceAttributeRequest
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBody
+    from ._describe_instance_attribute_response import DescribeInstanceAttributeResponse
+    from ._describe_instance_auto_renew_attribute_request import DescribeInstanceAutoRenewAttributeRequest
+    from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBody
+    from ._describe_instance_auto_renew_attribute_response import DescribeInstanceAutoRenewAttributeResponse
+    from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequest
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBody
+    from ._describe_instance_history_events_response import DescribeInstanceHistoryEventsResponse
+    from ._describe_instance_maintenance_attributes_request import DescribeInstanceMaintenanceAttributesRequest
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBody
+    from ._describe_instance_maintenance_attributes_response import DescribeInstanceMaintenanceAttributesResponse
+    from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequest
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBody
+    from ._describe_instance_modification_price_response import DescribeInstanceModificationPriceResponse
+    from ._describe_instance_monitor_data_request import DescribeInstanceMonitorDataRequest
+    from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBody
+    from ._describe_instance_monitor_data_response import DescribeInstanceMonitorDataResponse
+    from ._describe_instance_ram_role_request import DescribeInstanceRamRoleRequest
+    from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBody
+    from ._describe_instance_ram_role_response import DescribeInstanceRamRoleResponse
+    from ._describe_instance_status_request import DescribeInstanceStatusRequest
+    from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBody
+    from ._describe_instance_status_response import DescribeInstanceStatusResponse
+    from ._describe_instance_topology_request import DescribeInstanceTopologyRequest
+    from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBody
+    from ._describe_instance_topology_response import DescribeInstanceTopologyResponse
+    from ._describe_instance_type_families_request import DescribeInstanceTypeFamiliesRequest
+    from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBody
+    from ._describe_instance_type_families_response import DescribeInstanceTypeFamiliesResponse
+    from ._describe_instance_types_request import DescribeInstanceTypesRequest
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBody
+    from ._describe_instance_types_response import DescribeInstanceTypesResponse
+    from ._describe_instance_vnc_url_request import DescribeInstanceVncUrlRequest
+    from ._describe_instance_vnc_url_response_body import DescribeInstanceVncUrlResponseBody
+    from ._describe_instance_vnc_url_response import DescribeInstanceVncUrlResponse
+    from ._describe_instances_request import DescribeInstancesRequest
+    from ._describe_instances_response_body import DescribeInstancesResponseBody
+    from ._describe_instances_response import DescribeInstancesResponse
+    from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequest
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBody
+    from ._describe_instances_full_status_response import DescribeInstancesFullStatusResponse
+    from ._describe_invocation_results_request import DescribeInvocationResultsRequest
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBody
+    from ._describe_invocation_results_response import DescribeInvocationResultsResponse
+    from ._describe_invocations_request import DescribeInvocationsRequest
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBody
+    from ._describe_invocations_response import DescribeInvocationsResponse
+    from ._describe_key_pairs_request import DescribeKeyPairsRequest
+    from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBody
+    from ._describe_key_pairs_response import DescribeKeyPairsResponse
+    from ._describe_launch_template_versions_request import DescribeLaunchTemplateVersionsRequest
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBody
+    from ._describe_launch_template_versions_response import DescribeLaunchTemplateVersionsResponse
+    from ._describe_launch_templates_request import DescribeLaunchTemplatesRequest
+    from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBody
+    from ._describe_launch_templates_response import DescribeLaunchTemplatesResponse
+    from ._describe_limitation_request import DescribeLimitationRequest
+    from ._describe_limitation_response_body import DescribeLimitationResponseBody
+    from ._describe_limitation_response import DescribeLimitationResponse
+    from ._describe_locked_snapshots_request import DescribeLockedSnapshotsRequest
+    from ._describe_locked_snapshots_response_body import DescribeLockedSnapshotsResponseBody
+    from ._describe_locked_snapshots_response import DescribeLockedSnapshotsResponse
+    from ._describe_managed_instances_request import DescribeManagedInstancesRequest
+    from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBody
+    from ._describe_managed_instances_response import DescribeManagedInstancesResponse
+    from ._describe_nat_gateways_request import DescribeNatGatewaysRequest
+    from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBody
+    from ._describe_nat_gateways_response import DescribeNatGatewaysResponse
+    from ._describe_network_interface_attribute_request import DescribeNetworkInterfaceAttributeRequest
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBody
+    from ._describe_network_interface_attribute_response import DescribeNetworkInterfaceAttributeResponse
+    from ._describe_network_interface_permissions_request import DescribeNetworkInterfacePermissionsRequest
+    from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBody
+    from ._describe_network_interface_permissions_response import DescribeNetworkInterfacePermissionsResponse
+    from ._describe_network_interfaces_request import DescribeNetworkInterfacesRequest
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBody
+    from ._describe_network_interfaces_response import DescribeNetworkInterfacesResponse
+    from ._describe_new_project_eip_monitor_data_request import DescribeNewProjectEipMonitorDataRequest
+    from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBody
+    from ._describe_new_project_eip_monitor_data_response import DescribeNewProjectEipMonitorDataResponse
+    from ._describe_physical_connections_request import DescribePhysicalConnectionsRequest
+    from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBody
+    from ._describe_physical_connections_response import DescribePhysicalConnectionsResponse
+    from ._describe_port_range_list_associations_request import DescribePortRangeListAssociationsRequest
+    from ._describe_port_range_list_associations_response_body import DescribePortRangeListAssociationsResponseBody
+    from ._describe_port_range_list_associations_response import DescribePortRangeListAssociationsResponse
+    from ._describe_port_range_list_entries_request import DescribePortRangeListEntriesRequest
+    from ._describe_port_range_list_entries_response_body import DescribePortRangeListEntriesResponseBody
+    from ._describe_port_range_list_entries_response import DescribePortRangeListEntriesResponse
+    from ._describe_port_range_lists_request import DescribePortRangeListsRequest
+    from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBody
+    from ._describe_port_range_lists_response import DescribePortRangeListsResponse
+    from ._describe_prefix_list_associations_request import DescribePrefixListAssociationsRequest
+    from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBody
+    from ._describe_prefix_list_associations_response import DescribePrefixListAssociationsResponse
+    from ._describe_prefix_list_attributes_request import DescribePrefixListAttributesRequest
+    from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBody
+    from ._describe_prefix_list_attributes_response import DescribePrefixListAttributesResponse
+    from ._describe_prefix_lists_request import DescribePrefixListsRequest
+    from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBody
+    from ._describe_prefix_lists_response import DescribePrefixListsResponse
+    from ._describe_price_request import DescribePriceRequest
+    from ._describe_price_response_body import DescribePriceResponseBody
+    from ._describe_price_response import DescribePriceResponse
+    from ._describe_recommend_instance_type_request import DescribeRecommendInstanceTypeRequest
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBody
+    from ._describe_recommend_instance_type_response import DescribeRecommendInstanceTypeResponse
+    from ._describe_regions_request import DescribeRegionsRequest
+    from ._describe_regions_response_body import DescribeRegionsResponseBody
+    from ._describe_regions_response import DescribeRegionsResponse
+    from ._describe_renewal_price_request import DescribeRenewalPriceRequest
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBody
+    from ._describe_renewal_price_response import DescribeRenewalPriceResponse
+    from ._describe_reserved_instance_auto_renew_attribute_request import DescribeReservedInstanceAutoRenewAttributeRequest
+    from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBody
+    from ._describe_reserved_instance_auto_renew_attribute_response import DescribeReservedInstanceAutoRenewAttributeResponse
+    from ._describe_reserved_instances_request import DescribeReservedInstancesRequest
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBody
+    from ._describe_reserved_instances_response import DescribeReservedInstancesResponse
+    from ._describe_resource_by_tags_request import DescribeResourceByTagsRequest
+    from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBody
+    from ._describe_resource_by_tags_response import DescribeResourceByTagsResponse
+    from ._describe_resources_modification_request import DescribeResourcesModificationRequest
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBody
+    from ._describe_resources_modification_response import DescribeResourcesModificationResponse
+    from ._describe_route_tables_request import DescribeRouteTablesRequest
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBody
+    from ._describe_route_tables_response import DescribeRouteTablesResponse
+    from ._describe_router_interfaces_request import DescribeRouterInterfacesRequest
+    from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBody
+    from ._describe_router_interfaces_response import DescribeRouterInterfacesResponse
+    from ._describe_savings_plan_estimation_request import DescribeSavingsPlanEstimationRequest
+    from ._describe_savings_plan_estimation_response_body import DescribeSavingsPlanEstimationResponseBody
+    from ._describe_savings_plan_estimation_response import DescribeSavingsPlanEstimationResponse
+    from ._describe_savings_plan_price_request import DescribeSavingsPlanPriceRequest
+    from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBody
+    from ._describe_savings_plan_price_response import DescribeSavingsPlanPriceResponse
+    from ._describe_security_group_attribute_request import DescribeSecurityGroupAttributeRequest
+    from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBody
+    from ._describe_security_group_attribute_response import DescribeSecurityGroupAttributeResponse
+    from ._describe_security_group_references_request import DescribeSecurityGroupReferencesRequest
+    from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBody
+    from ._describe_security_group_references_response import DescribeSecurityGroupReferencesResponse
+    from ._describe_security_groups_request import DescribeSecurityGroupsRequest
+    from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBody
+    from ._describe_security_groups_response import DescribeSecurityGroupsResponse
+    from ._describe_send_file_results_request import DescribeSendFileResultsRequest
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBody
+    from ._describe_send_file_results_response import DescribeSendFileResultsResponse
+    from ._describe_snapshot_groups_request import DescribeSnapshotGroupsRequest
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBody
+    from ._describe_snapshot_groups_response import DescribeSnapshotGroupsResponse
+    from ._describe_snapshot_links_request import DescribeSnapshotLinksRequest
+    from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBody
+    from ._describe_snapshot_links_response import DescribeSnapshotLinksResponse
+    from ._describe_snapshot_monitor_data_request import DescribeSnapshotMonitorDataRequest
+    from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBody
+    from ._describe_snapshot_monitor_data_response import DescribeSnapshotMonitorDataResponse
+    from ._describe_snapshot_package_request import DescribeSnapshotPackageRequest
+    from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBody
+    from ._describe_snapshot_package_response import DescribeSnapshotPackageResponse
+    from ._describe_snapshots_request import DescribeSnapshotsRequest
+    from ._describe_snapshots_response_body import DescribeSnapshotsResponseBody
+    from ._describe_snapshots_response import DescribeSnapshotsResponse
+    from ._describe_snapshots_usage_request import DescribeSnapshotsUsageRequest
+    from ._describe_snapshots_usage_response_body import DescribeSnapshotsUsageResponseBody
+    from ._describe_snapshots_usage_response import DescribeSnapshotsUsageResponse
+    from ._describe_spot_advice_request import DescribeSpotAdviceRequest
+    from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBody
+    from ._describe_spot_advice_response import DescribeSpotAdviceResponse
+    from ._describe_spot_price_history_request import DescribeSpotPriceHistoryRequest
+    from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBody
+    from ._describe_spot_price_history_response import DescribeSpotPriceHistoryResponse
+    from ._describe_storage_capacity_units_request import DescribeStorageCapacityUnitsRequest
+    from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBody
+    from ._describe_storage_capacity_units_response import DescribeStorageCapacityUnitsResponse
+    from ._describe_storage_set_details_request import DescribeStorageSetDetailsRequest
+    from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBody
+    from ._describe_storage_set_details_response import DescribeStorageSetDetailsResponse
+    from ._describe_storage_sets_request import DescribeStorageSetsRequest
+    from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBody
+    from ._describe_storage_sets_response import DescribeStorageSetsResponse
+    from ._describe_tags_request import DescribeTagsRequest
+    from ._describe_tags_response_body import DescribeTagsResponseBody
+    from ._describe_tags_response import DescribeTagsResponse
+    from ._describe_task_attribute_request import DescribeTaskAttributeRequest
+    from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBody
+    from ._describe_task_attribute_response import DescribeTaskAttributeResponse
+    from ._describe_tasks_request import DescribeTasksRequest
+    from ._describe_tasks_response_body import DescribeTasksResponseBody
+    from ._describe_tasks_response import DescribeTasksResponse
+    from ._describe_terminal_sessions_request import DescribeTerminalSessionsRequest
+    from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBody
+    from ._describe_terminal_sessions_response import DescribeTerminalSessionsResponse
+    from ._describe_user_business_behavior_request import DescribeUserBusinessBehaviorRequest
+    from ._describe_user_business_behavior_response_body import DescribeUserBusinessBehaviorResponseBody
+    from ._describe_user_business_behavior_response import DescribeUserBusinessBehaviorResponse
+    from ._describe_user_data_request import DescribeUserDataRequest
+    from ._describe_user_data_response_body import DescribeUserDataResponseBody
+    from ._describe_user_data_response import DescribeUserDataResponse
+    from ._describe_vrouters_request import DescribeVRoutersRequest
+    from ._describe_vrouters_response_body import DescribeVRoutersResponseBody
+    from ._describe_vrouters_response import DescribeVRoutersResponse
+    from ._describe_vswitches_request import DescribeVSwitchesRequest
+    from ._describe_vswitches_response_body import DescribeVSwitchesResponseBody
+    from ._describe_vswitches_response import DescribeVSwitchesResponse
+    from ._describe_virtual_border_routers_request import DescribeVirtualBorderRoutersRequest
+    from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBody
+    from ._describe_virtual_border_routers_response import DescribeVirtualBorderRoutersResponse
+    from ._describe_virtual_border_routers_for_physical_connection_request import DescribeVirtualBorderRoutersForPhysicalConnectionRequest
+    from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody
+    from ._describe_virtual_border_routers_for_physical_connection_response import DescribeVirtualBorderRoutersForPhysicalConnectionResponse
+    from ._describe_vpcs_request import DescribeVpcsRequest
+    from ._describe_vpcs_response_body import DescribeVpcsResponseBody
+    from ._describe_vpcs_response import DescribeVpcsResponse
+    from ._describe_zones_request import DescribeZonesRequest
+    from ._describe_zones_response_body import DescribeZonesResponseBody
+    from ._describe_zones_response import DescribeZonesResponse
+    from ._detach_classic_link_vpc_request import DetachClassicLinkVpcRequest
+    from ._detach_classic_link_vpc_response_body import DetachClassicLinkVpcResponseBody
+    from ._detach_classic_link_vpc_response import DetachClassicLinkVpcResponse
+    from ._detach_disk_request import DetachDiskRequest
+    from ._detach_disk_response_body import DetachDiskResponseBody
+    from ._detach_disk_response import DetachDiskResponse
+    from ._detach_instance_ram_role_request import DetachInstanceRamRoleRequest
+    from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBody
+    from ._detach_instance_ram_role_response import DetachInstanceRamRoleResponse
+    from ._detach_key_pair_request import DetachKeyPairRequest
+    from ._detach_key_pair_response_body import DetachKeyPairResponseBody
+    from ._detach_key_pair_response import DetachKeyPairResponse
+    from ._detach_network_interface_request import DetachNetworkInterfaceRequest
+    from ._detach_network_interface_response_body import DetachNetworkInterfaceResponseBody
+    from ._detach_network_interface_response import DetachNetworkInterfaceResponse
+    from ._disable_activation_request import DisableActivationRequest
+    from ._disable_activation_response_body import DisableActivationResponseBody
+    from ._disable_activation_response import DisableActivationResponse
+    from ._disable_disk_encryption_by_default_request import DisableDiskEncryptionByDefaultRequest
+    from ._disable_disk_encryption_by_default_response_body import DisableDiskEncryptionByDefaultResponseBody
+    from ._disable_disk_encryption_by_default_response import DisableDiskEncryptionByDefaultResponse
+    from ._disable_network_interface_qo_srequest import DisableNetworkInterfaceQoSRequest
+    from ._disable_network_interface_qo_sresponse_body import DisableNetworkInterfaceQoSResponseBody
+    from ._disable_network_interface_qo_sresponse import DisableNetworkInterfaceQoSResponse
+    from ._enable_disk_encryption_by_default_request import EnableDiskEncryptionByDefaultRequest
+    from ._enable_disk_encryption_by_default_response_body import EnableDiskEncryptionByDefaultResponseBody
+    from ._enable_disk_encryption_by_default_response import EnableDiskEncryptionByDefaultResponse
+    from ._enable_network_interface_qo_srequest import EnableNetworkInterfaceQoSRequest
+    from ._enable_network_interface_qo_sresponse_body import EnableNetworkInterfaceQoSResponseBody
+    from ._enable_network_interface_qo_sresponse import EnableNetworkInterfaceQoSResponse
+    from ._enable_physical_connection_request import EnablePhysicalConnectionRequest
+    from ._enable_physical_connection_response_body import EnablePhysicalConnectionResponseBody
+    from ._enable_physical_connection_response import EnablePhysicalConnectionResponse
+    from ._end_terminal_session_request import EndTerminalSessionRequest
+    from ._end_terminal_session_response_body import EndTerminalSessionResponseBody
+    from ._end_terminal_session_response import EndTerminalSessionResponse
+    from ._export_image_request import ExportImageRequest
+    from ._export_image_response_body import ExportImageResponseBody
+    from ._export_image_response import ExportImageResponse
+    from ._export_snapshot_request import ExportSnapshotRequest
+    from ._export_snapshot_response_body import ExportSnapshotResponseBody
+    from ._export_snapshot_response import ExportSnapshotResponse
+    from ._get_instance_console_output_request import GetInstanceConsoleOutputRequest
+    from ._get_instance_console_output_response_body import GetInstanceConsoleOutputResponseBody
+    from ._get_instance_console_output_response import GetInstanceConsoleOutputResponse
+    from ._get_instance_screenshot_request import GetInstanceScreenshotRequest
+    from ._get_instance_screenshot_response_body import GetInstanceScreenshotResponseBody
+    from ._get_instance_screenshot_response import GetInstanceScreenshotResponse
+    from ._import_image_request import ImportImageRequest
+    from ._import_image_response_body import ImportImageResponseBody
+    from ._import_image_response import ImportImageResponse
+    from ._import_key_pair_request import ImportKeyPairRequest
+    from ._import_key_pair_response_body import ImportKeyPairResponseBody
+    from ._import_key_pair_response import ImportKeyPairResponse
+    from ._install_cloud_assistant_request import InstallCloudAssistantRequest
+    from ._install_cloud_assistant_response_body import InstallCloudAssistantResponseBody
+    from ._install_cloud_assistant_response import InstallCloudAssistantResponse
+    from ._invoke_command_request import InvokeCommandRequest
+    from ._invoke_command_shrink_request import InvokeCommandShrinkRequest
+    from ._invoke_command_response_body import InvokeCommandResponseBody
+    from ._invoke_command_response import InvokeCommandResponse
+    from ._join_resource_group_request import JoinResourceGroupRequest
+    from ._join_resource_group_response_body import JoinResourceGroupResponseBody
+    from ._join_resource_group_response import JoinResourceGroupResponse
+    from ._join_security_group_request import JoinSecurityGroupRequest
+    from ._join_security_group_response_body import JoinSecurityGroupResponseBody
+    from ._join_security_group_response import JoinSecurityGroupResponse
+    from ._leave_security_group_request import LeaveSecurityGroupRequest
+    from ._leave_security_group_response_body import LeaveSecurityGroupResponseBody
+    from ._leave_security_group_response import LeaveSecurityGroupResponse
+    from ._list_plugin_status_request import ListPluginStatusRequest
+    from ._list_plugin_status_response_body import ListPluginStatusResponseBody
+    from ._list_plugin_status_response import ListPluginStatusResponse
+    from ._list_tag_resources_request import ListTagResourcesRequest
+    from ._list_tag_resources_response_body import ListTagResourcesResponseBody
+    from ._list_tag_resources_response import ListTagResourcesResponse
+    from ._lock_snapshot_request import LockSnapshotRequest
+    from ._lock_snapshot_response_body import LockSnapshotResponseBody
+    from ._lock_snapshot_response import LockSnapshotResponse
+    from ._modify_auto_provisioning_group_request import ModifyAutoProvisioningGroupRequest
+    from ._modify_auto_provisioning_group_response_body import ModifyAutoProvisioningGroupResponseBody
+    from ._modify_auto_provisioning_group_response import ModifyAutoProvisioningGroupResponse
+    from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequest
+    from ._modify_auto_snapshot_policy_ex_response_body import ModifyAutoSnapshotPolicyExResponseBody
+    from ._modify_auto_snapshot_policy_ex_response import ModifyAutoSnapshotPolicyExResponse
+    from ._modify_bandwidth_package_spec_request import ModifyBandwidthPackageSpecRequest
+    from ._modify_bandwidth_package_spec_response_body import ModifyBandwidthPackageSpecResponseBody
+    from ._modify_bandwidth_package_spec_response import ModifyBandwidthPackageSpecResponse
+    from ._modify_capacity_reservation_request import ModifyCapacityReservationRequest
+    from ._modify_capacity_reservation_response_body import ModifyCapacityReservationResponseBody
+    from ._modify_capacity_reservation_response import ModifyCapacityReservationResponse
+    from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequest
+    from ._modify_cloud_assistant_settings_shrink_request import ModifyCloudAssistantSettingsShrinkRequest
+    from ._modify_cloud_assistant_settings_response_body import ModifyCloudAssistantSettingsResponseBody
+    from ._modify_cloud_assistant_settings_response import ModifyCloudAssistantSettingsResponse
+    from ._modify_command_request import ModifyCommandRequest
+    from ._modify_command_response_body import ModifyCommandResponseBody
+    from ._modify_command_response import ModifyCommandResponse
+    from ._modify_dedicated_host_attribute_request import ModifyDedicatedHostAttributeRequest
+    from ._modify_dedicated_host_attribute_response_body import ModifyDedicatedHostAttributeResponseBody
+    from ._modify_dedicated_host_attribute_response import ModifyDedicatedHostAttributeResponse
+    from ._modify_dedicated_host_auto_release_time_request import ModifyDedicatedHostAutoReleaseTimeRequest
+    from ._modify_dedicated_host_auto_release_time_response_body import ModifyDedicatedHostAutoReleaseTimeResponseBody
+    from ._modify_dedicated_host_auto_release_time_response import ModifyDedicatedHostAutoReleaseTimeResponse
+    from ._modify_dedicated_host_auto_renew_attribute_request import ModifyDedicatedHostAutoRenewAttributeRequest
+    from ._modify_dedicated_host_auto_renew_attribute_response_body import ModifyDedicatedHostAutoRenewAttributeResponseBody
+    from ._modify_dedicated_host_auto_renew_attribute_response import ModifyDedicatedHostAutoRenewAttributeResponse
+    from ._modify_dedicated_host_cluster_attribute_request import ModifyDedicatedHostClusterAttributeRequest
+    from ._modify_dedicated_host_cluster_attribute_response_body import ModifyDedicatedHostClusterAttributeResponseBody
+    from ._modify_dedicated_host_cluster_attribute_response import ModifyDedicatedHostClusterAttributeResponse
+    from ._modify_dedicated_hosts_charge_type_request import ModifyDedicatedHostsChargeTypeRequest
+    from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBody
+    from ._modify_dedicated_hosts_charge_type_response import ModifyDedicatedHostsChargeTypeResponse
+    from ._modify_deployment_set_attribute_request import ModifyDeploymentSetAttributeRequest
+    from ._modify_deployment_set_attribute_response_body import ModifyDeploymentSetAttributeResponseBody
+    from ._modify_deployment_set_attribute_response import ModifyDeploymentSetAttributeResponse
+    from ._modify_diagnostic_metric_set_request import ModifyDiagnosticMetricSetRequest
+    from ._modify_diagnostic_metric_set_response_body import ModifyDiagnosticMetricSetResponseBody
+    from ._modify_diagnostic_metric_set_response import ModifyDiagnosticMetricSetResponse
+    from ._modify_disk_attribute_request import ModifyDiskAttributeRequest
+    from ._modify_disk_attribute_response_body import ModifyDiskAttributeResponseBody
+    from ._modify_disk_attribute_response import ModifyDiskAttributeResponse
+    from ._modify_disk_charge_type_request import ModifyDiskChargeTypeRequest
+    from ._modify_disk_charge_type_response_body import ModifyDiskChargeTypeResponseBody
+    from ._modify_disk_charge_type_response import ModifyDiskChargeTypeResponse
+    from ._modify_disk_default_kmskey_id_request import ModifyDiskDefaultKMSKeyIdRequest
+    from ._modify_disk_default_kmskey_id_response_body import ModifyDiskDefaultKMSKeyIdResponseBody
+    from ._modify_disk_default_kmskey_id_response import ModifyDiskDefaultKMSKeyIdResponse
+    from ._modify_disk_deployment_request import ModifyDiskDeploymentRequest
+    from ._modify_disk_deployment_response_body import ModifyDiskDeploymentResponseBody
+    from ._modify_disk_deployment_response import ModifyDiskDeploymentResponse
+    from ._modify_disk_spec_request import ModifyDiskSpecRequest
+    from ._modify_disk_spec_response_body import ModifyDiskSpecResponseBody
+    from ._modify_disk_spec_response import ModifyDiskSpecResponse
+    from ._modify_eip_address_attribute_request import ModifyEipAddressAttributeRequest
+    from ._modify_eip_address_attribute_response_body import ModifyEipAddressAttributeResponseBody
+    from ._modify_eip_address_attribute_response import ModifyEipAddressAttributeResponse
+    from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequest
+    from ._modify_elasticity_assurance_response_body import ModifyElasticityAssuranceResponseBody
+    from ._modify_elasticity_assurance_response import ModifyElasticityAssuranceResponse
+    from ._modify_elasticity_assurance_auto_renew_attribute_request import ModifyElasticityAssuranceAutoRenewAttributeRequest
+    from ._modify_elasticity_assurance_auto_renew_attribute_response_body import ModifyElasticityAssuranceAutoRenewAttributeResponseBody
+    from ._modify_elasticity_assurance_auto_renew_attribute_response import ModifyElasticityAssuranceAutoRenewAttributeResponse
+    from ._modify_forward_entry_request import ModifyForwardEntryRequest
+    from ._modify_forward_entry_response_body import ModifyForwardEntryResponseBody
+    from ._modify_forward_entry_response import ModifyForwardEntryResponse
+    from ._modify_ha_vip_attribute_request import ModifyHaVipAttributeRequest
+    from ._modify_ha_vip_attribute_response_body import ModifyHaVipAttributeResponseBody
+    from ._modify_ha_vip_attribute_response import ModifyHaVipAttributeResponse
+    from ._modify_hpc_cluster_attribute_request import ModifyHpcClusterAttributeRequest
+    from ._modify_hpc_cluster_attribute_response_body import ModifyHpcClusterAttributeResponseBody
+    from ._modify_hpc_cluster_attribute_response import ModifyHpcClusterAttributeResponse
+    from ._modify_image_attribute_request import ModifyImageAttributeRequest
+    from ._modify_image_attribute_response_body import ModifyImageAttributeResponseBody
+    from ._modify_image_attribute_response import ModifyImageAttributeResponse
+    from ._modify_image_share_group_permission_request import ModifyImageShareGroupPermissionRequest
+    from ._modify_image_share_group_permission_response_body import ModifyImageShareGroupPermissionResponseBody
+    from ._modify_image_share_group_permission_response import ModifyImageShareGroupPermissionResponse
+    from ._modify_image_share_permission_request import ModifyImageSharePermissionRequest
+    from ._modify_image_share_permission_response_body import ModifyImageSharePermissionResponseBody
+    from ._modify_image_share_permission_response import ModifyImageSharePermissionResponse
+    from ._modify_instance_attachment_attributes_request import ModifyInstanceAttachmentAttributesRequest
+    from ._modify_instance_attachment_attributes_response_body import ModifyInstanceAttachmentAttributesResponseBody
+    from ._modify_instance_attachment_attributes_response import ModifyInstanceAttachmentAttributesResponse
+    from ._modify_instance_attribute_request import ModifyInstanceAttributeRequest
+    from ._modify_instance_attribute_response_body import ModifyInstanceAttributeResponseBody
+    from ._modify_instance_attribute_response import ModifyInstanceAttributeResponse
+    from ._modify_instance_auto_release_time_request import ModifyInstanceAutoReleaseTimeRequest
+    from ._modify_instance_auto_release_time_response_body import ModifyInstanceAutoReleaseTimeResponseBody
+    from ._modify_instance_auto_release_time_response import ModifyInstanceAutoReleaseTimeResponse
+    from ._modify_instance_auto_renew_attribute_request import ModifyInstanceAutoRenewAttributeRequest
+    from ._modify_instance_auto_renew_attribute_response_body import ModifyInstanceAutoRenewAttributeResponseBody
+    from ._modify_instance_auto_renew_attribute_response import ModifyInstanceAutoRenewAttributeResponse
+    from ._modify_instance_charge_type_request import ModifyInstanceChargeTypeRequest
+    from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBody
+    from ._modify_instance_charge_type_response import ModifyInstanceChargeTypeResponse
+    from ._modify_instance_clock_options_request import ModifyInstanceClockOptionsRequest
+    from ._modify_instance_clock_options_response_body import ModifyInstanceClockOptionsResponseBody
+    from ._modify_instance_clock_options_response import ModifyInstanceClockOptionsResponse
+    from ._modify_instance_deployment_request import ModifyInstanceDeploymentRequest
+    from ._modify_instance_deployment_response_body import ModifyInstanceDeploymentResponseBody
+    from ._modify_instance_deployment_response import ModifyInstanceDeploymentResponse
+    from ._modify_instance_maintenance_attributes_request import ModifyInstanceMaintenanceAttributesRequest
+    from ._modify_instance_maintenance_attributes_response_body import ModifyInstanceMaintenanceAttributesResponseBody
+    from ._modify_instance_maintenance_attributes_response import ModifyInstanceMaintenanceAttributesResponse
+    from ._modify_instance_metadata_options_request import ModifyInstanceMetadataOptionsRequest
+    from ._modify_instance_metadata_options_response_body import ModifyInstanceMetadataOptionsResponseBody
+    from ._modify_instance_metadata_options_response import ModifyInstanceMetadataOptionsResponse
+    from ._modify_instance_network_options_request import ModifyInstanceNetworkOptionsRequest
+    from ._modify_instance_network_options_response_body import ModifyInstanceNetworkOptionsResponseBody
+    from ._modify_instance_network_options_response import ModifyInstanceNetworkOptionsResponse
+    from ._modify_instance_network_spec_request import ModifyInstanceNetworkSpecRequest
+    from ._modify_instance_network_spec_response_body import ModifyInstanceNetworkSpecResponseBody
+    from ._modify_instance_network_spec_response import ModifyInstanceNetworkSpecResponse
+    from ._modify_instance_spec_request import ModifyInstanceSpecRequest
+    from ._modify_instance_spec_response_body import ModifyInstanceSpecResponseBody
+    from ._modify_instance_spec_response import ModifyInstanceSpecResponse
+    from ._modify_instance_vnc_passwd_request import ModifyInstanceVncPasswdRequest
+    from ._modify_instance_vnc_passwd_response_body import ModifyInstanceVncPasswdResponseBody
+    from ._modify_instance_vnc_passwd_response import ModifyInstanceVncPasswdResponse
+    from ._modify_instance_vpc_attribute_request import ModifyInstanceVpcAttributeRequest
+    from ._modify_instance_vpc_attribute_response_body import ModifyInstanceVpcAttributeResponseBody
+    from ._modify_instance_vpc_attribute_response import ModifyInstanceVpcAttributeResponse
+    from ._modify_invocation_attribute_request import ModifyInvocationAttributeRequest
+    from ._modify_invocation_attribute_shrink_request import ModifyInvocationAttributeShrinkRequest
+    from ._modify_invocation_attribute_response_body import ModifyInvocationAttributeResponseBody
+    from ._modify_invocation_attribute_response import ModifyInvocationAttributeResponse
+    from ._modify_launch_template_default_version_request import ModifyLaunchTemplateDefaultVersionRequest
+    from ._modify_launch_template_default_version_response_body import ModifyLaunchTemplateDefaultVersionResponseBody
+    from ._modify_launch_template_default_version_response import ModifyLaunchTemplateDefaultVersionResponse
+    from ._modify_managed_instance_request import ModifyManagedInstanceRequest
+    from ._modify_managed_instance_response_body import ModifyManagedInstanceResponseBody
+    from ._modify_managed_instance_response import ModifyManagedInstanceResponse
+    from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequest
+    from ._modify_network_interface_attribute_response_body import ModifyNetworkInterfaceAttributeResponseBody
+    from ._modify_network_interface_attribute_response import ModifyNetworkInterfaceAttributeResponse
+    from ._modify_physical_connection_attribute_request import ModifyPhysicalConnectionAttributeRequest
+    from ._modify_physical_connection_attribute_response_body import ModifyPhysicalConnectionAttributeResponseBody
+    from ._modify_physical_connection_attribute_response import ModifyPhysicalConnectionAttributeResponse
+    from ._modify_port_range_list_request import ModifyPortRangeListRequest
+    from ._modify_port_range_list_response_body import ModifyPortRangeListResponseBody
+    from ._modify_port_range_list_response import ModifyPortRangeListResponse
+    from ._modify_prefix_list_request import ModifyPrefixListRequest
+    from ._modify_prefix_list_response_body import ModifyPrefixListResponseBody
+    from ._modify_prefix_list_response import ModifyPrefixListResponse
+    from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequest
+    from ._modify_prepay_instance_spec_response_body import ModifyPrepayInstanceSpecResponseBody
+    from ._modify_prepay_instance_spec_response import ModifyPrepayInstanceSpecResponse
+    from ._modify_reserved_instance_attribute_request import ModifyReservedInstanceAttributeRequest
+    from ._modify_reserved_instance_attribute_response_body import ModifyReservedInstanceAttributeResponseBody
+    from ._modify_reserved_instance_attribute_response import ModifyReservedInstanceAttributeResponse
+    from ._modify_reserved_instance_auto_renew_attribute_request import ModifyReservedInstanceAutoRenewAttributeRequest
+    from ._modify_reserved_instance_auto_renew_attribute_response_body import ModifyReservedInstanceAutoRenewAttributeResponseBody
+    from ._modify_reserved_instance_auto_renew_attribute_response import ModifyReservedInstanceAutoRenewAttributeResponse
+    from ._modify_reserved_instances_request import ModifyReservedInstancesRequest
+    from ._modify_reserved_instances_response_body import ModifyReservedInstancesResponseBody
+    from ._modify_reserved_instances_response import ModifyReservedInstancesResponse
+    from ._modify_router_interface_attribute_request import ModifyRouterInterfaceAttributeRequest
+    from ._modify_router_interface_attribute_response_body import ModifyRouterInterfaceAttributeResponseBody
+    from ._modify_router_interface_attribute_response import ModifyRouterInterfaceAttributeResponse
+    from ._modify_router_interface_spec_request import ModifyRouterInterfaceSpecRequest
+    from ._modify_router_interface_spec_response_body import ModifyRouterInterfaceSpecResponseBody
+    from ._modify_router_interface_spec_response import ModifyRouterInterfaceSpecResponse
+    from ._modify_security_group_attribute_request import ModifySecurityGroupAttributeRequest
+    from ._modify_security_group_attribute_response_body import ModifySecurityGroupAttributeResponseBody
+    from ._modify_security_group_attribute_response import ModifySecurityGroupAttributeResponse
+    from ._modify_security_group_egress_rule_request import ModifySecurityGroupEgressRuleRequest
+    from ._modify_security_group_egress_rule_response_body import ModifySecurityGroupEgressRuleResponseBody
+    from ._modify_security_group_egress_rule_response import ModifySecurityGroupEgressRuleResponse
+    from ._modify_security_group_policy_request import ModifySecurityGroupPolicyRequest
+    from ._modify_security_group_policy_response_body import ModifySecurityGroupPolicyResponseBody
+    from ._modify_security_group_policy_response import ModifySecurityGroupPolicyResponse
+    from ._modify_security_group_rule_request import ModifySecurityGroupRuleRequest
+    from ._modify_security_group_rule_response_body import ModifySecurityGroupRuleResponseBody
+    from ._modify_security_group_rule_response import ModifySecurityGroupRuleResponse
+    from ._modify_snapshot_attribute_request import ModifySnapshotAttributeRequest
+    from ._modify_snapshot_attribute_response_body import ModifySnapshotAttributeResponseBody
+    from ._modify_snapshot_attribute_response import ModifySnapshotAttributeResponse
+    from ._modify_snapshot_category_request import ModifySnapshotCategoryRequest
+    from ._modify_snapshot_category_response_body import ModifySnapshotCategoryResponseBody
+    from ._modify_snapshot_category_response import ModifySnapshotCategoryResponse
+    from ._modify_snapshot_group_request import ModifySnapshotGroupRequest
+    from ._modify_snapshot_group_response_body import ModifySnapshotGroupResponseBody
+    from ._modify_snapshot_group_response import ModifySnapshotGroupResponse
+    from ._modify_storage_capacity_unit_attribute_request import ModifyStorageCapacityUnitAttributeRequest
+    from ._modify_storage_capacity_unit_attribute_response_body import ModifyStorageCapacityUnitAttributeResponseBody
+    from ._modify_storage_capacity_unit_attribute_response import ModifyStorageCapacityUnitAttributeResponse
+    from ._modify_storage_set_attribute_request import ModifyStorageSetAttributeRequest
+    from ._modify_storage_set_attribute_response_body import ModifyStorageSetAttributeResponseBody
+    from ._modify_storage_set_attribute_response import ModifyStorageSetAttributeResponse
+    from ._modify_user_business_behavior_request import ModifyUserBusinessBehaviorRequest
+    from ._modify_user_business_behavior_response_body import ModifyUserBusinessBehaviorResponseBody
+    from ._modify_user_business_behavior_response import ModifyUserBusinessBehaviorResponse
+    from ._modify_vrouter_attribute_request import ModifyVRouterAttributeRequest
+    from ._modify_vrouter_attribute_response_body import ModifyVRouterAttributeResponseBody
+    from ._modify_vrouter_attribute_response import ModifyVRouterAttributeResponse
+    from ._modify_vswitch_attribute_request import ModifyVSwitchAttributeRequest
+    from ._modify_vswitch_attribute_response_body import ModifyVSwitchAttributeResponseBody
+    from ._modify_vswitch_attribute_response import ModifyVSwitchAttributeResponse
+    from ._modify_virtual_border_router_attribute_request import ModifyVirtualBorderRouterAttributeRequest
+    from ._modify_virtual_border_router_attribute_response_body import ModifyVirtualBorderRouterAttributeResponseBody
+    from ._modify_virtual_border_router_attribute_response import ModifyVirtualBorderRouterAttributeResponse
+    from ._modify_vpc_attribute_request import ModifyVpcAttributeRequest
+    from ._modify_vpc_attribute_response_body import ModifyVpcAttributeResponseBody
+    from ._modify_vpc_attribute_response import ModifyVpcAttributeResponse
+    from ._open_snapshot_service_request import OpenSnapshotServiceRequest
+    from ._open_snapshot_service_response_body import OpenSnapshotServiceResponseBody
+    from ._open_snapshot_service_response import OpenSnapshotServiceResponse
+    from ._purchase_elasticity_assurance_request import PurchaseElasticityAssuranceRequest
+    from ._purchase_elasticity_assurance_response_body import PurchaseElasticityAssuranceResponseBody
+    from ._purchase_elasticity_assurance_response import PurchaseElasticityAssuranceResponse
+    from ._purchase_reserved_instances_offering_request import PurchaseReservedInstancesOfferingRequest
+    from ._purchase_reserved_instances_offering_response_body import PurchaseReservedInstancesOfferingResponseBody
+    from ._purchase_reserved_instances_offering_response import PurchaseReservedInstancesOfferingResponse
+    from ._purchase_storage_capacity_unit_request import PurchaseStorageCapacityUnitRequest
+    from ._purchase_storage_capacity_unit_response_body import PurchaseStorageCapacityUnitResponseBody
+    from ._purchase_storage_capacity_unit_response import PurchaseStorageCapacityUnitResponse
+    from ._re_activate_instances_request import ReActivateInstancesRequest
+    from ._re_activate_instances_response_body import ReActivateInstancesResponseBody
+    from ._re_activate_instances_response import ReActivateInstancesResponse
+    from ._re_init_disk_request import ReInitDiskRequest
+    from ._re_init_disk_response_body import ReInitDiskResponseBody
+    from ._re_init_disk_response import ReInitDiskResponse
+    from ._reboot_instance_request import RebootInstanceRequest
+    from ._reboot_instance_response_body import RebootInstanceResponseBody
+    from ._reboot_instance_response import RebootInstanceResponse
+    from ._reboot_instances_request import RebootInstancesRequest
+    from ._reboot_instances_response_body import RebootInstancesResponseBody
+    from ._reboot_instances_response import RebootInstancesResponse
+    from ._recover_virtual_border_router_request import RecoverVirtualBorderRouterRequest
+    from ._recover_virtual_border_router_response_body import RecoverVirtualBorderRouterResponseBody
+    from ._recover_virtual_border_router_response import RecoverVirtualBorderRouterResponse
+    from ._redeploy_dedicated_host_request import RedeployDedicatedHostRequest
+    from ._redeploy_dedicated_host_response_body import RedeployDedicatedHostResponseBody
+    from ._redeploy_dedicated_host_response import RedeployDedicatedHostResponse
+    from ._redeploy_instance_request import RedeployInstanceRequest
+    from ._redeploy_instance_response_body import RedeployInstanceResponseBody
+    from ._redeploy_instance_response import RedeployInstanceResponse
+    from ._release_capacity_reservation_request import ReleaseCapacityReservationRequest
+    from ._release_capacity_reservation_response_body import ReleaseCapacityReservationResponseBody
+    from ._release_capacity_reservation_response import ReleaseCapacityReservationResponse
+    from ._release_dedicated_host_request import ReleaseDedicatedHostRequest
+    from ._release_dedicated_host_response_body import ReleaseDedicatedHostResponseBody
+    from ._release_dedicated_host_response import ReleaseDedicatedHostResponse
+    from ._release_eip_address_request import ReleaseEipAddressRequest
+    from ._release_eip_address_response_body import ReleaseEipAddressResponseBody
+    from ._release_eip_address_response import ReleaseEipAddressResponse
+    from ._release_public_ip_address_request import ReleasePublicIpAddressRequest
+    from ._release_public_ip_address_response_body import ReleasePublicIpAddressResponseBody
+    from ._release_public_ip_address_response import ReleasePublicIpAddressResponse
+    from ._remove_bandwidth_package_ips_request import RemoveBandwidthPackageIpsRequest
+    from ._remove_bandwidth_package_ips_response_body import RemoveBandwidthPackageIpsResponseBody
+    from ._remove_bandwidth_package_ips_response import RemoveBandwidthPackageIpsResponse
+    from ._remove_tags_request import RemoveTagsRequest
+    from ._remove_tags_response_body import RemoveTagsResponseBody
+    from ._remove_tags_response import RemoveTagsResponse
+    from ._renew_dedicated_hosts_request import RenewDedicatedHostsRequest
+    from ._renew_dedicated_hosts_response_body import RenewDedicatedHostsResponseBody
+    from ._renew_dedicated_hosts_response import RenewDedicatedHostsResponse
+    from ._renew_elasticity_assurances_request import RenewElasticityAssurancesRequest
+    from ._renew_elasticity_assurances_response_body import RenewElasticityAssurancesResponseBody
+    from ._renew_elasticity_assurances_response import RenewElasticityAssurancesResponse
+    from ._renew_instance_request import RenewInstanceRequest
+    from ._renew_instance_response_body import RenewInstanceResponseBody
+    from ._renew_instance_response import RenewInstanceResponse
+    from ._renew_reserved_instances_request import RenewReservedInstancesRequest
+    from ._renew_reserved_instances_response_body import RenewReservedInstancesResponseBody
+    from ._renew_reserved_instances_response import RenewReservedInstancesResponse
+    from ._replace_system_disk_request import ReplaceSystemDiskRequest
+    from ._replace_system_disk_response_body import ReplaceSystemDiskResponseBody
+    from ._replace_system_disk_response import ReplaceSystemDiskResponse
+    from ._report_instances_status_request import ReportInstancesStatusRequest
+    from ._report_instances_status_response_body import ReportInstancesStatusResponseBody
+    from ._report_instances_status_response import ReportInstancesStatusResponse
+    from ._reset_disk_request import ResetDiskRequest
+    from ._reset_disk_response_body import ResetDiskResponseBody
+    from ._reset_disk_response import ResetDiskResponse
+    from ._reset_disk_default_kmskey_id_request import ResetDiskDefaultKMSKeyIdRequest
+    from ._reset_disk_default_kmskey_id_response_body import ResetDiskDefaultKMSKeyIdResponseBody
+    from ._reset_disk_default_kmskey_id_response import ResetDiskDefaultKMSKeyIdResponse
+    from ._reset_disks_request import ResetDisksRequest
+    from ._reset_disks_response_body import ResetDisksResponseBody
+    from ._reset_disks_response import ResetDisksResponse
+    from ._resize_disk_request import ResizeDiskRequest
+    from ._resize_disk_response_body import ResizeDiskResponseBody
+    from ._resize_disk_response import ResizeDiskResponse
+    from ._revoke_security_group_request import RevokeSecurityGroupRequest
+    from ._revoke_security_group_response_body import RevokeSecurityGroupResponseBody
+    from ._revoke_security_group_response import RevokeSecurityGroupResponse
+    from ._revoke_security_group_egress_request import RevokeSecurityGroupEgressRequest
+    from ._revoke_security_group_egress_response_body import RevokeSecurityGroupEgressResponseBody
+    from ._revoke_security_group_egress_response import RevokeSecurityGroupEgressResponse
+    from ._run_command_request import RunCommandRequest
+    from ._run_command_shrink_request import RunCommandShrinkRequest
+    from ._run_command_response_body import RunCommandResponseBody
+    from ._run_command_response import RunCommandResponse
+    from ._run_instances_request import RunInstancesRequest
+    from ._run_instances_response_body import RunInstancesResponseBody
+    from ._run_instances_response import RunInstancesResponse
+    from ._send_file_request import SendFileRequest
+    from ._send_file_response_body import SendFileResponseBody
+    from ._send_file_response import SendFileResponse
+    from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequest
+    from ._start_image_pipeline_execution_response_body import StartImagePipelineExecutionResponseBody
+    from ._start_image_pipeline_execution_response import StartImagePipelineExecutionResponse
+    from ._start_instance_request import StartInstanceRequest
+    from ._start_instance_response_body import StartInstanceResponseBody
+    from ._start_instance_response import StartInstanceResponse
+    from ._start_instances_request import StartInstancesRequest
+    from ._start_instances_response_body import StartInstancesResponseBody
+    from ._start_instances_response import StartInstancesResponse
+    from ._start_terminal_session_request import StartTerminalSessionRequest
+    from ._start_terminal_session_shrink_request import StartTerminalSessionShrinkRequest
+    from ._start_terminal_session_response_body import StartTerminalSessionResponseBody
+    from ._start_terminal_session_response import StartTerminalSessionResponse
+    from ._stop_instance_request import StopInstanceRequest
+    from ._stop_instance_response_body import StopInstanceResponseBody
+    from ._stop_instance_response import StopInstanceResponse
+    from ._stop_instances_request import StopInstancesRequest
+    from ._stop_instances_response_body import StopInstancesResponseBody
+    from ._stop_instances_response import StopInstancesResponse
+    from ._stop_invocation_request import StopInvocationRequest
+    from ._stop_invocation_response_body import StopInvocationResponseBody
+    from ._stop_invocation_response import StopInvocationResponse
+    from ._tag_resources_request import TagResourcesRequest
+    from ._tag_resources_response_body import TagResourcesResponseBody
+    from ._tag_resources_response import TagResourcesResponse
+    from ._terminate_physical_connection_request import TerminatePhysicalConnectionRequest
+    from ._terminate_physical_connection_response_body import TerminatePhysicalConnectionResponseBody
+    from ._terminate_physical_connection_response import TerminatePhysicalConnectionResponse
+    from ._terminate_virtual_border_router_request import TerminateVirtualBorderRouterRequest
+    from ._terminate_virtual_border_router_response_body import TerminateVirtualBorderRouterResponseBody
+    from ._terminate_virtual_border_router_response import TerminateVirtualBorderRouterResponse
+    from ._unassign_ipv_6addresses_request import UnassignIpv6AddressesRequest
+    from ._unassign_ipv_6addresses_response_body import UnassignIpv6AddressesResponseBody
+    from ._unassign_ipv_6addresses_response import UnassignIpv6AddressesResponse
+    from ._unassign_private_ip_addresses_request import UnassignPrivateIpAddressesRequest
+    from ._unassign_private_ip_addresses_response_body import UnassignPrivateIpAddressesResponseBody
+    from ._unassign_private_ip_addresses_response import UnassignPrivateIpAddressesResponse
+    from ._unassociate_eip_address_request import UnassociateEipAddressRequest
+    from ._unassociate_eip_address_response_body import UnassociateEipAddressResponseBody
+    from ._unassociate_eip_address_response import UnassociateEipAddressResponse
+    from ._unassociate_ha_vip_request import UnassociateHaVipRequest
+    from ._unassociate_ha_vip_response_body import UnassociateHaVipResponseBody
+    from ._unassociate_ha_vip_response import UnassociateHaVipResponse
+    from ._unlock_snapshot_request import UnlockSnapshotRequest
+    from ._unlock_snapshot_response_body import UnlockSnapshotResponseBody
+    from ._unlock_snapshot_response import UnlockSnapshotResponse
+    from ._untag_resources_request import UntagResourcesRequest
+    from ._untag_resources_response_body import UntagResourcesResponseBody
+    from ._untag_resources_response import UntagResourcesResponse
+    from ._add_tags_request import AddTagsRequestTag
+    from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequestNetworkAttributes
+    from ._allocate_dedicated_hosts_request import AllocateDedicatedHostsRequestTag
+    from ._allocate_dedicated_hosts_response_body import AllocateDedicatedHostsResponseBodyDedicatedHostIdSets
+    from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBodyIpv6PrefixSets
+    from ._assign_ipv_6addresses_response_body import AssignIpv6AddressesResponseBodyIpv6Sets
+    from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet
+    from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet
+    from ._assign_private_ip_addresses_response_body import AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet
+    from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult
+    from ._attach_instance_ram_role_response_body import AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults
+    from ._attach_key_pair_response_body import AttachKeyPairResponseBodyResultsResult
+    from ._attach_key_pair_response_body import AttachKeyPairResponseBodyResults
+    from ._authorize_security_group_request import AuthorizeSecurityGroupRequestPermissions
+    from ._authorize_security_group_egress_request import AuthorizeSecurityGroupEgressRequestPermissions
+    from ._cancel_image_pipeline_execution_request import CancelImagePipelineExecutionRequestTemplateTag
+    from ._copy_image_request import CopyImageRequestTag
+    from ._copy_snapshot_request import CopySnapshotRequestArn
+    from ._copy_snapshot_request import CopySnapshotRequestTag
+    from ._create_activation_request import CreateActivationRequestTag
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationArn
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationTag
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchConfiguration
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestDataDiskConfig
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestLaunchTemplateConfig
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestPrePaidOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestResourcePoolOptions
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestSystemDiskConfig
+    from ._create_auto_provisioning_group_request import CreateAutoProvisioningGroupRequestTag
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestDataDiskConfig
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestPrePaidOptions
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig
+    from ._create_auto_provisioning_group_shrink_request import CreateAutoProvisioningGroupShrinkRequestTag
+    from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds
+    from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult
+    from ._create_auto_provisioning_group_response_body import CreateAutoProvisioningGroupResponseBodyLaunchResults
+    from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn
+    from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration
+    from ._create_auto_snapshot_policy_request import CreateAutoSnapshotPolicyRequestTag
+    from ._create_capacity_reservation_request import CreateCapacityReservationRequestPrivatePoolOptions
+    from ._create_capacity_reservation_request import CreateCapacityReservationRequestTag
+    from ._create_command_request import CreateCommandRequestTag
+    from ._create_dedicated_host_cluster_request import CreateDedicatedHostClusterRequestTag
+    from ._create_disk_request import CreateDiskRequestArn
+    from ._create_disk_request import CreateDiskRequestTag
+    from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestPrivatePoolOptions
+    from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestRecurrenceRules
+    from ._create_elasticity_assurance_request import CreateElasticityAssuranceRequestTag
+    from ._create_image_request import CreateImageRequestDiskDeviceMapping
+    from ._create_image_request import CreateImageRequestFeatures
+    from ._create_image_request import CreateImageRequestTag
+    from ._create_image_component_request import CreateImageComponentRequestTag
+    from ._create_image_pipeline_request import CreateImagePipelineRequestAdvancedOptions
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptionsImageFeatures
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptionsImageTags
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImageOptions
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsFeatures
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptionsImportImageTags
+    from ._create_image_pipeline_request import CreateImagePipelineRequestImportImageOptions
+    from ._create_image_pipeline_request import CreateImagePipelineRequestTag
+    from ._create_instance_request import CreateInstanceRequestHibernationOptions
+    from ._create_instance_request import CreateInstanceRequestPrivatePoolOptions
+    from ._create_instance_request import CreateInstanceRequestSystemDisk
+    from ._create_instance_request import CreateInstanceRequestArn
+    from ._create_instance_request import CreateInstanceRequestDataDisk
+    from ._create_instance_request import CreateInstanceRequestTag
+    from ._create_key_pair_request import CreateKeyPairRequestTag
+    from ._create_launch_template_request import CreateLaunchTemplateRequestSystemDisk
+    from ._create_launch_template_request import CreateLaunchTemplateRequestDataDisk
+    from ._create_launch_template_request import CreateLaunchTemplateRequestImageOptions
+    from ._create_launch_template_request import CreateLaunchTemplateRequestNetworkInterface
+    from ._create_launch_template_request import CreateLaunchTemplateRequestSecurityOptions
+    from ._create_launch_template_request import CreateLaunchTemplateRequestTag
+    from ._create_launch_template_request import CreateLaunchTemplateRequestTemplateTag
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestSystemDisk
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestDataDisk
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestImageOptions
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestNetworkInterface
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestSecurityOptions
+    from ._create_launch_template_version_request import CreateLaunchTemplateVersionRequestTag
+    from ._create_nat_gateway_request import CreateNatGatewayRequestBandwidthPackage
+    from ._create_nat_gateway_response_body import CreateNatGatewayResponseBodyBandwidthPackageIds
+    from ._create_nat_gateway_response_body import CreateNatGatewayResponseBodyForwardTableIds
+    from ._create_network_interface_request import CreateNetworkInterfaceRequestConnectionTrackingConfiguration
+    from ._create_network_interface_request import CreateNetworkInterfaceRequestEnhancedNetwork
+    from ._create_network_interface_request import CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig
+    from ._create_network_interface_request import CreateNetworkInterfaceRequestTag
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv4PrefixSets
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6PrefixSets
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyIpv6Sets
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyPrivateIpSets
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodySecurityGroupIds
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyTagsTag
+    from ._create_network_interface_response_body import CreateNetworkInterfaceResponseBodyTags
+    from ._create_network_interface_permission_response_body import CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission
+    from ._create_port_range_list_request import CreatePortRangeListRequestEntry
+    from ._create_port_range_list_request import CreatePortRangeListRequestTag
+    from ._create_prefix_list_request import CreatePrefixListRequestEntry
+    from ._create_prefix_list_request import CreatePrefixListRequestTag
+    from ._create_route_entry_request import CreateRouteEntryRequestNextHopList
+    from ._create_security_group_request import CreateSecurityGroupRequestTag
+    from ._create_simulated_system_events_response_body import CreateSimulatedSystemEventsResponseBodyEventIdSet
+    from ._create_snapshot_request import CreateSnapshotRequestTag
+    from ._create_snapshot_group_request import CreateSnapshotGroupRequestTag
+    from ._create_storage_set_request import CreateStorageSetRequestTag
+    from ._delete_activation_response_body import DeleteActivationResponseBodyActivation
+    from ._delete_launch_template_response_body import DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers
+    from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion
+    from ._delete_launch_template_version_response_body import DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions
+    from ._delete_route_entry_request import DeleteRouteEntryRequestNextHopList
+    from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
+    from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet
+    from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress
+    from ._delete_snapshot_group_response_body import DeleteSnapshotGroupResponseBodyOperationProgressSet
+    from ._deregister_managed_instance_response_body import DeregisterManagedInstanceResponseBodyInstance
+    from ._describe_access_points_request import DescribeAccessPointsRequestFilter
+    from ._describe_access_points_response_body import DescribeAccessPointsResponseBodyAccessPointSetAccessPointType
+    from ._describe_access_points_response_body import DescribeAccessPointsResponseBodyAccessPointSet
+    from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem
+    from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues
+    from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem
+    from ._describe_account_attributes_response_body import DescribeAccountAttributesResponseBodyAccountAttributeItems
+    from ._describe_activations_request import DescribeActivationsRequestTag
+    from ._describe_activations_response_body import DescribeActivationsResponseBodyActivationListTags
+    from ._describe_activations_response_body import DescribeActivationsResponseBodyActivationList
+    from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail
+    from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails
+    from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory
+    from ._describe_auto_provisioning_group_history_response_body import DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories
+    from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance
+    from ._describe_auto_provisioning_group_instances_response_body import DescribeAutoProvisioningGroupInstancesResponseBodyInstances
+    from ._describe_auto_provisioning_groups_request import DescribeAutoProvisioningGroupsRequestTag
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup
+    from ._describe_auto_provisioning_groups_response_body import DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups
+    from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation
+    from ._describe_auto_snapshot_policy_associations_response_body import DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations
+    from ._describe_auto_snapshot_policy_ex_request import DescribeAutoSnapshotPolicyExRequestTag
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy
+    from ._describe_auto_snapshot_policy_ex_response_body import DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone
+    from ._describe_available_resource_response_body import DescribeAvailableResourceResponseBodyAvailableZones
+    from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth
+    from ._describe_bandwidth_limitation_response_body import DescribeBandwidthLimitationResponseBodyBandwidths
+    from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse
+    from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses
+    from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage
+    from ._describe_bandwidth_packages_response_body import DescribeBandwidthPackagesResponseBodyBandwidthPackages
+    from ._describe_capacity_reservation_instances_request import DescribeCapacityReservationInstancesRequestPrivatePoolOptions
+    from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet
+    from ._describe_capacity_reservation_instances_response_body import DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem
+    from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequestPrivatePoolOptions
+    from ._describe_capacity_reservations_request import DescribeCapacityReservationsRequestTag
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem
+    from ._describe_capacity_reservations_response_body import DescribeCapacityReservationsResponseBodyCapacityReservationSet
+    from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBodyLinksLink
+    from ._describe_classic_link_instances_response_body import DescribeClassicLinkInstancesResponseBodyLinks
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySessionManagerConfig
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig
+    from ._describe_cloud_assistant_settings_response_body import DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs
+    from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus
+    from ._describe_cloud_assistant_status_response_body import DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet
+    from ._describe_clusters_response_body import DescribeClustersResponseBodyClustersCluster
+    from ._describe_clusters_response_body import DescribeClustersResponseBodyClusters
+    from ._describe_commands_request import DescribeCommandsRequestTag
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterDefinitions
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandParameterNames
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandTagsTag
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommandTags
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommandsCommand
+    from ._describe_commands_response_body import DescribeCommandsResponseBodyCommands
+    from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute
+    from ._describe_dedicated_host_auto_renew_response_body import DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes
+    from ._describe_dedicated_host_clusters_request import DescribeDedicatedHostClustersRequestTag
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster
+    from ._describe_dedicated_host_clusters_response_body import DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters
+    from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies
+    from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList
+    from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType
+    from ._describe_dedicated_host_types_response_body import DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes
+    from ._describe_dedicated_hosts_request import DescribeDedicatedHostsRequestTag
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost
+    from ._describe_dedicated_hosts_response_body import DescribeDedicatedHostsResponseBodyDedicatedHosts
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet
+    from ._describe_deployment_sets_response_body import DescribeDeploymentSetsResponseBodyDeploymentSets
+    from ._describe_diagnostic_metric_sets_response_body import DescribeDiagnosticMetricSetsResponseBodyMetricSets
+    from ._describe_diagnostic_metrics_response_body import DescribeDiagnosticMetricsResponseBodyMetrics
+    from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue
+    from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues
+    from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult
+    from ._describe_diagnostic_report_attributes_response_body import DescribeDiagnosticReportAttributesResponseBodyMetricResults
+    from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue
+    from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReportIssues
+    from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReportsReport
+    from ._describe_diagnostic_reports_response_body import DescribeDiagnosticReportsResponseBodyReports
+    from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData
+    from ._describe_disk_monitor_data_response_body import DescribeDiskMonitorDataResponseBodyMonitorData
+    from ._describe_disks_request import DescribeDisksRequestFilter
+    from ._describe_disks_request import DescribeDisksRequestTag
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskAttachmentsAttachment
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskAttachments
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskMountInstances
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskOperationLocks
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskPlacement
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskTagsTag
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDiskTags
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisksDisk
+    from ._describe_disks_response_body import DescribeDisksResponseBodyDisks
+    from ._describe_disks_full_status_request import DescribeDisksFullStatusRequestEventTime
+    from ._describe_disks_full_status_request import DescribeDisksFullStatusRequestTag
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType
+    from ._describe_disks_full_status_response_body import DescribeDisksFullStatusResponseBodyDiskFullStatusSet
+    from ._describe_eip_addresses_request import DescribeEipAddressesRequestFilter
+    from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason
+    from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks
+    from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddressesEipAddress
+    from ._describe_eip_addresses_response_body import DescribeEipAddressesResponseBodyEipAddresses
+    from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData
+    from ._describe_eip_monitor_data_response_body import DescribeEipMonitorDataResponseBodyEipMonitorDatas
+    from ._describe_elasticity_assurance_auto_renew_attribute_request import DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions
+    from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute
+    from ._describe_elasticity_assurance_auto_renew_attribute_response_body import DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes
+    from ._describe_elasticity_assurance_instances_request import DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions
+    from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet
+    from ._describe_elasticity_assurance_instances_response_body import DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem
+    from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequestPrivatePoolOptions
+    from ._describe_elasticity_assurances_request import DescribeElasticityAssurancesRequestTag
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem
+    from ._describe_elasticity_assurances_response_body import DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet
+    from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData
+    from ._describe_eni_monitor_data_response_body import DescribeEniMonitorDataResponseBodyMonitorData
+    from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry
+    from ._describe_forward_table_entries_response_body import DescribeForwardTableEntriesResponseBodyForwardTableEntries
+    from ._describe_ha_vips_request import DescribeHaVipsRequestFilter
+    from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses
+    from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances
+    from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVipsHaVip
+    from ._describe_ha_vips_response_body import DescribeHaVipsResponseBodyHaVips
+    from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBodyHpcClustersHpcCluster
+    from ._describe_hpc_clusters_response_body import DescribeHpcClustersResponseBodyHpcClusters
+    from ._describe_image_components_request import DescribeImageComponentsRequestTag
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponentImageComponentSet
+    from ._describe_image_components_response_body import DescribeImageComponentsResponseBodyImageComponent
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageTagsTag
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImageTags
+    from ._describe_image_from_family_response_body import DescribeImageFromFamilyResponseBodyImage
+    from ._describe_image_pipeline_executions_request import DescribeImagePipelineExecutionsRequestTag
+    from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag
+    from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags
+    from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet
+    from ._describe_image_pipeline_executions_response_body import DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution
+    from ._describe_image_pipelines_request import DescribeImagePipelinesRequestTag
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet
+    from ._describe_image_pipelines_response_body import DescribeImagePipelinesResponseBodyImagePipeline
+    from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyAccountsAccount
+    from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyAccounts
+    from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyShareGroupsShareGroup
+    from ._describe_image_share_permission_response_body import DescribeImageSharePermissionResponseBodyShareGroups
+    from ._describe_image_support_instance_types_request import DescribeImageSupportInstanceTypesRequestFilter
+    from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType
+    from ._describe_image_support_instance_types_response_body import DescribeImageSupportInstanceTypesResponseBodyInstanceTypes
+    from ._describe_images_request import DescribeImagesRequestFilter
+    from ._describe_images_request import DescribeImagesRequestTag
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptionsItems
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDetectionOptions
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageDiskDeviceMappings
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageFeatures
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageTagsTag
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImageTags
+    from ._describe_images_response_body import DescribeImagesResponseBodyImagesImage
+    from ._describe_images_response_body import DescribeImagesResponseBodyImages
+    from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance
+    from ._describe_instance_attachment_attributes_response_body import DescribeInstanceAttachmentAttributesResponseBodyInstances
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyDedicatedHostAttribute
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyEipAddress
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyInnerIpAddress
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyNetworkOptions
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyOperationLocksLockReason
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyOperationLocks
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyPublicIpAddress
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodySecurityGroupIds
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress
+    from ._describe_instance_attribute_response_body import DescribeInstanceAttributeResponseBodyVpcAttributes
+    from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute
+    from ._describe_instance_auto_renew_attribute_response_body import DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes
+    from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestEventPublishTime
+    from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestNotBefore
+    from ._describe_instance_history_events_request import DescribeInstanceHistoryEventsRequestTag
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType
+    from ._describe_instance_history_events_response_body import DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute
+    from ._describe_instance_maintenance_attributes_response_body import DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes
+    from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequestSystemDisk
+    from ._describe_instance_modification_price_request import DescribeInstanceModificationPriceRequestDataDisk
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoPrice
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfoRules
+    from ._describe_instance_modification_price_response_body import DescribeInstanceModificationPriceResponseBodyPriceInfo
+    from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData
+    from ._describe_instance_monitor_data_response_body import DescribeInstanceMonitorDataResponseBodyMonitorData
+    from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet
+    from ._describe_instance_ram_role_response_body import DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets
+    from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus
+    from ._describe_instance_status_response_body import DescribeInstanceStatusResponseBodyInstanceStatuses
+    from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBodyTopologysTopology
+    from ._describe_instance_topology_response_body import DescribeInstanceTopologyResponseBodyTopologys
+    from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily
+    from ._describe_instance_type_families_response_body import DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypesInstanceType
+    from ._describe_instance_types_response_body import DescribeInstanceTypesResponseBodyInstanceTypes
+    from ._describe_instances_request import DescribeInstancesRequestFilter
+    from ._describe_instances_request import DescribeInstancesRequestTag
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceClockOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceCpuOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceEipAddress
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceHibernationOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceImageOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceMetadataOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceOperationLocks
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstancePublicIpAddress
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceTagsTag
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceTags
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstanceVpcAttributes
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstancesInstance
+    from ._describe_instances_response_body import DescribeInstancesResponseBodyInstances
+    from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequestEventPublishTime
+    from ._describe_instances_full_status_request import DescribeInstancesFullStatusRequestNotBefore
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType
+    from ._describe_instances_full_status_response_body import DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet
+    from ._describe_invocation_results_request import DescribeInvocationResultsRequestTag
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocationInvocationResults
+    from ._describe_invocation_results_response_body import DescribeInvocationResultsResponseBodyInvocation
+    from ._describe_invocations_request import DescribeInvocationsRequestTag
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationTagsTag
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocationTags
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocationsInvocation
+    from ._describe_invocations_response_body import DescribeInvocationsResponseBodyInvocations
+    from ._describe_key_pairs_request import DescribeKeyPairsRequestTag
+    from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag
+    from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPairTags
+    from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairsKeyPair
+    from ._describe_key_pairs_response_body import DescribeKeyPairsResponseBodyKeyPairs
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet
+    from ._describe_launch_template_versions_response_body import DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets
+    from ._describe_launch_templates_request import DescribeLaunchTemplatesRequestTemplateTag
+    from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag
+    from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags
+    from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet
+    from ._describe_launch_templates_response_body import DescribeLaunchTemplatesResponseBodyLaunchTemplateSets
+    from ._describe_locked_snapshots_response_body import DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo
+    from ._describe_managed_instances_request import DescribeManagedInstancesRequestTag
+    from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBodyInstancesTags
+    from ._describe_managed_instances_response_body import DescribeManagedInstancesResponseBodyInstances
+    from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds
+    from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds
+    from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGatewaysNatGateway
+    from ._describe_nat_gateways_response_body import DescribeNatGatewaysResponseBodyNatGateways
+    from ._describe_network_interface_attribute_request import DescribeNetworkInterfaceAttributeRequestTag
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyAttachment
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyQoSConfig
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyTagsTag
+    from ._describe_network_interface_attribute_response_body import DescribeNetworkInterfaceAttributeResponseBodyTags
+    from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission
+    from ._describe_network_interface_permissions_response_body import DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions
+    from ._describe_network_interfaces_request import DescribeNetworkInterfacesRequestTag
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet
+    from ._describe_network_interfaces_response_body import DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets
+    from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData
+    from ._describe_new_project_eip_monitor_data_response_body import DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas
+    from ._describe_physical_connections_request import DescribePhysicalConnectionsRequestFilter
+    from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType
+    from ._describe_physical_connections_response_body import DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet
+    from ._describe_port_range_list_associations_response_body import DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations
+    from ._describe_port_range_list_entries_response_body import DescribePortRangeListEntriesResponseBodyEntries
+    from ._describe_port_range_lists_request import DescribePortRangeListsRequestTag
+    from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBodyPortRangeListsTags
+    from ._describe_port_range_lists_response_body import DescribePortRangeListsResponseBodyPortRangeLists
+    from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation
+    from ._describe_prefix_list_associations_response_body import DescribePrefixListAssociationsResponseBodyPrefixListAssociations
+    from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBodyEntriesEntry
+    from ._describe_prefix_list_attributes_response_body import DescribePrefixListAttributesResponseBodyEntries
+    from ._describe_prefix_lists_request import DescribePrefixListsRequestTag
+    from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag
+    from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixListTags
+    from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixListsPrefixList
+    from ._describe_prefix_lists_response_body import DescribePrefixListsResponseBodyPrefixLists
+    from ._describe_price_request import DescribePriceRequestDataDisk
+    from ._describe_price_request import DescribePriceRequestSchedulerOptions
+    from ._describe_price_request import DescribePriceRequestSystemDisk
+    from ._describe_price_request import DescribePriceRequestRecurrenceRules
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPriceDetailInfos
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoPrice
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRelatedPrice
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRulesRule
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfoRules
+    from ._describe_price_response_body import DescribePriceResponseBodyPriceInfo
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType
+    from ._describe_recommend_instance_type_response_body import DescribeRecommendInstanceTypeResponseBodyData
+    from ._describe_regions_response_body import DescribeRegionsResponseBodyRegionsRegion
+    from ._describe_regions_response_body import DescribeRegionsResponseBodyRegions
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoPrice
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoRulesRule
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfoRules
+    from ._describe_renewal_price_response_body import DescribeRenewalPriceResponseBodyPriceInfo
+    from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute
+    from ._describe_reserved_instance_auto_renew_attribute_response_body import DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes
+    from ._describe_reserved_instances_request import DescribeReservedInstancesRequestTag
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance
+    from ._describe_reserved_instances_response_body import DescribeReservedInstancesResponseBodyReservedInstances
+    from ._describe_resource_by_tags_request import DescribeResourceByTagsRequestTag
+    from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBodyResourcesResource
+    from ._describe_resource_by_tags_response_body import DescribeResourceByTagsResponseBodyResources
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone
+    from ._describe_resources_modification_response_body import DescribeResourcesModificationResponseBodyAvailableZones
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTablesRouteTable
+    from ._describe_route_tables_response_body import DescribeRouteTablesResponseBodyRouteTables
+    from ._describe_router_interfaces_request import DescribeRouterInterfacesRequestFilter
+    from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType
+    from ._describe_router_interfaces_response_body import DescribeRouterInterfacesResponseBodyRouterInterfaceSet
+    from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfoPrice
+    from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfoRules
+    from ._describe_savings_plan_price_response_body import DescribeSavingsPlanPriceResponseBodyPriceInfo
+    from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodyPermissionsPermission
+    from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodyPermissions
+    from ._describe_security_group_attribute_response_body import DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds
+    from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup
+    from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups
+    from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference
+    from ._describe_security_group_references_response_body import DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences
+    from ._describe_security_groups_request import DescribeSecurityGroupsRequestTag
+    from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag
+    from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags
+    from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup
+    from ._describe_security_groups_response_body import DescribeSecurityGroupsResponseBodySecurityGroups
+    from ._describe_send_file_results_request import DescribeSendFileResultsRequestTag
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocationTags
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocationsInvocation
+    from ._describe_send_file_results_response_body import DescribeSendFileResultsResponseBodyInvocations
+    from ._describe_snapshot_groups_request import DescribeSnapshotGroupsRequestTag
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup
+    from ._describe_snapshot_groups_response_body import DescribeSnapshotGroupsResponseBodySnapshotGroups
+    from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink
+    from ._describe_snapshot_links_response_body import DescribeSnapshotLinksResponseBodySnapshotLinks
+    from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint
+    from ._describe_snapshot_monitor_data_response_body import DescribeSnapshotMonitorDataResponseBodyMonitorData
+    from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage
+    from ._describe_snapshot_package_response_body import DescribeSnapshotPackageResponseBodySnapshotPackages
+    from ._describe_snapshots_request import DescribeSnapshotsRequestFilter
+    from ._describe_snapshots_request import DescribeSnapshotsRequestTag
+    from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag
+    from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshotTags
+    from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshotsSnapshot
+    from ._describe_snapshots_response_body import DescribeSnapshotsResponseBodySnapshots
+    from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource
+    from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources
+    from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone
+    from ._describe_spot_advice_response_body import DescribeSpotAdviceResponseBodyAvailableSpotZones
+    from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType
+    from ._describe_spot_price_history_response_body import DescribeSpotPriceHistoryResponseBodySpotPrices
+    from ._describe_storage_capacity_units_request import DescribeStorageCapacityUnitsRequestTag
+    from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag
+    from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags
+    from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit
+    from ._describe_storage_capacity_units_response_body import DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits
+    from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBodyDisksDisk
+    from ._describe_storage_set_details_response_body import DescribeStorageSetDetailsResponseBodyDisks
+    from ._describe_storage_sets_request import DescribeStorageSetsRequestTag
+    from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag
+    from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSetTags
+    from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSetsStorageSet
+    from ._describe_storage_sets_response_body import DescribeStorageSetsResponseBodyStorageSets
+    from ._describe_tags_request import DescribeTagsRequestTag
+    from ._describe_tags_response_body import DescribeTagsResponseBodyTagsTagResourceTypeCount
+    from ._describe_tags_response_body import DescribeTagsResponseBodyTagsTag
+    from ._describe_tags_response_body import DescribeTagsResponseBodyTags
+    from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
+    from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet
+    from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress
+    from ._describe_task_attribute_response_body import DescribeTaskAttributeResponseBodyOperationProgressSet
+    from ._describe_tasks_response_body import DescribeTasksResponseBodyTaskSetTask
+    from ._describe_tasks_response_body import DescribeTasksResponseBodyTaskSet
+    from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection
+    from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSessionConnections
+    from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessionsSession
+    from ._describe_terminal_sessions_response_body import DescribeTerminalSessionsResponseBodySessions
+    from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds
+    from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRoutersVRouter
+    from ._describe_vrouters_response_body import DescribeVRoutersResponseBodyVRouters
+    from ._describe_vswitches_response_body import DescribeVSwitchesResponseBodyVSwitchesVSwitch
+    from ._describe_vswitches_response_body import DescribeVSwitchesResponseBodyVSwitches
+    from ._describe_virtual_border_routers_request import DescribeVirtualBorderRoutersRequestFilter
+    from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType
+    from ._describe_virtual_border_routers_response_body import DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet
+    from ._describe_virtual_border_routers_for_physical_connection_request import DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter
+    from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType
+    from ._describe_virtual_border_routers_for_physical_connection_response_body import DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet
+    from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpcUserCidrs
+    from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpcVSwitchIds
+    from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcsVpc
+    from ._describe_vpcs_response_body import DescribeVpcsResponseBodyVpcs
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableDiskCategories
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourceCreation
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableResources
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZonesZone
+    from ._describe_zones_response_body import DescribeZonesResponseBodyZones
+    from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet
+    from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets
+    from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult
+    from ._detach_instance_ram_role_response_body import DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults
+    from ._detach_key_pair_response_body import DetachKeyPairResponseBodyResultsResult
+    from ._detach_key_pair_response_body import DetachKeyPairResponseBodyResults
+    from ._disable_activation_response_body import DisableActivationResponseBodyActivation
+    from ._enable_network_interface_qo_srequest import EnableNetworkInterfaceQoSRequestQoS
+    from ._import_image_request import ImportImageRequestDiskDeviceMapping
+    from ._import_image_request import ImportImageRequestFeatures
+    from ._import_image_request import ImportImageRequestTag
+    from ._import_key_pair_request import ImportKeyPairRequestTag
+    from ._invoke_command_request import InvokeCommandRequestResourceTag
+    from ._invoke_command_request import InvokeCommandRequestTag
+    from ._invoke_command_shrink_request import InvokeCommandShrinkRequestResourceTag
+    from ._invoke_command_shrink_request import InvokeCommandShrinkRequestTag
+    from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus
+    from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet
+    from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus
+    from ._list_plugin_status_response_body import ListPluginStatusResponseBodyInstancePluginStatusSet
+    from ._list_tag_resources_request import ListTagResourcesRequestTag
+    from ._list_tag_resources_request import ListTagResourcesRequestTagFilter
+    from ._list_tag_resources_response_body import ListTagResourcesResponseBodyTagResourcesTagResource
+    from ._list_tag_resources_response_body import ListTagResourcesResponseBodyTagResources
+    from ._lock_snapshot_response_body import LockSnapshotResponseBodyLockedSnapshotInfo
+    from ._modify_auto_provisioning_group_request import ModifyAutoProvisioningGroupRequestLaunchTemplateConfig
+    from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn
+    from ._modify_auto_snapshot_policy_ex_request import ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration
+    from ._modify_capacity_reservation_request import ModifyCapacityReservationRequestPrivatePoolOptions
+    from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestAgentUpgradeConfig
+    from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestOssDeliveryConfig
+    from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestSessionManagerConfig
+    from ._modify_cloud_assistant_settings_request import ModifyCloudAssistantSettingsRequestSlsDeliveryConfig
+    from ._modify_dedicated_host_attribute_request import ModifyDedicatedHostAttributeRequestNetworkAttributes
+    from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance
+    from ._modify_dedicated_hosts_charge_type_response_body import ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances
+    from ._modify_disk_spec_request import ModifyDiskSpecRequestPerformanceControlOptions
+    from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequestPrivatePoolOptions
+    from ._modify_elasticity_assurance_request import ModifyElasticityAssuranceRequestRecurrenceRules
+    from ._modify_elasticity_assurance_auto_renew_attribute_request import ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions
+    from ._modify_image_attribute_request import ModifyImageAttributeRequestFeatures
+    from ._modify_instance_attachment_attributes_request import ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions
+    from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestCpuOptions
+    from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestPrivateDnsNameOptions
+    from ._modify_instance_attribute_request import ModifyInstanceAttributeRequestRemoteConnectionOptions
+    from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance
+    from ._modify_instance_charge_type_response_body import ModifyInstanceChargeTypeResponseBodyFeeOfInstances
+    from ._modify_instance_maintenance_attributes_request import ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow
+    from ._modify_instance_spec_request import ModifyInstanceSpecRequestSystemDisk
+    from ._modify_instance_spec_request import ModifyInstanceSpecRequestTemporary
+    from ._modify_instance_spec_request import ModifyInstanceSpecRequestDisk
+    from ._modify_managed_instance_response_body import ModifyManagedInstanceResponseBodyInstance
+    from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration
+    from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestEnhancedNetwork
+    from ._modify_network_interface_attribute_request import ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig
+    from ._modify_port_range_list_request import ModifyPortRangeListRequestAddEntry
+    from ._modify_port_range_list_request import ModifyPortRangeListRequestRemoveEntry
+    from ._modify_prefix_list_request import ModifyPrefixListRequestAddEntry
+    from ._modify_prefix_list_request import ModifyPrefixListRequestRemoveEntry
+    from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequestSystemDisk
+    from ._modify_prepay_instance_spec_request import ModifyPrepayInstanceSpecRequestDisk
+    from ._modify_reserved_instances_request import ModifyReservedInstancesRequestConfiguration
+    from ._modify_reserved_instances_response_body import ModifyReservedInstancesResponseBodyReservedInstanceIdSets
+    from ._purchase_elasticity_assurance_request import PurchaseElasticityAssuranceRequestPrivatePoolOptions
+    from ._purchase_reserved_instances_offering_request import PurchaseReservedInstancesOfferingRequestTag
+    from ._purchase_reserved_instances_offering_response_body import PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets
+    from ._purchase_storage_capacity_unit_request import PurchaseStorageCapacityUnitRequestTag
+    from ._purchase_storage_capacity_unit_response_body import PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds
+    from ._reboot_instances_response_body import RebootInstancesResponseBodyInstanceResponsesInstanceResponse
+    from ._reboot_instances_response_body import RebootInstancesResponseBodyInstanceResponses
+    from ._release_capacity_reservation_request import ReleaseCapacityReservationRequestPrivatePoolOptions
+    from ._remove_tags_request import RemoveTagsRequestTag
+    from ._renew_elasticity_assurances_request import RenewElasticityAssurancesRequestPrivatePoolOptions
+    from ._renew_elasticity_assurances_response_body import RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet
+    from ._renew_reserved_instances_response_body import RenewReservedInstancesResponseBodyReservedInstanceIdSets
+    from ._replace_system_disk_request import ReplaceSystemDiskRequestSystemDisk
+    from ._replace_system_disk_request import ReplaceSystemDiskRequestArn
+    from ._reset_disks_request import ResetDisksRequestDisk
+    from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem
+    from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet
+    from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSetOperationProgress
+    from ._reset_disks_response_body import ResetDisksResponseBodyOperationProgressSet
+    from ._revoke_security_group_request import RevokeSecurityGroupRequestPermissions
+    from ._revoke_security_group_egress_request import RevokeSecurityGroupEgressRequestPermissions
+    from ._run_command_request import RunCommandRequestResourceTag
+    from ._run_command_request import RunCommandRequestTag
+    from ._run_command_shrink_request import RunCommandShrinkRequestResourceTag
+    from ._run_command_shrink_request import RunCommandShrinkRequestTag
+    from ._run_instances_request import RunInstancesRequestCpuOptions
+    from ._run_instances_request import RunInstancesRequestHibernationOptions
+    from ._run_instances_request import RunInstancesRequestPrivatePoolOptions
+    from ._run_instances_request import RunInstancesRequestSchedulerOptions
+    from ._run_instances_request import RunInstancesRequestSecurityOptions
+    from ._run_instances_request import RunInstancesRequestSystemDisk
+    from ._run_instances_request import RunInstancesRequestArn
+    from ._run_instances_request import RunInstancesRequestClockOptions
+    from ._run_instances_request import RunInstancesRequestDataDisk
+    from ._run_instances_request import RunInstancesRequestImageOptions
+    from ._run_instances_request import RunInstancesRequestNetworkInterface
+    from ._run_instances_request import RunInstancesRequestNetworkOptions
+    from ._run_instances_request import RunInstancesRequestPrivateDnsNameOptions
+    from ._run_instances_request import RunInstancesRequestTag
+    from ._run_instances_response_body import RunInstancesResponseBodyInstanceIdSets
+    from ._send_file_request import SendFileRequestTag
+    from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequestTag
+    from ._start_image_pipeline_execution_request import StartImagePipelineExecutionRequestTemplateTag
+    from ._start_instances_response_body import StartInstancesResponseBodyInstanceResponsesInstanceResponse
+    from ._start_instances_response_body import StartInstancesResponseBodyInstanceResponses
+    from ._start_terminal_session_request import StartTerminalSessionRequestEncryptionOptions
+    from ._stop_instances_response_body import StopInstancesResponseBodyInstanceResponsesInstanceResponse
+    from ._stop_instances_response_body import StopInstancesResponseBodyInstanceResponses
+    from ._tag_resources_request import TagResourcesRequestTag
+
+# Models are resolved on first attribute access, so importing the client
+# only loads the modules of the actions that are actually called.
+_MODULES = {
+    'AcceptInquiredSystemEventRequest': '_accept_inquired_system_event_request',
+    'AcceptInquiredSystemEventResponseBody': '_accept_inquired_system_event_response_body',
+    'AcceptInquiredSystemEventResponse': '_accept_inquired_system_event_response',
+    'ActivateRouterInterfaceRequest': '_activate_router_interface_request',
+    'ActivateRouterInterfaceResponseBody': '_activate_router_interface_response_body',
+    'ActivateRouterInterfaceResponse': '_activate_router_interface_response',
+    'AddBandwidthPackageIpsRequest': '_add_bandwidth_package_ips_request',
+    'AddBandwidthPackageIpsResponseBody': '_add_bandwidth_package_ips_response_body',
+    'AddBandwidthPackageIpsResponse': '_add_bandwidth_package_ips_response',
+    'AddTagsRequest': '_add_tags_request',
+    'AddTagsResponseBody': '_add_tags_response_body',
+    'AddTagsResponse': '_add_tags_response',
+    'AllocateDedicatedHostsRequest': '_allocate_dedicated_hosts_request',
+    'AllocateDedicatedHostsResponseBody': '_allocate_dedicated_hosts_response_body',
+    'AllocateDedicatedHostsResponse': '_allocate_dedicated_hosts_response',
+    'AllocateEipAddressRequest': '_allocate_eip_address_request',
+    'AllocateEipAddressResponseBody': '_allocate_eip_address_response_body',
+    'AllocateEipAddressResponse': '_allocate_eip_address_response',
+    'AllocatePublicIpAddressRequest': '_allocate_public_ip_address_request',
+    'AllocatePublicIpAddressResponseBody': '_allocate_public_ip_address_response_body',
+    'AllocatePublicIpAddressResponse': '_allocate_public_ip_address_response',
+    'ApplyAutoSnapshotPolicyRequest': '_apply_auto_snapshot_policy_request',
+    'ApplyAutoSnapshotPolicyResponseBody': '_apply_auto_snapshot_policy_response_body',
+    'ApplyAutoSnapshotPolicyResponse': '_apply_auto_snapshot_policy_response',
+    'AssignIpv6AddressesRequest': '_assign_ipv_6addresses_request',
+    'AssignIpv6AddressesResponseBody': '_assign_ipv_6addresses_response_body',
+    'AssignIpv6AddressesResponse': '_assign_ipv_6addresses_response',
+    'AssignPrivateIpAddressesRequest': '_assign_private_ip_addresses_request',
+    'AssignPrivateIpAddressesResponseBody': '_assign_private_ip_addresses_response_body',
+    'AssignPrivateIpAddressesResponse': '_assign_private_ip_addresses_response',
+    'AssociateEipAddressRequest': '_associate_eip_address_request',
+    'AssociateEipAddressResponseBody': '_associate_eip_address_response_body',
+    'AssociateEipAddressResponse': '_associate_eip_address_response',
+    'AssociateHaVipRequest': '_associate_ha_vip_request',
+    'AssociateHaVipResponseBody': '_associate_ha_vip_response_body',
+    'AssociateHaVipResponse': '_associate_ha_vip_response',
+    'AttachClassicLinkVpcRequest': '_attach_classic_link_vpc_request',
+    'AttachClassicLinkVpcResponseBody': '_attach_classic_link_vpc_response_body',
+    'AttachClassicLinkVpcResponse': '_attach_classic_link_vpc_response',
+    'AttachDiskRequest': '_attach_disk_request',
+    'AttachDiskResponseBody': '_attach_disk_response_body',
+    'AttachDiskResponse': '_attach_disk_response',
+    'AttachInstanceRamRoleRequest': '_attach_instance_ram_role_request',
+    'AttachInstanceRamRoleResponseBody': '_attach_instance_ram_role_response_body',
+    'AttachInstanceRamRoleResponse': '_attach_instance_ram_role_response',
+    'AttachKeyPairRequest': '_attach_key_pair_request',
+    'AttachKeyPairResponseBody': '_attach_key_pair_response_body',
+    'AttachKeyPairResponse': '_attach_key_pair_response',
+    'AttachNetworkInterfaceRequest': '_attach_network_interface_request',
+    'AttachNetworkInterfaceResponseBody': '_attach_network_interface_response_body',
+    'AttachNetworkInterfaceResponse': '_attach_network_interface_response',
+    'AuthorizeSecurityGroupRequest': '_authorize_security_group_request',
+    'AuthorizeSecurityGroupResponseBody': '_authorize_security_group_response_body',
+    'AuthorizeSecurityGroupResponse': '_authorize_security_group_response',
+    'AuthorizeSecurityGroupEgressRequest': '_authorize_security_group_egress_request',
+    'AuthorizeSecurityGroupEgressResponseBody': '_authorize_security_group_egress_response_body',
+    'AuthorizeSecurityGroupEgressResponse': '_authorize_security_group_egress_response',
+    'CancelAutoSnapshotPolicyRequest': '_cancel_auto_snapshot_policy_request',
+    'CancelAutoSnapshotPolicyResponseBody': '_cancel_auto_snapshot_policy_response_body',
+    'CancelAutoSnapshotPolicyResponse': '_cancel_auto_snapshot_policy_response',
+    'CancelCopyImageRequest': '_cancel_copy_image_request',
+    'CancelCopyImageResponseBody': '_cancel_copy_image_response_body',
+    'CancelCopyImageResponse': '_cancel_copy_image_response',
+    'CancelImagePipelineExecutionRequest': '_cancel_image_pipeline_execution_request',
+    'CancelImagePipelineExecutionResponseBody': '_cancel_image_pipeline_execution_response_body',
+    'CancelImagePipelineExecutionResponse': '_cancel_image_pipeline_execution_response',
+    'CancelPhysicalConnectionRequest': '_cancel_physical_connection_request',
+    'CancelPhysicalConnectionResponseBody': '_cancel_physical_connection_response_body',
+    'CancelPhysicalConnectionResponse': '_cancel_physical_connection_response',
+    'CancelSimulatedSystemEventsRequest': '_cancel_simulated_system_events_request',
+    'CancelSimulatedSystemEventsResponseBody': '_cancel_simulated_system_events_response_body',
+    'CancelSimulatedSystemEventsResponse': '_cancel_simulated_system_events_response',
+    'CancelTaskRequest': '_cancel_task_request',
+    'CancelTaskResponseBody': '_cancel_task_response_body',
+    'CancelTaskResponse': '_cancel_task_response',
+    'ConnectRouterInterfaceRequest': '_connect_router_interface_request',
+    'ConnectRouterInterfaceResponseBody': '_connect_router_interface_response_body',
+    'ConnectRouterInterfaceResponse': '_connect_router_interface_response',
+    'ConvertNatPublicIpToEipRequest': '_convert_nat_public_ip_to_eip_request',
+    'ConvertNatPublicIpToEipResponseBody': '_convert_nat_public_ip_to_eip_response_body',
+    'ConvertNatPublicIpToEipResponse': '_convert_nat_public_ip_to_eip_response',
+    'CopyImageRequest': '_copy_image_request',
+    'CopyImageResponseBody': '_copy_image_response_body',
+    'CopyImageResponse': '_copy_image_response',
+    'CopySnapshotRequest': '_copy_snapshot_request',
+    'CopySnapshotResponseBody': '_copy_snapshot_response_body',
+    'CopySnapshotResponse': '_copy_snapshot_response',
+    'CreateActivationRequest': '_create_activation_request',
+    'CreateActivationResponseBody': '_create_activation_response_body',
+    'CreateActivationResponse': '_create_activation_response',
+    'CreateAutoProvisioningGroupRequest': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupShrinkRequest': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupResponseBody': '_create_auto_provisioning_group_response_body',
+    'CreateAutoProvisioningGroupResponse': '_create_auto_provisioning_group_response',
+    'CreateAutoSnapshotPolicyRequest': '_create_auto_snapshot_policy_request',
+    'CreateAutoSnapshotPolicyResponseBody': '_create_auto_snapshot_policy_response_body',
+    'CreateAutoSnapshotPolicyResponse': '_create_auto_snapshot_policy_response',
+    'CreateCapacityReservationRequest': '_create_capacity_reservation_request',
+    'CreateCapacityReservationResponseBody': '_create_capacity_reservation_response_body',
+    'CreateCapacityReservationResponse': '_create_capacity_reservation_response',
+    'CreateCommandRequest': '_create_command_request',
+    'CreateCommandResponseBody': '_create_command_response_body',
+    'CreateCommandResponse': '_create_command_response',
+    'CreateDedicatedHostClusterRequest': '_create_dedicated_host_cluster_request',
+    'CreateDedicatedHostClusterResponseBody': '_create_dedicated_host_cluster_response_body',
+    'CreateDedicatedHostClusterResponse': '_create_dedicated_host_cluster_response',
+    'CreateDeploymentSetRequest': '_create_deployment_set_request',
+    'CreateDeploymentSetResponseBody': '_create_deployment_set_response_body',
+    'CreateDeploymentSetResponse': '_create_deployment_set_response',
+    'CreateDiagnosticMetricSetRequest': '_create_diagnostic_metric_set_request',
+    'CreateDiagnosticMetricSetResponseBody': '_create_diagnostic_metric_set_response_body',
+    'CreateDiagnosticMetricSetResponse': '_create_diagnostic_metric_set_response',
+    'CreateDiagnosticReportRequest': '_create_diagnostic_report_request',
+    'CreateDiagnosticReportResponseBody': '_create_diagnostic_report_response_body',
+    'CreateDiagnosticReportResponse': '_create_diagnostic_report_response',
+    'CreateDiskRequest': '_create_disk_request',
+    'CreateDiskResponseBody': '_create_disk_response_body',
+    'CreateDiskResponse': '_create_disk_response',
+    'CreateElasticityAssuranceRequest': '_create_elasticity_assurance_request',
+    'CreateElasticityAssuranceResponseBody': '_create_elasticity_assurance_response_body',
+    'CreateElasticityAssuranceResponse': '_create_elasticity_assurance_response',
+    'CreateForwardEntryRequest': '_create_forward_entry_request',
+    'CreateForwardEntryResponseBody': '_create_forward_entry_response_body',
+    'CreateForwardEntryResponse': '_create_forward_entry_response',
+    'CreateHaVipRequest': '_create_ha_vip_request',
+    'CreateHaVipResponseBody': '_create_ha_vip_response_body',
+    'CreateHaVipResponse': '_create_ha_vip_response',
+    'CreateHpcClusterRequest': '_create_hpc_cluster_request',
+    'CreateHpcClusterResponseBody': '_create_hpc_cluster_response_body',
+    'CreateHpcClusterResponse': '_create_hpc_cluster_response',
+    'CreateImageRequest': '_create_image_request',
+    'CreateImageResponseBody': '_create_image_response_body',
+    'CreateImageResponse': '_create_image_response',
+    'CreateImageComponentRequest': '_create_image_component_request',
+    'CreateImageComponentResponseBody': '_create_image_component_response_body',
+    'CreateImageComponentResponse': '_create_image_component_response',
+    'CreateImagePipelineRequest': '_create_image_pipeline_request',
+    'CreateImagePipelineResponseBody': '_create_image_pipeline_response_body',
+    'CreateImagePipelineResponse': '_create_image_pipeline_response',
+    'CreateInstanceRequest': '_create_instance_request',
+    'CreateInstanceResponseBody': '_create_instance_response_body',
+    'CreateInstanceResponse': '_create_instance_response',
+    'CreateKeyPairRequest': '_create_key_pair_request',
+    'CreateKeyPairResponseBody': '_create_key_pair_response_body',
+    'CreateKeyPairResponse': '_create_key_pair_response',
+    'CreateLaunchTemplateRequest': '_create_launch_template_request',
+    'CreateLaunchTemplateResponseBody': '_create_launch_template_response_body',
+    'CreateLaunchTemplateResponse': '_create_launch_template_response',
+    'CreateLaunchTemplateVersionRequest': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionResponseBody': '_create_launch_template_version_response_body',
+    'CreateLaunchTemplateVersionResponse': '_create_launch_template_version_response',
+    'CreateNatGatewayRequest': '_create_nat_gateway_request',
+    'CreateNatGatewayResponseBody': '_create_nat_gateway_response_body',
+    'CreateNatGatewayResponse': '_create_nat_gateway_response',
+    'CreateNetworkInterfaceRequest': '_create_network_interface_request',
+    'CreateNetworkInterfaceResponseBody': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponse': '_create_network_interface_response',
+    'CreateNetworkInterfacePermissionRequest': '_create_network_interface_permission_request',
+    'CreateNetworkInterfacePermissionResponseBody': '_create_network_interface_permission_response_body',
+    'CreateNetworkInterfacePermissionResponse': '_create_network_interface_permission_response',
+    'CreatePhysicalConnectionRequest': '_create_physical_connection_request',
+    'CreatePhysicalConnectionResponseBody': '_create_physical_connection_response_body',
+    'CreatePhysicalConnectionResponse': '_create_physical_connection_response',
+    'CreatePortRangeListRequest': '_create_port_range_list_request',
+    'CreatePortRangeListResponseBody': '_create_port_range_list_response_body',
+    'CreatePortRangeListResponse': '_create_port_range_list_response',
+    'CreatePrefixListRequest': '_create_prefix_list_request',
+    'CreatePrefixListResponseBody': '_create_prefix_list_response_body',
+    'CreatePrefixListResponse': '_create_prefix_list_response',
+    'CreateRouteEntryRequest': '_create_route_entry_request',
+    'CreateRouteEntryResponseBody': '_create_route_entry_response_body',
+    'CreateRouteEntryResponse': '_create_route_entry_response',
+    'CreateRouterInterfaceRequest': '_create_router_interface_request',
+    'CreateRouterInterfaceResponseBody': '_create_router_interface_response_body',
+    'CreateRouterInterfaceResponse': '_create_router_interface_response',
+    'CreateSavingsPlanRequest': '_create_savings_plan_request',
+    'CreateSavingsPlanResponseBody': '_create_savings_plan_response_body',
+    'CreateSavingsPlanResponse': '_create_savings_plan_response',
+    'CreateSecurityGroupRequest': '_create_security_group_request',
+    'CreateSecurityGroupResponseBody': '_create_security_group_response_body',
+    'CreateSecurityGroupResponse': '_create_security_group_response',
+    'CreateSimulatedSystemEventsRequest': '_create_simulated_system_events_request',
+    'CreateSimulatedSystemEventsResponseBody': '_create_simulated_system_events_response_body',
+    'CreateSimulatedSystemEventsResponse': '_create_simulated_system_events_response',
+    'CreateSnapshotRequest': '_create_snapshot_request',
+    'CreateSnapshotResponseBody': '_create_snapshot_response_body',
+    'CreateSnapshotResponse': '_create_snapshot_response',
+    'CreateSnapshotGroupRequest': '_create_snapshot_group_request',
+    'CreateSnapshotGroupResponseBody': '_create_snapshot_group_response_body',
+    'CreateSnapshotGroupResponse': '_create_snapshot_group_response',
+    'CreateStorageSetRequest': '_create_storage_set_request',
+    'CreateStorageSetResponseBody': '_create_storage_set_response_body',
+    'CreateStorageSetResponse': '_create_storage_set_response',
+    'CreateVSwitchRequest': '_create_vswitch_request',
+    'CreateVSwitchResponseBody': '_create_vswitch_response_body',
+    'CreateVSwitchResponse': '_create_vswitch_response',
+    'CreateVirtualBorderRouterRequest': '_create_virtual_border_router_request',
+    'CreateVirtualBorderRouterResponseBody': '_create_virtual_border_router_response_body',
+    'CreateVirtualBorderRouterResponse': '_create_virtual_border_router_response',
+    'CreateVpcRequest': '_create_vpc_request',
+    'CreateVpcResponseBody': '_create_vpc_response_body',
+    'CreateVpcResponse': '_create_vpc_response',
+    'DeactivateRouterInterfaceRequest': '_deactivate_router_interface_request',
+    'DeactivateRouterInterfaceResponseBody': '_deactivate_router_interface_response_body',
+    'DeactivateRouterInterfaceResponse': '_deactivate_router_interface_response',
+    'DeleteActivationRequest': '_delete_activation_request',
+    'DeleteActivationResponseBody': '_delete_activation_response_body',
+    'DeleteActivationResponse': '_delete_activation_response',
+    'DeleteAutoProvisioningGroupRequest': '_delete_auto_provisioning_group_request',
+    'DeleteAutoProvisioningGroupResponseBody': '_delete_auto_provisioning_group_response_body',
+    'DeleteAutoProvisioningGroupResponse': '_delete_auto_provisioning_group_response',
+    'DeleteAutoSnapshotPolicyRequest': '_delete_auto_snapshot_policy_request',
+    'DeleteAutoSnapshotPolicyResponseBody': '_delete_auto_snapshot_policy_response_body',
+    'DeleteAutoSnapshotPolicyResponse': '_delete_auto_snapshot_policy_response',
+    'DeleteBandwidthPackageRequest': '_delete_bandwidth_package_request',
+    'DeleteBandwidthPackageResponseBody': '_delete_bandwidth_package_response_body',
+    'DeleteBandwidthPackageResponse': '_delete_bandwidth_package_response',
+    'DeleteCommandRequest': '_delete_command_request',
+    'DeleteCommandResponseBody': '_delete_command_response_body',
+    'DeleteCommandResponse': '_delete_command_response',
+    'DeleteDedicatedHostClusterRequest': '_delete_dedicated_host_cluster_request',
+    'DeleteDedicatedHostClusterResponseBody': '_delete_dedicated_host_cluster_response_body',
+    'DeleteDedicatedHostClusterResponse': '_delete_dedicated_host_cluster_response',
+    'DeleteDeploymentSetRequest': '_delete_deployment_set_request',
+    'DeleteDeploymentSetResponseBody': '_delete_deployment_set_response_body',
+    'DeleteDeploymentSetResponse': '_delete_deployment_set_response',
+    'DeleteDiagnosticMetricSetsRequest': '_delete_diagnostic_metric_sets_request',
+    'DeleteDiagnosticMetricSetsResponseBody': '_delete_diagnostic_metric_sets_response_body',
+    'DeleteDiagnosticMetricSetsResponse': '_delete_diagnostic_metric_sets_response',
+    'DeleteDiagnosticReportsRequest': '_delete_diagnostic_reports_request',
+    'DeleteDiagnosticReportsResponseBody': '_delete_diagnostic_reports_response_body',
+    'DeleteDiagnosticReportsResponse': '_delete_diagnostic_reports_response',
+    'DeleteDiskRequest': '_delete_disk_request',
+    'DeleteDiskResponseBody': '_delete_disk_response_body',
+    'DeleteDiskResponse': '_delete_disk_response',
+    'DeleteForwardEntryRequest': '_delete_forward_entry_request',
+    'DeleteForwardEntryResponseBody': '_delete_forward_entry_response_body',
+    'DeleteForwardEntryResponse': '_delete_forward_entry_response',
+    'DeleteHaVipRequest': '_delete_ha_vip_request',
+    'DeleteHaVipResponseBody': '_delete_ha_vip_response_body',
+    'DeleteHaVipResponse': '_delete_ha_vip_response',
+    'DeleteHpcClusterRequest': '_delete_hpc_cluster_request',
+    'DeleteHpcClusterResponseBody': '_delete_hpc_cluster_response_body',
+    'DeleteHpcClusterResponse': '_delete_hpc_cluster_response',
+    'DeleteImageRequest': '_delete_image_request',
+    'DeleteImageResponseBody': '_delete_image_response_body',
+    'DeleteImageResponse': '_delete_image_response',
+    'DeleteImageComponentRequest': '_delete_image_component_request',
+    'DeleteImageComponentResponseBody': '_delete_image_component_response_body',
+    'DeleteImageComponentResponse': '_delete_image_component_response',
+    'DeleteImagePipelineRequest': '_delete_image_pipeline_request',
+    'DeleteImagePipelineResponseBody': '_delete_image_pipeline_response_body',
+    'DeleteImagePipelineResponse': '_delete_image_pipeline_response',
+    'DeleteInstanceRequest': '_delete_instance_request',
+    'DeleteInstanceResponseBody': '_delete_instance_response_body',
+    'DeleteInstanceResponse': '_delete_instance_response',
+    'DeleteInstancesRequest': '_delete_instances_request',
+    'DeleteInstancesResponseBody': '_delete_instances_response_body',
+    'DeleteInstancesResponse': '_delete_instances_response',
+    'DeleteKeyPairsRequest': '_delete_key_pairs_request',
+    'DeleteKeyPairsResponseBody': '_delete_key_pairs_response_body',
+    'DeleteKeyPairsResponse': '_delete_key_pairs_response',
+    'DeleteLaunchTemplateRequest': '_delete_launch_template_request',
+    'DeleteLaunchTemplateResponseBody': '_delete_launch_template_response_body',
+    'DeleteLaunchTemplateResponse': '_delete_launch_template_response',
+    'DeleteLaunchTemplateVersionRequest': '_delete_launch_template_version_request',
+    'DeleteLaunchTemplateVersionResponseBody': '_delete_launch_template_version_response_body',
+    'DeleteLaunchTemplateVersionResponse': '_delete_launch_template_version_response',
+    'DeleteNatGatewayRequest': '_delete_nat_gateway_request',
+    'DeleteNatGatewayResponseBody': '_delete_nat_gateway_response_body',
+    'DeleteNatGatewayResponse': '_delete_nat_gateway_response',
+    'DeleteNetworkInterfaceRequest': '_delete_network_interface_request',
+    'DeleteNetworkInterfaceResponseBody': '_delete_network_interface_response_body',
+    'DeleteNetworkInterfaceResponse': '_delete_network_interface_response',
+    'DeleteNetworkInterfacePermissionRequest': '_delete_network_interface_permission_request',
+    'DeleteNetworkInterfacePermissionResponseBody': '_delete_network_interface_permission_response_body',
+    'DeleteNetworkInterfacePermissionResponse': '_delete_network_interface_permission_response',
+    'DeletePhysicalConnectionRequest': '_delete_physical_connection_request',
+    'DeletePhysicalConnectionResponseBody': '_delete_physical_connection_response_body',
+    'DeletePhysicalConnectionResponse': '_delete_physical_connection_response',
+    'DeletePortRangeListRequest': '_delete_port_range_list_request',
+    'DeletePortRangeListResponseBody': '_delete_port_range_list_response_body',
+    'DeletePortRangeListResponse': '_delete_port_range_list_response',
+    'DeletePrefixListRequest': '_delete_prefix_list_request',
+    'DeletePrefixListResponseBody': '_delete_prefix_list_response_body',
+    'DeletePrefixListResponse': '_delete_prefix_list_response',
+    'DeleteRouteEntryRequest': '_delete_route_entry_request',
+    'DeleteRouteEntryResponseBody': '_delete_route_entry_response_body',
+    'DeleteRouteEntryResponse': '_delete_route_entry_response',
+    'DeleteRouterInterfaceRequest': '_delete_router_interface_request',
+    'DeleteRouterInterfaceResponseBody': '_delete_router_interface_response_body',
+    'DeleteRouterInterfaceResponse': '_delete_router_interface_response',
+    'DeleteSecurityGroupRequest': '_delete_security_group_request',
+    'DeleteSecurityGroupResponseBody': '_delete_security_group_response_body',
+    'DeleteSecurityGroupResponse': '_delete_security_group_response',
+    'DeleteSnapshotRequest': '_delete_snapshot_request',
+    'DeleteSnapshotResponseBody': '_delete_snapshot_response_body',
+    'DeleteSnapshotResponse': '_delete_snapshot_response',
+    'DeleteSnapshotGroupRequest': '_delete_snapshot_group_request',
+    'DeleteSnapshotGroupResponseBody': '_delete_snapshot_group_response_body',
+    'DeleteSnapshotGroupResponse': '_delete_snapshot_group_response',
+    'DeleteStorageSetRequest': '_delete_storage_set_request',
+    'DeleteStorageSetResponseBody': '_delete_storage_set_response_body',
+    'DeleteStorageSetResponse': '_delete_storage_set_response',
+    'DeleteVSwitchRequest': '_delete_vswitch_request',
+    'DeleteVSwitchResponseBody': '_delete_vswitch_response_body',
+    'DeleteVSwitchResponse': '_delete_vswitch_response',
+    'DeleteVirtualBorderRouterRequest': '_delete_virtual_border_router_request',
+    'DeleteVirtualBorderRouterResponseBody': '_delete_virtual_border_router_response_body',
+    'DeleteVirtualBorderRouterResponse': '_delete_virtual_border_router_response',
+    'DeleteVpcRequest': '_delete_vpc_request',
+    'DeleteVpcResponseBody': '_delete_vpc_response_body',
+    'DeleteVpcResponse': '_delete_vpc_response',
+    'DeregisterManagedInstanceRequest': '_deregister_managed_instance_request',
+    'DeregisterManagedInstanceResponseBody': '_deregister_managed_instance_response_body',
+    'DeregisterManagedInstanceResponse': '_deregister_managed_instance_response',
+    'DescribeAccessPointsRequest': '_describe_access_points_request',
+    'DescribeAccessPointsResponseBody': '_describe_access_points_response_body',
+    'DescribeAccessPointsResponse': '_describe_access_points_response',
+    'DescribeAccountAttributesRequest': '_describe_account_attributes_request',
+    'DescribeAccountAttributesResponseBody': '_describe_account_attributes_response_body',
+    'DescribeAccountAttributesResponse': '_describe_account_attributes_response',
+    'DescribeActivationsRequest': '_describe_activations_request',
+    'DescribeActivationsResponseBody': '_describe_activations_response_body',
+    'DescribeActivationsResponse': '_describe_activations_response',
+    'DescribeAutoProvisioningGroupHistoryRequest': '_describe_auto_provisioning_group_history_request',
+    'DescribeAutoProvisioningGroupHistoryResponseBody': '_describe_auto_provisioning_group_history_response_body',
+    'DescribeAutoProvisioningGroupHistoryResponse': '_describe_auto_provisioning_group_history_response',
+    'DescribeAutoProvisioningGroupInstancesRequest': '_describe_auto_provisioning_group_instances_request',
+    'DescribeAutoProvisioningGroupInstancesResponseBody': '_describe_auto_provisioning_group_instances_response_body',
+    'DescribeAutoProvisioningGroupInstancesResponse': '_describe_auto_provisioning_group_instances_response',
+    'DescribeAutoProvisioningGroupsRequest': '_describe_auto_provisioning_groups_request',
+    'DescribeAutoProvisioningGroupsResponseBody': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponse': '_describe_auto_provisioning_groups_response',
+    'DescribeAutoSnapshotPolicyAssociationsRequest': '_describe_auto_snapshot_policy_associations_request',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBody': '_describe_auto_snapshot_policy_associations_response_body',
+    'DescribeAutoSnapshotPolicyAssociationsResponse': '_describe_auto_snapshot_policy_associations_response',
+    'DescribeAutoSnapshotPolicyExRequest': '_describe_auto_snapshot_policy_ex_request',
+    'DescribeAutoSnapshotPolicyExResponseBody': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAutoSnapshotPolicyExResponse': '_describe_auto_snapshot_policy_ex_response',
+    'DescribeAvailableResourceRequest': '_describe_available_resource_request',
+    'DescribeAvailableResourceResponseBody': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponse': '_describe_available_resource_response',
+    'DescribeBandwidthLimitationRequest': '_describe_bandwidth_limitation_request',
+    'DescribeBandwidthLimitationResponseBody': '_describe_bandwidth_limitation_response_body',
+    'DescribeBandwidthLimitationResponse': '_describe_bandwidth_limitation_response',
+    'DescribeBandwidthPackagesRequest': '_describe_bandwidth_packages_request',
+    'DescribeBandwidthPackagesResponseBody': '_describe_bandwidth_packages_response_body',
+    'DescribeBandwidthPackagesResponse': '_describe_bandwidth_packages_response',
+    'DescribeCapacityReservationInstancesRequest': '_describe_capacity_reservation_instances_request',
+    'DescribeCapacityReservationInstancesResponseBody': '_describe_capacity_reservation_instances_response_body',
+    'DescribeCapacityReservationInstancesResponse': '_describe_capacity_reservation_instances_response',
+    'DescribeCapacityReservationsRequest': '_describe_capacity_reservations_request',
+    'DescribeCapacityReservationsResponseBody': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponse': '_describe_capacity_reservations_response',
+    'DescribeClassicLinkInstancesRequest': '_describe_classic_link_instances_request',
+    'DescribeClassicLinkInstancesResponseBody': '_describe_classic_link_instances_response_body',
+    'DescribeClassicLinkInstancesResponse': '_describe_classic_link_instances_response',
+    'DescribeCloudAssistantSettingsRequest': '_describe_cloud_assistant_settings_request',
+    'DescribeCloudAssistantSettingsResponseBody': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponse': '_describe_cloud_assistant_settings_response',
+    'DescribeCloudAssistantStatusRequest': '_describe_cloud_assistant_status_request',
+    'DescribeCloudAssistantStatusResponseBody': '_describe_cloud_assistant_status_response_body',
+    'DescribeCloudAssistantStatusResponse': '_describe_cloud_assistant_status_response',
+    'DescribeClustersRequest': '_describe_clusters_request',
+    'DescribeClustersResponseBody': '_describe_clusters_response_body',
+    'DescribeClustersResponse': '_describe_clusters_response',
+    'DescribeCommandsRequest': '_describe_commands_request',
+    'DescribeCommandsResponseBody': '_describe_commands_response_body',
+    'DescribeCommandsResponse': '_describe_commands_response',
+    'DescribeDedicatedHostAutoRenewRequest': '_describe_dedicated_host_auto_renew_request',
+    'DescribeDedicatedHostAutoRenewResponseBody': '_describe_dedicated_host_auto_renew_response_body',
+    'DescribeDedicatedHostAutoRenewResponse': '_describe_dedicated_host_auto_renew_response',
+    'DescribeDedicatedHostClustersRequest': '_describe_dedicated_host_clusters_request',
+    'DescribeDedicatedHostClustersResponseBody': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponse': '_describe_dedicated_host_clusters_response',
+    'DescribeDedicatedHostTypesRequest': '_describe_dedicated_host_types_request',
+    'DescribeDedicatedHostTypesResponseBody': '_describe_dedicated_host_types_response_body',
+    'DescribeDedicatedHostTypesResponse': '_describe_dedicated_host_types_response',
+    'DescribeDedicatedHostsRequest': '_describe_dedicated_hosts_request',
+    'DescribeDedicatedHostsResponseBody': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponse': '_describe_dedicated_hosts_response',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyRequest': '_describe_deployment_set_supported_instance_type_family_request',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody': '_describe_deployment_set_supported_instance_type_family_response_body',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponse': '_describe_deployment_set_supported_instance_type_family_response',
+    'DescribeDeploymentSetsRequest': '_describe_deployment_sets_request',
+    'DescribeDeploymentSetsResponseBody': '_describe_deployment_sets_response_body',
+    'DescribeDeploymentSetsResponse': '_describe_deployment_sets_response',
+    'DescribeDiagnosticMetricSetsRequest': '_describe_diagnostic_metric_sets_request',
+    'DescribeDiagnosticMetricSetsResponseBody': '_describe_diagnostic_metric_sets_response_body',
+    'DescribeDiagnosticMetricSetsResponse': '_describe_diagnostic_metric_sets_response',
+    'DescribeDiagnosticMetricsRequest': '_describe_diagnostic_metrics_request',
+    'DescribeDiagnosticMetricsResponseBody': '_describe_diagnostic_metrics_response_body',
+    'DescribeDiagnosticMetricsResponse': '_describe_diagnostic_metrics_response',
+    'DescribeDiagnosticReportAttributesRequest': '_describe_diagnostic_report_attributes_request',
+    'DescribeDiagnosticReportAttributesResponseBody': '_describe_diagnostic_report_attributes_response_body',
+    'DescribeDiagnosticReportAttributesResponse': '_describe_diagnostic_report_attributes_response',
+    'DescribeDiagnosticReportsRequest': '_describe_diagnostic_reports_request',
+    'DescribeDiagnosticReportsResponseBody': '_describe_diagnostic_reports_response_body',
+    'DescribeDiagnosticReportsResponse': '_describe_diagnostic_reports_response',
+    'DescribeDiskDefaultKMSKeyIdRequest': '_describe_disk_default_kmskey_id_request',
+    'DescribeDiskDefaultKMSKeyIdResponseBody': '_describe_disk_default_kmskey_id_response_body',
+    'DescribeDiskDefaultKMSKeyIdResponse': '_describe_disk_default_kmskey_id_response',
+    'DescribeDiskEncryptionByDefaultStatusRequest': '_describe_disk_encryption_by_default_status_request',
+    'DescribeDiskEncryptionByDefaultStatusResponseBody': '_describe_disk_encryption_by_default_status_response_body',
+    'DescribeDiskEncryptionByDefaultStatusResponse': '_describe_disk_encryption_by_default_status_response',
+    'DescribeDiskMonitorDataRequest': '_describe_disk_monitor_data_request',
+    'DescribeDiskMonitorDataResponseBody': '_describe_disk_monitor_data_response_body',
+    'DescribeDiskMonitorDataResponse': '_describe_disk_monitor_data_response',
+    'DescribeDisksRequest': '_describe_disks_request',
+    'DescribeDisksResponseBody': '_describe_disks_response_body',
+    'DescribeDisksResponse': '_describe_disks_response',
+    'DescribeDisksFullStatusRequest': '_describe_disks_full_status_request',
+    'DescribeDisksFullStatusResponseBody': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponse': '_describe_disks_full_status_response',
+    'DescribeEipAddressesRequest': '_describe_eip_addresses_request',
+    'DescribeEipAddressesResponseBody': '_describe_eip_addresses_response_body',
+    'DescribeEipAddressesResponse': '_describe_eip_addresses_response',
+    'DescribeEipMonitorDataRequest': '_describe_eip_monitor_data_request',
+    'DescribeEipMonitorDataResponseBody': '_describe_eip_monitor_data_response_body',
+    'DescribeEipMonitorDataResponse': '_describe_eip_monitor_data_response',
+    'DescribeElasticityAssuranceAutoRenewAttributeRequest': '_describe_elasticity_assurance_auto_renew_attribute_request',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBody': '_describe_elasticity_assurance_auto_renew_attribute_response_body',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponse': '_describe_elasticity_assurance_auto_renew_attribute_response',
+    'DescribeElasticityAssuranceInstancesRequest': '_describe_elasticity_assurance_instances_request',
+    'DescribeElasticityAssuranceInstancesResponseBody': '_describe_elasticity_assurance_instances_response_body',
+    'DescribeElasticityAssuranceInstancesResponse': '_describe_elasticity_assurance_instances_response',
+    'DescribeElasticityAssurancesRequest': '_describe_elasticity_assurances_request',
+    'DescribeElasticityAssurancesResponseBody': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponse': '_describe_elasticity_assurances_response',
+    'DescribeEniMonitorDataRequest': '_describe_eni_monitor_data_request',
+    'DescribeEniMonitorDataResponseBody': '_describe_eni_monitor_data_response_body',
+    'DescribeEniMonitorDataResponse': '_describe_eni_monitor_data_response',
+    'DescribeForwardTableEntriesRequest': '_describe_forward_table_entries_request',
+    'DescribeForwardTableEntriesResponseBody': '_describe_forward_table_entries_response_body',
+    'DescribeForwardTableEntriesResponse': '_describe_forward_table_entries_response',
+    'DescribeHaVipsRequest': '_describe_ha_vips_request',
+    'DescribeHaVipsResponseBody': '_describe_ha_vips_response_body',
+    'DescribeHaVipsResponse': '_describe_ha_vips_response',
+    'DescribeHpcClustersRequest': '_describe_hpc_clusters_request',
+    'DescribeHpcClustersResponseBody': '_describe_hpc_clusters_response_body',
+    'DescribeHpcClustersResponse': '_describe_hpc_clusters_response',
+    'DescribeImageComponentsRequest': '_describe_image_components_request',
+    'DescribeImageComponentsResponseBody': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponse': '_describe_image_components_response',
+    'DescribeImageFromFamilyRequest': '_describe_image_from_family_request',
+    'DescribeImageFromFamilyResponseBody': '_describe_image_from_family_response_body',
+    'DescribeImageFromFamilyResponse': '_describe_image_from_family_response',
+    'DescribeImagePipelineExecutionsRequest': '_describe_image_pipeline_executions_request',
+    'DescribeImagePipelineExecutionsResponseBody': '_describe_image_pipeline_executions_response_body',
+    'DescribeImagePipelineExecutionsResponse': '_describe_image_pipeline_executions_response',
+    'DescribeImagePipelinesRequest': '_describe_image_pipelines_request',
+    'DescribeImagePipelinesResponseBody': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponse': '_describe_image_pipelines_response',
+    'DescribeImageSharePermissionRequest': '_describe_image_share_permission_request',
+    'DescribeImageSharePermissionResponseBody': '_describe_image_share_permission_response_body',
+    'DescribeImageSharePermissionResponse': '_describe_image_share_permission_response',
+    'DescribeImageSupportInstanceTypesRequest': '_describe_image_support_instance_types_request',
+    'DescribeImageSupportInstanceTypesResponseBody': '_describe_image_support_instance_types_response_body',
+    'DescribeImageSupportInstanceTypesResponse': '_describe_image_support_instance_types_response',
+    'DescribeImagesRequest': '_describe_images_request',
+    'DescribeImagesResponseBody': '_describe_images_response_body',
+    'DescribeImagesResponse': '_describe_images_response',
+    'DescribeInstanceAttachmentAttributesRequest': '_describe_instance_attachment_attributes_request',
+    'DescribeInstanceAttachmentAttributesResponseBody': '_describe_instance_attachment_attributes_response_body',
+    'DescribeInstanceAttachmentAttributesResponse': '_describe_instance_attachment_attributes_response',
+    'DescribeInstanceAttributeRequest': '_describe_instance_attribute_request',
+    'DescribeInstanceAttributeResponseBody': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponse': '_describe_instance_attribute_response',
+    'DescribeInstanceAutoRenewAttributeRequest': '_describe_instance_auto_renew_attribute_request',
+    'DescribeInstanceAutoRenewAttributeResponseBody': '_describe_instance_auto_renew_attribute_response_body',
+    'DescribeInstanceAutoRenewAttributeResponse': '_describe_instance_auto_renew_attribute_response',
+    'DescribeInstanceHistoryEventsRequest': '_describe_instance_history_events_request',
+    'DescribeInstanceHistoryEventsResponseBody': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponse': '_describe_instance_history_events_response',
+    'DescribeInstanceMaintenanceAttributesRequest': '_describe_instance_maintenance_attributes_request',
+    'DescribeInstanceMaintenanceAttributesResponseBody': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponse': '_describe_instance_maintenance_attributes_response',
+    'DescribeInstanceModificationPriceRequest': '_describe_instance_modification_price_request',
+    'DescribeInstanceModificationPriceResponseBody': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponse': '_describe_instance_modification_price_response',
+    'DescribeInstanceMonitorDataRequest': '_describe_instance_monitor_data_request',
+    'DescribeInstanceMonitorDataResponseBody': '_describe_instance_monitor_data_response_body',
+    'DescribeInstanceMonitorDataResponse': '_describe_instance_monitor_data_response',
+    'DescribeInstanceRamRoleRequest': '_describe_instance_ram_role_request',
+    'DescribeInstanceRamRoleResponseBody': '_describe_instance_ram_role_response_body',
+    'DescribeInstanceRamRoleResponse': '_describe_instance_ram_role_response',
+    'DescribeInstanceStatusRequest': '_describe_instance_status_request',
+    'DescribeInstanceStatusResponseBody': '_describe_instance_status_response_body',
+    'DescribeInstanceStatusResponse': '_describe_instance_status_response',
+    'DescribeInstanceTopologyRequest': '_describe_instance_topology_request',
+    'DescribeInstanceTopologyResponseBody': '_describe_instance_topology_response_body',
+    'DescribeInstanceTopologyResponse': '_describe_instance_topology_response',
+    'DescribeInstanceTypeFamiliesRequest': '_describe_instance_type_families_request',
+    'DescribeInstanceTypeFamiliesResponseBody': '_describe_instance_type_families_response_body',
+    'DescribeInstanceTypeFamiliesResponse': '_describe_instance_type_families_response',
+    'DescribeInstanceTypesRequest': '_describe_instance_types_request',
+    'DescribeInstanceTypesResponseBody': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponse': '_describe_instance_types_response',
+    'DescribeInstanceVncUrlRequest': '_describe_instance_vnc_url_request',
+    'DescribeInstanceVncUrlResponseBody': '_describe_instance_vnc_url_response_body',
+    'DescribeInstanceVncUrlResponse': '_describe_instance_vnc_url_response',
+    'DescribeInstancesRequest': '_describe_instances_request',
+    'DescribeInstancesResponseBody': '_describe_instances_response_body',
+    'DescribeInstancesResponse': '_describe_instances_response',
+    'DescribeInstancesFullStatusRequest': '_describe_instances_full_status_request',
+    'DescribeInstancesFullStatusResponseBody': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponse': '_describe_instances_full_status_response',
+    'DescribeInvocationResultsRequest': '_describe_invocation_results_request',
+    'DescribeInvocationResultsResponseBody': '_describe_invocation_results_response_body',
+    'DescribeInvocationResultsResponse': '_describe_invocation_results_response',
+    'DescribeInvocationsRequest': '_describe_invocations_request',
+    'DescribeInvocationsResponseBody': '_describe_invocations_response_body',
+    'DescribeInvocationsResponse': '_describe_invocations_response',
+    'DescribeKeyPairsRequest': '_describe_key_pairs_request',
+    'DescribeKeyPairsResponseBody': '_describe_key_pairs_response_body',
+    'DescribeKeyPairsResponse': '_describe_key_pairs_response',
+    'DescribeLaunchTemplateVersionsRequest': '_describe_launch_template_versions_request',
+    'DescribeLaunchTemplateVersionsResponseBody': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponse': '_describe_launch_template_versions_response',
+    'DescribeLaunchTemplatesRequest': '_describe_launch_templates_request',
+    'DescribeLaunchTemplatesResponseBody': '_describe_launch_templates_response_body',
+    'DescribeLaunchTemplatesResponse': '_describe_launch_templates_response',
+    'DescribeLimitationRequest': '_describe_limitation_request',
+    'DescribeLimitationResponseBody': '_describe_limitation_response_body',
+    'DescribeLimitationResponse': '_describe_limitation_response',
+    'DescribeLockedSnapshotsRequest': '_describe_locked_snapshots_request',
+    'DescribeLockedSnapshotsResponseBody': '_describe_locked_snapshots_response_body',
+    'DescribeLockedSnapshotsResponse': '_describe_locked_snapshots_response',
+    'DescribeManagedInstancesRequest': '_describe_managed_instances_request',
+    'DescribeManagedInstancesResponseBody': '_describe_managed_instances_response_body',
+    'DescribeManagedInstancesResponse': '_describe_managed_instances_response',
+    'DescribeNatGatewaysRequest': '_describe_nat_gateways_request',
+    'DescribeNatGatewaysResponseBody': '_describe_nat_gateways_response_body',
+    'DescribeNatGatewaysResponse': '_describe_nat_gateways_response',
+    'DescribeNetworkInterfaceAttributeRequest': '_describe_network_interface_attribute_request',
+    'DescribeNetworkInterfaceAttributeResponseBody': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponse': '_describe_network_interface_attribute_response',
+    'DescribeNetworkInterfacePermissionsRequest': '_describe_network_interface_permissions_request',
+    'DescribeNetworkInterfacePermissionsResponseBody': '_describe_network_interface_permissions_response_body',
+    'DescribeNetworkInterfacePermissionsResponse': '_describe_network_interface_permissions_response',
+    'DescribeNetworkInterfacesRequest': '_describe_network_interfaces_request',
+    'DescribeNetworkInterfacesResponseBody': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponse': '_describe_network_interfaces_response',
+    'DescribeNewProjectEipMonitorDataRequest': '_describe_new_project_eip_monitor_data_request',
+    'DescribeNewProjectEipMonitorDataResponseBody': '_describe_new_project_eip_monitor_data_response_body',
+    'DescribeNewProjectEipMonitorDataResponse': '_describe_new_project_eip_monitor_data_response',
+    'DescribePhysicalConnectionsRequest': '_describe_physical_connections_request',
+    'DescribePhysicalConnectionsResponseBody': '_describe_physical_connections_response_body',
+    'DescribePhysicalConnectionsResponse': '_describe_physical_connections_response',
+    'DescribePortRangeListAssociationsRequest': '_describe_port_range_list_associations_request',
+    'DescribePortRangeListAssociationsResponseBody': '_describe_port_range_list_associations_response_body',
+    'DescribePortRangeListAssociationsResponse': '_describe_port_range_list_associations_response',
+    'DescribePortRangeListEntriesRequest': '_describe_port_range_list_entries_request',
+    'DescribePortRangeListEntriesResponseBody': '_describe_port_range_list_entries_response_body',
+    'DescribePortRangeListEntriesResponse': '_describe_port_range_list_entries_response',
+    'DescribePortRangeListsRequest': '_describe_port_range_lists_request',
+    'DescribePortRangeListsResponseBody': '_describe_port_range_lists_response_body',
+    'DescribePortRangeListsResponse': '_describe_port_range_lists_response',
+    'DescribePrefixListAssociationsRequest': '_describe_prefix_list_associations_request',
+    'DescribePrefixListAssociationsResponseBody': '_describe_prefix_list_associations_response_body',
+    'DescribePrefixListAssociationsResponse': '_describe_prefix_list_associations_response',
+    'DescribePrefixListAttributesRequest': '_describe_prefix_list_attributes_request',
+    'DescribePrefixListAttributesResponseBody': '_describe_prefix_list_attributes_response_body',
+    'DescribePrefixListAttributesResponse': '_describe_prefix_list_attributes_response',
+    'DescribePrefixListsRequest': '_describe_prefix_lists_request',
+    'DescribePrefixListsResponseBody': '_describe_prefix_lists_response_body',
+    'DescribePrefixListsResponse': '_describe_prefix_lists_response',
+    'DescribePriceRequest': '_describe_price_request',
+    'DescribePriceResponseBody': '_describe_price_response_body',
+    'DescribePriceResponse': '_describe_price_response',
+    'DescribeRecommendInstanceTypeRequest': '_describe_recommend_instance_type_request',
+    'DescribeRecommendInstanceTypeResponseBody': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponse': '_describe_recommend_instance_type_response',
+    'DescribeRegionsRequest': '_describe_regions_request',
+    'DescribeRegionsResponseBody': '_describe_regions_response_body',
+    'DescribeRegionsResponse': '_describe_regions_response',
+    'DescribeRenewalPriceRequest': '_describe_renewal_price_request',
+    'DescribeRenewalPriceResponseBody': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponse': '_describe_renewal_price_response',
+    'DescribeReservedInstanceAutoRenewAttributeRequest': '_describe_reserved_instance_auto_renew_attribute_request',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBody': '_describe_reserved_instance_auto_renew_attribute_response_body',
+    'DescribeReservedInstanceAutoRenewAttributeResponse': '_describe_reserved_instance_auto_renew_attribute_response',
+    'DescribeReservedInstancesRequest': '_describe_reserved_instances_request',
+    'DescribeReservedInstancesResponseBody': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponse': '_describe_reserved_instances_response',
+    'DescribeResourceByTagsRequest': '_describe_resource_by_tags_request',
+    'DescribeResourceByTagsResponseBody': '_describe_resource_by_tags_response_body',
+    'DescribeResourceByTagsResponse': '_describe_resource_by_tags_response',
+    'DescribeResourcesModificationRequest': '_describe_resources_modification_request',
+    'DescribeResourcesModificationResponseBody': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponse': '_describe_resources_modification_response',
+    'DescribeRouteTablesRequest': '_describe_route_tables_request',
+    'DescribeRouteTablesResponseBody': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponse': '_describe_route_tables_response',
+    'DescribeRouterInterfacesRequest': '_describe_router_interfaces_request',
+    'DescribeRouterInterfacesResponseBody': '_describe_router_interfaces_response_body',
+    'DescribeRouterInterfacesResponse': '_describe_router_interfaces_response',
+    'DescribeSavingsPlanEstimationRequest': '_describe_savings_plan_estimation_request',
+    'DescribeSavingsPlanEstimationResponseBody': '_describe_savings_plan_estimation_response_body',
+    'DescribeSavingsPlanEstimationResponse': '_describe_savings_plan_estimation_response',
+    'DescribeSavingsPlanPriceRequest': '_describe_savings_plan_price_request',
+    'DescribeSavingsPlanPriceResponseBody': '_describe_savings_plan_price_response_body',
+    'DescribeSavingsPlanPriceResponse': '_describe_savings_plan_price_response',
+    'DescribeSecurityGroupAttributeRequest': '_describe_security_group_attribute_request',
+    'DescribeSecurityGroupAttributeResponseBody': '_describe_security_group_attribute_response_body',
+    'DescribeSecurityGroupAttributeResponse': '_describe_security_group_attribute_response',
+    'DescribeSecurityGroupReferencesRequest': '_describe_security_group_references_request',
+    'DescribeSecurityGroupReferencesResponseBody': '_describe_security_group_references_response_body',
+    'DescribeSecurityGroupReferencesResponse': '_describe_security_group_references_response',
+    'DescribeSecurityGroupsRequest': '_describe_security_groups_request',
+    'DescribeSecurityGroupsResponseBody': '_describe_security_groups_response_body',
+    'DescribeSecurityGroupsResponse': '_describe_security_groups_response',
+    'DescribeSendFileResultsRequest': '_describe_send_file_results_request',
+    'DescribeSendFileResultsResponseBody': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponse': '_describe_send_file_results_response',
+    'DescribeSnapshotGroupsRequest': '_describe_snapshot_groups_request',
+    'DescribeSnapshotGroupsResponseBody': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponse': '_describe_snapshot_groups_response',
+    'DescribeSnapshotLinksRequest': '_describe_snapshot_links_request',
+    'DescribeSnapshotLinksResponseBody': '_describe_snapshot_links_response_body',
+    'DescribeSnapshotLinksResponse': '_describe_snapshot_links_response',
+    'DescribeSnapshotMonitorDataRequest': '_describe_snapshot_monitor_data_request',
+    'DescribeSnapshotMonitorDataResponseBody': '_describe_snapshot_monitor_data_response_body',
+    'DescribeSnapshotMonitorDataResponse': '_describe_snapshot_monitor_data_response',
+    'DescribeSnapshotPackageRequest': '_describe_snapshot_package_request',
+    'DescribeSnapshotPackageResponseBody': '_describe_snapshot_package_response_body',
+    'DescribeSnapshotPackageResponse': '_describe_snapshot_package_response',
+    'DescribeSnapshotsRequest': '_describe_snapshots_request',
+    'DescribeSnapshotsResponseBody': '_describe_snapshots_response_body',
+    'DescribeSnapshotsResponse': '_describe_snapshots_response',
+    'DescribeSnapshotsUsageRequest': '_describe_snapshots_usage_request',
+    'DescribeSnapshotsUsageResponseBody': '_describe_snapshots_usage_response_body',
+    'DescribeSnapshotsUsageResponse': '_describe_snapshots_usage_response',
+    'DescribeSpotAdviceRequest': '_describe_spot_advice_request',
+    'DescribeSpotAdviceResponseBody': '_describe_spot_advice_response_body',
+    'DescribeSpotAdviceResponse': '_describe_spot_advice_response',
+    'DescribeSpotPriceHistoryRequest': '_describe_spot_price_history_request',
+    'DescribeSpotPriceHistoryResponseBody': '_describe_spot_price_history_response_body',
+    'DescribeSpotPriceHistoryResponse': '_describe_spot_price_history_response',
+    'DescribeStorageCapacityUnitsRequest': '_describe_storage_capacity_units_request',
+    'DescribeStorageCapacityUnitsResponseBody': '_describe_storage_capacity_units_response_body',
+    'DescribeStorageCapacityUnitsResponse': '_describe_storage_capacity_units_response',
+    'DescribeStorageSetDetailsRequest': '_describe_storage_set_details_request',
+    'DescribeStorageSetDetailsResponseBody': '_describe_storage_set_details_response_body',
+    'DescribeStorageSetDetailsResponse': '_describe_storage_set_details_response',
+    'DescribeStorageSetsRequest': '_describe_storage_sets_request',
+    'DescribeStorageSetsResponseBody': '_describe_storage_sets_response_body',
+    'DescribeStorageSetsResponse': '_describe_storage_sets_response',
+    'DescribeTagsRequest': '_describe_tags_request',
+    'DescribeTagsResponseBody': '_describe_tags_response_body',
+    'DescribeTagsResponse': '_describe_tags_response',
+    'DescribeTaskAttributeRequest': '_describe_task_attribute_request',
+    'DescribeTaskAttributeResponseBody': '_describe_task_attribute_response_body',
+    'DescribeTaskAttributeResponse': '_describe_task_attribute_response',
+    'DescribeTasksRequest': '_describe_tasks_request',
+    'DescribeTasksResponseBody': '_describe_tasks_response_body',
+    'DescribeTasksResponse': '_describe_tasks_response',
+    'DescribeTerminalSessionsRequest': '_describe_terminal_sessions_request',
+    'DescribeTerminalSessionsResponseBody': '_describe_terminal_sessions_response_body',
+    'DescribeTerminalSessionsResponse': '_describe_terminal_sessions_response',
+    'DescribeUserBusinessBehaviorRequest': '_describe_user_business_behavior_request',
+    'DescribeUserBusinessBehaviorResponseBody': '_describe_user_business_behavior_response_body',
+    'DescribeUserBusinessBehaviorResponse': '_describe_user_business_behavior_response',
+    'DescribeUserDataRequest': '_describe_user_data_request',
+    'DescribeUserDataResponseBody': '_describe_user_data_response_body',
+    'DescribeUserDataResponse': '_describe_user_data_response',
+    'DescribeVRoutersRequest': '_describe_vrouters_request',
+    'DescribeVRoutersResponseBody': '_describe_vrouters_response_body',
+    'DescribeVRoutersResponse': '_describe_vrouters_response',
+    'DescribeVSwitchesRequest': '_describe_vswitches_request',
+    'DescribeVSwitchesResponseBody': '_describe_vswitches_response_body',
+    'DescribeVSwitchesResponse': '_describe_vswitches_response',
+    'DescribeVirtualBorderRoutersRequest': '_describe_virtual_border_routers_request',
+    'DescribeVirtualBorderRoutersResponseBody': '_describe_virtual_border_routers_response_body',
+    'DescribeVirtualBorderRoutersResponse': '_describe_virtual_border_routers_response',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequest': '_describe_virtual_border_routers_for_physical_connection_request',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody': '_describe_virtual_border_routers_for_physical_connection_response_body',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponse': '_describe_virtual_border_routers_for_physical_connection_response',
+    'DescribeVpcsRequest': '_describe_vpcs_request',
+    'DescribeVpcsResponseBody': '_describe_vpcs_response_body',
+    'DescribeVpcsResponse': '_describe_vpcs_response',
+    'DescribeZonesRequest': '_describe_zones_request',
+    'DescribeZonesResponseBody': '_describe_zones_response_body',
+    'DescribeZonesResponse': '_describe_zones_response',
+    'DetachClassicLinkVpcRequest': '_detach_classic_link_vpc_request',
+    'DetachClassicLinkVpcResponseBody': '_detach_classic_link_vpc_response_body',
+    'DetachClassicLinkVpcResponse': '_detach_classic_link_vpc_response',
+    'DetachDiskRequest': '_detach_disk_request',
+    'DetachDiskResponseBody': '_detach_disk_response_body',
+    'DetachDiskResponse': '_detach_disk_response',
+    'DetachInstanceRamRoleRequest': '_detach_instance_ram_role_request',
+    'DetachInstanceRamRoleResponseBody': '_detach_instance_ram_role_response_body',
+    'DetachInstanceRamRoleResponse': '_detach_instance_ram_role_response',
+    'DetachKeyPairRequest': '_detach_key_pair_request',
+    'DetachKeyPairResponseBody': '_detach_key_pair_response_body',
+    'DetachKeyPairResponse': '_detach_key_pair_response',
+    'DetachNetworkInterfaceRequest': '_detach_network_interface_request',
+    'DetachNetworkInterfaceResponseBody': '_detach_network_interface_response_body',
+    'DetachNetworkInterfaceResponse': '_detach_network_interface_response',
+    'DisableActivationRequest': '_disable_activation_request',
+    'DisableActivationResponseBody': '_disable_activation_response_body',
+    'DisableActivationResponse': '_disable_activation_response',
+    'DisableDiskEncryptionByDefaultRequest': '_disable_disk_encryption_by_default_request',
+    'DisableDiskEncryptionByDefaultResponseBody': '_disable_disk_encryption_by_default_response_body',
+    'DisableDiskEncryptionByDefaultResponse': '_disable_disk_encryption_by_default_response',
+    'DisableNetworkInterfaceQoSRequest': '_disable_network_interface_qo_srequest',
+    'DisableNetworkInterfaceQoSResponseBody': '_disable_network_interface_qo_sresponse_body',
+    'DisableNetworkInterfaceQoSResponse': '_disable_network_interface_qo_sresponse',
+    'EnableDiskEncryptionByDefaultRequest': '_enable_disk_encryption_by_default_request',
+    'EnableDiskEncryptionByDefaultResponseBody': '_enable_disk_encryption_by_default_response_body',
+    'EnableDiskEncryptionByDefaultResponse': '_enable_disk_encryption_by_default_response',
+    'EnableNetworkInterfaceQoSRequest': '_enable_network_interface_qo_srequest',
+    'EnableNetworkInterfaceQoSResponseBody': '_enable_network_interface_qo_sresponse_body',
+    'EnableNetworkInterfaceQoSResponse': '_enable_network_interface_qo_sresponse',
+    'EnablePhysicalConnectionRequest': '_enable_physical_connection_request',
+    'EnablePhysicalConnectionResponseBody': '_enable_physical_connection_response_body',
+    'EnablePhysicalConnectionResponse': '_enable_physical_connection_response',
+    'EndTerminalSessionRequest': '_end_terminal_session_request',
+    'EndTerminalSessionResponseBody': '_end_terminal_session_response_body',
+    'EndTerminalSessionResponse': '_end_terminal_session_response',
+    'ExportImageRequest': '_export_image_request',
+    'ExportImageResponseBody': '_export_image_response_body',
+    'ExportImageResponse': '_export_image_response',
+    'ExportSnapshotRequest': '_export_snapshot_request',
+    'ExportSnapshotResponseBody': '_export_snapshot_response_body',
+    'ExportSnapshotResponse': '_export_snapshot_response',
+    'GetInstanceConsoleOutputRequest': '_get_instance_console_output_request',
+    'GetInstanceConsoleOutputResponseBody': '_get_instance_console_output_response_body',
+    'GetInstanceConsoleOutputResponse': '_get_instance_console_output_response',
+    'GetInstanceScreenshotRequest': '_get_instance_screenshot_request',
+    'GetInstanceScreenshotResponseBody': '_get_instance_screenshot_response_body',
+    'GetInstanceScreenshotResponse': '_get_instance_screenshot_response',
+    'ImportImageRequest': '_import_image_request',
+    'ImportImageResponseBody': '_import_image_response_body',
+    'ImportImageResponse': '_import_image_response',
+    'ImportKeyPairRequest': '_import_key_pair_request',
+    'ImportKeyPairResponseBody': '_import_key_pair_response_body',
+    'ImportKeyPairResponse': '_import_key_pair_response',
+    'InstallCloudAssistantRequest': '_install_cloud_assistant_request',
+    'InstallCloudAssistantResponseBody': '_install_cloud_assistant_response_body',
+    'InstallCloudAssistantResponse': '_install_cloud_assistant_response',
+    'InvokeCommandRequest': '_invoke_command_request',
+    'InvokeCommandShrinkRequest': '_invoke_command_shrink_request',
+    'InvokeCommandResponseBody': '_invoke_command_response_body',
+    'InvokeCommandResponse': '_invoke_command_response',
+    'JoinResourceGroupRequest': '_join_resource_group_request',
+    'JoinResourceGroupResponseBody': '_join_resource_group_response_body',
+    'JoinResourceGroupResponse': '_join_resource_group_response',
+    'JoinSecurityGroupRequest': '_join_security_group_request',
+    'JoinSecurityGroupResponseBody': '_join_security_group_response_body',
+    'JoinSecurityGroupResponse': '_join_security_group_response',
+    'LeaveSecurityGroupRequest': '_leave_security_group_request',
+    'LeaveSecurityGroupResponseBody': '_leave_security_group_response_body',
+    'LeaveSecurityGroupResponse': '_leave_security_group_response',
+    'ListPluginStatusRequest': '_list_plugin_status_request',
+    'ListPluginStatusResponseBody': '_list_plugin_status_response_body',
+    'ListPluginStatusResponse': '_list_plugin_status_response',
+    'ListTagResourcesRequest': '_list_tag_resources_request',
+    'ListTagResourcesResponseBody': '_list_tag_resources_response_body',
+    'ListTagResourcesResponse': '_list_tag_resources_response',
+    'LockSnapshotRequest': '_lock_snapshot_request',
+    'LockSnapshotResponseBody': '_lock_snapshot_response_body',
+    'LockSnapshotResponse': '_lock_snapshot_response',
+    'ModifyAutoProvisioningGroupRequest': '_modify_auto_provisioning_group_request',
+    'ModifyAutoProvisioningGroupResponseBody': '_modify_auto_provisioning_group_response_body',
+    'ModifyAutoProvisioningGroupResponse': '_modify_auto_provisioning_group_response',
+    'ModifyAutoSnapshotPolicyExRequest': '_modify_auto_snapshot_policy_ex_request',
+    'ModifyAutoSnapshotPolicyExResponseBody': '_modify_auto_snapshot_policy_ex_response_body',
+    'ModifyAutoSnapshotPolicyExResponse': '_modify_auto_snapshot_policy_ex_response',
+    'ModifyBandwidthPackageSpecRequest': '_modify_bandwidth_package_spec_request',
+    'ModifyBandwidthPackageSpecResponseBody': '_modify_bandwidth_package_spec_response_body',
+    'ModifyBandwidthPackageSpecResponse': '_modify_bandwidth_package_spec_response',
+    'ModifyCapacityReservationRequest': '_modify_capacity_reservation_request',
+    'ModifyCapacityReservationResponseBody': '_modify_capacity_reservation_response_body',
+    'ModifyCapacityReservationResponse': '_modify_capacity_reservation_response',
+    'ModifyCloudAssistantSettingsRequest': '_modify_cloud_assistant_settings_request',
+    'ModifyCloudAssistantSettingsShrinkRequest': '_modify_cloud_assistant_settings_shrink_request',
+    'ModifyCloudAssistantSettingsResponseBody': '_modify_cloud_assistant_settings_response_body',
+    'ModifyCloudAssistantSettingsResponse': '_modify_cloud_assistant_settings_response',
+    'ModifyCommandRequest': '_modify_command_request',
+    'ModifyCommandResponseBody': '_modify_command_response_body',
+    'ModifyCommandResponse': '_modify_command_response',
+    'ModifyDedicatedHostAttributeRequest': '_modify_dedicated_host_attribute_request',
+    'ModifyDedicatedHostAttributeResponseBody': '_modify_dedicated_host_attribute_response_body',
+    'ModifyDedicatedHostAttributeResponse': '_modify_dedicated_host_attribute_response',
+    'ModifyDedicatedHostAutoReleaseTimeRequest': '_modify_dedicated_host_auto_release_time_request',
+    'ModifyDedicatedHostAutoReleaseTimeResponseBody': '_modify_dedicated_host_auto_release_time_response_body',
+    'ModifyDedicatedHostAutoReleaseTimeResponse': '_modify_dedicated_host_auto_release_time_response',
+    'ModifyDedicatedHostAutoRenewAttributeRequest': '_modify_dedicated_host_auto_renew_attribute_request',
+    'ModifyDedicatedHostAutoRenewAttributeResponseBody': '_modify_dedicated_host_auto_renew_attribute_response_body',
+    'ModifyDedicatedHostAutoRenewAttributeResponse': '_modify_dedicated_host_auto_renew_attribute_response',
+    'ModifyDedicatedHostClusterAttributeRequest': '_modify_dedicated_host_cluster_attribute_request',
+    'ModifyDedicatedHostClusterAttributeResponseBody': '_modify_dedicated_host_cluster_attribute_response_body',
+    'ModifyDedicatedHostClusterAttributeResponse': '_modify_dedicated_host_cluster_attribute_response',
+    'ModifyDedicatedHostsChargeTypeRequest': '_modify_dedicated_hosts_charge_type_request',
+    'ModifyDedicatedHostsChargeTypeResponseBody': '_modify_dedicated_hosts_charge_type_response_body',
+    'ModifyDedicatedHostsChargeTypeResponse': '_modify_dedicated_hosts_charge_type_response',
+    'ModifyDeploymentSetAttributeRequest': '_modify_deployment_set_attribute_request',
+    'ModifyDeploymentSetAttributeResponseBody': '_modify_deployment_set_attribute_response_body',
+    'ModifyDeploymentSetAttributeResponse': '_modify_deployment_set_attribute_response',
+    'ModifyDiagnosticMetricSetRequest': '_modify_diagnostic_metric_set_request',
+    'ModifyDiagnosticMetricSetResponseBody': '_modify_diagnostic_metric_set_response_body',
+    'ModifyDiagnosticMetricSetResponse': '_modify_diagnostic_metric_set_response',
+    'ModifyDiskAttributeRequest': '_modify_disk_attribute_request',
+    'ModifyDiskAttributeResponseBody': '_modify_disk_attribute_response_body',
+    'ModifyDiskAttributeResponse': '_modify_disk_attribute_response',
+    'ModifyDiskChargeTypeRequest': '_modify_disk_charge_type_request',
+    'ModifyDiskChargeTypeResponseBody': '_modify_disk_charge_type_response_body',
+    'ModifyDiskChargeTypeResponse': '_modify_disk_charge_type_response',
+    'ModifyDiskDefaultKMSKeyIdRequest': '_modify_disk_default_kmskey_id_request',
+    'ModifyDiskDefaultKMSKeyIdResponseBody': '_modify_disk_default_kmskey_id_response_body',
+    'ModifyDiskDefaultKMSKeyIdResponse': '_modify_disk_default_kmskey_id_response',
+    'ModifyDiskDeploymentRequest': '_modify_disk_deployment_request',
+    'ModifyDiskDeploymentResponseBody': '_modify_disk_deployment_response_body',
+    'ModifyDiskDeploymentResponse': '_modify_disk_deployment_response',
+    'ModifyDiskSpecRequest': '_modify_disk_spec_request',
+    'ModifyDiskSpecResponseBody': '_modify_disk_spec_response_body',
+    'ModifyDiskSpecResponse': '_modify_disk_spec_response',
+    'ModifyEipAddressAttributeRequest': '_modify_eip_address_attribute_request',
+    'ModifyEipAddressAttributeResponseBody': '_modify_eip_address_attribute_response_body',
+    'ModifyEipAddressAttributeResponse': '_modify_eip_address_attribute_response',
+    'ModifyElasticityAssuranceRequest': '_modify_elasticity_assurance_request',
+    'ModifyElasticityAssuranceResponseBody': '_modify_elasticity_assurance_response_body',
+    'ModifyElasticityAssuranceResponse': '_modify_elasticity_assurance_response',
+    'ModifyElasticityAssuranceAutoRenewAttributeRequest': '_modify_elasticity_assurance_auto_renew_attribute_request',
+    'ModifyElasticityAssuranceAutoRenewAttributeResponseBody': '_modify_elasticity_assurance_auto_renew_attribute_response_body',
+    'ModifyElasticityAssuranceAutoRenewAttributeResponse': '_modify_elasticity_assurance_auto_renew_attribute_response',
+    'ModifyForwardEntryRequest': '_modify_forward_entry_request',
+    'ModifyForwardEntryResponseBody': '_modify_forward_entry_response_body',
+    'ModifyForwardEntryResponse': '_modify_forward_entry_response',
+    'ModifyHaVipAttributeRequest': '_modify_ha_vip_attribute_request',
+    'ModifyHaVipAttributeResponseBody': '_modify_ha_vip_attribute_response_body',
+    'ModifyHaVipAttributeResponse': '_modify_ha_vip_attribute_response',
+    'ModifyHpcClusterAttributeRequest': '_modify_hpc_cluster_attribute_request',
+    'ModifyHpcClusterAttributeResponseBody': '_modify_hpc_cluster_attribute_response_body',
+    'ModifyHpcClusterAttributeResponse': '_modify_hpc_cluster_attribute_response',
+    'ModifyImageAttributeRequest': '_modify_image_attribute_request',
+    'ModifyImageAttributeResponseBody': '_modify_image_attribute_response_body',
+    'ModifyImageAttributeResponse': '_modify_image_attribute_response',
+    'ModifyImageShareGroupPermissionRequest': '_modify_image_share_group_permission_request',
+    'ModifyImageShareGroupPermissionResponseBody': '_modify_image_share_group_permission_response_body',
+    'ModifyImageShareGroupPermissionResponse': '_modify_image_share_group_permission_response',
+    'ModifyImageSharePermissionRequest': '_modify_image_share_permission_request',
+    'ModifyImageSharePermissionResponseBody': '_modify_image_share_permission_response_body',
+    'ModifyImageSharePermissionResponse': '_modify_image_share_permission_response',
+    'ModifyInstanceAttachmentAttributesRequest': '_modify_instance_attachment_attributes_request',
+    'ModifyInstanceAttachmentAttributesResponseBody': '_modify_instance_attachment_attributes_response_body',
+    'ModifyInstanceAttachmentAttributesResponse': '_modify_instance_attachment_attributes_response',
+    'ModifyInstanceAttributeRequest': '_modify_instance_attribute_request',
+    'ModifyInstanceAttributeResponseBody': '_modify_instance_attribute_response_body',
+    'ModifyInstanceAttributeResponse': '_modify_instance_attribute_response',
+    'ModifyInstanceAutoReleaseTimeRequest': '_modify_instance_auto_release_time_request',
+    'ModifyInstanceAutoReleaseTimeResponseBody': '_modify_instance_auto_release_time_response_body',
+    'ModifyInstanceAutoReleaseTimeResponse': '_modify_instance_auto_release_time_response',
+    'ModifyInstanceAutoRenewAttributeRequest': '_modify_instance_auto_renew_attribute_request',
+    'ModifyInstanceAutoRenewAttributeResponseBody': '_modify_instance_auto_renew_attribute_response_body',
+    'ModifyInstanceAutoRenewAttributeResponse': '_modify_instance_auto_renew_attribute_response',
+    'ModifyInstanceChargeTypeRequest': '_modify_instance_charge_type_request',
+    'ModifyInstanceChargeTypeResponseBody': '_modify_instance_charge_type_response_body',
+    'ModifyInstanceChargeTypeResponse': '_modify_instance_charge_type_response',
+    'ModifyInstanceClockOptionsRequest': '_modify_instance_clock_options_request',
+    'ModifyInstanceClockOptionsResponseBody': '_modify_instance_clock_options_response_body',
+    'ModifyInstanceClockOptionsResponse': '_modify_instance_clock_options_response',
+    'ModifyInstanceDeploymentRequest': '_modify_instance_deployment_request',
+    'ModifyInstanceDeploymentResponseBody': '_modify_instance_deployment_response_body',
+    'ModifyInstanceDeploymentResponse': '_modify_instance_deployment_response',
+    'ModifyInstanceMaintenanceAttributesRequest': '_modify_instance_maintenance_attributes_request',
+    'ModifyInstanceMaintenanceAttributesResponseBody': '_modify_instance_maintenance_attributes_response_body',
+    'ModifyInstanceMaintenanceAttributesResponse': '_modify_instance_maintenance_attributes_response',
+    'ModifyInstanceMetadataOptionsRequest': '_modify_instance_metadata_options_request',
+    'ModifyInstanceMetadataOptionsResponseBody': '_modify_instance_metadata_options_response_body',
+    'ModifyInstanceMetadataOptionsResponse': '_modify_instance_metadata_options_response',
+    'ModifyInstanceNetworkOptionsRequest': '_modify_instance_network_options_request',
+    'ModifyInstanceNetworkOptionsResponseBody': '_modify_instance_network_options_response_body',
+    'ModifyInstanceNetworkOptionsResponse': '_modify_instance_network_options_response',
+    'ModifyInstanceNetworkSpecRequest': '_modify_instance_network_spec_request',
+    'ModifyInstanceNetworkSpecResponseBody': '_modify_instance_network_spec_response_body',
+    'ModifyInstanceNetworkSpecResponse': '_modify_instance_network_spec_response',
+    'ModifyInstanceSpecRequest': '_modify_instance_spec_request',
+    'ModifyInstanceSpecResponseBody': '_modify_instance_spec_response_body',
+    'ModifyInstanceSpecResponse': '_modify_instance_spec_response',
+    'ModifyInstanceVncPasswdRequest': '_modify_instance_vnc_passwd_request',
+    'ModifyInstanceVncPasswdResponseBody': '_modify_instance_vnc_passwd_response_body',
+    'ModifyInstanceVncPasswdResponse': '_modify_instance_vnc_passwd_response',
+    'ModifyInstanceVpcAttributeRequest': '_modify_instance_vpc_attribute_request',
+    'ModifyInstanceVpcAttributeResponseBody': '_modify_instance_vpc_attribute_response_body',
+    'ModifyInstanceVpcAttributeResponse': '_modify_instance_vpc_attribute_response',
+    'ModifyInvocationAttributeRequest': '_modify_invocation_attribute_request',
+    'ModifyInvocationAttributeShrinkRequest': '_modify_invocation_attribute_shrink_request',
+    'ModifyInvocationAttributeResponseBody': '_modify_invocation_attribute_response_body',
+    'ModifyInvocationAttributeResponse': '_modify_invocation_attribute_response',
+    'ModifyLaunchTemplateDefaultVersionRequest': '_modify_launch_template_default_version_request',
+    'ModifyLaunchTemplateDefaultVersionResponseBody': '_modify_launch_template_default_version_response_body',
+    'ModifyLaunchTemplateDefaultVersionResponse': '_modify_launch_template_default_version_response',
+    'ModifyManagedInstanceRequest': '_modify_managed_instance_request',
+    'ModifyManagedInstanceResponseBody': '_modify_managed_instance_response_body',
+    'ModifyManagedInstanceResponse': '_modify_managed_instance_response',
+    'ModifyNetworkInterfaceAttributeRequest': '_modify_network_interface_attribute_request',
+    'ModifyNetworkInterfaceAttributeResponseBody': '_modify_network_interface_attribute_response_body',
+    'ModifyNetworkInterfaceAttributeResponse': '_modify_network_interface_attribute_response',
+    'ModifyPhysicalConnectionAttributeRequest': '_modify_physical_connection_attribute_request',
+    'ModifyPhysicalConnectionAttributeResponseBody': '_modify_physical_connection_attribute_response_body',
+    'ModifyPhysicalConnectionAttributeResponse': '_modify_physical_connection_attribute_response',
+    'ModifyPortRangeListRequest': '_modify_port_range_list_request',
+    'ModifyPortRangeListResponseBody': '_modify_port_range_list_response_body',
+    'ModifyPortRangeListResponse': '_modify_port_range_list_response',
+    'ModifyPrefixListRequest': '_modify_prefix_list_request',
+    'ModifyPrefixListResponseBody': '_modify_prefix_list_response_body',
+    'ModifyPrefixListResponse': '_modify_prefix_list_response',
+    'ModifyPrepayInstanceSpecRequest': '_modify_prepay_instance_spec_request',
+    'ModifyPrepayInstanceSpecResponseBody': '_modify_prepay_instance_spec_response_body',
+    'ModifyPrepayInstanceSpecResponse': '_modify_prepay_instance_spec_response',
+    'ModifyReservedInstanceAttributeRequest': '_modify_reserved_instance_attribute_request',
+    'ModifyReservedInstanceAttributeResponseBody': '_modify_reserved_instance_attribute_response_body',
+    'ModifyReservedInstanceAttributeResponse': '_modify_reserved_instance_attribute_response',
+    'ModifyReservedInstanceAutoRenewAttributeRequest': '_modify_reserved_instance_auto_renew_attribute_request',
+    'ModifyReservedInstanceAutoRenewAttributeResponseBody': '_modify_reserved_instance_auto_renew_attribute_response_body',
+    'ModifyReservedInstanceAutoRenewAttributeResponse': '_modify_reserved_instance_auto_renew_attribute_response',
+    'ModifyReservedInstancesRequest': '_modify_reserved_instances_request',
+    'ModifyReservedInstancesResponseBody': '_modify_reserved_instances_response_body',
+    'ModifyReservedInstancesResponse': '_modify_reserved_instances_response',
+    'ModifyRouterInterfaceAttributeRequest': '_modify_router_interface_attribute_request',
+    'ModifyRouterInterfaceAttributeResponseBody': '_modify_router_interface_attribute_response_body',
+    'ModifyRouterInterfaceAttributeResponse': '_modify_router_interface_attribute_response',
+    'ModifyRouterInterfaceSpecRequest': '_modify_router_interface_spec_request',
+    'ModifyRouterInterfaceSpecResponseBody': '_modify_router_interface_spec_response_body',
+    'ModifyRouterInterfaceSpecResponse': '_modify_router_interface_spec_response',
+    'ModifySecurityGroupAttributeRequest': '_modify_security_group_attribute_request',
+    'ModifySecurityGroupAttributeResponseBody': '_modify_security_group_attribute_response_body',
+    'ModifySecurityGroupAttributeResponse': '_modify_security_group_attribute_response',
+    'ModifySecurityGroupEgressRuleRequest': '_modify_security_group_egress_rule_request',
+    'ModifySecurityGroupEgressRuleResponseBody': '_modify_security_group_egress_rule_response_body',
+    'ModifySecurityGroupEgressRuleResponse': '_modify_security_group_egress_rule_response',
+    'ModifySecurityGroupPolicyRequest': '_modify_security_group_policy_request',
+    'ModifySecurityGroupPolicyResponseBody': '_modify_security_group_policy_response_body',
+    'ModifySecurityGroupPolicyResponse': '_modify_security_group_policy_response',
+    'ModifySecurityGroupRuleRequest': '_modify_security_group_rule_request',
+    'ModifySecurityGroupRuleResponseBody': '_modify_security_group_rule_response_body',
+    'ModifySecurityGroupRuleResponse': '_modify_security_group_rule_response',
+    'ModifySnapshotAttributeRequest': '_modify_snapshot_attribute_request',
+    'ModifySnapshotAttributeResponseBody': '_modify_snapshot_attribute_response_body',
+    'ModifySnapshotAttributeResponse': '_modify_snapshot_attribute_response',
+    'ModifySnapshotCategoryRequest': '_modify_snapshot_category_request',
+    'ModifySnapshotCategoryResponseBody': '_modify_snapshot_category_response_body',
+    'ModifySnapshotCategoryResponse': '_modify_snapshot_category_response',
+    'ModifySnapshotGroupRequest': '_modify_snapshot_group_request',
+    'ModifySnapshotGroupResponseBody': '_modify_snapshot_group_response_body',
+    'ModifySnapshotGroupResponse': '_modify_snapshot_group_response',
+    'ModifyStorageCapacityUnitAttributeRequest': '_modify_storage_capacity_unit_attribute_request',
+    'ModifyStorageCapacityUnitAttributeResponseBody': '_modify_storage_capacity_unit_attribute_response_body',
+    'ModifyStorageCapacityUnitAttributeResponse': '_modify_storage_capacity_unit_attribute_response',
+    'ModifyStorageSetAttributeRequest': '_modify_storage_set_attribute_request',
+    'ModifyStorageSetAttributeResponseBody': '_modify_storage_set_attribute_response_body',
+    'ModifyStorageSetAttributeResponse': '_modify_storage_set_attribute_response',
+    'ModifyUserBusinessBehaviorRequest': '_modify_user_business_behavior_request',
+    'ModifyUserBusinessBehaviorResponseBody': '_modify_user_business_behavior_response_body',
+    'ModifyUserBusinessBehaviorResponse': '_modify_user_business_behavior_response',
+    'ModifyVRouterAttributeRequest': '_modify_vrouter_attribute_request',
+    'ModifyVRouterAttributeResponseBody': '_modify_vrouter_attribute_response_body',
+    'ModifyVRouterAttributeResponse': '_modify_vrouter_attribute_response',
+    'ModifyVSwitchAttributeRequest': '_modify_vswitch_attribute_request',
+    'ModifyVSwitchAttributeResponseBody': '_modify_vswitch_attribute_response_body',
+    'ModifyVSwitchAttributeResponse': '_modify_vswitch_attribute_response',
+    'ModifyVirtualBorderRouterAttributeRequest': '_modify_virtual_border_router_attribute_request',
+    'ModifyVirtualBorderRouterAttributeResponseBody': '_modify_virtual_border_router_attribute_response_body',
+    'ModifyVirtualBorderRouterAttributeResponse': '_modify_virtual_border_router_attribute_response',
+    'ModifyVpcAttributeRequest': '_modify_vpc_attribute_request',
+    'ModifyVpcAttributeResponseBody': '_modify_vpc_attribute_response_body',
+    'ModifyVpcAttributeResponse': '_modify_vpc_attribute_response',
+    'OpenSnapshotServiceRequest': '_open_snapshot_service_request',
+    'OpenSnapshotServiceResponseBody': '_open_snapshot_service_response_body',
+    'OpenSnapshotServiceResponse': '_open_snapshot_service_response',
+    'PurchaseElasticityAssuranceRequest': '_purchase_elasticity_assurance_request',
+    'PurchaseElasticityAssuranceResponseBody': '_purchase_elasticity_assurance_response_body',
+    'PurchaseElasticityAssuranceResponse': '_purchase_elasticity_assurance_response',
+    'PurchaseReservedInstancesOfferingRequest': '_purchase_reserved_instances_offering_request',
+    'PurchaseReservedInstancesOfferingResponseBody': '_purchase_reserved_instances_offering_response_body',
+    'PurchaseReservedInstancesOfferingResponse': '_purchase_reserved_instances_offering_response',
+    'PurchaseStorageCapacityUnitRequest': '_purchase_storage_capacity_unit_request',
+    'PurchaseStorageCapacityUnitResponseBody': '_purchase_storage_capacity_unit_response_body',
+    'PurchaseStorageCapacityUnitResponse': '_purchase_storage_capacity_unit_response',
+    'ReActivateInstancesRequest': '_re_activate_instances_request',
+    'ReActivateInstancesResponseBody': '_re_activate_instances_response_body',
+    'ReActivateInstancesResponse': '_re_activate_instances_response',
+    'ReInitDiskRequest': '_re_init_disk_request',
+    'ReInitDiskResponseBody': '_re_init_disk_response_body',
+    'ReInitDiskResponse': '_re_init_disk_response',
+    'RebootInstanceRequest': '_reboot_instance_request',
+    'RebootInstanceResponseBody': '_reboot_instance_response_body',
+    'RebootInstanceResponse': '_reboot_instance_response',
+    'RebootInstancesRequest': '_reboot_instances_request',
+    'RebootInstancesResponseBody': '_reboot_instances_response_body',
+    'RebootInstancesResponse': '_reboot_instances_response',
+    'RecoverVirtualBorderRouterRequest': '_recover_virtual_border_router_request',
+    'RecoverVirtualBorderRouterResponseBody': '_recover_virtual_border_router_response_body',
+    'RecoverVirtualBorderRouterResponse': '_recover_virtual_border_router_response',
+    'RedeployDedicatedHostRequest': '_redeploy_dedicated_host_request',
+    'RedeployDedicatedHostResponseBody': '_redeploy_dedicated_host_response_body',
+    'RedeployDedicatedHostResponse': '_redeploy_dedicated_host_response',
+    'RedeployInstanceRequest': '_redeploy_instance_request',
+    'RedeployInstanceResponseBody': '_redeploy_instance_response_body',
+    'RedeployInstanceResponse': '_redeploy_instance_response',
+    'ReleaseCapacityReservationRequest': '_release_capacity_reservation_request',
+    'ReleaseCapacityReservationResponseBody': '_release_capacity_reservation_response_body',
+    'ReleaseCapacityReservationResponse': '_release_capacity_reservation_response',
+    'ReleaseDedicatedHostRequest': '_release_dedicated_host_request',
+    'ReleaseDedicatedHostResponseBody': '_release_dedicated_host_response_body',
+    'ReleaseDedicatedHostResponse': '_release_dedicated_host_response',
+    'ReleaseEipAddressRequest': '_release_eip_address_request',
+    'ReleaseEipAddressResponseBody': '_release_eip_address_response_body',
+    'ReleaseEipAddressResponse': '_release_eip_address_response',
+    'ReleasePublicIpAddressRequest': '_release_public_ip_address_request',
+    'ReleasePublicIpAddressResponseBody': '_release_public_ip_address_response_body',
+    'ReleasePublicIpAddressResponse': '_release_public_ip_address_response',
+    'RemoveBandwidthPackageIpsRequest': '_remove_bandwidth_package_ips_request',
+    'RemoveBandwidthPackageIpsResponseBody': '_remove_bandwidth_package_ips_response_body',
+    'RemoveBandwidthPackageIpsResponse': '_remove_bandwidth_package_ips_response',
+    'RemoveTagsRequest': '_remove_tags_request',
+    'RemoveTagsResponseBody': '_remove_tags_response_body',
+    'RemoveTagsResponse': '_remove_tags_response',
+    'RenewDedicatedHostsRequest': '_renew_dedicated_hosts_request',
+    'RenewDedicatedHostsResponseBody': '_renew_dedicated_hosts_response_body',
+    'RenewDedicatedHostsResponse': '_renew_dedicated_hosts_response',
+    'RenewElasticityAssurancesRequest': '_renew_elasticity_assurances_request',
+    'RenewElasticityAssurancesResponseBody': '_renew_elasticity_assurances_response_body',
+    'RenewElasticityAssurancesResponse': '_renew_elasticity_assurances_response',
+    'RenewInstanceRequest': '_renew_instance_request',
+    'RenewInstanceResponseBody': '_renew_instance_response_body',
+    'RenewInstanceResponse': '_renew_instance_response',
+    'RenewReservedInstancesRequest': '_renew_reserved_instances_request',
+    'RenewReservedInstancesResponseBody': '_renew_reserved_instances_response_body',
+    'RenewReservedInstancesResponse': '_renew_reserved_instances_response',
+    'ReplaceSystemDiskRequest': '_replace_system_disk_request',
+    'ReplaceSystemDiskResponseBody': '_replace_system_disk_response_body',
+    'ReplaceSystemDiskResponse': '_replace_system_disk_response',
+    'ReportInstancesStatusRequest': '_report_instances_status_request',
+    'ReportInstancesStatusResponseBody': '_report_instances_status_response_body',
+    'ReportInstancesStatusResponse': '_report_instances_status_response',
+    'ResetDiskRequest': '_reset_disk_request',
+    'ResetDiskResponseBody': '_reset_disk_response_body',
+    'ResetDiskResponse': '_reset_disk_response',
+    'ResetDiskDefaultKMSKeyIdRequest': '_reset_disk_default_kmskey_id_request',
+    'ResetDiskDefaultKMSKeyIdResponseBody': '_reset_disk_default_kmskey_id_response_body',
+    'ResetDiskDefaultKMSKeyIdResponse': '_reset_disk_default_kmskey_id_response',
+    'ResetDisksRequest': '_reset_disks_request',
+    'ResetDisksResponseBody': '_reset_disks_response_body',
+    'ResetDisksResponse': '_reset_disks_response',
+    'ResizeDiskRequest': '_resize_disk_request',
+    'ResizeDiskResponseBody': '_resize_disk_response_body',
+    'ResizeDiskResponse': '_resize_disk_response',
+    'RevokeSecurityGroupRequest': '_revoke_security_group_request',
+    'RevokeSecurityGroupResponseBody': '_revoke_security_group_response_body',
+    'RevokeSecurityGroupResponse': '_revoke_security_group_response',
+    'RevokeSecurityGroupEgressRequest': '_revoke_security_group_egress_request',
+    'RevokeSecurityGroupEgressResponseBody': '_revoke_security_group_egress_response_body',
+    'RevokeSecurityGroupEgressResponse': '_revoke_security_group_egress_response',
+    'RunCommandRequest': '_run_command_request',
+    'RunCommandShrinkRequest': '_run_command_shrink_request',
+    'RunCommandResponseBody': '_run_command_response_body',
+    'RunCommandResponse': '_run_command_response',
+    'RunInstancesRequest': '_run_instances_request',
+    'RunInstancesResponseBody': '_run_instances_response_body',
+    'RunInstancesResponse': '_run_instances_response',
+    'SendFileRequest': '_send_file_request',
+    'SendFileResponseBody': '_send_file_response_body',
+    'SendFileResponse': '_send_file_response',
+    'StartImagePipelineExecutionRequest': '_start_image_pipeline_execution_request',
+    'StartImagePipelineExecutionResponseBody': '_start_image_pipeline_execution_response_body',
+    'StartImagePipelineExecutionResponse': '_start_image_pipeline_execution_response',
+    'StartInstanceRequest': '_start_instance_request',
+    'StartInstanceResponseBody': '_start_instance_response_body',
+    'StartInstanceResponse': '_start_instance_response',
+    'StartInstancesRequest': '_start_instances_request',
+    'StartInstancesResponseBody': '_start_instances_response_body',
+    'StartInstancesResponse': '_start_instances_response',
+    'StartTerminalSessionRequest': '_start_terminal_session_request',
+    'StartTerminalSessionShrinkRequest': '_start_terminal_session_shrink_request',
+    'StartTerminalSessionResponseBody': '_start_terminal_session_response_body',
+    'StartTerminalSessionResponse': '_start_terminal_session_response',
+    'StopInstanceRequest': '_stop_instance_request',
+    'StopInstanceResponseBody': '_stop_instance_response_body',
+    'StopInstanceResponse': '_stop_instance_response',
+    'StopInstancesRequest': '_stop_instances_request',
+    'StopInstancesResponseBody': '_stop_instances_response_body',
+    'StopInstancesResponse': '_stop_instances_response',
+    'StopInvocationRequest': '_stop_invocation_request',
+    'StopInvocationResponseBody': '_stop_invocation_response_body',
+    'StopInvocationResponse': '_stop_invocation_response',
+    'TagResourcesRequest': '_tag_resources_request',
+    'TagResourcesResponseBody': '_tag_resources_response_body',
+    'TagResourcesResponse': '_tag_resources_response',
+    'TerminatePhysicalConnectionRequest': '_terminate_physical_connection_request',
+    'TerminatePhysicalConnectionResponseBody': '_terminate_physical_connection_response_body',
+    'TerminatePhysicalConnectionResponse': '_terminate_physical_connection_response',
+    'TerminateVirtualBorderRouterRequest': '_terminate_virtual_border_router_request',
+    'TerminateVirtualBorderRouterResponseBody': '_terminate_virtual_border_router_response_body',
+    'TerminateVirtualBorderRouterResponse': '_terminate_virtual_border_router_response',
+    'UnassignIpv6AddressesRequest': '_unassign_ipv_6addresses_request',
+    'UnassignIpv6AddressesResponseBody': '_unassign_ipv_6addresses_response_body',
+    'UnassignIpv6AddressesResponse': '_unassign_ipv_6addresses_response',
+    'UnassignPrivateIpAddressesRequest': '_unassign_private_ip_addresses_request',
+    'UnassignPrivateIpAddressesResponseBody': '_unassign_private_ip_addresses_response_body',
+    'UnassignPrivateIpAddressesResponse': '_unassign_private_ip_addresses_response',
+    'UnassociateEipAddressRequest': '_unassociate_eip_address_request',
+    'UnassociateEipAddressResponseBody': '_unassociate_eip_address_response_body',
+    'UnassociateEipAddressResponse': '_unassociate_eip_address_response',
+    'UnassociateHaVipRequest': '_unassociate_ha_vip_request',
+    'UnassociateHaVipResponseBody': '_unassociate_ha_vip_response_body',
+    'UnassociateHaVipResponse': '_unassociate_ha_vip_response',
+    'UnlockSnapshotRequest': '_unlock_snapshot_request',
+    'UnlockSnapshotResponseBody': '_unlock_snapshot_response_body',
+    'UnlockSnapshotResponse': '_unlock_snapshot_response',
+    'UntagResourcesRequest': '_untag_resources_request',
+    'UntagResourcesResponseBody': '_untag_resources_response_body',
+    'UntagResourcesResponse': '_untag_resources_response',
+    'AddTagsRequestTag': '_add_tags_request',
+    'AllocateDedicatedHostsRequestNetworkAttributes': '_allocate_dedicated_hosts_request',
+    'AllocateDedicatedHostsRequestTag': '_allocate_dedicated_hosts_request',
+    'AllocateDedicatedHostsResponseBodyDedicatedHostIdSets': '_allocate_dedicated_hosts_response_body',
+    'AssignIpv6AddressesResponseBodyIpv6PrefixSets': '_assign_ipv_6addresses_response_body',
+    'AssignIpv6AddressesResponseBodyIpv6Sets': '_assign_ipv_6addresses_response_body',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet': '_assign_private_ip_addresses_response_body',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet': '_assign_private_ip_addresses_response_body',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet': '_assign_private_ip_addresses_response_body',
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult': '_attach_instance_ram_role_response_body',
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults': '_attach_instance_ram_role_response_body',
+    'AttachKeyPairResponseBodyResultsResult': '_attach_key_pair_response_body',
+    'AttachKeyPairResponseBodyResults': '_attach_key_pair_response_body',
+    'AuthorizeSecurityGroupRequestPermissions': '_authorize_security_group_request',
+    'AuthorizeSecurityGroupEgressRequestPermissions': '_authorize_security_group_egress_request',
+    'CancelImagePipelineExecutionRequestTemplateTag': '_cancel_image_pipeline_execution_request',
+    'CopyImageRequestTag': '_copy_image_request',
+    'CopySnapshotRequestArn': '_copy_snapshot_request',
+    'CopySnapshotRequestTag': '_copy_snapshot_request',
+    'CreateActivationRequestTag': '_create_activation_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationArn': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationTag': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchConfiguration': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestDataDiskConfig': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestLaunchTemplateConfig': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestPrePaidOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestResourcePoolOptions': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestSystemDiskConfig': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupRequestTag': '_create_auto_provisioning_group_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestDataDiskConfig': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptions': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupShrinkRequestTag': '_create_auto_provisioning_group_shrink_request',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds': '_create_auto_provisioning_group_response_body',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult': '_create_auto_provisioning_group_response_body',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResults': '_create_auto_provisioning_group_response_body',
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn': '_create_auto_snapshot_policy_request',
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration': '_create_auto_snapshot_policy_request',
+    'CreateAutoSnapshotPolicyRequestTag': '_create_auto_snapshot_policy_request',
+    'CreateCapacityReservationRequestPrivatePoolOptions': '_create_capacity_reservation_request',
+    'CreateCapacityReservationRequestTag': '_create_capacity_reservation_request',
+    'CreateCommandRequestTag': '_create_command_request',
+    'CreateDedicatedHostClusterRequestTag': '_create_dedicated_host_cluster_request',
+    'CreateDiskRequestArn': '_create_disk_request',
+    'CreateDiskRequestTag': '_create_disk_request',
+    'CreateElasticityAssuranceRequestPrivatePoolOptions': '_create_elasticity_assurance_request',
+    'CreateElasticityAssuranceRequestRecurrenceRules': '_create_elasticity_assurance_request',
+    'CreateElasticityAssuranceRequestTag': '_create_elasticity_assurance_request',
+    'CreateImageRequestDiskDeviceMapping': '_create_image_request',
+    'CreateImageRequestFeatures': '_create_image_request',
+    'CreateImageRequestTag': '_create_image_request',
+    'CreateImageComponentRequestTag': '_create_image_component_request',
+    'CreateImagePipelineRequestAdvancedOptions': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImageOptionsImageFeatures': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImageOptionsImageTags': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImageOptions': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImportImageOptionsFeatures': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImportImageOptionsImportImageTags': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestImportImageOptions': '_create_image_pipeline_request',
+    'CreateImagePipelineRequestTag': '_create_image_pipeline_request',
+    'CreateInstanceRequestHibernationOptions': '_create_instance_request',
+    'CreateInstanceRequestPrivatePoolOptions': '_create_instance_request',
+    'CreateInstanceRequestSystemDisk': '_create_instance_request',
+    'CreateInstanceRequestArn': '_create_instance_request',
+    'CreateInstanceRequestDataDisk': '_create_instance_request',
+    'CreateInstanceRequestTag': '_create_instance_request',
+    'CreateKeyPairRequestTag': '_create_key_pair_request',
+    'CreateLaunchTemplateRequestSystemDisk': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestDataDisk': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestImageOptions': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestNetworkInterface': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestSecurityOptions': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestTag': '_create_launch_template_request',
+    'CreateLaunchTemplateRequestTemplateTag': '_create_launch_template_request',
+    'CreateLaunchTemplateVersionRequestSystemDisk': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionRequestDataDisk': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionRequestImageOptions': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionRequestNetworkInterface': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionRequestSecurityOptions': '_create_launch_template_version_request',
+    'CreateLaunchTemplateVersionRequestTag': '_create_launch_template_version_request',
+    'CreateNatGatewayRequestBandwidthPackage': '_create_nat_gateway_request',
+    'CreateNatGatewayResponseBodyBandwidthPackageIds': '_create_nat_gateway_response_body',
+    'CreateNatGatewayResponseBodyForwardTableIds': '_create_nat_gateway_response_body',
+    'CreateNetworkInterfaceRequestConnectionTrackingConfiguration': '_create_network_interface_request',
+    'CreateNetworkInterfaceRequestEnhancedNetwork': '_create_network_interface_request',
+    'CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig': '_create_network_interface_request',
+    'CreateNetworkInterfaceRequestTag': '_create_network_interface_request',
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSets': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSets': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyIpv6Sets': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyPrivateIpSets': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodySecurityGroupIds': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyTagsTag': '_create_network_interface_response_body',
+    'CreateNetworkInterfaceResponseBodyTags': '_create_network_interface_response_body',
+    'CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission': '_create_network_interface_permission_response_body',
+    'CreatePortRangeListRequestEntry': '_create_port_range_list_request',
+    'CreatePortRangeListRequestTag': '_create_port_range_list_request',
+    'CreatePrefixListRequestEntry': '_create_prefix_list_request',
+    'CreatePrefixListRequestTag': '_create_prefix_list_request',
+    'CreateRouteEntryRequestNextHopList': '_create_route_entry_request',
+    'CreateSecurityGroupRequestTag': '_create_security_group_request',
+    'CreateSimulatedSystemEventsResponseBodyEventIdSet': '_create_simulated_system_events_response_body',
+    'CreateSnapshotRequestTag': '_create_snapshot_request',
+    'CreateSnapshotGroupRequestTag': '_create_snapshot_group_request',
+    'CreateStorageSetRequestTag': '_create_storage_set_request',
+    'DeleteActivationResponseBodyActivation': '_delete_activation_response_body',
+    'DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers': '_delete_launch_template_response_body',
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion': '_delete_launch_template_version_response_body',
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions': '_delete_launch_template_version_response_body',
+    'DeleteRouteEntryRequestNextHopList': '_delete_route_entry_request',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': '_delete_snapshot_group_response_body',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet': '_delete_snapshot_group_response_body',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress': '_delete_snapshot_group_response_body',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSet': '_delete_snapshot_group_response_body',
+    'DeregisterManagedInstanceResponseBodyInstance': '_deregister_managed_instance_response_body',
+    'DescribeAccessPointsRequestFilter': '_describe_access_points_request',
+    'DescribeAccessPointsResponseBodyAccessPointSetAccessPointType': '_describe_access_points_response_body',
+    'DescribeAccessPointsResponseBodyAccessPointSet': '_describe_access_points_response_body',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem': '_describe_account_attributes_response_body',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues': '_describe_account_attributes_response_body',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem': '_describe_account_attributes_response_body',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItems': '_describe_account_attributes_response_body',
+    'DescribeActivationsRequestTag': '_describe_activations_request',
+    'DescribeActivationsResponseBodyActivationListTags': '_describe_activations_response_body',
+    'DescribeActivationsResponseBodyActivationList': '_describe_activations_response_body',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail': '_describe_auto_provisioning_group_history_response_body',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails': '_describe_auto_provisioning_group_history_response_body',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory': '_describe_auto_provisioning_group_history_response_body',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories': '_describe_auto_provisioning_group_history_response_body',
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance': '_describe_auto_provisioning_group_instances_response_body',
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstances': '_describe_auto_provisioning_group_instances_response_body',
+    'DescribeAutoProvisioningGroupsRequestTag': '_describe_auto_provisioning_groups_request',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups': '_describe_auto_provisioning_groups_response_body',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation': '_describe_auto_snapshot_policy_associations_response_body',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations': '_describe_auto_snapshot_policy_associations_response_body',
+    'DescribeAutoSnapshotPolicyExRequestTag': '_describe_auto_snapshot_policy_ex_request',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies': '_describe_auto_snapshot_policy_ex_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone': '_describe_available_resource_response_body',
+    'DescribeAvailableResourceResponseBodyAvailableZones': '_describe_available_resource_response_body',
+    'DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth': '_describe_bandwidth_limitation_response_body',
+    'DescribeBandwidthLimitationResponseBodyBandwidths': '_describe_bandwidth_limitation_response_body',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse': '_describe_bandwidth_packages_response_body',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses': '_describe_bandwidth_packages_response_body',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage': '_describe_bandwidth_packages_response_body',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackages': '_describe_bandwidth_packages_response_body',
+    'DescribeCapacityReservationInstancesRequestPrivatePoolOptions': '_describe_capacity_reservation_instances_request',
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet': '_describe_capacity_reservation_instances_response_body',
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem': '_describe_capacity_reservation_instances_response_body',
+    'DescribeCapacityReservationsRequestPrivatePoolOptions': '_describe_capacity_reservations_request',
+    'DescribeCapacityReservationsRequestTag': '_describe_capacity_reservations_request',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem': '_describe_capacity_reservations_response_body',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSet': '_describe_capacity_reservations_response_body',
+    'DescribeClassicLinkInstancesResponseBodyLinksLink': '_describe_classic_link_instances_response_body',
+    'DescribeClassicLinkInstancesResponseBodyLinks': '_describe_classic_link_instances_response_body',
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodySessionManagerConfig': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs': '_describe_cloud_assistant_settings_response_body',
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus': '_describe_cloud_assistant_status_response_body',
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet': '_describe_cloud_assistant_status_response_body',
+    'DescribeClustersResponseBodyClustersCluster': '_describe_clusters_response_body',
+    'DescribeClustersResponseBodyClusters': '_describe_clusters_response_body',
+    'DescribeCommandsRequestTag': '_describe_commands_request',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitions': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommandParameterNames': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommandTagsTag': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommandTags': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommandsCommand': '_describe_commands_response_body',
+    'DescribeCommandsResponseBodyCommands': '_describe_commands_response_body',
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute': '_describe_dedicated_host_auto_renew_response_body',
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes': '_describe_dedicated_host_auto_renew_response_body',
+    'DescribeDedicatedHostClustersRequestTag': '_describe_dedicated_host_clusters_request',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters': '_describe_dedicated_host_clusters_response_body',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies': '_describe_dedicated_host_types_response_body',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList': '_describe_dedicated_host_types_response_body',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType': '_describe_dedicated_host_types_response_body',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes': '_describe_dedicated_host_types_response_body',
+    'DescribeDedicatedHostsRequestTag': '_describe_dedicated_hosts_request',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost': '_describe_dedicated_hosts_response_body',
+    'DescribeDedicatedHostsResponseBodyDedicatedHosts': '_describe_dedicated_hosts_response_body',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity': '_describe_deployment_sets_response_body',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities': '_describe_deployment_sets_response_body',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds': '_describe_deployment_sets_response_body',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet': '_describe_deployment_sets_response_body',
+    'DescribeDeploymentSetsResponseBodyDeploymentSets': '_describe_deployment_sets_response_body',
+    'DescribeDiagnosticMetricSetsResponseBodyMetricSets': '_describe_diagnostic_metric_sets_response_body',
+    'DescribeDiagnosticMetricsResponseBodyMetrics': '_describe_diagnostic_metrics_response_body',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue': '_describe_diagnostic_report_attributes_response_body',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues': '_describe_diagnostic_report_attributes_response_body',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult': '_describe_diagnostic_report_attributes_response_body',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResults': '_describe_diagnostic_report_attributes_response_body',
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue': '_describe_diagnostic_reports_response_body',
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssues': '_describe_diagnostic_reports_response_body',
+    'DescribeDiagnosticReportsResponseBodyReportsReport': '_describe_diagnostic_reports_response_body',
+    'DescribeDiagnosticReportsResponseBodyReports': '_describe_diagnostic_reports_response_body',
+    'DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData': '_describe_disk_monitor_data_response_body',
+    'DescribeDiskMonitorDataResponseBodyMonitorData': '_describe_disk_monitor_data_response_body',
+    'DescribeDisksRequestFilter': '_describe_disks_request',
+    'DescribeDisksRequestTag': '_describe_disks_request',
+    'DescribeDisksResponseBodyDisksDiskAttachmentsAttachment': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskAttachments': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskMountInstances': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskOperationLocks': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskPlacement': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskTagsTag': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDiskTags': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisksDisk': '_describe_disks_response_body',
+    'DescribeDisksResponseBodyDisks': '_describe_disks_response_body',
+    'DescribeDisksFullStatusRequestEventTime': '_describe_disks_full_status_request',
+    'DescribeDisksFullStatusRequestTag': '_describe_disks_full_status_request',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType': '_describe_disks_full_status_response_body',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSet': '_describe_disks_full_status_response_body',
+    'DescribeEipAddressesRequestFilter': '_describe_eip_addresses_request',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason': '_describe_eip_addresses_response_body',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks': '_describe_eip_addresses_response_body',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddress': '_describe_eip_addresses_response_body',
+    'DescribeEipAddressesResponseBodyEipAddresses': '_describe_eip_addresses_response_body',
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData': '_describe_eip_monitor_data_response_body',
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatas': '_describe_eip_monitor_data_response_body',
+    'DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions': '_describe_elasticity_assurance_auto_renew_attribute_request',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute': '_describe_elasticity_assurance_auto_renew_attribute_response_body',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes': '_describe_elasticity_assurance_auto_renew_attribute_response_body',
+    'DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions': '_describe_elasticity_assurance_instances_request',
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet': '_describe_elasticity_assurance_instances_response_body',
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem': '_describe_elasticity_assurance_instances_response_body',
+    'DescribeElasticityAssurancesRequestPrivatePoolOptions': '_describe_elasticity_assurances_request',
+    'DescribeElasticityAssurancesRequestTag': '_describe_elasticity_assurances_request',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem': '_describe_elasticity_assurances_response_body',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet': '_describe_elasticity_assurances_response_body',
+    'DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData': '_describe_eni_monitor_data_response_body',
+    'DescribeEniMonitorDataResponseBodyMonitorData': '_describe_eni_monitor_data_response_body',
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry': '_describe_forward_table_entries_response_body',
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntries': '_describe_forward_table_entries_response_body',
+    'DescribeHaVipsRequestFilter': '_describe_ha_vips_request',
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses': '_describe_ha_vips_response_body',
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances': '_describe_ha_vips_response_body',
+    'DescribeHaVipsResponseBodyHaVipsHaVip': '_describe_ha_vips_response_body',
+    'DescribeHaVipsResponseBodyHaVips': '_describe_ha_vips_response_body',
+    'DescribeHpcClustersResponseBodyHpcClustersHpcCluster': '_describe_hpc_clusters_response_body',
+    'DescribeHpcClustersResponseBodyHpcClusters': '_describe_hpc_clusters_response_body',
+    'DescribeImageComponentsRequestTag': '_describe_image_components_request',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSet': '_describe_image_components_response_body',
+    'DescribeImageComponentsResponseBodyImageComponent': '_describe_image_components_response_body',
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping': '_describe_image_from_family_response_body',
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings': '_describe_image_from_family_response_body',
+    'DescribeImageFromFamilyResponseBodyImageTagsTag': '_describe_image_from_family_response_body',
+    'DescribeImageFromFamilyResponseBodyImageTags': '_describe_image_from_family_response_body',
+    'DescribeImageFromFamilyResponseBodyImage': '_describe_image_from_family_response_body',
+    'DescribeImagePipelineExecutionsRequestTag': '_describe_image_pipeline_executions_request',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag': '_describe_image_pipeline_executions_response_body',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags': '_describe_image_pipeline_executions_response_body',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet': '_describe_image_pipeline_executions_response_body',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution': '_describe_image_pipeline_executions_response_body',
+    'DescribeImagePipelinesRequestTag': '_describe_image_pipelines_request',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet': '_describe_image_pipelines_response_body',
+    'DescribeImagePipelinesResponseBodyImagePipeline': '_describe_image_pipelines_response_body',
+    'DescribeImageSharePermissionResponseBodyAccountsAccount': '_describe_image_share_permission_response_body',
+    'DescribeImageSharePermissionResponseBodyAccounts': '_describe_image_share_permission_response_body',
+    'DescribeImageSharePermissionResponseBodyShareGroupsShareGroup': '_describe_image_share_permission_response_body',
+    'DescribeImageSharePermissionResponseBodyShareGroups': '_describe_image_share_permission_response_body',
+    'DescribeImageSupportInstanceTypesRequestFilter': '_describe_image_support_instance_types_request',
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType': '_describe_image_support_instance_types_response_body',
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypes': '_describe_image_support_instance_types_response_body',
+    'DescribeImagesRequestFilter': '_describe_images_request',
+    'DescribeImagesRequestTag': '_describe_images_request',
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItems': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageDetectionOptions': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappings': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageFeatures': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageTagsTag': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImageTags': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImagesImage': '_describe_images_response_body',
+    'DescribeImagesResponseBodyImages': '_describe_images_response_body',
+    'DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance': '_describe_instance_attachment_attributes_response_body',
+    'DescribeInstanceAttachmentAttributesResponseBodyInstances': '_describe_instance_attachment_attributes_response_body',
+    'DescribeInstanceAttributeResponseBodyDedicatedHostAttribute': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyEipAddress': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyInnerIpAddress': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyNetworkOptions': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyOperationLocksLockReason': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyOperationLocks': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyPublicIpAddress': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodySecurityGroupIds': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAttributeResponseBodyVpcAttributes': '_describe_instance_attribute_response_body',
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute': '_describe_instance_auto_renew_attribute_response_body',
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes': '_describe_instance_auto_renew_attribute_response_body',
+    'DescribeInstanceHistoryEventsRequestEventPublishTime': '_describe_instance_history_events_request',
+    'DescribeInstanceHistoryEventsRequestNotBefore': '_describe_instance_history_events_request',
+    'DescribeInstanceHistoryEventsRequestTag': '_describe_instance_history_events_request',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType': '_describe_instance_history_events_response_body',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet': '_describe_instance_history_events_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes': '_describe_instance_maintenance_attributes_response_body',
+    'DescribeInstanceModificationPriceRequestSystemDisk': '_describe_instance_modification_price_request',
+    'DescribeInstanceModificationPriceRequestDataDisk': '_describe_instance_modification_price_request',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPrice': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRules': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfo': '_describe_instance_modification_price_response_body',
+    'DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData': '_describe_instance_monitor_data_response_body',
+    'DescribeInstanceMonitorDataResponseBodyMonitorData': '_describe_instance_monitor_data_response_body',
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet': '_describe_instance_ram_role_response_body',
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets': '_describe_instance_ram_role_response_body',
+    'DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus': '_describe_instance_status_response_body',
+    'DescribeInstanceStatusResponseBodyInstanceStatuses': '_describe_instance_status_response_body',
+    'DescribeInstanceTopologyResponseBodyTopologysTopology': '_describe_instance_topology_response_body',
+    'DescribeInstanceTopologyResponseBodyTopologys': '_describe_instance_topology_response_body',
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily': '_describe_instance_type_families_response_body',
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies': '_describe_instance_type_families_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceType': '_describe_instance_types_response_body',
+    'DescribeInstanceTypesResponseBodyInstanceTypes': '_describe_instance_types_response_body',
+    'DescribeInstancesRequestFilter': '_describe_instances_request',
+    'DescribeInstancesRequestTag': '_describe_instances_request',
+    'DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceClockOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceCpuOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceEipAddress': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceHibernationOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceImageOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceMetadataOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocks': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstancePublicIpAddress': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceTagsTag': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceTags': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributes': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstancesInstance': '_describe_instances_response_body',
+    'DescribeInstancesResponseBodyInstances': '_describe_instances_response_body',
+    'DescribeInstancesFullStatusRequestEventPublishTime': '_describe_instances_full_status_request',
+    'DescribeInstancesFullStatusRequestNotBefore': '_describe_instances_full_status_request',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType': '_describe_instances_full_status_response_body',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet': '_describe_instances_full_status_response_body',
+    'DescribeInvocationResultsRequestTag': '_describe_invocation_results_request',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag': '_describe_invocation_results_response_body',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags': '_describe_invocation_results_response_body',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult': '_describe_invocation_results_response_body',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResults': '_describe_invocation_results_response_body',
+    'DescribeInvocationResultsResponseBodyInvocation': '_describe_invocation_results_response_body',
+    'DescribeInvocationsRequestTag': '_describe_invocations_request',
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance': '_describe_invocations_response_body',
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances': '_describe_invocations_response_body',
+    'DescribeInvocationsResponseBodyInvocationsInvocationTagsTag': '_describe_invocations_response_body',
+    'DescribeInvocationsResponseBodyInvocationsInvocationTags': '_describe_invocations_response_body',
+    'DescribeInvocationsResponseBodyInvocationsInvocation': '_describe_invocations_response_body',
+    'DescribeInvocationsResponseBodyInvocations': '_describe_invocations_response_body',
+    'DescribeKeyPairsRequestTag': '_describe_key_pairs_request',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag': '_describe_key_pairs_response_body',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTags': '_describe_key_pairs_response_body',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPair': '_describe_key_pairs_response_body',
+    'DescribeKeyPairsResponseBodyKeyPairs': '_describe_key_pairs_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets': '_describe_launch_template_versions_response_body',
+    'DescribeLaunchTemplatesRequestTemplateTag': '_describe_launch_templates_request',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag': '_describe_launch_templates_response_body',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags': '_describe_launch_templates_response_body',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet': '_describe_launch_templates_response_body',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSets': '_describe_launch_templates_response_body',
+    'DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo': '_describe_locked_snapshots_response_body',
+    'DescribeManagedInstancesRequestTag': '_describe_managed_instances_request',
+    'DescribeManagedInstancesResponseBodyInstancesTags': '_describe_managed_instances_response_body',
+    'DescribeManagedInstancesResponseBodyInstances': '_describe_managed_instances_response_body',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds': '_describe_nat_gateways_response_body',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds': '_describe_nat_gateways_response_body',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGateway': '_describe_nat_gateways_response_body',
+    'DescribeNatGatewaysResponseBodyNatGateways': '_describe_nat_gateways_response_body',
+    'DescribeNetworkInterfaceAttributeRequestTag': '_describe_network_interface_attribute_request',
+    'DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachment': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfig': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyTagsTag': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfaceAttributeResponseBodyTags': '_describe_network_interface_attribute_response_body',
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission': '_describe_network_interface_permissions_response_body',
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions': '_describe_network_interface_permissions_response_body',
+    'DescribeNetworkInterfacesRequestTag': '_describe_network_interfaces_request',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet': '_describe_network_interfaces_response_body',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets': '_describe_network_interfaces_response_body',
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData': '_describe_new_project_eip_monitor_data_response_body',
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas': '_describe_new_project_eip_monitor_data_response_body',
+    'DescribePhysicalConnectionsRequestFilter': '_describe_physical_connections_request',
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType': '_describe_physical_connections_response_body',
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet': '_describe_physical_connections_response_body',
+    'DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations': '_describe_port_range_list_associations_response_body',
+    'DescribePortRangeListEntriesResponseBodyEntries': '_describe_port_range_list_entries_response_body',
+    'DescribePortRangeListsRequestTag': '_describe_port_range_lists_request',
+    'DescribePortRangeListsResponseBodyPortRangeListsTags': '_describe_port_range_lists_response_body',
+    'DescribePortRangeListsResponseBodyPortRangeLists': '_describe_port_range_lists_response_body',
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation': '_describe_prefix_list_associations_response_body',
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociations': '_describe_prefix_list_associations_response_body',
+    'DescribePrefixListAttributesResponseBodyEntriesEntry': '_describe_prefix_list_attributes_response_body',
+    'DescribePrefixListAttributesResponseBodyEntries': '_describe_prefix_list_attributes_response_body',
+    'DescribePrefixListsRequestTag': '_describe_prefix_lists_request',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag': '_describe_prefix_lists_response_body',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTags': '_describe_prefix_lists_response_body',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixList': '_describe_prefix_lists_response_body',
+    'DescribePrefixListsResponseBodyPrefixLists': '_describe_prefix_lists_response_body',
+    'DescribePriceRequestDataDisk': '_describe_price_request',
+    'DescribePriceRequestSchedulerOptions': '_describe_price_request',
+    'DescribePriceRequestSystemDisk': '_describe_price_request',
+    'DescribePriceRequestRecurrenceRules': '_describe_price_request',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfos': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoPrice': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoRelatedPrice': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoRulesRule': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfoRules': '_describe_price_response_body',
+    'DescribePriceResponseBodyPriceInfo': '_describe_price_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType': '_describe_recommend_instance_type_response_body',
+    'DescribeRecommendInstanceTypeResponseBodyData': '_describe_recommend_instance_type_response_body',
+    'DescribeRegionsResponseBodyRegionsRegion': '_describe_regions_response_body',
+    'DescribeRegionsResponseBodyRegions': '_describe_regions_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoPrice': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoRulesRule': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfoRules': '_describe_renewal_price_response_body',
+    'DescribeRenewalPriceResponseBodyPriceInfo': '_describe_renewal_price_response_body',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute': '_describe_reserved_instance_auto_renew_attribute_response_body',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes': '_describe_reserved_instance_auto_renew_attribute_response_body',
+    'DescribeReservedInstancesRequestTag': '_describe_reserved_instances_request',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance': '_describe_reserved_instances_response_body',
+    'DescribeReservedInstancesResponseBodyReservedInstances': '_describe_reserved_instances_response_body',
+    'DescribeResourceByTagsRequestTag': '_describe_resource_by_tags_request',
+    'DescribeResourceByTagsResponseBodyResourcesResource': '_describe_resource_by_tags_response_body',
+    'DescribeResourceByTagsResponseBodyResources': '_describe_resource_by_tags_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone': '_describe_resources_modification_response_body',
+    'DescribeResourcesModificationResponseBodyAvailableZones': '_describe_resources_modification_response_body',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTable': '_describe_route_tables_response_body',
+    'DescribeRouteTablesResponseBodyRouteTables': '_describe_route_tables_response_body',
+    'DescribeRouterInterfacesRequestFilter': '_describe_router_interfaces_request',
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType': '_describe_router_interfaces_response_body',
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSet': '_describe_router_interfaces_response_body',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoPrice': '_describe_savings_plan_price_response_body',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoRules': '_describe_savings_plan_price_response_body',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfo': '_describe_savings_plan_price_response_body',
+    'DescribeSecurityGroupAttributeResponseBodyPermissionsPermission': '_describe_security_group_attribute_response_body',
+    'DescribeSecurityGroupAttributeResponseBodyPermissions': '_describe_security_group_attribute_response_body',
+    'DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds': '_describe_security_group_attribute_response_body',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup': '_describe_security_group_references_response_body',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups': '_describe_security_group_references_response_body',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference': '_describe_security_group_references_response_body',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences': '_describe_security_group_references_response_body',
+    'DescribeSecurityGroupsRequestTag': '_describe_security_groups_request',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag': '_describe_security_groups_response_body',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags': '_describe_security_groups_response_body',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup': '_describe_security_groups_response_body',
+    'DescribeSecurityGroupsResponseBodySecurityGroups': '_describe_security_groups_response_body',
+    'DescribeSendFileResultsRequestTag': '_describe_send_file_results_request',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTags': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocation': '_describe_send_file_results_response_body',
+    'DescribeSendFileResultsResponseBodyInvocations': '_describe_send_file_results_response_body',
+    'DescribeSnapshotGroupsRequestTag': '_describe_snapshot_groups_request',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroups': '_describe_snapshot_groups_response_body',
+    'DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink': '_describe_snapshot_links_response_body',
+    'DescribeSnapshotLinksResponseBodySnapshotLinks': '_describe_snapshot_links_response_body',
+    'DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint': '_describe_snapshot_monitor_data_response_body',
+    'DescribeSnapshotMonitorDataResponseBodyMonitorData': '_describe_snapshot_monitor_data_response_body',
+    'DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage': '_describe_snapshot_package_response_body',
+    'DescribeSnapshotPackageResponseBodySnapshotPackages': '_describe_snapshot_package_response_body',
+    'DescribeSnapshotsRequestFilter': '_describe_snapshots_request',
+    'DescribeSnapshotsRequestTag': '_describe_snapshots_request',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag': '_describe_snapshots_response_body',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTags': '_describe_snapshots_response_body',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshot': '_describe_snapshots_response_body',
+    'DescribeSnapshotsResponseBodySnapshots': '_describe_snapshots_response_body',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource': '_describe_spot_advice_response_body',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources': '_describe_spot_advice_response_body',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone': '_describe_spot_advice_response_body',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZones': '_describe_spot_advice_response_body',
+    'DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType': '_describe_spot_price_history_response_body',
+    'DescribeSpotPriceHistoryResponseBodySpotPrices': '_describe_spot_price_history_response_body',
+    'DescribeStorageCapacityUnitsRequestTag': '_describe_storage_capacity_units_request',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag': '_describe_storage_capacity_units_response_body',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags': '_describe_storage_capacity_units_response_body',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit': '_describe_storage_capacity_units_response_body',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits': '_describe_storage_capacity_units_response_body',
+    'DescribeStorageSetDetailsResponseBodyDisksDisk': '_describe_storage_set_details_response_body',
+    'DescribeStorageSetDetailsResponseBodyDisks': '_describe_storage_set_details_response_body',
+    'DescribeStorageSetsRequestTag': '_describe_storage_sets_request',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag': '_describe_storage_sets_response_body',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTags': '_describe_storage_sets_response_body',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSet': '_describe_storage_sets_response_body',
+    'DescribeStorageSetsResponseBodyStorageSets': '_describe_storage_sets_response_body',
+    'DescribeTagsRequestTag': '_describe_tags_request',
+    'DescribeTagsResponseBodyTagsTagResourceTypeCount': '_describe_tags_response_body',
+    'DescribeTagsResponseBodyTagsTag': '_describe_tags_response_body',
+    'DescribeTagsResponseBodyTags': '_describe_tags_response_body',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': '_describe_task_attribute_response_body',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet': '_describe_task_attribute_response_body',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress': '_describe_task_attribute_response_body',
+    'DescribeTaskAttributeResponseBodyOperationProgressSet': '_describe_task_attribute_response_body',
+    'DescribeTasksResponseBodyTaskSetTask': '_describe_tasks_response_body',
+    'DescribeTasksResponseBodyTaskSet': '_describe_tasks_response_body',
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection': '_describe_terminal_sessions_response_body',
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnections': '_describe_terminal_sessions_response_body',
+    'DescribeTerminalSessionsResponseBodySessionsSession': '_describe_terminal_sessions_response_body',
+    'DescribeTerminalSessionsResponseBodySessions': '_describe_terminal_sessions_response_body',
+    'DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds': '_describe_vrouters_response_body',
+    'DescribeVRoutersResponseBodyVRoutersVRouter': '_describe_vrouters_response_body',
+    'DescribeVRoutersResponseBodyVRouters': '_describe_vrouters_response_body',
+    'DescribeVSwitchesResponseBodyVSwitchesVSwitch': '_describe_vswitches_response_body',
+    'DescribeVSwitchesResponseBodyVSwitches': '_describe_vswitches_response_body',
+    'DescribeVirtualBorderRoutersRequestFilter': '_describe_virtual_border_routers_request',
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType': '_describe_virtual_border_routers_response_body',
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet': '_describe_virtual_border_routers_response_body',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter': '_describe_virtual_border_routers_for_physical_connection_request',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType': '_describe_virtual_border_routers_for_physical_connection_response_body',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet': '_describe_virtual_border_routers_for_physical_connection_response_body',
+    'DescribeVpcsResponseBodyVpcsVpcUserCidrs': '_describe_vpcs_response_body',
+    'DescribeVpcsResponseBodyVpcsVpcVSwitchIds': '_describe_vpcs_response_body',
+    'DescribeVpcsResponseBodyVpcsVpc': '_describe_vpcs_response_body',
+    'DescribeVpcsResponseBodyVpcs': '_describe_vpcs_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableDiskCategories': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourceCreation': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableResources': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZonesZone': '_describe_zones_response_body',
+    'DescribeZonesResponseBodyZones': '_describe_zones_response_body',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet': '_detach_instance_ram_role_response_body',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets': '_detach_instance_ram_role_response_body',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult': '_detach_instance_ram_role_response_body',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults': '_detach_instance_ram_role_response_body',
+    'DetachKeyPairResponseBodyResultsResult': '_detach_key_pair_response_body',
+    'DetachKeyPairResponseBodyResults': '_detach_key_pair_response_body',
+    'DisableActivationResponseBodyActivation': '_disable_activation_response_body',
+    'EnableNetworkInterfaceQoSRequestQoS': '_enable_network_interface_qo_srequest',
+    'ImportImageRequestDiskDeviceMapping': '_import_image_request',
+    'ImportImageRequestFeatures': '_import_image_request',
+    'ImportImageRequestTag': '_import_image_request',
+    'ImportKeyPairRequestTag': '_import_key_pair_request',
+    'InvokeCommandRequestResourceTag': '_invoke_command_request',
+    'InvokeCommandRequestTag': '_invoke_command_request',
+    'InvokeCommandShrinkRequestResourceTag': '_invoke_command_shrink_request',
+    'InvokeCommandShrinkRequestTag': '_invoke_command_shrink_request',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus': '_list_plugin_status_response_body',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet': '_list_plugin_status_response_body',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus': '_list_plugin_status_response_body',
+    'ListPluginStatusResponseBodyInstancePluginStatusSet': '_list_plugin_status_response_body',
+    'ListTagResourcesRequestTag': '_list_tag_resources_request',
+    'ListTagResourcesRequestTagFilter': '_list_tag_resources_request',
+    'ListTagResourcesResponseBodyTagResourcesTagResource': '_list_tag_resources_response_body',
+    'ListTagResourcesResponseBodyTagResources': '_list_tag_resources_response_body',
+    'LockSnapshotResponseBodyLockedSnapshotInfo': '_lock_snapshot_response_body',
+    'ModifyAutoProvisioningGroupRequestLaunchTemplateConfig': '_modify_auto_provisioning_group_request',
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn': '_modify_auto_snapshot_policy_ex_request',
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration': '_modify_auto_snapshot_policy_ex_request',
+    'ModifyCapacityReservationRequestPrivatePoolOptions': '_modify_capacity_reservation_request',
+    'ModifyCloudAssistantSettingsRequestAgentUpgradeConfig': '_modify_cloud_assistant_settings_request',
+    'ModifyCloudAssistantSettingsRequestOssDeliveryConfig': '_modify_cloud_assistant_settings_request',
+    'ModifyCloudAssistantSettingsRequestSessionManagerConfig': '_modify_cloud_assistant_settings_request',
+    'ModifyCloudAssistantSettingsRequestSlsDeliveryConfig': '_modify_cloud_assistant_settings_request',
+    'ModifyDedicatedHostAttributeRequestNetworkAttributes': '_modify_dedicated_host_attribute_request',
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance': '_modify_dedicated_hosts_charge_type_response_body',
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances': '_modify_dedicated_hosts_charge_type_response_body',
+    'ModifyDiskSpecRequestPerformanceControlOptions': '_modify_disk_spec_request',
+    'ModifyElasticityAssuranceRequestPrivatePoolOptions': '_modify_elasticity_assurance_request',
+    'ModifyElasticityAssuranceRequestRecurrenceRules': '_modify_elasticity_assurance_request',
+    'ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions': '_modify_elasticity_assurance_auto_renew_attribute_request',
+    'ModifyImageAttributeRequestFeatures': '_modify_image_attribute_request',
+    'ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions': '_modify_instance_attachment_attributes_request',
+    'ModifyInstanceAttributeRequestCpuOptions': '_modify_instance_attribute_request',
+    'ModifyInstanceAttributeRequestPrivateDnsNameOptions': '_modify_instance_attribute_request',
+    'ModifyInstanceAttributeRequestRemoteConnectionOptions': '_modify_instance_attribute_request',
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance': '_modify_instance_charge_type_response_body',
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstances': '_modify_instance_charge_type_response_body',
+    'ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow': '_modify_instance_maintenance_attributes_request',
+    'ModifyInstanceSpecRequestSystemDisk': '_modify_instance_spec_request',
+    'ModifyInstanceSpecRequestTemporary': '_modify_instance_spec_request',
+    'ModifyInstanceSpecRequestDisk': '_modify_instance_spec_request',
+    'ModifyManagedInstanceResponseBodyInstance': '_modify_managed_instance_response_body',
+    'ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration': '_modify_network_interface_attribute_request',
+    'ModifyNetworkInterfaceAttributeRequestEnhancedNetwork': '_modify_network_interface_attribute_request',
+    'ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig': '_modify_network_interface_attribute_request',
+    'ModifyPortRangeListRequestAddEntry': '_modify_port_range_list_request',
+    'ModifyPortRangeListRequestRemoveEntry': '_modify_port_range_list_request',
+    'ModifyPrefixListRequestAddEntry': '_modify_prefix_list_request',
+    'ModifyPrefixListRequestRemoveEntry': '_modify_prefix_list_request',
+    'ModifyPrepayInstanceSpecRequestSystemDisk': '_modify_prepay_instance_spec_request',
+    'ModifyPrepayInstanceSpecRequestDisk': '_modify_prepay_instance_spec_request',
+    'ModifyReservedInstancesRequestConfiguration': '_modify_reserved_instances_request',
+    'ModifyReservedInstancesResponseBodyReservedInstanceIdSets': '_modify_reserved_instances_response_body',
+    'PurchaseElasticityAssuranceRequestPrivatePoolOptions': '_purchase_elasticity_assurance_request',
+    'PurchaseReservedInstancesOfferingRequestTag': '_purchase_reserved_instances_offering_request',
+    'PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets': '_purchase_reserved_instances_offering_response_body',
+    'PurchaseStorageCapacityUnitRequestTag': '_purchase_storage_capacity_unit_request',
+    'PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds': '_purchase_storage_capacity_unit_response_body',
+    'RebootInstancesResponseBodyInstanceResponsesInstanceResponse': '_reboot_instances_response_body',
+    'RebootInstancesResponseBodyInstanceResponses': '_reboot_instances_response_body',
+    'ReleaseCapacityReservationRequestPrivatePoolOptions': '_release_capacity_reservation_request',
+    'RemoveTagsRequestTag': '_remove_tags_request',
+    'RenewElasticityAssurancesRequestPrivatePoolOptions': '_renew_elasticity_assurances_request',
+    'RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet': '_renew_elasticity_assurances_response_body',
+    'RenewReservedInstancesResponseBodyReservedInstanceIdSets': '_renew_reserved_instances_response_body',
+    'ReplaceSystemDiskRequestSystemDisk': '_replace_system_disk_request',
+    'ReplaceSystemDiskRequestArn': '_replace_system_disk_request',
+    'ResetDisksRequestDisk': '_reset_disks_request',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': '_reset_disks_response_body',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet': '_reset_disks_response_body',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgress': '_reset_disks_response_body',
+    'ResetDisksResponseBodyOperationProgressSet': '_reset_disks_response_body',
+    'RevokeSecurityGroupRequestPermissions': '_revoke_security_group_request',
+    'RevokeSecurityGroupEgressRequestPermissions': '_revoke_security_group_egress_request',
+    'RunCommandRequestResourceTag': '_run_command_request',
+    'RunCommandRequestTag': '_run_command_request',
+    'RunCommandShrinkRequestResourceTag': '_run_command_shrink_request',
+    'RunCommandShrinkRequestTag': '_run_command_shrink_request',
+    'RunInstancesRequestCpuOptions': '_run_instances_request',
+    'RunInstancesRequestHibernationOptions': '_run_instances_request',
+    'RunInstancesRequestPrivatePoolOptions': '_run_instances_request',
+    'RunInstancesRequestSchedulerOptions': '_run_instances_request',
+    'RunInstancesRequestSecurityOptions': '_run_instances_request',
+    'RunInstancesRequestSystemDisk': '_run_instances_request',
+    'RunInstancesRequestArn': '_run_instances_request',
+    'RunInstancesRequestClockOptions': '_run_instances_request',
+    'RunInstancesRequestDataDisk': '_run_instances_request',
+    'RunInstancesRequestImageOptions': '_run_instances_request',
+    'RunInstancesRequestNetworkInterface': '_run_instances_request',
+    'RunInstancesRequestNetworkOptions': '_run_instances_request',
+    'RunInstancesRequestPrivateDnsNameOptions': '_run_instances_request',
+    'RunInstancesRequestTag': '_run_instances_request',
+    'RunInstancesResponseBodyInstanceIdSets': '_run_instances_response_body',
+    'SendFileRequestTag': '_send_file_request',
+    'StartImagePipelineExecutionRequestTag': '_start_image_pipeline_execution_request',
+    'StartImagePipelineExecutionRequestTemplateTag': '_start_image_pipeline_execution_request',
+    'StartInstancesResponseBodyInstanceResponsesInstanceResponse': '_start_instances_response_body',
+    'StartInstancesResponseBodyInstanceResponses': '_start_instances_response_body',
+    'StartTerminalSessionRequestEncryptionOptions': '_start_terminal_session_request',
+    'StopInstancesResponseBodyInstanceResponsesInstanceResponse': '_stop_instances_response_body',
+    'StopInstancesResponseBodyInstanceResponses': '_stop_instances_response_body',
+    'TagResourcesRequestTag': '_tag_resources_request'
+}
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
 
 __all__ = [
-    AcceptInquiredSystemEventRequest,
-    AcceptInquiredSystemEventResponseBody,
-    AcceptInquiredSystemEventResponse,
-    ActivateRouterInterfaceRequest,
-    ActivateRouterInterfaceResponseBody,
-    ActivateRouterInterfaceResponse,
-    AddBandwidthPackageIpsRequest,
-    AddBandwidthPackageIpsResponseBody,
-    AddBandwidthPackageIpsResponse,
-    AddTagsRequest,
-    AddTagsResponseBody,
-    AddTagsResponse,
-    AllocateDedicatedHostsRequest,
-    AllocateDedicatedHostsResponseBody,
-    AllocateDedicatedHostsResponse,
-    AllocateEipAddressRequest,
-    AllocateEipAddressResponseBody,
-    AllocateEipAddressResponse,
-    AllocatePublicIpAddressRequest,
-    AllocatePublicIpAddressResponseBody,
-    AllocatePublicIpAddressResponse,
-    ApplyAutoSnapshotPolicyRequest,
-    ApplyAutoSnapshotPolicyResponseBody,
-    ApplyAutoSnapshotPolicyResponse,
-    AssignIpv6AddressesRequest,
-    AssignIpv6AddressesResponseBody,
-    AssignIpv6AddressesResponse,
-    AssignPrivateIpAddressesRequest,
-    AssignPrivateIpAddressesResponseBody,
-    AssignPrivateIpAddressesResponse,
-    AssociateEipAddressRequest,
-    AssociateEipAddressResponseBody,
-    AssociateEipAddressResponse,
-    AssociateHaVipRequest,
-    AssociateHaVipResponseBody,
-    AssociateHaVipResponse,
-    AttachClassicLinkVpcRequest,
-    AttachClassicLinkVpcResponseBody,
-    AttachClassicLinkVpcResponse,
-    AttachDiskRequest,
-    AttachDiskResponseBody,
-    AttachDiskResponse,
-    AttachInstanceRamRoleRequest,
-    AttachInstanceRamRoleResponseBody,
-    AttachInstanceRamRoleResponse,
-    AttachKeyPairRequest,
-    AttachKeyPairResponseBody,
-    AttachKeyPairResponse,
-    AttachNetworkInterfaceRequest,
-    AttachNetworkInterfaceResponseBody,
-    AttachNetworkInterfaceResponse,
-    AuthorizeSecurityGroupRequest,
-    AuthorizeSecurityGroupResponseBody,
-    AuthorizeSecurityGroupResponse,
-    AuthorizeSecurityGroupEgressRequest,
-    AuthorizeSecurityGroupEgressResponseBody,
-    AuthorizeSecurityGroupEgressResponse,
-    CancelAutoSnapshotPolicyRequest,
-    CancelAutoSnapshotPolicyResponseBody,
-    CancelAutoSnapshotPolicyResponse,
-    CancelCopyImageRequest,
-    CancelCopyImageResponseBody,
-    CancelCopyImageResponse,
-    CancelImagePipelineExecutionRequest,
-    CancelImagePipelineExecutionResponseBody,
-    CancelImagePipelineExecutionResponse,
-    CancelPhysicalConnectionRequest,
-    CancelPhysicalConnectionResponseBody,
-    CancelPhysicalConnectionResponse,
-    CancelSimulatedSystemEventsRequest,
-    CancelSimulatedSystemEventsResponseBody,
-    CancelSimulatedSystemEventsResponse,
-    CancelTaskRequest,
-    CancelTaskResponseBody,
-    CancelTaskResponse,
-    ConnectRouterInterfaceRequest,
-    ConnectRouterInterfaceResponseBody,
-    ConnectRouterInterfaceResponse,
-    ConvertNatPublicIpToEipRequest,
-    ConvertNatPublicIpToEipResponseBody,
-    ConvertNatPublicIpToEipResponse,
-    CopyImageRequest,
-    CopyImageResponseBody,
-    CopyImageResponse,
-    CopySnapshotRequest,
-    CopySnapshotResponseBody,
-    CopySnapshotResponse,
-    CreateActivationRequest,
-    CreateActivationResponseBody,
-    CreateActivationResponse,
-    CreateAutoProvisioningGroupRequest,
-    CreateAutoProvisioningGroupShrinkRequest,
-    CreateAutoProvisioningGroupResponseBody,
-    CreateAutoProvisioningGroupResponse,
-    CreateAutoSnapshotPolicyRequest,
-    CreateAutoSnapshotPolicyResponseBody,
-    CreateAutoSnapshotPolicyResponse,
-    CreateCapacityReservationRequest,
-    CreateCapacityReservationResponseBody,
-    CreateCapacityReservationResponse,
-    CreateCommandRequest,
-    CreateCommandResponseBody,
-    CreateCommandResponse,
-    CreateDedicatedHostClusterRequest,
-    CreateDedicatedHostClusterResponseBody,
-    CreateDedicatedHostClusterResponse,
-    CreateDeploymentSetRequest,
-    CreateDeploymentSetResponseBody,
-    CreateDeploymentSetResponse,
-    CreateDiagnosticMetricSetRequest,
-    CreateDiagnosticMetricSetResponseBody,
-    CreateDiagnosticMetricSetResponse,
-    CreateDiagnosticReportRequest,
-    CreateDiagnosticReportResponseBody,
-    CreateDiagnosticReportResponse,
-    CreateDiskRequest,
-    CreateDiskResponseBody,
-    CreateDiskResponse,
-    CreateElasticityAssuranceRequest,
-    CreateElasticityAssuranceResponseBody,
-    CreateElasticityAssuranceResponse,
-    CreateForwardEntryRequest,
-    CreateForwardEntryResponseBody,
-    CreateForwardEntryResponse,
-    CreateHaVipRequest,
-    CreateHaVipResponseBody,
-    CreateHaVipResponse,
-    CreateHpcClusterRequest,
-    CreateHpcClusterResponseBody,
-    CreateHpcClusterResponse,
-    CreateImageRequest,
-    CreateImageResponseBody,
-    CreateImageResponse,
-    CreateImageComponentRequest,
-    CreateImageComponentResponseBody,
-    CreateImageComponentResponse,
-    CreateImagePipelineRequest,
-    CreateImagePipelineResponseBody,
-    CreateImagePipelineResponse,
-    CreateInstanceRequest,
-    CreateInstanceResponseBody,
-    CreateInstanceResponse,
-    CreateKeyPairRequest,
-    CreateKeyPairResponseBody,
-    CreateKeyPairResponse,
-    CreateLaunchTemplateRequest,
-    CreateLaunchTemplateResponseBody,
-    CreateLaunchTemplateResponse,
-    CreateLaunchTemplateVersionRequest,
-    CreateLaunchTemplateVersionResponseBody,
-    CreateLaunchTemplateVersionResponse,
-    CreateNatGatewayRequest,
-    CreateNatGatewayResponseBody,
-    CreateNatGatewayResponse,
-    CreateNetworkInterfaceRequest,
-    CreateNetworkInterfaceResponseBody,
-    CreateNetworkInterfaceResponse,
-    CreateNetworkInterfacePermissionRequest,
-    CreateNetworkInterfacePermissionResponseBody,
-    CreateNetworkInterfacePermissionResponse,
-    CreatePhysicalConnectionRequest,
-    CreatePhysicalConnectionResponseBody,
-    CreatePhysicalConnectionResponse,
-    CreatePortRangeListRequest,
-    CreatePortRangeListResponseBody,
-    CreatePortRangeListResponse,
-    CreatePrefixListRequest,
-    CreatePrefixListResponseBody,
-    CreatePrefixListResponse,
-    CreateRouteEntryRequest,
-    CreateRouteEntryResponseBody,
-    CreateRouteEntryResponse,
-    CreateRouterInterfaceRequest,
-    CreateRouterInterfaceResponseBody,
-    CreateRouterInterfaceResponse,
-    CreateSavingsPlanRequest,
-    CreateSavingsPlanResponseBody,
-    CreateSavingsPlanResponse,
-    CreateSecurityGroupRequest,
-    CreateSecurityGroupResponseBody,
-    CreateSecurityGroupResponse,
-    CreateSimulatedSystemEventsRequest,
-    CreateSimulatedSystemEventsResponseBody,
-    CreateSimulatedSystemEventsResponse,
-    CreateSnapshotRequest,
-    CreateSnapshotResponseBody,
-    CreateSnapshotResponse,
-    CreateSnapshotGroupRequest,
-    CreateSnapshotGroupResponseBody,
-    CreateSnapshotGroupResponse,
-    CreateStorageSetRequest,
-    CreateStorageSetResponseBody,
-    CreateStorageSetResponse,
-    CreateVSwitchRequest,
-    CreateVSwitchResponseBody,
-    CreateVSwitchResponse,
-    CreateVirtualBorderRouterRequest,
-    CreateVirtualBorderRouterResponseBody,
-    CreateVirtualBorderRouterResponse,
-    CreateVpcRequest,
-    CreateVpcResponseBody,
-    CreateVpcResponse,
-    DeactivateRouterInterfaceRequest,
-    DeactivateRouterInterfaceResponseBody,
-    DeactivateRouterInterfaceResponse,
-    DeleteActivationRequest,
-    DeleteActivationResponseBody,
-    DeleteActivationResponse,
-    DeleteAutoProvisioningGroupRequest,
-    DeleteAutoProvisioningGroupResponseBody,
-    DeleteAutoProvisioningGroupResponse,
-    DeleteAutoSnapshotPolicyRequest,
-    DeleteAutoSnapshotPolicyResponseBody,
-    DeleteAutoSnapshotPolicyResponse,
-    DeleteBandwidthPackageRequest,
-    DeleteBandwidthPackageResponseBody,
-    DeleteBandwidthPackageResponse,
-    DeleteCommandRequest,
-    DeleteCommandResponseBody,
-    DeleteCommandResponse,
-    DeleteDedicatedHostClusterRequest,
-    DeleteDedicatedHostClusterResponseBody,
-    DeleteDedicatedHostClusterResponse,
-    DeleteDeploymentSetRequest,
-    DeleteDeploymentSetResponseBody,
-    DeleteDeploymentSetResponse,
-    DeleteDiagnosticMetricSetsRequest,
-    DeleteDiagnosticMetricSetsResponseBody,
-    DeleteDiagnosticMetricSetsResponse,
-    DeleteDiagnosticReportsRequest,
-    DeleteDiagnosticReportsResponseBody,
-    DeleteDiagnosticReportsResponse,
-    DeleteDiskRequest,
-    DeleteDiskResponseBody,
-    DeleteDiskResponse,
-    DeleteForwardEntryRequest,
-    DeleteForwardEntryResponseBody,
-    DeleteForwardEntryResponse,
-    DeleteHaVipRequest,
-    DeleteHaVipResponseBody,
-    DeleteHaVipResponse,
-    DeleteHpcClusterRequest,
-    DeleteHpcClusterResponseBody,
-    DeleteHpcClusterResponse,
-    DeleteImageRequest,
-    DeleteImageResponseBody,
-    DeleteImageResponse,
-    DeleteImageComponentRequest,
-    DeleteImageComponentResponseBody,
-    DeleteImageComponentResponse,
-    DeleteImagePipelineRequest,
-    DeleteImagePipelineResponseBody,
-    DeleteImagePipelineResponse,
-    DeleteInstanceRequest,
-    DeleteInstanceResponseBody,
-    DeleteInstanceResponse,
-    DeleteInstancesRequest,
-    DeleteInstancesResponseBody,
-    DeleteInstancesResponse,
-    DeleteKeyPairsRequest,
-    DeleteKeyPairsResponseBody,
-    DeleteKeyPairsResponse,
-    DeleteLaunchTemplateRequest,
-    DeleteLaunchTemplateResponseBody,
-    DeleteLaunchTemplateResponse,
-    DeleteLaunchTemplateVersionRequest,
-    DeleteLaunchTemplateVersionResponseBody,
-    DeleteLaunchTemplateVersionResponse,
-    DeleteNatGatewayRequest,
-    DeleteNatGatewayResponseBody,
-    DeleteNatGatewayResponse,
-    DeleteNetworkInterfaceRequest,
-    DeleteNetworkInterfaceResponseBody,
-    DeleteNetworkInterfaceResponse,
-    DeleteNetworkInterfacePermissionRequest,
-    DeleteNetworkInterfacePermissionResponseBody,
-    DeleteNetworkInterfacePermissionResponse,
-    DeletePhysicalConnectionRequest,
-    DeletePhysicalConnectionResponseBody,
-    DeletePhysicalConnectionResponse,
-    DeletePortRangeListRequest,
-    DeletePortRangeListResponseBody,
-    DeletePortRangeListResponse,
-    DeletePrefixListRequest,
-    DeletePrefixListResponseBody,
-    DeletePrefixListResponse,
-    DeleteRouteEntryRequest,
-    DeleteRouteEntryResponseBody,
-    DeleteRouteEntryResponse,
-    DeleteRouterInterfaceRequest,
-    DeleteRouterInterfaceResponseBody,
-    DeleteRouterInterfaceResponse,
-    DeleteSecurityGroupRequest,
-    DeleteSecurityGroupResponseBody,
-    DeleteSecurityGroupResponse,
-    DeleteSnapshotRequest,
-    DeleteSnapshotResponseBody,
-    DeleteSnapshotResponse,
-    DeleteSnapshotGroupRequest,
-    DeleteSnapshotGroupResponseBody,
-    DeleteSnapshotGroupResponse,
-    DeleteStorageSetRequest,
-    DeleteStorageSetResponseBody,
-    DeleteStorageSetResponse,
-    DeleteVSwitchRequest,
-    DeleteVSwitchResponseBody,
-    DeleteVSwitchResponse,
-    DeleteVirtualBorderRouterRequest,
-    DeleteVirtualBorderRouterResponseBody,
-    DeleteVirtualBorderRouterResponse,
-    DeleteVpcRequest,
-    DeleteVpcResponseBody,
-    DeleteVpcResponse,
-    DeregisterManagedInstanceRequest,
-    DeregisterManagedInstanceResponseBody,
-    DeregisterManagedInstanceResponse,
-    DescribeAccessPointsRequest,
-    DescribeAccessPointsResponseBody,
-    DescribeAccessPointsResponse,
-    DescribeAccountAttributesRequest,
-    DescribeAccountAttributesResponseBody,
-    DescribeAccountAttributesResponse,
-    DescribeActivationsRequest,
-    DescribeActivationsResponseBody,
-    DescribeActivationsResponse,
-    DescribeAutoProvisioningGroupHistoryRequest,
-    DescribeAutoProvisioningGroupHistoryResponseBody,
-    DescribeAutoProvisioningGroupHistoryResponse,
-    DescribeAutoProvisioningGroupInstancesRequest,
-    DescribeAutoProvisioningGroupInstancesResponseBody,
-    DescribeAutoProvisioningGroupInstancesResponse,
-    DescribeAutoProvisioningGroupsRequest,
-    DescribeAutoProvisioningGroupsResponseBody,
-    DescribeAutoProvisioningGroupsResponse,
-    DescribeAutoSnapshotPolicyAssociationsRequest,
-    DescribeAutoSnapshotPolicyAssociationsResponseBody,
-    DescribeAutoSnapshotPolicyAssociationsResponse,
-    DescribeAutoSnapshotPolicyExRequest,
-    DescribeAutoSnapshotPolicyExResponseBody,
-    DescribeAutoSnapshotPolicyExResponse,
-    DescribeAvailableResourceRequest,
-    DescribeAvailableResourceResponseBody,
-    DescribeAvailableResourceResponse,
-    DescribeBandwidthLimitationRequest,
-    DescribeBandwidthLimitationResponseBody,
-    DescribeBandwidthLimitationResponse,
-    DescribeBandwidthPackagesRequest,
-    DescribeBandwidthPackagesResponseBody,
-    DescribeBandwidthPackagesResponse,
-    DescribeCapacityReservationInstancesRequest,
-    DescribeCapacityReservationInstancesResponseBody,
-    DescribeCapacityReservationInstancesResponse,
-    DescribeCapacityReservationsRequest,
-    DescribeCapacityReservationsResponseBody,
-    DescribeCapacityReservationsResponse,
-    DescribeClassicLinkInstancesRequest,
-    DescribeClassicLinkInstancesResponseBody,
-    DescribeClassicLinkInstancesResponse,
-    DescribeCloudAssistantSettingsRequest,
-    DescribeCloudAssistantSettingsResponseBody,
-    DescribeCloudAssistantSettingsResponse,
-    DescribeCloudAssistantStatusRequest,
-    DescribeCloudAssistantStatusResponseBody,
-    DescribeCloudAssistantStatusResponse,
-    DescribeClustersRequest,
-    DescribeClustersResponseBody,
-    DescribeClustersResponse,
-    DescribeCommandsRequest,
-    DescribeCommandsResponseBody,
-    DescribeCommandsResponse,
-    DescribeDedicatedHostAutoRenewRequest,
-    DescribeDedicatedHostAutoRenewResponseBody,
-    DescribeDedicatedHostAutoRenewResponse,
-    DescribeDedicatedHostClustersRequest,
-    DescribeDedicatedHostClustersResponseBody,
-    DescribeDedicatedHostClustersResponse,
-    DescribeDedicatedHostTypesRequest,
-    DescribeDedicatedHostTypesResponseBody,
-    DescribeDedicatedHostTypesResponse,
-    DescribeDedicatedHostsRequest,
-    DescribeDedicatedHostsResponseBody,
-    DescribeDedicatedHostsResponse,
-    DescribeDeploymentSetSupportedInstanceTypeFamilyRequest,
-    DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody,
-    DescribeDeploymentSetSupportedInstanceTypeFamilyResponse,
-    DescribeDeploymentSetsRequest,
-    DescribeDeploymentSetsResponseBody,
-    DescribeDeploymentSetsResponse,
-    DescribeDiagnosticMetricSetsRequest,
-    DescribeDiagnosticMetricSetsResponseBody,
-    DescribeDiagnosticMetricSetsResponse,
-    DescribeDiagnosticMetricsRequest,
-    DescribeDiagnosticMetricsResponseBody,
-    DescribeDiagnosticMetricsResponse,
-    DescribeDiagnosticReportAttributesRequest,
-    DescribeDiagnosticReportAttributesResponseBody,
-    DescribeDiagnosticReportAttributesResponse,
-    DescribeDiagnosticReportsRequest,
-    DescribeDiagnosticReportsResponseBody,
-    DescribeDiagnosticReportsResponse,
-    DescribeDiskDefaultKMSKeyIdRequest,
-    DescribeDiskDefaultKMSKeyIdResponseBody,
-    DescribeDiskDefaultKMSKeyIdResponse,
-    DescribeDiskEncryptionByDefaultStatusRequest,
-    DescribeDiskEncryptionByDefaultStatusResponseBody,
-    DescribeDiskEncryptionByDefaultStatusResponse,
-    DescribeDiskMonitorDataRequest,
-    DescribeDiskMonitorDataResponseBody,
-    DescribeDiskMonitorDataResponse,
-    DescribeDisksRequest,
-    DescribeDisksResponseBody,
-    DescribeDisksResponse,
-    DescribeDisksFullStatusRequest,
-    DescribeDisksFullStatusResponseBody,
-    DescribeDisksFullStatusResponse,
-    DescribeEipAddressesRequest,
-    DescribeEipAddressesResponseBody,
-    DescribeEipAddressesResponse,
-    DescribeEipMonitorDataRequest,
-    DescribeEipMonitorDataResponseBody,
-    DescribeEipMonitorDataResponse,
-    DescribeElasticityAssuranceAutoRenewAttributeRequest,
-    DescribeElasticityAssuranceAutoRenewAttributeResponseBody,
-    DescribeElasticityAssuranceAutoRenewAttributeResponse,
-    DescribeElasticityAssuranceInstancesRequest,
-    DescribeElasticityAssuranceInstancesResponseBody,
-    DescribeElasticityAssuranceInstancesResponse,
-    DescribeElasticityAssurancesRequest,
-    DescribeElasticityAssurancesResponseBody,
-    DescribeElasticityAssurancesResponse,
-    DescribeEniMonitorDataRequest,
-    DescribeEniMonitorDataResponseBody,
-    DescribeEniMonitorDataResponse,
-    DescribeForwardTableEntriesRequest,
-    DescribeForwardTableEntriesResponseBody,
-    DescribeForwardTableEntriesResponse,
-    DescribeHaVipsRequest,
-    DescribeHaVipsResponseBody,
-    DescribeHaVipsResponse,
-    DescribeHpcClustersRequest,
-    DescribeHpcClustersResponseBody,
-    DescribeHpcClustersResponse,
-    DescribeImageComponentsRequest,
-    DescribeImageComponentsResponseBody,
-    DescribeImageComponentsResponse,
-    DescribeImageFromFamilyRequest,
-    DescribeImageFromFamilyResponseBody,
-    DescribeImageFromFamilyResponse,
-    DescribeImagePipelineExecutionsRequest,
-    DescribeImagePipelineExecutionsResponseBody,
-    DescribeImagePipelineExecutionsResponse,
-    DescribeImagePipelinesRequest,
-    DescribeImagePipelinesResponseBody,
-    DescribeImagePipelinesResponse,
-    DescribeImageSharePermissionRequest,
-    DescribeImageSharePermissionResponseBody,
-    DescribeImageSharePermissionResponse,
-    DescribeImageSupportInstanceTypesRequest,
-    DescribeImageSupportInstanceTypesResponseBody,
-    DescribeImageSupportInstanceTypesResponse,
-    DescribeImagesRequest,
-    DescribeImagesResponseBody,
-    DescribeImagesResponse,
-    DescribeInstanceAttachmentAttributesRequest,
-    DescribeInstanceAttachmentAttributesResponseBody,
-    DescribeInstanceAttachmentAttributesResponse,
-    DescribeInstanceAttributeRequest,
-    DescribeInstanceAttributeResponseBody,
-    DescribeInstanceAttributeResponse,
-    DescribeInstanceAutoRenewAttributeRequest,
-    DescribeInstanceAutoRenewAttributeResponseBody,
-    DescribeInstanceAutoRenewAttributeResponse,
-    DescribeInstanceHistoryEventsRequest,
-    DescribeInstanceHistoryEventsResponseBody,
-    DescribeInstanceHistoryEventsResponse,
-    DescribeInstanceMaintenanceAttributesRequest,
-    DescribeInstanceMaintenanceAttributesResponseBody,
-    DescribeInstanceMaintenanceAttributesResponse,
-    DescribeInstanceModificationPriceRequest,
-    DescribeInstanceModificationPriceResponseBody,
-    DescribeInstanceModificationPriceResponse,
-    DescribeInstanceMonitorDataRequest,
-    DescribeInstanceMonitorDataResponseBody,
-    DescribeInstanceMonitorDataResponse,
-    DescribeInstanceRamRoleRequest,
-    DescribeInstanceRamRoleResponseBody,
-    DescribeInstanceRamRoleResponse,
-    DescribeInstanceStatusRequest,
-    DescribeInstanceStatusResponseBody,
-    DescribeInstanceStatusResponse,
-    DescribeInstanceTopologyRequest,
-    DescribeInstanceTopologyResponseBody,
-    DescribeInstanceTopologyResponse,
-    DescribeInstanceTypeFamiliesRequest,
-    DescribeInstanceTypeFamiliesResponseBody,
-    DescribeInstanceTypeFamiliesResponse,
-    DescribeInstanceTypesRequest,
-    DescribeInstanceTypesResponseBody,
-    DescribeInstanceTypesResponse,
-    DescribeInstanceVncUrlRequest,
-    DescribeInstanceVncUrlResponseBody,
-    DescribeInstanceVncUrlResponse,
-    DescribeInstancesRequest,
-    DescribeInstancesResponseBody,
-    DescribeInstancesResponse,
-    DescribeInstancesFullStatusRequest,
-    DescribeInstancesFullStatusResponseBody,
-    DescribeInstancesFullStatusResponse,
-    DescribeInvocationResultsRequest,
-    DescribeInvocationResultsResponseBody,
-    DescribeInvocationResultsResponse,
-    DescribeInvocationsRequest,
-    DescribeInvocationsResponseBody,
-    DescribeInvocationsResponse,
-    DescribeKeyPairsRequest,
-    DescribeKeyPairsResponseBody,
-    DescribeKeyPairsResponse,
-    DescribeLaunchTemplateVersionsRequest,
-    DescribeLaunchTemplateVersionsResponseBody,
-    DescribeLaunchTemplateVersionsResponse,
-    DescribeLaunchTemplatesRequest,
-    DescribeLaunchTemplatesResponseBody,
-    DescribeLaunchTemplatesResponse,
-    DescribeLimitationRequest,
-    DescribeLimitationResponseBody,
-    DescribeLimitationResponse,
-    DescribeLockedSnapshotsRequest,
-    DescribeLockedSnapshotsResponseBody,
-    DescribeLockedSnapshotsResponse,
-    DescribeManagedInstancesRequest,
-    DescribeManagedInstancesResponseBody,
-    DescribeManagedInstancesResponse,
-    DescribeNatGatewaysRequest,
-    DescribeNatGatewaysResponseBody,
-    DescribeNatGatewaysResponse,
-    DescribeNetworkInterfaceAttributeRequest,
-    DescribeNetworkInterfaceAttributeResponseBody,
-    DescribeNetworkInterfaceAttributeResponse,
-    DescribeNetworkInterfacePermissionsRequest,
-    DescribeNetworkInterfacePermissionsResponseBody,
-    DescribeNetworkInterfacePermissionsResponse,
-    DescribeNetworkInterfacesRequest,
-    DescribeNetworkInterfacesResponseBody,
-    DescribeNetworkInterfacesResponse,
-    DescribeNewProjectEipMonitorDataRequest,
-    DescribeNewProjectEipMonitorDataResponseBody,
-    DescribeNewProjectEipMonitorDataResponse,
-    DescribePhysicalConnectionsRequest,
-    DescribePhysicalConnectionsResponseBody,
-    DescribePhysicalConnectionsResponse,
-    DescribePortRangeListAssociationsRequest,
-    DescribePortRangeListAssociationsResponseBody,
-    DescribePortRangeListAssociationsResponse,
-    DescribePortRangeListEntriesRequest,
-    DescribePortRangeListEntriesResponseBody,
-    DescribePortRangeListEntriesResponse,
-    DescribePortRangeListsRequest,
-    DescribePortRangeListsResponseBody,
-    DescribePortRangeListsResponse,
-    DescribePrefixListAssociationsRequest,
-    DescribePrefixListAssociationsResponseBody,
-    DescribePrefixListAssociationsResponse,
-    DescribePrefixListAttributesRequest,
-    DescribePrefixListAttributesResponseBody,
-    DescribePrefixListAttributesResponse,
-    DescribePrefixListsRequest,
-    DescribePrefixListsResponseBody,
-    DescribePrefixListsResponse,
-    DescribePriceRequest,
-    DescribePriceResponseBody,
-    DescribePriceResponse,
-    DescribeRecommendInstanceTypeRequest,
-    DescribeRecommendInstanceTypeResponseBody,
-    DescribeRecommendInstanceTypeResponse,
-    DescribeRegionsRequest,
-    DescribeRegionsResponseBody,
-    DescribeRegionsResponse,
-    DescribeRenewalPriceRequest,
-    DescribeRenewalPriceResponseBody,
-    DescribeRenewalPriceResponse,
-    DescribeReservedInstanceAutoRenewAttributeRequest,
-    DescribeReservedInstanceAutoRenewAttributeResponseBody,
-    DescribeReservedInstanceAutoRenewAttributeResponse,
-    DescribeReservedInstancesRequest,
-    DescribeReservedInstancesResponseBody,
-    DescribeReservedInstancesResponse,
-    DescribeResourceByTagsRequest,
-    DescribeResourceByTagsResponseBody,
-    DescribeResourceByTagsResponse,
-    DescribeResourcesModificationRequest,
-    DescribeResourcesModificationResponseBody,
-    DescribeResourcesModificationResponse,
-    DescribeRouteTablesRequest,
-    DescribeRouteTablesResponseBody,
-    DescribeRouteTablesResponse,
-    DescribeRouterInterfacesRequest,
-    DescribeRouterInterfacesResponseBody,
-    DescribeRouterInterfacesResponse,
-    DescribeSavingsPlanEstimationRequest,
-    DescribeSavingsPlanEstimationResponseBody,
-    DescribeSavingsPlanEstimationResponse,
-    DescribeSavingsPlanPriceRequest,
-    DescribeSavingsPlanPriceResponseBody,
-    DescribeSavingsPlanPriceResponse,
-    DescribeSecurityGroupAttributeRequest,
-    DescribeSecurityGroupAttributeResponseBody,
-    DescribeSecurityGroupAttributeResponse,
-    DescribeSecurityGroupReferencesRequest,
-    DescribeSecurityGroupReferencesResponseBody,
-    DescribeSecurityGroupReferencesResponse,
-    DescribeSecurityGroupsRequest,
-    DescribeSecurityGroupsResponseBody,
-    DescribeSecurityGroupsResponse,
-    DescribeSendFileResultsRequest,
-    DescribeSendFileResultsResponseBody,
-    DescribeSendFileResultsResponse,
-    DescribeSnapshotGroupsRequest,
-    DescribeSnapshotGroupsResponseBody,
-    DescribeSnapshotGroupsResponse,
-    DescribeSnapshotLinksRequest,
-    DescribeSnapshotLinksResponseBody,
-    DescribeSnapshotLinksResponse,
-    DescribeSnapshotMonitorDataRequest,
-    DescribeSnapshotMonitorDataResponseBody,
-    DescribeSnapshotMonitorDataResponse,
-    DescribeSnapshotPackageRequest,
-    DescribeSnapshotPackageResponseBody,
-    DescribeSnapshotPackageResponse,
-    DescribeSnapshotsRequest,
-    DescribeSnapshotsResponseBody,
-    DescribeSnapshotsResponse,
-    DescribeSnapshotsUsageRequest,
-    DescribeSnapshotsUsageResponseBody,
-    DescribeSnapshotsUsageResponse,
-    DescribeSpotAdviceRequest,
-    DescribeSpotAdviceResponseBody,
-    DescribeSpotAdviceResponse,
-    DescribeSpotPriceHistoryRequest,
-    DescribeSpotPriceHistoryResponseBody,
-    DescribeSpotPriceHistoryResponse,
-    DescribeStorageCapacityUnitsRequest,
-    DescribeStorageCapacityUnitsResponseBody,
-    DescribeStorageCapacityUnitsResponse,
-    DescribeStorageSetDetailsRequest,
-    DescribeStorageSetDetailsResponseBody,
-    DescribeStorageSetDetailsResponse,
-    DescribeStorageSetsRequest,
-    DescribeStorageSetsResponseBody,
-    DescribeStorageSetsResponse,
-    DescribeTagsRequest,
-    DescribeTagsResponseBody,
-    DescribeTagsResponse,
-    DescribeTaskAttributeRequest,
-    DescribeTaskAttributeResponseBody,
-    DescribeTaskAttributeResponse,
-    DescribeTasksRequest,
-    DescribeTasksResponseBody,
-    DescribeTasksResponse,
-    DescribeTerminalSessionsRequest,
-    DescribeTerminalSessionsResponseBody,
-    DescribeTerminalSessionsResponse,
-    DescribeUserBusinessBehaviorRequest,
-    DescribeUserBusinessBehaviorResponseBody,
-    DescribeUserBusinessBehaviorResponse,
-    DescribeUserDataRequest,
-    DescribeUserDataResponseBody,
-    DescribeUserDataResponse,
-    DescribeVRoutersRequest,
-    DescribeVRoutersResponseBody,
-    DescribeVRoutersResponse,
-    DescribeVSwitchesRequest,
-    DescribeVSwitchesResponseBody,
-    DescribeVSwitchesResponse,
-    DescribeVirtualBorderRoutersRequest,
-    DescribeVirtualBorderRoutersResponseBody,
-    DescribeVirtualBorderRoutersResponse,
-    DescribeVirtualBorderRoutersForPhysicalConnectionRequest,
-    DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody,
-    DescribeVirtualBorderRoutersForPhysicalConnectionResponse,
-    DescribeVpcsRequest,
-    DescribeVpcsResponseBody,
-    DescribeVpcsResponse,
-    DescribeZonesRequest,
-    DescribeZonesResponseBody,
-    DescribeZonesResponse,
-    DetachClassicLinkVpcRequest,
-    DetachClassicLinkVpcResponseBody,
-    DetachClassicLinkVpcResponse,
-    DetachDiskRequest,
-    DetachDiskResponseBody,
-    DetachDiskResponse,
-    DetachInstanceRamRoleRequest,
-    DetachInstanceRamRoleResponseBody,
-    DetachInstanceRamRoleResponse,
-    DetachKeyPairRequest,
-    DetachKeyPairResponseBody,
-    DetachKeyPairResponse,
-    DetachNetworkInterfaceRequest,
-    DetachNetworkInterfaceResponseBody,
-    DetachNetworkInterfaceResponse,
-    DisableActivationRequest,
-    DisableActivationResponseBody,
-    DisableActivationResponse,
-    DisableDiskEncryptionByDefaultRequest,
-    DisableDiskEncryptionByDefaultResponseBody,
-    DisableDiskEncryptionByDefaultResponse,
-    DisableNetworkInterfaceQoSRequest,
-    DisableNetworkInterfaceQoSResponseBody,
-    DisableNetworkInterfaceQoSResponse,
-    EnableDiskEncryptionByDefaultRequest,
-    EnableDiskEncryptionByDefaultResponseBody,
-    EnableDiskEncryptionByDefaultResponse,
-    EnableNetworkInterfaceQoSRequest,
-    EnableNetworkInterfaceQoSResponseBody,
-    EnableNetworkInterfaceQoSResponse,
-    EnablePhysicalConnectionRequest,
-    EnablePhysicalConnectionResponseBody,
-    EnablePhysicalConnectionResponse,
-    EndTerminalSessionRequest,
-    EndTerminalSessionResponseBody,
-    EndTerminalSessionResponse,
-    ExportImageRequest,
-    ExportImageResponseBody,
-    ExportImageResponse,
-    ExportSnapshotRequest,
-    ExportSnapshotResponseBody,
-    ExportSnapshotResponse,
-    GetInstanceConsoleOutputRequest,
-    GetInstanceConsoleOutputResponseBody,
-    GetInstanceConsoleOutputResponse,
-    GetInstanceScreenshotRequest,
-    GetInstanceScreenshotResponseBody,
-    GetInstanceScreenshotResponse,
-    ImportImageRequest,
-    ImportImageResponseBody,
-    ImportImageResponse,
-    ImportKeyPairRequest,
-    ImportKeyPairResponseBody,
-    ImportKeyPairResponse,
-    InstallCloudAssistantRequest,
-    InstallCloudAssistantResponseBody,
-    InstallCloudAssistantResponse,
-    InvokeCommandRequest,
-    InvokeCommandShrinkRequest,
-    InvokeCommandResponseBody,
-    InvokeCommandResponse,
-    JoinResourceGroupRequest,
-    JoinResourceGroupResponseBody,
-    JoinResourceGroupResponse,
-    JoinSecurityGroupRequest,
-    JoinSecurityGroupResponseBody,
-    JoinSecurityGroupResponse,
-    LeaveSecurityGroupRequest,
-    LeaveSecurityGroupResponseBody,
-    LeaveSecurityGroupResponse,
-    ListPluginStatusRequest,
-    ListPluginStatusResponseBody,
-    ListPluginStatusResponse,
-    ListTagResourcesRequest,
-    ListTagResourcesResponseBody,
-    ListTagResourcesResponse,
-    LockSnapshotRequest,
-    LockSnapshotResponseBody,
-    LockSnapshotResponse,
-    ModifyAutoProvisioningGroupRequest,
-    ModifyAutoProvisioningGroupResponseBody,
-    ModifyAutoProvisioningGroupResponse,
-    ModifyAutoSnapshotPolicyExRequest,
-    ModifyAutoSnapshotPolicyExResponseBody,
-    ModifyAutoSnapshotPolicyExResponse,
-    ModifyBandwidthPackageSpecRequest,
-    ModifyBandwidthPackageSpecResponseBody,
-    ModifyBandwidthPackageSpecResponse,
-    ModifyCapacityReservationRequest,
-    ModifyCapacityReservationResponseBody,
-    ModifyCapacityReservationResponse,
-    ModifyCloudAssistantSettingsRequest,
-    ModifyCloudAssistantSettingsShrinkRequest,
-    ModifyCloudAssistantSettingsResponseBody,
-    ModifyCloudAssistantSettingsResponse,
-    ModifyCommandRequest,
-    ModifyCommandResponseBody,
-    ModifyCommandResponse,
-    ModifyDedicatedHostAttributeRequest,
-    ModifyDedicatedHostAttributeResponseBody,
-    ModifyDedicatedHostAttributeResponse,
-    ModifyDedicatedHostAutoReleaseTimeRequest,
-    ModifyDedicatedHostAutoReleaseTimeResponseBody,
-    ModifyDedicatedHostAutoReleaseTimeResponse,
-    ModifyDedicatedHostAutoRenewAttributeRequest,
-    ModifyDedicatedHostAutoRenewAttributeResponseBody,
-    ModifyDedicatedHostAutoRenewAttributeResponse,
-    ModifyDedicatedHostClusterAttributeRequest,
-    ModifyDedicatedHostClusterAttributeResponseBody,
-    ModifyDedicatedHostClusterAttributeResponse,
-    ModifyDedicatedHostsChargeTypeRequest,
-    ModifyDedicatedHostsChargeTypeResponseBody,
-    ModifyDedicatedHostsChargeTypeResponse,
-    ModifyDeploymentSetAttributeRequest,
-    ModifyDeploymentSetAttributeResponseBody,
-    ModifyDeploymentSetAttributeResponse,
-    ModifyDiagnosticMetricSetRequest,
-    ModifyDiagnosticMetricSetResponseBody,
-    ModifyDiagnosticMetricSetResponse,
-    ModifyDiskAttributeRequest,
-    ModifyDiskAttributeResponseBody,
-    ModifyDiskAttributeResponse,
-    ModifyDiskChargeTypeRequest,
-    ModifyDiskChargeTypeResponseBody,
-    ModifyDiskChargeTypeResponse,
-    ModifyDiskDefaultKMSKeyIdRequest,
-    ModifyDiskDefaultKMSKeyIdResponseBody,
-    ModifyDiskDefaultKMSKeyIdResponse,
-    ModifyDiskDeploymentRequest,
-    ModifyDiskDeploymentResponseBody,
-    ModifyDiskDeploymentResponse,
-    ModifyDiskSpecRequest,
-    ModifyDiskSpecResponseBody,
-    ModifyDiskSpecResponse,
-    ModifyEipAddressAttributeRequest,
-    ModifyEipAddressAttributeResponseBody,
-    ModifyEipAddressAttributeResponse,
-    ModifyElasticityAssuranceRequest,
-    ModifyElasticityAssuranceResponseBody,
-    ModifyElasticityAssuranceResponse,
-    ModifyElasticityAssuranceAutoRenewAttributeRequest,
-    ModifyElasticityAssuranceAutoRenewAttributeResponseBody,
-    ModifyElasticityAssuranceAutoRenewAttributeResponse,
-    ModifyForwardEntryRequest,
-    ModifyForwardEntryResponseBody,
-    ModifyForwardEntryResponse,
-    ModifyHaVipAttributeRequest,
-    ModifyHaVipAttributeResponseBody,
-    ModifyHaVipAttributeResponse,
-    ModifyHpcClusterAttributeRequest,
-    ModifyHpcClusterAttributeResponseBody,
-    ModifyHpcClusterAttributeResponse,
-    ModifyImageAttributeRequest,
-    ModifyImageAttributeResponseBody,
-    ModifyImageAttributeResponse,
-    ModifyImageShareGroupPermissionRequest,
-    ModifyImageShareGroupPermissionResponseBody,
-    ModifyImageShareGroupPermissionResponse,
-    ModifyImageSharePermissionRequest,
-    ModifyImageSharePermissionResponseBody,
-    ModifyImageSharePermissionResponse,
-    ModifyInstanceAttachmentAttributesRequest,
-    ModifyInstanceAttachmentAttributesResponseBody,
-    ModifyInstanceAttachmentAttributesResponse,
-    ModifyInstanceAttributeRequest,
-    ModifyInstanceAttributeResponseBody,
-    ModifyInstanceAttributeResponse,
-    ModifyInstanceAutoReleaseTimeRequest,
-    ModifyInstanceAutoReleaseTimeResponseBody,
-    ModifyInstanceAutoReleaseTimeResponse,
-    ModifyInstanceAutoRenewAttributeRequest,
-    ModifyInstanceAutoRenewAttributeResponseBody,
-    ModifyInstanceAutoRenewAttributeResponse,
-    ModifyInstanceChargeTypeRequest,
-    ModifyInstanceChargeTypeResponseBody,
-    ModifyInstanceChargeTypeResponse,
-    ModifyInstanceClockOptionsRequest,
-    ModifyInstanceClockOptionsResponseBody,
-    ModifyInstanceClockOptionsResponse,
-    ModifyInstanceDeploymentRequest,
-    ModifyInstanceDeploymentResponseBody,
-    ModifyInstanceDeploymentResponse,
-    ModifyInstanceMaintenanceAttributesRequest,
-    ModifyInstanceMaintenanceAttributesResponseBody,
-    ModifyInstanceMaintenanceAttributesResponse,
-    ModifyInstanceMetadataOptionsRequest,
-    ModifyInstanceMetadataOptionsResponseBody,
-    ModifyInstanceMetadataOptionsResponse,
-    ModifyInstanceNetworkOptionsRequest,
-    ModifyInstanceNetworkOptionsResponseBody,
-    ModifyInstanceNetworkOptionsResponse,
-    ModifyInstanceNetworkSpecRequest,
-    ModifyInstanceNetworkSpecResponseBody,
-    ModifyInstanceNetworkSpecResponse,
-    ModifyInstanceSpecRequest,
-    ModifyInstanceSpecResponseBody,
-    ModifyInstanceSpecResponse,
-    ModifyInstanceVncPasswdRequest,
-    ModifyInstanceVncPasswdResponseBody,
-    ModifyInstanceVncPasswdResponse,
-    ModifyInstanceVpcAttributeRequest,
-    ModifyInstanceVpcAttributeResponseBody,
-    ModifyInstanceVpcAttributeResponse,
-    ModifyInvocationAttributeRequest,
-    ModifyInvocationAttributeShrinkRequest,
-    ModifyInvocationAttributeResponseBody,
-    ModifyInvocationAttributeResponse,
-    ModifyLaunchTemplateDefaultVersionRequest,
-    ModifyLaunchTemplateDefaultVersionResponseBody,
-    ModifyLaunchTemplateDefaultVersionResponse,
-    ModifyManagedInstanceRequest,
-    ModifyManagedInstanceResponseBody,
-    ModifyManagedInstanceResponse,
-    ModifyNetworkInterfaceAttributeRequest,
-    ModifyNetworkInterfaceAttributeResponseBody,
-    ModifyNetworkInterfaceAttributeResponse,
-    ModifyPhysicalConnectionAttributeRequest,
-    ModifyPhysicalConnectionAttributeResponseBody,
-    ModifyPhysicalConnectionAttributeResponse,
-    ModifyPortRangeListRequest,
-    ModifyPortRangeListResponseBody,
-    ModifyPortRangeListResponse,
-    ModifyPrefixListRequest,
-    ModifyPrefixListResponseBody,
-    ModifyPrefixListResponse,
-    ModifyPrepayInstanceSpecRequest,
-    ModifyPrepayInstanceSpecResponseBody,
-    ModifyPrepayInstanceSpecResponse,
-    ModifyReservedInstanceAttributeRequest,
-    ModifyReservedInstanceAttributeResponseBody,
-    ModifyReservedInstanceAttributeResponse,
-    ModifyReservedInstanceAutoRenewAttributeRequest,
-    ModifyReservedInstanceAutoRenewAttributeResponseBody,
-    ModifyReservedInstanceAutoRenewAttributeResponse,
-    ModifyReservedInstancesRequest,
-    ModifyReservedInstancesResponseBody,
-    ModifyReservedInstancesResponse,
-    ModifyRouterInterfaceAttributeRequest,
-    ModifyRouterInterfaceAttributeResponseBody,
-    ModifyRouterInterfaceAttributeResponse,
-    ModifyRouterInterfaceSpecRequest,
-    ModifyRouterInterfaceSpecResponseBody,
-    ModifyRouterInterfaceSpecResponse,
-    ModifySecurityGroupAttributeRequest,
-    ModifySecurityGroupAttributeResponseBody,
-    ModifySecurityGroupAttributeResponse,
-    ModifySecurityGroupEgressRuleRequest,
-    ModifySecurityGroupEgressRuleResponseBody,
-    ModifySecurityGroupEgressRuleResponse,
-    ModifySecurityGroupPolicyRequest,
-    ModifySecurityGroupPolicyResponseBody,
-    ModifySecurityGroupPolicyResponse,
-    ModifySecurityGroupRuleRequest,
-    ModifySecurityGroupRuleResponseBody,
-    ModifySecurityGroupRuleResponse,
-    ModifySnapshotAttributeRequest,
-    ModifySnapshotAttributeResponseBody,
-    ModifySnapshotAttributeResponse,
-    ModifySnapshotCategoryRequest,
-    ModifySnapshotCategoryResponseBody,
-    ModifySnapshotCategoryResponse,
-    ModifySnapshotGroupRequest,
-    ModifySnapshotGroupResponseBody,
-    ModifySnapshotGroupResponse,
-    ModifyStorageCapacityUnitAttributeRequest,
-    ModifyStorageCapacityUnitAttributeResponseBody,
-    ModifyStorageCapacityUnitAttributeResponse,
-    ModifyStorageSetAttributeRequest,
-    ModifyStorageSetAttributeResponseBody,
-    ModifyStorageSetAttributeResponse,
-    ModifyUserBusinessBehaviorRequest,
-    ModifyUserBusinessBehaviorResponseBody,
-    ModifyUserBusinessBehaviorResponse,
-    ModifyVRouterAttributeRequest,
-    ModifyVRouterAttributeResponseBody,
-    ModifyVRouterAttributeResponse,
-    ModifyVSwitchAttributeRequest,
-    ModifyVSwitchAttributeResponseBody,
-    ModifyVSwitchAttributeResponse,
-    ModifyVirtualBorderRouterAttributeRequest,
-    ModifyVirtualBorderRouterAttributeResponseBody,
-    ModifyVirtualBorderRouterAttributeResponse,
-    ModifyVpcAttributeRequest,
-    ModifyVpcAttributeResponseBody,
-    ModifyVpcAttributeResponse,
-    OpenSnapshotServiceRequest,
-    OpenSnapshotServiceResponseBody,
-    OpenSnapshotServiceResponse,
-    PurchaseElasticityAssuranceRequest,
-    PurchaseElasticityAssuranceResponseBody,
-    PurchaseElasticityAssuranceResponse,
-    PurchaseReservedInstancesOfferingRequest,
-    PurchaseReservedInstancesOfferingResponseBody,
-    PurchaseReservedInstancesOfferingResponse,
-    PurchaseStorageCapacityUnitRequest,
-    PurchaseStorageCapacityUnitResponseBody,
-    PurchaseStorageCapacityUnitResponse,
-    ReActivateInstancesRequest,
-    ReActivateInstancesResponseBody,
-    ReActivateInstancesResponse,
-    ReInitDiskRequest,
-    ReInitDiskResponseBody,
-    ReInitDiskResponse,
-    RebootInstanceRequest,
-    RebootInstanceResponseBody,
-    RebootInstanceResponse,
-    RebootInstancesRequest,
-    RebootInstancesResponseBody,
-    RebootInstancesResponse,
-    RecoverVirtualBorderRouterRequest,
-    RecoverVirtualBorderRouterResponseBody,
-    RecoverVirtualBorderRouterResponse,
-    RedeployDedicatedHostRequest,
-    RedeployDedicatedHostResponseBody,
-    RedeployDedicatedHostResponse,
-    RedeployInstanceRequest,
-    RedeployInstanceResponseBody,
-    RedeployInstanceResponse,
-    ReleaseCapacityReservationRequest,
-    ReleaseCapacityReservationResponseBody,
-    ReleaseCapacityReservationResponse,
-    ReleaseDedicatedHostRequest,
-    ReleaseDedicatedHostResponseBody,
-    ReleaseDedicatedHostResponse,
-    ReleaseEipAddressRequest,
-    ReleaseEipAddressResponseBody,
-    ReleaseEipAddressResponse,
-    ReleasePublicIpAddressRequest,
-    ReleasePublicIpAddressResponseBody,
-    ReleasePublicIpAddressResponse,
-    RemoveBandwidthPackageIpsRequest,
-    RemoveBandwidthPackageIpsResponseBody,
-    RemoveBandwidthPackageIpsResponse,
-    RemoveTagsRequest,
-    RemoveTagsResponseBody,
-    RemoveTagsResponse,
-    RenewDedicatedHostsRequest,
-    RenewDedicatedHostsResponseBody,
-    RenewDedicatedHostsResponse,
-    RenewElasticityAssurancesRequest,
-    RenewElasticityAssurancesResponseBody,
-    RenewElasticityAssurancesResponse,
-    RenewInstanceRequest,
-    RenewInstanceResponseBody,
-    RenewInstanceResponse,
-    RenewReservedInstancesRequest,
-    RenewReservedInstancesResponseBody,
-    RenewReservedInstancesResponse,
-    ReplaceSystemDiskRequest,
-    ReplaceSystemDiskResponseBody,
-    ReplaceSystemDiskResponse,
-    ReportInstancesStatusRequest,
-    ReportInstancesStatusResponseBody,
-    ReportInstancesStatusResponse,
-    ResetDiskRequest,
-    ResetDiskResponseBody,
-    ResetDiskResponse,
-    ResetDiskDefaultKMSKeyIdRequest,
-    ResetDiskDefaultKMSKeyIdResponseBody,
-    ResetDiskDefaultKMSKeyIdResponse,
-    ResetDisksRequest,
-    ResetDisksResponseBody,
-    ResetDisksResponse,
-    ResizeDiskRequest,
-    ResizeDiskResponseBody,
-    ResizeDiskResponse,
-    RevokeSecurityGroupRequest,
-    RevokeSecurityGroupResponseBody,
-    RevokeSecurityGroupResponse,
-    RevokeSecurityGroupEgressRequest,
-    RevokeSecurityGroupEgressResponseBody,
-    RevokeSecurityGroupEgressResponse,
-    RunCommandRequest,
-    RunCommandShrinkRequest,
-    RunCommandResponseBody,
-    RunCommandResponse,
-    RunInstancesRequest,
-    RunInstancesResponseBody,
-    RunInstancesResponse,
-    SendFileRequest,
-    SendFileResponseBody,
-    SendFileResponse,
-    StartImagePipelineExecutionRequest,
-    StartImagePipelineExecutionResponseBody,
-    StartImagePipelineExecutionResponse,
-    StartInstanceRequest,
-    StartInstanceResponseBody,
-    StartInstanceResponse,
-    StartInstancesRequest,
-    StartInstancesResponseBody,
-    StartInstancesResponse,
-    StartTerminalSessionRequest,
-    StartTerminalSessionShrinkRequest,
-    StartTerminalSessionResponseBody,
-    StartTerminalSessionResponse,
-    StopInstanceRequest,
-    StopInstanceResponseBody,
-    StopInstanceResponse,
-    StopInstancesRequest,
-    StopInstancesResponseBody,
-    StopInstancesResponse,
-    StopInvocationRequest,
-    StopInvocationResponseBody,
-    StopInvocationResponse,
-    TagResourcesRequest,
-    TagResourcesResponseBody,
-    TagResourcesResponse,
-    TerminatePhysicalConnectionRequest,
-    TerminatePhysicalConnectionResponseBody,
-    TerminatePhysicalConnectionResponse,
-    TerminateVirtualBorderRouterRequest,
-    TerminateVirtualBorderRouterResponseBody,
-    TerminateVirtualBorderRouterResponse,
-    UnassignIpv6AddressesRequest,
-    UnassignIpv6AddressesResponseBody,
-    UnassignIpv6AddressesResponse,
-    UnassignPrivateIpAddressesRequest,
-    UnassignPrivateIpAddressesResponseBody,
-    UnassignPrivateIpAddressesResponse,
-    UnassociateEipAddressRequest,
-    UnassociateEipAddressResponseBody,
-    UnassociateEipAddressResponse,
-    UnassociateHaVipRequest,
-    UnassociateHaVipResponseBody,
-    UnassociateHaVipResponse,
-    UnlockSnapshotRequest,
-    UnlockSnapshotResponseBody,
-    UnlockSnapshotResponse,
-    UntagResourcesRequest,
-    UntagResourcesResponseBody,
-    UntagResourcesResponse,
-    AddTagsRequestTag,
-    AllocateDedicatedHostsRequestNetworkAttributes,
-    AllocateDedicatedHostsRequestTag,
-    AllocateDedicatedHostsResponseBodyDedicatedHostIdSets,
-    AssignIpv6AddressesResponseBodyIpv6PrefixSets,
-    AssignIpv6AddressesResponseBodyIpv6Sets,
-    AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet,
-    AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet,
-    AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet,
-    AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult,
-    AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults,
-    AttachKeyPairResponseBodyResultsResult,
-    AttachKeyPairResponseBodyResults,
-    AuthorizeSecurityGroupRequestPermissions,
-    AuthorizeSecurityGroupEgressRequestPermissions,
-    CancelImagePipelineExecutionRequestTemplateTag,
-    CopyImageRequestTag,
-    CopySnapshotRequestArn,
-    CopySnapshotRequestTag,
-    CreateActivationRequestTag,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationArn,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationTag,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions,
-    CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions,
-    CreateAutoProvisioningGroupRequestLaunchConfiguration,
-    CreateAutoProvisioningGroupRequestDataDiskConfig,
-    CreateAutoProvisioningGroupRequestLaunchTemplateConfig,
-    CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution,
-    CreateAutoProvisioningGroupRequestPrePaidOptions,
-    CreateAutoProvisioningGroupRequestResourcePoolOptions,
-    CreateAutoProvisioningGroupRequestSystemDiskConfig,
-    CreateAutoProvisioningGroupRequestTag,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions,
-    CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration,
-    CreateAutoProvisioningGroupShrinkRequestDataDiskConfig,
-    CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig,
-    CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution,
-    CreateAutoProvisioningGroupShrinkRequestPrePaidOptions,
-    CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig,
-    CreateAutoProvisioningGroupShrinkRequestTag,
-    CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds,
-    CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult,
-    CreateAutoProvisioningGroupResponseBodyLaunchResults,
-    CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn,
-    CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration,
-    CreateAutoSnapshotPolicyRequestTag,
-    CreateCapacityReservationRequestPrivatePoolOptions,
-    CreateCapacityReservationRequestTag,
-    CreateCommandRequestTag,
-    CreateDedicatedHostClusterRequestTag,
-    CreateDiskRequestArn,
-    CreateDiskRequestTag,
-    CreateElasticityAssuranceRequestPrivatePoolOptions,
-    CreateElasticityAssuranceRequestRecurrenceRules,
-    CreateElasticityAssuranceRequestTag,
-    CreateImageRequestDiskDeviceMapping,
-    CreateImageRequestFeatures,
-    CreateImageRequestTag,
-    CreateImageComponentRequestTag,
-    CreateImagePipelineRequestAdvancedOptions,
-    CreateImagePipelineRequestImageOptionsImageFeatures,
-    CreateImagePipelineRequestImageOptionsImageTags,
-    CreateImagePipelineRequestImageOptions,
-    CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings,
-    CreateImagePipelineRequestImportImageOptionsFeatures,
-    CreateImagePipelineRequestImportImageOptionsImportImageTags,
-    CreateImagePipelineRequestImportImageOptions,
-    CreateImagePipelineRequestTag,
-    CreateInstanceRequestHibernationOptions,
-    CreateInstanceRequestPrivatePoolOptions,
-    CreateInstanceRequestSystemDisk,
-    CreateInstanceRequestArn,
-    CreateInstanceRequestDataDisk,
-    CreateInstanceRequestTag,
-    CreateKeyPairRequestTag,
-    CreateLaunchTemplateRequestSystemDisk,
-    CreateLaunchTemplateRequestDataDisk,
-    CreateLaunchTemplateRequestImageOptions,
-    CreateLaunchTemplateRequestNetworkInterface,
-    CreateLaunchTemplateRequestSecurityOptions,
-    CreateLaunchTemplateRequestTag,
-    CreateLaunchTemplateRequestTemplateTag,
-    CreateLaunchTemplateVersionRequestSystemDisk,
-    CreateLaunchTemplateVersionRequestDataDisk,
-    CreateLaunchTemplateVersionRequestImageOptions,
-    CreateLaunchTemplateVersionRequestNetworkInterface,
-    CreateLaunchTemplateVersionRequestSecurityOptions,
-    CreateLaunchTemplateVersionRequestTag,
-    CreateNatGatewayRequestBandwidthPackage,
-    CreateNatGatewayResponseBodyBandwidthPackageIds,
-    CreateNatGatewayResponseBodyForwardTableIds,
-    CreateNetworkInterfaceRequestConnectionTrackingConfiguration,
-    CreateNetworkInterfaceRequestEnhancedNetwork,
-    CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig,
-    CreateNetworkInterfaceRequestTag,
-    CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet,
-    CreateNetworkInterfaceResponseBodyIpv4PrefixSets,
-    CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet,
-    CreateNetworkInterfaceResponseBodyIpv6PrefixSets,
-    CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set,
-    CreateNetworkInterfaceResponseBodyIpv6Sets,
-    CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet,
-    CreateNetworkInterfaceResponseBodyPrivateIpSets,
-    CreateNetworkInterfaceResponseBodySecurityGroupIds,
-    CreateNetworkInterfaceResponseBodyTagsTag,
-    CreateNetworkInterfaceResponseBodyTags,
-    CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission,
-    CreatePortRangeListRequestEntry,
-    CreatePortRangeListRequestTag,
-    CreatePrefixListRequestEntry,
-    CreatePrefixListRequestTag,
-    CreateRouteEntryRequestNextHopList,
-    CreateSecurityGroupRequestTag,
-    CreateSimulatedSystemEventsResponseBodyEventIdSet,
-    CreateSnapshotRequestTag,
-    CreateSnapshotGroupRequestTag,
-    CreateStorageSetRequestTag,
-    DeleteActivationResponseBodyActivation,
-    DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers,
-    DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion,
-    DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions,
-    DeleteRouteEntryRequestNextHopList,
-    DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem,
-    DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet,
-    DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress,
-    DeleteSnapshotGroupResponseBodyOperationProgressSet,
-    DeregisterManagedInstanceResponseBodyInstance,
-    DescribeAccessPointsRequestFilter,
-    DescribeAccessPointsResponseBodyAccessPointSetAccessPointType,
-    DescribeAccessPointsResponseBodyAccessPointSet,
-    DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem,
-    DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues,
-    DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem,
-    DescribeAccountAttributesResponseBodyAccountAttributeItems,
-    DescribeActivationsRequestTag,
-    DescribeActivationsResponseBodyActivationListTags,
-    DescribeActivationsResponseBodyActivationList,
-    DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail,
-    DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails,
-    DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory,
-    DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories,
-    DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance,
-    DescribeAutoProvisioningGroupInstancesResponseBodyInstances,
-    DescribeAutoProvisioningGroupsRequestTag,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup,
-    DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups,
-    DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation,
-    DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations,
-    DescribeAutoSnapshotPolicyExRequestTag,
-    DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration,
-    DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag,
-    DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags,
-    DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy,
-    DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies,
-    DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource,
-    DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources,
-    DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource,
-    DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources,
-    DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone,
-    DescribeAvailableResourceResponseBodyAvailableZones,
-    DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth,
-    DescribeBandwidthLimitationResponseBodyBandwidths,
-    DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse,
-    DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses,
-    DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage,
-    DescribeBandwidthPackagesResponseBodyBandwidthPackages,
-    DescribeCapacityReservationInstancesRequestPrivatePoolOptions,
-    DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet,
-    DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem,
-    DescribeCapacityReservationsRequestPrivatePoolOptions,
-    DescribeCapacityReservationsRequestTag,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem,
-    DescribeCapacityReservationsResponseBodyCapacityReservationSet,
-    DescribeClassicLinkInstancesResponseBodyLinksLink,
-    DescribeClassicLinkInstancesResponseBodyLinks,
-    DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows,
-    DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig,
-    DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig,
-    DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs,
-    DescribeCloudAssistantSettingsResponseBodySessionManagerConfig,
-    DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig,
-    DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs,
-    DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus,
-    DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet,
-    DescribeClustersResponseBodyClustersCluster,
-    DescribeClustersResponseBodyClusters,
-    DescribeCommandsRequestTag,
-    DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues,
-    DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition,
-    DescribeCommandsResponseBodyCommandsCommandParameterDefinitions,
-    DescribeCommandsResponseBodyCommandsCommandParameterNames,
-    DescribeCommandsResponseBodyCommandsCommandTagsTag,
-    DescribeCommandsResponseBodyCommandsCommandTags,
-    DescribeCommandsResponseBodyCommandsCommand,
-    DescribeCommandsResponseBodyCommands,
-    DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute,
-    DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes,
-    DescribeDedicatedHostClustersRequestTag,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster,
-    DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters,
-    DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies,
-    DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList,
-    DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType,
-    DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes,
-    DescribeDedicatedHostsRequestTag,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags,
-    DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost,
-    DescribeDedicatedHostsResponseBodyDedicatedHosts,
-    DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity,
-    DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities,
-    DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds,
-    DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet,
-    DescribeDeploymentSetsResponseBodyDeploymentSets,
-    DescribeDiagnosticMetricSetsResponseBodyMetricSets,
-    DescribeDiagnosticMetricsResponseBodyMetrics,
-    DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue,
-    DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues,
-    DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult,
-    DescribeDiagnosticReportAttributesResponseBodyMetricResults,
-    DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue,
-    DescribeDiagnosticReportsResponseBodyReportsReportIssues,
-    DescribeDiagnosticReportsResponseBodyReportsReport,
-    DescribeDiagnosticReportsResponseBodyReports,
-    DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData,
-    DescribeDiskMonitorDataResponseBodyMonitorData,
-    DescribeDisksRequestFilter,
-    DescribeDisksRequestTag,
-    DescribeDisksResponseBodyDisksDiskAttachmentsAttachment,
-    DescribeDisksResponseBodyDisksDiskAttachments,
-    DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance,
-    DescribeDisksResponseBodyDisksDiskMountInstances,
-    DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock,
-    DescribeDisksResponseBodyDisksDiskOperationLocks,
-    DescribeDisksResponseBodyDisksDiskPlacement,
-    DescribeDisksResponseBodyDisksDiskTagsTag,
-    DescribeDisksResponseBodyDisksDiskTags,
-    DescribeDisksResponseBodyDisksDisk,
-    DescribeDisksResponseBodyDisks,
-    DescribeDisksFullStatusRequestEventTime,
-    DescribeDisksFullStatusRequestTag,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType,
-    DescribeDisksFullStatusResponseBodyDiskFullStatusSet,
-    DescribeEipAddressesRequestFilter,
-    DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason,
-    DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks,
-    DescribeEipAddressesResponseBodyEipAddressesEipAddress,
-    DescribeEipAddressesResponseBodyEipAddresses,
-    DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData,
-    DescribeEipMonitorDataResponseBodyEipMonitorDatas,
-    DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions,
-    DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute,
-    DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes,
-    DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions,
-    DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet,
-    DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem,
-    DescribeElasticityAssurancesRequestPrivatePoolOptions,
-    DescribeElasticityAssurancesRequestTag,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem,
-    DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet,
-    DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData,
-    DescribeEniMonitorDataResponseBodyMonitorData,
-    DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry,
-    DescribeForwardTableEntriesResponseBodyForwardTableEntries,
-    DescribeHaVipsRequestFilter,
-    DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses,
-    DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances,
-    DescribeHaVipsResponseBodyHaVipsHaVip,
-    DescribeHaVipsResponseBodyHaVips,
-    DescribeHpcClustersResponseBodyHpcClustersHpcCluster,
-    DescribeHpcClustersResponseBodyHpcClusters,
-    DescribeImageComponentsRequestTag,
-    DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter,
-    DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters,
-    DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag,
-    DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags,
-    DescribeImageComponentsResponseBodyImageComponentImageComponentSet,
-    DescribeImageComponentsResponseBodyImageComponent,
-    DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping,
-    DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings,
-    DescribeImageFromFamilyResponseBodyImageTagsTag,
-    DescribeImageFromFamilyResponseBodyImageTags,
-    DescribeImageFromFamilyResponseBodyImage,
-    DescribeImagePipelineExecutionsRequestTag,
-    DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag,
-    DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags,
-    DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet,
-    DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution,
-    DescribeImagePipelinesRequestTag,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds,
-    DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet,
-    DescribeImagePipelinesResponseBodyImagePipeline,
-    DescribeImageSharePermissionResponseBodyAccountsAccount,
-    DescribeImageSharePermissionResponseBodyAccounts,
-    DescribeImageSharePermissionResponseBodyShareGroupsShareGroup,
-    DescribeImageSharePermissionResponseBodyShareGroups,
-    DescribeImageSupportInstanceTypesRequestFilter,
-    DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType,
-    DescribeImageSupportInstanceTypesResponseBodyInstanceTypes,
-    DescribeImagesRequestFilter,
-    DescribeImagesRequestTag,
-    DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem,
-    DescribeImagesResponseBodyImagesImageDetectionOptionsItems,
-    DescribeImagesResponseBodyImagesImageDetectionOptions,
-    DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping,
-    DescribeImagesResponseBodyImagesImageDiskDeviceMappings,
-    DescribeImagesResponseBodyImagesImageFeatures,
-    DescribeImagesResponseBodyImagesImageTagsTag,
-    DescribeImagesResponseBodyImagesImageTags,
-    DescribeImagesResponseBodyImagesImage,
-    DescribeImagesResponseBodyImages,
-    DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance,
-    DescribeInstanceAttachmentAttributesResponseBodyInstances,
-    DescribeInstanceAttributeResponseBodyDedicatedHostAttribute,
-    DescribeInstanceAttributeResponseBodyEipAddress,
-    DescribeInstanceAttributeResponseBodyInnerIpAddress,
-    DescribeInstanceAttributeResponseBodyNetworkOptions,
-    DescribeInstanceAttributeResponseBodyOperationLocksLockReason,
-    DescribeInstanceAttributeResponseBodyOperationLocks,
-    DescribeInstanceAttributeResponseBodyPublicIpAddress,
-    DescribeInstanceAttributeResponseBodySecurityGroupIds,
-    DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress,
-    DescribeInstanceAttributeResponseBodyVpcAttributes,
-    DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute,
-    DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes,
-    DescribeInstanceHistoryEventsRequestEventPublishTime,
-    DescribeInstanceHistoryEventsRequestNotBefore,
-    DescribeInstanceHistoryEventsRequestTag,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType,
-    DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute,
-    DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes,
-    DescribeInstanceModificationPriceRequestSystemDisk,
-    DescribeInstanceModificationPriceRequestDataDisk,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoPrice,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule,
-    DescribeInstanceModificationPriceResponseBodyPriceInfoRules,
-    DescribeInstanceModificationPriceResponseBodyPriceInfo,
-    DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData,
-    DescribeInstanceMonitorDataResponseBodyMonitorData,
-    DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet,
-    DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets,
-    DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus,
-    DescribeInstanceStatusResponseBodyInstanceStatuses,
-    DescribeInstanceTopologyResponseBodyTopologysTopology,
-    DescribeInstanceTopologyResponseBodyTopologys,
-    DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily,
-    DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes,
-    DescribeInstanceTypesResponseBodyInstanceTypesInstanceType,
-    DescribeInstanceTypesResponseBodyInstanceTypes,
-    DescribeInstancesRequestFilter,
-    DescribeInstancesRequestTag,
-    DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo,
-    DescribeInstancesResponseBodyInstancesInstanceClockOptions,
-    DescribeInstancesResponseBodyInstancesInstanceCpuOptions,
-    DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute,
-    DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute,
-    DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr,
-    DescribeInstancesResponseBodyInstancesInstanceEipAddress,
-    DescribeInstancesResponseBodyInstancesInstanceHibernationOptions,
-    DescribeInstancesResponseBodyInstancesInstanceImageOptions,
-    DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress,
-    DescribeInstancesResponseBodyInstancesInstanceMetadataOptions,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface,
-    DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces,
-    DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason,
-    DescribeInstancesResponseBodyInstancesInstanceOperationLocks,
-    DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions,
-    DescribeInstancesResponseBodyInstancesInstancePublicIpAddress,
-    DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress,
-    DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds,
-    DescribeInstancesResponseBodyInstancesInstanceTagsTag,
-    DescribeInstancesResponseBodyInstancesInstanceTags,
-    DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress,
-    DescribeInstancesResponseBodyInstancesInstanceVpcAttributes,
-    DescribeInstancesResponseBodyInstancesInstance,
-    DescribeInstancesResponseBodyInstances,
-    DescribeInstancesFullStatusRequestEventPublishTime,
-    DescribeInstancesFullStatusRequestNotBefore,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType,
-    DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet,
-    DescribeInvocationResultsRequestTag,
-    DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag,
-    DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags,
-    DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult,
-    DescribeInvocationResultsResponseBodyInvocationInvocationResults,
-    DescribeInvocationResultsResponseBodyInvocation,
-    DescribeInvocationsRequestTag,
-    DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance,
-    DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances,
-    DescribeInvocationsResponseBodyInvocationsInvocationTagsTag,
-    DescribeInvocationsResponseBodyInvocationsInvocationTags,
-    DescribeInvocationsResponseBodyInvocationsInvocation,
-    DescribeInvocationsResponseBodyInvocations,
-    DescribeKeyPairsRequestTag,
-    DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag,
-    DescribeKeyPairsResponseBodyKeyPairsKeyPairTags,
-    DescribeKeyPairsResponseBodyKeyPairsKeyPair,
-    DescribeKeyPairsResponseBodyKeyPairs,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet,
-    DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets,
-    DescribeLaunchTemplatesRequestTemplateTag,
-    DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag,
-    DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags,
-    DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet,
-    DescribeLaunchTemplatesResponseBodyLaunchTemplateSets,
-    DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo,
-    DescribeManagedInstancesRequestTag,
-    DescribeManagedInstancesResponseBodyInstancesTags,
-    DescribeManagedInstancesResponseBodyInstances,
-    DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds,
-    DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds,
-    DescribeNatGatewaysResponseBodyNatGatewaysNatGateway,
-    DescribeNatGatewaysResponseBodyNatGateways,
-    DescribeNetworkInterfaceAttributeRequestTag,
-    DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp,
-    DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds,
-    DescribeNetworkInterfaceAttributeResponseBodyAttachment,
-    DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet,
-    DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification,
-    DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification,
-    DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration,
-    DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set,
-    DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets,
-    DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig,
-    DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp,
-    DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet,
-    DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets,
-    DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS,
-    DescribeNetworkInterfaceAttributeResponseBodyQoSConfig,
-    DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds,
-    DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification,
-    DescribeNetworkInterfaceAttributeResponseBodyTagsTag,
-    DescribeNetworkInterfaceAttributeResponseBodyTags,
-    DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission,
-    DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions,
-    DescribeNetworkInterfacesRequestTag,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet,
-    DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets,
-    DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData,
-    DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas,
-    DescribePhysicalConnectionsRequestFilter,
-    DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType,
-    DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet,
-    DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations,
-    DescribePortRangeListEntriesResponseBodyEntries,
-    DescribePortRangeListsRequestTag,
-    DescribePortRangeListsResponseBodyPortRangeListsTags,
-    DescribePortRangeListsResponseBodyPortRangeLists,
-    DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation,
-    DescribePrefixListAssociationsResponseBodyPrefixListAssociations,
-    DescribePrefixListAttributesResponseBodyEntriesEntry,
-    DescribePrefixListAttributesResponseBodyEntries,
-    DescribePrefixListsRequestTag,
-    DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag,
-    DescribePrefixListsResponseBodyPrefixListsPrefixListTags,
-    DescribePrefixListsResponseBodyPrefixListsPrefixList,
-    DescribePrefixListsResponseBodyPrefixLists,
-    DescribePriceRequestDataDisk,
-    DescribePriceRequestSchedulerOptions,
-    DescribePriceRequestSystemDisk,
-    DescribePriceRequestRecurrenceRules,
-    DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule,
-    DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules,
-    DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo,
-    DescribePriceResponseBodyPriceInfoPriceDetailInfos,
-    DescribePriceResponseBodyPriceInfoPrice,
-    DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice,
-    DescribePriceResponseBodyPriceInfoRelatedPrice,
-    DescribePriceResponseBodyPriceInfoRulesRule,
-    DescribePriceResponseBodyPriceInfoRules,
-    DescribePriceResponseBodyPriceInfo,
-    DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType,
-    DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes,
-    DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone,
-    DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones,
-    DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType,
-    DescribeRecommendInstanceTypeResponseBodyData,
-    DescribeRegionsResponseBodyRegionsRegion,
-    DescribeRegionsResponseBodyRegions,
-    DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule,
-    DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules,
-    DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo,
-    DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos,
-    DescribeRenewalPriceResponseBodyPriceInfoPrice,
-    DescribeRenewalPriceResponseBodyPriceInfoRulesRule,
-    DescribeRenewalPriceResponseBodyPriceInfoRules,
-    DescribeRenewalPriceResponseBodyPriceInfo,
-    DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute,
-    DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes,
-    DescribeReservedInstancesRequestTag,
-    DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock,
-    DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks,
-    DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag,
-    DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags,
-    DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance,
-    DescribeReservedInstancesResponseBodyReservedInstances,
-    DescribeResourceByTagsRequestTag,
-    DescribeResourceByTagsResponseBodyResourcesResource,
-    DescribeResourceByTagsResponseBodyResources,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources,
-    DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone,
-    DescribeResourcesModificationResponseBodyAvailableZones,
-    DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop,
-    DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops,
-    DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry,
-    DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys,
-    DescribeRouteTablesResponseBodyRouteTablesRouteTable,
-    DescribeRouteTablesResponseBodyRouteTables,
-    DescribeRouterInterfacesRequestFilter,
-    DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType,
-    DescribeRouterInterfacesResponseBodyRouterInterfaceSet,
-    DescribeSavingsPlanPriceResponseBodyPriceInfoPrice,
-    DescribeSavingsPlanPriceResponseBodyPriceInfoRules,
-    DescribeSavingsPlanPriceResponseBodyPriceInfo,
-    DescribeSecurityGroupAttributeResponseBodyPermissionsPermission,
-    DescribeSecurityGroupAttributeResponseBodyPermissions,
-    DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds,
-    DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup,
-    DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups,
-    DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference,
-    DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences,
-    DescribeSecurityGroupsRequestTag,
-    DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag,
-    DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags,
-    DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup,
-    DescribeSecurityGroupsResponseBodySecurityGroups,
-    DescribeSendFileResultsRequestTag,
-    DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance,
-    DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances,
-    DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag,
-    DescribeSendFileResultsResponseBodyInvocationsInvocationTags,
-    DescribeSendFileResultsResponseBodyInvocationsInvocation,
-    DescribeSendFileResultsResponseBodyInvocations,
-    DescribeSnapshotGroupsRequestTag,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags,
-    DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup,
-    DescribeSnapshotGroupsResponseBodySnapshotGroups,
-    DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink,
-    DescribeSnapshotLinksResponseBodySnapshotLinks,
-    DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint,
-    DescribeSnapshotMonitorDataResponseBodyMonitorData,
-    DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage,
-    DescribeSnapshotPackageResponseBodySnapshotPackages,
-    DescribeSnapshotsRequestFilter,
-    DescribeSnapshotsRequestTag,
-    DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag,
-    DescribeSnapshotsResponseBodySnapshotsSnapshotTags,
-    DescribeSnapshotsResponseBodySnapshotsSnapshot,
-    DescribeSnapshotsResponseBodySnapshots,
-    DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource,
-    DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources,
-    DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone,
-    DescribeSpotAdviceResponseBodyAvailableSpotZones,
-    DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType,
-    DescribeSpotPriceHistoryResponseBodySpotPrices,
-    DescribeStorageCapacityUnitsRequestTag,
-    DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag,
-    DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags,
-    DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit,
-    DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits,
-    DescribeStorageSetDetailsResponseBodyDisksDisk,
-    DescribeStorageSetDetailsResponseBodyDisks,
-    DescribeStorageSetsRequestTag,
-    DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag,
-    DescribeStorageSetsResponseBodyStorageSetsStorageSetTags,
-    DescribeStorageSetsResponseBodyStorageSetsStorageSet,
-    DescribeStorageSetsResponseBodyStorageSets,
-    DescribeTagsRequestTag,
-    DescribeTagsResponseBodyTagsTagResourceTypeCount,
-    DescribeTagsResponseBodyTagsTag,
-    DescribeTagsResponseBodyTags,
-    DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem,
-    DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet,
-    DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress,
-    DescribeTaskAttributeResponseBodyOperationProgressSet,
-    DescribeTasksResponseBodyTaskSetTask,
-    DescribeTasksResponseBodyTaskSet,
-    DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection,
-    DescribeTerminalSessionsResponseBodySessionsSessionConnections,
-    DescribeTerminalSessionsResponseBodySessionsSession,
-    DescribeTerminalSessionsResponseBodySessions,
-    DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds,
-    DescribeVRoutersResponseBodyVRoutersVRouter,
-    DescribeVRoutersResponseBodyVRouters,
-    DescribeVSwitchesResponseBodyVSwitchesVSwitch,
-    DescribeVSwitchesResponseBodyVSwitches,
-    DescribeVirtualBorderRoutersRequestFilter,
-    DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType,
-    DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet,
-    DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter,
-    DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType,
-    DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet,
-    DescribeVpcsResponseBodyVpcsVpcUserCidrs,
-    DescribeVpcsResponseBodyVpcsVpcVSwitchIds,
-    DescribeVpcsResponseBodyVpcsVpc,
-    DescribeVpcsResponseBodyVpcs,
-    DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes,
-    DescribeZonesResponseBodyZonesZoneAvailableDiskCategories,
-    DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes,
-    DescribeZonesResponseBodyZonesZoneAvailableResourceCreation,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories,
-    DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo,
-    DescribeZonesResponseBodyZonesZoneAvailableResources,
-    DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories,
-    DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations,
-    DescribeZonesResponseBodyZonesZone,
-    DescribeZonesResponseBodyZones,
-    DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet,
-    DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets,
-    DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult,
-    DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults,
-    DetachKeyPairResponseBodyResultsResult,
-    DetachKeyPairResponseBodyResults,
-    DisableActivationResponseBodyActivation,
-    EnableNetworkInterfaceQoSRequestQoS,
-    ImportImageRequestDiskDeviceMapping,
-    ImportImageRequestFeatures,
-    ImportImageRequestTag,
-    ImportKeyPairRequestTag,
-    InvokeCommandRequestResourceTag,
-    InvokeCommandRequestTag,
-    InvokeCommandShrinkRequestResourceTag,
-    InvokeCommandShrinkRequestTag,
-    ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus,
-    ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet,
-    ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus,
-    ListPluginStatusResponseBodyInstancePluginStatusSet,
-    ListTagResourcesRequestTag,
-    ListTagResourcesRequestTagFilter,
-    ListTagResourcesResponseBodyTagResourcesTagResource,
-    ListTagResourcesResponseBodyTagResources,
-    LockSnapshotResponseBodyLockedSnapshotInfo,
-    ModifyAutoProvisioningGroupRequestLaunchTemplateConfig,
-    ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn,
-    ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration,
-    ModifyCapacityReservationRequestPrivatePoolOptions,
-    ModifyCloudAssistantSettingsRequestAgentUpgradeConfig,
-    ModifyCloudAssistantSettingsRequestOssDeliveryConfig,
-    ModifyCloudAssistantSettingsRequestSessionManagerConfig,
-    ModifyCloudAssistantSettingsRequestSlsDeliveryConfig,
-    ModifyDedicatedHostAttributeRequestNetworkAttributes,
-    ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance,
-    ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances,
-    ModifyDiskSpecRequestPerformanceControlOptions,
-    ModifyElasticityAssuranceRequestPrivatePoolOptions,
-    ModifyElasticityAssuranceRequestRecurrenceRules,
-    ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions,
-    ModifyImageAttributeRequestFeatures,
-    ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions,
-    ModifyInstanceAttributeRequestCpuOptions,
-    ModifyInstanceAttributeRequestPrivateDnsNameOptions,
-    ModifyInstanceAttributeRequestRemoteConnectionOptions,
-    ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance,
-    ModifyInstanceChargeTypeResponseBodyFeeOfInstances,
-    ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow,
-    ModifyInstanceSpecRequestSystemDisk,
-    ModifyInstanceSpecRequestTemporary,
-    ModifyInstanceSpecRequestDisk,
-    ModifyManagedInstanceResponseBodyInstance,
-    ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration,
-    ModifyNetworkInterfaceAttributeRequestEnhancedNetwork,
-    ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig,
-    ModifyPortRangeListRequestAddEntry,
-    ModifyPortRangeListRequestRemoveEntry,
-    ModifyPrefixListRequestAddEntry,
-    ModifyPrefixListRequestRemoveEntry,
-    ModifyPrepayInstanceSpecRequestSystemDisk,
-    ModifyPrepayInstanceSpecRequestDisk,
-    ModifyReservedInstancesRequestConfiguration,
-    ModifyReservedInstancesResponseBodyReservedInstanceIdSets,
-    PurchaseElasticityAssuranceRequestPrivatePoolOptions,
-    PurchaseReservedInstancesOfferingRequestTag,
-    PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets,
-    PurchaseStorageCapacityUnitRequestTag,
-    PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds,
-    RebootInstancesResponseBodyInstanceResponsesInstanceResponse,
-    RebootInstancesResponseBodyInstanceResponses,
-    ReleaseCapacityReservationRequestPrivatePoolOptions,
-    RemoveTagsRequestTag,
-    RenewElasticityAssurancesRequestPrivatePoolOptions,
-    RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet,
-    RenewReservedInstancesResponseBodyReservedInstanceIdSets,
-    ReplaceSystemDiskRequestSystemDisk,
-    ReplaceSystemDiskRequestArn,
-    ResetDisksRequestDisk,
-    ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem,
-    ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet,
-    ResetDisksResponseBodyOperationProgressSetOperationProgress,
-    ResetDisksResponseBodyOperationProgressSet,
-    RevokeSecurityGroupRequestPermissions,
-    RevokeSecurityGroupEgressRequestPermissions,
-    RunCommandRequestResourceTag,
-    RunCommandRequestTag,
-    RunCommandShrinkRequestResourceTag,
-    RunCommandShrinkRequestTag,
-    RunInstancesRequestCpuOptions,
-    RunInstancesRequestHibernationOptions,
-    RunInstancesRequestPrivatePoolOptions,
-    RunInstancesRequestSchedulerOptions,
-    RunInstancesRequestSecurityOptions,
-    RunInstancesRequestSystemDisk,
-    RunInstancesRequestArn,
-    RunInstancesRequestClockOptions,
-    RunInstancesRequestDataDisk,
-    RunInstancesRequestImageOptions,
-    RunInstancesRequestNetworkInterface,
-    RunInstancesRequestNetworkOptions,
-    RunInstancesRequestPrivateDnsNameOptions,
-    RunInstancesRequestTag,
-    RunInstancesResponseBodyInstanceIdSets,
-    SendFileRequestTag,
-    StartImagePipelineExecutionRequestTag,
-    StartImagePipelineExecutionRequestTemplateTag,
-    StartInstancesResponseBodyInstanceResponsesInstanceResponse,
-    StartInstancesResponseBodyInstanceResponses,
-    StartTerminalSessionRequestEncryptionOptions,
-    StopInstancesResponseBodyInstanceResponsesInstanceResponse,
-    StopInstancesResponseBodyInstanceResponses,
-    TagResourcesRequestTag
+    'AcceptInquiredSystemEventRequest',
+    'AcceptInquiredSystemEventResponseBody',
+    'AcceptInquiredSystemEventResponse',
+    'ActivateRouterInterfaceRequest',
+    'ActivateRouterInterfaceResponseBody',
+    'ActivateRouterInterfaceResponse',
+    'AddBandwidthPackageIpsRequest',
+    'AddBandwidthPackageIpsResponseBody',
+    'AddBandwidthPackageIpsResponse',
+    'AddTagsRequest',
+    'AddTagsResponseBody',
+    'AddTagsResponse',
+    'AllocateDedicatedHostsRequest',
+    'AllocateDedicatedHostsResponseBody',
+    'AllocateDedicatedHostsResponse',
+    'AllocateEipAddressRequest',
+    'AllocateEipAddressResponseBody',
+    'AllocateEipAddressResponse',
+    'AllocatePublicIpAddressRequest',
+    'AllocatePublicIpAddressResponseBody',
+    'AllocatePublicIpAddressResponse',
+    'ApplyAutoSnapshotPolicyRequest',
+    'ApplyAutoSnapshotPolicyResponseBody',
+    'ApplyAutoSnapshotPolicyResponse',
+    'AssignIpv6AddressesRequest',
+    'AssignIpv6AddressesResponseBody',
+    'AssignIpv6AddressesResponse',
+    'AssignPrivateIpAddressesRequest',
+    'AssignPrivateIpAddressesResponseBody',
+    'AssignPrivateIpAddressesResponse',
+    'AssociateEipAddressRequest',
+    'AssociateEipAddressResponseBody',
+    'AssociateEipAddressResponse',
+    'AssociateHaVipRequest',
+    'AssociateHaVipResponseBody',
+    'AssociateHaVipResponse',
+    'AttachClassicLinkVpcRequest',
+    'AttachClassicLinkVpcResponseBody',
+    'AttachClassicLinkVpcResponse',
+    'AttachDiskRequest',
+    'AttachDiskResponseBody',
+    'AttachDiskResponse',
+    'AttachInstanceRamRoleRequest',
+    'AttachInstanceRamRoleResponseBody',
+    'AttachInstanceRamRoleResponse',
+    'AttachKeyPairRequest',
+    'AttachKeyPairResponseBody',
+    'AttachKeyPairResponse',
+    'AttachNetworkInterfaceRequest',
+    'AttachNetworkInterfaceResponseBody',
+    'AttachNetworkInterfaceResponse',
+    'AuthorizeSecurityGroupRequest',
+    'AuthorizeSecurityGroupResponseBody',
+    'AuthorizeSecurityGroupResponse',
+    'AuthorizeSecurityGroupEgressRequest',
+    'AuthorizeSecurityGroupEgressResponseBody',
+    'AuthorizeSecurityGroupEgressResponse',
+    'CancelAutoSnapshotPolicyRequest',
+    'CancelAutoSnapshotPolicyResponseBody',
+    'CancelAutoSnapshotPolicyResponse',
+    'CancelCopyImageRequest',
+    'CancelCopyImageResponseBody',
+    'CancelCopyImageResponse',
+    'CancelImagePipelineExecutionRequest',
+    'CancelImagePipelineExecutionResponseBody',
+    'CancelImagePipelineExecutionResponse',
+    'CancelPhysicalConnectionRequest',
+    'CancelPhysicalConnectionResponseBody',
+    'CancelPhysicalConnectionResponse',
+    'CancelSimulatedSystemEventsRequest',
+    'CancelSimulatedSystemEventsResponseBody',
+    'CancelSimulatedSystemEventsResponse',
+    'CancelTaskRequest',
+    'CancelTaskResponseBody',
+    'CancelTaskResponse',
+    'ConnectRouterInterfaceRequest',
+    'ConnectRouterInterfaceResponseBody',
+    'ConnectRouterInterfaceResponse',
+    'ConvertNatPublicIpToEipRequest',
+    'ConvertNatPublicIpToEipResponseBody',
+    'ConvertNatPublicIpToEipResponse',
+    'CopyImageRequest',
+    'CopyImageResponseBody',
+    'CopyImageResponse',
+    'CopySnapshotRequest',
+    'CopySnapshotResponseBody',
+    'CopySnapshotResponse',
+    'CreateActivationRequest',
+    'CreateActivationResponseBody',
+    'CreateActivationResponse',
+    'CreateAutoProvisioningGroupRequest',
+    'CreateAutoProvisioningGroupShrinkRequest',
+    'CreateAutoProvisioningGroupResponseBody',
+    'CreateAutoProvisioningGroupResponse',
+    'CreateAutoSnapshotPolicyRequest',
+    'CreateAutoSnapshotPolicyResponseBody',
+    'CreateAutoSnapshotPolicyResponse',
+    'CreateCapacityReservationRequest',
+    'CreateCapacityReservationResponseBody',
+    'CreateCapacityReservationResponse',
+    'CreateCommandRequest',
+    'CreateCommandResponseBody',
+    'CreateCommandResponse',
+    'CreateDedicatedHostClusterRequest',
+    'CreateDedicatedHostClusterResponseBody',
+    'CreateDedicatedHostClusterResponse',
+    'CreateDeploymentSetRequest',
+    'CreateDeploymentSetResponseBody',
+    'CreateDeploymentSetResponse',
+    'CreateDiagnosticMetricSetRequest',
+    'CreateDiagnosticMetricSetResponseBody',
+    'CreateDiagnosticMetricSetResponse',
+    'CreateDiagnosticReportRequest',
+    'CreateDiagnosticReportResponseBody',
+    'CreateDiagnosticReportResponse',
+    'CreateDiskRequest',
+    'CreateDiskResponseBody',
+    'CreateDiskResponse',
+    'CreateElasticityAssuranceRequest',
+    'CreateElasticityAssuranceResponseBody',
+    'CreateElasticityAssuranceResponse',
+    'CreateForwardEntryRequest',
+    'CreateForwardEntryResponseBody',
+    'CreateForwardEntryResponse',
+    'CreateHaVipRequest',
+    'CreateHaVipResponseBody',
+    'CreateHaVipResponse',
+    'CreateHpcClusterRequest',
+    'CreateHpcClusterResponseBody',
+    'CreateHpcClusterResponse',
+    'CreateImageRequest',
+    'CreateImageResponseBody',
+    'CreateImageResponse',
+    'CreateImageComponentRequest',
+    'CreateImageComponentResponseBody',
+    'CreateImageComponentResponse',
+    'CreateImagePipelineRequest',
+    'CreateImagePipelineResponseBody',
+    'CreateImagePipelineResponse',
+    'CreateInstanceRequest',
+    'CreateInstanceResponseBody',
+    'CreateInstanceResponse',
+    'CreateKeyPairRequest',
+    'CreateKeyPairResponseBody',
+    'CreateKeyPairResponse',
+    'CreateLaunchTemplateRequest',
+    'CreateLaunchTemplateResponseBody',
+    'CreateLaunchTemplateResponse',
+    'CreateLaunchTemplateVersionRequest',
+    'CreateLaunchTemplateVersionResponseBody',
+    'CreateLaunchTemplateVersionResponse',
+    'CreateNatGatewayRequest',
+    'CreateNatGatewayResponseBody',
+    'CreateNatGatewayResponse',
+    'CreateNetworkInterfaceRequest',
+    'CreateNetworkInterfaceResponseBody',
+    'CreateNetworkInterfaceResponse',
+    'CreateNetworkInterfacePermissionRequest',
+    'CreateNetworkInterfacePermissionResponseBody',
+    'CreateNetworkInterfacePermissionResponse',
+    'CreatePhysicalConnectionRequest',
+    'CreatePhysicalConnectionResponseBody',
+    'CreatePhysicalConnectionResponse',
+    'CreatePortRangeListRequest',
+    'CreatePortRangeListResponseBody',
+    'CreatePortRangeListResponse',
+    'CreatePrefixListRequest',
+    'CreatePrefixListResponseBody',
+    'CreatePrefixListResponse',
+    'CreateRouteEntryRequest',
+    'CreateRouteEntryResponseBody',
+    'CreateRouteEntryResponse',
+    'CreateRouterInterfaceRequest',
+    'CreateRouterInterfaceResponseBody',
+    'CreateRouterInterfaceResponse',
+    'CreateSavingsPlanRequest',
+    'CreateSavingsPlanResponseBody',
+    'CreateSavingsPlanResponse',
+    'CreateSecurityGroupRequest',
+    'CreateSecurityGroupResponseBody',
+    'CreateSecurityGroupResponse',
+    'CreateSimulatedSystemEventsRequest',
+    'CreateSimulatedSystemEventsResponseBody',
+    'CreateSimulatedSystemEventsResponse',
+    'CreateSnapshotRequest',
+    'CreateSnapshotResponseBody',
+    'CreateSnapshotResponse',
+    'CreateSnapshotGroupRequest',
+    'CreateSnapshotGroupResponseBody',
+    'CreateSnapshotGroupResponse',
+    'CreateStorageSetRequest',
+    'CreateStorageSetResponseBody',
+    'CreateStorageSetResponse',
+    'CreateVSwitchRequest',
+    'CreateVSwitchResponseBody',
+    'CreateVSwitchResponse',
+    'CreateVirtualBorderRouterRequest',
+    'CreateVirtualBorderRouterResponseBody',
+    'CreateVirtualBorderRouterResponse',
+    'CreateVpcRequest',
+    'CreateVpcResponseBody',
+    'CreateVpcResponse',
+    'DeactivateRouterInterfaceRequest',
+    'DeactivateRouterInterfaceResponseBody',
+    'DeactivateRouterInterfaceResponse',
+    'DeleteActivationRequest',
+    'DeleteActivationResponseBody',
+    'DeleteActivationResponse',
+    'DeleteAutoProvisioningGroupRequest',
+    'DeleteAutoProvisioningGroupResponseBody',
+    'DeleteAutoProvisioningGroupResponse',
+    'DeleteAutoSnapshotPolicyRequest',
+    'DeleteAutoSnapshotPolicyResponseBody',
+    'DeleteAutoSnapshotPolicyResponse',
+    'DeleteBandwidthPackageRequest',
+    'DeleteBandwidthPackageResponseBody',
+    'DeleteBandwidthPackageResponse',
+    'DeleteCommandRequest',
+    'DeleteCommandResponseBody',
+    'DeleteCommandResponse',
+    'DeleteDedicatedHostClusterRequest',
+    'DeleteDedicatedHostClusterResponseBody',
+    'DeleteDedicatedHostClusterResponse',
+    'DeleteDeploymentSetRequest',
+    'DeleteDeploymentSetResponseBody',
+    'DeleteDeploymentSetResponse',
+    'DeleteDiagnosticMetricSetsRequest',
+    'DeleteDiagnosticMetricSetsResponseBody',
+    'DeleteDiagnosticMetricSetsResponse',
+    'DeleteDiagnosticReportsRequest',
+    'DeleteDiagnosticReportsResponseBody',
+    'DeleteDiagnosticReportsResponse',
+    'DeleteDiskRequest',
+    'DeleteDiskResponseBody',
+    'DeleteDiskResponse',
+    'DeleteForwardEntryRequest',
+    'DeleteForwardEntryResponseBody',
+    'DeleteForwardEntryResponse',
+    'DeleteHaVipRequest',
+    'DeleteHaVipResponseBody',
+    'DeleteHaVipResponse',
+    'DeleteHpcClusterRequest',
+    'DeleteHpcClusterResponseBody',
+    'DeleteHpcClusterResponse',
+    'DeleteImageRequest',
+    'DeleteImageResponseBody',
+    'DeleteImageResponse',
+    'DeleteImageComponentRequest',
+    'DeleteImageComponentResponseBody',
+    'DeleteImageComponentResponse',
+    'DeleteImagePipelineRequest',
+    'DeleteImagePipelineResponseBody',
+    'DeleteImagePipelineResponse',
+    'DeleteInstanceRequest',
+    'DeleteInstanceResponseBody',
+    'DeleteInstanceResponse',
+    'DeleteInstancesRequest',
+    'DeleteInstancesResponseBody',
+    'DeleteInstancesResponse',
+    'DeleteKeyPairsRequest',
+    'DeleteKeyPairsResponseBody',
+    'DeleteKeyPairsResponse',
+    'DeleteLaunchTemplateRequest',
+    'DeleteLaunchTemplateResponseBody',
+    'DeleteLaunchTemplateResponse',
+    'DeleteLaunchTemplateVersionRequest',
+    'DeleteLaunchTemplateVersionResponseBody',
+    'DeleteLaunchTemplateVersionResponse',
+    'DeleteNatGatewayRequest',
+    'DeleteNatGatewayResponseBody',
+    'DeleteNatGatewayResponse',
+    'DeleteNetworkInterfaceRequest',
+    'DeleteNetworkInterfaceResponseBody',
+    'DeleteNetworkInterfaceResponse',
+    'DeleteNetworkInterfacePermissionRequest',
+    'DeleteNetworkInterfacePermissionResponseBody',
+    'DeleteNetworkInterfacePermissionResponse',
+    'DeletePhysicalConnectionRequest',
+    'DeletePhysicalConnectionResponseBody',
+    'DeletePhysicalConnectionResponse',
+    'DeletePortRangeListRequest',
+    'DeletePortRangeListResponseBody',
+    'DeletePortRangeListResponse',
+    'DeletePrefixListRequest',
+    'DeletePrefixListResponseBody',
+    'DeletePrefixListResponse',
+    'DeleteRouteEntryRequest',
+    'DeleteRouteEntryResponseBody',
+    'DeleteRouteEntryResponse',
+    'DeleteRouterInterfaceRequest',
+    'DeleteRouterInterfaceResponseBody',
+    'DeleteRouterInterfaceResponse',
+    'DeleteSecurityGroupRequest',
+    'DeleteSecurityGroupResponseBody',
+    'DeleteSecurityGroupResponse',
+    'DeleteSnapshotRequest',
+    'DeleteSnapshotResponseBody',
+    'DeleteSnapshotResponse',
+    'DeleteSnapshotGroupRequest',
+    'DeleteSnapshotGroupResponseBody',
+    'DeleteSnapshotGroupResponse',
+    'DeleteStorageSetRequest',
+    'DeleteStorageSetResponseBody',
+    'DeleteStorageSetResponse',
+    'DeleteVSwitchRequest',
+    'DeleteVSwitchResponseBody',
+    'DeleteVSwitchResponse',
+    'DeleteVirtualBorderRouterRequest',
+    'DeleteVirtualBorderRouterResponseBody',
+    'DeleteVirtualBorderRouterResponse',
+    'DeleteVpcRequest',
+    'DeleteVpcResponseBody',
+    'DeleteVpcResponse',
+    'DeregisterManagedInstanceRequest',
+    'DeregisterManagedInstanceResponseBody',
+    'DeregisterManagedInstanceResponse',
+    'DescribeAccessPointsRequest',
+    'DescribeAccessPointsResponseBody',
+    'DescribeAccessPointsResponse',
+    'DescribeAccountAttributesRequest',
+    'DescribeAccountAttributesResponseBody',
+    'DescribeAccountAttributesResponse',
+    'DescribeActivationsRequest',
+    'DescribeActivationsResponseBody',
+    'DescribeActivationsResponse',
+    'DescribeAutoProvisioningGroupHistoryRequest',
+    'DescribeAutoProvisioningGroupHistoryResponseBody',
+    'DescribeAutoProvisioningGroupHistoryResponse',
+    'DescribeAutoProvisioningGroupInstancesRequest',
+    'DescribeAutoProvisioningGroupInstancesResponseBody',
+    'DescribeAutoProvisioningGroupInstancesResponse',
+    'DescribeAutoProvisioningGroupsRequest',
+    'DescribeAutoProvisioningGroupsResponseBody',
+    'DescribeAutoProvisioningGroupsResponse',
+    'DescribeAutoSnapshotPolicyAssociationsRequest',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBody',
+    'DescribeAutoSnapshotPolicyAssociationsResponse',
+    'DescribeAutoSnapshotPolicyExRequest',
+    'DescribeAutoSnapshotPolicyExResponseBody',
+    'DescribeAutoSnapshotPolicyExResponse',
+    'DescribeAvailableResourceRequest',
+    'DescribeAvailableResourceResponseBody',
+    'DescribeAvailableResourceResponse',
+    'DescribeBandwidthLimitationRequest',
+    'DescribeBandwidthLimitationResponseBody',
+    'DescribeBandwidthLimitationResponse',
+    'DescribeBandwidthPackagesRequest',
+    'DescribeBandwidthPackagesResponseBody',
+    'DescribeBandwidthPackagesResponse',
+    'DescribeCapacityReservationInstancesRequest',
+    'DescribeCapacityReservationInstancesResponseBody',
+    'DescribeCapacityReservationInstancesResponse',
+    'DescribeCapacityReservationsRequest',
+    'DescribeCapacityReservationsResponseBody',
+    'DescribeCapacityReservationsResponse',
+    'DescribeClassicLinkInstancesRequest',
+    'DescribeClassicLinkInstancesResponseBody',
+    'DescribeClassicLinkInstancesResponse',
+    'DescribeCloudAssistantSettingsRequest',
+    'DescribeCloudAssistantSettingsResponseBody',
+    'DescribeCloudAssistantSettingsResponse',
+    'DescribeCloudAssistantStatusRequest',
+    'DescribeCloudAssistantStatusResponseBody',
+    'DescribeCloudAssistantStatusResponse',
+    'DescribeClustersRequest',
+    'DescribeClustersResponseBody',
+    'DescribeClustersResponse',
+    'DescribeCommandsRequest',
+    'DescribeCommandsResponseBody',
+    'DescribeCommandsResponse',
+    'DescribeDedicatedHostAutoRenewRequest',
+    'DescribeDedicatedHostAutoRenewResponseBody',
+    'DescribeDedicatedHostAutoRenewResponse',
+    'DescribeDedicatedHostClustersRequest',
+    'DescribeDedicatedHostClustersResponseBody',
+    'DescribeDedicatedHostClustersResponse',
+    'DescribeDedicatedHostTypesRequest',
+    'DescribeDedicatedHostTypesResponseBody',
+    'DescribeDedicatedHostTypesResponse',
+    'DescribeDedicatedHostsRequest',
+    'DescribeDedicatedHostsResponseBody',
+    'DescribeDedicatedHostsResponse',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyRequest',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponse',
+    'DescribeDeploymentSetsRequest',
+    'DescribeDeploymentSetsResponseBody',
+    'DescribeDeploymentSetsResponse',
+    'DescribeDiagnosticMetricSetsRequest',
+    'DescribeDiagnosticMetricSetsResponseBody',
+    'DescribeDiagnosticMetricSetsResponse',
+    'DescribeDiagnosticMetricsRequest',
+    'DescribeDiagnosticMetricsResponseBody',
+    'DescribeDiagnosticMetricsResponse',
+    'DescribeDiagnosticReportAttributesRequest',
+    'DescribeDiagnosticReportAttributesResponseBody',
+    'DescribeDiagnosticReportAttributesResponse',
+    'DescribeDiagnosticReportsRequest',
+    'DescribeDiagnosticReportsResponseBody',
+    'DescribeDiagnosticReportsResponse',
+    'DescribeDiskDefaultKMSKeyIdRequest',
+    'DescribeDiskDefaultKMSKeyIdResponseBody',
+    'DescribeDiskDefaultKMSKeyIdResponse',
+    'DescribeDiskEncryptionByDefaultStatusRequest',
+    'DescribeDiskEncryptionByDefaultStatusResponseBody',
+    'DescribeDiskEncryptionByDefaultStatusResponse',
+    'DescribeDiskMonitorDataRequest',
+    'DescribeDiskMonitorDataResponseBody',
+    'DescribeDiskMonitorDataResponse',
+    'DescribeDisksRequest',
+    'DescribeDisksResponseBody',
+    'DescribeDisksResponse',
+    'DescribeDisksFullStatusRequest',
+    'DescribeDisksFullStatusResponseBody',
+    'DescribeDisksFullStatusResponse',
+    'DescribeEipAddressesRequest',
+    'DescribeEipAddressesResponseBody',
+    'DescribeEipAddressesResponse',
+    'DescribeEipMonitorDataRequest',
+    'DescribeEipMonitorDataResponseBody',
+    'DescribeEipMonitorDataResponse',
+    'DescribeElasticityAssuranceAutoRenewAttributeRequest',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBody',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponse',
+    'DescribeElasticityAssuranceInstancesRequest',
+    'DescribeElasticityAssuranceInstancesResponseBody',
+    'DescribeElasticityAssuranceInstancesResponse',
+    'DescribeElasticityAssurancesRequest',
+    'DescribeElasticityAssurancesResponseBody',
+    'DescribeElasticityAssurancesResponse',
+    'DescribeEniMonitorDataRequest',
+    'DescribeEniMonitorDataResponseBody',
+    'DescribeEniMonitorDataResponse',
+    'DescribeForwardTableEntriesRequest',
+    'DescribeForwardTableEntriesResponseBody',
+    'DescribeForwardTableEntriesResponse',
+    'DescribeHaVipsRequest',
+    'DescribeHaVipsResponseBody',
+    'DescribeHaVipsResponse',
+    'DescribeHpcClustersRequest',
+    'DescribeHpcClustersResponseBody',
+    'DescribeHpcClustersResponse',
+    'DescribeImageComponentsRequest',
+    'DescribeImageComponentsResponseBody',
+    'DescribeImageComponentsResponse',
+    'DescribeImageFromFamilyRequest',
+    'DescribeImageFromFamilyResponseBody',
+    'DescribeImageFromFamilyResponse',
+    'DescribeImagePipelineExecutionsRequest',
+    'DescribeImagePipelineExecutionsResponseBody',
+    'DescribeImagePipelineExecutionsResponse',
+    'DescribeImagePipelinesRequest',
+    'DescribeImagePipelinesResponseBody',
+    'DescribeImagePipelinesResponse',
+    'DescribeImageSharePermissionRequest',
+    'DescribeImageSharePermissionResponseBody',
+    'DescribeImageSharePermissionResponse',
+    'DescribeImageSupportInstanceTypesRequest',
+    'DescribeImageSupportInstanceTypesResponseBody',
+    'DescribeImageSupportInstanceTypesResponse',
+    'DescribeImagesRequest',
+    'DescribeImagesResponseBody',
+    'DescribeImagesResponse',
+    'DescribeInstanceAttachmentAttributesRequest',
+    'DescribeInstanceAttachmentAttributesResponseBody',
+    'DescribeInstanceAttachmentAttributesResponse',
+    'DescribeInstanceAttributeRequest',
+    'DescribeInstanceAttributeResponseBody',
+    'DescribeInstanceAttributeResponse',
+    'DescribeInstanceAutoRenewAttributeRequest',
+    'DescribeInstanceAutoRenewAttributeResponseBody',
+    'DescribeInstanceAutoRenewAttributeResponse',
+    'DescribeInstanceHistoryEventsRequest',
+    'DescribeInstanceHistoryEventsResponseBody',
+    'DescribeInstanceHistoryEventsResponse',
+    'DescribeInstanceMaintenanceAttributesRequest',
+    'DescribeInstanceMaintenanceAttributesResponseBody',
+    'DescribeInstanceMaintenanceAttributesResponse',
+    'DescribeInstanceModificationPriceRequest',
+    'DescribeInstanceModificationPriceResponseBody',
+    'DescribeInstanceModificationPriceResponse',
+    'DescribeInstanceMonitorDataRequest',
+    'DescribeInstanceMonitorDataResponseBody',
+    'DescribeInstanceMonitorDataResponse',
+    'DescribeInstanceRamRoleRequest',
+    'DescribeInstanceRamRoleResponseBody',
+    'DescribeInstanceRamRoleResponse',
+    'DescribeInstanceStatusRequest',
+    'DescribeInstanceStatusResponseBody',
+    'DescribeInstanceStatusResponse',
+    'DescribeInstanceTopologyRequest',
+    'DescribeInstanceTopologyResponseBody',
+    'DescribeInstanceTopologyResponse',
+    'DescribeInstanceTypeFamiliesRequest',
+    'DescribeInstanceTypeFamiliesResponseBody',
+    'DescribeInstanceTypeFamiliesResponse',
+    'DescribeInstanceTypesRequest',
+    'DescribeInstanceTypesResponseBody',
+    'DescribeInstanceTypesResponse',
+    'DescribeInstanceVncUrlRequest',
+    'DescribeInstanceVncUrlResponseBody',
+    'DescribeInstanceVncUrlResponse',
+    'DescribeInstancesRequest',
+    'DescribeInstancesResponseBody',
+    'DescribeInstancesResponse',
+    'DescribeInstancesFullStatusRequest',
+    'DescribeInstancesFullStatusResponseBody',
+    'DescribeInstancesFullStatusResponse',
+    'DescribeInvocationResultsRequest',
+    'DescribeInvocationResultsResponseBody',
+    'DescribeInvocationResultsResponse',
+    'DescribeInvocationsRequest',
+    'DescribeInvocationsResponseBody',
+    'DescribeInvocationsResponse',
+    'DescribeKeyPairsRequest',
+    'DescribeKeyPairsResponseBody',
+    'DescribeKeyPairsResponse',
+    'DescribeLaunchTemplateVersionsRequest',
+    'DescribeLaunchTemplateVersionsResponseBody',
+    'DescribeLaunchTemplateVersionsResponse',
+    'DescribeLaunchTemplatesRequest',
+    'DescribeLaunchTemplatesResponseBody',
+    'DescribeLaunchTemplatesResponse',
+    'DescribeLimitationRequest',
+    'DescribeLimitationResponseBody',
+    'DescribeLimitationResponse',
+    'DescribeLockedSnapshotsRequest',
+    'DescribeLockedSnapshotsResponseBody',
+    'DescribeLockedSnapshotsResponse',
+    'DescribeManagedInstancesRequest',
+    'DescribeManagedInstancesResponseBody',
+    'DescribeManagedInstancesResponse',
+    'DescribeNatGatewaysRequest',
+    'DescribeNatGatewaysResponseBody',
+    'DescribeNatGatewaysResponse',
+    'DescribeNetworkInterfaceAttributeRequest',
+    'DescribeNetworkInterfaceAttributeResponseBody',
+    'DescribeNetworkInterfaceAttributeResponse',
+    'DescribeNetworkInterfacePermissionsRequest',
+    'DescribeNetworkInterfacePermissionsResponseBody',
+    'DescribeNetworkInterfacePermissionsResponse',
+    'DescribeNetworkInterfacesRequest',
+    'DescribeNetworkInterfacesResponseBody',
+    'DescribeNetworkInterfacesResponse',
+    'DescribeNewProjectEipMonitorDataRequest',
+    'DescribeNewProjectEipMonitorDataResponseBody',
+    'DescribeNewProjectEipMonitorDataResponse',
+    'DescribePhysicalConnectionsRequest',
+    'DescribePhysicalConnectionsResponseBody',
+    'DescribePhysicalConnectionsResponse',
+    'DescribePortRangeListAssociationsRequest',
+    'DescribePortRangeListAssociationsResponseBody',
+    'DescribePortRangeListAssociationsResponse',
+    'DescribePortRangeListEntriesRequest',
+    'DescribePortRangeListEntriesResponseBody',
+    'DescribePortRangeListEntriesResponse',
+    'DescribePortRangeListsRequest',
+    'DescribePortRangeListsResponseBody',
+    'DescribePortRangeListsResponse',
+    'DescribePrefixListAssociationsRequest',
+    'DescribePrefixListAssociationsResponseBody',
+    'DescribePrefixListAssociationsResponse',
+    'DescribePrefixListAttributesRequest',
+    'DescribePrefixListAttributesResponseBody',
+    'DescribePrefixListAttributesResponse',
+    'DescribePrefixListsRequest',
+    'DescribePrefixListsResponseBody',
+    'DescribePrefixListsResponse',
+    'DescribePriceRequest',
+    'DescribePriceResponseBody',
+    'DescribePriceResponse',
+    'DescribeRecommendInstanceTypeRequest',
+    'DescribeRecommendInstanceTypeResponseBody',
+    'DescribeRecommendInstanceTypeResponse',
+    'DescribeRegionsRequest',
+    'DescribeRegionsResponseBody',
+    'DescribeRegionsResponse',
+    'DescribeRenewalPriceRequest',
+    'DescribeRenewalPriceResponseBody',
+    'DescribeRenewalPriceResponse',
+    'DescribeReservedInstanceAutoRenewAttributeRequest',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBody',
+    'DescribeReservedInstanceAutoRenewAttributeResponse',
+    'DescribeReservedInstancesRequest',
+    'DescribeReservedInstancesResponseBody',
+    'DescribeReservedInstancesResponse',
+    'DescribeResourceByTagsRequest',
+    'DescribeResourceByTagsResponseBody',
+    'DescribeResourceByTagsResponse',
+    'DescribeResourcesModificationRequest',
+    'DescribeResourcesModificationResponseBody',
+    'DescribeResourcesModificationResponse',
+    'DescribeRouteTablesRequest',
+    'DescribeRouteTablesResponseBody',
+    'DescribeRouteTablesResponse',
+    'DescribeRouterInterfacesRequest',
+    'DescribeRouterInterfacesResponseBody',
+    'DescribeRouterInterfacesResponse',
+    'DescribeSavingsPlanEstimationRequest',
+    'DescribeSavingsPlanEstimationResponseBody',
+    'DescribeSavingsPlanEstimationResponse',
+    'DescribeSavingsPlanPriceRequest',
+    'DescribeSavingsPlanPriceResponseBody',
+    'DescribeSavingsPlanPriceResponse',
+    'DescribeSecurityGroupAttributeRequest',
+    'DescribeSecurityGroupAttributeResponseBody',
+    'DescribeSecurityGroupAttributeResponse',
+    'DescribeSecurityGroupReferencesRequest',
+    'DescribeSecurityGroupReferencesResponseBody',
+    'DescribeSecurityGroupReferencesResponse',
+    'DescribeSecurityGroupsRequest',
+    'DescribeSecurityGroupsResponseBody',
+    'DescribeSecurityGroupsResponse',
+    'DescribeSendFileResultsRequest',
+    'DescribeSendFileResultsResponseBody',
+    'DescribeSendFileResultsResponse',
+    'DescribeSnapshotGroupsRequest',
+    'DescribeSnapshotGroupsResponseBody',
+    'DescribeSnapshotGroupsResponse',
+    'DescribeSnapshotLinksRequest',
+    'DescribeSnapshotLinksResponseBody',
+    'DescribeSnapshotLinksResponse',
+    'DescribeSnapshotMonitorDataRequest',
+    'DescribeSnapshotMonitorDataResponseBody',
+    'DescribeSnapshotMonitorDataResponse',
+    'DescribeSnapshotPackageRequest',
+    'DescribeSnapshotPackageResponseBody',
+    'DescribeSnapshotPackageResponse',
+    'DescribeSnapshotsRequest',
+    'DescribeSnapshotsResponseBody',
+    'DescribeSnapshotsResponse',
+    'DescribeSnapshotsUsageRequest',
+    'DescribeSnapshotsUsageResponseBody',
+    'DescribeSnapshotsUsageResponse',
+    'DescribeSpotAdviceRequest',
+    'DescribeSpotAdviceResponseBody',
+    'DescribeSpotAdviceResponse',
+    'DescribeSpotPriceHistoryRequest',
+    'DescribeSpotPriceHistoryResponseBody',
+    'DescribeSpotPriceHistoryResponse',
+    'DescribeStorageCapacityUnitsRequest',
+    'DescribeStorageCapacityUnitsResponseBody',
+    'DescribeStorageCapacityUnitsResponse',
+    'DescribeStorageSetDetailsRequest',
+    'DescribeStorageSetDetailsResponseBody',
+    'DescribeStorageSetDetailsResponse',
+    'DescribeStorageSetsRequest',
+    'DescribeStorageSetsResponseBody',
+    'DescribeStorageSetsResponse',
+    'DescribeTagsRequest',
+    'DescribeTagsResponseBody',
+    'DescribeTagsResponse',
+    'DescribeTaskAttributeRequest',
+    'DescribeTaskAttributeResponseBody',
+    'DescribeTaskAttributeResponse',
+    'DescribeTasksRequest',
+    'DescribeTasksResponseBody',
+    'DescribeTasksResponse',
+    'DescribeTerminalSessionsRequest',
+    'DescribeTerminalSessionsResponseBody',
+    'DescribeTerminalSessionsResponse',
+    'DescribeUserBusinessBehaviorRequest',
+    'DescribeUserBusinessBehaviorResponseBody',
+    'DescribeUserBusinessBehaviorResponse',
+    'DescribeUserDataRequest',
+    'DescribeUserDataResponseBody',
+    'DescribeUserDataResponse',
+    'DescribeVRoutersRequest',
+    'DescribeVRoutersResponseBody',
+    'DescribeVRoutersResponse',
+    'DescribeVSwitchesRequest',
+    'DescribeVSwitchesResponseBody',
+    'DescribeVSwitchesResponse',
+    'DescribeVirtualBorderRoutersRequest',
+    'DescribeVirtualBorderRoutersResponseBody',
+    'DescribeVirtualBorderRoutersResponse',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequest',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponse',
+    'DescribeVpcsRequest',
+    'DescribeVpcsResponseBody',
+    'DescribeVpcsResponse',
+    'DescribeZonesRequest',
+    'DescribeZonesResponseBody',
+    'DescribeZonesResponse',
+    'DetachClassicLinkVpcRequest',
+    'DetachClassicLinkVpcResponseBody',
+    'DetachClassicLinkVpcResponse',
+    'DetachDiskRequest',
+    'DetachDiskResponseBody',
+    'DetachDiskResponse',
+    'DetachInstanceRamRoleRequest',
+    'DetachInstanceRamRoleResponseBody',
+    'DetachInstanceRamRoleResponse',
+    'DetachKeyPairRequest',
+    'DetachKeyPairResponseBody',
+    'DetachKeyPairResponse',
+    'DetachNetworkInterfaceRequest',
+    'DetachNetworkInterfaceResponseBody',
+    'DetachNetworkInterfaceResponse',
+    'DisableActivationRequest',
+    'DisableActivationResponseBody',
+    'DisableActivationResponse',
+    'DisableDiskEncryptionByDefaultRequest',
+    'DisableDiskEncryptionByDefaultResponseBody',
+    'DisableDiskEncryptionByDefaultResponse',
+    'DisableNetworkInterfaceQoSRequest',
+    'DisableNetworkInterfaceQoSResponseBody',
+    'DisableNetworkInterfaceQoSResponse',
+    'EnableDiskEncryptionByDefaultRequest',
+    'EnableDiskEncryptionByDefaultResponseBody',
+    'EnableDiskEncryptionByDefaultResponse',
+    'EnableNetworkInterfaceQoSRequest',
+    'EnableNetworkInterfaceQoSResponseBody',
+    'EnableNetworkInterfaceQoSResponse',
+    'EnablePhysicalConnectionRequest',
+    'EnablePhysicalConnectionResponseBody',
+    'EnablePhysicalConnectionResponse',
+    'EndTerminalSessionRequest',
+    'EndTerminalSessionResponseBody',
+    'EndTerminalSessionResponse',
+    'ExportImageRequest',
+    'ExportImageResponseBody',
+    'ExportImageResponse',
+    'ExportSnapshotRequest',
+    'ExportSnapshotResponseBody',
+    'ExportSnapshotResponse',
+    'GetInstanceConsoleOutputRequest',
+    'GetInstanceConsoleOutputResponseBody',
+    'GetInstanceConsoleOutputResponse',
+    'GetInstanceScreenshotRequest',
+    'GetInstanceScreenshotResponseBody',
+    'GetInstanceScreenshotResponse',
+    'ImportImageRequest',
+    'ImportImageResponseBody',
+    'ImportImageResponse',
+    'ImportKeyPairRequest',
+    'ImportKeyPairResponseBody',
+    'ImportKeyPairResponse',
+    'InstallCloudAssistantRequest',
+    'InstallCloudAssistantResponseBody',
+    'InstallCloudAssistantResponse',
+    'InvokeCommandRequest',
+    'InvokeCommandShrinkRequest',
+    'InvokeCommandResponseBody',
+    'InvokeCommandResponse',
+    'JoinResourceGroupRequest',
+    'JoinResourceGroupResponseBody',
+    'JoinResourceGroupResponse',
+    'JoinSecurityGroupRequest',
+    'JoinSecurityGroupResponseBody',
+    'JoinSecurityGroupResponse',
+    'LeaveSecurityGroupRequest',
+    'LeaveSecurityGroupResponseBody',
+    'LeaveSecurityGroupResponse',
+    'ListPluginStatusRequest',
+    'ListPluginStatusResponseBody',
+    'ListPluginStatusResponse',
+    'ListTagResourcesRequest',
+    'ListTagResourcesResponseBody',
+    'ListTagResourcesResponse',
+    'LockSnapshotRequest',
+    'LockSnapshotResponseBody',
+    'LockSnapshotResponse',
+    'ModifyAutoProvisioningGroupRequest',
+    'ModifyAutoProvisioningGroupResponseBody',
+    'ModifyAutoProvisioningGroupResponse',
+    'ModifyAutoSnapshotPolicyExRequest',
+    'ModifyAutoSnapshotPolicyExResponseBody',
+    'ModifyAutoSnapshotPolicyExResponse',
+    'ModifyBandwidthPackageSpecRequest',
+    'ModifyBandwidthPackageSpecResponseBody',
+    'ModifyBandwidthPackageSpecResponse',
+    'ModifyCapacityReservationRequest',
+    'ModifyCapacityReservationResponseBody',
+    'ModifyCapacityReservationResponse',
+    'ModifyCloudAssistantSettingsRequest',
+    'ModifyCloudAssistantSettingsShrinkRequest',
+    'ModifyCloudAssistantSettingsResponseBody',
+    'ModifyCloudAssistantSettingsResponse',
+    'ModifyCommandRequest',
+    'ModifyCommandResponseBody',
+    'ModifyCommandResponse',
+    'ModifyDedicatedHostAttributeRequest',
+    'ModifyDedicatedHostAttributeResponseBody',
+    'ModifyDedicatedHostAttributeResponse',
+    'ModifyDedicatedHostAutoReleaseTimeRequest',
+    'ModifyDedicatedHostAutoReleaseTimeResponseBody',
+    'ModifyDedicatedHostAutoReleaseTimeResponse',
+    'ModifyDedicatedHostAutoRenewAttributeRequest',
+    'ModifyDedicatedHostAutoRenewAttributeResponseBody',
+    'ModifyDedicatedHostAutoRenewAttributeResponse',
+    'ModifyDedicatedHostClusterAttributeRequest',
+    'ModifyDedicatedHostClusterAttributeResponseBody',
+    'ModifyDedicatedHostClusterAttributeResponse',
+    'ModifyDedicatedHostsChargeTypeRequest',
+    'ModifyDedicatedHostsChargeTypeResponseBody',
+    'ModifyDedicatedHostsChargeTypeResponse',
+    'ModifyDeploymentSetAttributeRequest',
+    'ModifyDeploymentSetAttributeResponseBody',
+    'ModifyDeploymentSetAttributeResponse',
+    'ModifyDiagnosticMetricSetRequest',
+    'ModifyDiagnosticMetricSetResponseBody',
+    'ModifyDiagnosticMetricSetResponse',
+    'ModifyDiskAttributeRequest',
+    'ModifyDiskAttributeResponseBody',
+    'ModifyDiskAttributeResponse',
+    'ModifyDiskChargeTypeRequest',
+    'ModifyDiskChargeTypeResponseBody',
+    'ModifyDiskChargeTypeResponse',
+    'ModifyDiskDefaultKMSKeyIdRequest',
+    'ModifyDiskDefaultKMSKeyIdResponseBody',
+    'ModifyDiskDefaultKMSKeyIdResponse',
+    'ModifyDiskDeploymentRequest',
+    'ModifyDiskDeploymentResponseBody',
+    'ModifyDiskDeploymentResponse',
+    'ModifyDiskSpecRequest',
+    'ModifyDiskSpecResponseBody',
+    'ModifyDiskSpecResponse',
+    'ModifyEipAddressAttributeRequest',
+    'ModifyEipAddressAttributeResponseBody',
+    'ModifyEipAddressAttributeResponse',
+    'ModifyElasticityAssuranceRequest',
+    'ModifyElasticityAssuranceResponseBody',
+    'ModifyElasticityAssuranceResponse',
+    'ModifyElasticityAssuranceAutoRenewAttributeRequest',
+    'ModifyElasticityAssuranceAutoRenewAttributeResponseBody',
+    'ModifyElasticityAssuranceAutoRenewAttributeResponse',
+    'ModifyForwardEntryRequest',
+    'ModifyForwardEntryResponseBody',
+    'ModifyForwardEntryResponse',
+    'ModifyHaVipAttributeRequest',
+    'ModifyHaVipAttributeResponseBody',
+    'ModifyHaVipAttributeResponse',
+    'ModifyHpcClusterAttributeRequest',
+    'ModifyHpcClusterAttributeResponseBody',
+    'ModifyHpcClusterAttributeResponse',
+    'ModifyImageAttributeRequest',
+    'ModifyImageAttributeResponseBody',
+    'ModifyImageAttributeResponse',
+    'ModifyImageShareGroupPermissionRequest',
+    'ModifyImageShareGroupPermissionResponseBody',
+    'ModifyImageShareGroupPermissionResponse',
+    'ModifyImageSharePermissionRequest',
+    'ModifyImageSharePermissionResponseBody',
+    'ModifyImageSharePermissionResponse',
+    'ModifyInstanceAttachmentAttributesRequest',
+    'ModifyInstanceAttachmentAttributesResponseBody',
+    'ModifyInstanceAttachmentAttributesResponse',
+    'ModifyInstanceAttributeRequest',
+    'ModifyInstanceAttributeResponseBody',
+    'ModifyInstanceAttributeResponse',
+    'ModifyInstanceAutoReleaseTimeRequest',
+    'ModifyInstanceAutoReleaseTimeResponseBody',
+    'ModifyInstanceAutoReleaseTimeResponse',
+    'ModifyInstanceAutoRenewAttributeRequest',
+    'ModifyInstanceAutoRenewAttributeResponseBody',
+    'ModifyInstanceAutoRenewAttributeResponse',
+    'ModifyInstanceChargeTypeRequest',
+    'ModifyInstanceChargeTypeResponseBody',
+    'ModifyInstanceChargeTypeResponse',
+    'ModifyInstanceClockOptionsRequest',
+    'ModifyInstanceClockOptionsResponseBody',
+    'ModifyInstanceClockOptionsResponse',
+    'ModifyInstanceDeploymentRequest',
+    'ModifyInstanceDeploymentResponseBody',
+    'ModifyInstanceDeploymentResponse',
+    'ModifyInstanceMaintenanceAttributesRequest',
+    'ModifyInstanceMaintenanceAttributesResponseBody',
+    'ModifyInstanceMaintenanceAttributesResponse',
+    'ModifyInstanceMetadataOptionsRequest',
+    'ModifyInstanceMetadataOptionsResponseBody',
+    'ModifyInstanceMetadataOptionsResponse',
+    'ModifyInstanceNetworkOptionsRequest',
+    'ModifyInstanceNetworkOptionsResponseBody',
+    'ModifyInstanceNetworkOptionsResponse',
+    'ModifyInstanceNetworkSpecRequest',
+    'ModifyInstanceNetworkSpecResponseBody',
+    'ModifyInstanceNetworkSpecResponse',
+    'ModifyInstanceSpecRequest',
+    'ModifyInstanceSpecResponseBody',
+    'ModifyInstanceSpecResponse',
+    'ModifyInstanceVncPasswdRequest',
+    'ModifyInstanceVncPasswdResponseBody',
+    'ModifyInstanceVncPasswdResponse',
+    'ModifyInstanceVpcAttributeRequest',
+    'ModifyInstanceVpcAttributeResponseBody',
+    'ModifyInstanceVpcAttributeResponse',
+    'ModifyInvocationAttributeRequest',
+    'ModifyInvocationAttributeShrinkRequest',
+    'ModifyInvocationAttributeResponseBody',
+    'ModifyInvocationAttributeResponse',
+    'ModifyLaunchTemplateDefaultVersionRequest',
+    'ModifyLaunchTemplateDefaultVersionResponseBody',
+    'ModifyLaunchTemplateDefaultVersionResponse',
+    'ModifyManagedInstanceRequest',
+    'ModifyManagedInstanceResponseBody',
+    'ModifyManagedInstanceResponse',
+    'ModifyNetworkInterfaceAttributeRequest',
+    'ModifyNetworkInterfaceAttributeResponseBody',
+    'ModifyNetworkInterfaceAttributeResponse',
+    'ModifyPhysicalConnectionAttributeRequest',
+    'ModifyPhysicalConnectionAttributeResponseBody',
+    'ModifyPhysicalConnectionAttributeResponse',
+    'ModifyPortRangeListRequest',
+    'ModifyPortRangeListResponseBody',
+    'ModifyPortRangeListResponse',
+    'ModifyPrefixListRequest',
+    'ModifyPrefixListResponseBody',
+    'ModifyPrefixListResponse',
+    'ModifyPrepayInstanceSpecRequest',
+    'ModifyPrepayInstanceSpecResponseBody',
+    'ModifyPrepayInstanceSpecResponse',
+    'ModifyReservedInstanceAttributeRequest',
+    'ModifyReservedInstanceAttributeResponseBody',
+    'ModifyReservedInstanceAttributeResponse',
+    'ModifyReservedInstanceAutoRenewAttributeRequest',
+    'ModifyReservedInstanceAutoRenewAttributeResponseBody',
+    'ModifyReservedInstanceAutoRenewAttributeResponse',
+    'ModifyReservedInstancesRequest',
+    'ModifyReservedInstancesResponseBody',
+    'ModifyReservedInstancesResponse',
+    'ModifyRouterInterfaceAttributeRequest',
+    'ModifyRouterInterfaceAttributeResponseBody',
+    'ModifyRouterInterfaceAttributeResponse',
+    'ModifyRouterInterfaceSpecRequest',
+    'ModifyRouterInterfaceSpecResponseBody',
+    'ModifyRouterInterfaceSpecResponse',
+    'ModifySecurityGroupAttributeRequest',
+    'ModifySecurityGroupAttributeResponseBody',
+    'ModifySecurityGroupAttributeResponse',
+    'ModifySecurityGroupEgressRuleRequest',
+    'ModifySecurityGroupEgressRuleResponseBody',
+    'ModifySecurityGroupEgressRuleResponse',
+    'ModifySecurityGroupPolicyRequest',
+    'ModifySecurityGroupPolicyResponseBody',
+    'ModifySecurityGroupPolicyResponse',
+    'ModifySecurityGroupRuleRequest',
+    'ModifySecurityGroupRuleResponseBody',
+    'ModifySecurityGroupRuleResponse',
+    'ModifySnapshotAttributeRequest',
+    'ModifySnapshotAttributeResponseBody',
+    'ModifySnapshotAttributeResponse',
+    'ModifySnapshotCategoryRequest',
+    'ModifySnapshotCategoryResponseBody',
+    'ModifySnapshotCategoryResponse',
+    'ModifySnapshotGroupRequest',
+    'ModifySnapshotGroupResponseBody',
+    'ModifySnapshotGroupResponse',
+    'ModifyStorageCapacityUnitAttributeRequest',
+    'ModifyStorageCapacityUnitAttributeResponseBody',
+    'ModifyStorageCapacityUnitAttributeResponse',
+    'ModifyStorageSetAttributeRequest',
+    'ModifyStorageSetAttributeResponseBody',
+    'ModifyStorageSetAttributeResponse',
+    'ModifyUserBusinessBehaviorRequest',
+    'ModifyUserBusinessBehaviorResponseBody',
+    'ModifyUserBusinessBehaviorResponse',
+    'ModifyVRouterAttributeRequest',
+    'ModifyVRouterAttributeResponseBody',
+    'ModifyVRouterAttributeResponse',
+    'ModifyVSwitchAttributeRequest',
+    'ModifyVSwitchAttributeResponseBody',
+    'ModifyVSwitchAttributeResponse',
+    'ModifyVirtualBorderRouterAttributeRequest',
+    'ModifyVirtualBorderRouterAttributeResponseBody',
+    'ModifyVirtualBorderRouterAttributeResponse',
+    'ModifyVpcAttributeRequest',
+    'ModifyVpcAttributeResponseBody',
+    'ModifyVpcAttributeResponse',
+    'OpenSnapshotServiceRequest',
+    'OpenSnapshotServiceResponseBody',
+    'OpenSnapshotServiceResponse',
+    'PurchaseElasticityAssuranceRequest',
+    'PurchaseElasticityAssuranceResponseBody',
+    'PurchaseElasticityAssuranceResponse',
+    'PurchaseReservedInstancesOfferingRequest',
+    'PurchaseReservedInstancesOfferingResponseBody',
+    'PurchaseReservedInstancesOfferingResponse',
+    'PurchaseStorageCapacityUnitRequest',
+    'PurchaseStorageCapacityUnitResponseBody',
+    'PurchaseStorageCapacityUnitResponse',
+    'ReActivateInstancesRequest',
+    'ReActivateInstancesResponseBody',
+    'ReActivateInstancesResponse',
+    'ReInitDiskRequest',
+    'ReInitDiskResponseBody',
+    'ReInitDiskResponse',
+    'RebootInstanceRequest',
+    'RebootInstanceResponseBody',
+    'RebootInstanceResponse',
+    'RebootInstancesRequest',
+    'RebootInstancesResponseBody',
+    'RebootInstancesResponse',
+    'RecoverVirtualBorderRouterRequest',
+    'RecoverVirtualBorderRouterResponseBody',
+    'RecoverVirtualBorderRouterResponse',
+    'RedeployDedicatedHostRequest',
+    'RedeployDedicatedHostResponseBody',
+    'RedeployDedicatedHostResponse',
+    'RedeployInstanceRequest',
+    'RedeployInstanceResponseBody',
+    'RedeployInstanceResponse',
+    'ReleaseCapacityReservationRequest',
+    'ReleaseCapacityReservationResponseBody',
+    'ReleaseCapacityReservationResponse',
+    'ReleaseDedicatedHostRequest',
+    'ReleaseDedicatedHostResponseBody',
+    'ReleaseDedicatedHostResponse',
+    'ReleaseEipAddressRequest',
+    'ReleaseEipAddressResponseBody',
+    'ReleaseEipAddressResponse',
+    'ReleasePublicIpAddressRequest',
+    'ReleasePublicIpAddressResponseBody',
+    'ReleasePublicIpAddressResponse',
+    'RemoveBandwidthPackageIpsRequest',
+    'RemoveBandwidthPackageIpsResponseBody',
+    'RemoveBandwidthPackageIpsResponse',
+    'RemoveTagsRequest',
+    'RemoveTagsResponseBody',
+    'RemoveTagsResponse',
+    'RenewDedicatedHostsRequest',
+    'RenewDedicatedHostsResponseBody',
+    'RenewDedicatedHostsResponse',
+    'RenewElasticityAssurancesRequest',
+    'RenewElasticityAssurancesResponseBody',
+    'RenewElasticityAssurancesResponse',
+    'RenewInstanceRequest',
+    'RenewInstanceResponseBody',
+    'RenewInstanceResponse',
+    'RenewReservedInstancesRequest',
+    'RenewReservedInstancesResponseBody',
+    'RenewReservedInstancesResponse',
+    'ReplaceSystemDiskRequest',
+    'ReplaceSystemDiskResponseBody',
+    'ReplaceSystemDiskResponse',
+    'ReportInstancesStatusRequest',
+    'ReportInstancesStatusResponseBody',
+    'ReportInstancesStatusResponse',
+    'ResetDiskRequest',
+    'ResetDiskResponseBody',
+    'ResetDiskResponse',
+    'ResetDiskDefaultKMSKeyIdRequest',
+    'ResetDiskDefaultKMSKeyIdResponseBody',
+    'ResetDiskDefaultKMSKeyIdResponse',
+    'ResetDisksRequest',
+    'ResetDisksResponseBody',
+    'ResetDisksResponse',
+    'ResizeDiskRequest',
+    'ResizeDiskResponseBody',
+    'ResizeDiskResponse',
+    'RevokeSecurityGroupRequest',
+    'RevokeSecurityGroupResponseBody',
+    'RevokeSecurityGroupResponse',
+    'RevokeSecurityGroupEgressRequest',
+    'RevokeSecurityGroupEgressResponseBody',
+    'RevokeSecurityGroupEgressResponse',
+    'RunCommandRequest',
+    'RunCommandShrinkRequest',
+    'RunCommandResponseBody',
+    'RunCommandResponse',
+    'RunInstancesRequest',
+    'RunInstancesResponseBody',
+    'RunInstancesResponse',
+    'SendFileRequest',
+    'SendFileResponseBody',
+    'SendFileResponse',
+    'StartImagePipelineExecutionRequest',
+    'StartImagePipelineExecutionResponseBody',
+    'StartImagePipelineExecutionResponse',
+    'StartInstanceRequest',
+    'StartInstanceResponseBody',
+    'StartInstanceResponse',
+    'StartInstancesRequest',
+    'StartInstancesResponseBody',
+    'StartInstancesResponse',
+    'StartTerminalSessionRequest',
+    'StartTerminalSessionShrinkRequest',
+    'StartTerminalSessionResponseBody',
+    'StartTerminalSessionResponse',
+    'StopInstanceRequest',
+    'StopInstanceResponseBody',
+    'StopInstanceResponse',
+    'StopInstancesRequest',
+    'StopInstancesResponseBody',
+    'StopInstancesResponse',
+    'StopInvocationRequest',
+    'StopInvocationResponseBody',
+    'StopInvocationResponse',
+    'TagResourcesRequest',
+    'TagResourcesResponseBody',
+    'TagResourcesResponse',
+    'TerminatePhysicalConnectionRequest',
+    'TerminatePhysicalConnectionResponseBody',
+    'TerminatePhysicalConnectionResponse',
+    'TerminateVirtualBorderRouterRequest',
+    'TerminateVirtualBorderRouterResponseBody',
+    'TerminateVirtualBorderRouterResponse',
+    'UnassignIpv6AddressesRequest',
+    'UnassignIpv6AddressesResponseBody',
+    'UnassignIpv6AddressesResponse',
+    'UnassignPrivateIpAddressesRequest',
+    'UnassignPrivateIpAddressesResponseBody',
+    'UnassignPrivateIpAddressesResponse',
+    'UnassociateEipAddressRequest',
+    'UnassociateEipAddressResponseBody',
+    'UnassociateEipAddressResponse',
+    'UnassociateHaVipRequest',
+    'UnassociateHaVipResponseBody',
+    'UnassociateHaVipResponse',
+    'UnlockSnapshotRequest',
+    'UnlockSnapshotResponseBody',
+    'UnlockSnapshotResponse',
+    'UntagResourcesRequest',
+    'UntagResourcesResponseBody',
+    'UntagResourcesResponse',
+    'AddTagsRequestTag',
+    'AllocateDedicatedHostsRequestNetworkAttributes',
+    'AllocateDedicatedHostsRequestTag',
+    'AllocateDedicatedHostsResponseBodyDedicatedHostIdSets',
+    'AssignIpv6AddressesResponseBodyIpv6PrefixSets',
+    'AssignIpv6AddressesResponseBodyIpv6Sets',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet',
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet',
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult',
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults',
+    'AttachKeyPairResponseBodyResultsResult',
+    'AttachKeyPairResponseBodyResults',
+    'AuthorizeSecurityGroupRequestPermissions',
+    'AuthorizeSecurityGroupEgressRequestPermissions',
+    'CancelImagePipelineExecutionRequestTemplateTag',
+    'CopyImageRequestTag',
+    'CopySnapshotRequestArn',
+    'CopySnapshotRequestTag',
+    'CreateActivationRequestTag',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationArn',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationTag',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions',
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions',
+    'CreateAutoProvisioningGroupRequestLaunchConfiguration',
+    'CreateAutoProvisioningGroupRequestDataDiskConfig',
+    'CreateAutoProvisioningGroupRequestLaunchTemplateConfig',
+    'CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution',
+    'CreateAutoProvisioningGroupRequestPrePaidOptions',
+    'CreateAutoProvisioningGroupRequestResourcePoolOptions',
+    'CreateAutoProvisioningGroupRequestSystemDiskConfig',
+    'CreateAutoProvisioningGroupRequestTag',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration',
+    'CreateAutoProvisioningGroupShrinkRequestDataDiskConfig',
+    'CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig',
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution',
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptions',
+    'CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig',
+    'CreateAutoProvisioningGroupShrinkRequestTag',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult',
+    'CreateAutoProvisioningGroupResponseBodyLaunchResults',
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn',
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration',
+    'CreateAutoSnapshotPolicyRequestTag',
+    'CreateCapacityReservationRequestPrivatePoolOptions',
+    'CreateCapacityReservationRequestTag',
+    'CreateCommandRequestTag',
+    'CreateDedicatedHostClusterRequestTag',
+    'CreateDiskRequestArn',
+    'CreateDiskRequestTag',
+    'CreateElasticityAssuranceRequestPrivatePoolOptions',
+    'CreateElasticityAssuranceRequestRecurrenceRules',
+    'CreateElasticityAssuranceRequestTag',
+    'CreateImageRequestDiskDeviceMapping',
+    'CreateImageRequestFeatures',
+    'CreateImageRequestTag',
+    'CreateImageComponentRequestTag',
+    'CreateImagePipelineRequestAdvancedOptions',
+    'CreateImagePipelineRequestImageOptionsImageFeatures',
+    'CreateImagePipelineRequestImageOptionsImageTags',
+    'CreateImagePipelineRequestImageOptions',
+    'CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings',
+    'CreateImagePipelineRequestImportImageOptionsFeatures',
+    'CreateImagePipelineRequestImportImageOptionsImportImageTags',
+    'CreateImagePipelineRequestImportImageOptions',
+    'CreateImagePipelineRequestTag',
+    'CreateInstanceRequestHibernationOptions',
+    'CreateInstanceRequestPrivatePoolOptions',
+    'CreateInstanceRequestSystemDisk',
+    'CreateInstanceRequestArn',
+    'CreateInstanceRequestDataDisk',
+    'CreateInstanceRequestTag',
+    'CreateKeyPairRequestTag',
+    'CreateLaunchTemplateRequestSystemDisk',
+    'CreateLaunchTemplateRequestDataDisk',
+    'CreateLaunchTemplateRequestImageOptions',
+    'CreateLaunchTemplateRequestNetworkInterface',
+    'CreateLaunchTemplateRequestSecurityOptions',
+    'CreateLaunchTemplateRequestTag',
+    'CreateLaunchTemplateRequestTemplateTag',
+    'CreateLaunchTemplateVersionRequestSystemDisk',
+    'CreateLaunchTemplateVersionRequestDataDisk',
+    'CreateLaunchTemplateVersionRequestImageOptions',
+    'CreateLaunchTemplateVersionRequestNetworkInterface',
+    'CreateLaunchTemplateVersionRequestSecurityOptions',
+    'CreateLaunchTemplateVersionRequestTag',
+    'CreateNatGatewayRequestBandwidthPackage',
+    'CreateNatGatewayResponseBodyBandwidthPackageIds',
+    'CreateNatGatewayResponseBodyForwardTableIds',
+    'CreateNetworkInterfaceRequestConnectionTrackingConfiguration',
+    'CreateNetworkInterfaceRequestEnhancedNetwork',
+    'CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig',
+    'CreateNetworkInterfaceRequestTag',
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet',
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSets',
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet',
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSets',
+    'CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set',
+    'CreateNetworkInterfaceResponseBodyIpv6Sets',
+    'CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet',
+    'CreateNetworkInterfaceResponseBodyPrivateIpSets',
+    'CreateNetworkInterfaceResponseBodySecurityGroupIds',
+    'CreateNetworkInterfaceResponseBodyTagsTag',
+    'CreateNetworkInterfaceResponseBodyTags',
+    'CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission',
+    'CreatePortRangeListRequestEntry',
+    'CreatePortRangeListRequestTag',
+    'CreatePrefixListRequestEntry',
+    'CreatePrefixListRequestTag',
+    'CreateRouteEntryRequestNextHopList',
+    'CreateSecurityGroupRequestTag',
+    'CreateSimulatedSystemEventsResponseBodyEventIdSet',
+    'CreateSnapshotRequestTag',
+    'CreateSnapshotGroupRequestTag',
+    'CreateStorageSetRequestTag',
+    'DeleteActivationResponseBodyActivation',
+    'DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers',
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion',
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions',
+    'DeleteRouteEntryRequestNextHopList',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress',
+    'DeleteSnapshotGroupResponseBodyOperationProgressSet',
+    'DeregisterManagedInstanceResponseBodyInstance',
+    'DescribeAccessPointsRequestFilter',
+    'DescribeAccessPointsResponseBodyAccessPointSetAccessPointType',
+    'DescribeAccessPointsResponseBodyAccessPointSet',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem',
+    'DescribeAccountAttributesResponseBodyAccountAttributeItems',
+    'DescribeActivationsRequestTag',
+    'DescribeActivationsResponseBodyActivationListTags',
+    'DescribeActivationsResponseBodyActivationList',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory',
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories',
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance',
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstances',
+    'DescribeAutoProvisioningGroupsRequestTag',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup',
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation',
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations',
+    'DescribeAutoSnapshotPolicyExRequestTag',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy',
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources',
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone',
+    'DescribeAvailableResourceResponseBodyAvailableZones',
+    'DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth',
+    'DescribeBandwidthLimitationResponseBodyBandwidths',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage',
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackages',
+    'DescribeCapacityReservationInstancesRequestPrivatePoolOptions',
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet',
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem',
+    'DescribeCapacityReservationsRequestPrivatePoolOptions',
+    'DescribeCapacityReservationsRequestTag',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem',
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSet',
+    'DescribeClassicLinkInstancesResponseBodyLinksLink',
+    'DescribeClassicLinkInstancesResponseBodyLinks',
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows',
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig',
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig',
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs',
+    'DescribeCloudAssistantSettingsResponseBodySessionManagerConfig',
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig',
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs',
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus',
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet',
+    'DescribeClustersResponseBodyClustersCluster',
+    'DescribeClustersResponseBodyClusters',
+    'DescribeCommandsRequestTag',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition',
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitions',
+    'DescribeCommandsResponseBodyCommandsCommandParameterNames',
+    'DescribeCommandsResponseBodyCommandsCommandTagsTag',
+    'DescribeCommandsResponseBodyCommandsCommandTags',
+    'DescribeCommandsResponseBodyCommandsCommand',
+    'DescribeCommandsResponseBodyCommands',
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute',
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes',
+    'DescribeDedicatedHostClustersRequestTag',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster',
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType',
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes',
+    'DescribeDedicatedHostsRequestTag',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags',
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost',
+    'DescribeDedicatedHostsResponseBodyDedicatedHosts',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds',
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet',
+    'DescribeDeploymentSetsResponseBodyDeploymentSets',
+    'DescribeDiagnosticMetricSetsResponseBodyMetricSets',
+    'DescribeDiagnosticMetricsResponseBodyMetrics',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult',
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResults',
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue',
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssues',
+    'DescribeDiagnosticReportsResponseBodyReportsReport',
+    'DescribeDiagnosticReportsResponseBodyReports',
+    'DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData',
+    'DescribeDiskMonitorDataResponseBodyMonitorData',
+    'DescribeDisksRequestFilter',
+    'DescribeDisksRequestTag',
+    'DescribeDisksResponseBodyDisksDiskAttachmentsAttachment',
+    'DescribeDisksResponseBodyDisksDiskAttachments',
+    'DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance',
+    'DescribeDisksResponseBodyDisksDiskMountInstances',
+    'DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock',
+    'DescribeDisksResponseBodyDisksDiskOperationLocks',
+    'DescribeDisksResponseBodyDisksDiskPlacement',
+    'DescribeDisksResponseBodyDisksDiskTagsTag',
+    'DescribeDisksResponseBodyDisksDiskTags',
+    'DescribeDisksResponseBodyDisksDisk',
+    'DescribeDisksResponseBodyDisks',
+    'DescribeDisksFullStatusRequestEventTime',
+    'DescribeDisksFullStatusRequestTag',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType',
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSet',
+    'DescribeEipAddressesRequestFilter',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks',
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddress',
+    'DescribeEipAddressesResponseBodyEipAddresses',
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData',
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatas',
+    'DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute',
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes',
+    'DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions',
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet',
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem',
+    'DescribeElasticityAssurancesRequestPrivatePoolOptions',
+    'DescribeElasticityAssurancesRequestTag',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem',
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet',
+    'DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData',
+    'DescribeEniMonitorDataResponseBodyMonitorData',
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry',
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntries',
+    'DescribeHaVipsRequestFilter',
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses',
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances',
+    'DescribeHaVipsResponseBodyHaVipsHaVip',
+    'DescribeHaVipsResponseBodyHaVips',
+    'DescribeHpcClustersResponseBodyHpcClustersHpcCluster',
+    'DescribeHpcClustersResponseBodyHpcClusters',
+    'DescribeImageComponentsRequestTag',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags',
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSet',
+    'DescribeImageComponentsResponseBodyImageComponent',
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping',
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings',
+    'DescribeImageFromFamilyResponseBodyImageTagsTag',
+    'DescribeImageFromFamilyResponseBodyImageTags',
+    'DescribeImageFromFamilyResponseBodyImage',
+    'DescribeImagePipelineExecutionsRequestTag',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet',
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution',
+    'DescribeImagePipelinesRequestTag',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds',
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet',
+    'DescribeImagePipelinesResponseBodyImagePipeline',
+    'DescribeImageSharePermissionResponseBodyAccountsAccount',
+    'DescribeImageSharePermissionResponseBodyAccounts',
+    'DescribeImageSharePermissionResponseBodyShareGroupsShareGroup',
+    'DescribeImageSharePermissionResponseBodyShareGroups',
+    'DescribeImageSupportInstanceTypesRequestFilter',
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType',
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypes',
+    'DescribeImagesRequestFilter',
+    'DescribeImagesRequestTag',
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem',
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItems',
+    'DescribeImagesResponseBodyImagesImageDetectionOptions',
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping',
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappings',
+    'DescribeImagesResponseBodyImagesImageFeatures',
+    'DescribeImagesResponseBodyImagesImageTagsTag',
+    'DescribeImagesResponseBodyImagesImageTags',
+    'DescribeImagesResponseBodyImagesImage',
+    'DescribeImagesResponseBodyImages',
+    'DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance',
+    'DescribeInstanceAttachmentAttributesResponseBodyInstances',
+    'DescribeInstanceAttributeResponseBodyDedicatedHostAttribute',
+    'DescribeInstanceAttributeResponseBodyEipAddress',
+    'DescribeInstanceAttributeResponseBodyInnerIpAddress',
+    'DescribeInstanceAttributeResponseBodyNetworkOptions',
+    'DescribeInstanceAttributeResponseBodyOperationLocksLockReason',
+    'DescribeInstanceAttributeResponseBodyOperationLocks',
+    'DescribeInstanceAttributeResponseBodyPublicIpAddress',
+    'DescribeInstanceAttributeResponseBodySecurityGroupIds',
+    'DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress',
+    'DescribeInstanceAttributeResponseBodyVpcAttributes',
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute',
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes',
+    'DescribeInstanceHistoryEventsRequestEventPublishTime',
+    'DescribeInstanceHistoryEventsRequestNotBefore',
+    'DescribeInstanceHistoryEventsRequestTag',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType',
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute',
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes',
+    'DescribeInstanceModificationPriceRequestSystemDisk',
+    'DescribeInstanceModificationPriceRequestDataDisk',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPrice',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRules',
+    'DescribeInstanceModificationPriceResponseBodyPriceInfo',
+    'DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData',
+    'DescribeInstanceMonitorDataResponseBodyMonitorData',
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet',
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets',
+    'DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus',
+    'DescribeInstanceStatusResponseBodyInstanceStatuses',
+    'DescribeInstanceTopologyResponseBodyTopologysTopology',
+    'DescribeInstanceTopologyResponseBodyTopologys',
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily',
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes',
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceType',
+    'DescribeInstanceTypesResponseBodyInstanceTypes',
+    'DescribeInstancesRequestFilter',
+    'DescribeInstancesRequestTag',
+    'DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo',
+    'DescribeInstancesResponseBodyInstancesInstanceClockOptions',
+    'DescribeInstancesResponseBodyInstancesInstanceCpuOptions',
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute',
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute',
+    'DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr',
+    'DescribeInstancesResponseBodyInstancesInstanceEipAddress',
+    'DescribeInstancesResponseBodyInstancesInstanceHibernationOptions',
+    'DescribeInstancesResponseBodyInstancesInstanceImageOptions',
+    'DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress',
+    'DescribeInstancesResponseBodyInstancesInstanceMetadataOptions',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface',
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces',
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason',
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocks',
+    'DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions',
+    'DescribeInstancesResponseBodyInstancesInstancePublicIpAddress',
+    'DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress',
+    'DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds',
+    'DescribeInstancesResponseBodyInstancesInstanceTagsTag',
+    'DescribeInstancesResponseBodyInstancesInstanceTags',
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress',
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributes',
+    'DescribeInstancesResponseBodyInstancesInstance',
+    'DescribeInstancesResponseBodyInstances',
+    'DescribeInstancesFullStatusRequestEventPublishTime',
+    'DescribeInstancesFullStatusRequestNotBefore',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType',
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet',
+    'DescribeInvocationResultsRequestTag',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult',
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResults',
+    'DescribeInvocationResultsResponseBodyInvocation',
+    'DescribeInvocationsRequestTag',
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance',
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances',
+    'DescribeInvocationsResponseBodyInvocationsInvocationTagsTag',
+    'DescribeInvocationsResponseBodyInvocationsInvocationTags',
+    'DescribeInvocationsResponseBodyInvocationsInvocation',
+    'DescribeInvocationsResponseBodyInvocations',
+    'DescribeKeyPairsRequestTag',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTags',
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPair',
+    'DescribeKeyPairsResponseBodyKeyPairs',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet',
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets',
+    'DescribeLaunchTemplatesRequestTemplateTag',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet',
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSets',
+    'DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo',
+    'DescribeManagedInstancesRequestTag',
+    'DescribeManagedInstancesResponseBodyInstancesTags',
+    'DescribeManagedInstancesResponseBodyInstances',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds',
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGateway',
+    'DescribeNatGatewaysResponseBodyNatGateways',
+    'DescribeNetworkInterfaceAttributeRequestTag',
+    'DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp',
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds',
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachment',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification',
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification',
+    'DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration',
+    'DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set',
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets',
+    'DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet',
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets',
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS',
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfig',
+    'DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds',
+    'DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification',
+    'DescribeNetworkInterfaceAttributeResponseBodyTagsTag',
+    'DescribeNetworkInterfaceAttributeResponseBodyTags',
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission',
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions',
+    'DescribeNetworkInterfacesRequestTag',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet',
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets',
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData',
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas',
+    'DescribePhysicalConnectionsRequestFilter',
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType',
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet',
+    'DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations',
+    'DescribePortRangeListEntriesResponseBodyEntries',
+    'DescribePortRangeListsRequestTag',
+    'DescribePortRangeListsResponseBodyPortRangeListsTags',
+    'DescribePortRangeListsResponseBodyPortRangeLists',
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation',
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociations',
+    'DescribePrefixListAttributesResponseBodyEntriesEntry',
+    'DescribePrefixListAttributesResponseBodyEntries',
+    'DescribePrefixListsRequestTag',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTags',
+    'DescribePrefixListsResponseBodyPrefixListsPrefixList',
+    'DescribePrefixListsResponseBodyPrefixLists',
+    'DescribePriceRequestDataDisk',
+    'DescribePriceRequestSchedulerOptions',
+    'DescribePriceRequestSystemDisk',
+    'DescribePriceRequestRecurrenceRules',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo',
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfos',
+    'DescribePriceResponseBodyPriceInfoPrice',
+    'DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice',
+    'DescribePriceResponseBodyPriceInfoRelatedPrice',
+    'DescribePriceResponseBodyPriceInfoRulesRule',
+    'DescribePriceResponseBodyPriceInfoRules',
+    'DescribePriceResponseBodyPriceInfo',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones',
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType',
+    'DescribeRecommendInstanceTypeResponseBodyData',
+    'DescribeRegionsResponseBodyRegionsRegion',
+    'DescribeRegionsResponseBodyRegions',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo',
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos',
+    'DescribeRenewalPriceResponseBodyPriceInfoPrice',
+    'DescribeRenewalPriceResponseBodyPriceInfoRulesRule',
+    'DescribeRenewalPriceResponseBodyPriceInfoRules',
+    'DescribeRenewalPriceResponseBodyPriceInfo',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute',
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes',
+    'DescribeReservedInstancesRequestTag',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags',
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance',
+    'DescribeReservedInstancesResponseBodyReservedInstances',
+    'DescribeResourceByTagsRequestTag',
+    'DescribeResourceByTagsResponseBodyResourcesResource',
+    'DescribeResourceByTagsResponseBodyResources',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources',
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone',
+    'DescribeResourcesModificationResponseBodyAvailableZones',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys',
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTable',
+    'DescribeRouteTablesResponseBodyRouteTables',
+    'DescribeRouterInterfacesRequestFilter',
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType',
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSet',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoPrice',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoRules',
+    'DescribeSavingsPlanPriceResponseBodyPriceInfo',
+    'DescribeSecurityGroupAttributeResponseBodyPermissionsPermission',
+    'DescribeSecurityGroupAttributeResponseBodyPermissions',
+    'DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference',
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences',
+    'DescribeSecurityGroupsRequestTag',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags',
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup',
+    'DescribeSecurityGroupsResponseBodySecurityGroups',
+    'DescribeSendFileResultsRequestTag',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTags',
+    'DescribeSendFileResultsResponseBodyInvocationsInvocation',
+    'DescribeSendFileResultsResponseBodyInvocations',
+    'DescribeSnapshotGroupsRequestTag',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup',
+    'DescribeSnapshotGroupsResponseBodySnapshotGroups',
+    'DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink',
+    'DescribeSnapshotLinksResponseBodySnapshotLinks',
+    'DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint',
+    'DescribeSnapshotMonitorDataResponseBodyMonitorData',
+    'DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage',
+    'DescribeSnapshotPackageResponseBodySnapshotPackages',
+    'DescribeSnapshotsRequestFilter',
+    'DescribeSnapshotsRequestTag',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTags',
+    'DescribeSnapshotsResponseBodySnapshotsSnapshot',
+    'DescribeSnapshotsResponseBodySnapshots',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone',
+    'DescribeSpotAdviceResponseBodyAvailableSpotZones',
+    'DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType',
+    'DescribeSpotPriceHistoryResponseBodySpotPrices',
+    'DescribeStorageCapacityUnitsRequestTag',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit',
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits',
+    'DescribeStorageSetDetailsResponseBodyDisksDisk',
+    'DescribeStorageSetDetailsResponseBodyDisks',
+    'DescribeStorageSetsRequestTag',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTags',
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSet',
+    'DescribeStorageSetsResponseBodyStorageSets',
+    'DescribeTagsRequestTag',
+    'DescribeTagsResponseBodyTagsTagResourceTypeCount',
+    'DescribeTagsResponseBodyTagsTag',
+    'DescribeTagsResponseBodyTags',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet',
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress',
+    'DescribeTaskAttributeResponseBodyOperationProgressSet',
+    'DescribeTasksResponseBodyTaskSetTask',
+    'DescribeTasksResponseBodyTaskSet',
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection',
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnections',
+    'DescribeTerminalSessionsResponseBodySessionsSession',
+    'DescribeTerminalSessionsResponseBodySessions',
+    'DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds',
+    'DescribeVRoutersResponseBodyVRoutersVRouter',
+    'DescribeVRoutersResponseBodyVRouters',
+    'DescribeVSwitchesResponseBodyVSwitchesVSwitch',
+    'DescribeVSwitchesResponseBodyVSwitches',
+    'DescribeVirtualBorderRoutersRequestFilter',
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType',
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType',
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet',
+    'DescribeVpcsResponseBodyVpcsVpcUserCidrs',
+    'DescribeVpcsResponseBodyVpcsVpcVSwitchIds',
+    'DescribeVpcsResponseBodyVpcsVpc',
+    'DescribeVpcsResponseBodyVpcs',
+    'DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes',
+    'DescribeZonesResponseBodyZonesZoneAvailableDiskCategories',
+    'DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourceCreation',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories',
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo',
+    'DescribeZonesResponseBodyZonesZoneAvailableResources',
+    'DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories',
+    'DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations',
+    'DescribeZonesResponseBodyZonesZone',
+    'DescribeZonesResponseBodyZones',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult',
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults',
+    'DetachKeyPairResponseBodyResultsResult',
+    'DetachKeyPairResponseBodyResults',
+    'DisableActivationResponseBodyActivation',
+    'EnableNetworkInterfaceQoSRequestQoS',
+    'ImportImageRequestDiskDeviceMapping',
+    'ImportImageRequestFeatures',
+    'ImportImageRequestTag',
+    'ImportKeyPairRequestTag',
+    'InvokeCommandRequestResourceTag',
+    'InvokeCommandRequestTag',
+    'InvokeCommandShrinkRequestResourceTag',
+    'InvokeCommandShrinkRequestTag',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet',
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus',
+    'ListPluginStatusResponseBodyInstancePluginStatusSet',
+    'ListTagResourcesRequestTag',
+    'ListTagResourcesRequestTagFilter',
+    'ListTagResourcesResponseBodyTagResourcesTagResource',
+    'ListTagResourcesResponseBodyTagResources',
+    'LockSnapshotResponseBodyLockedSnapshotInfo',
+    'ModifyAutoProvisioningGroupRequestLaunchTemplateConfig',
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn',
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration',
+    'ModifyCapacityReservationRequestPrivatePoolOptions',
+    'ModifyCloudAssistantSettingsRequestAgentUpgradeConfig',
+    'ModifyCloudAssistantSettingsRequestOssDeliveryConfig',
+    'ModifyCloudAssistantSettingsRequestSessionManagerConfig',
+    'ModifyCloudAssistantSettingsRequestSlsDeliveryConfig',
+    'ModifyDedicatedHostAttributeRequestNetworkAttributes',
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance',
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances',
+    'ModifyDiskSpecRequestPerformanceControlOptions',
+    'ModifyElasticityAssuranceRequestPrivatePoolOptions',
+    'ModifyElasticityAssuranceRequestRecurrenceRules',
+    'ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions',
+    'ModifyImageAttributeRequestFeatures',
+    'ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions',
+    'ModifyInstanceAttributeRequestCpuOptions',
+    'ModifyInstanceAttributeRequestPrivateDnsNameOptions',
+    'ModifyInstanceAttributeRequestRemoteConnectionOptions',
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance',
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstances',
+    'ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow',
+    'ModifyInstanceSpecRequestSystemDisk',
+    'ModifyInstanceSpecRequestTemporary',
+    'ModifyInstanceSpecRequestDisk',
+    'ModifyManagedInstanceResponseBodyInstance',
+    'ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration',
+    'ModifyNetworkInterfaceAttributeRequestEnhancedNetwork',
+    'ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig',
+    'ModifyPortRangeListRequestAddEntry',
+    'ModifyPortRangeListRequestRemoveEntry',
+    'ModifyPrefixListRequestAddEntry',
+    'ModifyPrefixListRequestRemoveEntry',
+    'ModifyPrepayInstanceSpecRequestSystemDisk',
+    'ModifyPrepayInstanceSpecRequestDisk',
+    'ModifyReservedInstancesRequestConfiguration',
+    'ModifyReservedInstancesResponseBodyReservedInstanceIdSets',
+    'PurchaseElasticityAssuranceRequestPrivatePoolOptions',
+    'PurchaseReservedInstancesOfferingRequestTag',
+    'PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets',
+    'PurchaseStorageCapacityUnitRequestTag',
+    'PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds',
+    'RebootInstancesResponseBodyInstanceResponsesInstanceResponse',
+    'RebootInstancesResponseBodyInstanceResponses',
+    'ReleaseCapacityReservationRequestPrivatePoolOptions',
+    'RemoveTagsRequestTag',
+    'RenewElasticityAssurancesRequestPrivatePoolOptions',
+    'RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet',
+    'RenewReservedInstancesResponseBodyReservedInstanceIdSets',
+    'ReplaceSystemDiskRequestSystemDisk',
+    'ReplaceSystemDiskRequestArn',
+    'ResetDisksRequestDisk',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet',
+    'ResetDisksResponseBodyOperationProgressSetOperationProgress',
+    'ResetDisksResponseBodyOperationProgressSet',
+    'RevokeSecurityGroupRequestPermissions',
+    'RevokeSecurityGroupEgressRequestPermissions',
+    'RunCommandRequestResourceTag',
+    'RunCommandRequestTag',
+    'RunCommandShrinkRequestResourceTag',
+    'RunCommandShrinkRequestTag',
+    'RunInstancesRequestCpuOptions',
+    'RunInstancesRequestHibernationOptions',
+    'RunInstancesRequestPrivatePoolOptions',
+    'RunInstancesRequestSchedulerOptions',
+    'RunInstancesRequestSecurityOptions',
+    'RunInstancesRequestSystemDisk',
+    'RunInstancesRequestArn',
+    'RunInstancesRequestClockOptions',
+    'RunInstancesRequestDataDisk',
+    'RunInstancesRequestImageOptions',
+    'RunInstancesRequestNetworkInterface',
+    'RunInstancesRequestNetworkOptions',
+    'RunInstancesRequestPrivateDnsNameOptions',
+    'RunInstancesRequestTag',
+    'RunInstancesResponseBodyInstanceIdSets',
+    'SendFileRequestTag',
+    'StartImagePipelineExecutionRequestTag',
+    'StartImagePipelineExecutionRequestTemplateTag',
+    'StartInstancesResponseBodyInstanceResponsesInstanceResponse',
+    'StartInstancesResponseBodyInstanceResponses',
+    'StartTerminalSessionRequestEncryptionOptions',
+    'StopInstancesResponseBodyInstanceResponsesInstanceResponse',
+    'StopInstancesResponseBodyInstanceResponses',
+    'TagResourcesRequestTag'
 ]
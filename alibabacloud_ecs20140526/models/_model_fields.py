@@ -0,0 +1,13531 @@
+# -*- coding: utf-8 -*-
+# This file is generated by tools/generate_tables.py from the models; don't
+# edit it, rerun the script instead.
+from __future__ import annotations
+
+# Field kinds of MODEL_FIELDS entries.
+SCALAR = 0
+MODEL = 1
+MODEL_LIST = 2
+
+# model name -> ((wire name, attribute, kind, nested model name), ...),
+# mirroring the generated from_map of every model.
+MODEL_FIELDS = {
+    'AcceptInquiredSystemEventRequest': (
+        ('Choice', 'choice', SCALAR, None),
+        ('EventId', 'event_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AcceptInquiredSystemEventResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AcceptInquiredSystemEventResponseBody'),
+    ),
+    'AcceptInquiredSystemEventResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ActivateRouterInterfaceRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+    ),
+    'ActivateRouterInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ActivateRouterInterfaceResponseBody'),
+    ),
+    'ActivateRouterInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AddBandwidthPackageIpsRequest': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('IpCount', 'ip_count', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AddBandwidthPackageIpsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AddBandwidthPackageIpsResponseBody'),
+    ),
+    'AddBandwidthPackageIpsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AddTagsRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'AddTagsRequestTag'),
+    ),
+    'AddTagsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'AddTagsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AddTagsResponseBody'),
+    ),
+    'AddTagsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AllocateDedicatedHostsRequest': (
+        ('NetworkAttributes', 'network_attributes', MODEL, 'AllocateDedicatedHostsRequestNetworkAttributes'),
+        ('ActionOnMaintenance', 'action_on_maintenance', SCALAR, None),
+        ('AutoPlacement', 'auto_placement', SCALAR, None),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CpuOverCommitRatio', 'cpu_over_commit_ratio', SCALAR, None),
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('MinQuantity', 'min_quantity', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('Quantity', 'quantity', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'AllocateDedicatedHostsRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'AllocateDedicatedHostsRequestNetworkAttributes': (
+        ('SlbUdpTimeout', 'slb_udp_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'AllocateDedicatedHostsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'AllocateDedicatedHostsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AllocateDedicatedHostsResponseBody'),
+    ),
+    'AllocateDedicatedHostsResponseBody': (
+        ('DedicatedHostIdSets', 'dedicated_host_id_sets', MODEL, 'AllocateDedicatedHostsResponseBodyDedicatedHostIdSets'),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AllocateDedicatedHostsResponseBodyDedicatedHostIdSets': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+    ),
+    'AllocateEipAddressRequest': (
+        ('ActivityId', 'activity_id', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ISP', 'isp', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AllocateEipAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AllocateEipAddressResponseBody'),
+    ),
+    'AllocateEipAddressResponseBody': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('EipAddress', 'eip_address', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AllocatePublicIpAddressRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+    ),
+    'AllocatePublicIpAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AllocatePublicIpAddressResponseBody'),
+    ),
+    'AllocatePublicIpAddressResponseBody': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ApplyAutoSnapshotPolicyRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('autoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('diskIds', 'disk_ids', SCALAR, None),
+        ('regionId', 'region_id', SCALAR, None),
+    ),
+    'ApplyAutoSnapshotPolicyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ApplyAutoSnapshotPolicyResponseBody'),
+    ),
+    'ApplyAutoSnapshotPolicyResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AssignIpv6AddressesRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+        ('Ipv6PrefixCount', 'ipv_6prefix_count', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AssignIpv6AddressesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AssignIpv6AddressesResponseBody'),
+    ),
+    'AssignIpv6AddressesResponseBody': (
+        ('Ipv6PrefixSets', 'ipv_6prefix_sets', MODEL, 'AssignIpv6AddressesResponseBodyIpv6PrefixSets'),
+        ('Ipv6Sets', 'ipv_6sets', MODEL, 'AssignIpv6AddressesResponseBodyIpv6Sets'),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AssignIpv6AddressesResponseBodyIpv6PrefixSets': (
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+    ),
+    'AssignIpv6AddressesResponseBodyIpv6Sets': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+    ),
+    'AssignPrivateIpAddressesRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+        ('Ipv4PrefixCount', 'ipv_4prefix_count', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecondaryPrivateIpAddressCount', 'secondary_private_ip_address_count', SCALAR, None),
+    ),
+    'AssignPrivateIpAddressesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AssignPrivateIpAddressesResponseBody'),
+    ),
+    'AssignPrivateIpAddressesResponseBody': (
+        ('AssignedPrivateIpAddressesSet', 'assigned_private_ip_addresses_set', MODEL, 'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSet': (
+        ('Ipv4PrefixSet', 'ipv_4prefix_set', MODEL, 'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet'),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('PrivateIpSet', 'private_ip_set', MODEL, 'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet'),
+    ),
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetIpv4PrefixSet': (
+        ('Ipv4Prefixes', 'ipv_4prefixes', SCALAR, None),
+    ),
+    'AssignPrivateIpAddressesResponseBodyAssignedPrivateIpAddressesSetPrivateIpSet': (
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+    ),
+    'AssociateEipAddressRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AssociateEipAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AssociateEipAddressResponseBody'),
+    ),
+    'AssociateEipAddressResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AssociateHaVipRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AssociateHaVipResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AssociateHaVipResponseBody'),
+    ),
+    'AssociateHaVipResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AttachClassicLinkVpcRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'AttachClassicLinkVpcResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AttachClassicLinkVpcResponseBody'),
+    ),
+    'AttachClassicLinkVpcResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AttachDiskRequest': (
+        ('Bootable', 'bootable', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AttachDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AttachDiskResponseBody'),
+    ),
+    'AttachDiskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AttachInstanceRamRoleRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AttachInstanceRamRoleResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AttachInstanceRamRoleResponseBody'),
+    ),
+    'AttachInstanceRamRoleResponseBody': (
+        ('AttachInstanceRamRoleResults', 'attach_instance_ram_role_results', MODEL, 'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults'),
+        ('FailCount', 'fail_count', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResults': (
+        ('AttachInstanceRamRoleResult', 'attach_instance_ram_role_result', MODEL_LIST, 'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult'),
+    ),
+    'AttachInstanceRamRoleResponseBodyAttachInstanceRamRoleResultsAttachInstanceRamRoleResult': (
+        ('Code', 'code', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('Success', 'success', SCALAR, None),
+    ),
+    'AttachKeyPairRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'AttachKeyPairResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AttachKeyPairResponseBody'),
+    ),
+    'AttachKeyPairResponseBody': (
+        ('FailCount', 'fail_count', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Results', 'results', MODEL, 'AttachKeyPairResponseBodyResults'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'AttachKeyPairResponseBodyResults': (
+        ('Result', 'result', MODEL_LIST, 'AttachKeyPairResponseBodyResultsResult'),
+    ),
+    'AttachKeyPairResponseBodyResultsResult': (
+        ('Code', 'code', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('Success', 'success', SCALAR, None),
+    ),
+    'AttachNetworkInterfaceRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NetworkCardIndex', 'network_card_index', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TrunkNetworkInstanceId', 'trunk_network_instance_id', SCALAR, None),
+        ('WaitForNetworkConfigurationReady', 'wait_for_network_configuration_ready', SCALAR, None),
+    ),
+    'AttachNetworkInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AttachNetworkInterfaceResponseBody'),
+    ),
+    'AttachNetworkInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupEgressRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestGroupOwnerId', 'dest_group_owner_id', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Permissions', 'permissions', MODEL_LIST, 'AuthorizeSecurityGroupEgressRequestPermissions'),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupEgressRequestPermissions': (
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestGroupOwnerId', 'dest_group_owner_id', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupEgressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AuthorizeSecurityGroupEgressResponseBody'),
+    ),
+    'AuthorizeSecurityGroupEgressResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Permissions', 'permissions', MODEL_LIST, 'AuthorizeSecurityGroupRequestPermissions'),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourceGroupOwnerId', 'source_group_owner_id', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupRequestPermissions': (
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourceGroupOwnerId', 'source_group_owner_id', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+    ),
+    'AuthorizeSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'AuthorizeSecurityGroupResponseBody'),
+    ),
+    'AuthorizeSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelAutoSnapshotPolicyRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('autoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('diskIds', 'disk_ids', SCALAR, None),
+        ('regionId', 'region_id', SCALAR, None),
+    ),
+    'CancelAutoSnapshotPolicyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelAutoSnapshotPolicyResponseBody'),
+    ),
+    'CancelAutoSnapshotPolicyResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelCopyImageRequest': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CancelCopyImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelCopyImageResponseBody'),
+    ),
+    'CancelCopyImageResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelImagePipelineExecutionRequest': (
+        ('ExecutionId', 'execution_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TemplateTag', 'template_tag', MODEL_LIST, 'CancelImagePipelineExecutionRequestTemplateTag'),
+    ),
+    'CancelImagePipelineExecutionRequestTemplateTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CancelImagePipelineExecutionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelImagePipelineExecutionResponseBody'),
+    ),
+    'CancelImagePipelineExecutionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelPhysicalConnectionRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'CancelPhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelPhysicalConnectionResponseBody'),
+    ),
+    'CancelPhysicalConnectionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelSimulatedSystemEventsRequest': (
+        ('EventId', 'event_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CancelSimulatedSystemEventsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelSimulatedSystemEventsResponseBody'),
+    ),
+    'CancelSimulatedSystemEventsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CancelTaskRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'CancelTaskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CancelTaskResponseBody'),
+    ),
+    'CancelTaskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ConnectRouterInterfaceRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+    ),
+    'ConnectRouterInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ConnectRouterInterfaceResponseBody'),
+    ),
+    'ConnectRouterInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ConvertNatPublicIpToEipRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ConvertNatPublicIpToEipResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ConvertNatPublicIpToEipResponseBody'),
+    ),
+    'ConvertNatPublicIpToEipResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CopyImageRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DestinationDescription', 'destination_description', SCALAR, None),
+        ('DestinationImageName', 'destination_image_name', SCALAR, None),
+        ('DestinationRegionId', 'destination_region_id', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CopyImageRequestTag'),
+    ),
+    'CopyImageRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CopyImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CopyImageResponseBody'),
+    ),
+    'CopyImageResponseBody': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CopySnapshotRequest': (
+        ('Arn', 'arn', MODEL_LIST, 'CopySnapshotRequestArn'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DestinationRegionId', 'destination_region_id', SCALAR, None),
+        ('DestinationSnapshotDescription', 'destination_snapshot_description', SCALAR, None),
+        ('DestinationSnapshotName', 'destination_snapshot_name', SCALAR, None),
+        ('DestinationStorageLocationArn', 'destination_storage_location_arn', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CopySnapshotRequestTag'),
+    ),
+    'CopySnapshotRequestArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CopySnapshotRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CopySnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CopySnapshotResponseBody'),
+    ),
+    'CopySnapshotResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateActivationRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('InstanceCount', 'instance_count', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('IpAddressRange', 'ip_address_range', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateActivationRequestTag'),
+        ('TimeToLiveInHours', 'time_to_live_in_hours', SCALAR, None),
+    ),
+    'CreateActivationRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateActivationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateActivationResponseBody'),
+    ),
+    'CreateActivationResponseBody': (
+        ('ActivationCode', 'activation_code', SCALAR, None),
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequest': (
+        ('LaunchConfiguration', 'launch_configuration', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfiguration'),
+        ('AutoProvisioningGroupName', 'auto_provisioning_group_name', SCALAR, None),
+        ('AutoProvisioningGroupType', 'auto_provisioning_group_type', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DataDiskConfig', 'data_disk_config', MODEL_LIST, 'CreateAutoProvisioningGroupRequestDataDiskConfig'),
+        ('DefaultTargetCapacityType', 'default_target_capacity_type', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ExcessCapacityTerminationPolicy', 'excess_capacity_termination_policy', SCALAR, None),
+        ('ExecutionMode', 'execution_mode', SCALAR, None),
+        ('HibernationOptionsConfigured', 'hibernation_options_configured', SCALAR, None),
+        ('LaunchTemplateConfig', 'launch_template_config', MODEL_LIST, 'CreateAutoProvisioningGroupRequestLaunchTemplateConfig'),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersion', 'launch_template_version', SCALAR, None),
+        ('MaxSpotPrice', 'max_spot_price', SCALAR, None),
+        ('MinTargetCapacity', 'min_target_capacity', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PayAsYouGoAllocationStrategy', 'pay_as_you_go_allocation_strategy', SCALAR, None),
+        ('PayAsYouGoTargetCapacity', 'pay_as_you_go_target_capacity', SCALAR, None),
+        ('PrePaidOptions', 'pre_paid_options', MODEL, 'CreateAutoProvisioningGroupRequestPrePaidOptions'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourcePoolOptions', 'resource_pool_options', MODEL, 'CreateAutoProvisioningGroupRequestResourcePoolOptions'),
+        ('SpotAllocationStrategy', 'spot_allocation_strategy', SCALAR, None),
+        ('SpotInstanceInterruptionBehavior', 'spot_instance_interruption_behavior', SCALAR, None),
+        ('SpotInstancePoolsToUseCount', 'spot_instance_pools_to_use_count', SCALAR, None),
+        ('SpotTargetCapacity', 'spot_target_capacity', SCALAR, None),
+        ('SystemDiskConfig', 'system_disk_config', MODEL_LIST, 'CreateAutoProvisioningGroupRequestSystemDiskConfig'),
+        ('Tag', 'tag', MODEL_LIST, 'CreateAutoProvisioningGroupRequestTag'),
+        ('TerminateInstances', 'terminate_instances', SCALAR, None),
+        ('TerminateInstancesWithExpiration', 'terminate_instances_with_expiration', SCALAR, None),
+        ('TotalTargetCapacity', 'total_target_capacity', SCALAR, None),
+        ('ValidFrom', 'valid_from', SCALAR, None),
+        ('ValidUntil', 'valid_until', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestDataDiskConfig': (
+        ('DiskCategory', 'disk_category', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfiguration': (
+        ('Arn', 'arn', MODEL_LIST, 'CreateAutoProvisioningGroupRequestLaunchConfigurationArn'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk'),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HostNames', 'host_names', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceDescription', 'instance_description', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SystemDisk', 'system_disk', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk'),
+        ('SystemDiskCategory', 'system_disk_category', SCALAR, None),
+        ('SystemDiskDescription', 'system_disk_description', SCALAR, None),
+        ('SystemDiskName', 'system_disk_name', SCALAR, None),
+        ('SystemDiskPerformanceLevel', 'system_disk_performance_level', SCALAR, None),
+        ('SystemDiskSize', 'system_disk_size', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateAutoProvisioningGroupRequestLaunchConfigurationTag'),
+        ('UserData', 'user_data', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('CpuOptions', 'cpu_options', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions'),
+        ('ImageOptions', 'image_options', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions'),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('SchedulerOptions', 'scheduler_options', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions'),
+        ('SecurityOptions', 'security_options', MODEL, 'CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions'),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotInterruptionBehavior', 'spot_interruption_behavior', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationCpuOptions': (
+        ('Core', 'core', SCALAR, None),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KmsKeyId', 'kms_key_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSchedulerOptions': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSecurityOptions': (
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchConfigurationTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestLaunchTemplateConfig': (
+        ('Architectures', 'architectures', SCALAR, None),
+        ('BurstablePerformance', 'burstable_performance', SCALAR, None),
+        ('Cores', 'cores', SCALAR, None),
+        ('ExcludedInstanceTypes', 'excluded_instance_types', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxPrice', 'max_price', SCALAR, None),
+        ('MaxQuantity', 'max_quantity', SCALAR, None),
+        ('Memories', 'memories', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('WeightedCapacity', 'weighted_capacity', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestPrePaidOptions': (
+        ('SpecifyCapacityDistribution', 'specify_capacity_distribution', MODEL_LIST, 'CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution'),
+    ),
+    'CreateAutoProvisioningGroupRequestPrePaidOptionsSpecifyCapacityDistribution': (
+        ('InstanceTypes', 'instance_types', SCALAR, None),
+        ('MinTargetCapacity', 'min_target_capacity', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestResourcePoolOptions': (
+        ('PrivatePoolIds', 'private_pool_ids', SCALAR, None),
+        ('Strategy', 'strategy', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestSystemDiskConfig': (
+        ('DiskCategory', 'disk_category', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateAutoProvisioningGroupResponseBody'),
+    ),
+    'CreateAutoProvisioningGroupResponseBody': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('LaunchResults', 'launch_results', MODEL, 'CreateAutoProvisioningGroupResponseBodyLaunchResults'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupResponseBodyLaunchResults': (
+        ('LaunchResult', 'launch_result', MODEL_LIST, 'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult'),
+    ),
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResult': (
+        ('Amount', 'amount', SCALAR, None),
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorMsg', 'error_msg', SCALAR, None),
+        ('InstanceIds', 'instance_ids', MODEL, 'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupResponseBodyLaunchResultsLaunchResultInstanceIds': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequest': (
+        ('LaunchConfiguration', 'launch_configuration', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration'),
+        ('AutoProvisioningGroupName', 'auto_provisioning_group_name', SCALAR, None),
+        ('AutoProvisioningGroupType', 'auto_provisioning_group_type', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DataDiskConfig', 'data_disk_config', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestDataDiskConfig'),
+        ('DefaultTargetCapacityType', 'default_target_capacity_type', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ExcessCapacityTerminationPolicy', 'excess_capacity_termination_policy', SCALAR, None),
+        ('ExecutionMode', 'execution_mode', SCALAR, None),
+        ('HibernationOptionsConfigured', 'hibernation_options_configured', SCALAR, None),
+        ('LaunchTemplateConfig', 'launch_template_config', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig'),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersion', 'launch_template_version', SCALAR, None),
+        ('MaxSpotPrice', 'max_spot_price', SCALAR, None),
+        ('MinTargetCapacity', 'min_target_capacity', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PayAsYouGoAllocationStrategy', 'pay_as_you_go_allocation_strategy', SCALAR, None),
+        ('PayAsYouGoTargetCapacity', 'pay_as_you_go_target_capacity', SCALAR, None),
+        ('PrePaidOptions', 'pre_paid_options', MODEL, 'CreateAutoProvisioningGroupShrinkRequestPrePaidOptions'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourcePoolOptions', 'resource_pool_options_shrink', SCALAR, None),
+        ('SpotAllocationStrategy', 'spot_allocation_strategy', SCALAR, None),
+        ('SpotInstanceInterruptionBehavior', 'spot_instance_interruption_behavior', SCALAR, None),
+        ('SpotInstancePoolsToUseCount', 'spot_instance_pools_to_use_count', SCALAR, None),
+        ('SpotTargetCapacity', 'spot_target_capacity', SCALAR, None),
+        ('SystemDiskConfig', 'system_disk_config', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig'),
+        ('Tag', 'tag', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestTag'),
+        ('TerminateInstances', 'terminate_instances', SCALAR, None),
+        ('TerminateInstancesWithExpiration', 'terminate_instances_with_expiration', SCALAR, None),
+        ('TotalTargetCapacity', 'total_target_capacity', SCALAR, None),
+        ('ValidFrom', 'valid_from', SCALAR, None),
+        ('ValidUntil', 'valid_until', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestDataDiskConfig': (
+        ('DiskCategory', 'disk_category', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfiguration': (
+        ('Arn', 'arn', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk'),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HostNames', 'host_names', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceDescription', 'instance_description', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SystemDisk', 'system_disk', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk'),
+        ('SystemDiskCategory', 'system_disk_category', SCALAR, None),
+        ('SystemDiskDescription', 'system_disk_description', SCALAR, None),
+        ('SystemDiskName', 'system_disk_name', SCALAR, None),
+        ('SystemDiskPerformanceLevel', 'system_disk_performance_level', SCALAR, None),
+        ('SystemDiskSize', 'system_disk_size', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag'),
+        ('UserData', 'user_data', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('CpuOptions', 'cpu_options', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions'),
+        ('ImageOptions', 'image_options', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions'),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('SchedulerOptions', 'scheduler_options', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions'),
+        ('SecurityOptions', 'security_options', MODEL, 'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions'),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotInterruptionBehavior', 'spot_interruption_behavior', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationCpuOptions': (
+        ('Core', 'core', SCALAR, None),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KmsKeyId', 'kms_key_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSchedulerOptions': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSecurityOptions': (
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchConfigurationTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestLaunchTemplateConfig': (
+        ('Architectures', 'architectures', SCALAR, None),
+        ('BurstablePerformance', 'burstable_performance', SCALAR, None),
+        ('Cores', 'cores', SCALAR, None),
+        ('ExcludedInstanceTypes', 'excluded_instance_types', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxPrice', 'max_price', SCALAR, None),
+        ('MaxQuantity', 'max_quantity', SCALAR, None),
+        ('Memories', 'memories', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('WeightedCapacity', 'weighted_capacity', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptions': (
+        ('SpecifyCapacityDistribution', 'specify_capacity_distribution', MODEL_LIST, 'CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution'),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestPrePaidOptionsSpecifyCapacityDistribution': (
+        ('InstanceTypes', 'instance_types', SCALAR, None),
+        ('MinTargetCapacity', 'min_target_capacity', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestSystemDiskConfig': (
+        ('DiskCategory', 'disk_category', SCALAR, None),
+    ),
+    'CreateAutoProvisioningGroupShrinkRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateAutoSnapshotPolicyRequest': (
+        ('CopiedSnapshotsRetentionDays', 'copied_snapshots_retention_days', SCALAR, None),
+        ('CopyEncryptionConfiguration', 'copy_encryption_configuration', MODEL, 'CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration'),
+        ('EnableCrossRegionCopy', 'enable_cross_region_copy', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageLocationArn', 'storage_location_arn', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateAutoSnapshotPolicyRequestTag'),
+        ('TargetCopyRegions', 'target_copy_regions', SCALAR, None),
+        ('autoSnapshotPolicyName', 'auto_snapshot_policy_name', SCALAR, None),
+        ('regionId', 'region_id', SCALAR, None),
+        ('repeatWeekdays', 'repeat_weekdays', SCALAR, None),
+        ('retentionDays', 'retention_days', SCALAR, None),
+        ('timePoints', 'time_points', SCALAR, None),
+    ),
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfiguration': (
+        ('Arn', 'arn', MODEL_LIST, 'CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn'),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+    ),
+    'CreateAutoSnapshotPolicyRequestCopyEncryptionConfigurationArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CreateAutoSnapshotPolicyRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateAutoSnapshotPolicyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateAutoSnapshotPolicyResponseBody'),
+    ),
+    'CreateAutoSnapshotPolicyResponseBody': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateCapacityReservationRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'CreateCapacityReservationRequestPrivatePoolOptions'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('EndTimeType', 'end_time_type', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateCapacityReservationRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateCapacityReservationRequestPrivatePoolOptions': (
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'CreateCapacityReservationRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateCapacityReservationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateCapacityReservationResponseBody'),
+    ),
+    'CreateCapacityReservationResponseBody': (
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateCommandRequest': (
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateCommandRequestTag'),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'CreateCommandRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateCommandResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateCommandResponseBody'),
+    ),
+    'CreateCommandResponseBody': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateDedicatedHostClusterRequest': (
+        ('DedicatedHostClusterName', 'dedicated_host_cluster_name', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateDedicatedHostClusterRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateDedicatedHostClusterRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateDedicatedHostClusterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateDedicatedHostClusterResponseBody'),
+    ),
+    'CreateDedicatedHostClusterResponseBody': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateDeploymentSetRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DeploymentSetName', 'deployment_set_name', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Domain', 'domain', SCALAR, None),
+        ('Granularity', 'granularity', SCALAR, None),
+        ('GroupCount', 'group_count', SCALAR, None),
+        ('OnUnableToRedeployFailedInstance', 'on_unable_to_redeploy_failed_instance', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Strategy', 'strategy', SCALAR, None),
+    ),
+    'CreateDeploymentSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateDeploymentSetResponseBody'),
+    ),
+    'CreateDeploymentSetResponseBody': (
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateDiagnosticMetricSetRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('MetricIds', 'metric_ids', SCALAR, None),
+        ('MetricSetName', 'metric_set_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'CreateDiagnosticMetricSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateDiagnosticMetricSetResponseBody'),
+    ),
+    'CreateDiagnosticMetricSetResponseBody': (
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateDiagnosticReportRequest': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'CreateDiagnosticReportResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateDiagnosticReportResponseBody'),
+    ),
+    'CreateDiagnosticReportResponseBody': (
+        ('ReportId', 'report_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateDiskRequest': (
+        ('AdvancedFeatures', 'advanced_features', SCALAR, None),
+        ('Arn', 'arn', MODEL_LIST, 'CreateDiskRequestArn'),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskCategory', 'disk_category', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('MultiAttach', 'multi_attach', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateDiskRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateDiskRequestArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CreateDiskRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateDiskResponseBody'),
+    ),
+    'CreateDiskResponseBody': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateElasticityAssuranceRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'CreateElasticityAssuranceRequestPrivatePoolOptions'),
+        ('AssuranceTimes', 'assurance_times', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceCpuCoreCount', 'instance_cpu_core_count', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RecurrenceRules', 'recurrence_rules', MODEL_LIST, 'CreateElasticityAssuranceRequestRecurrenceRules'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateElasticityAssuranceRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateElasticityAssuranceRequestPrivatePoolOptions': (
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'CreateElasticityAssuranceRequestRecurrenceRules': (
+        ('EndHour', 'end_hour', SCALAR, None),
+        ('RecurrenceType', 'recurrence_type', SCALAR, None),
+        ('RecurrenceValue', 'recurrence_value', SCALAR, None),
+        ('StartHour', 'start_hour', SCALAR, None),
+    ),
+    'CreateElasticityAssuranceRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateElasticityAssuranceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateElasticityAssuranceResponseBody'),
+    ),
+    'CreateElasticityAssuranceResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateForwardEntryRequest': (
+        ('ExternalIp', 'external_ip', SCALAR, None),
+        ('ExternalPort', 'external_port', SCALAR, None),
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+        ('InternalIp', 'internal_ip', SCALAR, None),
+        ('InternalPort', 'internal_port', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CreateForwardEntryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateForwardEntryResponseBody'),
+    ),
+    'CreateForwardEntryResponseBody': (
+        ('ForwardEntryId', 'forward_entry_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateHaVipRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'CreateHaVipResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateHaVipResponseBody'),
+    ),
+    'CreateHaVipResponseBody': (
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateHpcClusterRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CreateHpcClusterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateHpcClusterResponseBody'),
+    ),
+    'CreateHpcClusterResponseBody': (
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateImageComponentRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ComponentType', 'component_type', SCALAR, None),
+        ('ComponentVersion', 'component_version', SCALAR, None),
+        ('Content', 'content', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SystemType', 'system_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateImageComponentRequestTag'),
+    ),
+    'CreateImageComponentRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateImageComponentResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateImageComponentResponseBody'),
+    ),
+    'CreateImageComponentResponseBody': (
+        ('ImageComponentId', 'image_component_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateImagePipelineRequest': (
+        ('AddAccount', 'add_account', SCALAR, None),
+        ('AdvancedOptions', 'advanced_options', MODEL, 'CreateImagePipelineRequestAdvancedOptions'),
+        ('BaseImage', 'base_image', SCALAR, None),
+        ('BaseImageType', 'base_image_type', SCALAR, None),
+        ('BuildContent', 'build_content', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DeleteInstanceOnFailure', 'delete_instance_on_failure', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'CreateImagePipelineRequestImageOptions'),
+        ('ImportImageOptions', 'import_image_options', MODEL, 'CreateImagePipelineRequestImportImageOptions'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepairMode', 'repair_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SystemDiskSize', 'system_disk_size', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateImagePipelineRequestTag'),
+        ('TestContent', 'test_content', SCALAR, None),
+        ('ToRegionId', 'to_region_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestAdvancedOptions': (
+        ('ImageNameSuffix', 'image_name_suffix', SCALAR, None),
+        ('RetainCloudAssistant', 'retain_cloud_assistant', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImageOptions': (
+        ('Description', 'description', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageFeatures', 'image_features', MODEL, 'CreateImagePipelineRequestImageOptionsImageFeatures'),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageTags', 'image_tags', MODEL_LIST, 'CreateImagePipelineRequestImageOptionsImageTags'),
+    ),
+    'CreateImagePipelineRequestImageOptionsImageFeatures': (
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImageOptionsImageTags': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImportImageOptions': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskDeviceMappings', 'disk_device_mappings', MODEL_LIST, 'CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings'),
+        ('Features', 'features', MODEL, 'CreateImagePipelineRequestImportImageOptionsFeatures'),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImportImageTags', 'import_image_tags', MODEL_LIST, 'CreateImagePipelineRequestImportImageOptionsImportImageTags'),
+        ('LicenseType', 'license_type', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RetainImportedImage', 'retain_imported_image', SCALAR, None),
+        ('RetentionStrategy', 'retention_strategy', SCALAR, None),
+        ('RoleName', 'role_name', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImportImageOptionsDiskDeviceMappings': (
+        ('DiskImageSize', 'disk_image_size', SCALAR, None),
+        ('Format', 'format', SCALAR, None),
+        ('OSSBucket', 'ossbucket', SCALAR, None),
+        ('OSSObject', 'ossobject', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImportImageOptionsFeatures': (
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestImportImageOptionsImportImageTags': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateImagePipelineRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateImagePipelineResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateImagePipelineResponseBody'),
+    ),
+    'CreateImagePipelineResponseBody': (
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateImageRequest': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DetectionStrategy', 'detection_strategy', SCALAR, None),
+        ('DiskDeviceMapping', 'disk_device_mapping', MODEL_LIST, 'CreateImageRequestDiskDeviceMapping'),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Features', 'features', MODEL, 'CreateImageRequestFeatures'),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageVersion', 'image_version', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateImageRequestTag'),
+    ),
+    'CreateImageRequestDiskDeviceMapping': (
+        ('Device', 'device', SCALAR, None),
+        ('DiskType', 'disk_type', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateImageRequestFeatures': (
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+    ),
+    'CreateImageRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateImageResponseBody'),
+    ),
+    'CreateImageResponseBody': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateInstanceRequest': (
+        ('HibernationOptions', 'hibernation_options', MODEL, 'CreateInstanceRequestHibernationOptions'),
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'CreateInstanceRequestPrivatePoolOptions'),
+        ('SystemDisk', 'system_disk', MODEL, 'CreateInstanceRequestSystemDisk'),
+        ('Affinity', 'affinity', SCALAR, None),
+        ('Arn', 'arn', MODEL_LIST, 'CreateInstanceRequestArn'),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ClusterId', 'cluster_id', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'CreateInstanceRequestDataDisk'),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetGroupNo', 'deployment_set_group_no', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InnerIpAddress', 'inner_ip_address', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('NodeControllerId', 'node_controller_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotInterruptionBehavior', 'spot_interruption_behavior', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateInstanceRequestTag'),
+        ('Tenancy', 'tenancy', SCALAR, None),
+        ('UseAdditionalService', 'use_additional_service', SCALAR, None),
+        ('UserData', 'user_data', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateInstanceRequestArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'CreateInstanceRequestDataDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+    ),
+    'CreateInstanceRequestHibernationOptions': (
+        ('Configured', 'configured', SCALAR, None),
+    ),
+    'CreateInstanceRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+    ),
+    'CreateInstanceRequestSystemDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+    ),
+    'CreateInstanceRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateInstanceResponseBody'),
+    ),
+    'CreateInstanceResponseBody': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'CreateKeyPairRequest': (
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateKeyPairRequestTag'),
+    ),
+    'CreateKeyPairRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateKeyPairResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateKeyPairResponseBody'),
+    ),
+    'CreateKeyPairResponseBody': (
+        ('KeyPairFingerPrint', 'key_pair_finger_print', SCALAR, None),
+        ('KeyPairId', 'key_pair_id', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('PrivateKeyBody', 'private_key_body', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'CreateLaunchTemplateRequestSystemDisk'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'CreateLaunchTemplateRequestDataDisk'),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableVmOsConfig', 'enable_vm_os_config', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'CreateLaunchTemplateRequestImageOptions'),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('NetworkInterface', 'network_interface', MODEL_LIST, 'CreateLaunchTemplateRequestNetworkInterface'),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SecurityOptions', 'security_options', MODEL, 'CreateLaunchTemplateRequestSecurityOptions'),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateLaunchTemplateRequestTag'),
+        ('TemplateResourceGroupId', 'template_resource_group_id', SCALAR, None),
+        ('TemplateTag', 'template_tag', MODEL_LIST, 'CreateLaunchTemplateRequestTemplateTag'),
+        ('UserData', 'user_data', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VersionDescription', 'version_description', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestNetworkInterface': (
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestSecurityOptions': (
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('Iops', 'iops', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateLaunchTemplateRequestTemplateTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateLaunchTemplateResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateLaunchTemplateResponseBody'),
+    ),
+    'CreateLaunchTemplateResponseBody': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersionNumber', 'launch_template_version_number', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'CreateLaunchTemplateVersionRequestSystemDisk'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'CreateLaunchTemplateVersionRequestDataDisk'),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableVmOsConfig', 'enable_vm_os_config', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'CreateLaunchTemplateVersionRequestImageOptions'),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('NetworkInterface', 'network_interface', MODEL_LIST, 'CreateLaunchTemplateVersionRequestNetworkInterface'),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SecurityOptions', 'security_options', MODEL, 'CreateLaunchTemplateVersionRequestSecurityOptions'),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateLaunchTemplateVersionRequestTag'),
+        ('UserData', 'user_data', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VersionDescription', 'version_description', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestNetworkInterface': (
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestSecurityOptions': (
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('Iops', 'iops', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateLaunchTemplateVersionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateLaunchTemplateVersionResponseBody'),
+    ),
+    'CreateLaunchTemplateVersionResponseBody': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersionNumber', 'launch_template_version_number', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateNatGatewayRequest': (
+        ('BandwidthPackage', 'bandwidth_package', MODEL_LIST, 'CreateNatGatewayRequestBandwidthPackage'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'CreateNatGatewayRequestBandwidthPackage': (
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('IpCount', 'ip_count', SCALAR, None),
+        ('Zone', 'zone', SCALAR, None),
+    ),
+    'CreateNatGatewayResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateNatGatewayResponseBody'),
+    ),
+    'CreateNatGatewayResponseBody': (
+        ('BandwidthPackageIds', 'bandwidth_package_ids', MODEL, 'CreateNatGatewayResponseBodyBandwidthPackageIds'),
+        ('ForwardTableIds', 'forward_table_ids', MODEL, 'CreateNatGatewayResponseBodyForwardTableIds'),
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateNatGatewayResponseBodyBandwidthPackageIds': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+    ),
+    'CreateNatGatewayResponseBodyForwardTableIds': (
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+    ),
+    'CreateNetworkInterfacePermissionRequest': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Permission', 'permission', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CreateNetworkInterfacePermissionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateNetworkInterfacePermissionResponseBody'),
+    ),
+    'CreateNetworkInterfacePermissionResponseBody': (
+        ('NetworkInterfacePermission', 'network_interface_permission', MODEL, 'CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateNetworkInterfacePermissionResponseBodyNetworkInterfacePermission': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfacePermissionId', 'network_interface_permission_id', SCALAR, None),
+        ('Permission', 'permission', SCALAR, None),
+        ('PermissionState', 'permission_state', SCALAR, None),
+        ('ServiceName', 'service_name', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceRequest': (
+        ('BusinessType', 'business_type', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ConnectionTrackingConfiguration', 'connection_tracking_configuration', MODEL, 'CreateNetworkInterfaceRequestConnectionTrackingConfiguration'),
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnhancedNetwork', 'enhanced_network', MODEL, 'CreateNetworkInterfaceRequestEnhancedNetwork'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+        ('Ipv4PrefixCount', 'ipv_4prefix_count', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+        ('Ipv6PrefixCount', 'ipv_6prefix_count', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficConfig', 'network_interface_traffic_config', MODEL, 'CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig'),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RxQueueSize', 'rx_queue_size', SCALAR, None),
+        ('SecondaryPrivateIpAddressCount', 'secondary_private_ip_address_count', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateNetworkInterfaceRequestTag'),
+        ('TxQueueSize', 'tx_queue_size', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('Visible', 'visible', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceRequestConnectionTrackingConfiguration': (
+        ('TcpClosedAndTimeWaitTimeout', 'tcp_closed_and_time_wait_timeout', SCALAR, None),
+        ('TcpEstablishedTimeout', 'tcp_established_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceRequestEnhancedNetwork': (
+        ('EnableRss', 'enable_rss', SCALAR, None),
+        ('EnableSriov', 'enable_sriov', SCALAR, None),
+        ('VirtualFunctionQuantity', 'virtual_function_quantity', SCALAR, None),
+        ('VirtualFunctionTotalQueueNumber', 'virtual_function_total_queue_number', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceRequestNetworkInterfaceTrafficConfig': (
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('RxQueueSize', 'rx_queue_size', SCALAR, None),
+        ('TxQueueSize', 'tx_queue_size', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateNetworkInterfaceResponseBody'),
+    ),
+    'CreateNetworkInterfaceResponseBody': (
+        ('Description', 'description', SCALAR, None),
+        ('Ipv4PrefixSets', 'ipv_4prefix_sets', MODEL, 'CreateNetworkInterfaceResponseBodyIpv4PrefixSets'),
+        ('Ipv6PrefixSets', 'ipv_6prefix_sets', MODEL, 'CreateNetworkInterfaceResponseBodyIpv6PrefixSets'),
+        ('Ipv6Sets', 'ipv_6sets', MODEL, 'CreateNetworkInterfaceResponseBodyIpv6Sets'),
+        ('MacAddress', 'mac_address', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('PrivateIpSets', 'private_ip_sets', MODEL, 'CreateNetworkInterfaceResponseBodyPrivateIpSets'),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'CreateNetworkInterfaceResponseBodySecurityGroupIds'),
+        ('ServiceID', 'service_id', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'CreateNetworkInterfaceResponseBodyTags'),
+        ('Type', 'type', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSets': (
+        ('Ipv4PrefixSet', 'ipv_4prefix_set', MODEL_LIST, 'CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet'),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv4PrefixSetsIpv4PrefixSet': (
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSets': (
+        ('Ipv6PrefixSet', 'ipv_6prefix_set', MODEL_LIST, 'CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet'),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv6PrefixSetsIpv6PrefixSet': (
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv6Sets': (
+        ('Ipv6Set', 'ipv_6set', MODEL_LIST, 'CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set'),
+    ),
+    'CreateNetworkInterfaceResponseBodyIpv6SetsIpv6Set': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodyPrivateIpSets': (
+        ('PrivateIpSet', 'private_ip_set', MODEL_LIST, 'CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet'),
+    ),
+    'CreateNetworkInterfaceResponseBodyPrivateIpSetsPrivateIpSet': (
+        ('Primary', 'primary', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodySecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'CreateNetworkInterfaceResponseBodyTags': (
+        ('Tag', 'tag', MODEL_LIST, 'CreateNetworkInterfaceResponseBodyTagsTag'),
+    ),
+    'CreateNetworkInterfaceResponseBodyTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'CreatePhysicalConnectionRequest': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('LineOperator', 'line_operator', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeerLocation', 'peer_location', SCALAR, None),
+        ('PortType', 'port_type', SCALAR, None),
+        ('RedundantPhysicalConnectionId', 'redundant_physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('bandwidth', 'bandwidth', SCALAR, None),
+    ),
+    'CreatePhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreatePhysicalConnectionResponseBody'),
+    ),
+    'CreatePhysicalConnectionResponseBody': (
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreatePortRangeListRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Entry', 'entry', MODEL_LIST, 'CreatePortRangeListRequestEntry'),
+        ('MaxEntries', 'max_entries', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListName', 'port_range_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreatePortRangeListRequestTag'),
+    ),
+    'CreatePortRangeListRequestEntry': (
+        ('Description', 'description', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+    ),
+    'CreatePortRangeListRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreatePortRangeListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreatePortRangeListResponseBody'),
+    ),
+    'CreatePortRangeListResponseBody': (
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreatePrefixListRequest': (
+        ('AddressFamily', 'address_family', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Entry', 'entry', MODEL_LIST, 'CreatePrefixListRequestEntry'),
+        ('MaxEntries', 'max_entries', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListName', 'prefix_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreatePrefixListRequestTag'),
+    ),
+    'CreatePrefixListRequestEntry': (
+        ('Cidr', 'cidr', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+    ),
+    'CreatePrefixListRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreatePrefixListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreatePrefixListResponseBody'),
+    ),
+    'CreatePrefixListResponseBody': (
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateRouteEntryRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DestinationCidrBlock', 'destination_cidr_block', SCALAR, None),
+        ('NextHopId', 'next_hop_id', SCALAR, None),
+        ('NextHopList', 'next_hop_list', MODEL_LIST, 'CreateRouteEntryRequestNextHopList'),
+        ('NextHopType', 'next_hop_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+    ),
+    'CreateRouteEntryRequestNextHopList': (
+        ('NextHopId', 'next_hop_id', SCALAR, None),
+        ('NextHopType', 'next_hop_type', SCALAR, None),
+    ),
+    'CreateRouteEntryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateRouteEntryResponseBody'),
+    ),
+    'CreateRouteEntryResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateRouterInterfaceRequest': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('HealthCheckSourceIp', 'health_check_source_ip', SCALAR, None),
+        ('HealthCheckTargetIp', 'health_check_target_ip', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OppositeAccessPointId', 'opposite_access_point_id', SCALAR, None),
+        ('OppositeInterfaceId', 'opposite_interface_id', SCALAR, None),
+        ('OppositeInterfaceOwnerId', 'opposite_interface_owner_id', SCALAR, None),
+        ('OppositeRegionId', 'opposite_region_id', SCALAR, None),
+        ('OppositeRouterId', 'opposite_router_id', SCALAR, None),
+        ('OppositeRouterType', 'opposite_router_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PricingCycle', 'pricing_cycle', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Role', 'role', SCALAR, None),
+        ('RouterId', 'router_id', SCALAR, None),
+        ('RouterType', 'router_type', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'CreateRouterInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateRouterInterfaceResponseBody'),
+    ),
+    'CreateRouterInterfaceResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+    ),
+    'CreateSavingsPlanRequest': (
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('CommittedAmount', 'committed_amount', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypeFamilyGroup', 'instance_type_family_group', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PlanType', 'plan_type', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+    ),
+    'CreateSavingsPlanResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateSavingsPlanResponseBody'),
+    ),
+    'CreateSavingsPlanResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SavingsPlanId', 'savings_plan_id', SCALAR, None),
+    ),
+    'CreateSecurityGroupRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupName', 'security_group_name', SCALAR, None),
+        ('SecurityGroupType', 'security_group_type', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateSecurityGroupRequestTag'),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'CreateSecurityGroupRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateSecurityGroupResponseBody'),
+    ),
+    'CreateSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'CreateSimulatedSystemEventsRequest': (
+        ('EventType', 'event_type', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NotBefore', 'not_before', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'CreateSimulatedSystemEventsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateSimulatedSystemEventsResponseBody'),
+    ),
+    'CreateSimulatedSystemEventsResponseBody': (
+        ('EventIdSet', 'event_id_set', MODEL, 'CreateSimulatedSystemEventsResponseBodyEventIdSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'CreateSimulatedSystemEventsResponseBodyEventIdSet': (
+        ('EventId', 'event_id', SCALAR, None),
+    ),
+    'CreateSnapshotGroupRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('ExcludeDiskId', 'exclude_disk_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstantAccess', 'instant_access', SCALAR, None),
+        ('InstantAccessRetentionDays', 'instant_access_retention_days', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageLocationArn', 'storage_location_arn', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateSnapshotGroupRequestTag'),
+    ),
+    'CreateSnapshotGroupRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateSnapshotGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateSnapshotGroupResponseBody'),
+    ),
+    'CreateSnapshotGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotGroupId', 'snapshot_group_id', SCALAR, None),
+    ),
+    'CreateSnapshotRequest': (
+        ('Category', 'category', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('InstantAccess', 'instant_access', SCALAR, None),
+        ('InstantAccessRetentionDays', 'instant_access_retention_days', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('SnapshotName', 'snapshot_name', SCALAR, None),
+        ('StorageLocationArn', 'storage_location_arn', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateSnapshotRequestTag'),
+    ),
+    'CreateSnapshotRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateSnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateSnapshotResponseBody'),
+    ),
+    'CreateSnapshotResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'CreateStorageSetRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('MaxPartitionNumber', 'max_partition_number', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageSetName', 'storage_set_name', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'CreateStorageSetRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateStorageSetRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'CreateStorageSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateStorageSetResponseBody'),
+    ),
+    'CreateStorageSetResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+    ),
+    'CreateVSwitchRequest': (
+        ('CidrBlock', 'cidr_block', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VSwitchName', 'v_switch_name', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'CreateVSwitchResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateVSwitchResponseBody'),
+    ),
+    'CreateVSwitchResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'CreateVirtualBorderRouterRequest': (
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('LocalGatewayIp', 'local_gateway_ip', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeerGatewayIp', 'peer_gateway_ip', SCALAR, None),
+        ('PeeringSubnetMask', 'peering_subnet_mask', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VbrOwnerId', 'vbr_owner_id', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+    ),
+    'CreateVirtualBorderRouterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateVirtualBorderRouterResponseBody'),
+    ),
+    'CreateVirtualBorderRouterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+    ),
+    'CreateVpcRequest': (
+        ('CidrBlock', 'cidr_block', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VpcName', 'vpc_name', SCALAR, None),
+    ),
+    'CreateVpcResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'CreateVpcResponseBody'),
+    ),
+    'CreateVpcResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DeactivateRouterInterfaceRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+    ),
+    'DeactivateRouterInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeactivateRouterInterfaceResponseBody'),
+    ),
+    'DeactivateRouterInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteActivationRequest': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteActivationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteActivationResponseBody'),
+    ),
+    'DeleteActivationResponseBody': (
+        ('Activation', 'activation', MODEL, 'DeleteActivationResponseBodyActivation'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteActivationResponseBodyActivation': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeregisteredCount', 'deregistered_count', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceCount', 'instance_count', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('IpAddressRange', 'ip_address_range', SCALAR, None),
+        ('RegisteredCount', 'registered_count', SCALAR, None),
+        ('TimeToLiveInHours', 'time_to_live_in_hours', SCALAR, None),
+    ),
+    'DeleteAutoProvisioningGroupRequest': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TerminateInstances', 'terminate_instances', SCALAR, None),
+    ),
+    'DeleteAutoProvisioningGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteAutoProvisioningGroupResponseBody'),
+    ),
+    'DeleteAutoProvisioningGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteAutoSnapshotPolicyRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('autoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('regionId', 'region_id', SCALAR, None),
+    ),
+    'DeleteAutoSnapshotPolicyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteAutoSnapshotPolicyResponseBody'),
+    ),
+    'DeleteAutoSnapshotPolicyResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteBandwidthPackageRequest': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteBandwidthPackageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteBandwidthPackageResponseBody'),
+    ),
+    'DeleteBandwidthPackageResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteCommandRequest': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteCommandResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteCommandResponseBody'),
+    ),
+    'DeleteCommandResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteDedicatedHostClusterRequest': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteDedicatedHostClusterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteDedicatedHostClusterResponseBody'),
+    ),
+    'DeleteDedicatedHostClusterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteDeploymentSetRequest': (
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteDeploymentSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteDeploymentSetResponseBody'),
+    ),
+    'DeleteDeploymentSetResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteDiagnosticMetricSetsRequest': (
+        ('MetricSetIds', 'metric_set_ids', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+    ),
+    'DeleteDiagnosticMetricSetsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteDiagnosticMetricSetsResponseBody'),
+    ),
+    'DeleteDiagnosticMetricSetsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteDiagnosticReportsRequest': (
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReportIds', 'report_ids', SCALAR, None),
+    ),
+    'DeleteDiagnosticReportsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteDiagnosticReportsResponseBody'),
+    ),
+    'DeleteDiagnosticReportsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteDiskRequest': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteDiskResponseBody'),
+    ),
+    'DeleteDiskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteForwardEntryRequest': (
+        ('ForwardEntryId', 'forward_entry_id', SCALAR, None),
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteForwardEntryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteForwardEntryResponseBody'),
+    ),
+    'DeleteForwardEntryResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteHaVipRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteHaVipResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteHaVipResponseBody'),
+    ),
+    'DeleteHaVipResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteHpcClusterRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteHpcClusterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteHpcClusterResponseBody'),
+    ),
+    'DeleteHpcClusterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteImageComponentRequest': (
+        ('ImageComponentId', 'image_component_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteImageComponentResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteImageComponentResponseBody'),
+    ),
+    'DeleteImageComponentResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteImagePipelineRequest': (
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteImagePipelineResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteImagePipelineResponseBody'),
+    ),
+    'DeleteImagePipelineResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteImageRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteImageResponseBody'),
+    ),
+    'DeleteImageResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteInstanceRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TerminateSubscription', 'terminate_subscription', SCALAR, None),
+    ),
+    'DeleteInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteInstanceResponseBody'),
+    ),
+    'DeleteInstanceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteInstancesRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TerminateSubscription', 'terminate_subscription', SCALAR, None),
+    ),
+    'DeleteInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteInstancesResponseBody'),
+    ),
+    'DeleteInstancesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteKeyPairsRequest': (
+        ('KeyPairNames', 'key_pair_names', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteKeyPairsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteKeyPairsResponseBody'),
+    ),
+    'DeleteKeyPairsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateRequest': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteLaunchTemplateResponseBody'),
+    ),
+    'DeleteLaunchTemplateResponseBody': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersionNumbers', 'launch_template_version_numbers', MODEL, 'DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateResponseBodyLaunchTemplateVersionNumbers': (
+        ('versionNumbers', 'version_numbers', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateVersionRequest': (
+        ('DeleteVersion', 'delete_version', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateVersionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteLaunchTemplateVersionResponseBody'),
+    ),
+    'DeleteLaunchTemplateVersionResponseBody': (
+        ('LaunchTemplateVersions', 'launch_template_versions', MODEL, 'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersions': (
+        ('LaunchTemplateVersion', 'launch_template_version', MODEL_LIST, 'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion'),
+    ),
+    'DeleteLaunchTemplateVersionResponseBodyLaunchTemplateVersionsLaunchTemplateVersion': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersionNumber', 'launch_template_version_number', SCALAR, None),
+    ),
+    'DeleteNatGatewayRequest': (
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteNatGatewayResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteNatGatewayResponseBody'),
+    ),
+    'DeleteNatGatewayResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteNetworkInterfacePermissionRequest': (
+        ('Force', 'force', SCALAR, None),
+        ('NetworkInterfacePermissionId', 'network_interface_permission_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteNetworkInterfacePermissionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteNetworkInterfacePermissionResponseBody'),
+    ),
+    'DeleteNetworkInterfacePermissionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteNetworkInterfaceRequest': (
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeleteNetworkInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteNetworkInterfaceResponseBody'),
+    ),
+    'DeleteNetworkInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeletePhysicalConnectionRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeletePhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeletePhysicalConnectionResponseBody'),
+    ),
+    'DeletePhysicalConnectionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeletePortRangeListRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeletePortRangeListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeletePortRangeListResponseBody'),
+    ),
+    'DeletePortRangeListResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeletePrefixListRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeletePrefixListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeletePrefixListResponseBody'),
+    ),
+    'DeletePrefixListResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteRouteEntryRequest': (
+        ('DestinationCidrBlock', 'destination_cidr_block', SCALAR, None),
+        ('NextHopId', 'next_hop_id', SCALAR, None),
+        ('NextHopList', 'next_hop_list', MODEL_LIST, 'DeleteRouteEntryRequestNextHopList'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+    ),
+    'DeleteRouteEntryRequestNextHopList': (
+        ('NextHopId', 'next_hop_id', SCALAR, None),
+        ('NextHopType', 'next_hop_type', SCALAR, None),
+    ),
+    'DeleteRouteEntryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteRouteEntryResponseBody'),
+    ),
+    'DeleteRouteEntryResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteRouterInterfaceRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'DeleteRouterInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteRouterInterfaceResponseBody'),
+    ),
+    'DeleteRouterInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteSecurityGroupRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DeleteSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteSecurityGroupResponseBody'),
+    ),
+    'DeleteSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteSnapshotGroupRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotGroupId', 'snapshot_group_id', SCALAR, None),
+    ),
+    'DeleteSnapshotGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteSnapshotGroupResponseBody'),
+    ),
+    'DeleteSnapshotGroupResponseBody': (
+        ('OperationProgressSet', 'operation_progress_set', MODEL, 'DeleteSnapshotGroupResponseBodyOperationProgressSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteSnapshotGroupResponseBodyOperationProgressSet': (
+        ('OperationProgress', 'operation_progress', MODEL_LIST, 'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress'),
+    ),
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgress': (
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorMsg', 'error_msg', SCALAR, None),
+        ('OperationStatus', 'operation_status', SCALAR, None),
+        ('RelatedItemSet', 'related_item_set', MODEL, 'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet'),
+    ),
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSet': (
+        ('RelatedItem', 'related_item', MODEL_LIST, 'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem'),
+    ),
+    'DeleteSnapshotGroupResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': (
+        ('Name', 'name', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DeleteSnapshotRequest': (
+        ('Force', 'force', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'DeleteSnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteSnapshotResponseBody'),
+    ),
+    'DeleteSnapshotResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteStorageSetRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+    ),
+    'DeleteStorageSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteStorageSetResponseBody'),
+    ),
+    'DeleteStorageSetResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteVSwitchRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'DeleteVSwitchResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteVSwitchResponseBody'),
+    ),
+    'DeleteVSwitchResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteVirtualBorderRouterRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+    ),
+    'DeleteVirtualBorderRouterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteVirtualBorderRouterResponseBody'),
+    ),
+    'DeleteVirtualBorderRouterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeleteVpcRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DeleteVpcResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeleteVpcResponseBody'),
+    ),
+    'DeleteVpcResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeregisterManagedInstanceRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DeregisterManagedInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DeregisterManagedInstanceResponseBody'),
+    ),
+    'DeregisterManagedInstanceResponseBody': (
+        ('Instance', 'instance', MODEL, 'DeregisterManagedInstanceResponseBodyInstance'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DeregisterManagedInstanceResponseBodyInstance': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('AgentVersion', 'agent_version', SCALAR, None),
+        ('Hostname', 'hostname', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InternetIp', 'internet_ip', SCALAR, None),
+        ('IntranetIp', 'intranet_ip', SCALAR, None),
+        ('InvocationCount', 'invocation_count', SCALAR, None),
+        ('LastInvokedTime', 'last_invoked_time', SCALAR, None),
+        ('MachineId', 'machine_id', SCALAR, None),
+        ('OsType', 'os_type', SCALAR, None),
+        ('OsVersion', 'os_version', SCALAR, None),
+        ('RegistrationTime', 'registration_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+    ),
+    'DescribeAccessPointsRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeAccessPointsRequestFilter'),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeAccessPointsRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeAccessPointsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAccessPointsResponseBody'),
+    ),
+    'DescribeAccessPointsResponseBody': (
+        ('AccessPointSet', 'access_point_set', MODEL, 'DescribeAccessPointsResponseBodyAccessPointSet'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeAccessPointsResponseBodyAccessPointSet': (
+        ('AccessPointType', 'access_point_type', MODEL_LIST, 'DescribeAccessPointsResponseBodyAccessPointSetAccessPointType'),
+    ),
+    'DescribeAccessPointsResponseBodyAccessPointSetAccessPointType': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('AttachedRegionNo', 'attached_region_no', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('HostOperator', 'host_operator', SCALAR, None),
+        ('Location', 'location', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeAccountAttributesRequest': (
+        ('AttributeName', 'attribute_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeAccountAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAccountAttributesResponseBody'),
+    ),
+    'DescribeAccountAttributesResponseBody': (
+        ('AccountAttributeItems', 'account_attribute_items', MODEL, 'DescribeAccountAttributesResponseBodyAccountAttributeItems'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeAccountAttributesResponseBodyAccountAttributeItems': (
+        ('AccountAttributeItem', 'account_attribute_item', MODEL_LIST, 'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem'),
+    ),
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItem': (
+        ('AttributeName', 'attribute_name', SCALAR, None),
+        ('AttributeValues', 'attribute_values', MODEL, 'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues'),
+    ),
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValues': (
+        ('ValueItem', 'value_item', MODEL_LIST, 'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem'),
+    ),
+    'DescribeAccountAttributesResponseBodyAccountAttributeItemsAccountAttributeItemAttributeValuesValueItem': (
+        ('Count', 'count', SCALAR, None),
+        ('DiskCategory', 'disk_category', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeActivationsRequest': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeActivationsRequestTag'),
+    ),
+    'DescribeActivationsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeActivationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeActivationsResponseBody'),
+    ),
+    'DescribeActivationsResponseBody': (
+        ('ActivationList', 'activation_list', MODEL_LIST, 'DescribeActivationsResponseBodyActivationList'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeActivationsResponseBodyActivationList': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeregisteredCount', 'deregistered_count', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Disabled', 'disabled', SCALAR, None),
+        ('InstanceCount', 'instance_count', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('IpAddressRange', 'ip_address_range', SCALAR, None),
+        ('RegisteredCount', 'registered_count', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL_LIST, 'DescribeActivationsResponseBodyActivationListTags'),
+        ('TimeToLiveInHours', 'time_to_live_in_hours', SCALAR, None),
+    ),
+    'DescribeActivationsResponseBodyActivationListTags': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupHistoryRequest': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAutoProvisioningGroupHistoryResponseBody'),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponseBody': (
+        ('AutoProvisioningGroupHistories', 'auto_provisioning_group_histories', MODEL, 'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistories': (
+        ('AutoProvisioningGroupHistory', 'auto_provisioning_group_history', MODEL_LIST, 'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory'),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistory': (
+        ('ActivityDetails', 'activity_details', MODEL, 'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails'),
+        ('LastEventTime', 'last_event_time', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetails': (
+        ('ActivityDetail', 'activity_detail', MODEL_LIST, 'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail'),
+    ),
+    'DescribeAutoProvisioningGroupHistoryResponseBodyAutoProvisioningGroupHistoriesAutoProvisioningGroupHistoryActivityDetailsActivityDetail': (
+        ('Detail', 'detail', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupInstancesRequest': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAutoProvisioningGroupInstancesResponseBody'),
+    ),
+    'DescribeAutoProvisioningGroupInstancesResponseBody': (
+        ('Instances', 'instances', MODEL, 'DescribeAutoProvisioningGroupInstancesResponseBodyInstances'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstances': (
+        ('Instance', 'instance', MODEL_LIST, 'DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance'),
+    ),
+    'DescribeAutoProvisioningGroupInstancesResponseBodyInstancesInstance': (
+        ('CPU', 'cpu', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('IsSpot', 'is_spot', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OsType', 'os_type', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsRequest': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('AutoProvisioningGroupName', 'auto_provisioning_group_name', SCALAR, None),
+        ('AutoProvisioningGroupStatus', 'auto_provisioning_group_status', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeAutoProvisioningGroupsRequestTag'),
+    ),
+    'DescribeAutoProvisioningGroupsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAutoProvisioningGroupsResponseBody'),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBody': (
+        ('AutoProvisioningGroups', 'auto_provisioning_groups', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroups': (
+        ('AutoProvisioningGroup', 'auto_provisioning_group', MODEL_LIST, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup'),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroup': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('AutoProvisioningGroupName', 'auto_provisioning_group_name', SCALAR, None),
+        ('AutoProvisioningGroupType', 'auto_provisioning_group_type', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('ExcessCapacityTerminationPolicy', 'excess_capacity_termination_policy', SCALAR, None),
+        ('LaunchTemplateConfigs', 'launch_template_configs', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs'),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateVersion', 'launch_template_version', SCALAR, None),
+        ('MaxSpotPrice', 'max_spot_price', SCALAR, None),
+        ('PayAsYouGoOptions', 'pay_as_you_go_options', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SpotOptions', 'spot_options', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions'),
+        ('State', 'state', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags'),
+        ('TargetCapacitySpecification', 'target_capacity_specification', MODEL, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification'),
+        ('TerminateInstances', 'terminate_instances', SCALAR, None),
+        ('TerminateInstancesWithExpiration', 'terminate_instances_with_expiration', SCALAR, None),
+        ('ValidFrom', 'valid_from', SCALAR, None),
+        ('ValidUntil', 'valid_until', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigs': (
+        ('LaunchTemplateConfig', 'launch_template_config', MODEL_LIST, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig'),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupLaunchTemplateConfigsLaunchTemplateConfig': (
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxPrice', 'max_price', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('WeightedCapacity', 'weighted_capacity', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupPayAsYouGoOptions': (
+        ('AllocationStrategy', 'allocation_strategy', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupSpotOptions': (
+        ('AllocationStrategy', 'allocation_strategy', SCALAR, None),
+        ('InstanceInterruptionBehavior', 'instance_interruption_behavior', SCALAR, None),
+        ('InstancePoolsToUseCount', 'instance_pools_to_use_count', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag'),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeAutoProvisioningGroupsResponseBodyAutoProvisioningGroupsAutoProvisioningGroupTargetCapacitySpecification': (
+        ('DefaultTargetCapacityType', 'default_target_capacity_type', SCALAR, None),
+        ('PayAsYouGoTargetCapacity', 'pay_as_you_go_target_capacity', SCALAR, None),
+        ('SpotTargetCapacity', 'spot_target_capacity', SCALAR, None),
+        ('TotalTargetCapacity', 'total_target_capacity', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyAssociationsRequest': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyAssociationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAutoSnapshotPolicyAssociationsResponseBody'),
+    ),
+    'DescribeAutoSnapshotPolicyAssociationsResponseBody': (
+        ('AutoSnapshotPolicyAssociations', 'auto_snapshot_policy_associations', MODEL, 'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociations': (
+        ('AutoSnapshotPolicyAssociation', 'auto_snapshot_policy_association', MODEL_LIST, 'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation'),
+    ),
+    'DescribeAutoSnapshotPolicyAssociationsResponseBodyAutoSnapshotPolicyAssociationsAutoSnapshotPolicyAssociation': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyExRequest': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('AutoSnapshotPolicyName', 'auto_snapshot_policy_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeAutoSnapshotPolicyExRequestTag'),
+    ),
+    'DescribeAutoSnapshotPolicyExRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyExResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAutoSnapshotPolicyExResponseBody'),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBody': (
+        ('AutoSnapshotPolicies', 'auto_snapshot_policies', MODEL, 'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPolicies': (
+        ('AutoSnapshotPolicy', 'auto_snapshot_policy', MODEL_LIST, 'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy'),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicy': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('AutoSnapshotPolicyName', 'auto_snapshot_policy_name', SCALAR, None),
+        ('CopiedSnapshotsRetentionDays', 'copied_snapshots_retention_days', SCALAR, None),
+        ('CopyEncryptionConfiguration', 'copy_encryption_configuration', MODEL, 'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DiskNums', 'disk_nums', SCALAR, None),
+        ('EnableCrossRegionCopy', 'enable_cross_region_copy', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatWeekdays', 'repeat_weekdays', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags'),
+        ('TargetCopyRegions', 'target_copy_regions', SCALAR, None),
+        ('TimePoints', 'time_points', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('VolumeNums', 'volume_nums', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyCopyEncryptionConfiguration': (
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag'),
+    ),
+    'DescribeAutoSnapshotPolicyExResponseBodyAutoSnapshotPoliciesAutoSnapshotPolicyTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeAvailableResourceRequest': (
+        ('Cores', 'cores', SCALAR, None),
+        ('DataDiskCategory', 'data_disk_category', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DestinationResource', 'destination_resource', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('NetworkCategory', 'network_category', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('SystemDiskCategory', 'system_disk_category', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeAvailableResourceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeAvailableResourceResponseBody'),
+    ),
+    'DescribeAvailableResourceResponseBody': (
+        ('AvailableZones', 'available_zones', MODEL, 'DescribeAvailableResourceResponseBodyAvailableZones'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZones': (
+        ('AvailableZone', 'available_zone', MODEL_LIST, 'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone'),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZone': (
+        ('AvailableResources', 'available_resources', MODEL, 'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StatusCategory', 'status_category', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResources': (
+        ('AvailableResource', 'available_resource', MODEL_LIST, 'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource'),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource': (
+        ('SupportedResources', 'supported_resources', MODEL, 'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources'),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources': (
+        ('SupportedResource', 'supported_resource', MODEL_LIST, 'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource'),
+    ),
+    'DescribeAvailableResourceResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource': (
+        ('Max', 'max', SCALAR, None),
+        ('Min', 'min', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StatusCategory', 'status_category', SCALAR, None),
+        ('Unit', 'unit', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeBandwidthLimitationRequest': (
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OperationType', 'operation_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+    ),
+    'DescribeBandwidthLimitationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeBandwidthLimitationResponseBody'),
+    ),
+    'DescribeBandwidthLimitationResponseBody': (
+        ('Bandwidths', 'bandwidths', MODEL, 'DescribeBandwidthLimitationResponseBodyBandwidths'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeBandwidthLimitationResponseBodyBandwidths': (
+        ('Bandwidth', 'bandwidth', MODEL_LIST, 'DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth'),
+    ),
+    'DescribeBandwidthLimitationResponseBodyBandwidthsBandwidth': (
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('Max', 'max', SCALAR, None),
+        ('Min', 'min', SCALAR, None),
+        ('Unit', 'unit', SCALAR, None),
+    ),
+    'DescribeBandwidthPackagesRequest': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeBandwidthPackagesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeBandwidthPackagesResponseBody'),
+    ),
+    'DescribeBandwidthPackagesResponseBody': (
+        ('BandwidthPackages', 'bandwidth_packages', MODEL, 'DescribeBandwidthPackagesResponseBodyBandwidthPackages'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackages': (
+        ('BandwidthPackage', 'bandwidth_package', MODEL_LIST, 'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage'),
+    ),
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackage': (
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('BusinessStatus', 'business_status', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ISP', 'isp', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('IpCount', 'ip_count', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('PublicIpAddresses', 'public_ip_addresses', MODEL, 'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddresses': (
+        ('PublicIpAddresse', 'public_ip_addresse', MODEL_LIST, 'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse'),
+    ),
+    'DescribeBandwidthPackagesResponseBodyBandwidthPackagesBandwidthPackagePublicIpAddressesPublicIpAddresse': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeCapacityReservationInstancesRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'DescribeCapacityReservationInstancesRequestPrivatePoolOptions'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeCapacityReservationInstancesRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'DescribeCapacityReservationInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeCapacityReservationInstancesResponseBody'),
+    ),
+    'DescribeCapacityReservationInstancesResponseBody': (
+        ('CapacityReservationItem', 'capacity_reservation_item', MODEL, 'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItem': (
+        ('InstanceIdSet', 'instance_id_set', MODEL_LIST, 'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet'),
+    ),
+    'DescribeCapacityReservationInstancesResponseBodyCapacityReservationItemInstanceIdSet': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'DescribeCapacityReservationsRequestPrivatePoolOptions'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeCapacityReservationsRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsRequestPrivatePoolOptions': (
+        ('Ids', 'ids', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeCapacityReservationsResponseBody'),
+    ),
+    'DescribeCapacityReservationsResponseBody': (
+        ('CapacityReservationSet', 'capacity_reservation_set', MODEL, 'DescribeCapacityReservationsResponseBodyCapacityReservationSet'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSet': (
+        ('CapacityReservationItem', 'capacity_reservation_item', MODEL_LIST, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem'),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItem': (
+        ('AllocatedResources', 'allocated_resources', MODEL, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources'),
+        ('CapacityReservationOwnerId', 'capacity_reservation_owner_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('EndTimeType', 'end_time_type', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('PrivatePoolOptionsMatchCriteria', 'private_pool_options_match_criteria', SCALAR, None),
+        ('PrivatePoolOptionsName', 'private_pool_options_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SavingPlanId', 'saving_plan_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('StartTimeType', 'start_time_type', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags'),
+        ('TimeSlot', 'time_slot', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResources': (
+        ('AllocatedResource', 'allocated_resource', MODEL_LIST, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource'),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResource': (
+        ('AvailableAmount', 'available_amount', SCALAR, None),
+        ('CapacityReservationUsages', 'capacity_reservation_usages', MODEL, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('TotalAmount', 'total_amount', SCALAR, None),
+        ('UsedAmount', 'used_amount', SCALAR, None),
+        ('zoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsages': (
+        ('CapacityReservationUsage', 'capacity_reservation_usage', MODEL_LIST, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage'),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemAllocatedResourcesAllocatedResourceCapacityReservationUsagesCapacityReservationUsage': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('ServiceName', 'service_name', SCALAR, None),
+        ('UsedAmount', 'used_amount', SCALAR, None),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag'),
+    ),
+    'DescribeCapacityReservationsResponseBodyCapacityReservationSetCapacityReservationItemTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeClassicLinkInstancesRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeClassicLinkInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeClassicLinkInstancesResponseBody'),
+    ),
+    'DescribeClassicLinkInstancesResponseBody': (
+        ('Links', 'links', MODEL, 'DescribeClassicLinkInstancesResponseBodyLinks'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeClassicLinkInstancesResponseBodyLinks': (
+        ('Link', 'link', MODEL_LIST, 'DescribeClassicLinkInstancesResponseBodyLinksLink'),
+    ),
+    'DescribeClassicLinkInstancesResponseBodyLinksLink': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SettingType', 'setting_type', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeCloudAssistantSettingsResponseBody'),
+    ),
+    'DescribeCloudAssistantSettingsResponseBody': (
+        ('AgentUpgradeConfig', 'agent_upgrade_config', MODEL, 'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig'),
+        ('OssDeliveryConfigs', 'oss_delivery_configs', MODEL, 'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs'),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SessionManagerConfig', 'session_manager_config', MODEL, 'DescribeCloudAssistantSettingsResponseBodySessionManagerConfig'),
+        ('SlsDeliveryConfigs', 'sls_delivery_configs', MODEL, 'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs'),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfig': (
+        ('AllowedUpgradeWindows', 'allowed_upgrade_windows', MODEL, 'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows'),
+        ('Enabled', 'enabled', SCALAR, None),
+        ('TimeZone', 'time_zone', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodyAgentUpgradeConfigAllowedUpgradeWindows': (
+        ('AllowedUpgradeWindow', 'allowed_upgrade_window', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigs': (
+        ('OssDeliveryConfig', 'oss_delivery_config', MODEL_LIST, 'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig'),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodyOssDeliveryConfigsOssDeliveryConfig': (
+        ('BucketName', 'bucket_name', SCALAR, None),
+        ('DeliveryType', 'delivery_type', SCALAR, None),
+        ('Enabled', 'enabled', SCALAR, None),
+        ('EncryptionAlgorithm', 'encryption_algorithm', SCALAR, None),
+        ('EncryptionKeyId', 'encryption_key_id', SCALAR, None),
+        ('EncryptionType', 'encryption_type', SCALAR, None),
+        ('Prefix', 'prefix', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodySessionManagerConfig': (
+        ('SessionManagerEnabled', 'session_manager_enabled', SCALAR, None),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigs': (
+        ('SlsDeliveryConfig', 'sls_delivery_config', MODEL_LIST, 'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig'),
+    ),
+    'DescribeCloudAssistantSettingsResponseBodySlsDeliveryConfigsSlsDeliveryConfig': (
+        ('DeliveryType', 'delivery_type', SCALAR, None),
+        ('Enabled', 'enabled', SCALAR, None),
+        ('LogstoreName', 'logstore_name', SCALAR, None),
+        ('ProjectName', 'project_name', SCALAR, None),
+    ),
+    'DescribeCloudAssistantStatusRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeCloudAssistantStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeCloudAssistantStatusResponseBody'),
+    ),
+    'DescribeCloudAssistantStatusResponseBody': (
+        ('InstanceCloudAssistantStatusSet', 'instance_cloud_assistant_status_set', MODEL, 'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSet': (
+        ('InstanceCloudAssistantStatus', 'instance_cloud_assistant_status', MODEL_LIST, 'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus'),
+    ),
+    'DescribeCloudAssistantStatusResponseBodyInstanceCloudAssistantStatusSetInstanceCloudAssistantStatus': (
+        ('ActiveTaskCount', 'active_task_count', SCALAR, None),
+        ('CloudAssistantStatus', 'cloud_assistant_status', SCALAR, None),
+        ('CloudAssistantVersion', 'cloud_assistant_version', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvocationCount', 'invocation_count', SCALAR, None),
+        ('LastHeartbeatTime', 'last_heartbeat_time', SCALAR, None),
+        ('LastInvokedTime', 'last_invoked_time', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('SupportSessionManager', 'support_session_manager', SCALAR, None),
+    ),
+    'DescribeClustersRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeClustersResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeClustersResponseBody'),
+    ),
+    'DescribeClustersResponseBody': (
+        ('Clusters', 'clusters', MODEL, 'DescribeClustersResponseBodyClusters'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeClustersResponseBodyClusters': (
+        ('Cluster', 'cluster', MODEL_LIST, 'DescribeClustersResponseBodyClustersCluster'),
+    ),
+    'DescribeClustersResponseBodyClustersCluster': (
+        ('ClusterId', 'cluster_id', SCALAR, None),
+    ),
+    'DescribeCommandsRequest': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Latest', 'latest', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('Provider', 'provider', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeCommandsRequestTag'),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeCommandsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeCommandsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeCommandsResponseBody'),
+    ),
+    'DescribeCommandsResponseBody': (
+        ('Commands', 'commands', MODEL, 'DescribeCommandsResponseBodyCommands'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeCommandsResponseBodyCommands': (
+        ('Command', 'command', MODEL_LIST, 'DescribeCommandsResponseBodyCommandsCommand'),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommand': (
+        ('Category', 'category', SCALAR, None),
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('CommandId', 'command_id', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('InvokeTimes', 'invoke_times', SCALAR, None),
+        ('Latest', 'latest', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('ParameterDefinitions', 'parameter_definitions', MODEL, 'DescribeCommandsResponseBodyCommandsCommandParameterDefinitions'),
+        ('ParameterNames', 'parameter_names', MODEL, 'DescribeCommandsResponseBodyCommandsCommandParameterNames'),
+        ('Provider', 'provider', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeCommandsResponseBodyCommandsCommandTags'),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('Version', 'version', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitions': (
+        ('ParameterDefinition', 'parameter_definition', MODEL_LIST, 'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition'),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinition': (
+        ('DefaultValue', 'default_value', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ParameterName', 'parameter_name', SCALAR, None),
+        ('PatternRegex', 'pattern_regex', SCALAR, None),
+        ('PossibleValues', 'possible_values', MODEL, 'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues'),
+        ('Required', 'required', SCALAR, None),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandParameterDefinitionsParameterDefinitionPossibleValues': (
+        ('PossibleValue', 'possible_value', SCALAR, None),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandParameterNames': (
+        ('ParameterName', 'parameter_name', SCALAR, None),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeCommandsResponseBodyCommandsCommandTagsTag'),
+    ),
+    'DescribeCommandsResponseBodyCommandsCommandTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeDedicatedHostAutoRenewRequest': (
+        ('DedicatedHostIds', 'dedicated_host_ids', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostAutoRenewResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDedicatedHostAutoRenewResponseBody'),
+    ),
+    'DescribeDedicatedHostAutoRenewResponseBody': (
+        ('DedicatedHostRenewAttributes', 'dedicated_host_renew_attributes', MODEL, 'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributes': (
+        ('DedicatedHostRenewAttribute', 'dedicated_host_renew_attribute', MODEL_LIST, 'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute'),
+    ),
+    'DescribeDedicatedHostAutoRenewResponseBodyDedicatedHostRenewAttributesDedicatedHostRenewAttribute': (
+        ('AutoRenewEnabled', 'auto_renew_enabled', SCALAR, None),
+        ('AutoRenewWithEcs', 'auto_renew_with_ecs', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('Duration', 'duration', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersRequest': (
+        ('DedicatedHostClusterIds', 'dedicated_host_cluster_ids', SCALAR, None),
+        ('DedicatedHostClusterName', 'dedicated_host_cluster_name', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDedicatedHostClustersRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDedicatedHostClustersResponseBody'),
+    ),
+    'DescribeDedicatedHostClustersResponseBody': (
+        ('DedicatedHostClusters', 'dedicated_host_clusters', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClusters': (
+        ('DedicatedHostCluster', 'dedicated_host_cluster', MODEL_LIST, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster'),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostCluster': (
+        ('DedicatedHostClusterCapacity', 'dedicated_host_cluster_capacity', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity'),
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostClusterName', 'dedicated_host_cluster_name', SCALAR, None),
+        ('DedicatedHostIds', 'dedicated_host_ids', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds'),
+        ('Description', 'description', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacity': (
+        ('AvailableInstanceTypes', 'available_instance_types', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes'),
+        ('AvailableMemory', 'available_memory', SCALAR, None),
+        ('AvailableVcpus', 'available_vcpus', SCALAR, None),
+        ('LocalStorageCapacities', 'local_storage_capacities', MODEL, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities'),
+        ('TotalMemory', 'total_memory', SCALAR, None),
+        ('TotalVcpus', 'total_vcpus', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypes': (
+        ('AvailableInstanceType', 'available_instance_type', MODEL_LIST, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType'),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityAvailableInstanceTypesAvailableInstanceType': (
+        ('AvailableInstanceCapacity', 'available_instance_capacity', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacities': (
+        ('LocalStorageCapacity', 'local_storage_capacity', MODEL_LIST, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity'),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostClusterCapacityLocalStorageCapacitiesLocalStorageCapacity': (
+        ('AvailableDisk', 'available_disk', SCALAR, None),
+        ('DataDiskCategory', 'data_disk_category', SCALAR, None),
+        ('TotalDisk', 'total_disk', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterDedicatedHostIds': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag'),
+    ),
+    'DescribeDedicatedHostClustersResponseBodyDedicatedHostClustersDedicatedHostClusterTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeDedicatedHostTypesRequest': (
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SupportedInstanceTypeFamily', 'supported_instance_type_family', SCALAR, None),
+    ),
+    'DescribeDedicatedHostTypesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDedicatedHostTypesResponseBody'),
+    ),
+    'DescribeDedicatedHostTypesResponseBody': (
+        ('DedicatedHostTypes', 'dedicated_host_types', MODEL, 'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypes': (
+        ('DedicatedHostType', 'dedicated_host_type', MODEL_LIST, 'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType'),
+    ),
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostType': (
+        ('Cores', 'cores', SCALAR, None),
+        ('CpuOverCommitRatioRange', 'cpu_over_commit_ratio_range', SCALAR, None),
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('GPUSpec', 'gpuspec', SCALAR, None),
+        ('LocalStorageAmount', 'local_storage_amount', SCALAR, None),
+        ('LocalStorageCapacity', 'local_storage_capacity', SCALAR, None),
+        ('LocalStorageCategory', 'local_storage_category', SCALAR, None),
+        ('MemorySize', 'memory_size', SCALAR, None),
+        ('PhysicalGpus', 'physical_gpus', SCALAR, None),
+        ('Sockets', 'sockets', SCALAR, None),
+        ('SupportCpuOverCommitRatio', 'support_cpu_over_commit_ratio', SCALAR, None),
+        ('SupportedInstanceTypeFamilies', 'supported_instance_type_families', MODEL, 'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies'),
+        ('SupportedInstanceTypesList', 'supported_instance_types_list', MODEL, 'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList'),
+        ('TotalVcpus', 'total_vcpus', SCALAR, None),
+        ('TotalVgpus', 'total_vgpus', SCALAR, None),
+    ),
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypeFamilies': (
+        ('SupportedInstanceTypeFamily', 'supported_instance_type_family', SCALAR, None),
+    ),
+    'DescribeDedicatedHostTypesResponseBodyDedicatedHostTypesDedicatedHostTypeSupportedInstanceTypesList': (
+        ('SupportedInstanceTypesList', 'supported_instance_types_list', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsRequest': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostIds', 'dedicated_host_ids', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('QueryInventory', 'query_inventory', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SocketDetails', 'socket_details', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDedicatedHostsRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDedicatedHostsResponseBody'),
+    ),
+    'DescribeDedicatedHostsResponseBody': (
+        ('DedicatedHosts', 'dedicated_hosts', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHosts'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHosts': (
+        ('DedicatedHost', 'dedicated_host', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHost': (
+        ('SchedulerOptions', 'scheduler_options', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions'),
+        ('ActionOnMaintenance', 'action_on_maintenance', SCALAR, None),
+        ('AutoPlacement', 'auto_placement', SCALAR, None),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('Capacity', 'capacity', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity'),
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('Cores', 'cores', SCALAR, None),
+        ('CpuOverCommitRatio', 'cpu_over_commit_ratio', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+        ('DedicatedHostOwnerId', 'dedicated_host_owner_id', SCALAR, None),
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('GPUSpec', 'gpuspec', SCALAR, None),
+        ('HostDetailInfo', 'host_detail_info', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo'),
+        ('Instances', 'instances', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances'),
+        ('MachineId', 'machine_id', SCALAR, None),
+        ('NetworkAttributes', 'network_attributes', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes'),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks'),
+        ('PhysicalGpus', 'physical_gpus', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SaleCycle', 'sale_cycle', SCALAR, None),
+        ('Sockets', 'sockets', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('SupportedCustomInstanceTypeFamilies', 'supported_custom_instance_type_families', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies'),
+        ('SupportedInstanceTypeFamilies', 'supported_instance_type_families', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies'),
+        ('SupportedInstanceTypesList', 'supported_instance_types_list', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList'),
+        ('Tags', 'tags', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacity': (
+        ('AvailableInstanceTypes', 'available_instance_types', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes'),
+        ('AvailableLocalStorage', 'available_local_storage', SCALAR, None),
+        ('AvailableMemory', 'available_memory', SCALAR, None),
+        ('AvailableVcpus', 'available_vcpus', SCALAR, None),
+        ('AvailableVgpus', 'available_vgpus', SCALAR, None),
+        ('LocalStorageCategory', 'local_storage_category', SCALAR, None),
+        ('SocketCapacities', 'socket_capacities', MODEL, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities'),
+        ('TotalLocalStorage', 'total_local_storage', SCALAR, None),
+        ('TotalMemory', 'total_memory', SCALAR, None),
+        ('TotalVcpus', 'total_vcpus', SCALAR, None),
+        ('TotalVgpus', 'total_vgpus', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypes': (
+        ('AvailableInstanceType', 'available_instance_type', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacityAvailableInstanceTypesAvailableInstanceType': (
+        ('AvailableInstanceCapacity', 'available_instance_capacity', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacities': (
+        ('SocketCapacity', 'socket_capacity', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostCapacitySocketCapacitiesSocketCapacity': (
+        ('AvailableMemory', 'available_memory', SCALAR, None),
+        ('AvailableVcpu', 'available_vcpu', SCALAR, None),
+        ('SocketId', 'socket_id', SCALAR, None),
+        ('TotalMemory', 'total_memory', SCALAR, None),
+        ('TotalVcpu', 'total_vcpu', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostHostDetailInfo': (
+        ('SerialNumber', 'serial_number', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstances': (
+        ('Instance', 'instance', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostInstancesInstance': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceOwnerId', 'instance_owner_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('SocketId', 'socket_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostNetworkAttributes': (
+        ('SlbUdpTimeout', 'slb_udp_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocks': (
+        ('OperationLock', 'operation_lock', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostOperationLocksOperationLock': (
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSchedulerOptions': (
+        ('ManagedPrivateSpaceId', 'managed_private_space_id', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedCustomInstanceTypeFamilies': (
+        ('SupportedCustomInstanceTypeFamily', 'supported_custom_instance_type_family', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypeFamilies': (
+        ('SupportedInstanceTypeFamily', 'supported_instance_type_family', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostSupportedInstanceTypesList': (
+        ('SupportedInstanceTypesList', 'supported_instance_types_list', SCALAR, None),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag'),
+    ),
+    'DescribeDedicatedHostsResponseBodyDedicatedHostsDedicatedHostTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Strategy', 'strategy', SCALAR, None),
+    ),
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody'),
+    ),
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponseBody': (
+        ('InstanceTypeFamilies', 'instance_type_families', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDeploymentSetsRequest': (
+        ('DeploymentSetIds', 'deployment_set_ids', SCALAR, None),
+        ('DeploymentSetName', 'deployment_set_name', SCALAR, None),
+        ('Domain', 'domain', SCALAR, None),
+        ('Granularity', 'granularity', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Strategy', 'strategy', SCALAR, None),
+    ),
+    'DescribeDeploymentSetsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDeploymentSetsResponseBody'),
+    ),
+    'DescribeDeploymentSetsResponseBody': (
+        ('DeploymentSets', 'deployment_sets', MODEL, 'DescribeDeploymentSetsResponseBodyDeploymentSets'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDeploymentSetsResponseBodyDeploymentSets': (
+        ('DeploymentSet', 'deployment_set', MODEL_LIST, 'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet'),
+    ),
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSet': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('Capacities', 'capacities', MODEL, 'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeploymentSetDescription', 'deployment_set_description', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('DeploymentSetName', 'deployment_set_name', SCALAR, None),
+        ('DeploymentStrategy', 'deployment_strategy', SCALAR, None),
+        ('Domain', 'domain', SCALAR, None),
+        ('Granularity', 'granularity', SCALAR, None),
+        ('GroupCount', 'group_count', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceIds', 'instance_ids', MODEL, 'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds'),
+        ('Strategy', 'strategy', SCALAR, None),
+    ),
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacities': (
+        ('Capacity', 'capacity', MODEL_LIST, 'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity'),
+    ),
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetCapacitiesCapacity': (
+        ('AvailableAmount', 'available_amount', SCALAR, None),
+        ('UsedAmount', 'used_amount', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDeploymentSetsResponseBodyDeploymentSetsDeploymentSetInstanceIds': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricSetsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('MetricSetIds', 'metric_set_ids', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricSetsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiagnosticMetricSetsResponseBody'),
+    ),
+    'DescribeDiagnosticMetricSetsResponseBody': (
+        ('MetricSets', 'metric_sets', MODEL_LIST, 'DescribeDiagnosticMetricSetsResponseBodyMetricSets'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricSetsResponseBodyMetricSets': (
+        ('Description', 'description', SCALAR, None),
+        ('MetricIds', 'metric_ids', SCALAR, None),
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('MetricSetName', 'metric_set_name', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('MetricIds', 'metric_ids', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiagnosticMetricsResponseBody'),
+    ),
+    'DescribeDiagnosticMetricsResponseBody': (
+        ('Metrics', 'metrics', MODEL_LIST, 'DescribeDiagnosticMetricsResponseBodyMetrics'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDiagnosticMetricsResponseBodyMetrics': (
+        ('Description', 'description', SCALAR, None),
+        ('GuestMetric', 'guest_metric', SCALAR, None),
+        ('MetricCategory', 'metric_category', SCALAR, None),
+        ('MetricId', 'metric_id', SCALAR, None),
+        ('MetricName', 'metric_name', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('SupportedOperatingSystem', 'supported_operating_system', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportAttributesRequest': (
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReportId', 'report_id', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiagnosticReportAttributesResponseBody'),
+    ),
+    'DescribeDiagnosticReportAttributesResponseBody': (
+        ('Attributes', 'attributes', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('FinishedTime', 'finished_time', SCALAR, None),
+        ('MetricResults', 'metric_results', MODEL, 'DescribeDiagnosticReportAttributesResponseBodyMetricResults'),
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('ReportId', 'report_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResults': (
+        ('MetricResult', 'metric_result', MODEL_LIST, 'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult'),
+    ),
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResult': (
+        ('Issues', 'issues', MODEL, 'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues'),
+        ('MetricCategory', 'metric_category', SCALAR, None),
+        ('MetricId', 'metric_id', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssues': (
+        ('Issue', 'issue', MODEL_LIST, 'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue'),
+    ),
+    'DescribeDiagnosticReportAttributesResponseBodyMetricResultsMetricResultIssuesIssue': (
+        ('Additional', 'additional', SCALAR, None),
+        ('IssueId', 'issue_id', SCALAR, None),
+        ('OccurrenceTime', 'occurrence_time', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReportIds', 'report_ids', SCALAR, None),
+        ('ResourceIds', 'resource_ids', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiagnosticReportsResponseBody'),
+    ),
+    'DescribeDiagnosticReportsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('Reports', 'reports', MODEL, 'DescribeDiagnosticReportsResponseBodyReports'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportsResponseBodyReports': (
+        ('Report', 'report', MODEL_LIST, 'DescribeDiagnosticReportsResponseBodyReportsReport'),
+    ),
+    'DescribeDiagnosticReportsResponseBodyReportsReport': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('FinishedTime', 'finished_time', SCALAR, None),
+        ('Issues', 'issues', MODEL, 'DescribeDiagnosticReportsResponseBodyReportsReportIssues'),
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('ReportId', 'report_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssues': (
+        ('Issue', 'issue', MODEL_LIST, 'DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue'),
+    ),
+    'DescribeDiagnosticReportsResponseBodyReportsReportIssuesIssue': (
+        ('IssueId', 'issue_id', SCALAR, None),
+        ('MetricCategory', 'metric_category', SCALAR, None),
+        ('MetricId', 'metric_id', SCALAR, None),
+        ('Severity', 'severity', SCALAR, None),
+    ),
+    'DescribeDiskDefaultKMSKeyIdRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeDiskDefaultKMSKeyIdResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiskDefaultKMSKeyIdResponseBody'),
+    ),
+    'DescribeDiskDefaultKMSKeyIdResponseBody': (
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDiskEncryptionByDefaultStatusRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeDiskEncryptionByDefaultStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiskEncryptionByDefaultStatusResponseBody'),
+    ),
+    'DescribeDiskEncryptionByDefaultStatusResponseBody': (
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeDiskMonitorDataRequest': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeDiskMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDiskMonitorDataResponseBody'),
+    ),
+    'DescribeDiskMonitorDataResponseBody': (
+        ('MonitorData', 'monitor_data', MODEL, 'DescribeDiskMonitorDataResponseBodyMonitorData'),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDiskMonitorDataResponseBodyMonitorData': (
+        ('DiskMonitorData', 'disk_monitor_data', MODEL_LIST, 'DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData'),
+    ),
+    'DescribeDiskMonitorDataResponseBodyMonitorDataDiskMonitorData': (
+        ('BPSRead', 'bpsread', SCALAR, None),
+        ('BPSTotal', 'bpstotal', SCALAR, None),
+        ('BPSWrite', 'bpswrite', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('IOPSRead', 'iopsread', SCALAR, None),
+        ('IOPSTotal', 'iopstotal', SCALAR, None),
+        ('IOPSWrite', 'iopswrite', SCALAR, None),
+        ('LatencyRead', 'latency_read', SCALAR, None),
+        ('LatencyWrite', 'latency_write', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusRequest': (
+        ('EventTime', 'event_time', MODEL, 'DescribeDisksFullStatusRequestEventTime'),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventType', 'event_type', SCALAR, None),
+        ('HealthStatus', 'health_status', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDisksFullStatusRequestTag'),
+    ),
+    'DescribeDisksFullStatusRequestEventTime': (
+        ('End', 'end', SCALAR, None),
+        ('Start', 'start', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDisksFullStatusResponseBody'),
+    ),
+    'DescribeDisksFullStatusResponseBody': (
+        ('DiskFullStatusSet', 'disk_full_status_set', MODEL, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSet'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSet': (
+        ('DiskFullStatusType', 'disk_full_status_type', MODEL_LIST, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType'),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusType': (
+        ('Device', 'device', SCALAR, None),
+        ('DiskEventSet', 'disk_event_set', MODEL, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet'),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('HealthStatus', 'health_status', MODEL, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Status', 'status', MODEL, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus'),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSet': (
+        ('DiskEventType', 'disk_event_type', MODEL_LIST, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType'),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventType': (
+        ('EventEndTime', 'event_end_time', SCALAR, None),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventTime', 'event_time', SCALAR, None),
+        ('EventType', 'event_type', MODEL, 'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType'),
+        ('ImpactLevel', 'impact_level', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeDiskEventSetDiskEventTypeEventType': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeHealthStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeDisksFullStatusResponseBodyDiskFullStatusSetDiskFullStatusTypeStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeDisksRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeDisksRequestFilter'),
+        ('AdditionalAttributes', 'additional_attributes', SCALAR, None),
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteAutoSnapshot', 'delete_auto_snapshot', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('DiskChargeType', 'disk_charge_type', SCALAR, None),
+        ('DiskIds', 'disk_ids', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('DiskType', 'disk_type', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('EnableAutoSnapshot', 'enable_auto_snapshot', SCALAR, None),
+        ('EnableAutomatedSnapshotPolicy', 'enable_automated_snapshot_policy', SCALAR, None),
+        ('EnableShared', 'enable_shared', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('MultiAttach', 'multi_attach', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('Portable', 'portable', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDisksRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDisksRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeDisksRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeDisksResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeDisksResponseBody'),
+    ),
+    'DescribeDisksResponseBody': (
+        ('Disks', 'disks', MODEL, 'DescribeDisksResponseBodyDisks'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisks': (
+        ('Disk', 'disk', MODEL_LIST, 'DescribeDisksResponseBodyDisksDisk'),
+    ),
+    'DescribeDisksResponseBodyDisksDisk': (
+        ('AttachedTime', 'attached_time', SCALAR, None),
+        ('Attachments', 'attachments', MODEL, 'DescribeDisksResponseBodyDisksDiskAttachments'),
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BdfId', 'bdf_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeleteAutoSnapshot', 'delete_auto_snapshot', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DetachedTime', 'detached_time', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskChargeType', 'disk_charge_type', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EnableAutoSnapshot', 'enable_auto_snapshot', SCALAR, None),
+        ('EnableAutomatedSnapshotPolicy', 'enable_automated_snapshot_policy', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('IOPS', 'iops', SCALAR, None),
+        ('IOPSRead', 'iopsread', SCALAR, None),
+        ('IOPSWrite', 'iopswrite', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('MountInstanceNum', 'mount_instance_num', SCALAR, None),
+        ('MountInstances', 'mount_instances', MODEL, 'DescribeDisksResponseBodyDisksDiskMountInstances'),
+        ('MultiAttach', 'multi_attach', SCALAR, None),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeDisksResponseBodyDisksDiskOperationLocks'),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Placement', 'placement', MODEL, 'DescribeDisksResponseBodyDisksDiskPlacement'),
+        ('Portable', 'portable', SCALAR, None),
+        ('ProductCode', 'product_code', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SerialNumber', 'serial_number', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SourceSnapshotId', 'source_snapshot_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeDisksResponseBodyDisksDiskTags'),
+        ('Throughput', 'throughput', SCALAR, None),
+        ('ThroughputRead', 'throughput_read', SCALAR, None),
+        ('ThroughputWrite', 'throughput_write', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisksDiskAttachments': (
+        ('Attachment', 'attachment', MODEL_LIST, 'DescribeDisksResponseBodyDisksDiskAttachmentsAttachment'),
+    ),
+    'DescribeDisksResponseBodyDisksDiskAttachmentsAttachment': (
+        ('AttachedTime', 'attached_time', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisksDiskMountInstances': (
+        ('MountInstance', 'mount_instance', MODEL_LIST, 'DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance'),
+    ),
+    'DescribeDisksResponseBodyDisksDiskMountInstancesMountInstance': (
+        ('AttachedTime', 'attached_time', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisksDiskOperationLocks': (
+        ('OperationLock', 'operation_lock', MODEL_LIST, 'DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock'),
+    ),
+    'DescribeDisksResponseBodyDisksDiskOperationLocksOperationLock': (
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisksDiskPlacement': (
+        ('ZoneIds', 'zone_ids', SCALAR, None),
+    ),
+    'DescribeDisksResponseBodyDisksDiskTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeDisksResponseBodyDisksDiskTagsTag'),
+    ),
+    'DescribeDisksResponseBodyDisksDiskTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeEipAddressesRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeEipAddressesRequestFilter'),
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('AssociatedInstanceId', 'associated_instance_id', SCALAR, None),
+        ('AssociatedInstanceType', 'associated_instance_type', SCALAR, None),
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('EipAddress', 'eip_address', SCALAR, None),
+        ('ISP', 'isp', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeEipAddressesRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeEipAddressesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeEipAddressesResponseBody'),
+    ),
+    'DescribeEipAddressesResponseBody': (
+        ('EipAddresses', 'eip_addresses', MODEL, 'DescribeEipAddressesResponseBodyEipAddresses'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeEipAddressesResponseBodyEipAddresses': (
+        ('EipAddress', 'eip_address', MODEL_LIST, 'DescribeEipAddressesResponseBodyEipAddressesEipAddress'),
+    ),
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddress': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('AllocationTime', 'allocation_time', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('EipBandwidth', 'eip_bandwidth', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocks': (
+        ('LockReason', 'lock_reason', MODEL_LIST, 'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason'),
+    ),
+    'DescribeEipAddressesResponseBodyEipAddressesEipAddressOperationLocksLockReason': (
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeEipMonitorDataRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeEipMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeEipMonitorDataResponseBody'),
+    ),
+    'DescribeEipMonitorDataResponseBody': (
+        ('EipMonitorDatas', 'eip_monitor_datas', MODEL, 'DescribeEipMonitorDataResponseBodyEipMonitorDatas'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatas': (
+        ('EipMonitorData', 'eip_monitor_data', MODEL_LIST, 'DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData'),
+    ),
+    'DescribeEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData': (
+        ('EipBandwidth', 'eip_bandwidth', SCALAR, None),
+        ('EipFlow', 'eip_flow', SCALAR, None),
+        ('EipPackets', 'eip_packets', SCALAR, None),
+        ('EipRX', 'eip_rx', SCALAR, None),
+        ('EipTX', 'eip_tx', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeElasticityAssuranceAutoRenewAttributeResponseBody'),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBody': (
+        ('ElasticityAssuranceRenewAttributes', 'elasticity_assurance_renew_attributes', MODEL, 'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributes': (
+        ('ElasticityAssuranceRenewAttribute', 'elasticity_assurance_renew_attribute', MODEL_LIST, 'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute'),
+    ),
+    'DescribeElasticityAssuranceAutoRenewAttributeResponseBodyElasticityAssuranceRenewAttributesElasticityAssuranceRenewAttribute': (
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceInstancesRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceInstancesRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeElasticityAssuranceInstancesResponseBody'),
+    ),
+    'DescribeElasticityAssuranceInstancesResponseBody': (
+        ('ElasticityAssuranceItem', 'elasticity_assurance_item', MODEL, 'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItem': (
+        ('InstanceIdSet', 'instance_id_set', MODEL_LIST, 'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet'),
+    ),
+    'DescribeElasticityAssuranceInstancesResponseBodyElasticityAssuranceItemInstanceIdSet': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'DescribeElasticityAssurancesRequestPrivatePoolOptions'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PackageType', 'package_type', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeElasticityAssurancesRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesRequestPrivatePoolOptions': (
+        ('Ids', 'ids', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeElasticityAssurancesResponseBody'),
+    ),
+    'DescribeElasticityAssurancesResponseBody': (
+        ('ElasticityAssuranceSet', 'elasticity_assurance_set', MODEL, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSet': (
+        ('ElasticityAssuranceItem', 'elasticity_assurance_item', MODEL_LIST, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem'),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItem': (
+        ('AllocatedResources', 'allocated_resources', MODEL, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources'),
+        ('Description', 'description', SCALAR, None),
+        ('ElasticityAssuranceOwnerId', 'elasticity_assurance_owner_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('LatestStartTime', 'latest_start_time', SCALAR, None),
+        ('PackageType', 'package_type', SCALAR, None),
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('PrivatePoolOptionsMatchCriteria', 'private_pool_options_match_criteria', SCALAR, None),
+        ('PrivatePoolOptionsName', 'private_pool_options_name', SCALAR, None),
+        ('RecurrenceRules', 'recurrence_rules', MODEL, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('StartTimeType', 'start_time_type', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags'),
+        ('TotalAssuranceTimes', 'total_assurance_times', SCALAR, None),
+        ('UsedAssuranceTimes', 'used_assurance_times', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResources': (
+        ('AllocatedResource', 'allocated_resource', MODEL_LIST, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource'),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResource': (
+        ('AvailableAmount', 'available_amount', SCALAR, None),
+        ('ElasticityAssuranceUsages', 'elasticity_assurance_usages', MODEL, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('TotalAmount', 'total_amount', SCALAR, None),
+        ('UsedAmount', 'used_amount', SCALAR, None),
+        ('zoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsages': (
+        ('ElasticityAssuranceUsage', 'elasticity_assurance_usage', MODEL_LIST, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage'),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemAllocatedResourcesAllocatedResourceElasticityAssuranceUsagesElasticityAssuranceUsage': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('ServiceName', 'service_name', SCALAR, None),
+        ('UsedAmount', 'used_amount', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRules': (
+        ('RecurrenceRule', 'recurrence_rule', MODEL_LIST, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule'),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemRecurrenceRulesRecurrenceRule': (
+        ('EndHour', 'end_hour', SCALAR, None),
+        ('RecurrenceType', 'recurrence_type', SCALAR, None),
+        ('RecurrenceValue', 'recurrence_value', SCALAR, None),
+        ('StartHour', 'start_hour', SCALAR, None),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag'),
+    ),
+    'DescribeElasticityAssurancesResponseBodyElasticityAssuranceSetElasticityAssuranceItemTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeEniMonitorDataRequest': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('EniId', 'eni_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeEniMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeEniMonitorDataResponseBody'),
+    ),
+    'DescribeEniMonitorDataResponseBody': (
+        ('MonitorData', 'monitor_data', MODEL, 'DescribeEniMonitorDataResponseBodyMonitorData'),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeEniMonitorDataResponseBodyMonitorData': (
+        ('EniMonitorData', 'eni_monitor_data', MODEL_LIST, 'DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData'),
+    ),
+    'DescribeEniMonitorDataResponseBodyMonitorDataEniMonitorData': (
+        ('DropPacketRx', 'drop_packet_rx', SCALAR, None),
+        ('DropPacketTx', 'drop_packet_tx', SCALAR, None),
+        ('EniId', 'eni_id', SCALAR, None),
+        ('IntranetRx', 'intranet_rx', SCALAR, None),
+        ('IntranetTx', 'intranet_tx', SCALAR, None),
+        ('PacketRx', 'packet_rx', SCALAR, None),
+        ('PacketTx', 'packet_tx', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribeForwardTableEntriesRequest': (
+        ('ForwardEntryId', 'forward_entry_id', SCALAR, None),
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeForwardTableEntriesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeForwardTableEntriesResponseBody'),
+    ),
+    'DescribeForwardTableEntriesResponseBody': (
+        ('ForwardTableEntries', 'forward_table_entries', MODEL, 'DescribeForwardTableEntriesResponseBodyForwardTableEntries'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntries': (
+        ('ForwardTableEntry', 'forward_table_entry', MODEL_LIST, 'DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry'),
+    ),
+    'DescribeForwardTableEntriesResponseBodyForwardTableEntriesForwardTableEntry': (
+        ('ExternalIp', 'external_ip', SCALAR, None),
+        ('ExternalPort', 'external_port', SCALAR, None),
+        ('ForwardEntryId', 'forward_entry_id', SCALAR, None),
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+        ('InternalIp', 'internal_ip', SCALAR, None),
+        ('InternalPort', 'internal_port', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeHaVipsRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeHaVipsRequestFilter'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeHaVipsRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeHaVipsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeHaVipsResponseBody'),
+    ),
+    'DescribeHaVipsResponseBody': (
+        ('HaVips', 'ha_vips', MODEL, 'DescribeHaVipsResponseBodyHaVips'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeHaVipsResponseBodyHaVips': (
+        ('HaVip', 'ha_vip', MODEL_LIST, 'DescribeHaVipsResponseBodyHaVipsHaVip'),
+    ),
+    'DescribeHaVipsResponseBodyHaVipsHaVip': (
+        ('AssociatedEipAddresses', 'associated_eip_addresses', MODEL, 'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses'),
+        ('AssociatedInstances', 'associated_instances', MODEL, 'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances'),
+        ('CreateTime', 'create_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('MasterInstanceId', 'master_instance_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedEipAddresses': (
+        ('associatedEipAddresse', 'associated_eip_addresse', SCALAR, None),
+    ),
+    'DescribeHaVipsResponseBodyHaVipsHaVipAssociatedInstances': (
+        ('associatedInstance', 'associated_instance', SCALAR, None),
+    ),
+    'DescribeHpcClustersRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('HpcClusterIds', 'hpc_cluster_ids', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeHpcClustersResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeHpcClustersResponseBody'),
+    ),
+    'DescribeHpcClustersResponseBody': (
+        ('HpcClusters', 'hpc_clusters', MODEL, 'DescribeHpcClustersResponseBodyHpcClusters'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeHpcClustersResponseBodyHpcClusters': (
+        ('HpcCluster', 'hpc_cluster', MODEL_LIST, 'DescribeHpcClustersResponseBodyHpcClustersHpcCluster'),
+    ),
+    'DescribeHpcClustersResponseBodyHpcClustersHpcCluster': (
+        ('Description', 'description', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeImageComponentsRequest': (
+        ('ComponentType', 'component_type', SCALAR, None),
+        ('ComponentVersion', 'component_version', SCALAR, None),
+        ('ImageComponentId', 'image_component_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('Owner', 'owner', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SystemType', 'system_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImageComponentsRequestTag'),
+    ),
+    'DescribeImageComponentsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImageComponentsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImageComponentsResponseBody'),
+    ),
+    'DescribeImageComponentsResponseBody': (
+        ('ImageComponent', 'image_component', MODEL, 'DescribeImageComponentsResponseBodyImageComponent'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponent': (
+        ('ImageComponentSet', 'image_component_set', MODEL_LIST, 'DescribeImageComponentsResponseBodyImageComponentImageComponentSet'),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSet': (
+        ('ComponentType', 'component_type', SCALAR, None),
+        ('ComponentVersion', 'component_version', SCALAR, None),
+        ('Content', 'content', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ImageComponentId', 'image_component_id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('Owner', 'owner', SCALAR, None),
+        ('Parameters', 'parameters', MODEL, 'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters'),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SystemType', 'system_type', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags'),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParameters': (
+        ('Parameter', 'parameter', MODEL_LIST, 'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter'),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetParametersParameter': (
+        ('DefaultValue', 'default_value', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag'),
+    ),
+    'DescribeImageComponentsResponseBodyImageComponentImageComponentSetTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeImageFromFamilyRequest': (
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeImageFromFamilyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImageFromFamilyResponseBody'),
+    ),
+    'DescribeImageFromFamilyResponseBody': (
+        ('Image', 'image', MODEL, 'DescribeImageFromFamilyResponseBodyImage'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeImageFromFamilyResponseBodyImage': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskDeviceMappings', 'disk_device_mappings', MODEL, 'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings'),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('ImageVersion', 'image_version', SCALAR, None),
+        ('IsCopied', 'is_copied', SCALAR, None),
+        ('IsSelfShared', 'is_self_shared', SCALAR, None),
+        ('IsSubscribed', 'is_subscribed', SCALAR, None),
+        ('IsSupportCloudinit', 'is_support_cloudinit', SCALAR, None),
+        ('IsSupportIoOptimized', 'is_support_io_optimized', SCALAR, None),
+        ('OSName', 'osname', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('ProductCode', 'product_code', SCALAR, None),
+        ('Progress', 'progress', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeImageFromFamilyResponseBodyImageTags'),
+        ('Usage', 'usage', SCALAR, None),
+    ),
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappings': (
+        ('DiskDeviceMapping', 'disk_device_mapping', MODEL_LIST, 'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping'),
+    ),
+    'DescribeImageFromFamilyResponseBodyImageDiskDeviceMappingsDiskDeviceMapping': (
+        ('Device', 'device', SCALAR, None),
+        ('Format', 'format', SCALAR, None),
+        ('ImportOSSBucket', 'import_ossbucket', SCALAR, None),
+        ('ImportOSSObject', 'import_ossobject', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeImageFromFamilyResponseBodyImageTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImageFromFamilyResponseBodyImageTagsTag'),
+    ),
+    'DescribeImageFromFamilyResponseBodyImageTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeImagePipelineExecutionsRequest': (
+        ('ExecutionId', 'execution_id', SCALAR, None),
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagePipelineExecutionsRequestTag'),
+    ),
+    'DescribeImagePipelineExecutionsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagePipelineExecutionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImagePipelineExecutionsResponseBody'),
+    ),
+    'DescribeImagePipelineExecutionsResponseBody': (
+        ('ImagePipelineExecution', 'image_pipeline_execution', MODEL, 'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecution': (
+        ('ImagePipelineExecutionSet', 'image_pipeline_execution_set', MODEL_LIST, 'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet'),
+    ),
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSet': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('ExecutionId', 'execution_id', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('ModifiedTime', 'modified_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags'),
+    ),
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag'),
+    ),
+    'DescribeImagePipelineExecutionsResponseBodyImagePipelineExecutionImagePipelineExecutionSetTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeImagePipelinesRequest': (
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagePipelinesRequestTag'),
+    ),
+    'DescribeImagePipelinesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImagePipelinesResponseBody'),
+    ),
+    'DescribeImagePipelinesResponseBody': (
+        ('ImagePipeline', 'image_pipeline', MODEL, 'DescribeImagePipelinesResponseBodyImagePipeline'),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipeline': (
+        ('ImagePipelineSet', 'image_pipeline_set', MODEL_LIST, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSet': (
+        ('AddAccounts', 'add_accounts', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts'),
+        ('AdvancedOptions', 'advanced_options', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions'),
+        ('BaseImage', 'base_image', SCALAR, None),
+        ('BaseImageType', 'base_image_type', SCALAR, None),
+        ('BuildContent', 'build_content', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeleteInstanceOnFailure', 'delete_instance_on_failure', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions'),
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('ImportImageOptions', 'import_image_options', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions'),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+        ('RepairMode', 'repair_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SystemDiskSize', 'system_disk_size', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags'),
+        ('TestContent', 'test_content', SCALAR, None),
+        ('ToRegionIds', 'to_region_ids', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds'),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAddAccounts': (
+        ('AddAccount', 'add_account', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetAdvancedOptions': (
+        ('ImageNameSuffix', 'image_name_suffix', SCALAR, None),
+        ('RetainCloudAssistant', 'retain_cloud_assistant', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptions': (
+        ('Description', 'description', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageFeatures', 'image_features', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures'),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageTags', 'image_tags', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageFeatures': (
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTags': (
+        ('ImageTag', 'image_tag', MODEL_LIST, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImageOptionsImageTagsImageTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptions': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskDeviceMappings', 'disk_device_mappings', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings'),
+        ('Features', 'features', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures'),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImportImageTags', 'import_image_tags', MODEL, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags'),
+        ('LicenseType', 'license_type', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RetainImportedImage', 'retain_imported_image', SCALAR, None),
+        ('RetentionStrategy', 'retention_strategy', SCALAR, None),
+        ('RoleName', 'role_name', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappings': (
+        ('DiskDeviceMapping', 'disk_device_mapping', MODEL_LIST, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsDiskDeviceMappingsDiskDeviceMapping': (
+        ('DiskImageSize', 'disk_image_size', SCALAR, None),
+        ('Format', 'format', SCALAR, None),
+        ('OSSBucket', 'ossbucket', SCALAR, None),
+        ('OSSObject', 'ossobject', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsFeatures': (
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTags': (
+        ('ImportImageTag', 'import_image_tag', MODEL_LIST, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetImportImageOptionsImportImageTagsImportImageTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag'),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeImagePipelinesResponseBodyImagePipelineImagePipelineSetToRegionIds': (
+        ('ToRegionId', 'to_region_id', SCALAR, None),
+    ),
+    'DescribeImageSharePermissionRequest': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeImageSharePermissionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImageSharePermissionResponseBody'),
+    ),
+    'DescribeImageSharePermissionResponseBody': (
+        ('Accounts', 'accounts', MODEL, 'DescribeImageSharePermissionResponseBodyAccounts'),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ShareGroups', 'share_groups', MODEL, 'DescribeImageSharePermissionResponseBodyShareGroups'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeImageSharePermissionResponseBodyAccounts': (
+        ('Account', 'account', MODEL_LIST, 'DescribeImageSharePermissionResponseBodyAccountsAccount'),
+    ),
+    'DescribeImageSharePermissionResponseBodyAccountsAccount': (
+        ('AliyunId', 'aliyun_id', SCALAR, None),
+        ('SharedTime', 'shared_time', SCALAR, None),
+    ),
+    'DescribeImageSharePermissionResponseBodyShareGroups': (
+        ('ShareGroup', 'share_group', MODEL_LIST, 'DescribeImageSharePermissionResponseBodyShareGroupsShareGroup'),
+    ),
+    'DescribeImageSharePermissionResponseBodyShareGroupsShareGroup': (
+        ('Group', 'group', SCALAR, None),
+    ),
+    'DescribeImageSupportInstanceTypesRequest': (
+        ('ActionType', 'action_type', SCALAR, None),
+        ('Filter', 'filter', MODEL_LIST, 'DescribeImageSupportInstanceTypesRequestFilter'),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeImageSupportInstanceTypesRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImageSupportInstanceTypesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImageSupportInstanceTypesResponseBody'),
+    ),
+    'DescribeImageSupportInstanceTypesResponseBody': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceTypes', 'instance_types', MODEL, 'DescribeImageSupportInstanceTypesResponseBodyInstanceTypes'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypes': (
+        ('InstanceType', 'instance_type', MODEL_LIST, 'DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType'),
+    ),
+    'DescribeImageSupportInstanceTypesResponseBodyInstanceTypesInstanceType': (
+        ('CpuCoreCount', 'cpu_core_count', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypeId', 'instance_type_id', SCALAR, None),
+        ('MemorySize', 'memory_size', SCALAR, None),
+    ),
+    'DescribeImagesRequest': (
+        ('ActionType', 'action_type', SCALAR, None),
+        ('Architecture', 'architecture', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Filter', 'filter', MODEL_LIST, 'DescribeImagesRequestFilter'),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('ImageOwnerId', 'image_owner_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('IsPublic', 'is_public', SCALAR, None),
+        ('IsSupportCloudinit', 'is_support_cloudinit', SCALAR, None),
+        ('IsSupportIoOptimized', 'is_support_io_optimized', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ShowExpired', 'show_expired', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagesRequestTag'),
+        ('Usage', 'usage', SCALAR, None),
+    ),
+    'DescribeImagesRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeImagesResponseBody'),
+    ),
+    'DescribeImagesResponseBody': (
+        ('Images', 'images', MODEL, 'DescribeImagesResponseBodyImages'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImages': (
+        ('Image', 'image', MODEL_LIST, 'DescribeImagesResponseBodyImagesImage'),
+    ),
+    'DescribeImagesResponseBodyImagesImage': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DetectionOptions', 'detection_options', MODEL, 'DescribeImagesResponseBodyImagesImageDetectionOptions'),
+        ('DiskDeviceMappings', 'disk_device_mappings', MODEL, 'DescribeImagesResponseBodyImagesImageDiskDeviceMappings'),
+        ('Features', 'features', MODEL, 'DescribeImagesResponseBodyImagesImageFeatures'),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('ImageOwnerId', 'image_owner_id', SCALAR, None),
+        ('ImageVersion', 'image_version', SCALAR, None),
+        ('IsCopied', 'is_copied', SCALAR, None),
+        ('IsPublic', 'is_public', SCALAR, None),
+        ('IsSelfShared', 'is_self_shared', SCALAR, None),
+        ('IsSubscribed', 'is_subscribed', SCALAR, None),
+        ('IsSupportCloudinit', 'is_support_cloudinit', SCALAR, None),
+        ('IsSupportIoOptimized', 'is_support_io_optimized', SCALAR, None),
+        ('LicenseType', 'license_type', SCALAR, None),
+        ('LoginAsNonRootSupported', 'login_as_non_root_supported', SCALAR, None),
+        ('OSName', 'osname', SCALAR, None),
+        ('OSNameEn', 'osname_en', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('ProductCode', 'product_code', SCALAR, None),
+        ('Progress', 'progress', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('SupplierName', 'supplier_name', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeImagesResponseBodyImagesImageTags'),
+        ('Usage', 'usage', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImagesImageDetectionOptions': (
+        ('Items', 'items', MODEL, 'DescribeImagesResponseBodyImagesImageDetectionOptionsItems'),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItems': (
+        ('Item', 'item', MODEL_LIST, 'DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem'),
+    ),
+    'DescribeImagesResponseBodyImagesImageDetectionOptionsItemsItem': (
+        ('Name', 'name', SCALAR, None),
+        ('RiskCode', 'risk_code', SCALAR, None),
+        ('RiskLevel', 'risk_level', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappings': (
+        ('DiskDeviceMapping', 'disk_device_mapping', MODEL_LIST, 'DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping'),
+    ),
+    'DescribeImagesResponseBodyImagesImageDiskDeviceMappingsDiskDeviceMapping': (
+        ('Device', 'device', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('Format', 'format', SCALAR, None),
+        ('ImportOSSBucket', 'import_ossbucket', SCALAR, None),
+        ('ImportOSSObject', 'import_ossobject', SCALAR, None),
+        ('Progress', 'progress', SCALAR, None),
+        ('RemainTime', 'remain_time', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImagesImageFeatures': (
+        ('CpuOnlineDowngrade', 'cpu_online_downgrade', SCALAR, None),
+        ('CpuOnlineUpgrade', 'cpu_online_upgrade', SCALAR, None),
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+        ('MemoryOnlineDowngrade', 'memory_online_downgrade', SCALAR, None),
+        ('MemoryOnlineUpgrade', 'memory_online_upgrade', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'DescribeImagesResponseBodyImagesImageTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeImagesResponseBodyImagesImageTagsTag'),
+    ),
+    'DescribeImagesResponseBodyImagesImageTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeInstanceAttachmentAttributesRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceAttachmentAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceAttachmentAttributesResponseBody'),
+    ),
+    'DescribeInstanceAttachmentAttributesResponseBody': (
+        ('Instances', 'instances', MODEL, 'DescribeInstanceAttachmentAttributesResponseBodyInstances'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceAttachmentAttributesResponseBodyInstances': (
+        ('Instance', 'instance', MODEL_LIST, 'DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance'),
+    ),
+    'DescribeInstanceAttachmentAttributesResponseBodyInstancesInstance': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+        ('PrivatePoolOptionsMatchCriteria', 'private_pool_options_match_criteria', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceAttributeResponseBody'),
+    ),
+    'DescribeInstanceAttributeResponseBody': (
+        ('ClusterId', 'cluster_id', SCALAR, None),
+        ('Cpu', 'cpu', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DedicatedHostAttribute', 'dedicated_host_attribute', MODEL, 'DescribeInstanceAttributeResponseBodyDedicatedHostAttribute'),
+        ('Description', 'description', SCALAR, None),
+        ('EipAddress', 'eip_address', MODEL, 'DescribeInstanceAttributeResponseBodyEipAddress'),
+        ('EnableJumboFrame', 'enable_jumbo_frame', SCALAR, None),
+        ('EnableNetworkEncryption', 'enable_network_encryption', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InnerIpAddress', 'inner_ip_address', MODEL, 'DescribeInstanceAttributeResponseBodyInnerIpAddress'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceNetworkType', 'instance_network_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('NetworkOptions', 'network_options', MODEL, 'DescribeInstanceAttributeResponseBodyNetworkOptions'),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeInstanceAttributeResponseBodyOperationLocks'),
+        ('PublicIpAddress', 'public_ip_address', MODEL, 'DescribeInstanceAttributeResponseBodyPublicIpAddress'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeInstanceAttributeResponseBodySecurityGroupIds'),
+        ('SerialNumber', 'serial_number', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StoppedMode', 'stopped_mode', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+        ('VpcAttributes', 'vpc_attributes', MODEL, 'DescribeInstanceAttributeResponseBodyVpcAttributes'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyDedicatedHostAttribute': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyEipAddress': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyInnerIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyNetworkOptions': (
+        ('BandwidthWeighting', 'bandwidth_weighting', SCALAR, None),
+        ('EnableJumboFrame', 'enable_jumbo_frame', SCALAR, None),
+        ('EnableNetworkEncryption', 'enable_network_encryption', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyOperationLocks': (
+        ('LockReason', 'lock_reason', MODEL_LIST, 'DescribeInstanceAttributeResponseBodyOperationLocksLockReason'),
+    ),
+    'DescribeInstanceAttributeResponseBodyOperationLocksLockReason': (
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyPublicIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodySecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyVpcAttributes': (
+        ('NatIpAddress', 'nat_ip_address', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', MODEL, 'DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress'),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeInstanceAttributeResponseBodyVpcAttributesPrivateIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstanceAutoRenewAttributeRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceAutoRenewAttributeResponseBody'),
+    ),
+    'DescribeInstanceAutoRenewAttributeResponseBody': (
+        ('InstanceRenewAttributes', 'instance_renew_attributes', MODEL, 'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributes': (
+        ('InstanceRenewAttribute', 'instance_renew_attribute', MODEL_LIST, 'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute'),
+    ),
+    'DescribeInstanceAutoRenewAttributeResponseBodyInstanceRenewAttributesInstanceRenewAttribute': (
+        ('AutoRenewEnabled', 'auto_renew_enabled', SCALAR, None),
+        ('Duration', 'duration', SCALAR, None),
+        ('EnableExpectedRenewDay', 'enable_expected_renew_day', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsRequest': (
+        ('EventPublishTime', 'event_publish_time', MODEL, 'DescribeInstanceHistoryEventsRequestEventPublishTime'),
+        ('NotBefore', 'not_before', MODEL, 'DescribeInstanceHistoryEventsRequestNotBefore'),
+        ('EventCycleStatus', 'event_cycle_status', SCALAR, None),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventType', 'event_type', SCALAR, None),
+        ('ImpactLevel', 'impact_level', SCALAR, None),
+        ('InstanceEventCycleStatus', 'instance_event_cycle_status', SCALAR, None),
+        ('InstanceEventType', 'instance_event_type', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInstanceHistoryEventsRequestTag'),
+    ),
+    'DescribeInstanceHistoryEventsRequestEventPublishTime': (
+        ('End', 'end', SCALAR, None),
+        ('Start', 'start', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsRequestNotBefore': (
+        ('End', 'end', SCALAR, None),
+        ('Start', 'start', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceHistoryEventsResponseBody'),
+    ),
+    'DescribeInstanceHistoryEventsResponseBody': (
+        ('InstanceSystemEventSet', 'instance_system_event_set', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSet': (
+        ('InstanceSystemEventType', 'instance_system_event_type', MODEL_LIST, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType'),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventType': (
+        ('EventCycleStatus', 'event_cycle_status', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus'),
+        ('EventFinishTime', 'event_finish_time', SCALAR, None),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventPublishTime', 'event_publish_time', SCALAR, None),
+        ('EventType', 'event_type', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType'),
+        ('ExtendedAttribute', 'extended_attribute', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute'),
+        ('ImpactLevel', 'impact_level', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NotBefore', 'not_before', SCALAR, None),
+        ('Reason', 'reason', SCALAR, None),
+        ('ReasonCode', 'reason_code', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventCycleStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeEventType': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttribute': (
+        ('CanAccept', 'can_accept', SCALAR, None),
+        ('Code', 'code', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('HostId', 'host_id', SCALAR, None),
+        ('HostType', 'host_type', SCALAR, None),
+        ('InactiveDisks', 'inactive_disks', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks'),
+        ('MetricName', 'metric_name', SCALAR, None),
+        ('MetricValue', 'metric_value', SCALAR, None),
+        ('MigrationOptions', 'migration_options', MODEL, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions'),
+        ('OnlineRepairPolicy', 'online_repair_policy', SCALAR, None),
+        ('PunishDomain', 'punish_domain', SCALAR, None),
+        ('PunishType', 'punish_type', SCALAR, None),
+        ('PunishUrl', 'punish_url', SCALAR, None),
+        ('Rack', 'rack', SCALAR, None),
+        ('ResponseResult', 'response_result', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisks': (
+        ('InactiveDisk', 'inactive_disk', MODEL_LIST, 'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk'),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeviceCategory', 'device_category', SCALAR, None),
+        ('DeviceSize', 'device_size', SCALAR, None),
+        ('DeviceType', 'device_type', SCALAR, None),
+        ('ReleaseTime', 'release_time', SCALAR, None),
+    ),
+    'DescribeInstanceHistoryEventsResponseBodyInstanceSystemEventSetInstanceSystemEventTypeExtendedAttributeMigrationOptions': (
+        ('MigrationOption', 'migration_option', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceMaintenanceAttributesResponseBody'),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBody': (
+        ('MaintenanceAttributes', 'maintenance_attributes', MODEL, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributes': (
+        ('MaintenanceAttribute', 'maintenance_attribute', MODEL_LIST, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute'),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttribute': (
+        ('ActionOnMaintenance', 'action_on_maintenance', MODEL, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaintenanceWindows', 'maintenance_windows', MODEL, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows'),
+        ('NotifyOnMaintenance', 'notify_on_maintenance', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenance': (
+        ('DefaultValue', 'default_value', SCALAR, None),
+        ('SupportedValues', 'supported_values', MODEL, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues'),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeActionOnMaintenanceSupportedValues': (
+        ('SupportedValue', 'supported_value', SCALAR, None),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindows': (
+        ('MaintenanceWindow', 'maintenance_window', MODEL_LIST, 'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow'),
+    ),
+    'DescribeInstanceMaintenanceAttributesResponseBodyMaintenanceAttributesMaintenanceAttributeMaintenanceWindowsMaintenanceWindow': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'DescribeInstanceModificationPriceRequestSystemDisk'),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'DescribeInstanceModificationPriceRequestDataDisk'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceRequestDataDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceRequestSystemDisk': (
+        ('Category', 'category', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceModificationPriceResponseBody'),
+    ),
+    'DescribeInstanceModificationPriceResponseBody': (
+        ('PriceInfo', 'price_info', MODEL, 'DescribeInstanceModificationPriceResponseBodyPriceInfo'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfo': (
+        ('Price', 'price', MODEL, 'DescribeInstanceModificationPriceResponseBodyPriceInfoPrice'),
+        ('Rules', 'rules', MODEL, 'DescribeInstanceModificationPriceResponseBodyPriceInfoRules'),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPrice': (
+        ('Currency', 'currency', SCALAR, None),
+        ('DetailInfos', 'detail_infos', MODEL, 'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos'),
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfos': (
+        ('DetailInfo', 'detail_info', MODEL_LIST, 'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo'),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': (
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('Resource', 'resource', SCALAR, None),
+        ('SubRules', 'sub_rules', MODEL, 'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules'),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule'),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule'),
+    ),
+    'DescribeInstanceModificationPriceResponseBodyPriceInfoRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeInstanceMonitorDataRequest': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeInstanceMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceMonitorDataResponseBody'),
+    ),
+    'DescribeInstanceMonitorDataResponseBody': (
+        ('MonitorData', 'monitor_data', MODEL, 'DescribeInstanceMonitorDataResponseBodyMonitorData'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeInstanceMonitorDataResponseBodyMonitorData': (
+        ('InstanceMonitorData', 'instance_monitor_data', MODEL_LIST, 'DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData'),
+    ),
+    'DescribeInstanceMonitorDataResponseBodyMonitorDataInstanceMonitorData': (
+        ('BPSRead', 'bpsread', SCALAR, None),
+        ('BPSWrite', 'bpswrite', SCALAR, None),
+        ('CPU', 'cpu', SCALAR, None),
+        ('CPUAdvanceCreditBalance', 'cpuadvance_credit_balance', SCALAR, None),
+        ('CPUCreditBalance', 'cpucredit_balance', SCALAR, None),
+        ('CPUCreditUsage', 'cpucredit_usage', SCALAR, None),
+        ('CPUNotpaidSurplusCreditUsage', 'cpunotpaid_surplus_credit_usage', SCALAR, None),
+        ('IOPSRead', 'iopsread', SCALAR, None),
+        ('IOPSWrite', 'iopswrite', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InternetBandwidth', 'internet_bandwidth', SCALAR, None),
+        ('InternetRX', 'internet_rx', SCALAR, None),
+        ('InternetTX', 'internet_tx', SCALAR, None),
+        ('IntranetBandwidth', 'intranet_bandwidth', SCALAR, None),
+        ('IntranetRX', 'intranet_rx', SCALAR, None),
+        ('IntranetTX', 'intranet_tx', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribeInstanceRamRoleRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceRamRoleResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceRamRoleResponseBody'),
+    ),
+    'DescribeInstanceRamRoleResponseBody': (
+        ('InstanceRamRoleSets', 'instance_ram_role_sets', MODEL, 'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSets': (
+        ('InstanceRamRoleSet', 'instance_ram_role_set', MODEL_LIST, 'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet'),
+    ),
+    'DescribeInstanceRamRoleResponseBodyInstanceRamRoleSetsInstanceRamRoleSet': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+    ),
+    'DescribeInstanceStatusRequest': (
+        ('ClusterId', 'cluster_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeInstanceStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceStatusResponseBody'),
+    ),
+    'DescribeInstanceStatusResponseBody': (
+        ('InstanceStatuses', 'instance_statuses', MODEL, 'DescribeInstanceStatusResponseBodyInstanceStatuses'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstanceStatusResponseBodyInstanceStatuses': (
+        ('InstanceStatus', 'instance_status', MODEL_LIST, 'DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus'),
+    ),
+    'DescribeInstanceStatusResponseBodyInstanceStatusesInstanceStatus': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeInstanceTopologyRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceTopologyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceTopologyResponseBody'),
+    ),
+    'DescribeInstanceTopologyResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Topologys', 'topologys', MODEL, 'DescribeInstanceTopologyResponseBodyTopologys'),
+    ),
+    'DescribeInstanceTopologyResponseBodyTopologys': (
+        ('Topology', 'topology', MODEL_LIST, 'DescribeInstanceTopologyResponseBodyTopologysTopology'),
+    ),
+    'DescribeInstanceTopologyResponseBodyTopologysTopology': (
+        ('HostId', 'host_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypeFamiliesRequest': (
+        ('Generation', 'generation', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypeFamiliesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceTypeFamiliesResponseBody'),
+    ),
+    'DescribeInstanceTypeFamiliesResponseBody': (
+        ('InstanceTypeFamilies', 'instance_type_families', MODEL, 'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamilies': (
+        ('InstanceTypeFamily', 'instance_type_family', MODEL_LIST, 'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily'),
+    ),
+    'DescribeInstanceTypeFamiliesResponseBodyInstanceTypeFamiliesInstanceTypeFamily': (
+        ('Generation', 'generation', SCALAR, None),
+        ('InstanceTypeFamilyId', 'instance_type_family_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypesRequest': (
+        ('AdditionalAttributes', 'additional_attributes', SCALAR, None),
+        ('CpuArchitecture', 'cpu_architecture', SCALAR, None),
+        ('CpuArchitectures', 'cpu_architectures', SCALAR, None),
+        ('GPUSpec', 'gpuspec', SCALAR, None),
+        ('GpuSpecs', 'gpu_specs', SCALAR, None),
+        ('InstanceCategories', 'instance_categories', SCALAR, None),
+        ('InstanceCategory', 'instance_category', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstanceTypeFamilies', 'instance_type_families', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypes', 'instance_types', SCALAR, None),
+        ('LocalStorageCategories', 'local_storage_categories', SCALAR, None),
+        ('LocalStorageCategory', 'local_storage_category', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('MaximumCpuCoreCount', 'maximum_cpu_core_count', SCALAR, None),
+        ('MaximumCpuSpeedFrequency', 'maximum_cpu_speed_frequency', SCALAR, None),
+        ('MaximumCpuTurboFrequency', 'maximum_cpu_turbo_frequency', SCALAR, None),
+        ('MaximumGPUAmount', 'maximum_gpuamount', SCALAR, None),
+        ('MaximumMemorySize', 'maximum_memory_size', SCALAR, None),
+        ('MinimumBaselineCredit', 'minimum_baseline_credit', SCALAR, None),
+        ('MinimumCpuCoreCount', 'minimum_cpu_core_count', SCALAR, None),
+        ('MinimumCpuSpeedFrequency', 'minimum_cpu_speed_frequency', SCALAR, None),
+        ('MinimumCpuTurboFrequency', 'minimum_cpu_turbo_frequency', SCALAR, None),
+        ('MinimumDiskQuantity', 'minimum_disk_quantity', SCALAR, None),
+        ('MinimumEniIpv6AddressQuantity', 'minimum_eni_ipv_6address_quantity', SCALAR, None),
+        ('MinimumEniPrivateIpAddressQuantity', 'minimum_eni_private_ip_address_quantity', SCALAR, None),
+        ('MinimumEniQuantity', 'minimum_eni_quantity', SCALAR, None),
+        ('MinimumEriQuantity', 'minimum_eri_quantity', SCALAR, None),
+        ('MinimumGPUAmount', 'minimum_gpuamount', SCALAR, None),
+        ('MinimumInitialCredit', 'minimum_initial_credit', SCALAR, None),
+        ('MinimumInstanceBandwidthRx', 'minimum_instance_bandwidth_rx', SCALAR, None),
+        ('MinimumInstanceBandwidthTx', 'minimum_instance_bandwidth_tx', SCALAR, None),
+        ('MinimumInstancePpsRx', 'minimum_instance_pps_rx', SCALAR, None),
+        ('MinimumInstancePpsTx', 'minimum_instance_pps_tx', SCALAR, None),
+        ('MinimumLocalStorageAmount', 'minimum_local_storage_amount', SCALAR, None),
+        ('MinimumLocalStorageCapacity', 'minimum_local_storage_capacity', SCALAR, None),
+        ('MinimumMemorySize', 'minimum_memory_size', SCALAR, None),
+        ('MinimumPrimaryEniQueueNumber', 'minimum_primary_eni_queue_number', SCALAR, None),
+        ('MinimumQueuePairNumber', 'minimum_queue_pair_number', SCALAR, None),
+        ('MinimumSecondaryEniQueueNumber', 'minimum_secondary_eni_queue_number', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PhysicalProcessorModel', 'physical_processor_model', SCALAR, None),
+        ('PhysicalProcessorModels', 'physical_processor_models', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceTypesResponseBody'),
+    ),
+    'DescribeInstanceTypesResponseBody': (
+        ('InstanceTypes', 'instance_types', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypes'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypes': (
+        ('InstanceType', 'instance_type', MODEL_LIST, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceType'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceType': (
+        ('Attributes', 'attributes', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes'),
+        ('BaselineCredit', 'baseline_credit', SCALAR, None),
+        ('Clock', 'clock', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock'),
+        ('CpuArchitecture', 'cpu_architecture', SCALAR, None),
+        ('CpuCoreCount', 'cpu_core_count', SCALAR, None),
+        ('CpuOptions', 'cpu_options', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions'),
+        ('CpuSpeedFrequency', 'cpu_speed_frequency', SCALAR, None),
+        ('CpuTurboFrequency', 'cpu_turbo_frequency', SCALAR, None),
+        ('DiskQuantity', 'disk_quantity', SCALAR, None),
+        ('EnhancedNetwork', 'enhanced_network', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork'),
+        ('EniIpv6AddressQuantity', 'eni_ipv_6address_quantity', SCALAR, None),
+        ('EniPrivateIpAddressQuantity', 'eni_private_ip_address_quantity', SCALAR, None),
+        ('EniQuantity', 'eni_quantity', SCALAR, None),
+        ('EniTotalQuantity', 'eni_total_quantity', SCALAR, None),
+        ('EniTrunkSupported', 'eni_trunk_supported', SCALAR, None),
+        ('EriQuantity', 'eri_quantity', SCALAR, None),
+        ('GPUAmount', 'gpuamount', SCALAR, None),
+        ('GPUMemorySize', 'gpumemory_size', SCALAR, None),
+        ('GPUSpec', 'gpuspec', SCALAR, None),
+        ('InitialCredit', 'initial_credit', SCALAR, None),
+        ('InstanceBandwidthRx', 'instance_bandwidth_rx', SCALAR, None),
+        ('InstanceBandwidthTx', 'instance_bandwidth_tx', SCALAR, None),
+        ('InstanceCategory', 'instance_category', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstancePpsRx', 'instance_pps_rx', SCALAR, None),
+        ('InstancePpsTx', 'instance_pps_tx', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypeId', 'instance_type_id', SCALAR, None),
+        ('JumboFrameSupport', 'jumbo_frame_support', SCALAR, None),
+        ('LocalStorageAmount', 'local_storage_amount', SCALAR, None),
+        ('LocalStorageCapacity', 'local_storage_capacity', SCALAR, None),
+        ('LocalStorageCategory', 'local_storage_category', SCALAR, None),
+        ('MaximumQueueNumberPerEni', 'maximum_queue_number_per_eni', SCALAR, None),
+        ('MemorySize', 'memory_size', SCALAR, None),
+        ('NetworkCardQuantity', 'network_card_quantity', SCALAR, None),
+        ('NetworkCards', 'network_cards', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards'),
+        ('NetworkEncryptionSupport', 'network_encryption_support', SCALAR, None),
+        ('NetworkInfo', 'network_info', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo'),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+        ('PhysicalProcessorModel', 'physical_processor_model', SCALAR, None),
+        ('PrimaryEniQueueNumber', 'primary_eni_queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('SecondaryEniQueueNumber', 'secondary_eni_queue_number', SCALAR, None),
+        ('SupportedBootModes', 'supported_boot_modes', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes'),
+        ('TotalEniQueueQuantity', 'total_eni_queue_quantity', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributes': (
+        ('Attribute', 'attribute', MODEL_LIST, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeAttributesAttribute': (
+        ('Name', 'name', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeClock': (
+        ('PtpSupport', 'ptp_support', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptions': (
+        ('Core', 'core', SCALAR, None),
+        ('CoreFactor', 'core_factor', SCALAR, None),
+        ('HyperThreadingAdjustable', 'hyper_threading_adjustable', SCALAR, None),
+        ('SupportedTopologyTypes', 'supported_topology_types', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes'),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeCpuOptionsSupportedTopologyTypes': (
+        ('SupportedTopologyType', 'supported_topology_type', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeEnhancedNetwork': (
+        ('RssSupport', 'rss_support', SCALAR, None),
+        ('SriovSupport', 'sriov_support', SCALAR, None),
+        ('VfQueueNumberPerEni', 'vf_queue_number_per_eni', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCards': (
+        ('NetworkCardInfo', 'network_card_info', MODEL_LIST, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkCardsNetworkCardInfo': (
+        ('NetworkCardIndex', 'network_card_index', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfo': (
+        ('BandwidthWeighting', 'bandwidth_weighting', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeighting': (
+        ('WeightingInfos', 'weighting_infos', MODEL, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfos': (
+        ('WeightingInfo', 'weighting_info', MODEL_LIST, 'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo'),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeNetworkInfoBandwidthWeightingWeightingInfosWeightingInfo': (
+        ('EbsBandwidth', 'ebs_bandwidth', SCALAR, None),
+        ('EbsBurstBandwidth', 'ebs_burst_bandwidth', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('VpcBandwidth', 'vpc_bandwidth', SCALAR, None),
+        ('VpcBurstBandwidth', 'vpc_burst_bandwidth', SCALAR, None),
+    ),
+    'DescribeInstanceTypesResponseBodyInstanceTypesInstanceTypeSupportedBootModes': (
+        ('SupportedBootMode', 'supported_boot_mode', SCALAR, None),
+    ),
+    'DescribeInstanceVncUrlRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeInstanceVncUrlResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstanceVncUrlResponseBody'),
+    ),
+    'DescribeInstanceVncUrlResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('VncUrl', 'vnc_url', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusRequest': (
+        ('EventPublishTime', 'event_publish_time', MODEL, 'DescribeInstancesFullStatusRequestEventPublishTime'),
+        ('NotBefore', 'not_before', MODEL, 'DescribeInstancesFullStatusRequestNotBefore'),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventType', 'event_type', SCALAR, None),
+        ('HealthStatus', 'health_status', SCALAR, None),
+        ('InstanceEventType', 'instance_event_type', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusRequestEventPublishTime': (
+        ('End', 'end', SCALAR, None),
+        ('Start', 'start', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusRequestNotBefore': (
+        ('End', 'end', SCALAR, None),
+        ('Start', 'start', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstancesFullStatusResponseBody'),
+    ),
+    'DescribeInstancesFullStatusResponseBody': (
+        ('InstanceFullStatusSet', 'instance_full_status_set', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSet': (
+        ('InstanceFullStatusType', 'instance_full_status_type', MODEL_LIST, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType'),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusType': (
+        ('HealthStatus', 'health_status', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('ScheduledSystemEventSet', 'scheduled_system_event_set', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet'),
+        ('Status', 'status', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus'),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeHealthStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSet': (
+        ('ScheduledSystemEventType', 'scheduled_system_event_type', MODEL_LIST, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType'),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventType': (
+        ('EventCycleStatus', 'event_cycle_status', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus'),
+        ('EventId', 'event_id', SCALAR, None),
+        ('EventPublishTime', 'event_publish_time', SCALAR, None),
+        ('EventType', 'event_type', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType'),
+        ('ExtendedAttribute', 'extended_attribute', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute'),
+        ('ImpactLevel', 'impact_level', SCALAR, None),
+        ('NotBefore', 'not_before', SCALAR, None),
+        ('Reason', 'reason', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventCycleStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeEventType': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttribute': (
+        ('Device', 'device', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('InactiveDisks', 'inactive_disks', MODEL, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks'),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisks': (
+        ('InactiveDisk', 'inactive_disk', MODEL_LIST, 'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk'),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeScheduledSystemEventSetScheduledSystemEventTypeExtendedAttributeInactiveDisksInactiveDisk': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeviceCategory', 'device_category', SCALAR, None),
+        ('DeviceSize', 'device_size', SCALAR, None),
+        ('DeviceType', 'device_type', SCALAR, None),
+        ('ReleaseTime', 'release_time', SCALAR, None),
+    ),
+    'DescribeInstancesFullStatusResponseBodyInstanceFullStatusSetInstanceFullStatusTypeStatus': (
+        ('Code', 'code', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'DescribeInstancesRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeInstancesRequestFilter'),
+        ('AdditionalAttributes', 'additional_attributes', SCALAR, None),
+        ('DeviceAvailable', 'device_available', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('EipAddresses', 'eip_addresses', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InnerIpAddresses', 'inner_ip_addresses', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceNetworkType', 'instance_network_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NeedSaleCycle', 'need_sale_cycle', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('PrivateIpAddresses', 'private_ip_addresses', SCALAR, None),
+        ('PublicIpAddresses', 'public_ip_addresses', SCALAR, None),
+        ('RdmaIpAddresses', 'rdma_ip_addresses', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInstancesRequestTag'),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeInstancesRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInstancesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInstancesResponseBody'),
+    ),
+    'DescribeInstancesResponseBody': (
+        ('Instances', 'instances', MODEL, 'DescribeInstancesResponseBodyInstances'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstances': (
+        ('Instance', 'instance', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstance'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstance': (
+        ('AdditionalInfo', 'additional_info', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('ClockOptions', 'clock_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceClockOptions'),
+        ('ClusterId', 'cluster_id', SCALAR, None),
+        ('Cpu', 'cpu', SCALAR, None),
+        ('CpuOptions', 'cpu_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceCpuOptions'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DedicatedHostAttribute', 'dedicated_host_attribute', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute'),
+        ('DedicatedInstanceAttribute', 'dedicated_instance_attribute', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute'),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetGroupNo', 'deployment_set_group_no', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DeviceAvailable', 'device_available', SCALAR, None),
+        ('EcsCapacityReservationAttr', 'ecs_capacity_reservation_attr', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr'),
+        ('EipAddress', 'eip_address', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceEipAddress'),
+        ('EnableNVS', 'enable_nvs', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('GPUAmount', 'gpuamount', SCALAR, None),
+        ('GPUSpec', 'gpuspec', SCALAR, None),
+        ('HibernationOptions', 'hibernation_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceHibernationOptions'),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('ISP', 'isp', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceImageOptions'),
+        ('InnerIpAddress', 'inner_ip_address', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceNetworkType', 'instance_network_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('LocalStorageAmount', 'local_storage_amount', SCALAR, None),
+        ('LocalStorageCapacity', 'local_storage_capacity', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('MetadataOptions', 'metadata_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceMetadataOptions'),
+        ('NetworkInterfaces', 'network_interfaces', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces'),
+        ('OSName', 'osname', SCALAR, None),
+        ('OSNameEn', 'osname_en', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceOperationLocks'),
+        ('PrivateDnsNameOptions', 'private_dns_name_options', MODEL, 'DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions'),
+        ('PublicIpAddress', 'public_ip_address', MODEL, 'DescribeInstancesResponseBodyInstancesInstancePublicIpAddress'),
+        ('RdmaIpAddress', 'rdma_ip_address', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress'),
+        ('Recyclable', 'recyclable', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SaleCycle', 'sale_cycle', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds'),
+        ('SerialNumber', 'serial_number', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotInterruptionBehavior', 'spot_interruption_behavior', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StoppedMode', 'stopped_mode', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceTags'),
+        ('VlanId', 'vlan_id', SCALAR, None),
+        ('VpcAttributes', 'vpc_attributes', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceVpcAttributes'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceAdditionalInfo': (
+        ('EnableHighDensityMode', 'enable_high_density_mode', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceClockOptions': (
+        ('PtpStatus', 'ptp_status', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceCpuOptions': (
+        ('CoreCount', 'core_count', SCALAR, None),
+        ('EnableVISST', 'enable_visst', SCALAR, None),
+        ('EnableVRDT', 'enable_vrdt', SCALAR, None),
+        ('Numa', 'numa', SCALAR, None),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+        ('TopologyType', 'topology_type', SCALAR, None),
+        ('TurboMode', 'turbo_mode', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedHostAttribute': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceDedicatedInstanceAttribute': (
+        ('Affinity', 'affinity', SCALAR, None),
+        ('Tenancy', 'tenancy', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceEcsCapacityReservationAttr': (
+        ('CapacityReservationId', 'capacity_reservation_id', SCALAR, None),
+        ('CapacityReservationPreference', 'capacity_reservation_preference', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceEipAddress': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('IpAddress', 'ip_address', SCALAR, None),
+        ('IsSupportUnassociate', 'is_support_unassociate', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceHibernationOptions': (
+        ('Configured', 'configured', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceImageOptions': (
+        ('CurrentOSNVMeSupported', 'current_osnvme_supported', SCALAR, None),
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceInnerIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceMetadataOptions': (
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfaces': (
+        ('NetworkInterface', 'network_interface', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterface': (
+        ('Ipv4PrefixSets', 'ipv_4prefix_sets', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets'),
+        ('Ipv6PrefixSets', 'ipv_6prefix_sets', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets'),
+        ('Ipv6Sets', 'ipv_6sets', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets'),
+        ('MacAddress', 'mac_address', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('PrivateIpSets', 'private_ip_sets', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets'),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSets': (
+        ('Ipv4PrefixSet', 'ipv_4prefix_set', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv4PrefixSetsIpv4PrefixSet': (
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSets': (
+        ('Ipv6PrefixSet', 'ipv_6prefix_set', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6PrefixSetsIpv6PrefixSet': (
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6Sets': (
+        ('Ipv6Set', 'ipv_6set', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfaceIpv6SetsIpv6Set': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSets': (
+        ('PrivateIpSet', 'private_ip_set', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceNetworkInterfacesNetworkInterfacePrivateIpSetsPrivateIpSet': (
+        ('Primary', 'primary', SCALAR, None),
+        ('PrivateDnsName', 'private_dns_name', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocks': (
+        ('LockReason', 'lock_reason', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceOperationLocksLockReason': (
+        ('LockMsg', 'lock_msg', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstancePrivateDnsNameOptions': (
+        ('EnableInstanceIdDnsAAAARecord', 'enable_instance_id_dns_aaaarecord', SCALAR, None),
+        ('EnableInstanceIdDnsARecord', 'enable_instance_id_dns_arecord', SCALAR, None),
+        ('EnableIpDnsARecord', 'enable_ip_dns_arecord', SCALAR, None),
+        ('EnableIpDnsPtrRecord', 'enable_ip_dns_ptr_record', SCALAR, None),
+        ('HostnameType', 'hostname_type', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstancePublicIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceRdmaIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceSecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInstancesResponseBodyInstancesInstanceTagsTag'),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributes': (
+        ('NatIpAddress', 'nat_ip_address', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', MODEL, 'DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress'),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeInstancesResponseBodyInstancesInstanceVpcAttributesPrivateIpAddress': (
+        ('IpAddress', 'ip_address', SCALAR, None),
+    ),
+    'DescribeInvocationResultsRequest': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('IncludeHistory', 'include_history', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('InvokeRecordStatus', 'invoke_record_status', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInvocationResultsRequestTag'),
+    ),
+    'DescribeInvocationResultsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInvocationResultsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInvocationResultsResponseBody'),
+    ),
+    'DescribeInvocationResultsResponseBody': (
+        ('Invocation', 'invocation', MODEL, 'DescribeInvocationResultsResponseBodyInvocation'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeInvocationResultsResponseBodyInvocation': (
+        ('InvocationResults', 'invocation_results', MODEL, 'DescribeInvocationResultsResponseBodyInvocationInvocationResults'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResults': (
+        ('InvocationResult', 'invocation_result', MODEL_LIST, 'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult'),
+    ),
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResult': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('Dropped', 'dropped', SCALAR, None),
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorInfo', 'error_info', SCALAR, None),
+        ('ExitCode', 'exit_code', SCALAR, None),
+        ('FinishedTime', 'finished_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('InvokeRecordStatus', 'invoke_record_status', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('OssOutputStatus', 'oss_output_status', SCALAR, None),
+        ('OssOutputUri', 'oss_output_uri', SCALAR, None),
+        ('Output', 'output', SCALAR, None),
+        ('Repeats', 'repeats', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('StopTime', 'stop_time', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+    ),
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag'),
+    ),
+    'DescribeInvocationResultsResponseBodyInvocationInvocationResultsInvocationResultTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeInvocationsRequest': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('CommandName', 'command_name', SCALAR, None),
+        ('CommandType', 'command_type', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('IncludeOutput', 'include_output', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('InvokeStatus', 'invoke_status', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInvocationsRequestTag'),
+        ('Timed', 'timed', SCALAR, None),
+    ),
+    'DescribeInvocationsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeInvocationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeInvocationsResponseBody'),
+    ),
+    'DescribeInvocationsResponseBody': (
+        ('Invocations', 'invocations', MODEL, 'DescribeInvocationsResponseBodyInvocations'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeInvocationsResponseBodyInvocations': (
+        ('Invocation', 'invocation', MODEL_LIST, 'DescribeInvocationsResponseBodyInvocationsInvocation'),
+    ),
+    'DescribeInvocationsResponseBodyInvocationsInvocation': (
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('CommandDescription', 'command_description', SCALAR, None),
+        ('CommandId', 'command_id', SCALAR, None),
+        ('CommandName', 'command_name', SCALAR, None),
+        ('CommandType', 'command_type', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('InvokeInstances', 'invoke_instances', MODEL, 'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances'),
+        ('InvokeStatus', 'invoke_status', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('Parameters', 'parameters', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeInvocationsResponseBodyInvocationsInvocationTags'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstances': (
+        ('InvokeInstance', 'invoke_instance', MODEL_LIST, 'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance'),
+    ),
+    'DescribeInvocationsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Dropped', 'dropped', SCALAR, None),
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorInfo', 'error_info', SCALAR, None),
+        ('ExitCode', 'exit_code', SCALAR, None),
+        ('FinishTime', 'finish_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceInvokeStatus', 'instance_invoke_status', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('OssOutputStatus', 'oss_output_status', SCALAR, None),
+        ('OssOutputUri', 'oss_output_uri', SCALAR, None),
+        ('Output', 'output', SCALAR, None),
+        ('Repeats', 'repeats', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('StopTime', 'stop_time', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('UpdateTime', 'update_time', SCALAR, None),
+    ),
+    'DescribeInvocationsResponseBodyInvocationsInvocationTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeInvocationsResponseBodyInvocationsInvocationTagsTag'),
+    ),
+    'DescribeInvocationsResponseBodyInvocationsInvocationTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeKeyPairsRequest': (
+        ('IncludePublicKey', 'include_public_key', SCALAR, None),
+        ('KeyPairFingerPrint', 'key_pair_finger_print', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeKeyPairsRequestTag'),
+    ),
+    'DescribeKeyPairsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeKeyPairsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeKeyPairsResponseBody'),
+    ),
+    'DescribeKeyPairsResponseBody': (
+        ('KeyPairs', 'key_pairs', MODEL, 'DescribeKeyPairsResponseBodyKeyPairs'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeKeyPairsResponseBodyKeyPairs': (
+        ('KeyPair', 'key_pair', MODEL_LIST, 'DescribeKeyPairsResponseBodyKeyPairsKeyPair'),
+    ),
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPair': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('KeyPairFingerPrint', 'key_pair_finger_print', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('PublicKey', 'public_key', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeKeyPairsResponseBodyKeyPairsKeyPairTags'),
+    ),
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag'),
+    ),
+    'DescribeKeyPairsResponseBodyKeyPairsKeyPairTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsRequest': (
+        ('DefaultVersion', 'default_version', SCALAR, None),
+        ('DetailFlag', 'detail_flag', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('LaunchTemplateVersion', 'launch_template_version', SCALAR, None),
+        ('MaxVersion', 'max_version', SCALAR, None),
+        ('MinVersion', 'min_version', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeLaunchTemplateVersionsResponseBody'),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBody': (
+        ('LaunchTemplateVersionSets', 'launch_template_version_sets', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSets': (
+        ('LaunchTemplateVersionSet', 'launch_template_version_set', MODEL_LIST, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet'),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSet': (
+        ('CreateTime', 'create_time', SCALAR, None),
+        ('CreatedBy', 'created_by', SCALAR, None),
+        ('DefaultVersion', 'default_version', SCALAR, None),
+        ('LaunchTemplateData', 'launch_template_data', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData'),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('ModifiedTime', 'modified_time', SCALAR, None),
+        ('VersionDescription', 'version_description', SCALAR, None),
+        ('VersionNumber', 'version_number', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateData': (
+        ('SystemDisk', 'system_disk', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk'),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisks', 'data_disks', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks'),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableVmOsConfig', 'enable_vm_os_config', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions'),
+        ('ImageOwnerAlias', 'image_owner_alias', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('NetworkInterfaces', 'network_interfaces', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces'),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds'),
+        ('SecurityOptions', 'security_options', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions'),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags'),
+        ('UserData', 'user_data', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisks': (
+        ('DataDisk', 'data_disk', MODEL_LIST, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk'),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataDataDisksDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfaces': (
+        ('NetworkInterface', 'network_interface', MODEL_LIST, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface'),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterface': (
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds'),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataNetworkInterfacesNetworkInterfaceSecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSecurityOptions': (
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('Iops', 'iops', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTags': (
+        ('InstanceTag', 'instance_tag', MODEL_LIST, 'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag'),
+    ),
+    'DescribeLaunchTemplateVersionsResponseBodyLaunchTemplateVersionSetsLaunchTemplateVersionSetLaunchTemplateDataTagsInstanceTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeLaunchTemplatesRequest': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TemplateResourceGroupId', 'template_resource_group_id', SCALAR, None),
+        ('TemplateTag', 'template_tag', MODEL_LIST, 'DescribeLaunchTemplatesRequestTemplateTag'),
+    ),
+    'DescribeLaunchTemplatesRequestTemplateTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeLaunchTemplatesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeLaunchTemplatesResponseBody'),
+    ),
+    'DescribeLaunchTemplatesResponseBody': (
+        ('LaunchTemplateSets', 'launch_template_sets', MODEL, 'DescribeLaunchTemplatesResponseBodyLaunchTemplateSets'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSets': (
+        ('LaunchTemplateSet', 'launch_template_set', MODEL_LIST, 'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet'),
+    ),
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSet': (
+        ('CreateTime', 'create_time', SCALAR, None),
+        ('CreatedBy', 'created_by', SCALAR, None),
+        ('DefaultVersionNumber', 'default_version_number', SCALAR, None),
+        ('LatestVersionNumber', 'latest_version_number', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('ModifiedTime', 'modified_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags'),
+    ),
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag'),
+    ),
+    'DescribeLaunchTemplatesResponseBodyLaunchTemplateSetsLaunchTemplateSetTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeLimitationRequest': (
+        ('Limitation', 'limitation', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeLimitationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeLimitationResponseBody'),
+    ),
+    'DescribeLimitationResponseBody': (
+        ('Limitation', 'limitation', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeLockedSnapshotsRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('LockStatus', 'lock_status', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotIds', 'snapshot_ids', SCALAR, None),
+    ),
+    'DescribeLockedSnapshotsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeLockedSnapshotsResponseBody'),
+    ),
+    'DescribeLockedSnapshotsResponseBody': (
+        ('LockedSnapshotsInfo', 'locked_snapshots_info', MODEL_LIST, 'DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeLockedSnapshotsResponseBodyLockedSnapshotsInfo': (
+        ('CoolOffPeriod', 'cool_off_period', SCALAR, None),
+        ('CoolOffPeriodExpiredTime', 'cool_off_period_expired_time', SCALAR, None),
+        ('LockCreationTime', 'lock_creation_time', SCALAR, None),
+        ('LockDuration', 'lock_duration', SCALAR, None),
+        ('LockDurationStartTime', 'lock_duration_start_time', SCALAR, None),
+        ('LockExpiredTime', 'lock_expired_time', SCALAR, None),
+        ('LockStatus', 'lock_status', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'DescribeManagedInstancesRequest': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('Connected', 'connected', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceIp', 'instance_ip', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('MachineId', 'machine_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OsType', 'os_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeManagedInstancesRequestTag'),
+    ),
+    'DescribeManagedInstancesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeManagedInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeManagedInstancesResponseBody'),
+    ),
+    'DescribeManagedInstancesResponseBody': (
+        ('Instances', 'instances', MODEL_LIST, 'DescribeManagedInstancesResponseBodyInstances'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeManagedInstancesResponseBodyInstances': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('AgentVersion', 'agent_version', SCALAR, None),
+        ('Connected', 'connected', SCALAR, None),
+        ('Hostname', 'hostname', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InternetIp', 'internet_ip', SCALAR, None),
+        ('IntranetIp', 'intranet_ip', SCALAR, None),
+        ('InvocationCount', 'invocation_count', SCALAR, None),
+        ('LastInvokedTime', 'last_invoked_time', SCALAR, None),
+        ('MachineId', 'machine_id', SCALAR, None),
+        ('OsType', 'os_type', SCALAR, None),
+        ('OsVersion', 'os_version', SCALAR, None),
+        ('RegistrationTime', 'registration_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL_LIST, 'DescribeManagedInstancesResponseBodyInstancesTags'),
+    ),
+    'DescribeManagedInstancesResponseBodyInstancesTags': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeNatGatewaysRequest': (
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeNatGatewaysResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeNatGatewaysResponseBody'),
+    ),
+    'DescribeNatGatewaysResponseBody': (
+        ('NatGateways', 'nat_gateways', MODEL, 'DescribeNatGatewaysResponseBodyNatGateways'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeNatGatewaysResponseBodyNatGateways': (
+        ('NatGateway', 'nat_gateway', MODEL_LIST, 'DescribeNatGatewaysResponseBodyNatGatewaysNatGateway'),
+    ),
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGateway': (
+        ('BandwidthPackageIds', 'bandwidth_package_ids', MODEL, 'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds'),
+        ('BusinessStatus', 'business_status', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ForwardTableIds', 'forward_table_ids', MODEL, 'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NatGatewayId', 'nat_gateway_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayBandwidthPackageIds': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+    ),
+    'DescribeNatGatewaysResponseBodyNatGatewaysNatGatewayForwardTableIds': (
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeRequest': (
+        ('Attribute', 'attribute', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeNetworkInterfaceAttributeRequestTag'),
+    ),
+    'DescribeNetworkInterfaceAttributeRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeNetworkInterfaceAttributeResponseBody'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBody': (
+        ('AssociatedPublicIp', 'associated_public_ip', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp'),
+        ('Attachment', 'attachment', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyAttachment'),
+        ('BondInterfaceSpecification', 'bond_interface_specification', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification'),
+        ('ConnectionTrackingConfiguration', 'connection_tracking_configuration', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnhancedNetwork', 'enhanced_network', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Ipv4PrefixSets', 'ipv_4prefix_sets', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets'),
+        ('Ipv6PrefixSets', 'ipv_6prefix_sets', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets'),
+        ('Ipv6Sets', 'ipv_6sets', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets'),
+        ('MacAddress', 'mac_address', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficConfig', 'network_interface_traffic_config', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig'),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('PrivateIpSets', 'private_ip_sets', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets'),
+        ('QoSConfig', 'qo_sconfig', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyQoSConfig'),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds'),
+        ('ServiceID', 'service_id', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('SlaveInterfaceSpecification', 'slave_interface_specification', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification'),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyTags'),
+        ('TcpOptionAddressEnabled', 'tcp_option_address_enabled', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyAssociatedPublicIp': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('PublicIpAddress', 'public_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachment': (
+        ('DeviceIndex', 'device_index', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MemberNetworkInterfaceIds', 'member_network_interface_ids', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds'),
+        ('NetworkCardIndex', 'network_card_index', SCALAR, None),
+        ('TrunkNetworkInterfaceId', 'trunk_network_interface_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyAttachmentMemberNetworkInterfaceIds': (
+        ('MemberNetworkInterfaceId', 'member_network_interface_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecification': (
+        ('BondMode', 'bond_mode', SCALAR, None),
+        ('SlaveInterfaceSpecification', 'slave_interface_specification', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecification': (
+        ('SlaveInterfaceSpecificationSet', 'slave_interface_specification_set', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyBondInterfaceSpecificationSlaveInterfaceSpecificationSlaveInterfaceSpecificationSet': (
+        ('BondNetworkInterfaceId', 'bond_network_interface_id', SCALAR, None),
+        ('SlaveNetworkInterfaceId', 'slave_network_interface_id', SCALAR, None),
+        ('WorkState', 'work_state', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyConnectionTrackingConfiguration': (
+        ('TcpClosedAndTimeWaitTimeout', 'tcp_closed_and_time_wait_timeout', SCALAR, None),
+        ('TcpEstablishedTimeout', 'tcp_established_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyEnhancedNetwork': (
+        ('EnableRss', 'enable_rss', SCALAR, None),
+        ('EnableSriov', 'enable_sriov', SCALAR, None),
+        ('VirtualFunctionQuantity', 'virtual_function_quantity', SCALAR, None),
+        ('VirtualFunctionTotalQueueNumber', 'virtual_function_total_queue_number', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSets': (
+        ('Ipv4PrefixSet', 'ipv_4prefix_set', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv4PrefixSetsIpv4PrefixSet': (
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSets': (
+        ('Ipv6PrefixSet', 'ipv_6prefix_set', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6PrefixSetsIpv6PrefixSet': (
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6Sets': (
+        ('Ipv6Set', 'ipv_6set', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyIpv6SetsIpv6Set': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyNetworkInterfaceTrafficConfig': (
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSets': (
+        ('PrivateIpSet', 'private_ip_set', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSet': (
+        ('AssociatedPublicIp', 'associated_public_ip', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp'),
+        ('Primary', 'primary', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyPrivateIpSetsPrivateIpSetAssociatedPublicIp': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('PublicIpAddress', 'public_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfig': (
+        ('EnableQoS', 'enable_qo_s', SCALAR, None),
+        ('QoS', 'qo_s', MODEL, 'DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyQoSConfigQoS': (
+        ('BandwidthRx', 'bandwidth_rx', SCALAR, None),
+        ('BandwidthTx', 'bandwidth_tx', SCALAR, None),
+        ('ConcurrentConnections', 'concurrent_connections', SCALAR, None),
+        ('PpsRx', 'pps_rx', SCALAR, None),
+        ('PpsTx', 'pps_tx', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodySecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodySlaveInterfaceSpecification': (
+        ('BondNetworkInterfaceId', 'bond_network_interface_id', SCALAR, None),
+        ('SlaveNetworkInterfaceId', 'slave_network_interface_id', SCALAR, None),
+        ('WorkState', 'work_state', SCALAR, None),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeNetworkInterfaceAttributeResponseBodyTagsTag'),
+    ),
+    'DescribeNetworkInterfaceAttributeResponseBodyTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacePermissionsRequest': (
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfacePermissionId', 'network_interface_permission_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacePermissionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeNetworkInterfacePermissionsResponseBody'),
+    ),
+    'DescribeNetworkInterfacePermissionsResponseBody': (
+        ('NetworkInterfacePermissions', 'network_interface_permissions', MODEL, 'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissions': (
+        ('NetworkInterfacePermission', 'network_interface_permission', MODEL_LIST, 'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission'),
+    ),
+    'DescribeNetworkInterfacePermissionsResponseBodyNetworkInterfacePermissionsNetworkInterfacePermission': (
+        ('AccountId', 'account_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfacePermissionId', 'network_interface_permission_id', SCALAR, None),
+        ('Permission', 'permission', SCALAR, None),
+        ('PermissionState', 'permission_state', SCALAR, None),
+        ('ServiceName', 'service_name', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeNetworkInterfacesRequestTag'),
+        ('Type', 'type', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeNetworkInterfacesResponseBody'),
+    ),
+    'DescribeNetworkInterfacesResponseBody': (
+        ('NetworkInterfaceSets', 'network_interface_sets', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSets': (
+        ('NetworkInterfaceSet', 'network_interface_set', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSet': (
+        ('AssociatedPublicIp', 'associated_public_ip', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp'),
+        ('Attachment', 'attachment', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Ipv4PrefixSets', 'ipv_4prefix_sets', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets'),
+        ('Ipv6PrefixSets', 'ipv_6prefix_sets', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets'),
+        ('Ipv6Sets', 'ipv_6sets', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets'),
+        ('MacAddress', 'mac_address', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('PrivateIpSets', 'private_ip_sets', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets'),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds'),
+        ('ServiceID', 'service_id', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags'),
+        ('Type', 'type', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAssociatedPublicIp': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('PublicIpAddress', 'public_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetAttachment': (
+        ('DeviceIndex', 'device_index', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NetworkCardIndex', 'network_card_index', SCALAR, None),
+        ('TrunkNetworkInterfaceId', 'trunk_network_interface_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSets': (
+        ('Ipv4PrefixSet', 'ipv_4prefix_set', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv4PrefixSetsIpv4PrefixSet': (
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSets': (
+        ('Ipv6PrefixSet', 'ipv_6prefix_set', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6PrefixSetsIpv6PrefixSet': (
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6Sets': (
+        ('Ipv6Set', 'ipv_6set', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetIpv6SetsIpv6Set': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSets': (
+        ('PrivateIpSet', 'private_ip_set', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSet': (
+        ('AssociatedPublicIp', 'associated_public_ip', MODEL, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp'),
+        ('Primary', 'primary', SCALAR, None),
+        ('PrivateDnsName', 'private_dns_name', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetPrivateIpSetsPrivateIpSetAssociatedPublicIp': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('PublicIpAddress', 'public_ip_address', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetSecurityGroupIds': (
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag'),
+    ),
+    'DescribeNetworkInterfacesResponseBodyNetworkInterfaceSetsNetworkInterfaceSetTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeNewProjectEipMonitorDataRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeNewProjectEipMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeNewProjectEipMonitorDataResponseBody'),
+    ),
+    'DescribeNewProjectEipMonitorDataResponseBody': (
+        ('EipMonitorDatas', 'eip_monitor_datas', MODEL, 'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatas': (
+        ('EipMonitorData', 'eip_monitor_data', MODEL_LIST, 'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData'),
+    ),
+    'DescribeNewProjectEipMonitorDataResponseBodyEipMonitorDatasEipMonitorData': (
+        ('EipBandwidth', 'eip_bandwidth', SCALAR, None),
+        ('EipFlow', 'eip_flow', SCALAR, None),
+        ('EipPackets', 'eip_packets', SCALAR, None),
+        ('EipRX', 'eip_rx', SCALAR, None),
+        ('EipTX', 'eip_tx', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribePhysicalConnectionsRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Filter', 'filter', MODEL_LIST, 'DescribePhysicalConnectionsRequestFilter'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'DescribePhysicalConnectionsRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribePhysicalConnectionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePhysicalConnectionsResponseBody'),
+    ),
+    'DescribePhysicalConnectionsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('PhysicalConnectionSet', 'physical_connection_set', MODEL, 'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSet': (
+        ('PhysicalConnectionType', 'physical_connection_type', MODEL_LIST, 'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType'),
+    ),
+    'DescribePhysicalConnectionsResponseBodyPhysicalConnectionSetPhysicalConnectionType': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('AdLocation', 'ad_location', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('BusinessStatus', 'business_status', SCALAR, None),
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnabledTime', 'enabled_time', SCALAR, None),
+        ('LineOperator', 'line_operator', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('PeerLocation', 'peer_location', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('PortNumber', 'port_number', SCALAR, None),
+        ('PortType', 'port_type', SCALAR, None),
+        ('RedundantPhysicalConnectionId', 'redundant_physical_connection_id', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribePortRangeListAssociationsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribePortRangeListAssociationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePortRangeListAssociationsResponseBody'),
+    ),
+    'DescribePortRangeListAssociationsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PortRangeListAssociations', 'port_range_list_associations', MODEL_LIST, 'DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePortRangeListAssociationsResponseBodyPortRangeListAssociations': (
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribePortRangeListEntriesRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribePortRangeListEntriesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePortRangeListEntriesResponseBody'),
+    ),
+    'DescribePortRangeListEntriesResponseBody': (
+        ('Entries', 'entries', MODEL_LIST, 'DescribePortRangeListEntriesResponseBodyEntries'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePortRangeListEntriesResponseBodyEntries': (
+        ('Description', 'description', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+    ),
+    'DescribePortRangeListsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('PortRangeListName', 'port_range_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribePortRangeListsRequestTag'),
+    ),
+    'DescribePortRangeListsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribePortRangeListsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePortRangeListsResponseBody'),
+    ),
+    'DescribePortRangeListsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PortRangeLists', 'port_range_lists', MODEL_LIST, 'DescribePortRangeListsResponseBodyPortRangeLists'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePortRangeListsResponseBodyPortRangeLists': (
+        ('AssociationCount', 'association_count', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('MaxEntries', 'max_entries', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('PortRangeListName', 'port_range_list_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL_LIST, 'DescribePortRangeListsResponseBodyPortRangeListsTags'),
+    ),
+    'DescribePortRangeListsResponseBodyPortRangeListsTags': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribePrefixListAssociationsRequest': (
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribePrefixListAssociationsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePrefixListAssociationsResponseBody'),
+    ),
+    'DescribePrefixListAssociationsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PrefixListAssociations', 'prefix_list_associations', MODEL, 'DescribePrefixListAssociationsResponseBodyPrefixListAssociations'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociations': (
+        ('PrefixListAssociation', 'prefix_list_association', MODEL_LIST, 'DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation'),
+    ),
+    'DescribePrefixListAssociationsResponseBodyPrefixListAssociationsPrefixListAssociation': (
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribePrefixListAttributesRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribePrefixListAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePrefixListAttributesResponseBody'),
+    ),
+    'DescribePrefixListAttributesResponseBody': (
+        ('AddressFamily', 'address_family', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Entries', 'entries', MODEL, 'DescribePrefixListAttributesResponseBodyEntries'),
+        ('MaxEntries', 'max_entries', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('PrefixListName', 'prefix_list_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePrefixListAttributesResponseBodyEntries': (
+        ('Entry', 'entry', MODEL_LIST, 'DescribePrefixListAttributesResponseBodyEntriesEntry'),
+    ),
+    'DescribePrefixListAttributesResponseBodyEntriesEntry': (
+        ('Cidr', 'cidr', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+    ),
+    'DescribePrefixListsRequest': (
+        ('AddressFamily', 'address_family', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('PrefixListName', 'prefix_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribePrefixListsRequestTag'),
+    ),
+    'DescribePrefixListsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribePrefixListsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePrefixListsResponseBody'),
+    ),
+    'DescribePrefixListsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PrefixLists', 'prefix_lists', MODEL, 'DescribePrefixListsResponseBodyPrefixLists'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePrefixListsResponseBodyPrefixLists': (
+        ('PrefixList', 'prefix_list', MODEL_LIST, 'DescribePrefixListsResponseBodyPrefixListsPrefixList'),
+    ),
+    'DescribePrefixListsResponseBodyPrefixListsPrefixList': (
+        ('AddressFamily', 'address_family', SCALAR, None),
+        ('AssociationCount', 'association_count', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('MaxEntries', 'max_entries', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('PrefixListName', 'prefix_list_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribePrefixListsResponseBodyPrefixListsPrefixListTags'),
+    ),
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag'),
+    ),
+    'DescribePrefixListsResponseBodyPrefixListsPrefixListTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribePriceRequest': (
+        ('DataDisk', 'data_disk', MODEL_LIST, 'DescribePriceRequestDataDisk'),
+        ('SchedulerOptions', 'scheduler_options', MODEL, 'DescribePriceRequestSchedulerOptions'),
+        ('SystemDisk', 'system_disk', MODEL, 'DescribePriceRequestSystemDisk'),
+        ('Amount', 'amount', SCALAR, None),
+        ('AssuranceTimes', 'assurance_times', SCALAR, None),
+        ('Capacity', 'capacity', SCALAR, None),
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceCpuCoreCount', 'instance_cpu_core_count', SCALAR, None),
+        ('InstanceNetworkType', 'instance_network_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeList', 'instance_type_list', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Isp', 'isp', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('PriceUnit', 'price_unit', SCALAR, None),
+        ('RecurrenceRules', 'recurrence_rules', MODEL_LIST, 'DescribePriceRequestRecurrenceRules'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribePriceRequestDataDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+    ),
+    'DescribePriceRequestRecurrenceRules': (
+        ('EndHour', 'end_hour', SCALAR, None),
+        ('RecurrenceType', 'recurrence_type', SCALAR, None),
+        ('RecurrenceValue', 'recurrence_value', SCALAR, None),
+        ('StartHour', 'start_hour', SCALAR, None),
+    ),
+    'DescribePriceRequestSchedulerOptions': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DeploymentSetStrategy', 'deployment_set_strategy', SCALAR, None),
+    ),
+    'DescribePriceRequestSystemDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+    ),
+    'DescribePriceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribePriceResponseBody'),
+    ),
+    'DescribePriceResponseBody': (
+        ('PriceInfo', 'price_info', MODEL, 'DescribePriceResponseBodyPriceInfo'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribePriceResponseBodyPriceInfo': (
+        ('Price', 'price', MODEL, 'DescribePriceResponseBodyPriceInfoPrice'),
+        ('RelatedPrice', 'related_price', MODEL, 'DescribePriceResponseBodyPriceInfoRelatedPrice'),
+        ('Rules', 'rules', MODEL, 'DescribePriceResponseBodyPriceInfoRules'),
+    ),
+    'DescribePriceResponseBodyPriceInfoPrice': (
+        ('Currency', 'currency', SCALAR, None),
+        ('DetailInfos', 'detail_infos', MODEL, 'DescribePriceResponseBodyPriceInfoPriceDetailInfos'),
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('ReservedInstanceHourPrice', 'reserved_instance_hour_price', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfos': (
+        ('DetailInfo', 'detail_info', MODEL_LIST, 'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo'),
+    ),
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': (
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('Resource', 'resource', SCALAR, None),
+        ('SubRules', 'sub_rules', MODEL, 'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules'),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule'),
+    ),
+    'DescribePriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribePriceResponseBodyPriceInfoRelatedPrice': (
+        ('MarketplaceImagePrice', 'marketplace_image_price', MODEL, 'DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice'),
+    ),
+    'DescribePriceResponseBodyPriceInfoRelatedPriceMarketplaceImagePrice': (
+        ('Currency', 'currency', SCALAR, None),
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribePriceResponseBodyPriceInfoRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribePriceResponseBodyPriceInfoRulesRule'),
+    ),
+    'DescribePriceResponseBodyPriceInfoRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeRecommendInstanceTypeRequest': (
+        ('Cores', 'cores', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('MaxPrice', 'max_price', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PriorityStrategy', 'priority_strategy', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Scene', 'scene', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('SystemDiskCategory', 'system_disk_category', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+        ('ZoneMatchMode', 'zone_match_mode', SCALAR, None),
+    ),
+    'DescribeRecommendInstanceTypeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeRecommendInstanceTypeResponseBody'),
+    ),
+    'DescribeRecommendInstanceTypeResponseBody': (
+        ('Data', 'data', MODEL, 'DescribeRecommendInstanceTypeResponseBodyData'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyData': (
+        ('RecommendInstanceType', 'recommend_instance_type', MODEL_LIST, 'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType'),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceType': (
+        ('CommodityCode', 'commodity_code', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceType', 'instance_type', MODEL, 'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType'),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Scene', 'scene', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+        ('Zones', 'zones', MODEL, 'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones'),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeInstanceType': (
+        ('Cores', 'cores', SCALAR, None),
+        ('Generation', 'generation', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('SupportIoOptimized', 'support_io_optimized', SCALAR, None),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZones': (
+        ('zone', 'zone', MODEL_LIST, 'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone'),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZone': (
+        ('NetworkTypes', 'network_types', MODEL, 'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes'),
+        ('ZoneNo', 'zone_no', SCALAR, None),
+    ),
+    'DescribeRecommendInstanceTypeResponseBodyDataRecommendInstanceTypeZonesZoneNetworkTypes': (
+        ('NetworkType', 'network_type', SCALAR, None),
+    ),
+    'DescribeRegionsRequest': (
+        ('AcceptLanguage', 'accept_language', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribeRegionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeRegionsResponseBody'),
+    ),
+    'DescribeRegionsResponseBody': (
+        ('Regions', 'regions', MODEL, 'DescribeRegionsResponseBodyRegions'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeRegionsResponseBodyRegions': (
+        ('Region', 'region', MODEL_LIST, 'DescribeRegionsResponseBodyRegionsRegion'),
+    ),
+    'DescribeRegionsResponseBodyRegionsRegion': (
+        ('LocalName', 'local_name', SCALAR, None),
+        ('RegionEndpoint', 'region_endpoint', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeRenewalPriceRequest': (
+        ('ExpectedRenewDay', 'expected_renew_day', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PriceUnit', 'price_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribeRenewalPriceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeRenewalPriceResponseBody'),
+    ),
+    'DescribeRenewalPriceResponseBody': (
+        ('PriceInfo', 'price_info', MODEL, 'DescribeRenewalPriceResponseBodyPriceInfo'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfo': (
+        ('Price', 'price', MODEL, 'DescribeRenewalPriceResponseBodyPriceInfoPrice'),
+        ('Rules', 'rules', MODEL, 'DescribeRenewalPriceResponseBodyPriceInfoRules'),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoPrice': (
+        ('Currency', 'currency', SCALAR, None),
+        ('DetailInfos', 'detail_infos', MODEL, 'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos'),
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfos': (
+        ('DetailInfo', 'detail_info', MODEL_LIST, 'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo'),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfo': (
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('Resource', 'resource', SCALAR, None),
+        ('SubRules', 'sub_rules', MODEL, 'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules'),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule'),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoPriceDetailInfosDetailInfoSubRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoRules': (
+        ('Rule', 'rule', MODEL_LIST, 'DescribeRenewalPriceResponseBodyPriceInfoRulesRule'),
+    ),
+    'DescribeRenewalPriceResponseBodyPriceInfoRulesRule': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeReservedInstanceAutoRenewAttributeRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeReservedInstanceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeReservedInstanceAutoRenewAttributeResponseBody'),
+    ),
+    'DescribeReservedInstanceAutoRenewAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ReservedInstanceRenewAttributes', 'reserved_instance_renew_attributes', MODEL, 'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes'),
+    ),
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributes': (
+        ('ReservedInstanceRenewAttribute', 'reserved_instance_renew_attribute', MODEL_LIST, 'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute'),
+    ),
+    'DescribeReservedInstanceAutoRenewAttributeResponseBodyReservedInstanceRenewAttributesReservedInstanceRenewAttribute': (
+        ('Duration', 'duration', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+    ),
+    'DescribeReservedInstancesRequest': (
+        ('AllocationType', 'allocation_type', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('LockReason', 'lock_reason', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ReservedInstanceName', 'reserved_instance_name', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeReservedInstancesRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeReservedInstancesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeReservedInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeReservedInstancesResponseBody'),
+    ),
+    'DescribeReservedInstancesResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ReservedInstances', 'reserved_instances', MODEL, 'DescribeReservedInstancesResponseBodyReservedInstances'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstances': (
+        ('ReservedInstance', 'reserved_instance', MODEL_LIST, 'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance'),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstance': (
+        ('AllocationStatus', 'allocation_status', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('OperationLocks', 'operation_locks', MODEL, 'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks'),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ReservedInstanceName', 'reserved_instance_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocks': (
+        ('OperationLock', 'operation_lock', MODEL_LIST, 'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock'),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceOperationLocksOperationLock': (
+        ('LockReason', 'lock_reason', SCALAR, None),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag'),
+    ),
+    'DescribeReservedInstancesResponseBodyReservedInstancesReservedInstanceTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeResourceByTagsRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeResourceByTagsRequestTag'),
+    ),
+    'DescribeResourceByTagsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeResourceByTagsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeResourceByTagsResponseBody'),
+    ),
+    'DescribeResourceByTagsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Resources', 'resources', MODEL, 'DescribeResourceByTagsResponseBodyResources'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeResourceByTagsResponseBodyResources': (
+        ('Resource', 'resource', MODEL_LIST, 'DescribeResourceByTagsResponseBodyResourcesResource'),
+    ),
+    'DescribeResourceByTagsResponseBodyResourcesResource': (
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'DescribeResourcesModificationRequest': (
+        ('Conditions', 'conditions', SCALAR, None),
+        ('Cores', 'cores', SCALAR, None),
+        ('DestinationResource', 'destination_resource', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('MigrateAcrossZone', 'migrate_across_zone', SCALAR, None),
+        ('OperationType', 'operation_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeResourcesModificationResponseBody'),
+    ),
+    'DescribeResourcesModificationResponseBody': (
+        ('AvailableZones', 'available_zones', MODEL, 'DescribeResourcesModificationResponseBodyAvailableZones'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZones': (
+        ('AvailableZone', 'available_zone', MODEL_LIST, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone'),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZone': (
+        ('AvailableResources', 'available_resources', MODEL, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StatusCategory', 'status_category', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResources': (
+        ('AvailableResource', 'available_resource', MODEL_LIST, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource'),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResource': (
+        ('ConditionSupportedResources', 'condition_supported_resources', MODEL, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources'),
+        ('SupportedResources', 'supported_resources', MODEL, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources'),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResources': (
+        ('ConditionSupportedResource', 'condition_supported_resource', MODEL_LIST, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource'),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResource': (
+        ('Conditions', 'conditions', MODEL, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions'),
+        ('Max', 'max', SCALAR, None),
+        ('Min', 'min', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StatusCategory', 'status_category', SCALAR, None),
+        ('Unit', 'unit', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditions': (
+        ('Condition', 'condition', MODEL_LIST, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition'),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceConditionSupportedResourcesConditionSupportedResourceConditionsCondition': (
+        ('Key', 'key', SCALAR, None),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResources': (
+        ('SupportedResource', 'supported_resource', MODEL_LIST, 'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource'),
+    ),
+    'DescribeResourcesModificationResponseBodyAvailableZonesAvailableZoneAvailableResourcesAvailableResourceSupportedResourcesSupportedResource': (
+        ('Max', 'max', SCALAR, None),
+        ('Min', 'min', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StatusCategory', 'status_category', SCALAR, None),
+        ('Unit', 'unit', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeRouteTablesRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+        ('RouteTableName', 'route_table_name', SCALAR, None),
+        ('RouterId', 'router_id', SCALAR, None),
+        ('RouterType', 'router_type', SCALAR, None),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+    ),
+    'DescribeRouteTablesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeRouteTablesResponseBody'),
+    ),
+    'DescribeRouteTablesResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('RouteTables', 'route_tables', MODEL, 'DescribeRouteTablesResponseBodyRouteTables'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTables': (
+        ('RouteTable', 'route_table', MODEL_LIST, 'DescribeRouteTablesResponseBodyRouteTablesRouteTable'),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTable': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('RouteEntrys', 'route_entrys', MODEL, 'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys'),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+        ('RouteTableType', 'route_table_type', SCALAR, None),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrys': (
+        ('RouteEntry', 'route_entry', MODEL_LIST, 'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry'),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntry': (
+        ('DestinationCidrBlock', 'destination_cidr_block', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NextHopType', 'next_hop_type', SCALAR, None),
+        ('NextHops', 'next_hops', MODEL, 'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops'),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHops': (
+        ('NextHop', 'next_hop', MODEL_LIST, 'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop'),
+    ),
+    'DescribeRouteTablesResponseBodyRouteTablesRouteTableRouteEntrysRouteEntryNextHopsNextHop': (
+        ('Enabled', 'enabled', SCALAR, None),
+        ('NextHopId', 'next_hop_id', SCALAR, None),
+        ('NextHopType', 'next_hop_type', SCALAR, None),
+        ('Weight', 'weight', SCALAR, None),
+    ),
+    'DescribeRouterInterfacesRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeRouterInterfacesRequestFilter'),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeRouterInterfacesRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeRouterInterfacesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeRouterInterfacesResponseBody'),
+    ),
+    'DescribeRouterInterfacesResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('RouterInterfaceSet', 'router_interface_set', MODEL, 'DescribeRouterInterfacesResponseBodyRouterInterfaceSet'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSet': (
+        ('RouterInterfaceType', 'router_interface_type', MODEL_LIST, 'DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType'),
+    ),
+    'DescribeRouterInterfacesResponseBodyRouterInterfaceSetRouterInterfaceType': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('BusinessStatus', 'business_status', SCALAR, None),
+        ('ChargeType', 'charge_type', SCALAR, None),
+        ('ConnectedTime', 'connected_time', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('HealthCheckSourceIp', 'health_check_source_ip', SCALAR, None),
+        ('HealthCheckTargetIp', 'health_check_target_ip', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OppositeAccessPointId', 'opposite_access_point_id', SCALAR, None),
+        ('OppositeInterfaceBusinessStatus', 'opposite_interface_business_status', SCALAR, None),
+        ('OppositeInterfaceId', 'opposite_interface_id', SCALAR, None),
+        ('OppositeInterfaceOwnerId', 'opposite_interface_owner_id', SCALAR, None),
+        ('OppositeInterfaceSpec', 'opposite_interface_spec', SCALAR, None),
+        ('OppositeInterfaceStatus', 'opposite_interface_status', SCALAR, None),
+        ('OppositeRegionId', 'opposite_region_id', SCALAR, None),
+        ('OppositeRouterId', 'opposite_router_id', SCALAR, None),
+        ('OppositeRouterType', 'opposite_router_type', SCALAR, None),
+        ('Role', 'role', SCALAR, None),
+        ('RouterId', 'router_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+        ('RouterType', 'router_type', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeSavingsPlanEstimationRequest': (
+        ('EstimationResource', 'estimation_resource', SCALAR, None),
+        ('InstanceTypeScope', 'instance_type_scope', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PlanType', 'plan_type', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+    ),
+    'DescribeSavingsPlanEstimationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSavingsPlanEstimationResponseBody'),
+    ),
+    'DescribeSavingsPlanEstimationResponseBody': (
+        ('CommittedAmount', 'committed_amount', SCALAR, None),
+        ('Currency', 'currency', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypeFamilyGroup', 'instance_type_family_group', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PlanType', 'plan_type', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+    ),
+    'DescribeSavingsPlanPriceRequest': (
+        ('CommittedAmount', 'committed_amount', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypeFamilyGroup', 'instance_type_family_group', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PlanType', 'plan_type', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+    ),
+    'DescribeSavingsPlanPriceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSavingsPlanPriceResponseBody'),
+    ),
+    'DescribeSavingsPlanPriceResponseBody': (
+        ('PriceInfo', 'price_info', MODEL, 'DescribeSavingsPlanPriceResponseBodyPriceInfo'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeSavingsPlanPriceResponseBodyPriceInfo': (
+        ('Price', 'price', MODEL, 'DescribeSavingsPlanPriceResponseBodyPriceInfoPrice'),
+        ('Rules', 'rules', MODEL_LIST, 'DescribeSavingsPlanPriceResponseBodyPriceInfoRules'),
+    ),
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoPrice': (
+        ('Currency', 'currency', SCALAR, None),
+        ('DiscountPrice', 'discount_price', SCALAR, None),
+        ('OriginalPrice', 'original_price', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'DescribeSavingsPlanPriceResponseBodyPriceInfoRules': (
+        ('Description', 'description', SCALAR, None),
+        ('RuleId', 'rule_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupAttributeRequest': (
+        ('Attribute', 'attribute', SCALAR, None),
+        ('Direction', 'direction', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSecurityGroupAttributeResponseBody'),
+    ),
+    'DescribeSecurityGroupAttributeResponseBody': (
+        ('Description', 'description', SCALAR, None),
+        ('InnerAccessPolicy', 'inner_access_policy', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('Permissions', 'permissions', MODEL, 'DescribeSecurityGroupAttributeResponseBodyPermissions'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupName', 'security_group_name', SCALAR, None),
+        ('SnapshotPolicyIds', 'snapshot_policy_ids', MODEL, 'DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds'),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupAttributeResponseBodyPermissions': (
+        ('Permission', 'permission', MODEL_LIST, 'DescribeSecurityGroupAttributeResponseBodyPermissionsPermission'),
+    ),
+    'DescribeSecurityGroupAttributeResponseBodyPermissionsPermission': (
+        ('CreateTime', 'create_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupName', 'dest_group_name', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('DestPrefixListName', 'dest_prefix_list_name', SCALAR, None),
+        ('Direction', 'direction', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('PortRangeListName', 'port_range_list_name', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('SecurityGroupRuleId', 'security_group_rule_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupName', 'source_group_name', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+        ('SourcePrefixListName', 'source_prefix_list_name', SCALAR, None),
+    ),
+    'DescribeSecurityGroupAttributeResponseBodySnapshotPolicyIds': (
+        ('SnapshotPolicyId', 'snapshot_policy_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupReferencesRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupReferencesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSecurityGroupReferencesResponseBody'),
+    ),
+    'DescribeSecurityGroupReferencesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityGroupReferences', 'security_group_references', MODEL, 'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences'),
+    ),
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferences': (
+        ('SecurityGroupReference', 'security_group_reference', MODEL_LIST, 'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference'),
+    ),
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReference': (
+        ('ReferencingSecurityGroups', 'referencing_security_groups', MODEL, 'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups'),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroups': (
+        ('ReferencingSecurityGroup', 'referencing_security_group', MODEL_LIST, 'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup'),
+    ),
+    'DescribeSecurityGroupReferencesResponseBodySecurityGroupReferencesSecurityGroupReferenceReferencingSecurityGroupsReferencingSecurityGroup': (
+        ('AliUid', 'ali_uid', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupsRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('FuzzyQuery', 'fuzzy_query', SCALAR, None),
+        ('IsQueryEcsCount', 'is_query_ecs_count', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SecurityGroupName', 'security_group_name', SCALAR, None),
+        ('SecurityGroupType', 'security_group_type', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSecurityGroupsRequestTag'),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSecurityGroupsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSecurityGroupsResponseBody'),
+    ),
+    'DescribeSecurityGroupsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityGroups', 'security_groups', MODEL, 'DescribeSecurityGroupsResponseBodySecurityGroups'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeSecurityGroupsResponseBodySecurityGroups': (
+        ('SecurityGroup', 'security_group', MODEL_LIST, 'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup'),
+    ),
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroup': (
+        ('AvailableInstanceAmount', 'available_instance_amount', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EcsCount', 'ecs_count', SCALAR, None),
+        ('GroupToGroupRuleCount', 'group_to_group_rule_count', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('RuleCount', 'rule_count', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupName', 'security_group_name', SCALAR, None),
+        ('SecurityGroupType', 'security_group_type', SCALAR, None),
+        ('ServiceID', 'service_id', SCALAR, None),
+        ('ServiceManaged', 'service_managed', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags'),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag'),
+    ),
+    'DescribeSecurityGroupsResponseBodySecurityGroupsSecurityGroupTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeSendFileResultsRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSendFileResultsRequestTag'),
+    ),
+    'DescribeSendFileResultsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSendFileResultsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSendFileResultsResponseBody'),
+    ),
+    'DescribeSendFileResultsResponseBody': (
+        ('Invocations', 'invocations', MODEL, 'DescribeSendFileResultsResponseBodyInvocations'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocations': (
+        ('Invocation', 'invocation', MODEL_LIST, 'DescribeSendFileResultsResponseBodyInvocationsInvocation'),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocationsInvocation': (
+        ('Content', 'content', SCALAR, None),
+        ('ContentType', 'content_type', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('FileGroup', 'file_group', SCALAR, None),
+        ('FileMode', 'file_mode', SCALAR, None),
+        ('FileOwner', 'file_owner', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('InvokeInstances', 'invoke_instances', MODEL, 'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances'),
+        ('Name', 'name', SCALAR, None),
+        ('Overwrite', 'overwrite', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeSendFileResultsResponseBodyInvocationsInvocationTags'),
+        ('TargetDir', 'target_dir', SCALAR, None),
+        ('VmCount', 'vm_count', SCALAR, None),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstances': (
+        ('InvokeInstance', 'invoke_instance', MODEL_LIST, 'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance'),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationInvokeInstancesInvokeInstance': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorInfo', 'error_info', SCALAR, None),
+        ('FinishTime', 'finish_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvocationStatus', 'invocation_status', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('UpdateTime', 'update_time', SCALAR, None),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag'),
+    ),
+    'DescribeSendFileResultsResponseBodyInvocationsInvocationTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeSnapshotGroupsRequest': (
+        ('AdditionalAttributes', 'additional_attributes', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotGroupId', 'snapshot_group_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSnapshotGroupsRequestTag'),
+    ),
+    'DescribeSnapshotGroupsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSnapshotGroupsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotGroupsResponseBody'),
+    ),
+    'DescribeSnapshotGroupsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotGroups', 'snapshot_groups', MODEL, 'DescribeSnapshotGroupsResponseBodySnapshotGroups'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroups': (
+        ('SnapshotGroup', 'snapshot_group', MODEL_LIST, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroup': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('ProgressStatus', 'progress_status', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('SnapshotGroupId', 'snapshot_group_id', SCALAR, None),
+        ('Snapshots', 'snapshots', MODEL, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots'),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshots': (
+        ('Snapshot', 'snapshot', MODEL_LIST, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshot': (
+        ('Available', 'available', SCALAR, None),
+        ('InstantAccess', 'instant_access', SCALAR, None),
+        ('InstantAccessRetentionDays', 'instant_access_retention_days', SCALAR, None),
+        ('Progress', 'progress', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('SourceDiskId', 'source_disk_id', SCALAR, None),
+        ('SourceDiskType', 'source_disk_type', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupSnapshotsSnapshotTagsTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag'),
+    ),
+    'DescribeSnapshotGroupsResponseBodySnapshotGroupsSnapshotGroupTagsTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSnapshotLinksRequest': (
+        ('DiskIds', 'disk_ids', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotLinkIds', 'snapshot_link_ids', SCALAR, None),
+    ),
+    'DescribeSnapshotLinksResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotLinksResponseBody'),
+    ),
+    'DescribeSnapshotLinksResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotLinks', 'snapshot_links', MODEL, 'DescribeSnapshotLinksResponseBodySnapshotLinks'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeSnapshotLinksResponseBodySnapshotLinks': (
+        ('SnapshotLink', 'snapshot_link', MODEL_LIST, 'DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink'),
+    ),
+    'DescribeSnapshotLinksResponseBodySnapshotLinksSnapshotLink': (
+        ('Category', 'category', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstantAccess', 'instant_access', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('SnapshotLinkId', 'snapshot_link_id', SCALAR, None),
+        ('SourceDiskId', 'source_disk_id', SCALAR, None),
+        ('SourceDiskName', 'source_disk_name', SCALAR, None),
+        ('SourceDiskSize', 'source_disk_size', SCALAR, None),
+        ('SourceDiskType', 'source_disk_type', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('TotalSize', 'total_size', SCALAR, None),
+    ),
+    'DescribeSnapshotMonitorDataRequest': (
+        ('Category', 'category', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeSnapshotMonitorDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotMonitorDataResponseBody'),
+    ),
+    'DescribeSnapshotMonitorDataResponseBody': (
+        ('MonitorData', 'monitor_data', MODEL, 'DescribeSnapshotMonitorDataResponseBodyMonitorData'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeSnapshotMonitorDataResponseBodyMonitorData': (
+        ('DataPoint', 'data_point', MODEL_LIST, 'DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint'),
+    ),
+    'DescribeSnapshotMonitorDataResponseBodyMonitorDataDataPoint': (
+        ('Size', 'size', SCALAR, None),
+        ('TimeStamp', 'time_stamp', SCALAR, None),
+    ),
+    'DescribeSnapshotPackageRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeSnapshotPackageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotPackageResponseBody'),
+    ),
+    'DescribeSnapshotPackageResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotPackages', 'snapshot_packages', MODEL, 'DescribeSnapshotPackageResponseBodySnapshotPackages'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeSnapshotPackageResponseBodySnapshotPackages': (
+        ('SnapshotPackage', 'snapshot_package', MODEL_LIST, 'DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage'),
+    ),
+    'DescribeSnapshotPackageResponseBodySnapshotPackagesSnapshotPackage': (
+        ('DisplayName', 'display_name', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InitCapacity', 'init_capacity', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'DescribeSnapshotsRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeSnapshotsRequestFilter'),
+        ('Category', 'category', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotIds', 'snapshot_ids', SCALAR, None),
+        ('SnapshotLinkId', 'snapshot_link_id', SCALAR, None),
+        ('SnapshotName', 'snapshot_name', SCALAR, None),
+        ('SnapshotType', 'snapshot_type', SCALAR, None),
+        ('SourceDiskType', 'source_disk_type', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSnapshotsRequestTag'),
+        ('Usage', 'usage', SCALAR, None),
+    ),
+    'DescribeSnapshotsRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSnapshotsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeSnapshotsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotsResponseBody'),
+    ),
+    'DescribeSnapshotsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Snapshots', 'snapshots', MODEL, 'DescribeSnapshotsResponseBodySnapshots'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeSnapshotsResponseBodySnapshots': (
+        ('Snapshot', 'snapshot', MODEL_LIST, 'DescribeSnapshotsResponseBodySnapshotsSnapshot'),
+    ),
+    'DescribeSnapshotsResponseBodySnapshotsSnapshot': (
+        ('Available', 'available', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('InstantAccess', 'instant_access', SCALAR, None),
+        ('InstantAccessRetentionDays', 'instant_access_retention_days', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('LastModifiedTime', 'last_modified_time', SCALAR, None),
+        ('ProductCode', 'product_code', SCALAR, None),
+        ('Progress', 'progress', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemainTime', 'remain_time', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('SnapshotLinkId', 'snapshot_link_id', SCALAR, None),
+        ('SnapshotName', 'snapshot_name', SCALAR, None),
+        ('SnapshotSN', 'snapshot_sn', SCALAR, None),
+        ('SnapshotType', 'snapshot_type', SCALAR, None),
+        ('SourceDiskId', 'source_disk_id', SCALAR, None),
+        ('SourceDiskSize', 'source_disk_size', SCALAR, None),
+        ('SourceDiskType', 'source_disk_type', SCALAR, None),
+        ('SourceRegionId', 'source_region_id', SCALAR, None),
+        ('SourceSnapshotId', 'source_snapshot_id', SCALAR, None),
+        ('SourceStorageType', 'source_storage_type', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeSnapshotsResponseBodySnapshotsSnapshotTags'),
+        ('Usage', 'usage', SCALAR, None),
+    ),
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag'),
+    ),
+    'DescribeSnapshotsResponseBodySnapshotsSnapshotTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeSnapshotsUsageRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeSnapshotsUsageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSnapshotsUsageResponseBody'),
+    ),
+    'DescribeSnapshotsUsageResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SnapshotCount', 'snapshot_count', SCALAR, None),
+        ('SnapshotSize', 'snapshot_size', SCALAR, None),
+    ),
+    'DescribeSpotAdviceRequest': (
+        ('Cores', 'cores', SCALAR, None),
+        ('GpuAmount', 'gpu_amount', SCALAR, None),
+        ('GpuSpec', 'gpu_spec', SCALAR, None),
+        ('InstanceFamilyLevel', 'instance_family_level', SCALAR, None),
+        ('InstanceTypeFamily', 'instance_type_family', SCALAR, None),
+        ('InstanceTypes', 'instance_types', SCALAR, None),
+        ('Memory', 'memory', SCALAR, None),
+        ('MinCores', 'min_cores', SCALAR, None),
+        ('MinMemory', 'min_memory', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeSpotAdviceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSpotAdviceResponseBody'),
+    ),
+    'DescribeSpotAdviceResponseBody': (
+        ('AvailableSpotZones', 'available_spot_zones', MODEL, 'DescribeSpotAdviceResponseBodyAvailableSpotZones'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DescribeSpotAdviceResponseBodyAvailableSpotZones': (
+        ('AvailableSpotZone', 'available_spot_zone', MODEL_LIST, 'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone'),
+    ),
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZone': (
+        ('AvailableSpotResources', 'available_spot_resources', MODEL, 'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResources': (
+        ('AvailableSpotResource', 'available_spot_resource', MODEL_LIST, 'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource'),
+    ),
+    'DescribeSpotAdviceResponseBodyAvailableSpotZonesAvailableSpotZoneAvailableSpotResourcesAvailableSpotResource': (
+        ('AverageSpotDiscount', 'average_spot_discount', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InterruptRateDesc', 'interrupt_rate_desc', SCALAR, None),
+        ('InterruptionRate', 'interruption_rate', SCALAR, None),
+    ),
+    'DescribeSpotPriceHistoryRequest': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('Offset', 'offset', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeSpotPriceHistoryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeSpotPriceHistoryResponseBody'),
+    ),
+    'DescribeSpotPriceHistoryResponseBody': (
+        ('Currency', 'currency', SCALAR, None),
+        ('NextOffset', 'next_offset', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SpotPrices', 'spot_prices', MODEL, 'DescribeSpotPriceHistoryResponseBodySpotPrices'),
+    ),
+    'DescribeSpotPriceHistoryResponseBodySpotPrices': (
+        ('SpotPriceType', 'spot_price_type', MODEL_LIST, 'DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType'),
+    ),
+    'DescribeSpotPriceHistoryResponseBodySpotPricesSpotPriceType': (
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('NetworkType', 'network_type', SCALAR, None),
+        ('OriginPrice', 'origin_price', SCALAR, None),
+        ('SpotPrice', 'spot_price', SCALAR, None),
+        ('Timestamp', 'timestamp', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeStorageCapacityUnitsRequest': (
+        ('AllocationType', 'allocation_type', SCALAR, None),
+        ('Capacity', 'capacity', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StorageCapacityUnitId', 'storage_capacity_unit_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeStorageCapacityUnitsRequestTag'),
+    ),
+    'DescribeStorageCapacityUnitsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeStorageCapacityUnitsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeStorageCapacityUnitsResponseBody'),
+    ),
+    'DescribeStorageCapacityUnitsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('StorageCapacityUnits', 'storage_capacity_units', MODEL, 'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnits': (
+        ('StorageCapacityUnit', 'storage_capacity_unit', MODEL_LIST, 'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit'),
+    ),
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnit': (
+        ('AllocationStatus', 'allocation_status', SCALAR, None),
+        ('Capacity', 'capacity', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('ExpiredTime', 'expired_time', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('StorageCapacityUnitId', 'storage_capacity_unit_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags'),
+    ),
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag'),
+    ),
+    'DescribeStorageCapacityUnitsResponseBodyStorageCapacityUnitsStorageCapacityUnitTagsTag': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeStorageSetDetailsRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DiskIds', 'disk_ids', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+    ),
+    'DescribeStorageSetDetailsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeStorageSetDetailsResponseBody'),
+    ),
+    'DescribeStorageSetDetailsResponseBody': (
+        ('Disks', 'disks', MODEL, 'DescribeStorageSetDetailsResponseBodyDisks'),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeStorageSetDetailsResponseBodyDisks': (
+        ('Disk', 'disk', MODEL_LIST, 'DescribeStorageSetDetailsResponseBodyDisksDisk'),
+    ),
+    'DescribeStorageSetDetailsResponseBodyDisksDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeStorageSetsRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageSetIds', 'storage_set_ids', SCALAR, None),
+        ('StorageSetName', 'storage_set_name', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeStorageSetsRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeStorageSetsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeStorageSetsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeStorageSetsResponseBody'),
+    ),
+    'DescribeStorageSetsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('StorageSets', 'storage_sets', MODEL, 'DescribeStorageSetsResponseBodyStorageSets'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeStorageSetsResponseBodyStorageSets': (
+        ('StorageSet', 'storage_set', MODEL_LIST, 'DescribeStorageSetsResponseBodyStorageSetsStorageSet'),
+    ),
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSet': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetName', 'storage_set_name', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeStorageSetsResponseBodyStorageSetsStorageSetTags'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag'),
+    ),
+    'DescribeStorageSetsResponseBodyStorageSetsStorageSetTagsTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeTagsRequest': (
+        ('Category', 'category', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'DescribeTagsRequestTag'),
+    ),
+    'DescribeTagsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeTagsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeTagsResponseBody'),
+    ),
+    'DescribeTagsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Tags', 'tags', MODEL, 'DescribeTagsResponseBodyTags'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeTagsResponseBodyTags': (
+        ('Tag', 'tag', MODEL_LIST, 'DescribeTagsResponseBodyTagsTag'),
+    ),
+    'DescribeTagsResponseBodyTagsTag': (
+        ('ResourceTypeCount', 'resource_type_count', MODEL, 'DescribeTagsResponseBodyTagsTagResourceTypeCount'),
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'DescribeTagsResponseBodyTagsTagResourceTypeCount': (
+        ('Ddh', 'ddh', SCALAR, None),
+        ('Disk', 'disk', SCALAR, None),
+        ('Eni', 'eni', SCALAR, None),
+        ('Image', 'image', SCALAR, None),
+        ('Instance', 'instance', SCALAR, None),
+        ('KeyPair', 'key_pair', SCALAR, None),
+        ('LaunchTemplate', 'launch_template', SCALAR, None),
+        ('ReservedInstance', 'reserved_instance', SCALAR, None),
+        ('Securitygroup', 'securitygroup', SCALAR, None),
+        ('Snapshot', 'snapshot', SCALAR, None),
+        ('SnapshotPolicy', 'snapshot_policy', SCALAR, None),
+        ('Volume', 'volume', SCALAR, None),
+    ),
+    'DescribeTaskAttributeRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'DescribeTaskAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeTaskAttributeResponseBody'),
+    ),
+    'DescribeTaskAttributeResponseBody': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('FailedCount', 'failed_count', SCALAR, None),
+        ('FinishedTime', 'finished_time', SCALAR, None),
+        ('OperationProgressSet', 'operation_progress_set', MODEL, 'DescribeTaskAttributeResponseBodyOperationProgressSet'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SuccessCount', 'success_count', SCALAR, None),
+        ('SupportCancel', 'support_cancel', SCALAR, None),
+        ('TaskAction', 'task_action', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+        ('TaskProcess', 'task_process', SCALAR, None),
+        ('TaskStatus', 'task_status', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeTaskAttributeResponseBodyOperationProgressSet': (
+        ('OperationProgress', 'operation_progress', MODEL_LIST, 'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress'),
+    ),
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgress': (
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorMsg', 'error_msg', SCALAR, None),
+        ('OperationStatus', 'operation_status', SCALAR, None),
+        ('RelatedItemSet', 'related_item_set', MODEL, 'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet'),
+    ),
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSet': (
+        ('RelatedItem', 'related_item', MODEL_LIST, 'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem'),
+    ),
+    'DescribeTaskAttributeResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': (
+        ('Name', 'name', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeTasksRequest': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceIds', 'resource_ids', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('TaskAction', 'task_action', SCALAR, None),
+        ('TaskIds', 'task_ids', SCALAR, None),
+        ('TaskStatus', 'task_status', SCALAR, None),
+    ),
+    'DescribeTasksResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeTasksResponseBody'),
+    ),
+    'DescribeTasksResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskSet', 'task_set', MODEL, 'DescribeTasksResponseBodyTaskSet'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DescribeTasksResponseBodyTaskSet': (
+        ('Task', 'task', MODEL_LIST, 'DescribeTasksResponseBodyTaskSetTask'),
+    ),
+    'DescribeTasksResponseBodyTaskSetTask': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('FinishedTime', 'finished_time', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('SupportCancel', 'support_cancel', SCALAR, None),
+        ('TaskAction', 'task_action', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+        ('TaskStatus', 'task_status', SCALAR, None),
+    ),
+    'DescribeTerminalSessionsRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SessionId', 'session_id', SCALAR, None),
+    ),
+    'DescribeTerminalSessionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeTerminalSessionsResponseBody'),
+    ),
+    'DescribeTerminalSessionsResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Sessions', 'sessions', MODEL, 'DescribeTerminalSessionsResponseBodySessions'),
+    ),
+    'DescribeTerminalSessionsResponseBodySessions': (
+        ('Session', 'session', MODEL_LIST, 'DescribeTerminalSessionsResponseBodySessionsSession'),
+    ),
+    'DescribeTerminalSessionsResponseBodySessionsSession': (
+        ('ClientIP', 'client_ip', SCALAR, None),
+        ('Connections', 'connections', MODEL, 'DescribeTerminalSessionsResponseBodySessionsSessionConnections'),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('IdentityType', 'identity_type', SCALAR, None),
+        ('PortNumber', 'port_number', SCALAR, None),
+        ('PrincipalId', 'principal_id', SCALAR, None),
+        ('SessionId', 'session_id', SCALAR, None),
+        ('TargetServer', 'target_server', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+    ),
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnections': (
+        ('Connection', 'connection', MODEL_LIST, 'DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection'),
+    ),
+    'DescribeTerminalSessionsResponseBodySessionsSessionConnectionsConnection': (
+        ('ClosedReason', 'closed_reason', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('FailedDetail', 'failed_detail', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'DescribeUserBusinessBehaviorRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('statusKey', 'status_key', SCALAR, None),
+    ),
+    'DescribeUserBusinessBehaviorResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeUserBusinessBehaviorResponseBody'),
+    ),
+    'DescribeUserBusinessBehaviorResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('StatusValue', 'status_value', SCALAR, None),
+    ),
+    'DescribeUserDataRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeUserDataResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeUserDataResponseBody'),
+    ),
+    'DescribeUserDataResponseBody': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('UserData', 'user_data', SCALAR, None),
+    ),
+    'DescribeVRoutersRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+    ),
+    'DescribeVRoutersResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeVRoutersResponseBody'),
+    ),
+    'DescribeVRoutersResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('VRouters', 'vrouters', MODEL, 'DescribeVRoutersResponseBodyVRouters'),
+    ),
+    'DescribeVRoutersResponseBodyVRouters': (
+        ('VRouter', 'vrouter', MODEL_LIST, 'DescribeVRoutersResponseBodyVRoutersVRouter'),
+    ),
+    'DescribeVRoutersResponseBodyVRoutersVRouter': (
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RouteTableIds', 'route_table_ids', MODEL, 'DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds'),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+        ('VRouterName', 'vrouter_name', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeVRoutersResponseBodyVRoutersVRouterRouteTableIds': (
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+    ),
+    'DescribeVSwitchesRequest': (
+        ('IsDefault', 'is_default', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeVSwitchesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeVSwitchesResponseBody'),
+    ),
+    'DescribeVSwitchesResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('VSwitches', 'v_switches', MODEL, 'DescribeVSwitchesResponseBodyVSwitches'),
+    ),
+    'DescribeVSwitchesResponseBodyVSwitches': (
+        ('VSwitch', 'v_switch', MODEL_LIST, 'DescribeVSwitchesResponseBodyVSwitchesVSwitch'),
+    ),
+    'DescribeVSwitchesResponseBodyVSwitchesVSwitch': (
+        ('AvailableIpAddressCount', 'available_ip_address_count', SCALAR, None),
+        ('CidrBlock', 'cidr_block', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('IsDefault', 'is_default', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VSwitchName', 'v_switch_name', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter'),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody'),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('VirtualBorderRouterForPhysicalConnectionSet', 'virtual_border_router_for_physical_connection_set', MODEL, 'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet'),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSet': (
+        ('VirtualBorderRouterForPhysicalConnectionType', 'virtual_border_router_for_physical_connection_type', MODEL_LIST, 'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType'),
+    ),
+    'DescribeVirtualBorderRoutersForPhysicalConnectionResponseBodyVirtualBorderRouterForPhysicalConnectionSetVirtualBorderRouterForPhysicalConnectionType': (
+        ('ActivationTime', 'activation_time', SCALAR, None),
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('RecoveryTime', 'recovery_time', SCALAR, None),
+        ('TerminationTime', 'termination_time', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+        ('VbrOwnerUid', 'vbr_owner_uid', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersRequest': (
+        ('Filter', 'filter', MODEL_LIST, 'DescribeVirtualBorderRoutersRequestFilter'),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersRequestFilter': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'DescribeVirtualBorderRoutersResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeVirtualBorderRoutersResponseBody'),
+    ),
+    'DescribeVirtualBorderRoutersResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('VirtualBorderRouterSet', 'virtual_border_router_set', MODEL, 'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet'),
+    ),
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSet': (
+        ('VirtualBorderRouterType', 'virtual_border_router_type', MODEL_LIST, 'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType'),
+    ),
+    'DescribeVirtualBorderRoutersResponseBodyVirtualBorderRouterSetVirtualBorderRouterType': (
+        ('AccessPointId', 'access_point_id', SCALAR, None),
+        ('ActivationTime', 'activation_time', SCALAR, None),
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('LocalGatewayIp', 'local_gateway_ip', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('PeerGatewayIp', 'peer_gateway_ip', SCALAR, None),
+        ('PeeringSubnetMask', 'peering_subnet_mask', SCALAR, None),
+        ('PhysicalConnectionBusinessStatus', 'physical_connection_business_status', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('PhysicalConnectionOwnerUid', 'physical_connection_owner_uid', SCALAR, None),
+        ('PhysicalConnectionStatus', 'physical_connection_status', SCALAR, None),
+        ('RecoveryTime', 'recovery_time', SCALAR, None),
+        ('RouteTableId', 'route_table_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('TerminationTime', 'termination_time', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+        ('VlanInterfaceId', 'vlan_interface_id', SCALAR, None),
+    ),
+    'DescribeVpcsRequest': (
+        ('IsDefault', 'is_default', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DescribeVpcsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeVpcsResponseBody'),
+    ),
+    'DescribeVpcsResponseBody': (
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+        ('Vpcs', 'vpcs', MODEL, 'DescribeVpcsResponseBodyVpcs'),
+    ),
+    'DescribeVpcsResponseBodyVpcs': (
+        ('Vpc', 'vpc', MODEL_LIST, 'DescribeVpcsResponseBodyVpcsVpc'),
+    ),
+    'DescribeVpcsResponseBodyVpcsVpc': (
+        ('CidrBlock', 'cidr_block', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('IsDefault', 'is_default', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+        ('UserCidrs', 'user_cidrs', MODEL, 'DescribeVpcsResponseBodyVpcsVpcUserCidrs'),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+        ('VSwitchIds', 'v_switch_ids', MODEL, 'DescribeVpcsResponseBodyVpcsVpcVSwitchIds'),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('VpcName', 'vpc_name', SCALAR, None),
+    ),
+    'DescribeVpcsResponseBodyVpcsVpcUserCidrs': (
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'DescribeVpcsResponseBodyVpcsVpcVSwitchIds': (
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'DescribeZonesRequest': (
+        ('AcceptLanguage', 'accept_language', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('Verbose', 'verbose', SCALAR, None),
+    ),
+    'DescribeZonesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DescribeZonesResponseBody'),
+    ),
+    'DescribeZonesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Zones', 'zones', MODEL, 'DescribeZonesResponseBodyZones'),
+    ),
+    'DescribeZonesResponseBodyZones': (
+        ('Zone', 'zone', MODEL_LIST, 'DescribeZonesResponseBodyZonesZone'),
+    ),
+    'DescribeZonesResponseBodyZonesZone': (
+        ('AvailableDedicatedHostTypes', 'available_dedicated_host_types', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes'),
+        ('AvailableDiskCategories', 'available_disk_categories', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableDiskCategories'),
+        ('AvailableInstanceTypes', 'available_instance_types', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes'),
+        ('AvailableResourceCreation', 'available_resource_creation', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourceCreation'),
+        ('AvailableResources', 'available_resources', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResources'),
+        ('AvailableVolumeCategories', 'available_volume_categories', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories'),
+        ('DedicatedHostGenerations', 'dedicated_host_generations', MODEL, 'DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations'),
+        ('LocalName', 'local_name', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+        ('ZoneType', 'zone_type', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableDedicatedHostTypes': (
+        ('DedicatedHostType', 'dedicated_host_type', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableDiskCategories': (
+        ('DiskCategories', 'disk_categories', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableInstanceTypes': (
+        ('InstanceTypes', 'instance_types', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourceCreation': (
+        ('ResourceTypes', 'resource_types', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResources': (
+        ('ResourcesInfo', 'resources_info', MODEL_LIST, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo'),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfo': (
+        ('DataDiskCategories', 'data_disk_categories', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories'),
+        ('InstanceGenerations', 'instance_generations', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations'),
+        ('InstanceTypeFamilies', 'instance_type_families', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies'),
+        ('InstanceTypes', 'instance_types', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes'),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('NetworkTypes', 'network_types', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes'),
+        ('SystemDiskCategories', 'system_disk_categories', MODEL, 'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories'),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoDataDiskCategories': (
+        ('supportedDataDiskCategory', 'supported_data_disk_category', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceGenerations': (
+        ('supportedInstanceGeneration', 'supported_instance_generation', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypeFamilies': (
+        ('supportedInstanceTypeFamily', 'supported_instance_type_family', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoInstanceTypes': (
+        ('supportedInstanceType', 'supported_instance_type', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoNetworkTypes': (
+        ('supportedNetworkCategory', 'supported_network_category', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableResourcesResourcesInfoSystemDiskCategories': (
+        ('supportedSystemDiskCategory', 'supported_system_disk_category', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneAvailableVolumeCategories': (
+        ('VolumeCategories', 'volume_categories', SCALAR, None),
+    ),
+    'DescribeZonesResponseBodyZonesZoneDedicatedHostGenerations': (
+        ('DedicatedHostGeneration', 'dedicated_host_generation', SCALAR, None),
+    ),
+    'DetachClassicLinkVpcRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'DetachClassicLinkVpcResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DetachClassicLinkVpcResponseBody'),
+    ),
+    'DetachClassicLinkVpcResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DetachDiskRequest': (
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DetachDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DetachDiskResponseBody'),
+    ),
+    'DetachDiskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DetachInstanceRamRoleRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DetachInstanceRamRoleResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DetachInstanceRamRoleResponseBody'),
+    ),
+    'DetachInstanceRamRoleResponseBody': (
+        ('DetachInstanceRamRoleResults', 'detach_instance_ram_role_results', MODEL, 'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults'),
+        ('FailCount', 'fail_count', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResults': (
+        ('DetachInstanceRamRoleResult', 'detach_instance_ram_role_result', MODEL_LIST, 'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult'),
+    ),
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResult': (
+        ('Code', 'code', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceRamRoleSets', 'instance_ram_role_sets', MODEL, 'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets'),
+        ('Message', 'message', SCALAR, None),
+        ('Success', 'success', SCALAR, None),
+    ),
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSets': (
+        ('InstanceRamRoleSet', 'instance_ram_role_set', MODEL_LIST, 'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet'),
+    ),
+    'DetachInstanceRamRoleResponseBodyDetachInstanceRamRoleResultsDetachInstanceRamRoleResultInstanceRamRoleSetsInstanceRamRoleSet': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+    ),
+    'DetachKeyPairRequest': (
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DetachKeyPairResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DetachKeyPairResponseBody'),
+    ),
+    'DetachKeyPairResponseBody': (
+        ('FailCount', 'fail_count', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Results', 'results', MODEL, 'DetachKeyPairResponseBodyResults'),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'DetachKeyPairResponseBodyResults': (
+        ('Result', 'result', MODEL_LIST, 'DetachKeyPairResponseBodyResultsResult'),
+    ),
+    'DetachKeyPairResponseBodyResultsResult': (
+        ('Code', 'code', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('Success', 'success', SCALAR, None),
+    ),
+    'DetachNetworkInterfaceRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TrunkNetworkInstanceId', 'trunk_network_instance_id', SCALAR, None),
+    ),
+    'DetachNetworkInterfaceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DetachNetworkInterfaceResponseBody'),
+    ),
+    'DetachNetworkInterfaceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DisableActivationRequest': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DisableActivationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DisableActivationResponseBody'),
+    ),
+    'DisableActivationResponseBody': (
+        ('Activation', 'activation', MODEL, 'DisableActivationResponseBodyActivation'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DisableActivationResponseBodyActivation': (
+        ('ActivationId', 'activation_id', SCALAR, None),
+        ('CreationTime', 'creation_time', SCALAR, None),
+        ('DeregisteredCount', 'deregistered_count', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Disabled', 'disabled', SCALAR, None),
+        ('InstanceCount', 'instance_count', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('IpAddressRange', 'ip_address_range', SCALAR, None),
+        ('RegisteredCount', 'registered_count', SCALAR, None),
+        ('TimeToLiveInHours', 'time_to_live_in_hours', SCALAR, None),
+    ),
+    'DisableDiskEncryptionByDefaultRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DisableDiskEncryptionByDefaultResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DisableDiskEncryptionByDefaultResponseBody'),
+    ),
+    'DisableDiskEncryptionByDefaultResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'DisableNetworkInterfaceQoSRequest': (
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'DisableNetworkInterfaceQoSResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'DisableNetworkInterfaceQoSResponseBody'),
+    ),
+    'DisableNetworkInterfaceQoSResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'EnableDiskEncryptionByDefaultRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'EnableDiskEncryptionByDefaultResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'EnableDiskEncryptionByDefaultResponseBody'),
+    ),
+    'EnableDiskEncryptionByDefaultResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'EnableNetworkInterfaceQoSRequest': (
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('QoS', 'qo_s', MODEL, 'EnableNetworkInterfaceQoSRequestQoS'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'EnableNetworkInterfaceQoSRequestQoS': (
+        ('BandwidthRx', 'bandwidth_rx', SCALAR, None),
+        ('BandwidthTx', 'bandwidth_tx', SCALAR, None),
+        ('ConcurrentConnections', 'concurrent_connections', SCALAR, None),
+        ('PpsRx', 'pps_rx', SCALAR, None),
+        ('PpsTx', 'pps_tx', SCALAR, None),
+    ),
+    'EnableNetworkInterfaceQoSResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'EnableNetworkInterfaceQoSResponseBody'),
+    ),
+    'EnableNetworkInterfaceQoSResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'EnablePhysicalConnectionRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'EnablePhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'EnablePhysicalConnectionResponseBody'),
+    ),
+    'EnablePhysicalConnectionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'EndTerminalSessionRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SessionId', 'session_id', SCALAR, None),
+    ),
+    'EndTerminalSessionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'EndTerminalSessionResponseBody'),
+    ),
+    'EndTerminalSessionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ExportImageRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ImageFormat', 'image_format', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OSSBucket', 'ossbucket', SCALAR, None),
+        ('OSSPrefix', 'ossprefix', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RoleName', 'role_name', SCALAR, None),
+    ),
+    'ExportImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ExportImageResponseBody'),
+    ),
+    'ExportImageResponseBody': (
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ExportSnapshotRequest': (
+        ('OssBucket', 'oss_bucket', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RoleName', 'role_name', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'ExportSnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ExportSnapshotResponseBody'),
+    ),
+    'ExportSnapshotResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'GetInstanceConsoleOutputRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemoveSymbols', 'remove_symbols', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'GetInstanceConsoleOutputResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'GetInstanceConsoleOutputResponseBody'),
+    ),
+    'GetInstanceConsoleOutputResponseBody': (
+        ('ConsoleOutput', 'console_output', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('LastUpdateTime', 'last_update_time', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'GetInstanceScreenshotRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('WakeUp', 'wake_up', SCALAR, None),
+    ),
+    'GetInstanceScreenshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'GetInstanceScreenshotResponseBody'),
+    ),
+    'GetInstanceScreenshotResponseBody': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Screenshot', 'screenshot', SCALAR, None),
+    ),
+    'ImportImageRequest': (
+        ('Architecture', 'architecture', SCALAR, None),
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DetectionStrategy', 'detection_strategy', SCALAR, None),
+        ('DiskDeviceMapping', 'disk_device_mapping', MODEL_LIST, 'ImportImageRequestDiskDeviceMapping'),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Features', 'features', MODEL, 'ImportImageRequestFeatures'),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('LicenseType', 'license_type', SCALAR, None),
+        ('OSType', 'ostype', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RoleName', 'role_name', SCALAR, None),
+        ('StorageLocationArn', 'storage_location_arn', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'ImportImageRequestTag'),
+    ),
+    'ImportImageRequestDiskDeviceMapping': (
+        ('Device', 'device', SCALAR, None),
+        ('DiskImSize', 'disk_im_size', SCALAR, None),
+        ('DiskImageSize', 'disk_image_size', SCALAR, None),
+        ('Format', 'format', SCALAR, None),
+        ('OSSBucket', 'ossbucket', SCALAR, None),
+        ('OSSObject', 'ossobject', SCALAR, None),
+    ),
+    'ImportImageRequestFeatures': (
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'ImportImageRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'ImportImageResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ImportImageResponseBody'),
+    ),
+    'ImportImageResponseBody': (
+        ('ImageId', 'image_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ImportKeyPairRequest': (
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PublicKeyBody', 'public_key_body', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'ImportKeyPairRequestTag'),
+    ),
+    'ImportKeyPairRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'ImportKeyPairResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ImportKeyPairResponseBody'),
+    ),
+    'ImportKeyPairResponseBody': (
+        ('KeyPairFingerPrint', 'key_pair_finger_print', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'InstallCloudAssistantRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'InstallCloudAssistantResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'InstallCloudAssistantResponseBody'),
+    ),
+    'InstallCloudAssistantResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'InvokeCommandRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CommandId', 'command_id', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceTag', 'resource_tag', MODEL_LIST, 'InvokeCommandRequestResourceTag'),
+        ('Tag', 'tag', MODEL_LIST, 'InvokeCommandRequestTag'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+        ('WindowsPasswordName', 'windows_password_name', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'InvokeCommandRequestResourceTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'InvokeCommandRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'InvokeCommandResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'InvokeCommandResponseBody'),
+    ),
+    'InvokeCommandResponseBody': (
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'InvokeCommandShrinkRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CommandId', 'command_id', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters_shrink', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceTag', 'resource_tag', MODEL_LIST, 'InvokeCommandShrinkRequestResourceTag'),
+        ('Tag', 'tag', MODEL_LIST, 'InvokeCommandShrinkRequestTag'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+        ('WindowsPasswordName', 'windows_password_name', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'InvokeCommandShrinkRequestResourceTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'InvokeCommandShrinkRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'JoinResourceGroupRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'JoinResourceGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'JoinResourceGroupResponseBody'),
+    ),
+    'JoinResourceGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'JoinSecurityGroupRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'JoinSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'JoinSecurityGroupResponseBody'),
+    ),
+    'JoinSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'LeaveSecurityGroupRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'LeaveSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'LeaveSecurityGroupResponseBody'),
+    ),
+    'LeaveSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ListPluginStatusRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaxResults', 'max_results', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ListPluginStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ListPluginStatusResponseBody'),
+    ),
+    'ListPluginStatusResponseBody': (
+        ('InstancePluginStatusSet', 'instance_plugin_status_set', MODEL, 'ListPluginStatusResponseBodyInstancePluginStatusSet'),
+        ('NextToken', 'next_token', SCALAR, None),
+        ('PageNumber', 'page_number', SCALAR, None),
+        ('PageSize', 'page_size', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TotalCount', 'total_count', SCALAR, None),
+    ),
+    'ListPluginStatusResponseBodyInstancePluginStatusSet': (
+        ('InstancePluginStatus', 'instance_plugin_status', MODEL_LIST, 'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus'),
+    ),
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatus': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('PluginStatusSet', 'plugin_status_set', MODEL, 'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet'),
+    ),
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSet': (
+        ('PluginStatus', 'plugin_status', MODEL_LIST, 'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus'),
+    ),
+    'ListPluginStatusResponseBodyInstancePluginStatusSetInstancePluginStatusPluginStatusSetPluginStatus': (
+        ('FirstHeartbeatTime', 'first_heartbeat_time', SCALAR, None),
+        ('LastHeartbeatTime', 'last_heartbeat_time', SCALAR, None),
+        ('PluginName', 'plugin_name', SCALAR, None),
+        ('PluginStatus', 'plugin_status', SCALAR, None),
+        ('PluginVersion', 'plugin_version', SCALAR, None),
+    ),
+    'ListTagResourcesRequest': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'ListTagResourcesRequestTag'),
+        ('TagFilter', 'tag_filter', MODEL_LIST, 'ListTagResourcesRequestTagFilter'),
+    ),
+    'ListTagResourcesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'ListTagResourcesRequestTagFilter': (
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValues', 'tag_values', SCALAR, None),
+    ),
+    'ListTagResourcesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ListTagResourcesResponseBody'),
+    ),
+    'ListTagResourcesResponseBody': (
+        ('NextToken', 'next_token', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TagResources', 'tag_resources', MODEL, 'ListTagResourcesResponseBodyTagResources'),
+    ),
+    'ListTagResourcesResponseBodyTagResources': (
+        ('TagResource', 'tag_resource', MODEL_LIST, 'ListTagResourcesResponseBodyTagResourcesTagResource'),
+    ),
+    'ListTagResourcesResponseBodyTagResourcesTagResource': (
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('TagKey', 'tag_key', SCALAR, None),
+        ('TagValue', 'tag_value', SCALAR, None),
+    ),
+    'LockSnapshotRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CoolOffPeriod', 'cool_off_period', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('LockDuration', 'lock_duration', SCALAR, None),
+        ('LockMode', 'lock_mode', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'LockSnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'LockSnapshotResponseBody'),
+    ),
+    'LockSnapshotResponseBody': (
+        ('LockedSnapshotInfo', 'locked_snapshot_info', MODEL, 'LockSnapshotResponseBodyLockedSnapshotInfo'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'LockSnapshotResponseBodyLockedSnapshotInfo': (
+        ('CoolOffPeriod', 'cool_off_period', SCALAR, None),
+        ('CoolOffPeriodExpiredTime', 'cool_off_period_expired_time', SCALAR, None),
+        ('LockCreationTime', 'lock_creation_time', SCALAR, None),
+        ('LockDuration', 'lock_duration', SCALAR, None),
+        ('LockDurationStartTime', 'lock_duration_start_time', SCALAR, None),
+        ('LockExpiredTime', 'lock_expired_time', SCALAR, None),
+        ('LockStatus', 'lock_status', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'ModifyAutoProvisioningGroupRequest': (
+        ('AutoProvisioningGroupId', 'auto_provisioning_group_id', SCALAR, None),
+        ('AutoProvisioningGroupName', 'auto_provisioning_group_name', SCALAR, None),
+        ('DefaultTargetCapacityType', 'default_target_capacity_type', SCALAR, None),
+        ('ExcessCapacityTerminationPolicy', 'excess_capacity_termination_policy', SCALAR, None),
+        ('LaunchTemplateConfig', 'launch_template_config', MODEL_LIST, 'ModifyAutoProvisioningGroupRequestLaunchTemplateConfig'),
+        ('MaxSpotPrice', 'max_spot_price', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PayAsYouGoTargetCapacity', 'pay_as_you_go_target_capacity', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SpotTargetCapacity', 'spot_target_capacity', SCALAR, None),
+        ('TerminateInstancesWithExpiration', 'terminate_instances_with_expiration', SCALAR, None),
+        ('TotalTargetCapacity', 'total_target_capacity', SCALAR, None),
+    ),
+    'ModifyAutoProvisioningGroupRequestLaunchTemplateConfig': (
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MaxPrice', 'max_price', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('WeightedCapacity', 'weighted_capacity', SCALAR, None),
+    ),
+    'ModifyAutoProvisioningGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyAutoProvisioningGroupResponseBody'),
+    ),
+    'ModifyAutoProvisioningGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyAutoSnapshotPolicyExRequest': (
+        ('CopiedSnapshotsRetentionDays', 'copied_snapshots_retention_days', SCALAR, None),
+        ('CopyEncryptionConfiguration', 'copy_encryption_configuration', MODEL, 'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration'),
+        ('EnableCrossRegionCopy', 'enable_cross_region_copy', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TargetCopyRegions', 'target_copy_regions', SCALAR, None),
+        ('autoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('autoSnapshotPolicyName', 'auto_snapshot_policy_name', SCALAR, None),
+        ('regionId', 'region_id', SCALAR, None),
+        ('repeatWeekdays', 'repeat_weekdays', SCALAR, None),
+        ('retentionDays', 'retention_days', SCALAR, None),
+        ('timePoints', 'time_points', SCALAR, None),
+    ),
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfiguration': (
+        ('Arn', 'arn', MODEL_LIST, 'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn'),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+    ),
+    'ModifyAutoSnapshotPolicyExRequestCopyEncryptionConfigurationArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'ModifyAutoSnapshotPolicyExResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyAutoSnapshotPolicyExResponseBody'),
+    ),
+    'ModifyAutoSnapshotPolicyExResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyBandwidthPackageSpecRequest': (
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyBandwidthPackageSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyBandwidthPackageSpecResponseBody'),
+    ),
+    'ModifyBandwidthPackageSpecResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyCapacityReservationRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'ModifyCapacityReservationRequestPrivatePoolOptions'),
+        ('Description', 'description', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('EndTimeType', 'end_time_type', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'ModifyCapacityReservationRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'ModifyCapacityReservationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyCapacityReservationResponseBody'),
+    ),
+    'ModifyCapacityReservationResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsRequest': (
+        ('AgentUpgradeConfig', 'agent_upgrade_config', MODEL, 'ModifyCloudAssistantSettingsRequestAgentUpgradeConfig'),
+        ('OssDeliveryConfig', 'oss_delivery_config', MODEL, 'ModifyCloudAssistantSettingsRequestOssDeliveryConfig'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SessionManagerConfig', 'session_manager_config', MODEL, 'ModifyCloudAssistantSettingsRequestSessionManagerConfig'),
+        ('SettingType', 'setting_type', SCALAR, None),
+        ('SlsDeliveryConfig', 'sls_delivery_config', MODEL, 'ModifyCloudAssistantSettingsRequestSlsDeliveryConfig'),
+    ),
+    'ModifyCloudAssistantSettingsRequestAgentUpgradeConfig': (
+        ('AllowedUpgradeWindow', 'allowed_upgrade_window', SCALAR, None),
+        ('Enabled', 'enabled', SCALAR, None),
+        ('TimeZone', 'time_zone', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsRequestOssDeliveryConfig': (
+        ('BucketName', 'bucket_name', SCALAR, None),
+        ('Enabled', 'enabled', SCALAR, None),
+        ('EncryptionAlgorithm', 'encryption_algorithm', SCALAR, None),
+        ('EncryptionKeyId', 'encryption_key_id', SCALAR, None),
+        ('EncryptionType', 'encryption_type', SCALAR, None),
+        ('Prefix', 'prefix', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsRequestSessionManagerConfig': (
+        ('SessionManagerEnabled', 'session_manager_enabled', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsRequestSlsDeliveryConfig': (
+        ('Enabled', 'enabled', SCALAR, None),
+        ('LogstoreName', 'logstore_name', SCALAR, None),
+        ('ProjectName', 'project_name', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyCloudAssistantSettingsResponseBody'),
+    ),
+    'ModifyCloudAssistantSettingsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyCloudAssistantSettingsShrinkRequest': (
+        ('AgentUpgradeConfig', 'agent_upgrade_config_shrink', SCALAR, None),
+        ('OssDeliveryConfig', 'oss_delivery_config_shrink', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SessionManagerConfig', 'session_manager_config_shrink', SCALAR, None),
+        ('SettingType', 'setting_type', SCALAR, None),
+        ('SlsDeliveryConfig', 'sls_delivery_config_shrink', SCALAR, None),
+    ),
+    'ModifyCommandRequest': (
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('CommandId', 'command_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'ModifyCommandResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyCommandResponseBody'),
+    ),
+    'ModifyCommandResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAttributeRequest': (
+        ('NetworkAttributes', 'network_attributes', MODEL, 'ModifyDedicatedHostAttributeRequestNetworkAttributes'),
+        ('ActionOnMaintenance', 'action_on_maintenance', SCALAR, None),
+        ('AutoPlacement', 'auto_placement', SCALAR, None),
+        ('CpuOverCommitRatio', 'cpu_over_commit_ratio', SCALAR, None),
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DedicatedHostName', 'dedicated_host_name', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAttributeRequestNetworkAttributes': (
+        ('SlbUdpTimeout', 'slb_udp_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDedicatedHostAttributeResponseBody'),
+    ),
+    'ModifyDedicatedHostAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAutoReleaseTimeRequest': (
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAutoReleaseTimeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDedicatedHostAutoReleaseTimeResponseBody'),
+    ),
+    'ModifyDedicatedHostAutoReleaseTimeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAutoRenewAttributeRequest': (
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewWithEcs', 'auto_renew_with_ecs', SCALAR, None),
+        ('DedicatedHostIds', 'dedicated_host_ids', SCALAR, None),
+        ('Duration', 'duration', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDedicatedHostAutoRenewAttributeResponseBody'),
+    ),
+    'ModifyDedicatedHostAutoRenewAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostClusterAttributeRequest': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostClusterName', 'dedicated_host_cluster_name', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostClusterAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDedicatedHostClusterAttributeResponseBody'),
+    ),
+    'ModifyDedicatedHostClusterAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostsChargeTypeRequest': (
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DedicatedHostChargeType', 'dedicated_host_charge_type', SCALAR, None),
+        ('DedicatedHostIds', 'dedicated_host_ids', SCALAR, None),
+        ('DetailFee', 'detail_fee', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostsChargeTypeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDedicatedHostsChargeTypeResponseBody'),
+    ),
+    'ModifyDedicatedHostsChargeTypeResponseBody': (
+        ('FeeOfInstances', 'fee_of_instances', MODEL, 'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances'),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstances': (
+        ('FeeOfInstance', 'fee_of_instance', MODEL_LIST, 'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance'),
+    ),
+    'ModifyDedicatedHostsChargeTypeResponseBodyFeeOfInstancesFeeOfInstance': (
+        ('Currency', 'currency', SCALAR, None),
+        ('Fee', 'fee', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'ModifyDeploymentSetAttributeRequest': (
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('DeploymentSetName', 'deployment_set_name', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDeploymentSetAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDeploymentSetAttributeResponseBody'),
+    ),
+    'ModifyDeploymentSetAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDiagnosticMetricSetRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('MetricIds', 'metric_ids', SCALAR, None),
+        ('MetricSetId', 'metric_set_id', SCALAR, None),
+        ('MetricSetName', 'metric_set_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+    ),
+    'ModifyDiagnosticMetricSetResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiagnosticMetricSetResponseBody'),
+    ),
+    'ModifyDiagnosticMetricSetResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDiskAttributeRequest': (
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('DeleteAutoSnapshot', 'delete_auto_snapshot', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DiskIds', 'disk_ids', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EnableAutoSnapshot', 'enable_auto_snapshot', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDiskAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiskAttributeResponseBody'),
+    ),
+    'ModifyDiskAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDiskChargeTypeRequest': (
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DiskChargeType', 'disk_charge_type', SCALAR, None),
+        ('DiskIds', 'disk_ids', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDiskChargeTypeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiskChargeTypeResponseBody'),
+    ),
+    'ModifyDiskChargeTypeResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDiskDefaultKMSKeyIdRequest': (
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDiskDefaultKMSKeyIdResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiskDefaultKMSKeyIdResponseBody'),
+    ),
+    'ModifyDiskDefaultKMSKeyIdResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyDiskDeploymentRequest': (
+        ('DiskCategory', 'disk_category', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+    ),
+    'ModifyDiskDeploymentResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiskDeploymentResponseBody'),
+    ),
+    'ModifyDiskDeploymentResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ModifyDiskSpecRequest': (
+        ('DestinationZoneId', 'destination_zone_id', SCALAR, None),
+        ('DiskCategory', 'disk_category', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PerformanceControlOptions', 'performance_control_options', MODEL, 'ModifyDiskSpecRequestPerformanceControlOptions'),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyDiskSpecRequestPerformanceControlOptions': (
+        ('IOPS', 'iops', SCALAR, None),
+        ('Recover', 'recover', SCALAR, None),
+        ('Throughput', 'throughput', SCALAR, None),
+    ),
+    'ModifyDiskSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyDiskSpecResponseBody'),
+    ),
+    'ModifyDiskSpecResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ModifyEipAddressAttributeRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('Bandwidth', 'bandwidth', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyEipAddressAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyEipAddressAttributeResponseBody'),
+    ),
+    'ModifyEipAddressAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceAutoRenewAttributeRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceAutoRenewAttributeRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyElasticityAssuranceAutoRenewAttributeResponseBody'),
+    ),
+    'ModifyElasticityAssuranceAutoRenewAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'ModifyElasticityAssuranceRequestPrivatePoolOptions'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RecurrenceRules', 'recurrence_rules', MODEL_LIST, 'ModifyElasticityAssuranceRequestRecurrenceRules'),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceRequestRecurrenceRules': (
+        ('EndHour', 'end_hour', SCALAR, None),
+        ('RecurrenceType', 'recurrence_type', SCALAR, None),
+        ('RecurrenceValue', 'recurrence_value', SCALAR, None),
+        ('StartHour', 'start_hour', SCALAR, None),
+    ),
+    'ModifyElasticityAssuranceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyElasticityAssuranceResponseBody'),
+    ),
+    'ModifyElasticityAssuranceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyForwardEntryRequest': (
+        ('ExternalIp', 'external_ip', SCALAR, None),
+        ('ExternalPort', 'external_port', SCALAR, None),
+        ('ForwardEntryId', 'forward_entry_id', SCALAR, None),
+        ('ForwardTableId', 'forward_table_id', SCALAR, None),
+        ('InternalIp', 'internal_ip', SCALAR, None),
+        ('InternalPort', 'internal_port', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyForwardEntryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyForwardEntryResponseBody'),
+    ),
+    'ModifyForwardEntryResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyHaVipAttributeRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyHaVipAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyHaVipAttributeResponseBody'),
+    ),
+    'ModifyHaVipAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyHpcClusterAttributeRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyHpcClusterAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyHpcClusterAttributeResponseBody'),
+    ),
+    'ModifyHpcClusterAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyImageAttributeRequest': (
+        ('BootMode', 'boot_mode', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('Features', 'features', MODEL, 'ModifyImageAttributeRequestFeatures'),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageName', 'image_name', SCALAR, None),
+        ('LicenseType', 'license_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Status', 'status', SCALAR, None),
+    ),
+    'ModifyImageAttributeRequestFeatures': (
+        ('ImdsSupport', 'imds_support', SCALAR, None),
+        ('NvmeSupport', 'nvme_support', SCALAR, None),
+    ),
+    'ModifyImageAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyImageAttributeResponseBody'),
+    ),
+    'ModifyImageAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyImageShareGroupPermissionRequest': (
+        ('AddGroup', 'add_group', SCALAR, None),
+        ('RemoveGroup', 'remove_group', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyImageShareGroupPermissionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyImageShareGroupPermissionResponseBody'),
+    ),
+    'ModifyImageShareGroupPermissionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyImageSharePermissionRequest': (
+        ('AddAccount', 'add_account', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('IsPublic', 'is_public', SCALAR, None),
+        ('LaunchPermission', 'launch_permission', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemoveAccount', 'remove_account', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyImageSharePermissionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyImageSharePermissionResponseBody'),
+    ),
+    'ModifyImageSharePermissionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceAttachmentAttributesRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceAttachmentAttributesRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+    ),
+    'ModifyInstanceAttachmentAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceAttachmentAttributesResponseBody'),
+    ),
+    'ModifyInstanceAttachmentAttributesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceAttributeRequest': (
+        ('CpuOptions', 'cpu_options', MODEL, 'ModifyInstanceAttributeRequestCpuOptions'),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableJumboFrame', 'enable_jumbo_frame', SCALAR, None),
+        ('EnableNetworkEncryption', 'enable_network_encryption', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('NetworkInterfaceQueueNumber', 'network_interface_queue_number', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PrivateDnsNameOptions', 'private_dns_name_options', MODEL, 'ModifyInstanceAttributeRequestPrivateDnsNameOptions'),
+        ('Recyclable', 'recyclable', SCALAR, None),
+        ('RemoteConnectionOptions', 'remote_connection_options', MODEL, 'ModifyInstanceAttributeRequestRemoteConnectionOptions'),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('UserData', 'user_data', SCALAR, None),
+    ),
+    'ModifyInstanceAttributeRequestCpuOptions': (
+        ('Core', 'core', SCALAR, None),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+        ('TopologyType', 'topology_type', SCALAR, None),
+    ),
+    'ModifyInstanceAttributeRequestPrivateDnsNameOptions': (
+        ('EnableInstanceIdDnsAAAARecord', 'enable_instance_id_dns_aaaarecord', SCALAR, None),
+        ('EnableInstanceIdDnsARecord', 'enable_instance_id_dns_arecord', SCALAR, None),
+        ('EnableIpDnsARecord', 'enable_ip_dns_arecord', SCALAR, None),
+        ('EnableIpDnsPtrRecord', 'enable_ip_dns_ptr_record', SCALAR, None),
+        ('HostnameType', 'hostname_type', SCALAR, None),
+    ),
+    'ModifyInstanceAttributeRequestRemoteConnectionOptions': (
+        ('Password', 'password', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'ModifyInstanceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceAttributeResponseBody'),
+    ),
+    'ModifyInstanceAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceAutoReleaseTimeRequest': (
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceAutoReleaseTimeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceAutoReleaseTimeResponseBody'),
+    ),
+    'ModifyInstanceAutoReleaseTimeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceAutoRenewAttributeRequest': (
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('Duration', 'duration', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceAutoRenewAttributeResponseBody'),
+    ),
+    'ModifyInstanceAutoRenewAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceChargeTypeRequest': (
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('IncludeDataDisks', 'include_data_disks', SCALAR, None),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceIds', 'instance_ids', SCALAR, None),
+        ('IsDetailFee', 'is_detail_fee', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceChargeTypeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceChargeTypeResponseBody'),
+    ),
+    'ModifyInstanceChargeTypeResponseBody': (
+        ('FeeOfInstances', 'fee_of_instances', MODEL, 'ModifyInstanceChargeTypeResponseBodyFeeOfInstances'),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstances': (
+        ('FeeOfInstance', 'fee_of_instance', MODEL_LIST, 'ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance'),
+    ),
+    'ModifyInstanceChargeTypeResponseBodyFeeOfInstancesFeeOfInstance': (
+        ('Currency', 'currency', SCALAR, None),
+        ('Fee', 'fee', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+    ),
+    'ModifyInstanceClockOptionsRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PtpStatus', 'ptp_status', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceClockOptionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceClockOptionsResponseBody'),
+    ),
+    'ModifyInstanceClockOptionsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ModifyInstanceDeploymentRequest': (
+        ('Affinity', 'affinity', SCALAR, None),
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DeploymentSetGroupNo', 'deployment_set_group_no', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MigrationType', 'migration_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemoveFromDeploymentSet', 'remove_from_deployment_set', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tenancy', 'tenancy', SCALAR, None),
+    ),
+    'ModifyInstanceDeploymentResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceDeploymentResponseBody'),
+    ),
+    'ModifyInstanceDeploymentResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceMaintenanceAttributesRequest': (
+        ('ActionOnMaintenance', 'action_on_maintenance', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('MaintenanceWindow', 'maintenance_window', MODEL_LIST, 'ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow'),
+        ('NotifyOnMaintenance', 'notify_on_maintenance', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceMaintenanceAttributesRequestMaintenanceWindow': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'ModifyInstanceMaintenanceAttributesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceMaintenanceAttributesResponseBody'),
+    ),
+    'ModifyInstanceMaintenanceAttributesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceMetadataOptionsRequest': (
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceMetadataTags', 'instance_metadata_tags', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceMetadataOptionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceMetadataOptionsResponseBody'),
+    ),
+    'ModifyInstanceMetadataOptionsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceNetworkOptionsRequest': (
+        ('BandwidthWeighting', 'bandwidth_weighting', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceNetworkOptionsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceNetworkOptionsResponseBody'),
+    ),
+    'ModifyInstanceNetworkOptionsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ModifyInstanceNetworkSpecRequest': (
+        ('AllocatePublicIp', 'allocate_public_ip', SCALAR, None),
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('ISP', 'isp', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('NetworkChargeType', 'network_charge_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'ModifyInstanceNetworkSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceNetworkSpecResponseBody'),
+    ),
+    'ModifyInstanceNetworkSpecResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceSpecRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'ModifyInstanceSpecRequestSystemDisk'),
+        ('Temporary', 'temporary', MODEL, 'ModifyInstanceSpecRequestTemporary'),
+        ('AllowMigrateAcrossZone', 'allow_migrate_across_zone', SCALAR, None),
+        ('Async', 'async_', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Disk', 'disk', MODEL_LIST, 'ModifyInstanceSpecRequestDisk'),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('ModifyMode', 'modify_mode', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInstanceSpecRequestDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+    ),
+    'ModifyInstanceSpecRequestSystemDisk': (
+        ('Category', 'category', SCALAR, None),
+    ),
+    'ModifyInstanceSpecRequestTemporary': (
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'ModifyInstanceSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceSpecResponseBody'),
+    ),
+    'ModifyInstanceSpecResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceVncPasswdRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VncPassword', 'vnc_password', SCALAR, None),
+    ),
+    'ModifyInstanceVncPasswdResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceVncPasswdResponseBody'),
+    ),
+    'ModifyInstanceVncPasswdResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInstanceVpcAttributeRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+    ),
+    'ModifyInstanceVpcAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInstanceVpcAttributeResponseBody'),
+    ),
+    'ModifyInstanceVpcAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInvocationAttributeRequest': (
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyInvocationAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyInvocationAttributeResponseBody'),
+    ),
+    'ModifyInvocationAttributeResponseBody': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyInvocationAttributeShrinkRequest': (
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters_shrink', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyLaunchTemplateDefaultVersionRequest': (
+        ('DefaultVersionNumber', 'default_version_number', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyLaunchTemplateDefaultVersionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyLaunchTemplateDefaultVersionResponseBody'),
+    ),
+    'ModifyLaunchTemplateDefaultVersionResponseBody': (
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyManagedInstanceRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyManagedInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyManagedInstanceResponseBody'),
+    ),
+    'ModifyManagedInstanceResponseBody': (
+        ('Instance', 'instance', MODEL, 'ModifyManagedInstanceResponseBodyInstance'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyManagedInstanceResponseBodyInstance': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+    ),
+    'ModifyNetworkInterfaceAttributeRequest': (
+        ('ConnectionTrackingConfiguration', 'connection_tracking_configuration', MODEL, 'ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration'),
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnhancedNetwork', 'enhanced_network', MODEL, 'ModifyNetworkInterfaceAttributeRequestEnhancedNetwork'),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficConfig', 'network_interface_traffic_config', MODEL, 'ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RxQueueSize', 'rx_queue_size', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('TxQueueSize', 'tx_queue_size', SCALAR, None),
+    ),
+    'ModifyNetworkInterfaceAttributeRequestConnectionTrackingConfiguration': (
+        ('TcpClosedAndTimeWaitTimeout', 'tcp_closed_and_time_wait_timeout', SCALAR, None),
+        ('TcpEstablishedTimeout', 'tcp_established_timeout', SCALAR, None),
+        ('UdpTimeout', 'udp_timeout', SCALAR, None),
+    ),
+    'ModifyNetworkInterfaceAttributeRequestEnhancedNetwork': (
+        ('EnableRss', 'enable_rss', SCALAR, None),
+        ('EnableSriov', 'enable_sriov', SCALAR, None),
+        ('VirtualFunctionQuantity', 'virtual_function_quantity', SCALAR, None),
+        ('VirtualFunctionTotalQueueNumber', 'virtual_function_total_queue_number', SCALAR, None),
+    ),
+    'ModifyNetworkInterfaceAttributeRequestNetworkInterfaceTrafficConfig': (
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('RxQueueSize', 'rx_queue_size', SCALAR, None),
+        ('TxQueueSize', 'tx_queue_size', SCALAR, None),
+    ),
+    'ModifyNetworkInterfaceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyNetworkInterfaceAttributeResponseBody'),
+    ),
+    'ModifyNetworkInterfaceAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyPhysicalConnectionAttributeRequest': (
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('LineOperator', 'line_operator', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeerLocation', 'peer_location', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('PortType', 'port_type', SCALAR, None),
+        ('RedundantPhysicalConnectionId', 'redundant_physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('bandwidth', 'bandwidth', SCALAR, None),
+    ),
+    'ModifyPhysicalConnectionAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyPhysicalConnectionAttributeResponseBody'),
+    ),
+    'ModifyPhysicalConnectionAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyPortRangeListRequest': (
+        ('AddEntry', 'add_entry', MODEL_LIST, 'ModifyPortRangeListRequestAddEntry'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('PortRangeListName', 'port_range_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemoveEntry', 'remove_entry', MODEL_LIST, 'ModifyPortRangeListRequestRemoveEntry'),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyPortRangeListRequestAddEntry': (
+        ('Description', 'description', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+    ),
+    'ModifyPortRangeListRequestRemoveEntry': (
+        ('PortRange', 'port_range', SCALAR, None),
+    ),
+    'ModifyPortRangeListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyPortRangeListResponseBody'),
+    ),
+    'ModifyPortRangeListResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyPrefixListRequest': (
+        ('AddEntry', 'add_entry', MODEL_LIST, 'ModifyPrefixListRequestAddEntry'),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrefixListId', 'prefix_list_id', SCALAR, None),
+        ('PrefixListName', 'prefix_list_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemoveEntry', 'remove_entry', MODEL_LIST, 'ModifyPrefixListRequestRemoveEntry'),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyPrefixListRequestAddEntry': (
+        ('Cidr', 'cidr', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+    ),
+    'ModifyPrefixListRequestRemoveEntry': (
+        ('Cidr', 'cidr', SCALAR, None),
+    ),
+    'ModifyPrefixListResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyPrefixListResponseBody'),
+    ),
+    'ModifyPrefixListResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyPrepayInstanceSpecRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'ModifyPrepayInstanceSpecRequestSystemDisk'),
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Disk', 'disk', MODEL_LIST, 'ModifyPrepayInstanceSpecRequestDisk'),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('MigrateAcrossZone', 'migrate_across_zone', SCALAR, None),
+        ('ModifyMode', 'modify_mode', SCALAR, None),
+        ('OperatorType', 'operator_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RebootTime', 'reboot_time', SCALAR, None),
+        ('RebootWhenFinished', 'reboot_when_finished', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyPrepayInstanceSpecRequestDisk': (
+        ('Category', 'category', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+    ),
+    'ModifyPrepayInstanceSpecRequestSystemDisk': (
+        ('Category', 'category', SCALAR, None),
+    ),
+    'ModifyPrepayInstanceSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyPrepayInstanceSpecResponseBody'),
+    ),
+    'ModifyPrepayInstanceSpecResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyReservedInstanceAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ReservedInstanceName', 'reserved_instance_name', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyReservedInstanceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyReservedInstanceAttributeResponseBody'),
+    ),
+    'ModifyReservedInstanceAttributeResponseBody': (
+        ('Code', 'code', SCALAR, None),
+        ('HttpStatusCode', 'http_status_code', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyReservedInstanceAutoRenewAttributeRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RenewalStatus', 'renewal_status', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyReservedInstanceAutoRenewAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyReservedInstanceAutoRenewAttributeResponseBody'),
+    ),
+    'ModifyReservedInstanceAutoRenewAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyReservedInstancesRequest': (
+        ('Configuration', 'configuration', MODEL_LIST, 'ModifyReservedInstancesRequestConfiguration'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ModifyReservedInstancesRequestConfiguration': (
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('ReservedInstanceName', 'reserved_instance_name', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'ModifyReservedInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyReservedInstancesResponseBody'),
+    ),
+    'ModifyReservedInstancesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ReservedInstanceIdSets', 'reserved_instance_id_sets', MODEL, 'ModifyReservedInstancesResponseBodyReservedInstanceIdSets'),
+    ),
+    'ModifyReservedInstancesResponseBodyReservedInstanceIdSets': (
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+    ),
+    'ModifyRouterInterfaceAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('HealthCheckSourceIp', 'health_check_source_ip', SCALAR, None),
+        ('HealthCheckTargetIp', 'health_check_target_ip', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OppositeInterfaceId', 'opposite_interface_id', SCALAR, None),
+        ('OppositeInterfaceOwnerId', 'opposite_interface_owner_id', SCALAR, None),
+        ('OppositeRouterId', 'opposite_router_id', SCALAR, None),
+        ('OppositeRouterType', 'opposite_router_type', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+    ),
+    'ModifyRouterInterfaceAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyRouterInterfaceAttributeResponseBody'),
+    ),
+    'ModifyRouterInterfaceAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyRouterInterfaceSpecRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RouterInterfaceId', 'router_interface_id', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'ModifyRouterInterfaceSpecResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyRouterInterfaceSpecResponseBody'),
+    ),
+    'ModifyRouterInterfaceSpecResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('Spec', 'spec', SCALAR, None),
+    ),
+    'ModifySecurityGroupAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupName', 'security_group_name', SCALAR, None),
+    ),
+    'ModifySecurityGroupAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySecurityGroupAttributeResponseBody'),
+    ),
+    'ModifySecurityGroupAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifySecurityGroupEgressRuleRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestGroupOwnerId', 'dest_group_owner_id', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupRuleId', 'security_group_rule_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+    ),
+    'ModifySecurityGroupEgressRuleResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySecurityGroupEgressRuleResponseBody'),
+    ),
+    'ModifySecurityGroupEgressRuleResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifySecurityGroupPolicyRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('InnerAccessPolicy', 'inner_access_policy', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+    ),
+    'ModifySecurityGroupPolicyResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySecurityGroupPolicyResponseBody'),
+    ),
+    'ModifySecurityGroupPolicyResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifySecurityGroupRuleRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupRuleId', 'security_group_rule_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourceGroupOwnerId', 'source_group_owner_id', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+    ),
+    'ModifySecurityGroupRuleResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySecurityGroupRuleResponseBody'),
+    ),
+    'ModifySecurityGroupRuleResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifySnapshotAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('DisableInstantAccess', 'disable_instant_access', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('SnapshotName', 'snapshot_name', SCALAR, None),
+    ),
+    'ModifySnapshotAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySnapshotAttributeResponseBody'),
+    ),
+    'ModifySnapshotAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifySnapshotCategoryRequest': (
+        ('Category', 'category', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('RetentionDays', 'retention_days', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'ModifySnapshotCategoryResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySnapshotCategoryResponseBody'),
+    ),
+    'ModifySnapshotCategoryResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ModifySnapshotGroupRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotGroupId', 'snapshot_group_id', SCALAR, None),
+    ),
+    'ModifySnapshotGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifySnapshotGroupResponseBody'),
+    ),
+    'ModifySnapshotGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyStorageCapacityUnitAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageCapacityUnitId', 'storage_capacity_unit_id', SCALAR, None),
+    ),
+    'ModifyStorageCapacityUnitAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyStorageCapacityUnitAttributeResponseBody'),
+    ),
+    'ModifyStorageCapacityUnitAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyStorageSetAttributeRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetName', 'storage_set_name', SCALAR, None),
+    ),
+    'ModifyStorageSetAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyStorageSetAttributeResponseBody'),
+    ),
+    'ModifyStorageSetAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyUserBusinessBehaviorRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('statusKey', 'status_key', SCALAR, None),
+        ('statusValue', 'status_value', SCALAR, None),
+    ),
+    'ModifyUserBusinessBehaviorResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyUserBusinessBehaviorResponseBody'),
+    ),
+    'ModifyUserBusinessBehaviorResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyVRouterAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VRouterId', 'vrouter_id', SCALAR, None),
+        ('VRouterName', 'vrouter_name', SCALAR, None),
+    ),
+    'ModifyVRouterAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyVRouterAttributeResponseBody'),
+    ),
+    'ModifyVRouterAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyVSwitchAttributeRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('VSwitchName', 'v_switch_name', SCALAR, None),
+    ),
+    'ModifyVSwitchAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyVSwitchAttributeResponseBody'),
+    ),
+    'ModifyVSwitchAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyVirtualBorderRouterAttributeRequest': (
+        ('CircuitCode', 'circuit_code', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('LocalGatewayIp', 'local_gateway_ip', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PeerGatewayIp', 'peer_gateway_ip', SCALAR, None),
+        ('PeeringSubnetMask', 'peering_subnet_mask', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+        ('VlanId', 'vlan_id', SCALAR, None),
+    ),
+    'ModifyVirtualBorderRouterAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyVirtualBorderRouterAttributeResponseBody'),
+    ),
+    'ModifyVirtualBorderRouterAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ModifyVpcAttributeRequest': (
+        ('CidrBlock', 'cidr_block', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VpcId', 'vpc_id', SCALAR, None),
+        ('VpcName', 'vpc_name', SCALAR, None),
+    ),
+    'ModifyVpcAttributeResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ModifyVpcAttributeResponseBody'),
+    ),
+    'ModifyVpcAttributeResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'OpenSnapshotServiceRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'OpenSnapshotServiceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'OpenSnapshotServiceResponseBody'),
+    ),
+    'OpenSnapshotServiceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'PurchaseElasticityAssuranceRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'PurchaseElasticityAssuranceRequestPrivatePoolOptions'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'PurchaseElasticityAssuranceRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+    ),
+    'PurchaseElasticityAssuranceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'PurchaseElasticityAssuranceResponseBody'),
+    ),
+    'PurchaseElasticityAssuranceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'PurchaseReservedInstancesOfferingRequest': (
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceAmount', 'instance_amount', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OfferingType', 'offering_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceName', 'reserved_instance_name', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Scope', 'scope', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'PurchaseReservedInstancesOfferingRequestTag'),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'PurchaseReservedInstancesOfferingRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'PurchaseReservedInstancesOfferingResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'PurchaseReservedInstancesOfferingResponseBody'),
+    ),
+    'PurchaseReservedInstancesOfferingResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ReservedInstanceIdSets', 'reserved_instance_id_sets', MODEL, 'PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets'),
+    ),
+    'PurchaseReservedInstancesOfferingResponseBodyReservedInstanceIdSets': (
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+    ),
+    'PurchaseStorageCapacityUnitRequest': (
+        ('Amount', 'amount', SCALAR, None),
+        ('Capacity', 'capacity', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('FromApp', 'from_app', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'PurchaseStorageCapacityUnitRequestTag'),
+    ),
+    'PurchaseStorageCapacityUnitRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'PurchaseStorageCapacityUnitResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'PurchaseStorageCapacityUnitResponseBody'),
+    ),
+    'PurchaseStorageCapacityUnitResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('StorageCapacityUnitIds', 'storage_capacity_unit_ids', MODEL, 'PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds'),
+    ),
+    'PurchaseStorageCapacityUnitResponseBodyStorageCapacityUnitIds': (
+        ('StorageCapacityUnitId', 'storage_capacity_unit_id', SCALAR, None),
+    ),
+    'ReActivateInstancesRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ReActivateInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReActivateInstancesResponseBody'),
+    ),
+    'ReActivateInstancesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ReInitDiskRequest': (
+        ('AutoStartInstance', 'auto_start_instance', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+    ),
+    'ReInitDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReInitDiskResponseBody'),
+    ),
+    'ReInitDiskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RebootInstanceRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RebootInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RebootInstanceResponseBody'),
+    ),
+    'RebootInstanceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RebootInstancesRequest': (
+        ('BatchOptimization', 'batch_optimization', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ForceReboot', 'force_reboot', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RebootInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RebootInstancesResponseBody'),
+    ),
+    'RebootInstancesResponseBody': (
+        ('InstanceResponses', 'instance_responses', MODEL, 'RebootInstancesResponseBodyInstanceResponses'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RebootInstancesResponseBodyInstanceResponses': (
+        ('InstanceResponse', 'instance_response', MODEL_LIST, 'RebootInstancesResponseBodyInstanceResponsesInstanceResponse'),
+    ),
+    'RebootInstancesResponseBodyInstanceResponsesInstanceResponse': (
+        ('Code', 'code', SCALAR, None),
+        ('CurrentStatus', 'current_status', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('PreviousStatus', 'previous_status', SCALAR, None),
+    ),
+    'RecoverVirtualBorderRouterRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+    ),
+    'RecoverVirtualBorderRouterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RecoverVirtualBorderRouterResponseBody'),
+    ),
+    'RecoverVirtualBorderRouterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RedeployDedicatedHostRequest': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('MigrationType', 'migration_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RedeployDedicatedHostResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RedeployDedicatedHostResponseBody'),
+    ),
+    'RedeployDedicatedHostResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RedeployInstanceRequest': (
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RedeployInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RedeployInstanceResponseBody'),
+    ),
+    'RedeployInstanceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TaskId', 'task_id', SCALAR, None),
+    ),
+    'ReleaseCapacityReservationRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'ReleaseCapacityReservationRequestPrivatePoolOptions'),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ReleaseCapacityReservationRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'ReleaseCapacityReservationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReleaseCapacityReservationResponseBody'),
+    ),
+    'ReleaseCapacityReservationResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ReleaseDedicatedHostRequest': (
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TerminateSubscription', 'terminate_subscription', SCALAR, None),
+    ),
+    'ReleaseDedicatedHostResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReleaseDedicatedHostResponseBody'),
+    ),
+    'ReleaseDedicatedHostResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ReleaseEipAddressRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ReleaseEipAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReleaseEipAddressResponseBody'),
+    ),
+    'ReleaseEipAddressResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ReleasePublicIpAddressRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('PublicIpAddress', 'public_ip_address', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+    ),
+    'ReleasePublicIpAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReleasePublicIpAddressResponseBody'),
+    ),
+    'ReleasePublicIpAddressResponseBody': (
+        ('RemainTimes', 'remain_times', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RemoveBandwidthPackageIpsRequest': (
+        ('BandwidthPackageId', 'bandwidth_package_id', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RemovedIpAddresses', 'removed_ip_addresses', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RemoveBandwidthPackageIpsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RemoveBandwidthPackageIpsResponseBody'),
+    ),
+    'RemoveBandwidthPackageIpsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RemoveTagsRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'RemoveTagsRequestTag'),
+    ),
+    'RemoveTagsRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RemoveTagsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RemoveTagsResponseBody'),
+    ),
+    'RemoveTagsResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RenewDedicatedHostsRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DedicatedHostIds', 'dedicated_host_ids', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RenewDedicatedHostsResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RenewDedicatedHostsResponseBody'),
+    ),
+    'RenewDedicatedHostsResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RenewElasticityAssurancesRequest': (
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'RenewElasticityAssurancesRequestPrivatePoolOptions'),
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RenewElasticityAssurancesRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+    ),
+    'RenewElasticityAssurancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RenewElasticityAssurancesResponseBody'),
+    ),
+    'RenewElasticityAssurancesResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('PrivatePoolOptionsIdSet', 'private_pool_options_id_set', MODEL, 'RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RenewElasticityAssurancesResponseBodyPrivatePoolOptionsIdSet': (
+        ('PrivatePoolOptionsId', 'private_pool_options_id', SCALAR, None),
+    ),
+    'RenewInstanceRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ExpectedRenewDay', 'expected_renew_day', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RenewInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RenewInstanceResponseBody'),
+    ),
+    'RenewInstanceResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RenewReservedInstancesRequest': (
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'RenewReservedInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RenewReservedInstancesResponseBody'),
+    ),
+    'RenewReservedInstancesResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('ReservedInstanceIdSets', 'reserved_instance_id_sets', MODEL, 'RenewReservedInstancesResponseBodyReservedInstanceIdSets'),
+    ),
+    'RenewReservedInstancesResponseBodyReservedInstanceIdSets': (
+        ('ReservedInstanceId', 'reserved_instance_id', SCALAR, None),
+    ),
+    'ReplaceSystemDiskRequest': (
+        ('SystemDisk', 'system_disk', MODEL, 'ReplaceSystemDiskRequestSystemDisk'),
+        ('Architecture', 'architecture', SCALAR, None),
+        ('Arn', 'arn', MODEL_LIST, 'ReplaceSystemDiskRequestArn'),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Platform', 'platform', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('UseAdditionalService', 'use_additional_service', SCALAR, None),
+    ),
+    'ReplaceSystemDiskRequestArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'ReplaceSystemDiskRequestSystemDisk': (
+        ('Size', 'size', SCALAR, None),
+    ),
+    'ReplaceSystemDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReplaceSystemDiskResponseBody'),
+    ),
+    'ReplaceSystemDiskResponseBody': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ReportInstancesStatusRequest': (
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('EndTime', 'end_time', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('IssueCategory', 'issue_category', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Reason', 'reason', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StartTime', 'start_time', SCALAR, None),
+    ),
+    'ReportInstancesStatusResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ReportInstancesStatusResponseBody'),
+    ),
+    'ReportInstancesStatusResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ResetDiskDefaultKMSKeyIdRequest': (
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ResetDiskDefaultKMSKeyIdResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ResetDiskDefaultKMSKeyIdResponseBody'),
+    ),
+    'ResetDiskDefaultKMSKeyIdResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ResetDiskRequest': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'ResetDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ResetDiskResponseBody'),
+    ),
+    'ResetDiskResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ResetDisksRequest': (
+        ('Disk', 'disk', MODEL_LIST, 'ResetDisksRequestDisk'),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'ResetDisksRequestDisk': (
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'ResetDisksResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ResetDisksResponseBody'),
+    ),
+    'ResetDisksResponseBody': (
+        ('OperationProgressSet', 'operation_progress_set', MODEL, 'ResetDisksResponseBodyOperationProgressSet'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'ResetDisksResponseBodyOperationProgressSet': (
+        ('OperationProgress', 'operation_progress', MODEL_LIST, 'ResetDisksResponseBodyOperationProgressSetOperationProgress'),
+    ),
+    'ResetDisksResponseBodyOperationProgressSetOperationProgress': (
+        ('ErrorCode', 'error_code', SCALAR, None),
+        ('ErrorMsg', 'error_msg', SCALAR, None),
+        ('OperationStatus', 'operation_status', SCALAR, None),
+        ('RelatedItemSet', 'related_item_set', MODEL, 'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet'),
+    ),
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSet': (
+        ('RelatedItem', 'related_item', MODEL_LIST, 'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem'),
+    ),
+    'ResetDisksResponseBodyOperationProgressSetOperationProgressRelatedItemSetRelatedItem': (
+        ('Name', 'name', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'ResizeDiskRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DiskId', 'disk_id', SCALAR, None),
+        ('NewSize', 'new_size', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+    ),
+    'ResizeDiskResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'ResizeDiskResponseBody'),
+    ),
+    'ResizeDiskResponseBody': (
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RevokeSecurityGroupEgressRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestGroupOwnerId', 'dest_group_owner_id', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Permissions', 'permissions', MODEL_LIST, 'RevokeSecurityGroupEgressRequestPermissions'),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupRuleId', 'security_group_rule_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+    ),
+    'RevokeSecurityGroupEgressRequestPermissions': (
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('DestGroupId', 'dest_group_id', SCALAR, None),
+        ('DestGroupOwnerAccount', 'dest_group_owner_account', SCALAR, None),
+        ('DestGroupOwnerId', 'dest_group_owner_id', SCALAR, None),
+        ('DestPrefixListId', 'dest_prefix_list_id', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+    ),
+    'RevokeSecurityGroupEgressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RevokeSecurityGroupEgressResponseBody'),
+    ),
+    'RevokeSecurityGroupEgressResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RevokeSecurityGroupRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Permissions', 'permissions', MODEL_LIST, 'RevokeSecurityGroupRequestPermissions'),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupRuleId', 'security_group_rule_id', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourceGroupOwnerId', 'source_group_owner_id', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+    ),
+    'RevokeSecurityGroupRequestPermissions': (
+        ('Description', 'description', SCALAR, None),
+        ('DestCidrIp', 'dest_cidr_ip', SCALAR, None),
+        ('IpProtocol', 'ip_protocol', SCALAR, None),
+        ('Ipv6DestCidrIp', 'ipv_6dest_cidr_ip', SCALAR, None),
+        ('Ipv6SourceCidrIp', 'ipv_6source_cidr_ip', SCALAR, None),
+        ('NicType', 'nic_type', SCALAR, None),
+        ('Policy', 'policy', SCALAR, None),
+        ('PortRange', 'port_range', SCALAR, None),
+        ('PortRangeListId', 'port_range_list_id', SCALAR, None),
+        ('Priority', 'priority', SCALAR, None),
+        ('SourceCidrIp', 'source_cidr_ip', SCALAR, None),
+        ('SourceGroupId', 'source_group_id', SCALAR, None),
+        ('SourceGroupOwnerAccount', 'source_group_owner_account', SCALAR, None),
+        ('SourceGroupOwnerId', 'source_group_owner_id', SCALAR, None),
+        ('SourcePortRange', 'source_port_range', SCALAR, None),
+        ('SourcePrefixListId', 'source_prefix_list_id', SCALAR, None),
+    ),
+    'RevokeSecurityGroupResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RevokeSecurityGroupResponseBody'),
+    ),
+    'RevokeSecurityGroupResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RunCommandRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KeepCommand', 'keep_command', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceTag', 'resource_tag', MODEL_LIST, 'RunCommandRequestResourceTag'),
+        ('Tag', 'tag', MODEL_LIST, 'RunCommandRequestTag'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+        ('WindowsPasswordName', 'windows_password_name', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'RunCommandRequestResourceTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RunCommandRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RunCommandResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RunCommandResponseBody'),
+    ),
+    'RunCommandResponseBody': (
+        ('CommandId', 'command_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'RunCommandShrinkRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('CommandContent', 'command_content', SCALAR, None),
+        ('ContainerId', 'container_id', SCALAR, None),
+        ('ContainerName', 'container_name', SCALAR, None),
+        ('ContentEncoding', 'content_encoding', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('EnableParameter', 'enable_parameter', SCALAR, None),
+        ('Frequency', 'frequency', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('KeepCommand', 'keep_command', SCALAR, None),
+        ('Launcher', 'launcher', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('OssOutputDelivery', 'oss_output_delivery', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Parameters', 'parameters_shrink', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('RepeatMode', 'repeat_mode', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceTag', 'resource_tag', MODEL_LIST, 'RunCommandShrinkRequestResourceTag'),
+        ('Tag', 'tag', MODEL_LIST, 'RunCommandShrinkRequestTag'),
+        ('TerminationMode', 'termination_mode', SCALAR, None),
+        ('Timed', 'timed', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+        ('Type', 'type', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+        ('WindowsPasswordName', 'windows_password_name', SCALAR, None),
+        ('WorkingDir', 'working_dir', SCALAR, None),
+    ),
+    'RunCommandShrinkRequestResourceTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RunCommandShrinkRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RunInstancesRequest': (
+        ('CpuOptions', 'cpu_options', MODEL, 'RunInstancesRequestCpuOptions'),
+        ('HibernationOptions', 'hibernation_options', MODEL, 'RunInstancesRequestHibernationOptions'),
+        ('PrivatePoolOptions', 'private_pool_options', MODEL, 'RunInstancesRequestPrivatePoolOptions'),
+        ('SchedulerOptions', 'scheduler_options', MODEL, 'RunInstancesRequestSchedulerOptions'),
+        ('SecurityOptions', 'security_options', MODEL, 'RunInstancesRequestSecurityOptions'),
+        ('SystemDisk', 'system_disk', MODEL, 'RunInstancesRequestSystemDisk'),
+        ('Affinity', 'affinity', SCALAR, None),
+        ('Amount', 'amount', SCALAR, None),
+        ('Arn', 'arn', MODEL_LIST, 'RunInstancesRequestArn'),
+        ('AutoPay', 'auto_pay', SCALAR, None),
+        ('AutoReleaseTime', 'auto_release_time', SCALAR, None),
+        ('AutoRenew', 'auto_renew', SCALAR, None),
+        ('AutoRenewPeriod', 'auto_renew_period', SCALAR, None),
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ClockOptions', 'clock_options', MODEL, 'RunInstancesRequestClockOptions'),
+        ('CreditSpecification', 'credit_specification', SCALAR, None),
+        ('DataDisk', 'data_disk', MODEL_LIST, 'RunInstancesRequestDataDisk'),
+        ('DedicatedHostId', 'dedicated_host_id', SCALAR, None),
+        ('DeletionProtection', 'deletion_protection', SCALAR, None),
+        ('DeploymentSetGroupNo', 'deployment_set_group_no', SCALAR, None),
+        ('DeploymentSetId', 'deployment_set_id', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('HostName', 'host_name', SCALAR, None),
+        ('HostNames', 'host_names', SCALAR, None),
+        ('HpcClusterId', 'hpc_cluster_id', SCALAR, None),
+        ('HttpEndpoint', 'http_endpoint', SCALAR, None),
+        ('HttpPutResponseHopLimit', 'http_put_response_hop_limit', SCALAR, None),
+        ('HttpTokens', 'http_tokens', SCALAR, None),
+        ('ImageFamily', 'image_family', SCALAR, None),
+        ('ImageId', 'image_id', SCALAR, None),
+        ('ImageOptions', 'image_options', MODEL, 'RunInstancesRequestImageOptions'),
+        ('InstanceChargeType', 'instance_charge_type', SCALAR, None),
+        ('InstanceName', 'instance_name', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('InternetChargeType', 'internet_charge_type', SCALAR, None),
+        ('InternetMaxBandwidthIn', 'internet_max_bandwidth_in', SCALAR, None),
+        ('InternetMaxBandwidthOut', 'internet_max_bandwidth_out', SCALAR, None),
+        ('IoOptimized', 'io_optimized', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('Isp', 'isp', SCALAR, None),
+        ('KeyPairName', 'key_pair_name', SCALAR, None),
+        ('LaunchTemplateId', 'launch_template_id', SCALAR, None),
+        ('LaunchTemplateName', 'launch_template_name', SCALAR, None),
+        ('LaunchTemplateVersion', 'launch_template_version', SCALAR, None),
+        ('MinAmount', 'min_amount', SCALAR, None),
+        ('NetworkInterface', 'network_interface', MODEL_LIST, 'RunInstancesRequestNetworkInterface'),
+        ('NetworkInterfaceQueueNumber', 'network_interface_queue_number', SCALAR, None),
+        ('NetworkOptions', 'network_options', MODEL, 'RunInstancesRequestNetworkOptions'),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('Password', 'password', SCALAR, None),
+        ('PasswordInherit', 'password_inherit', SCALAR, None),
+        ('Period', 'period', SCALAR, None),
+        ('PeriodUnit', 'period_unit', SCALAR, None),
+        ('PrivateDnsNameOptions', 'private_dns_name_options', MODEL, 'RunInstancesRequestPrivateDnsNameOptions'),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RamRoleName', 'ram_role_name', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SecurityEnhancementStrategy', 'security_enhancement_strategy', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SpotDuration', 'spot_duration', SCALAR, None),
+        ('SpotInterruptionBehavior', 'spot_interruption_behavior', SCALAR, None),
+        ('SpotPriceLimit', 'spot_price_limit', SCALAR, None),
+        ('SpotStrategy', 'spot_strategy', SCALAR, None),
+        ('StorageSetId', 'storage_set_id', SCALAR, None),
+        ('StorageSetPartitionNumber', 'storage_set_partition_number', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'RunInstancesRequestTag'),
+        ('Tenancy', 'tenancy', SCALAR, None),
+        ('UniqueSuffix', 'unique_suffix', SCALAR, None),
+        ('UserData', 'user_data', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+        ('ZoneId', 'zone_id', SCALAR, None),
+    ),
+    'RunInstancesRequestArn': (
+        ('AssumeRoleFor', 'assume_role_for', SCALAR, None),
+        ('RoleType', 'role_type', SCALAR, None),
+        ('Rolearn', 'rolearn', SCALAR, None),
+    ),
+    'RunInstancesRequestClockOptions': (
+        ('PtpStatus', 'ptp_status', SCALAR, None),
+    ),
+    'RunInstancesRequestCpuOptions': (
+        ('Core', 'core', SCALAR, None),
+        ('Numa', 'numa', SCALAR, None),
+        ('ThreadsPerCore', 'threads_per_core', SCALAR, None),
+        ('TopologyType', 'topology_type', SCALAR, None),
+    ),
+    'RunInstancesRequestDataDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('DeleteWithInstance', 'delete_with_instance', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('Device', 'device', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+    ),
+    'RunInstancesRequestHibernationOptions': (
+        ('Configured', 'configured', SCALAR, None),
+    ),
+    'RunInstancesRequestImageOptions': (
+        ('LoginAsNonRoot', 'login_as_non_root', SCALAR, None),
+    ),
+    'RunInstancesRequestNetworkInterface': (
+        ('DeleteOnRelease', 'delete_on_release', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('Ipv6AddressCount', 'ipv_6address_count', SCALAR, None),
+        ('NetworkCardIndex', 'network_card_index', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('NetworkInterfaceName', 'network_interface_name', SCALAR, None),
+        ('NetworkInterfaceTrafficMode', 'network_interface_traffic_mode', SCALAR, None),
+        ('PrimaryIpAddress', 'primary_ip_address', SCALAR, None),
+        ('QueueNumber', 'queue_number', SCALAR, None),
+        ('QueuePairNumber', 'queue_pair_number', SCALAR, None),
+        ('RxQueueSize', 'rx_queue_size', SCALAR, None),
+        ('SecondaryPrivateIpAddressCount', 'secondary_private_ip_address_count', SCALAR, None),
+        ('SecurityGroupId', 'security_group_id', SCALAR, None),
+        ('SecurityGroupIds', 'security_group_ids', SCALAR, None),
+        ('SourceDestCheck', 'source_dest_check', SCALAR, None),
+        ('TxQueueSize', 'tx_queue_size', SCALAR, None),
+        ('VSwitchId', 'v_switch_id', SCALAR, None),
+    ),
+    'RunInstancesRequestNetworkOptions': (
+        ('BandwidthWeighting', 'bandwidth_weighting', SCALAR, None),
+        ('EnableJumboFrame', 'enable_jumbo_frame', SCALAR, None),
+        ('EnableNetworkEncryption', 'enable_network_encryption', SCALAR, None),
+    ),
+    'RunInstancesRequestPrivateDnsNameOptions': (
+        ('EnableInstanceIdDnsAAAARecord', 'enable_instance_id_dns_aaaarecord', SCALAR, None),
+        ('EnableInstanceIdDnsARecord', 'enable_instance_id_dns_arecord', SCALAR, None),
+        ('EnableIpDnsARecord', 'enable_ip_dns_arecord', SCALAR, None),
+        ('EnableIpDnsPtrRecord', 'enable_ip_dns_ptr_record', SCALAR, None),
+        ('HostnameType', 'hostname_type', SCALAR, None),
+    ),
+    'RunInstancesRequestPrivatePoolOptions': (
+        ('Id', 'id', SCALAR, None),
+        ('MatchCriteria', 'match_criteria', SCALAR, None),
+    ),
+    'RunInstancesRequestSchedulerOptions': (
+        ('DedicatedHostClusterId', 'dedicated_host_cluster_id', SCALAR, None),
+    ),
+    'RunInstancesRequestSecurityOptions': (
+        ('ConfidentialComputingMode', 'confidential_computing_mode', SCALAR, None),
+        ('TrustedSystemMode', 'trusted_system_mode', SCALAR, None),
+    ),
+    'RunInstancesRequestSystemDisk': (
+        ('AutoSnapshotPolicyId', 'auto_snapshot_policy_id', SCALAR, None),
+        ('Category', 'category', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('DiskName', 'disk_name', SCALAR, None),
+        ('PerformanceLevel', 'performance_level', SCALAR, None),
+        ('Size', 'size', SCALAR, None),
+        ('BurstingEnabled', 'bursting_enabled', SCALAR, None),
+        ('EncryptAlgorithm', 'encrypt_algorithm', SCALAR, None),
+        ('Encrypted', 'encrypted', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('ProvisionedIops', 'provisioned_iops', SCALAR, None),
+        ('StorageClusterId', 'storage_cluster_id', SCALAR, None),
+    ),
+    'RunInstancesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'RunInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'RunInstancesResponseBody'),
+    ),
+    'RunInstancesResponseBody': (
+        ('InstanceIdSets', 'instance_id_sets', MODEL, 'RunInstancesResponseBodyInstanceIdSets'),
+        ('OrderId', 'order_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+        ('TradePrice', 'trade_price', SCALAR, None),
+    ),
+    'RunInstancesResponseBodyInstanceIdSets': (
+        ('InstanceIdSet', 'instance_id_set', SCALAR, None),
+    ),
+    'SendFileRequest': (
+        ('Content', 'content', SCALAR, None),
+        ('ContentType', 'content_type', SCALAR, None),
+        ('Description', 'description', SCALAR, None),
+        ('FileGroup', 'file_group', SCALAR, None),
+        ('FileMode', 'file_mode', SCALAR, None),
+        ('FileOwner', 'file_owner', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Name', 'name', SCALAR, None),
+        ('Overwrite', 'overwrite', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceGroupId', 'resource_group_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'SendFileRequestTag'),
+        ('TargetDir', 'target_dir', SCALAR, None),
+        ('Timeout', 'timeout', SCALAR, None),
+    ),
+    'SendFileRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'SendFileResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'SendFileResponseBody'),
+    ),
+    'SendFileResponseBody': (
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StartImagePipelineExecutionRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('ImagePipelineId', 'image_pipeline_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'StartImagePipelineExecutionRequestTag'),
+        ('TemplateTag', 'template_tag', MODEL_LIST, 'StartImagePipelineExecutionRequestTemplateTag'),
+    ),
+    'StartImagePipelineExecutionRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'StartImagePipelineExecutionRequestTemplateTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'StartImagePipelineExecutionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StartImagePipelineExecutionResponseBody'),
+    ),
+    'StartImagePipelineExecutionResponseBody': (
+        ('ExecutionId', 'execution_id', SCALAR, None),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StartInstanceRequest': (
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('InitLocalDisk', 'init_local_disk', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'StartInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StartInstanceResponseBody'),
+    ),
+    'StartInstanceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StartInstancesRequest': (
+        ('BatchOptimization', 'batch_optimization', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'StartInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StartInstancesResponseBody'),
+    ),
+    'StartInstancesResponseBody': (
+        ('InstanceResponses', 'instance_responses', MODEL, 'StartInstancesResponseBodyInstanceResponses'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StartInstancesResponseBodyInstanceResponses': (
+        ('InstanceResponse', 'instance_response', MODEL_LIST, 'StartInstancesResponseBodyInstanceResponsesInstanceResponse'),
+    ),
+    'StartInstancesResponseBodyInstanceResponsesInstanceResponse': (
+        ('Code', 'code', SCALAR, None),
+        ('CurrentStatus', 'current_status', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('PreviousStatus', 'previous_status', SCALAR, None),
+    ),
+    'StartTerminalSessionRequest': (
+        ('CommandLine', 'command_line', SCALAR, None),
+        ('ConnectionType', 'connection_type', SCALAR, None),
+        ('EncryptionOptions', 'encryption_options', MODEL, 'StartTerminalSessionRequestEncryptionOptions'),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PasswordName', 'password_name', SCALAR, None),
+        ('PortNumber', 'port_number', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TargetServer', 'target_server', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+    ),
+    'StartTerminalSessionRequestEncryptionOptions': (
+        ('Enabled', 'enabled', SCALAR, None),
+        ('KMSKeyId', 'kmskey_id', SCALAR, None),
+        ('Mode', 'mode', SCALAR, None),
+    ),
+    'StartTerminalSessionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StartTerminalSessionResponseBody'),
+    ),
+    'StartTerminalSessionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+        ('SecurityToken', 'security_token', SCALAR, None),
+        ('SessionId', 'session_id', SCALAR, None),
+        ('WebSocketUrl', 'web_socket_url', SCALAR, None),
+    ),
+    'StartTerminalSessionShrinkRequest': (
+        ('CommandLine', 'command_line', SCALAR, None),
+        ('ConnectionType', 'connection_type', SCALAR, None),
+        ('EncryptionOptions', 'encryption_options_shrink', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PasswordName', 'password_name', SCALAR, None),
+        ('PortNumber', 'port_number', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('TargetServer', 'target_server', SCALAR, None),
+        ('Username', 'username', SCALAR, None),
+    ),
+    'StopInstanceRequest': (
+        ('ConfirmStop', 'confirm_stop', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('Hibernate', 'hibernate', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StoppedMode', 'stopped_mode', SCALAR, None),
+    ),
+    'StopInstanceResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StopInstanceResponseBody'),
+    ),
+    'StopInstanceResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StopInstancesRequest': (
+        ('BatchOptimization', 'batch_optimization', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('ForceStop', 'force_stop', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('StoppedMode', 'stopped_mode', SCALAR, None),
+    ),
+    'StopInstancesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StopInstancesResponseBody'),
+    ),
+    'StopInstancesResponseBody': (
+        ('InstanceResponses', 'instance_responses', MODEL, 'StopInstancesResponseBodyInstanceResponses'),
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'StopInstancesResponseBodyInstanceResponses': (
+        ('InstanceResponse', 'instance_response', MODEL_LIST, 'StopInstancesResponseBodyInstanceResponsesInstanceResponse'),
+    ),
+    'StopInstancesResponseBodyInstanceResponsesInstanceResponse': (
+        ('Code', 'code', SCALAR, None),
+        ('CurrentStatus', 'current_status', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('Message', 'message', SCALAR, None),
+        ('PreviousStatus', 'previous_status', SCALAR, None),
+    ),
+    'StopInvocationRequest': (
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InvokeId', 'invoke_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'StopInvocationResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'StopInvocationResponseBody'),
+    ),
+    'StopInvocationResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'TagResourcesRequest': (
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('Tag', 'tag', MODEL_LIST, 'TagResourcesRequestTag'),
+    ),
+    'TagResourcesRequestTag': (
+        ('Key', 'key', SCALAR, None),
+        ('Value', 'value', SCALAR, None),
+    ),
+    'TagResourcesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'TagResourcesResponseBody'),
+    ),
+    'TagResourcesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'TerminatePhysicalConnectionRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PhysicalConnectionId', 'physical_connection_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+    ),
+    'TerminatePhysicalConnectionResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'TerminatePhysicalConnectionResponseBody'),
+    ),
+    'TerminatePhysicalConnectionResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'TerminateVirtualBorderRouterRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('UserCidr', 'user_cidr', SCALAR, None),
+        ('VbrId', 'vbr_id', SCALAR, None),
+    ),
+    'TerminateVirtualBorderRouterResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'TerminateVirtualBorderRouterResponseBody'),
+    ),
+    'TerminateVirtualBorderRouterResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UnassignIpv6AddressesRequest': (
+        ('Ipv6Address', 'ipv_6address', SCALAR, None),
+        ('Ipv6Prefix', 'ipv_6prefix', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'UnassignIpv6AddressesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UnassignIpv6AddressesResponseBody'),
+    ),
+    'UnassignIpv6AddressesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UnassignPrivateIpAddressesRequest': (
+        ('Ipv4Prefix', 'ipv_4prefix', SCALAR, None),
+        ('NetworkInterfaceId', 'network_interface_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('PrivateIpAddress', 'private_ip_address', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'UnassignPrivateIpAddressesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UnassignPrivateIpAddressesResponseBody'),
+    ),
+    'UnassignPrivateIpAddressesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UnassociateEipAddressRequest': (
+        ('AllocationId', 'allocation_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('InstanceType', 'instance_type', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'UnassociateEipAddressResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UnassociateEipAddressResponseBody'),
+    ),
+    'UnassociateEipAddressResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UnassociateHaVipRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('Force', 'force', SCALAR, None),
+        ('HaVipId', 'ha_vip_id', SCALAR, None),
+        ('InstanceId', 'instance_id', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+    ),
+    'UnassociateHaVipResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UnassociateHaVipResponseBody'),
+    ),
+    'UnassociateHaVipResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UnlockSnapshotRequest': (
+        ('ClientToken', 'client_token', SCALAR, None),
+        ('DryRun', 'dry_run', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('SnapshotId', 'snapshot_id', SCALAR, None),
+    ),
+    'UnlockSnapshotResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UnlockSnapshotResponseBody'),
+    ),
+    'UnlockSnapshotResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    ),
+    'UntagResourcesRequest': (
+        ('All', 'all', SCALAR, None),
+        ('OwnerAccount', 'owner_account', SCALAR, None),
+        ('OwnerId', 'owner_id', SCALAR, None),
+        ('RegionId', 'region_id', SCALAR, None),
+        ('ResourceId', 'resource_id', SCALAR, None),
+        ('ResourceOwnerAccount', 'resource_owner_account', SCALAR, None),
+        ('ResourceOwnerId', 'resource_owner_id', SCALAR, None),
+        ('ResourceType', 'resource_type', SCALAR, None),
+        ('TagKey', 'tag_key', SCALAR, None),
+    ),
+    'UntagResourcesResponse': (
+        ('headers', 'headers', SCALAR, None),
+        ('statusCode', 'status_code', SCALAR, None),
+        ('body', 'body', MODEL, 'UntagResourcesResponseBody'),
+    ),
+    'UntagResourcesResponseBody': (
+        ('RequestId', 'request_id', SCALAR, None),
+    )
+}
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import math
+from typing import Any, AsyncIterator, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from alibabacloud_ecs20140526._action_specs import ACTION_SPECS
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS, MODEL, MODEL_LIST, SCALAR
+from darabonba.model import DaraModel
+from darabonba.runtime import RuntimeOptions
+
+class PaginationSpec(NamedTuple):
+    # Request attributes of the NextToken/MaxResults and PageNumber/PageSize
+    # styles, None when the action does not support that style.
+    next_token: Optional[str]
+    max_results: Optional[str]
+    page_number: Optional[str]
+    page_size: Optional[str]
+    # Attribute paths from the response body to the item list, the
+    # NextToken and the TotalCount of a page.
+    items_path: Tuple[str, ...]
+    next_token_path: Optional[Tuple[str, ...]]
+    total_count_path: Optional[Tuple[str, ...]]
+    # Attributes of an item that identify it (see ITEM_IDS), None when the
+    # action has no such attributes.
+    item_id: Optional[Tuple[str, ...]]
+
+_SPECS = {}
+
+def _find(model_name: str, wire_name: str, kind: int) -> Optional[Tuple[str, ...]]:
+    # Depth-first search through nested models, nearest match first.
+    nested_paths = []
+    for field_wire_name, name, field_kind, nested in MODEL_FIELDS[model_name]:
+        if field_kind == kind and (wire_name is None or field_wire_name == wire_name):
+            return (name,)
+        if field_kind == MODEL:
+            nested_paths.append((name, nested))
+    for name, nested in nested_paths:
+        path = _find(nested, wire_name, kind)
+        if path is not None:
+            return (name,) + path
+    return None
+
+# Action -> attributes of a response item that together identify it, used
+# to drop items seen twice when they shift between pages.
+ITEM_IDS = {
+    'DescribeAccessPoints': ('access_point_id',),
+    'DescribeActivations': ('activation_id',),
+    'DescribeAutoProvisioningGroupHistory': ('task_id',),
+    'DescribeAutoProvisioningGroupInstances': ('instance_id',),
+    'DescribeAutoProvisioningGroups': ('auto_provisioning_group_id',),
+    'DescribeAutoSnapshotPolicyAssociations': ('auto_snapshot_policy_id', 'disk_id'),
+    'DescribeAutoSnapshotPolicyEx': ('auto_snapshot_policy_id',),
+    'DescribeBandwidthPackages': ('bandwidth_package_id',),
+    'DescribeCapacityReservationInstances': ('instance_id',),
+    'DescribeCapacityReservations': ('private_pool_options_id',),
+    'DescribeClassicLinkInstances': ('instance_id', 'vpc_id'),
+    'DescribeCloudAssistantStatus': ('instance_id',),
+    'DescribeCommands': ('command_id',),
+    'DescribeDedicatedHostClusters': ('dedicated_host_cluster_id',),
+    'DescribeDedicatedHosts': ('dedicated_host_id',),
+    'DescribeDeploymentSets': ('deployment_set_id',),
+    'DescribeDiagnosticMetricSets': ('metric_set_id',),
+    'DescribeDiagnosticMetrics': ('metric_id',),
+    'DescribeDiagnosticReports': ('report_id',),
+    'DescribeDisks': ('disk_id',),
+    'DescribeDisksFullStatus': ('disk_id',),
+    'DescribeEipAddresses': ('allocation_id',),
+    'DescribeElasticityAssuranceInstances': ('instance_id',),
+    'DescribeElasticityAssurances': ('private_pool_options_id',),
+    'DescribeForwardTableEntries': ('forward_entry_id',),
+    'DescribeHaVips': ('ha_vip_id',),
+    'DescribeHpcClusters': ('hpc_cluster_id',),
+    'DescribeImageComponents': ('image_component_id',),
+    'DescribeImagePipelineExecutions': ('execution_id',),
+    'DescribeImagePipelines': ('image_pipeline_id',),
+    'DescribeImageSharePermission': ('aliyun_id',),
+    'DescribeImages': ('image_id',),
+    'DescribeInstanceAttachmentAttributes': ('instance_id',),
+    'DescribeInstanceAutoRenewAttribute': ('instance_id',),
+    'DescribeInstanceHistoryEvents': ('event_id',),
+    'DescribeInstanceMaintenanceAttributes': ('instance_id',),
+    'DescribeInstanceRamRole': ('instance_id',),
+    'DescribeInstanceStatus': ('instance_id',),
+    'DescribeInstanceTypes': ('instance_type_id',),
+    'DescribeInstances': ('instance_id',),
+    'DescribeInstancesFullStatus': ('instance_id',),
+    'DescribeInvocationResults': ('invoke_id', 'instance_id'),
+    'DescribeInvocations': ('invoke_id',),
+    'DescribeKeyPairs': ('key_pair_name',),
+    'DescribeLaunchTemplateVersions': ('launch_template_id', 'version_number'),
+    'DescribeLaunchTemplates': ('launch_template_id',),
+    'DescribeLockedSnapshots': ('snapshot_id',),
+    'DescribeManagedInstances': ('instance_id',),
+    'DescribeNatGateways': ('nat_gateway_id',),
+    'DescribeNetworkInterfacePermissions': ('network_interface_permission_id',),
+    'DescribeNetworkInterfaces': ('network_interface_id',),
+    'DescribePhysicalConnections': ('physical_connection_id',),
+    'DescribePortRangeListAssociations': ('resource_id',),
+    'DescribePortRangeLists': ('port_range_list_id',),
+    'DescribePrefixListAssociations': ('resource_id',),
+    'DescribePrefixLists': ('prefix_list_id',),
+    'DescribeReservedInstances': ('reserved_instance_id',),
+    'DescribeResourceByTags': ('resource_type', 'resource_id'),
+    'DescribeRouteTables': ('route_table_id',),
+    'DescribeRouterInterfaces': ('router_interface_id',),
+    'DescribeSecurityGroupAttribute': ('security_group_rule_id',),
+    'DescribeSecurityGroups': ('security_group_id',),
+    'DescribeSendFileResults': ('invoke_id',),
+    'DescribeSnapshotGroups': ('snapshot_group_id',),
+    'DescribeSnapshotLinks': ('snapshot_link_id',),
+    'DescribeSnapshots': ('snapshot_id',),
+    'DescribeStorageCapacityUnits': ('storage_capacity_unit_id',),
+    'DescribeStorageSetDetails': ('disk_id',),
+    'DescribeStorageSets': ('storage_set_id',),
+    'DescribeTags': ('tag_key', 'tag_value'),
+    'DescribeTasks': ('task_id',),
+    'DescribeTerminalSessions': ('session_id',),
+    'DescribeVRouters': ('vrouter_id',),
+    'DescribeVSwitches': ('v_switch_id',),
+    'DescribeVirtualBorderRouters': ('vbr_id',),
+    'DescribeVirtualBorderRoutersForPhysicalConnection': ('vbr_id',),
+    'DescribeVpcs': ('vpc_id',),
+    'ListPluginStatus': ('instance_id',),
+    'ListTagResources': ('resource_type', 'resource_id', 'tag_key'),
+}
+
+def pagination_spec(action: str) -> Optional[PaginationSpec]:
+    """
+    Describe how `action` pages, or None if it is not paginated.
+    """
+    if action in _SPECS:
+        return _SPECS[action]
+    spec = None
+    action_spec = ACTION_SPECS.get(action)
+    if action_spec is not None:
+        query = {wire_name: name for name, wire_name in action_spec.query}
+        body = f'{action}ResponseBody'
+        items_path = _find(body, None, MODEL_LIST)
+        next_token_path = _find(body, 'NextToken', SCALAR)
+        has_token = 'NextToken' in query and next_token_path is not None
+        has_page = 'PageNumber' in query and 'PageSize' in query
+        if items_path is not None and (has_token or has_page):
+            spec = PaginationSpec(
+                next_token=query['NextToken'] if has_token else None,
+                max_results=query.get('MaxResults') if has_token else None,
+                page_number=query['PageNumber'] if has_page else None,
+                page_size=query['PageSize'] if has_page else None,
+                items_path=items_path,
+                next_token_path=next_token_path if has_token else None,
+                total_count_path=_find(body, 'TotalCount', SCALAR),
+                item_id=ITEM_IDS.get(action),
+            )
+    _SPECS[action] = spec
+    return spec
+
+def paginated_actions() -> List[str]:
+    return [action for action in ACTION_SPECS if pagination_spec(action) is not None]
+
+def _get_path(value: Any, path: Tuple[str, ...]) -> Any:
+    for name in path:
+        if value is None:
+            return None
+        value = getattr(value, name)
+    return value
+
+class Paginator:
+    """
+    Iterates the pages or the items of a paginated action, fetching one
+    page at a time. NextToken is used when the action supports it, unless
+    the request already sets a page number.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        action: str,
+        request: DaraModel,
+        runtime: RuntimeOptions = None,
+        max_items: int = None,
+    ):
+        spec = pagination_spec(action)
+        if spec is None:
+            raise ValueError(f'{action} is not a paginated action')
+        self.client = client
+        self.action = action
+        self.request = request
+        self.runtime = runtime or RuntimeOptions()
+        self.max_items = max_items
+        self.spec = spec
+
+    def _use_token(self) -> bool:
+        spec = self.spec
+        if spec.next_token is None:
+            return False
+        return spec.page_number is None or getattr(self.request, spec.page_number) is None
+
+    def _first_request(self) -> DaraModel:
+        # Pages are requested on a copy so the caller's request is left as is.
+        return copy.copy(self.request)
+
+    def _advance(self, request: DaraModel, response: Any, use_token: bool, fetched: int) -> bool:
+        # Moves `request` to the next page, returning False after the last one.
+        if self.max_items is not None and fetched >= self.max_items:
+            return False
+        spec = self.spec
+        body = response.body
+        if use_token:
+            next_token = _get_path(body, spec.next_token_path)
+            if not next_token:
+                return False
+            setattr(request, spec.next_token, next_token)
+            return True
+        items = self.page_items(response)
+        if not items:
+            return False
+        page_number = int(getattr(request, spec.page_number) or 1)
+        total_count = _get_path(body, spec.total_count_path) if spec.total_count_path else None
+        if total_count is not None:
+            page_size = getattr(request, spec.page_size) or getattr(body, 'page_size', None) or len(items)
+            if page_number * int(page_size) >= int(total_count):
+                return False
+        setattr(request, spec.page_number, page_number + 1)
+        return True
+
+    def page_items(self, response: Any) -> List[Any]:
+        return _get_path(response.body, self.spec.items_path) or []
+
+    def pages(self) -> Iterator[Any]:
+        request = self._first_request()
+        use_token = self._use_token()
+        fetched = 0
+        while True:
+            response = self.client.call_action(self.action, request, self.runtime)
+            fetched += len(self.page_items(response))
+            yield response
+            if not self._advance(request, response, use_token, fetched):
+                return
+
+    async def pages_async(self) -> AsyncIterator[Any]:
+        request = self._first_request()
+        use_token = self._use_token()
+        fetched = 0
+        while True:
+            response = await self.client.call_action_async(self.action, request, self.runtime)
+            fetched += len(self.page_items(response))
+            yield response
+            if not self._advance(request, response, use_token, fetched):
+                return
+
+    def items(self) -> Iterator[Any]:
+        remaining = self.max_items
+        for response in self.pages():
+            for item in self.page_items(response):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+
+    async def items_async(self) -> AsyncIterator[Any]:
+        remaining = self.max_items
+        async for response in self.pages_async():
+            for item in self.page_items(response):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield item
+
+    def _item_key(self, item: Any) -> Any:
+        if self.spec.item_id is not None:
+            item_id = tuple(getattr(item, name) for name in self.spec.item_id)
+            if any(value is not None for value in item_id):
+                return item_id
+        return json.dumps(item.to_map(), sort_keys=True, default=str)
+
+    async def fetch_all_pages_concurrently(
+        self,
+        concurrency: int = 4,
+        key: Callable[[Any], Any] = None,
+    ) -> List[Any]:
+        """
+        Return every item, in page order and without duplicates. Actions
+        with PageNumber and TotalCount fetch the first page, then the rest
+        concurrently with at most `concurrency` requests in flight; others
+        page through serially, as do pages after a first page without a
+        TotalCount. Items are deduplicated by `key`, by default the action's
+        ITEM_IDS, since items can shift across pages between calls.
+        """
+        spec = self.spec
+        if spec.page_number is None or spec.total_count_path is None:
+            responses = [response async for response in self.pages_async()]
+        else:
+            request = self._first_request()
+            first = await self.client.call_action_async(self.action, request, self.runtime)
+            first_items = self.page_items(first)
+            page_number = int(getattr(request, spec.page_number) or 1)
+            page_size = int(getattr(request, spec.page_size) or getattr(first.body, 'page_size', None) or len(first_items) or 1)
+            total_count = _get_path(first.body, spec.total_count_path)
+            if total_count is None:
+                # Without TotalCount the number of pages is unknown, so page
+                # on serially from the first response.
+                responses = [first]
+                fetched = len(first_items)
+                while self._advance(request, responses[-1], False, fetched):
+                    response = await self.client.call_action_async(self.action, request, self.runtime)
+                    fetched += len(self.page_items(response))
+                    responses.append(response)
+                return self._unique(responses, key)
+            last_page = math.ceil(int(total_count) / page_size) if first_items else page_number
+            if self.max_items is not None:
+                last_page = min(last_page, page_number - 1 + math.ceil(self.max_items / page_size))
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(number: int) -> Any:
+                page_request = copy.copy(self.request)
+                setattr(page_request, spec.page_number, number)
+                setattr(page_request, spec.page_size, page_size)
+                async with semaphore:
+                    return await self.client.call_action_async(self.action, page_request, self.runtime)
+
+            rest = await asyncio.gather(*(fetch(number) for number in range(page_number + 1, last_page + 1)))
+            responses = [first] + list(rest)
+        return self._unique(responses, key)
+
+    def _unique(self, responses: List[Any], key: Optional[Callable[[Any], Any]]) -> List[Any]:
+        key = key or self._item_key
+        seen = set()
+        items = []
+        for response in responses:
+            for item in self.page_items(response):
+                item_key = key(item)
+                if item_key in seen:
+                    continue
+                seen.add(item_key)
+                items.append(item)
+                if self.max_items is not None and len(items) >= self.max_items:
+                    return items
+        return items
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.items()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.items_async()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool, RegionResult
+from alibabacloud_ecs20140526.columnar import Table
+from alibabacloud_ecs20140526.response_cache import ResponseCache
+from darabonba.runtime import RuntimeOptions
+
+PRICE_COLUMNS = ('trade_price', 'original_price', 'discount_price')
+CELL_COLUMNS = ('region_id', 'zone_id', 'instance_type', 'system_disk_category', 'spot_strategy', 'price_unit')
+TABLE_COLUMNS = CELL_COLUMNS + PRICE_COLUMNS + ('currency', 'error')
+
+class PriceCell(NamedTuple):
+    region_id: str
+    # None prices the instance type for the region as a whole.
+    zone_id: Optional[str]
+    instance_type: str
+    system_disk_category: Optional[str] = None
+    spot_strategy: str = 'NoSpot'
+    price_unit: str = 'Hour'
+
+# Requests to send, by region, with the cell each one prices.
+_Calls = Dict[str, List[Tuple[PriceCell, main_models.DescribePriceRequest]]]
+
+def _canonical(cell: PriceCell) -> PriceCell:
+    # Cells that send the same DescribePrice query compare equal.
+    return cell._replace(
+        zone_id=cell.zone_id or None,
+        system_disk_category=cell.system_disk_category or None,
+        spot_strategy=cell.spot_strategy or 'NoSpot',
+        price_unit=cell.price_unit or 'Hour',
+    )
+
+def price_grid(
+    zones: Mapping[str, Sequence[Optional[str]]],
+    instance_types: Sequence[str],
+    system_disk_categories: Sequence[Optional[str]] = (None,),
+    spot_strategies: Sequence[str] = ('NoSpot',),
+    price_units: Sequence[str] = ('Hour',),
+) -> List[PriceCell]:
+    """
+    The cross product of the zones of each region (`zones` maps a region ID
+    to its zone IDs) with the instance types, system disk categories, spot
+    strategies and price units, without duplicate cells.
+    """
+    cells = (
+        _canonical(PriceCell(region_id, zone_id, *rest))
+        for region_id, region_zones in zones.items()
+        for zone_id in region_zones
+        for rest in itertools.product(instance_types, system_disk_categories, spot_strategies, price_units)
+    )
+    return list(dict.fromkeys(cells))
+
+class PriceMatrix:
+    """
+    Prices many DescribePrice cells at once. Duplicate cells are priced
+    once, cached prices are reused for `ttl` seconds (or for the
+    DescribePrice TTL a supplied `cache` already has), and the rest are
+    fetched concurrently through a RegionalClientPool, so the pool's rate
+    limiter and retry policy apply. Results come back as a columnar Table
+    with one row per cell, in the order given, and NaN/None prices plus an
+    `error` message for cells that failed. A supplied cache is not
+    reconfigured, so clients sharing it only cache DescribePrice if it
+    already did.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        ttl: float = 600.0,
+        cache: ResponseCache = None,
+        resource_type: str = 'instance',
+        system_disk_size: int = None,
+        spot_duration: int = None,
+        concurrency: int = 32,
+        region_concurrency: int = 8,
+        timeout: float = None,
+        runtime: RuntimeOptions = None,
+    ):
+        self.clients = clients
+        # A grid easily holds thousands of cells, more than the default LRU.
+        self.cache = cache if cache is not None else ResponseCache(ttls={}, max_entries=65536)
+        self.ttl = self.cache.ttls.get('DescribePrice', ttl)
+        self.resource_type = resource_type
+        self.system_disk_size = system_disk_size
+        self.spot_duration = spot_duration
+        self.concurrency = concurrency
+        self.region_concurrency = region_concurrency
+        self.timeout = timeout
+        self.runtime = runtime
+
+    def request(
+        self,
+        cell: PriceCell,
+    ) -> main_models.DescribePriceRequest:
+        request = main_models.DescribePriceRequest(
+            region_id=cell.region_id,
+            zone_id=cell.zone_id,
+            resource_type=self.resource_type,
+            instance_type=cell.instance_type,
+            spot_strategy=cell.spot_strategy,
+            price_unit=cell.price_unit,
+        )
+        if cell.spot_strategy != 'NoSpot':
+            request.spot_duration = self.spot_duration
+        if cell.system_disk_category is not None:
+            request.system_disk = main_models.DescribePriceRequestSystemDisk(
+                category=cell.system_disk_category,
+                size=self.system_disk_size,
+            )
+        return request
+
+    def _key(self, cell: PriceCell) -> str:
+        query = dict(cell._asdict(), resource_type=self.resource_type, system_disk_size=self.system_disk_size,
+                     spot_duration=self.spot_duration)
+        return self.cache.key('DescribePrice', query, self.clients.endpoint(cell.region_id))
+
+    def _plan(
+        self,
+        cells: Iterable[PriceCell],
+    ) -> Tuple[List[PriceCell], Dict[PriceCell, Dict[str, Any]], _Calls]:
+        cells = [_canonical(cell) for cell in cells]
+        prices: Dict[PriceCell, Dict[str, Any]] = {}
+        calls: _Calls = {}
+        for cell in dict.fromkeys(cells):
+            cached = self.cache.get(self._key(cell))
+            if cached is not None:
+                prices[cell] = cached
+            else:
+                calls.setdefault(cell.region_id, []).append((cell, self.request(cell)))
+        return cells, prices, calls
+
+    def _collect(
+        self,
+        calls: _Calls,
+        results: List[RegionResult],
+        prices: Dict[PriceCell, Dict[str, Any]],
+    ) -> None:
+        cells = {id(request): cell for region_calls in calls.values() for cell, request in region_calls}
+        for result in results:
+            cell = cells[id(result.request)]
+            if result.error is not None:
+                prices[cell] = {'error': str(result.error).splitlines()[0]}
+                continue
+            price = _parse_price(result.response)
+            if price is None:
+                prices[cell] = {'error': 'no price returned'}
+                continue
+            self.cache.set(self._key(cell), 'DescribePrice', price, self.ttl)
+            prices[cell] = price
+
+    def _table(self, cells: List[PriceCell], prices: Dict[PriceCell, Dict[str, Any]]) -> Table:
+        columns: Dict[str, List[Any]] = {name: [] for name in TABLE_COLUMNS}
+        for cell in cells:
+            price = prices[cell]
+            for name, value in zip(CELL_COLUMNS, cell):
+                columns[name].append(value)
+            for name in PRICE_COLUMNS + ('currency', 'error'):
+                columns[name].append(price.get(name))
+        return Table(columns, numeric=PRICE_COLUMNS)
+
+    def _fan_out_args(self, calls: _Calls) -> Dict[str, Any]:
+        return dict(
+            request_factory=lambda region_id: [request for cell, request in calls[region_id]],
+            regions=list(calls),
+            concurrency=self.concurrency,
+            region_concurrency=self.region_concurrency,
+            timeout=self.timeout,
+            runtime=self.runtime,
+        )
+
+    def fetch(
+        self,
+        cells: Iterable[PriceCell],
+    ) -> Table:
+        """
+        Price `cells` (see `price_grid`) and return one row per cell.
+        """
+        cells, prices, calls = self._plan(cells)
+        if calls:
+            self._collect(calls, self.clients.fan_out('DescribePrice', **self._fan_out_args(calls)), prices)
+        return self._table(cells, prices)
+
+    async def fetch_async(
+        self,
+        cells: Iterable[PriceCell],
+    ) -> Table:
+        """
+        Async version of `fetch`.
+        """
+        cells, prices, calls = self._plan(cells)
+        if calls:
+            self._collect(calls, await self.clients.fan_out_async('DescribePrice', **self._fan_out_args(calls)), prices)
+        return self._table(cells, prices)
+
+def _parse_price(response: Any) -> Optional[Dict[str, Any]]:
+    body = response.body
+    price = body.price_info.price if body and body.price_info else None
+    if price is None or price.trade_price is None:
+        return None
+    return {
+        'trade_price': price.trade_price,
+        'original_price': price.original_price,
+        'discount_price': price.discount_price,
+        'currency': price.currency,
+    }
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from alibabacloud_tea_openapi import exceptions as main_exceptions
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Bucket state: [tokens, last update (epoch seconds), current rate,
+# last rate decrease (epoch seconds)].
+State = List[float]
+
+def is_throttling(error: Exception) -> bool:
+    """
+    Whether `error` is ECS refusing a call for rate reasons, such as
+    Throttling, Throttling.User or Throttling.Api.
+    """
+    if isinstance(error, main_exceptions.ThrottlingException):
+        return True
+    code = getattr(error, 'code', None)
+    return isinstance(code, str) and code.startswith('Throttling')
+
+class MemoryBackend:
+    """
+    Keeps bucket state in this process. One backend, and so one set of
+    buckets, can be shared by every client and thread in the process.
+    """
+
+    # Updates only take a thread lock for a moment, so async callers run
+    # them on the event loop.
+    blocking = False
+
+    def __init__(self):
+        self._states: Dict[str, State] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Optional[State]], Tuple[State, Any]],
+    ) -> Any:
+        with self._lock:
+            state, result = fn(self._states.get(key))
+            self._states[key] = state
+        return result
+
+class FileLockBackend:
+    """
+    Keeps bucket state in a JSON file guarded by `flock`, so worker
+    processes on one host draw from the same buckets. Needs `fcntl`, so it
+    is not available on Windows.
+    """
+
+    # Updates wait for the file lock and do file I/O, so async callers run
+    # them in the default executor.
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+    ):
+        if fcntl is None:
+            raise RuntimeError('FileLockBackend needs fcntl, which this platform does not provide')
+        self.path = path
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        key: str,
+        fn: Callable[[Optional[State]], Tuple[State, Any]],
+    ) -> Any:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, 'r+') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    content = f.read()
+                    states = json.loads(content) if content else {}
+                    states[key], result = fn(states.get(key))
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(states))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        return result
+
+class RateLimiter:
+    """
+    Token buckets keyed by action and region. Each call takes one token;
+    callers wait while a bucket is empty. A throttling error multiplies
+    the bucket's rate by `decrease` (down to `min_rate`), and every
+    successful call adds `increase` back until the configured rate is
+    reached again (AIMD). Calls already in flight when the rate drops
+    often fail too, so the rate drops at most once per refill interval,
+    the time the bucket takes to refill at its lowered rate.
+
+    `on_success` and `on_throttle` only note the outcome; the notes of a
+    bucket are applied in the same backend update as its next reservation
+    (or `current_rate`), so responses cost no backend round trip of their
+    own. With a blocking backend such as FileLockBackend, `acquire_async`
+    runs that update in the default executor instead of on the event loop.
+
+    `rates` overrides the default `rate` (calls per second) for an action,
+    or for one action in one region, e.g. {'DescribePrice': 5,
+    ('RunInstances', 'cn-hangzhou'): 2}.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        burst: float = None,
+        rates: Dict[Any, float] = None,
+        min_rate: float = 0.5,
+        decrease: float = 0.5,
+        increase: float = None,
+        backend: Any = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.min_rate = min_rate
+        self.decrease = decrease
+        self.increase = increase
+        self.backend = backend or MemoryBackend()
+        # Outcomes by bucket key, as (throttled, epoch seconds), not yet
+        # applied to the backend.
+        self._outcomes: Dict[str, List[Tuple[bool, float]]] = {}
+        self._outcomes_lock = threading.Lock()
+
+    def _limits(self, action: str, region_id: Optional[str]) -> Tuple[float, float]:
+        rate = self.rates.get((action, region_id))
+        if rate is None:
+            rate = self.rates.get(action, self.rate)
+        return rate, self.burst or max(1.0, rate)
+
+    def _key(self, action: str, region_id: Optional[str]) -> str:
+        return f'{action}:{region_id or ""}'
+
+    def _pop_outcomes(self, key: str) -> List[Tuple[bool, float]]:
+        with self._outcomes_lock:
+            return self._outcomes.pop(key, [])
+
+    def _apply(self, state: Optional[State], outcomes: List[Tuple[bool, float]], rate: float, burst: float) -> State:
+        # AIMD over the noted outcomes, in the order they happened.
+        if state is None:
+            state = [burst, time.time(), rate, 0.0]
+        tokens, updated, current, decreased = state
+        increase = self.increase if self.increase is not None else rate / 20
+        for throttled, at in outcomes:
+            if not throttled:
+                current = min(rate, current + increase)
+            elif at - decreased >= burst / current:
+                # Throttles within a refill interval of the last decrease
+                # belong to the burst that caused it.
+                current = max(self.min_rate, current * self.decrease)
+                decreased = at
+                # Drop the tokens saved up at the old rate.
+                tokens = min(tokens, 0.0)
+        return [tokens, updated, current, decreased]
+
+    def reserve(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> float:
+        """
+        Take a token and return how many seconds to wait before using it.
+        """
+        rate, burst = self._limits(action, region_id)
+        key = self._key(action, region_id)
+        outcomes = self._pop_outcomes(key)
+
+        def take(state: Optional[State]) -> Tuple[State, float]:
+            now = time.time()
+            tokens, updated, current, decreased = self._apply(state, outcomes, rate, burst)
+            # Tokens may go negative: later callers then wait behind the
+            # ones already holding a reservation.
+            tokens = min(burst, tokens + max(0.0, now - updated) * current) - 1
+            wait = 0.0 if tokens >= 0 else -tokens / current
+            return [tokens, now, current, decreased], wait
+
+        return self.backend.update(key, take)
+
+    def acquire(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> None:
+        wait = self.reserve(action, region_id)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> None:
+        if getattr(self.backend, 'blocking', False):
+            wait = await asyncio.get_running_loop().run_in_executor(None, self.reserve, action, region_id)
+        else:
+            wait = self.reserve(action, region_id)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def current_rate(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> float:
+        rate, burst = self._limits(action, region_id)
+        key = self._key(action, region_id)
+        outcomes = self._pop_outcomes(key)
+
+        def read(state: Optional[State]) -> Tuple[State, float]:
+            state = self._apply(state, outcomes, rate, burst)
+            return state, state[2]
+
+        return self.backend.update(key, read)
+
+    def _note(self, action: str, region_id: Optional[str], throttled: bool) -> None:
+        with self._outcomes_lock:
+            self._outcomes.setdefault(self._key(action, region_id), []).append((throttled, time.time()))
+
+    def on_success(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> None:
+        self._note(action, region_id, False)
+
+    def on_throttle(
+        self,
+        action: str,
+        region_id: str = None,
+    ) -> None:
+        self._note(action, region_id, True)
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Seconds a response stays fresh, for the metadata actions that change
+# rarely. Actions not listed are never cached unless given a TTL.
+DEFAULT_TTLS = {
+    'DescribeRegions': 24 * 3600,
+    'DescribeZones': 3600,
+    'DescribeInstanceTypes': 24 * 3600,
+    'DescribeInstanceTypeFamilies': 24 * 3600,
+    'DescribeDedicatedHostTypes': 24 * 3600,
+    'DescribeImageSupportInstanceTypes': 3600,
+}
+
+class MemoryStore:
+    """
+    In-process LRU of serialized responses, holding at most `max_entries`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+    ):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: str,
+    ) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: str,
+        expires: float,
+        value: str,
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+class SqliteStore:
+    """
+    Serialized responses in a sqlite file, so they outlive the process and
+    can be shared by processes on one host.
+    """
+
+    def __init__(
+        self,
+        path: str,
+    ):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS response_cache (key TEXT PRIMARY KEY, expires REAL, value TEXT)'
+        )
+
+    def get(
+        self,
+        key: str,
+    ) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT expires, value FROM response_cache WHERE key = ?', (key,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def set(
+        self,
+        key: str,
+        expires: float,
+        value: str,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO response_cache (key, expires, value) VALUES (?, ?, ?)',
+                (key, expires, value),
+            )
+
+    def purge(self) -> None:
+        # Drop expired rows, which are otherwise only replaced on refresh.
+        with self._lock:
+            self._connection.execute('DELETE FROM response_cache WHERE expires <= ?', (time.time(),))
+
+# Result of an async flight whose caller was cancelled before the call
+# returned.
+_ABANDONED = object()
+
+class _Flight:
+    __slots__ = ('event', 'value', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+class ResponseCache:
+    """
+    Caches the response maps of the actions in `ttls` (DEFAULT_TTLS by
+    default), keyed by the endpoint, the action and the request query with
+    its parameters sorted. Responses are kept in a memory LRU and, if
+    `store` is given (e.g. a SqliteStore), in that store too. Identical
+    calls made while one is in flight wait for it instead of calling ECS.
+
+    Keys do not include the credential, so share a cache only between
+    clients of one account.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] = None,
+        max_entries: int = 1024,
+        store: Any = None,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.memory = MemoryStore(max_entries)
+        self.store = store
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def caches(
+        self,
+        action: str,
+    ) -> bool:
+        return bool(self.ttls.get(action))
+
+    def key(
+        self,
+        action: str,
+        query: Optional[Dict[str, Any]],
+        scope: str = None,
+    ) -> str:
+        return json.dumps([scope, action, sorted((query or {}).items())], ensure_ascii=False, default=str)
+
+    def _count(self, action: str, name: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(action, {})
+            stats[name] = stats.get(name, 0) + 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Hits, misses and coalesced calls per action.
+        """
+        with self._lock:
+            return {action: dict(stats) for action, stats in self._stats.items()}
+
+    def get(
+        self,
+        key: str,
+    ) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        entry = self.memory.get(key)
+        if (entry is None or entry[0] <= now) and self.store is not None:
+            # Another process may have refreshed the shared store.
+            entry = self.store.get(key)
+            if entry is not None and entry[0] > now:
+                self.memory.set(key, *entry)
+        if entry is None or entry[0] <= now:
+            return None
+        # Every hit gets its own copy, so callers cannot change the cache.
+        return json.loads(entry[1])
+
+    def set(
+        self,
+        key: str,
+        action: str,
+        response: Dict[str, Any],
+        ttl: float = None,
+    ) -> None:
+        expires = time.time() + (self.ttls[action] if ttl is None else ttl)
+        value = json.dumps(response, ensure_ascii=False, default=str)
+        self.memory.set(key, expires, value)
+        if self.store is not None:
+            self.store.set(key, expires, value)
+
+    def get_or_call(
+        self,
+        action: str,
+        query: Optional[Dict[str, Any]],
+        call: Callable[[], Dict[str, Any]],
+        scope: str = None,
+    ) -> Dict[str, Any]:
+        key = self.key(action, query, scope)
+        response = self.get(key)
+        if response is not None:
+            self._count(action, 'hits')
+            return response
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.event.wait()
+            self._count(action, 'coalesced')
+            if flight.error is not None:
+                raise flight.error
+            return json.loads(json.dumps(flight.value, default=str))
+        self._count(action, 'misses')
+        try:
+            response = flight.value = call()
+            self.set(key, action, response)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+        return response
+
+    async def get_or_call_async(
+        self,
+        action: str,
+        query: Optional[Dict[str, Any]],
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        scope: str = None,
+    ) -> Dict[str, Any]:
+        key = self.key(action, query, scope)
+        response = self.get(key)
+        if response is not None:
+            self._count(action, 'hits')
+            return response
+        future = self._async_flights.get(key)
+        while future is not None:
+            self._count(action, 'coalesced')
+            response = await asyncio.shield(future)
+            if response is not _ABANDONED:
+                return json.loads(json.dumps(response, default=str))
+            # The caller making the call was cancelled; the first waiter to
+            # get here makes it again and the others wait on that.
+            future = self._async_flights.get(key)
+        future = self._async_flights[key] = asyncio.get_running_loop().create_future()
+        self._count(action, 'misses')
+        try:
+            response = await call()
+            self.set(key, action, response)
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every waiter too.
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Waiters re-raise it; mark it retrieved for the leader.
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            del self._async_flights[key]
+        return response
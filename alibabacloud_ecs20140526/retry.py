@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import random
+import threading
+from typing import Any, Dict, Optional
+
+from alibabacloud_ecs20140526.rate_limiter import is_throttling
+from darabonba.exceptions import RetryError
+
+# Actions that only read state and can be sent again at any time.
+READ_ACTION_PREFIXES = ('Describe', 'List', 'Get')
+
+# Error codes returned before the call had any effect, for any action.
+THROTTLING = 'throttling'
+# Transient server-side failures: the call may or may not have been applied.
+TRANSIENT_CODES = frozenset([
+    'ServiceUnavailable',
+    'InternalError',
+    'UnknownError',
+    'OperationConflict',
+    'LastTokenProcessing',
+])
+# Transient resource states, only worth retrying for reads.
+READ_RETRY_CODES = frozenset([
+    'IncorrectInstanceStatus',
+])
+
+def is_read_action(action: str) -> bool:
+    return action.startswith(READ_ACTION_PREFIXES)
+
+def _error_kind(error: Exception) -> Optional[str]:
+    if is_throttling(error):
+        return THROTTLING
+    code = getattr(error, 'code', None)
+    if code in TRANSIENT_CODES:
+        return code
+    if code in READ_RETRY_CODES:
+        return code
+    status_code = getattr(error, 'status_code', None)
+    if isinstance(status_code, int) and status_code >= 500:
+        return 'ServerError'
+    if isinstance(error, (RetryError, IOError, TimeoutError)):
+        # Connection and read failures raised by the HTTP layer.
+        return 'NetworkError'
+    return None
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of the calls made. Every call deposits
+    `ratio` tokens (up to `max_tokens`) and every retry takes one, so
+    during an outage retries add at most `ratio` of extra load instead of
+    multiplying it by the attempt count.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        max_tokens: float = 10.0,
+    ):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+class RetryMetrics:
+    """
+    Counters of calls and retries per action. `snapshot()` returns a copy,
+    e.g. {'DescribeInstances': {'calls': 10, 'retries': 2,
+    'retries.throttling': 2}}.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def incr(
+        self,
+        action: str,
+        name: str,
+    ) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(action, {})
+            counters[name] = counters.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {action: dict(counters) for action, counters in self._counters.items()}
+
+class RetryPolicy:
+    """
+    Decides whether a failed ECS call is sent again and after how long.
+
+    Throttling errors are retried for every action, as throttled calls are
+    rejected before they run. Other transient errors (ServiceUnavailable,
+    OperationConflict, 5xx, network failures) are retried only for reads
+    and for mutations that carry a ClientToken, which ECS deduplicates.
+    IncorrectInstanceStatus is retried for reads only. Delays use
+    decorrelated jitter between `base_delay` and `max_delay` seconds, and
+    every retry needs a token from the shared `budget`.
+
+    A policy is meant to be shared by all clients of a process, so that the
+    budget and the metrics cover all of them.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.2,
+        max_delay: float = 20.0,
+        budget: RetryBudget = None,
+        metrics: RetryMetrics = None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.metrics = metrics or RetryMetrics()
+
+    def is_retryable(
+        self,
+        action: str,
+        query: Optional[Dict[str, Any]],
+        error: Exception,
+    ) -> Optional[str]:
+        """
+        Return the kind of `error` if it may be retried for `action`, else
+        None.
+        """
+        kind = _error_kind(error)
+        if kind is None or kind == THROTTLING:
+            return kind
+        if is_read_action(action):
+            return kind
+        if kind in READ_RETRY_CODES:
+            return None
+        if query and query.get('ClientToken'):
+            return kind
+        return None
+
+    def on_call(
+        self,
+        action: str,
+    ) -> None:
+        self.budget.deposit()
+        self.metrics.incr(action, 'calls')
+
+    def retry_delay(
+        self,
+        action: str,
+        query: Optional[Dict[str, Any]],
+        error: Exception,
+        attempt: int,
+        previous_delay: float,
+    ) -> Optional[float]:
+        """
+        Return the seconds to wait before attempt `attempt + 1`, or None if
+        `error` should be raised.
+        """
+        kind = self.is_retryable(action, query, error)
+        if kind is None:
+            return None
+        if attempt + 1 >= self.max_attempts:
+            self.metrics.incr(action, 'exhausted')
+            return None
+        if not self.budget.withdraw():
+            self.metrics.incr(action, 'budget_exhausted')
+            return None
+        self.metrics.incr(action, 'retries')
+        self.metrics.incr(action, f'retries.{kind}')
+        delay = min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)))
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after:
+            # Throttling responses may say when to come back, in milliseconds.
+            delay = max(delay, min(self.max_delay, retry_after / 1000))
+        return delay
@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.paginator import Paginator
+from darabonba.runtime import RuntimeOptions
+
+# Authorize and Revoke calls take at most 100 Permissions or rule IDs.
+MAX_RULES = 100
+
+# Protocols without ports; their port range is always -1/-1.
+_PORTLESS = ('ICMP', 'ICMPV6', 'GRE', 'ALL')
+
+class Rule(NamedTuple):
+    """
+    A security group rule, described from the group's side: `cidr_ip`,
+    `ipv6_cidr_ip`, `group_id` and `prefix_list_id` name the peer (the
+    source of an ingress rule, the destination of an egress rule), and
+    `local_cidr_ip`/`local_ipv6_cidr_ip` the other end of a quintuple rule.
+    Pass rules through `normalize` before comparing them.
+    """
+    direction: str
+    ip_protocol: str
+    port_range: str = None
+    cidr_ip: str = None
+    ipv6_cidr_ip: str = None
+    group_id: str = None
+    group_owner_account: str = None
+    prefix_list_id: str = None
+    local_cidr_ip: str = None
+    local_ipv6_cidr_ip: str = None
+    source_port_range: str = None
+    port_range_list_id: str = None
+    nic_type: str = None
+    policy: str = None
+    # Priority and description can be changed in place with a modify call;
+    # every other field identifies the rule.
+    priority: int = None
+    description: str = None
+
+    @property
+    def key(self) -> tuple:
+        return self[:-2]
+
+# Normalized CIDR blocks; policies repeat the same few blocks many times.
+_CIDRS: Dict[str, str] = {}
+
+def _cidr(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    cidr = _CIDRS.get(value)
+    if cidr is None:
+        try:
+            cidr = str(ipaddress.ip_network(value, strict=False))
+        except ValueError:
+            cidr = value
+        if len(_CIDRS) >= 65536:
+            _CIDRS.clear()
+        _CIDRS[value] = cidr
+    return cidr
+
+def _ports(value: Optional[str], protocol: str) -> Optional[str]:
+    if protocol in _PORTLESS:
+        return '-1/-1'
+    if not value:
+        return None
+    start, _, end = value.partition('/')
+    return f'{int(start)}/{int(end or start)}'
+
+def normalize(
+    rule: Rule,
+) -> Rule:
+    """
+    The canonical form of `rule`: upper-case protocol, `start/end` port
+    ranges, CIDR blocks in network form, empty values as None and ECS
+    defaults filled in (nic_type intranet, policy accept, priority 1,
+    description '').
+    """
+    protocol = str(rule.ip_protocol).upper()
+    return Rule(
+        direction=rule.direction.lower(),
+        ip_protocol=protocol,
+        port_range=None if rule.port_range_list_id else _ports(rule.port_range, protocol),
+        cidr_ip=_cidr(rule.cidr_ip),
+        ipv6_cidr_ip=_cidr(rule.ipv6_cidr_ip),
+        group_id=rule.group_id or None,
+        group_owner_account=rule.group_owner_account or None,
+        prefix_list_id=rule.prefix_list_id or None,
+        local_cidr_ip=_cidr(rule.local_cidr_ip),
+        local_ipv6_cidr_ip=_cidr(rule.local_ipv6_cidr_ip),
+        source_port_range=_ports(rule.source_port_range, protocol) if rule.source_port_range else None,
+        port_range_list_id=rule.port_range_list_id or None,
+        nic_type=(rule.nic_type or 'intranet').lower(),
+        policy=(rule.policy or 'accept').lower(),
+        priority=int(rule.priority or 1),
+        description=rule.description or '',
+    )
+
+def from_permission(
+    permission: Any,
+) -> Rule:
+    """
+    The normalized rule of a DescribeSecurityGroupAttribute permission.
+    """
+    if (permission.direction or 'ingress').lower() == 'egress':
+        peer = (permission.dest_cidr_ip, permission.ipv_6dest_cidr_ip, permission.dest_group_id,
+                permission.dest_group_owner_account, permission.dest_prefix_list_id)
+        local = (permission.source_cidr_ip, permission.ipv_6source_cidr_ip)
+    else:
+        peer = (permission.source_cidr_ip, permission.ipv_6source_cidr_ip, permission.source_group_id,
+                permission.source_group_owner_account, permission.source_prefix_list_id)
+        local = (permission.dest_cidr_ip, permission.ipv_6dest_cidr_ip)
+    return normalize(Rule(
+        permission.direction or 'ingress', permission.ip_protocol, permission.port_range, *peer, *local,
+        source_port_range=permission.source_port_range,
+        port_range_list_id=permission.port_range_list_id,
+        nic_type=permission.nic_type,
+        policy=permission.policy,
+        priority=permission.priority,
+        description=permission.description,
+    ))
+
+def _wire(rule: Rule) -> Dict[str, Any]:
+    # Request attributes of `rule`, shared by the Permissions models and
+    # the modify requests.
+    if rule.direction == 'egress':
+        peer, local = 'dest', 'source'
+    else:
+        peer, local = 'source', 'dest'
+    fields = {
+        f'{peer}_cidr_ip': rule.cidr_ip,
+        f'ipv_6{peer}_cidr_ip': rule.ipv6_cidr_ip,
+        f'{peer}_group_id': rule.group_id,
+        f'{peer}_group_owner_account': rule.group_owner_account,
+        f'{peer}_prefix_list_id': rule.prefix_list_id,
+        f'{local}_cidr_ip': rule.local_cidr_ip,
+        f'ipv_6{local}_cidr_ip': rule.local_ipv6_cidr_ip,
+        'ip_protocol': rule.ip_protocol,
+        'port_range': rule.port_range,
+        'source_port_range': rule.source_port_range,
+        'port_range_list_id': rule.port_range_list_id,
+        'nic_type': rule.nic_type,
+        'policy': rule.policy,
+        'priority': str(rule.priority),
+        'description': rule.description or None,
+    }
+    return {name: value for name, value in fields.items() if value is not None}
+
+class RuleDiff(NamedTuple):
+    authorize: List[Rule]
+    # (rule ID, desired rule) of rules whose priority or description changes.
+    modify: List[Tuple[str, Rule]]
+    # (rule ID, current rule) of rules to remove.
+    revoke: List[Tuple[str, Rule]]
+
+def diff_rules(
+    current: Iterable[Tuple[str, Rule]],
+    desired: Iterable[Rule],
+) -> RuleDiff:
+    """
+    What takes a group from `current` rules (with their rule IDs) to
+    `desired`, matching rules by `Rule.key` in one pass over each side.
+    Current duplicates of one key beyond the first are revoked.
+    """
+    wanted: Dict[tuple, Rule] = {}
+    for rule in desired:
+        rule = normalize(rule)
+        wanted[rule.key] = rule
+    matched = set()
+    modify, revoke = [], []
+    for rule_id, rule in current:
+        target = wanted.get(rule.key)
+        if target is None or rule.key in matched:
+            revoke.append((rule_id, rule))
+            continue
+        matched.add(rule.key)
+        if (target.priority, target.description) != (rule.priority, rule.description):
+            modify.append((rule_id, target))
+    authorize = [rule for key, rule in wanted.items() if key not in matched]
+    return RuleDiff(authorize, modify, revoke)
+
+class RuleCall(NamedTuple):
+    # AuthorizeSecurityGroup, RevokeSecurityGroup, ModifySecurityGroupRule
+    # or their Egress variants.
+    action: str
+    region_id: str
+    security_group_id: str
+    # Rules authorized or, for a modify call, the single desired rule.
+    rules: Tuple[Rule, ...]
+    # Rule IDs revoked or, for a modify call, the single rule changed.
+    rule_ids: Tuple[str, ...]
+
+class GroupPlan(NamedTuple):
+    region_id: str
+    security_group_id: str
+    diff: Optional[RuleDiff]
+    # Calls to run in order.
+    calls: List[RuleCall]
+    # Set when the current rules could not be read; the plan is empty.
+    error: Optional[Exception]
+
+class GroupResult(NamedTuple):
+    region_id: str
+    security_group_id: str
+    # Number of calls of the plan that succeeded.
+    applied: int
+    # The call that failed, after which the rest of the group's calls were
+    # skipped, and its error.
+    failed_call: Optional[RuleCall]
+    error: Optional[Exception]
+
+_ACTIONS = {
+    'ingress': ('AuthorizeSecurityGroup', 'ModifySecurityGroupRule', 'RevokeSecurityGroup'),
+    'egress': ('AuthorizeSecurityGroupEgress', 'ModifySecurityGroupEgressRule', 'RevokeSecurityGroupEgress'),
+}
+
+def plan_calls(
+    region_id: str,
+    security_group_id: str,
+    diff: RuleDiff,
+    revoke_first: bool = False,
+) -> List[RuleCall]:
+    """
+    The calls applying `diff`: authorize and revoke calls of up to MAX_RULES
+    rules each per direction, and one modify call per changed rule. New
+    rules are authorized before old ones are revoked, so traffic allowed
+    both before and after keeps flowing; `revoke_first` reverses that for
+    groups close to their rule quota.
+    """
+    authorize, modify, revoke = [], [], []
+    for direction, (authorize_action, modify_action, revoke_action) in _ACTIONS.items():
+        rules = [rule for rule in diff.authorize if rule.direction == direction]
+        for start in range(0, len(rules), MAX_RULES):
+            authorize.append(RuleCall(authorize_action, region_id, security_group_id, tuple(rules[start:start + MAX_RULES]), ()))
+        for rule_id, rule in diff.modify:
+            if rule.direction == direction:
+                modify.append(RuleCall(modify_action, region_id, security_group_id, (rule,), (rule_id,)))
+        rule_ids = [rule_id for rule_id, rule in diff.revoke if rule.direction == direction]
+        for start in range(0, len(rule_ids), MAX_RULES):
+            revoke.append(RuleCall(revoke_action, region_id, security_group_id, (), tuple(rule_ids[start:start + MAX_RULES])))
+    return revoke + modify + authorize if revoke_first else authorize + modify + revoke
+
+def _request(call: RuleCall) -> Any:
+    common = {'region_id': call.region_id, 'security_group_id': call.security_group_id}
+    if call.action.startswith('Authorize'):
+        permission = getattr(main_models, f'{call.action}RequestPermissions')
+        return getattr(main_models, f'{call.action}Request')(
+            permissions=[permission(**_wire(rule)) for rule in call.rules], **common)
+    if call.action.startswith('Revoke'):
+        return getattr(main_models, f'{call.action}Request')(security_group_rule_id=list(call.rule_ids), **common)
+    # A modify call always sends the description, so that '' clears it.
+    fields = dict(_wire(call.rules[0]), description=call.rules[0].description)
+    return getattr(main_models, f'{call.action}Request')(
+        security_group_rule_id=call.rule_ids[0], **fields, **common)
+
+GroupKey = Tuple[str, str]
+
+class SecurityGroupReconciler:
+    """
+    Brings security groups to a desired set of rules. `plan` reads every
+    group's rules with DescribeSecurityGroupAttribute and diffs them against
+    the desired ones; `apply` runs the resulting batched calls, groups in
+    parallel on up to `concurrency` workers and each group's calls in order,
+    stopping a group at its first failed call.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        concurrency: int = 8,
+        revoke_first: bool = False,
+        runtime: RuntimeOptions = None,
+    ):
+        self.clients = clients
+        self.concurrency = concurrency
+        self.revoke_first = revoke_first
+        self.runtime = runtime or RuntimeOptions()
+
+    def _describe_request(self, region_id: str, security_group_id: str) -> main_models.DescribeSecurityGroupAttributeRequest:
+        return main_models.DescribeSecurityGroupAttributeRequest(
+            region_id=region_id,
+            security_group_id=security_group_id,
+            direction='all',
+            max_results=1000,
+        )
+
+    @staticmethod
+    def _current(permissions: Sequence[Any]) -> List[Tuple[str, Rule]]:
+        return [(permission.security_group_rule_id, from_permission(permission)) for permission in permissions]
+
+    def _plan(self, group: GroupKey, desired: Iterable[Rule], result: Any) -> GroupPlan:
+        region_id, security_group_id = group
+        if isinstance(result, Exception):
+            return GroupPlan(region_id, security_group_id, None, [], result)
+        diff = diff_rules(self._current(result), desired)
+        return GroupPlan(region_id, security_group_id, diff, plan_calls(region_id, security_group_id, diff, self.revoke_first), None)
+
+    def current(
+        self,
+        region_id: str,
+        security_group_id: str,
+    ) -> List[Tuple[str, Rule]]:
+        """
+        (rule ID, normalized rule) of every rule of a group, both directions.
+        """
+        paginator = Paginator(self.clients.client(region_id), 'DescribeSecurityGroupAttribute',
+                              self._describe_request(region_id, security_group_id), self.runtime)
+        return self._current(list(paginator.items()))
+
+    def plan(
+        self,
+        desired: Mapping[GroupKey, Iterable[Rule]],
+    ) -> List[GroupPlan]:
+        """
+        A plan for each (region ID, security group ID) of `desired`. Rules
+        of the group that are not desired are revoked.
+        """
+        groups = list(desired)
+
+        def describe(group: GroupKey) -> Any:
+            try:
+                paginator = Paginator(self.clients.client(group[0]), 'DescribeSecurityGroupAttribute',
+                                      self._describe_request(*group), self.runtime)
+                return list(paginator.items())
+            except Exception as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(groups) or 1))) as executor:
+            results = list(executor.map(describe, groups))
+        return [self._plan(group, desired[group], result) for group, result in zip(groups, results)]
+
+    async def plan_async(
+        self,
+        desired: Mapping[GroupKey, Iterable[Rule]],
+    ) -> List[GroupPlan]:
+        """
+        Async version of `plan`.
+        """
+        groups = list(desired)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def describe(group: GroupKey) -> List[Any]:
+            async with semaphore:
+                paginator = Paginator(self.clients.client(group[0]), 'DescribeSecurityGroupAttribute',
+                                      self._describe_request(*group), self.runtime)
+                return [item async for item in paginator.items_async()]
+
+        results = await asyncio.gather(*(describe(group) for group in groups), return_exceptions=True)
+        return [self._plan(group, desired[group], result) for group, result in zip(groups, results)]
+
+    def _apply_group(self, plan: GroupPlan) -> GroupResult:
+        client = self.clients.client(plan.region_id)
+        for applied, call in enumerate(plan.calls):
+            try:
+                client.call_action(call.action, _request(call), self.runtime)
+            except Exception as error:
+                return GroupResult(plan.region_id, plan.security_group_id, applied, call, error)
+        return GroupResult(plan.region_id, plan.security_group_id, len(plan.calls), None, plan.error)
+
+    async def _apply_group_async(self, plan: GroupPlan) -> GroupResult:
+        client = self.clients.client(plan.region_id)
+        for applied, call in enumerate(plan.calls):
+            try:
+                await client.call_action_async(call.action, _request(call), self.runtime)
+            except Exception as error:
+                return GroupResult(plan.region_id, plan.security_group_id, applied, call, error)
+        return GroupResult(plan.region_id, plan.security_group_id, len(plan.calls), None, plan.error)
+
+    def apply(
+        self,
+        plans: Sequence[GroupPlan],
+    ) -> List[GroupResult]:
+        """
+        Run every plan's calls, in plan order. A group whose rules could not
+        be read reports that error.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(plans) or 1))) as executor:
+            return list(executor.map(self._apply_group, plans))
+
+    async def apply_async(
+        self,
+        plans: Sequence[GroupPlan],
+    ) -> List[GroupResult]:
+        """
+        Async version of `apply`.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def run(plan: GroupPlan) -> GroupResult:
+            async with semaphore:
+                return await self._apply_group_async(plan)
+
+        return list(await asyncio.gather(*(run(plan) for plan in plans)))
+
+    def sync(
+        self,
+        desired: Mapping[GroupKey, Iterable[Rule]],
+    ) -> List[GroupResult]:
+        """
+        `plan` then `apply`.
+        """
+        return self.apply(self.plan(desired))
+
+    async def sync_async(
+        self,
+        desired: Mapping[GroupKey, Iterable[Rule]],
+    ) -> List[GroupResult]:
+        """
+        Async version of `sync`.
+        """
+        return await self.apply_async(await self.plan_async(desired))
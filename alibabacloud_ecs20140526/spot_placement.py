@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.columnar import Table, concat, outer_join
+from alibabacloud_ecs20140526.spot_prices import SpotPriceStore, SpotSeries
+from darabonba.runtime import RuntimeOptions
+
+# Seconds each source stays fresh. Stock moves fastest; spot advice is a
+# 30-day aggregate.
+DEFAULT_TTLS = {
+    'DescribeSpotAdvice': 3600,
+    'DescribeSpotPriceHistory': 900,
+    'DescribeAvailableResource': 60,
+}
+
+# Order of DescribeAvailableResource status categories, best first; zones
+# without an entry for the type rank last.
+STOCK_RANKS = {
+    'WithStock': 0,
+    'ClosedWithStock': 1,
+    'WithoutStock': 2,
+    'ClosedWithoutStock': 3,
+}
+
+PLACEMENT_COLUMNS = (
+    'region_id', 'zone_id', 'instance_type', 'stock', 'stock_rank', 'interruption_rate',
+    'interrupt_rate_desc', 'average_spot_discount', 'mean_price', 'last_price', 'volatility',
+)
+_NUMERIC = ('stock_rank', 'interruption_rate', 'average_spot_discount', 'mean_price', 'last_price', 'volatility')
+
+# Every source is a Table keyed by these columns, one row per key.
+_KEY = ('zone_id', 'instance_type')
+_ADVICE_COLUMNS = _KEY + ('interruption_rate', 'interrupt_rate_desc', 'average_spot_discount')
+_STOCK_COLUMNS = _KEY + ('stock',)
+_PRICE_COLUMNS = _KEY + ('mean_price', 'last_price', 'volatility')
+
+def _unique(table: Table) -> Table:
+    # Keep the last row of each key, as ECS lists a zone's type only once
+    # but a repeated entry should not break the join.
+    last = {key: index for index, key in enumerate(zip(table['zone_id'], table['instance_type']))}
+    return table if len(last) == len(table) else table.take(sorted(last.values()))
+
+class SpotPlacementAdvisor:
+    """
+    Ranks (zone, instance type) placements for spot instances in a region by
+    joining DescribeSpotAdvice (interruption rate, average discount),
+    DescribeAvailableResource (stock) and the spot price history of a
+    SpotPriceStore (mean and last price, volatility over `history_seconds`).
+
+    The three sources are fetched in parallel and each is kept for its own
+    TTL (`ttls`, DEFAULT_TTLS by default), so repeated decisions within the
+    TTLs are answered from memory without calling ECS.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        price_store: SpotPriceStore = None,
+        ttls: Dict[str, float] = None,
+        network_type: str = 'vpc',
+        history_seconds: int = 7 * 86400,
+        runtime: RuntimeOptions = None,
+    ):
+        self.clients = clients
+        self.price_store = price_store or SpotPriceStore()
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.network_type = network_type
+        self.history_seconds = history_seconds
+        self.runtime = runtime or RuntimeOptions()
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _store(self, key: tuple, value: Any) -> Any:
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttls[key[0]], value)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _advice_request(self, region_id: str, instance_types: Sequence[str]) -> main_models.DescribeSpotAdviceRequest:
+        return main_models.DescribeSpotAdviceRequest(region_id=region_id, instance_types=list(instance_types))
+
+    @staticmethod
+    def _parse_advice(response: Any) -> Table:
+        columns: Dict[str, List[Any]] = {name: [] for name in _ADVICE_COLUMNS}
+        body = response.body
+        zones = body.available_spot_zones.available_spot_zone if body and body.available_spot_zones else None
+        for zone in zones or []:
+            resources = zone.available_spot_resources.available_spot_resource if zone.available_spot_resources else None
+            for resource in resources or []:
+                columns['zone_id'].append(zone.zone_id)
+                columns['instance_type'].append(resource.instance_type)
+                columns['interruption_rate'].append(resource.interruption_rate)
+                columns['interrupt_rate_desc'].append(resource.interrupt_rate_desc)
+                columns['average_spot_discount'].append(resource.average_spot_discount)
+        return _unique(Table(columns, numeric=_NUMERIC))
+
+    def _stock_request(self, region_id: str) -> main_models.DescribeAvailableResourceRequest:
+        return main_models.DescribeAvailableResourceRequest(
+            region_id=region_id,
+            destination_resource='InstanceType',
+            instance_charge_type='PostPaid',
+            spot_strategy='SpotAsPriceGo',
+        )
+
+    @staticmethod
+    def _parse_stock(response: Any) -> Table:
+        columns: Dict[str, List[Any]] = {name: [] for name in _STOCK_COLUMNS}
+        body = response.body
+        zones = body.available_zones.available_zone if body and body.available_zones else None
+        for zone in zones or []:
+            resources = zone.available_resources.available_resource if zone.available_resources else None
+            for resource in resources or []:
+                supported = resource.supported_resources.supported_resource if resource.supported_resources else None
+                for item in supported or []:
+                    columns['zone_id'].append(zone.zone_id)
+                    columns['instance_type'].append(item.value)
+                    columns['stock'].append(item.status_category)
+        return _unique(Table(columns))
+
+    def _prices(self, region_id: str, instance_type: str) -> Table:
+        stats = self.price_store.zone_stats(
+            region_id, instance_type, self.network_type, start=time.time() - self.history_seconds, percentiles=(),
+        )
+        columns = {name: stats[name] for name in _PRICE_COLUMNS if name != 'instance_type'}
+        columns['instance_type'] = [instance_type] * len(stats)
+        return Table(columns, numeric=_NUMERIC)
+
+    def _series(self, region_id: str, instance_types: Sequence[str]) -> List[SpotSeries]:
+        return [SpotSeries(region_id, instance_type, self.network_type) for instance_type in instance_types
+                if self._cached(('DescribeSpotPriceHistory', region_id, instance_type)) is None]
+
+    def _price_rows(self, region_id: str, instance_types: Sequence[str], synced: Sequence[Any]) -> Table:
+        tables = []
+        fresh = {result.series.instance_type: result.error is None for result in synced}
+        for instance_type in dict.fromkeys(instance_types):
+            key = ('DescribeSpotPriceHistory', region_id, instance_type)
+            if instance_type not in fresh:
+                prices = self._cached(key)
+                if prices is not None:
+                    tables.append(prices)
+                continue
+            prices = self._prices(region_id, instance_type)
+            if fresh[instance_type]:
+                # A failed sync is retried on the next call instead of cached.
+                self._store(key, prices)
+            tables.append(prices)
+        return concat(tables, _PRICE_COLUMNS)
+
+    def _join(self, region_id: str, instance_types: Sequence[str], advice: Table, stock: Table, prices: Table) -> Table:
+        wanted = set(instance_types)
+        sources = [table.where([instance_type in wanted for instance_type in table['instance_type']])
+                   for table in (advice, stock, prices)]
+        joined = outer_join(sources, _KEY)
+        ranks = [STOCK_RANKS.get(status, len(STOCK_RANKS)) for status in joined['stock']]
+        columns = dict(joined.columns, region_id=[region_id] * len(joined), stock_rank=ranks)
+        table = Table({name: columns[name] for name in PLACEMENT_COLUMNS}, numeric=_NUMERIC)
+        # Best stock first, then the least interrupted, then the cheapest.
+        return table.sort(['stock_rank', 'interruption_rate', 'mean_price'])
+
+    def advise(
+        self,
+        region_id: str,
+        instance_types: Sequence[str],
+    ) -> Table:
+        """
+        One row per (zone, instance type) of `instance_types` seen by any
+        source, ranked by stock, then interruption rate, then mean price.
+        Columns are PLACEMENT_COLUMNS; a source without data for a row
+        leaves its columns missing.
+        """
+        client = self.clients.client(region_id)
+        advice_key = ('DescribeSpotAdvice', region_id, tuple(sorted(instance_types)))
+        stock_key = ('DescribeAvailableResource', region_id)
+        advice, stock = self._cached(advice_key), self._cached(stock_key)
+        series = self._series(region_id, instance_types)
+        synced = []
+        if advice is None or stock is None or series:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                if advice is None:
+                    advice = executor.submit(client.call_action, 'DescribeSpotAdvice',
+                                             self._advice_request(region_id, instance_types), self.runtime)
+                if stock is None:
+                    stock = executor.submit(client.call_action, 'DescribeAvailableResource',
+                                            self._stock_request(region_id), self.runtime)
+                if series:
+                    synced = executor.submit(self.price_store.sync, self.clients, series,
+                                             start=time.time() - self.history_seconds, runtime=self.runtime)
+            if not isinstance(advice, Table):
+                advice = self._store(advice_key, self._parse_advice(advice.result()))
+            if not isinstance(stock, Table):
+                stock = self._store(stock_key, self._parse_stock(stock.result()))
+            if series:
+                synced = synced.result()
+        return self._join(region_id, instance_types, advice, stock, self._price_rows(region_id, instance_types, synced))
+
+    async def advise_async(
+        self,
+        region_id: str,
+        instance_types: Sequence[str],
+    ) -> Table:
+        """
+        Async version of `advise`.
+        """
+        client = self.clients.client(region_id)
+        advice_key = ('DescribeSpotAdvice', region_id, tuple(sorted(instance_types)))
+        stock_key = ('DescribeAvailableResource', region_id)
+
+        async def advice() -> Table:
+            rows = self._cached(advice_key)
+            if rows is None:
+                response = await client.call_action_async(
+                    'DescribeSpotAdvice', self._advice_request(region_id, instance_types), self.runtime)
+                rows = self._store(advice_key, self._parse_advice(response))
+            return rows
+
+        async def stock() -> Table:
+            rows = self._cached(stock_key)
+            if rows is None:
+                response = await client.call_action_async(
+                    'DescribeAvailableResource', self._stock_request(region_id), self.runtime)
+                rows = self._store(stock_key, self._parse_stock(response))
+            return rows
+
+        series = self._series(region_id, instance_types)
+        advice_rows, stock_rows, synced = await asyncio.gather(
+            advice(),
+            stock(),
+            self.price_store.sync_async(self.clients, series, start=time.time() - self.history_seconds, runtime=self.runtime),
+        )
+        return self._join(region_id, instance_types, advice_rows, stock_rows, self._price_rows(region_id, instance_types, synced))
+
+    async def advise_regions_async(
+        self,
+        region_ids: Sequence[str],
+        instance_types: Sequence[str],
+    ) -> Table:
+        """
+        `advise_async` for several regions in parallel, ranked together.
+        """
+        tables = await asyncio.gather(*(self.advise_async(region_id, instance_types) for region_id in region_ids))
+        return concat(tables, PLACEMENT_COLUMNS).sort(['stock_rank', 'interruption_rate', 'mean_price'])
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import calendar
+import math
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.columnar import Table, numpy
+from darabonba.runtime import RuntimeOptions
+
+# DescribeSpotPriceHistory looks back at most 30 days.
+MAX_HISTORY = 30 * 86400
+
+# The OSType DescribeSpotPriceHistory assumes when none is given.
+DEFAULT_OSTYPE = 'linux'
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS spot_price ('
+    ' region_id TEXT NOT NULL, instance_type TEXT NOT NULL, network_type TEXT NOT NULL,'
+    ' io_optimized TEXT NOT NULL, ostype TEXT NOT NULL, zone_id TEXT NOT NULL, timestamp INTEGER NOT NULL,'
+    ' spot_price REAL, origin_price REAL,'
+    ' PRIMARY KEY (region_id, instance_type, network_type, io_optimized, ostype, zone_id, timestamp)'
+    ') WITHOUT ROWID',
+    'CREATE TABLE IF NOT EXISTS spot_price_watermark (series TEXT PRIMARY KEY, synced_until INTEGER NOT NULL)',
+)
+
+class SpotSeries(NamedTuple):
+    region_id: str
+    instance_type: str
+    network_type: str = 'vpc'
+    # None syncs every zone of the region in one series.
+    zone_id: Optional[str] = None
+    io_optimized: Optional[str] = None
+    ostype: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return '/'.join(value or '' for value in self)
+
+class SyncResult(NamedTuple):
+    series: SpotSeries
+    # Price points fetched, including ones the store already held.
+    fetched: int
+    # The first error, if a slice failed; the watermark then stops before it.
+    error: Optional[Exception]
+
+def _iso(epoch: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(epoch))
+
+def _epoch(timestamp: str) -> int:
+    return calendar.timegm(time.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ'))
+
+def _percentile(values: List[float], q: float) -> float:
+    # Linear interpolation between closest ranks, as numpy.percentile.
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+class SpotPriceStore:
+    """
+    A local, append-only copy of DescribeSpotPriceHistory in sqlite.
+
+    `sync` fetches each series only from its watermark (the end of the last
+    successful sync) to now, so repeated runs download only new points. The
+    time range is cut into `slice_seconds` slices fetched concurrently, each
+    paged through `Offset`/`NextOffset`. Queries read a series back as
+    columns (NumPy arrays when NumPy is installed) and aggregate per zone.
+    """
+
+    def __init__(
+        self,
+        path: str = ':memory:',
+        slice_seconds: int = 86400,
+    ):
+        self.path = path
+        self.slice_seconds = slice_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        self._migrate()
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+    def _migrate(self) -> None:
+        # Stores written before ostype was a column hold Linux and Windows
+        # prices under one key and cannot be told apart; drop them so the
+        # next sync fetches the series again.
+        columns = [row[1] for row in self._connection.execute('PRAGMA table_info(spot_price)')]
+        if columns and 'ostype' not in columns:
+            self._connection.execute('DROP TABLE spot_price')
+            self._connection.execute('DROP TABLE IF EXISTS spot_price_watermark')
+
+    def watermark(
+        self,
+        series: SpotSeries,
+    ) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT synced_until FROM spot_price_watermark WHERE series = ?', (series.key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _slices(self, series: SpotSeries, start: Optional[float], end: int) -> List[Tuple[int, int]]:
+        start = max(self.watermark(series) or 0, end - MAX_HISTORY, int(start or 0))
+        return [(begin, min(end, begin + self.slice_seconds)) for begin in range(start, end, self.slice_seconds)]
+
+    def _request(self, series: SpotSeries, start: int, end: int) -> main_models.DescribeSpotPriceHistoryRequest:
+        return main_models.DescribeSpotPriceHistoryRequest(
+            region_id=series.region_id,
+            zone_id=series.zone_id,
+            instance_type=series.instance_type,
+            network_type=series.network_type,
+            io_optimized=series.io_optimized,
+            ostype=series.ostype,
+            start_time=_iso(start),
+            end_time=_iso(end),
+        )
+
+    @staticmethod
+    def _next_offset(request: Any, response: Any) -> Optional[int]:
+        body = response.body
+        items = body.spot_prices.spot_price_type if body and body.spot_prices else None
+        offset = body.next_offset if body else None
+        if not items or not offset or offset <= (request.offset or 0):
+            return None
+        return offset
+
+    @staticmethod
+    def _items(response: Any) -> List[Any]:
+        body = response.body
+        return list(body.spot_prices.spot_price_type or []) if body and body.spot_prices else []
+
+    def _fetch_slice(self, clients: RegionalClientPool, series: SpotSeries, start: int, end: int,
+                     runtime: RuntimeOptions) -> List[Any]:
+        client = clients.client(series.region_id)
+        request = self._request(series, start, end)
+        items = []
+        while True:
+            response = client.call_action('DescribeSpotPriceHistory', request, runtime)
+            items.extend(self._items(response))
+            offset = self._next_offset(request, response)
+            if offset is None:
+                return items
+            request.offset = offset
+
+    async def _fetch_slice_async(self, clients: RegionalClientPool, series: SpotSeries, start: int, end: int,
+                                 runtime: RuntimeOptions) -> List[Any]:
+        client = clients.client(series.region_id)
+        request = self._request(series, start, end)
+        items = []
+        while True:
+            response = await client.call_action_async('DescribeSpotPriceHistory', request, runtime)
+            items.extend(self._items(response))
+            offset = self._next_offset(request, response)
+            if offset is None:
+                return items
+            request.offset = offset
+
+    def _save(self, series: SpotSeries, slices: List[Tuple[int, int]], results: List[Any]) -> SyncResult:
+        rows = []
+        synced_until = None
+        error = None
+        for (start, end), items in zip(slices, results):
+            if isinstance(items, Exception):
+                error = error or items
+                continue
+            if error is None:
+                synced_until = end
+            for item in items:
+                rows.append((
+                    series.region_id, series.instance_type, item.network_type or series.network_type,
+                    item.io_optimized or series.io_optimized or '', series.ostype or DEFAULT_OSTYPE,
+                    item.zone_id or series.zone_id or '', _epoch(item.timestamp), item.spot_price, item.origin_price,
+                ))
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                self._connection.executemany('INSERT OR IGNORE INTO spot_price VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+                if synced_until is not None:
+                    self._connection.execute(
+                        'INSERT OR REPLACE INTO spot_price_watermark (series, synced_until) VALUES (?, ?)',
+                        (series.key, synced_until),
+                    )
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+        return SyncResult(series, len(rows), error)
+
+    def sync(
+        self,
+        clients: RegionalClientPool,
+        series: Sequence[SpotSeries],
+        concurrency: int = 16,
+        start: float = None,
+        end: float = None,
+        runtime: RuntimeOptions = None,
+    ) -> List[SyncResult]:
+        """
+        Fetch every series from its watermark, or from `start` (at most 30
+        days back) on the first sync, up to `end` (now by default), with at
+        most `concurrency` slices in flight.
+        """
+        end = int(end if end is not None else time.time())
+        runtime = runtime or RuntimeOptions()
+        plans = [(item, self._slices(item, start, end)) for item in series]
+        jobs = [(item, start, stop) for item, slices in plans for start, stop in slices]
+
+        def fetch(job: Tuple[SpotSeries, int, int]) -> Any:
+            try:
+                return self._fetch_slice(clients, *job, runtime)
+            except Exception as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs) or 1))) as executor:
+            fetched = iter(list(executor.map(fetch, jobs)))
+        return [self._save(item, slices, [next(fetched) for _ in slices]) for item, slices in plans]
+
+    async def sync_async(
+        self,
+        clients: RegionalClientPool,
+        series: Sequence[SpotSeries],
+        concurrency: int = 16,
+        start: float = None,
+        end: float = None,
+        runtime: RuntimeOptions = None,
+    ) -> List[SyncResult]:
+        """
+        Async version of `sync`.
+        """
+        end = int(end if end is not None else time.time())
+        runtime = runtime or RuntimeOptions()
+        plans = [(item, self._slices(item, start, end)) for item in series]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(item: SpotSeries, start: int, stop: int) -> List[Any]:
+            async with semaphore:
+                return await self._fetch_slice_async(clients, item, start, stop, runtime)
+
+        results = []
+        for item, slices in plans:
+            results.append(asyncio.gather(*(fetch(item, start, stop) for start, stop in slices), return_exceptions=True))
+        fetched = await asyncio.gather(*results)
+        return [self._save(item, slices, items) for (item, slices), items in zip(plans, fetched)]
+
+    def history(
+        self,
+        region_id: str,
+        instance_type: str,
+        network_type: str = 'vpc',
+        zone_id: str = None,
+        start: float = None,
+        end: float = None,
+        ostype: str = DEFAULT_OSTYPE,
+        io_optimized: str = None,
+    ) -> Table:
+        """
+        Price points of one instance type and OS type as columns zone_id,
+        timestamp (epoch seconds), spot_price and origin_price, ordered by
+        zone and time. `io_optimized` None accepts either value.
+        """
+        query = ('SELECT zone_id, timestamp, spot_price, origin_price FROM spot_price'
+                 ' WHERE region_id = ? AND instance_type = ? AND network_type = ? AND ostype = ?'
+                 ' AND timestamp >= ? AND timestamp <= ?')
+        params = [region_id, instance_type, network_type, ostype, int(start or 0), int(end if end is not None else 2 ** 62)]
+        for name, value in (('zone_id', zone_id), ('io_optimized', io_optimized)):
+            if value is not None:
+                query += f' AND {name} = ?'
+                params.append(value)
+        with self._lock:
+            rows = self._connection.execute(query + ' ORDER BY zone_id, timestamp', params).fetchall()
+        columns = list(zip(*rows)) or [(), (), (), ()]
+        return Table(
+            dict(zip(('zone_id', 'timestamp', 'spot_price', 'origin_price'), columns)),
+            numeric=('timestamp', 'spot_price', 'origin_price'),
+        )
+
+    def zone_stats(
+        self,
+        region_id: str,
+        instance_type: str,
+        network_type: str = 'vpc',
+        start: float = None,
+        end: float = None,
+        percentiles: Sequence[float] = (50, 90),
+        ostype: str = DEFAULT_OSTYPE,
+        io_optimized: str = None,
+    ) -> Table:
+        """
+        Per zone over the window: the number of points, the last, mean, min
+        and max spot price, the requested percentiles (columns p50, p90,
+        ...) and the volatility (standard deviation over mean).
+        """
+        history = self.history(region_id, instance_type, network_type, None, start, end, ostype, io_optimized)
+        zones = history['zone_id']
+        prices = history['spot_price']
+        names = ['count', 'last_price', 'mean_price', 'min_price', 'max_price'] + [f'p{q:g}' for q in percentiles] + ['volatility']
+        columns: Dict[str, List[Any]] = {'zone_id': [], **{name: [] for name in names}}
+        begin = 0
+        while begin < len(zones):
+            stop = begin
+            while stop < len(zones) and zones[stop] == zones[begin]:
+                stop += 1
+            if numpy is not None:
+                values = prices[begin:stop]
+                values = values[~numpy.isnan(values)]
+                stats = [len(values), values[-1], values.mean(), values.min(), values.max()] if len(values) else [0] + [None] * 4
+                stats += list(numpy.percentile(values, percentiles)) if len(values) else [None] * len(percentiles)
+                stats.append(values.std() / stats[2] if len(values) and stats[2] else None)
+            else:
+                values = [value for value in prices[begin:stop] if value is not None]
+                mean = sum(values) / len(values) if values else None
+                stats = [len(values), values[-1], mean, min(values), max(values)] if values else [0] + [None] * 4
+                stats += [_percentile(values, q) for q in percentiles] if values else [None] * len(percentiles)
+                stats.append(math.sqrt(sum((value - mean) ** 2 for value in values) / len(values)) / mean if values and mean else None)
+            columns['zone_id'].append(zones[begin])
+            for name, value in zip(names, stats):
+                columns[name].append(value)
+            begin = stop
+        return Table(columns, numeric=names)
+
+    def cheapest_zone(
+        self,
+        region_id: str,
+        instance_type: str,
+        network_type: str = 'vpc',
+        start: float = None,
+        end: float = None,
+        by: str = 'mean_price',
+        ostype: str = DEFAULT_OSTYPE,
+        io_optimized: str = None,
+    ) -> Optional[str]:
+        """
+        The zone with the lowest `by` (a zone_stats column) over the window.
+        """
+        stats = self.zone_stats(region_id, instance_type, network_type, start, end, ostype=ostype, io_optimized=io_optimized)
+        index = stats.argmin(by)
+        return None if index is None else stats['zone_id'][index]
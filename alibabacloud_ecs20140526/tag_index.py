@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.paginator import Paginator
+from darabonba.runtime import RuntimeOptions
+
+class ResourceRef(NamedTuple):
+    region_id: str
+    # ListTagResources resource type, e.g. instance, disk, securitygroup.
+    resource_type: str
+    resource_id: str
+
+class TagQuery(ABC):
+    """
+    A boolean query over tags, built from HasTag leaves with `&`, `|` and
+    `~`, e.g. HasTag('team', 'payments') & ~HasTag('env', 'dev').
+    """
+
+    def __and__(self, other: TagQuery) -> TagQuery:
+        return _And(self, other)
+
+    def __or__(self, other: TagQuery) -> TagQuery:
+        return _Or(self, other)
+
+    def __invert__(self) -> TagQuery:
+        return _Not(self)
+
+    @abstractmethod
+    def evaluate(self, snapshot: _Snapshot, universe: FrozenSet[ResourceRef]) -> Set[ResourceRef]:
+        """
+        The resources of `universe` that match, using `snapshot`'s postings.
+        """
+
+class HasTag(TagQuery):
+    """
+    Resources tagged `key`, with `value` if given, else with any value.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        value: str = None,
+    ):
+        self.key = key
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f'HasTag({self.key!r}, {self.value!r})'
+
+    def evaluate(self, snapshot: _Snapshot, universe: FrozenSet[ResourceRef]) -> Set[ResourceRef]:
+        if self.value is None:
+            refs = snapshot.by_key.get(self.key, frozenset())
+        else:
+            refs = snapshot.by_tag.get((self.key, self.value), frozenset())
+        return refs & universe
+
+class _And(TagQuery):
+    def __init__(self, left: TagQuery, right: TagQuery):
+        self.left, self.right = left, right
+
+    def __repr__(self) -> str:
+        return f'({self.left!r} & {self.right!r})'
+
+    def evaluate(self, snapshot: _Snapshot, universe: FrozenSet[ResourceRef]) -> Set[ResourceRef]:
+        left = self.left.evaluate(snapshot, universe)
+        return left & self.right.evaluate(snapshot, frozenset(left)) if left else left
+
+class _Or(TagQuery):
+    def __init__(self, left: TagQuery, right: TagQuery):
+        self.left, self.right = left, right
+
+    def __repr__(self) -> str:
+        return f'({self.left!r} | {self.right!r})'
+
+    def evaluate(self, snapshot: _Snapshot, universe: FrozenSet[ResourceRef]) -> Set[ResourceRef]:
+        return self.left.evaluate(snapshot, universe) | self.right.evaluate(snapshot, universe)
+
+class _Not(TagQuery):
+    def __init__(self, query: TagQuery):
+        self.query = query
+
+    def __repr__(self) -> str:
+        return f'~{self.query!r}'
+
+    def evaluate(self, snapshot: _Snapshot, universe: FrozenSet[ResourceRef]) -> Set[ResourceRef]:
+        return set(universe) - self.query.evaluate(snapshot, universe)
+
+class _Snapshot:
+    # Immutable once built; a refresh swaps in a new one.
+    __slots__ = ('tags', 'by_tag', 'by_key', 'by_scope', 'all')
+
+    def __init__(self, rows: Sequence[Tuple[ResourceRef, str, Optional[str]]]):
+        tags: Dict[ResourceRef, Dict[str, Optional[str]]] = {}
+        by_tag: Dict[Tuple[str, Optional[str]], Set[ResourceRef]] = {}
+        by_key: Dict[str, Set[ResourceRef]] = {}
+        by_scope: Dict[Tuple[Optional[str], Optional[str]], Set[ResourceRef]] = {}
+        for ref, key, value in rows:
+            tags.setdefault(ref, {})[key] = value
+            by_tag.setdefault((key, value), set()).add(ref)
+            by_key.setdefault(key, set()).add(ref)
+        for ref in tags:
+            for scope in ((ref.region_id, ref.resource_type), (ref.region_id, None), (None, ref.resource_type)):
+                by_scope.setdefault(scope, set()).add(ref)
+        self.tags = tags
+        self.by_tag = {tag: frozenset(refs) for tag, refs in by_tag.items()}
+        self.by_key = {key: frozenset(refs) for key, refs in by_key.items()}
+        self.by_scope = {scope: frozenset(refs) for scope, refs in by_scope.items()}
+        self.all = frozenset(tags)
+
+_Source = Tuple[str, str, str]
+
+class TagIndex:
+    """
+    An in-memory inverted index from tags to resources, built from
+    ListTagResources for every tag key in `keys`, resource type in
+    `resource_types` and region in `regions` (all regions by default).
+    ListTagResources needs a tag key or resource IDs to list anything, so
+    only resources carrying one of `keys` are indexed, with all the tags
+    ECS returns for them.
+
+    `refresh` relists every (region, type, key) concurrently and swaps in
+    the new index at once, so readers never see a half-built one; a listing
+    that fails keeps its previous rows. `start` runs refresh in a daemon
+    thread every `interval` seconds. Queries never call ECS.
+    """
+
+    def __init__(
+        self,
+        clients: RegionalClientPool,
+        keys: Sequence[str],
+        resource_types: Sequence[str] = ('instance',),
+        regions: Sequence[str] = None,
+        interval: float = 300,
+        concurrency: int = 8,
+        runtime: RuntimeOptions = None,
+    ):
+        self.clients = clients
+        self.keys = list(keys)
+        self.resource_types = list(resource_types)
+        self.regions = list(regions) if regions is not None else None
+        self.interval = interval
+        self.concurrency = concurrency
+        self.runtime = runtime or RuntimeOptions()
+        self.refreshed_at: Optional[float] = None
+        self.errors: Dict[_Source, Exception] = {}
+        self._sources: Dict[_Source, List[Tuple[ResourceRef, str, Optional[str]]]] = {}
+        self._snapshot = _Snapshot([])
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _request(self, source: _Source) -> main_models.ListTagResourcesRequest:
+        region_id, resource_type, key = source
+        return main_models.ListTagResourcesRequest(
+            region_id=region_id,
+            resource_type=resource_type,
+            tag=[main_models.ListTagResourcesRequestTag(key=key)],
+        )
+
+    @staticmethod
+    def _rows(source: _Source, items: Sequence[Any]) -> List[Tuple[ResourceRef, str, Optional[str]]]:
+        region_id, resource_type = source[:2]
+        return [(ResourceRef(region_id, item.resource_type or resource_type, item.resource_id), item.tag_key, item.tag_value)
+                for item in items]
+
+    def _list(self, source: _Source) -> List[Tuple[ResourceRef, str, Optional[str]]]:
+        client = self.clients.client(source[0])
+        return self._rows(source, list(Paginator(client, 'ListTagResources', self._request(source), self.runtime).items()))
+
+    async def _list_async(self, source: _Source) -> List[Tuple[ResourceRef, str, Optional[str]]]:
+        client = self.clients.client(source[0])
+        paginator = Paginator(client, 'ListTagResources', self._request(source), self.runtime)
+        return self._rows(source, [item async for item in paginator.items_async()])
+
+    def _sources_for(self, regions: Sequence[str]) -> List[_Source]:
+        return [(region_id, resource_type, key) for region_id in regions for resource_type in self.resource_types for key in self.keys]
+
+    def _swap(self, sources: List[_Source], results: List[Any]) -> None:
+        errors = {}
+        with self._lock:
+            for source, rows in zip(sources, results):
+                if isinstance(rows, Exception):
+                    errors[source] = rows
+                else:
+                    self._sources[source] = rows
+            # Regions or keys dropped from the configuration leave the index.
+            wanted = set(sources)
+            self._sources = {source: rows for source, rows in self._sources.items() if source in wanted}
+            snapshot = _Snapshot([row for rows in self._sources.values() for row in rows])
+            self._snapshot = snapshot
+            self.errors = errors
+            self.refreshed_at = time.time()
+
+    def refresh(self) -> Dict[_Source, Exception]:
+        """
+        Relist every source and swap in the new index. Returns the failed
+        sources with their errors.
+        """
+        sources = self._sources_for(self.regions if self.regions is not None else self.clients.region_ids())
+
+        def run(source: _Source) -> Any:
+            try:
+                return self._list(source)
+            except Exception as error:
+                return error
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(sources) or 1))) as executor:
+            results = list(executor.map(run, sources))
+        self._swap(sources, results)
+        return self.errors
+
+    async def refresh_async(self) -> Dict[_Source, Exception]:
+        """
+        Async version of `refresh`.
+        """
+        sources = self._sources_for(self.regions if self.regions is not None else await self.clients.region_ids_async())
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def run(source: _Source) -> List[Tuple[ResourceRef, str, Optional[str]]]:
+            async with semaphore:
+                return await self._list_async(source)
+
+        results = await asyncio.gather(*(run(source) for source in sources), return_exceptions=True)
+        self._swap(sources, list(results))
+        return self.errors
+
+    def start(self) -> None:
+        """
+        Refresh now, then every `interval` seconds in a daemon thread until
+        `stop` is called.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.refresh()
+
+        def loop() -> None:
+            while not self._stop.wait(self.interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    # Region listing failed; keep serving the last index.
+                    pass
+
+        self._thread = threading.Thread(target=loop, name='tag-index-refresh', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def query(
+        self,
+        query: TagQuery,
+        resource_type: str = None,
+        region_id: str = None,
+    ) -> Set[ResourceRef]:
+        """
+        Indexed resources matching `query`, optionally only of one resource
+        type and region. `~` is relative to the indexed resources in that
+        scope.
+        """
+        snapshot = self._snapshot
+        if resource_type is None and region_id is None:
+            universe = snapshot.all
+        else:
+            universe = snapshot.by_scope.get((region_id, resource_type), frozenset())
+        return query.evaluate(snapshot, universe)
+
+    def ids(
+        self,
+        query: TagQuery,
+        resource_type: str = None,
+        region_id: str = None,
+    ) -> List[str]:
+        return sorted(ref.resource_id for ref in self.query(query, resource_type, region_id))
+
+    def tags(
+        self,
+        ref: ResourceRef,
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Tags of an indexed resource, or None if it is not indexed.
+        """
+        tags = self._snapshot.tags.get(ref)
+        return dict(tags) if tags is not None else None
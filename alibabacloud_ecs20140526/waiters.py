@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from typing import Any, AsyncIterator, Collection, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.batch import ChunkError, call_batched, call_batched_async, page_items
+from alibabacloud_ecs20140526.paginator import Paginator, pagination_spec
+from darabonba.runtime import RuntimeOptions
+
+class WaiterTimeout(TimeoutError):
+    """
+    Raised when a waiter runs out of time. `pending` maps every resource
+    that had not converged to its last seen status (None if never seen),
+    and `errors` holds the calls of the last poll that failed, if any.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        pending: Dict[str, Optional[str]],
+        errors: List[ChunkError] = None,
+    ):
+        super().__init__(message)
+        self.pending = pending
+        self.errors = list(errors or [])
+
+class InstanceEvent(NamedTuple):
+    instance_id: str
+    status: str
+    # Seconds from the start of the wait until the status was seen.
+    elapsed: float
+
+class _Backoff:
+    # Polls again after `min_interval` while resources keep converging and
+    # backs off by `factor`, up to `max_interval`, while none do.
+
+    def __init__(self, min_interval: float, max_interval: float, factor: float = 1.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self.interval = min_interval
+
+    def next(self, progressed: bool) -> float:
+        if progressed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.factor)
+        return self.interval
+
+class _InstancePoll:
+    # State shared by the sync and async instance waiters.
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        target_status: Union[str, Collection[str]],
+        timeout: float,
+        min_interval: float,
+        max_interval: float,
+    ):
+        self.pending: Dict[str, Optional[str]] = dict.fromkeys(ids)
+        self.targets = {target_status} if isinstance(target_status, str) else set(target_status)
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout if timeout is not None else None
+        self.backoff = _Backoff(min_interval, max_interval)
+        self.errors: List[ChunkError] = []
+
+    def request(self, region_id: Optional[str]) -> main_models.DescribeInstanceStatusRequest:
+        # DescribeInstanceStatus returns at most 50 statuses per page.
+        return main_models.DescribeInstanceStatusRequest(region_id=region_id, page_size=50)
+
+    def update(self, result: Any) -> List[InstanceEvent]:
+        # IDs of a chunk that failed stay pending and are polled again; the
+        # errors are only raised, with WaiterTimeout, once time runs out.
+        self.errors = result.errors
+        events = []
+        elapsed = time.monotonic() - self.started
+        for status in page_items('DescribeInstanceStatus', result.response) if result.response else []:
+            if status.instance_id not in self.pending:
+                continue
+            self.pending[status.instance_id] = status.status
+            if status.status in self.targets:
+                del self.pending[status.instance_id]
+                events.append(InstanceEvent(status.instance_id, status.status, elapsed))
+        return events
+
+    def sleep_time(self, progressed: bool) -> float:
+        interval = self.backoff.next(progressed)
+        if self.deadline is None:
+            return interval
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            error = self.errors[-1].error if self.errors else None
+            raise WaiterTimeout(
+                f'{len(self.pending)} instances did not reach {sorted(self.targets)} in time',
+                dict(self.pending),
+                self.errors,
+            ) from error
+        return min(interval, remaining)
+
+def wait_for_instances(
+    client: Any,
+    ids: Sequence[str],
+    target_status: Union[str, Collection[str]],
+    timeout: float = 600,
+    region_id: str = None,
+    min_interval: float = 2.0,
+    max_interval: float = 15.0,
+    concurrency: int = 4,
+    runtime: RuntimeOptions = None,
+) -> Iterator[InstanceEvent]:
+    """
+    Yield an InstanceEvent for each instance as soon as DescribeInstanceStatus
+    reports it in `target_status`. All pending instances are polled together,
+    100 IDs per call, and converged ones are dropped from the next poll.
+    The interval starts at `min_interval` and grows up to `max_interval`
+    while nothing converges. A failed call does not end the wait: its IDs
+    are polled again in the next round. Raises WaiterTimeout after
+    `timeout` seconds, with the errors of the last round if it had any.
+    """
+    poll = _InstancePoll(ids, target_status, timeout, min_interval, max_interval)
+    region_id = region_id or client._region_id
+    while poll.pending:
+        result = call_batched(
+            client, 'DescribeInstanceStatus', poll.request(region_id),
+            list(poll.pending), concurrency, runtime,
+        )
+        events = poll.update(result)
+        yield from events
+        if poll.pending:
+            time.sleep(poll.sleep_time(bool(events)))
+
+async def wait_for_instances_async(
+    client: Any,
+    ids: Sequence[str],
+    target_status: Union[str, Collection[str]],
+    timeout: float = 600,
+    region_id: str = None,
+    min_interval: float = 2.0,
+    max_interval: float = 15.0,
+    concurrency: int = 4,
+    runtime: RuntimeOptions = None,
+) -> AsyncIterator[InstanceEvent]:
+    """
+    Async version of `wait_for_instances`.
+    """
+    poll = _InstancePoll(ids, target_status, timeout, min_interval, max_interval)
+    region_id = region_id or client._region_id
+    while poll.pending:
+        result = await call_batched_async(
+            client, 'DescribeInstanceStatus', poll.request(region_id),
+            list(poll.pending), concurrency, runtime,
+        )
+        events = poll.update(result)
+        for event in events:
+            yield event
+        if poll.pending:
+            await asyncio.sleep(poll.sleep_time(bool(events)))
+
+class OperationSpec(NamedTuple):
+    # List action polled for the operation and the request attribute that
+    # takes its IDs, `max_ids` at a time (joined with `separator` when the
+    # attribute is a string holding several IDs).
+    action: str
+    id_attr: str
+    max_ids: int
+    separator: Optional[str]
+    # Attributes of a listed item holding the operation ID and its status.
+    item_id: str
+    item_status: str
+    succeeded: FrozenSet[str]
+    failed: FrozenSet[str]
+
+OPERATION_SPECS = {
+    # ImportImage, ExportImage, ReInitDisk, ModifyDiskSpec and other tasks.
+    'task': OperationSpec(
+        'DescribeTasks', 'task_ids', 100, ',', 'task_id', 'task_status',
+        frozenset(['Finished']), frozenset(['Failed', 'Cancelled', 'Deleted']),
+    ),
+    # RunCommand and InvokeCommand.
+    'invocation': OperationSpec(
+        'DescribeInvocations', 'invoke_id', 1, None, 'invoke_id', 'invocation_status',
+        frozenset(['Success']), frozenset(['Failed', 'PartialFailed', 'Stopped', 'Cancelled', 'Terminated']),
+    ),
+    'send_file': OperationSpec(
+        'DescribeSendFileResults', 'invoke_id', 1, None, 'invoke_id', 'invocation_status',
+        frozenset(['Success']),
+        frozenset(['Failed', 'PartialFailed', 'Invalid', 'Aborted', 'Timeout', 'Error', 'Stopped', 'Cancelled']),
+    ),
+    'image_pipeline_execution': OperationSpec(
+        'DescribeImagePipelineExecutions', 'execution_id', 1, None, 'execution_id', 'status',
+        frozenset(['SUCCESS', 'PARTITION_SUCCESS']), frozenset(['FAILED', 'TEST_FAILED', 'CANCELLED']),
+    ),
+}
+
+class OperationResult(NamedTuple):
+    kind: str
+    operation_id: str
+    status: str
+    succeeded: bool
+    # The listed item, e.g. a DescribeTasksResponseBodyTaskSetTask.
+    item: Any
+
+class OperationWaiter:
+    """
+    Waits on asynchronous ECS operations. Each kind of operation in
+    OPERATION_SPECS has a single poller per waiter and event loop: every
+    pending operation of that kind, whoever waits on it, is checked in the
+    same round, several IDs per call where the list action allows it
+    (DescribeTasks takes 100) and one call per ID otherwise, with at most
+    `concurrency` calls in flight. The interval adapts as in
+    `wait_for_instances`. A failed call leaves its operations pending and
+    is retried after the backoff; its error is only raised, with
+    WaiterTimeout, if the wait runs out of time. A wait gives up after
+    `timeout` seconds unless it is given its own.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        region_id: str = None,
+        timeout: float = 3600.0,
+        min_interval: float = 2.0,
+        max_interval: float = 15.0,
+        concurrency: int = 8,
+        runtime: RuntimeOptions = None,
+    ):
+        self.client = client
+        self.region_id = region_id or client._region_id
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.concurrency = concurrency
+        self.runtime = runtime or RuntimeOptions()
+        self._pending: Dict[str, Dict[str, List[asyncio.Future]]] = {}
+        self._last_status: Dict[str, Dict[str, Optional[str]]] = {}
+        # The last error of a poll covering each operation, cleared when a
+        # later poll succeeds.
+        self._errors: Dict[str, Dict[str, Exception]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def wait(
+        self,
+        kind: str,
+        operation_id: str,
+        timeout: float = None,
+    ) -> OperationResult:
+        """
+        Return once the operation has succeeded or failed. Raises
+        WaiterTimeout after `timeout` seconds (the waiter's `timeout` by
+        default).
+        """
+        if kind not in OPERATION_SPECS:
+            raise ValueError(f'unknown operation kind {kind!r}, expected one of {sorted(OPERATION_SPECS)}')
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(kind, {})
+        pending.setdefault(operation_id, []).append(future)
+        self._last_status.setdefault(kind, {}).setdefault(operation_id, None)
+        poller = self._pollers.get(kind)
+        if poller is None or poller.done() or poller.get_loop() is not loop:
+            self._pollers[kind] = loop.create_task(self._poll(kind))
+        try:
+            return await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            error = self._errors.get(kind, {}).get(operation_id)
+            raise WaiterTimeout(
+                f'{kind} {operation_id} did not finish in time',
+                {operation_id: self._last_status[kind].get(operation_id)},
+                [ChunkError(0, [operation_id], error)] if error is not None else None,
+            ) from error
+        finally:
+            futures = pending.get(operation_id)
+            if futures is not None and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del pending[operation_id]
+
+    async def wait_all(
+        self,
+        kind: str,
+        operation_ids: Sequence[str],
+        timeout: float = None,
+    ) -> AsyncIterator[OperationResult]:
+        """
+        Yield each operation's result as it finishes.
+        """
+        for next_result in asyncio.as_completed([self.wait(kind, operation_id, timeout) for operation_id in operation_ids]):
+            yield await next_result
+
+    def _request(self, spec: OperationSpec, ids: List[str]) -> Any:
+        request = getattr(main_models, f'{spec.action}Request')(region_id=self.region_id)
+        setattr(request, spec.id_attr, spec.separator.join(ids) if spec.separator else ids[0])
+        page_spec = pagination_spec(spec.action)
+        if page_spec is not None and len(ids) > 1:
+            size_attr = page_spec.max_results if page_spec.next_token is not None else page_spec.page_size
+            setattr(request, size_attr, min(len(ids), 100))
+        return request
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to the loop they are first used on, so each loop
+        # polling through this waiter gets its own.
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(max(1, self.concurrency))
+        return semaphore
+
+    async def _fetch(self, spec: OperationSpec, ids: List[str]) -> List[Any]:
+        request = self._request(spec, ids)
+        async with self._semaphore():
+            if pagination_spec(spec.action) is None:
+                response = await self.client.call_action_async(spec.action, request, self.runtime)
+                return page_items(spec.action, response)
+            return [item async for item in Paginator(self.client, spec.action, request, self.runtime).items_async()]
+
+    def _settle(self, kind: str, operation_id: str, outcome: Any) -> None:
+        for future in self._pending.get(kind, {}).pop(operation_id, []):
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def _poll(self, kind: str) -> None:
+        spec = OPERATION_SPECS[kind]
+        pending = self._pending[kind]
+        last_status = self._last_status[kind]
+        errors = self._errors.setdefault(kind, {})
+        backoff = _Backoff(self.min_interval, self.max_interval)
+        # Let waiters started in the same tick join the first round.
+        await asyncio.sleep(0)
+        while pending:
+            ids = list(pending)
+            chunks = [ids[start:start + spec.max_ids] for start in range(0, len(ids), spec.max_ids)]
+            results = await asyncio.gather(*(self._fetch(spec, chunk) for chunk in chunks), return_exceptions=True)
+            progressed = False
+            for chunk, items in zip(chunks, results):
+                if isinstance(items, BaseException):
+                    if not isinstance(items, Exception):
+                        raise items
+                    # Keep the chunk pending; a throttle or a transient
+                    # error should not fail every wait it covers.
+                    errors.update(dict.fromkeys(chunk, items))
+                    continue
+                for operation_id in chunk:
+                    errors.pop(operation_id, None)
+                for item in items:
+                    operation_id = getattr(item, spec.item_id)
+                    status = getattr(item, spec.item_status)
+                    if operation_id not in last_status:
+                        continue
+                    last_status[operation_id] = status
+                    if status in spec.succeeded or status in spec.failed:
+                        self._settle(kind, operation_id, OperationResult(kind, operation_id, status, status in spec.succeeded, item))
+                        progressed = True
+            if pending:
+                await asyncio.sleep(backoff.next(progressed))
+            # Forget operations nobody waits on any more (settled or timed out).
+            for operation_id in [operation_id for operation_id in last_status if operation_id not in pending]:
+                del last_status[operation_id]
+                errors.pop(operation_id, None)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic response payloads shaped like real ones: every field of every
+model is filled in, from the MODEL_FIELDS tables, the way a fully
+populated DescribeInstances page is.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS, MODEL, SCALAR
+
+def sample_map(
+    model_name: str,
+    items: int = 2,
+) -> Dict[str, Any]:
+    """
+    A map for `model_name` with every field set and `items` entries in
+    each nested list.
+    """
+    m = {}
+    for i, (wire_name, name, kind, nested) in enumerate(MODEL_FIELDS[model_name]):
+        if kind == SCALAR:
+            m[wire_name] = (f'{name}-value', i, True)[i % 3]
+        elif kind == MODEL:
+            m[wire_name] = sample_map(nested, items)
+        else:
+            m[wire_name] = [sample_map(nested, items) for _ in range(items)]
+    return m
+
+def describe_instances_payload(
+    count: int = 100,
+) -> Dict[str, Any]:
+    """
+    A DescribeInstances response map holding `count` instances, decoded
+    from JSON like a response from ECS.
+    """
+    body = sample_map('DescribeInstancesResponseBody')
+    body['Instances']['Instance'] = [
+        dict(sample_map('DescribeInstancesResponseBodyInstancesInstance', items=1), InstanceId=f'i-{n}')
+        for n in range(count)
+    ]
+    return json.loads(json.dumps({'headers': {'x-acs-request-id': 'r'}, 'statusCode': 200, 'body': body}))
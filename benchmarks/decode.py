@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Time to decode a 100-instance DescribeInstances response with the
+generated from_map and with the compiled decoder, after checking that
+both build the same objects. Run from the repository root:
+
+    python benchmarks/decode.py
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from _payload import describe_instances_payload
+from alibabacloud_ecs20140526 import _decoder
+from alibabacloud_ecs20140526 import models as main_models
+from darabonba.core import DaraCore
+from darabonba.model import DaraModel
+
+def same(a: Any, b: Any) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, DaraModel):
+        return list(vars(a)) == list(vars(b)) and all(same(vars(a)[name], vars(b)[name]) for name in vars(a))
+    return a == b
+
+def main(number: int = 200) -> None:
+    payload = describe_instances_payload(100)
+    response_class = main_models.DescribeInstancesResponse
+    assert same(_decoder.from_map(response_class, payload), DaraCore.from_map(response_class(), payload))
+    generated = min(timeit.repeat(lambda: DaraCore.from_map(response_class(), payload), number=number, repeat=7))
+    compiled = min(timeit.repeat(lambda: _decoder.from_map(response_class, payload), number=number, repeat=7))
+    print(f'from_map: {generated / number * 1e3:.2f} ms/page')
+    print(f'decoder:  {compiled / number * 1e3:.2f} ms/page ({generated / compiled:.1f}x)')
+
+if __name__ == '__main__':
+    main()
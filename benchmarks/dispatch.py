@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Per-call overhead of building and dispatching DescribeInstances and
+RunInstances requests, with the network replaced by a canned response,
+and the time to import the client. Run from the repository root:
+
+    python benchmarks/dispatch.py
+
+Run it on two checkouts to compare them.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client import Client
+from darabonba.runtime import RuntimeOptions
+
+class CannedClient(Client):
+    def __init__(self):
+        pass
+
+    def call_api(self, params, request, runtime):
+        return {'headers': {}, 'statusCode': 200, 'body': {'RequestId': 'r'}}
+
+def _import_ms() -> float:
+    script = (
+        'import time\n'
+        'start = time.perf_counter()\n'
+        'import alibabacloud_ecs20140526.client\n'
+        'print((time.perf_counter() - start) * 1000)\n'
+    )
+    return min(float(subprocess.check_output([sys.executable, '-c', script], cwd=ROOT)) for _ in range(5))
+
+def main(number: int = 20000) -> None:
+    client = CannedClient()
+    runtime = RuntimeOptions()
+    describe = main_models.DescribeInstancesRequest(
+        region_id='cn-hangzhou',
+        instance_ids='["i-1","i-2"]',
+        status='Running',
+        max_results=100,
+        vpc_id='vpc-1',
+        zone_id='cn-hangzhou-h',
+        instance_charge_type='PostPaid',
+    )
+    run = main_models.RunInstancesRequest(
+        region_id='cn-hangzhou',
+        image_id='img-1',
+        instance_type='ecs.g7.large',
+        security_group_id='sg-1',
+        v_switch_id='vsw-1',
+        amount=10,
+        client_token='token',
+        system_disk=main_models.RunInstancesRequestSystemDisk(category='cloud_essd', size=40),
+    )
+    calls = (
+        ('DescribeInstances', lambda: client.describe_instances_with_options(describe, runtime)),
+        ('RunInstances', lambda: client.run_instances_with_options(run, runtime)),
+    )
+    for name, call in calls:
+        best = min(timeit.repeat(call, number=number, repeat=5))
+        print(f'{name}: {best / number * 1e6:.1f} us/call')
+    print(f'import client: {_import_ms():.0f} ms')
+
+if __name__ == '__main__':
+    main()
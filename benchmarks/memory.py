@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Memory held per instance record after decoding a 1,000-instance
+DescribeInstances response into the generated models and into their
+compact (__slots__) classes. Run from the repository root:
+
+    python benchmarks/memory.py
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from _payload import describe_instances_payload
+from alibabacloud_ecs20140526 import _decoder
+from alibabacloud_ecs20140526 import models as main_models
+
+def bytes_per_instance(payload: dict, compact: bool) -> int:
+    response_class = main_models.DescribeInstancesResponse
+    # Compile the decoders first so they are not counted.
+    _decoder.from_map(response_class, payload, compact)
+    gc.collect()
+    tracemalloc.start()
+    response = _decoder.from_map(response_class, payload, compact)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held // len(response.body.instances.instance)
+
+def main(count: int = 1000) -> None:
+    payload = describe_instances_payload(count)
+    for label, compact in (('models', False), ('compact models', True)):
+        print(f'{label}: {bytes_per_instance(payload, compact)} bytes per instance record')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+CPU time to read InstanceId and Status from every instance of a
+100-instance DescribeInstances page through models, lazy responses and
+raw maps, with the network replaced by the canned page. Run from the
+repository root:
+
+    python benchmarks/raw_responses.py
+"""
+from __future__ import annotations
+
+import timeit
+
+from _payload import describe_instances_payload
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.client import Client
+from darabonba.runtime import RuntimeOptions
+
+class CannedClient(Client):
+    def __init__(self, response: dict):
+        self.response = response
+
+    def call_api(self, params, request, runtime):
+        return self.response
+
+def main(number: int = 100) -> None:
+    client = CannedClient(describe_instances_payload(100))
+    request = main_models.DescribeInstancesRequest(region_id='cn-hangzhou')
+    runtime = RuntimeOptions()
+
+    def read_models():
+        return [(item.instance_id, item.status) for item in client.describe_instances(request).body.instances.instance]
+
+    def read_raw():
+        items = client.call_action_raw('DescribeInstances', request, runtime)['body']['Instances']['Instance']
+        return [(item.get('InstanceId'), item.get('Status')) for item in items]
+
+    def per_page(read) -> float:
+        return min(timeit.repeat(read, number=number, repeat=7)) / number * 1e3
+
+    client.set_lazy_responses(False)
+    expected = read_models()
+    models_ms = per_page(read_models)
+    client.set_lazy_responses(True)
+    assert read_models() == expected
+    lazy_ms = per_page(read_models)
+    assert read_raw() == expected
+    raw_ms = per_page(read_raw)
+    print(f'models: {models_ms:.2f} ms/page')
+    print(f'lazy:   {lazy_ms:.2f} ms/page')
+    print(f'raw:    {raw_ms:.3f} ms/page')
+
+if __name__ == '__main__':
+    main()
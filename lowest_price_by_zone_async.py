@@ -6,7 +6,9 @@ from typing import Dict, List, Optional
 from alibabacloud_credentials.client import Client as CredentialClient
 from alibabacloud_credentials.models import Config as CredentialConfig
 from alibabacloud_ecs20140526 import models as ecs_models
-from alibabacloud_ecs20140526.client import Client as EcsClient
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.pricing import PriceMatrix, price_grid
+from alibabacloud_ecs20140526.response_cache import ResponseCache, SqliteStore
 from alibabacloud_tea_openapi import models as open_api_models
 
 
@@ -50,23 +52,17 @@ def build_credentials_client() -> CredentialClient:
     return CredentialClient(credentials_config)
 
 
-def build_client(
-    region_id: str,
-    access_key_id: str,
-    access_key_secret: str,
-    security_token: Optional[str],
+def build_client_pool(
+    credentials_client: CredentialClient,
     endpoint: Optional[str],
-) -> EcsClient:
-    config = open_api_models.Config(
-        access_key_id=access_key_id,
-        access_key_secret=access_key_secret,
-        region_id=region_id,
-    )
-    if security_token:
-        config.security_token = security_token
+    cache_path: Optional[str] = None,
+) -> RegionalClientPool:
+    config = open_api_models.Config(credential=credentials_client)
     if endpoint:
         config.endpoint = endpoint
-    return EcsClient(config)
+    # DescribeZones changes rarely; with a cache file it is reused across runs.
+    response_cache = ResponseCache(store=SqliteStore(cache_path) if cache_path else None)
+    return RegionalClientPool(config, response_cache=response_cache)
 
 
 def zone_supports_instance(zone: ecs_models.DescribeZonesResponseBodyZonesZone) -> bool:
@@ -76,17 +72,16 @@ def zone_supports_instance(zone: ecs_models.DescribeZonesResponseBodyZonesZone)
     return INSTANCE_TYPE in available.instance_types
 
 
-async def fetch_zones(
-    client: EcsClient,
-    region_id: str,
-) -> List[str]:
-    request = ecs_models.DescribeZonesRequest(
+def zones_request(region_id: str) -> ecs_models.DescribeZonesRequest:
+    return ecs_models.DescribeZonesRequest(
         region_id=region_id,
         instance_charge_type="PostPaid",
         spot_strategy=SPOT_STRATEGY,
         verbose=True,
     )
-    response = await client.describe_zones_async(request)
+
+
+def parse_zones(response: ecs_models.DescribeZonesResponse) -> List[str]:
     zones: List[str] = []
     if response.body and response.body.zones and response.body.zones.zone:
         for zone in response.body.zones.zone:
@@ -98,95 +93,43 @@ async def fetch_zones(
     return zones
 
 
-async def fetch_price(
-    sem: asyncio.Semaphore,
-    client: EcsClient,
-    region_id: str,
-    zone_id: str,
-) -> Optional[Dict[str, object]]:
-    async with sem:
-        try:
-            system_disk = ecs_models.DescribePriceRequestSystemDisk(
-                category=SYSTEM_DISK_CATEGORY,
-                size=SYSTEM_DISK_SIZE,
-            )
-            request = ecs_models.DescribePriceRequest(
-                resource_type=RESOURCE_TYPE,
-                instance_type=INSTANCE_TYPE,
-                spot_strategy=SPOT_STRATEGY,
-                spot_duration=SPOT_DURATION,
-                system_disk=system_disk,
-                price_unit=PRICE_UNIT,
-                region_id=region_id,
-                zone_id=zone_id,
-            )
-            response = await client.describe_price_async(request)
-            if not response.body or not response.body.price_info or not response.body.price_info.price:
-                return None
-            price_info = response.body.price_info.price
-            if price_info.trade_price is None:
-                return None
-            return {
-                "region_id": region_id,
-                "zone_id": zone_id,
-                "trade_price": price_info.trade_price,
-                "original_price": price_info.original_price,
-                "discount_price": price_info.discount_price,
-                "currency": price_info.currency,
-            }
-        except Exception as exc:
-            msg = str(exc).splitlines()[0]
-            print(f"Skip {region_id}/{zone_id}: {msg}", file=sys.stderr)
-            return None
-
-
 async def main() -> None:
     endpoint = os.getenv("ALIBABA_CLOUD_ENDPOINT")
     max_concurrency = int(os.getenv("MAX_CONCURRENCY", "10"))
 
-    credentials_client = build_credentials_client()
-    credential = credentials_client.get_credential()
-    access_key_id = credential.get_access_key_id()
-    access_key_secret = credential.get_access_key_secret()
-    security_token = credential.get_security_token()
-    clients = {
-        region_id: build_client(
-            region_id,
-            access_key_id,
-            access_key_secret,
-            security_token,
-            endpoint,
-        )
-        for region_id in TARGET_REGIONS
-    }
+    cache_path = os.getenv("ECS_RESPONSE_CACHE")
 
-    zone_tasks = [
-        fetch_zones(clients[region_id], region_id)
-        for region_id in TARGET_REGIONS
-    ]
-    zone_lists = await asyncio.gather(*zone_tasks, return_exceptions=True)
+    clients = build_client_pool(build_credentials_client(), endpoint, cache_path)
 
     zones_by_region: Dict[str, List[str]] = {}
-    for region_id, zones in zip(TARGET_REGIONS, zone_lists):
-        if isinstance(zones, Exception):
-            msg = str(zones).splitlines()[0]
-            print(f"Skip zones for {region_id}: {msg}", file=sys.stderr)
+    for result in await clients.fan_out_async(
+        "DescribeZones",
+        zones_request,
+        regions=TARGET_REGIONS,
+        concurrency=max_concurrency,
+    ):
+        if result.error is not None:
+            msg = str(result.error).splitlines()[0]
+            print(f"Skip zones for {result.region_id}: {msg}", file=sys.stderr)
             continue
-        zones_by_region[region_id] = zones
-
-    sem = asyncio.Semaphore(max_concurrency)
-    price_tasks = []
-    for region_id, zones in zones_by_region.items():
-        client = clients[region_id]
-        for zone_id in zones:
-            price_tasks.append(fetch_price(sem, client, region_id, zone_id))
-
-    results = [r for r in await asyncio.gather(*price_tasks) if r]
+        zones_by_region[result.region_id] = parse_zones(result.response)
+
+    matrix = PriceMatrix(
+        clients,
+        resource_type=RESOURCE_TYPE,
+        system_disk_size=SYSTEM_DISK_SIZE,
+        spot_duration=SPOT_DURATION,
+        concurrency=max_concurrency,
+    )
+    cells = price_grid(zones_by_region, [INSTANCE_TYPE], [SYSTEM_DISK_CATEGORY], [SPOT_STRATEGY], [PRICE_UNIT])
+    table = await matrix.fetch_async(cells)
+    for row in table.where([error is not None for error in table["error"]]).rows():
+        print(f"Skip {row['region_id']}/{row['zone_id']}: {row['error']}", file=sys.stderr)
+    results = list(table.where([error is None for error in table["error"]]).sort("trade_price").rows())
     if not results:
         print("No price results.")
         return
 
-    results.sort(key=lambda r: r["trade_price"])
     best = results[0]
     label = REGION_LABELS.get(best["region_id"], best["region_id"])
     print("Full price list (sorted by trade_price):")
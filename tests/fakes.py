@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+An in-process stand-in for ECS: clients whose requests are answered by a
+Python function instead of the network, after going through every layer
+of `Client` (ClientToken, cache, retry, rate limiter).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from alibabacloud_ecs20140526.client import Client
+from alibabacloud_ecs20140526.client_pool import RegionalClientPool
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS, MODEL, SCALAR
+from alibabacloud_tea_openapi import models as open_api_models
+
+# handler(region_id, action, query) -> response body, or raises.
+Handler = Callable[[str, str, Dict[str, Any]], Dict[str, Any]]
+
+class FakeEcs:
+    def __init__(
+        self,
+        handler: Handler,
+        delay: float = 0,
+    ):
+        self.handler = handler
+        # Seconds each async request takes; async calls always yield once,
+        # as a network round trip would.
+        self.delay = delay
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        fake = self
+
+        class FakeClient(Client):
+            def __init__(self, config: open_api_models.Config):
+                self._region_id = config.region_id
+                self._signature_version = None
+                self._signature_algorithm = None
+                self._endpoint = f'ecs.{config.region_id}.example'
+
+            def do_request(self, params, request, runtime):
+                return fake.respond(self._region_id, params.action, dict(request.query))
+
+            async def do_request_async(self, params, request, runtime):
+                await asyncio.sleep(fake.delay)
+                return fake.respond(self._region_id, params.action, dict(request.query))
+
+        self.client_class = FakeClient
+
+    def respond(self, region_id: str, action: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.calls.append((region_id, action, query))
+        body = self.handler(region_id, action, query)
+        # Round-trip through JSON like a real response.
+        return {'headers': {}, 'statusCode': 200, 'body': json.loads(json.dumps(body))}
+
+    def actions(self) -> List[str]:
+        return [action for region_id, action, query in self.calls]
+
+    def client(
+        self,
+        region_id: str = 'cn-hangzhou',
+    ) -> Client:
+        return self.client_class(open_api_models.Config(region_id=region_id, access_key_id='ak', access_key_secret='sk'))
+
+    def pool(self, **kwargs: Any) -> RegionalClientPool:
+        config = open_api_models.Config(access_key_id='ak', access_key_secret='sk')
+        return RegionalClientPool(config, client_class=self.client_class, **kwargs)
+
+def listed(query: Dict[str, Any], name: str) -> List[Any]:
+    """
+    Values of a repeated query parameter, e.g. `listed(q, 'InstanceId')`
+    for InstanceId.1, InstanceId.2, ... in order.
+    """
+    values = []
+    for key, value in query.items():
+        match = re.fullmatch(re.escape(name) + r'\.(\d+)', key)
+        if match:
+            values.append((int(match.group(1)), value))
+    return [value for index, value in sorted(values)]
+
+def listed_models(query: Dict[str, Any], name: str) -> List[Dict[str, Any]]:
+    """
+    Repeated structured parameters, e.g. Tag.1.Key/Tag.1.Value, as dicts.
+    """
+    models: Dict[int, Dict[str, Any]] = {}
+    for key, value in query.items():
+        match = re.fullmatch(re.escape(name) + r'\.(\d+)\.(\w+)', key)
+        if match:
+            models.setdefault(int(match.group(1)), {})[match.group(2)] = value
+    return [models[index] for index in sorted(models)]
+
+def page(
+    items: List[Any],
+    query: Dict[str, Any],
+    list_name: str,
+    item_name: str,
+    total_count: bool = True,
+) -> Dict[str, Any]:
+    """
+    One PageNumber/PageSize page of `items` as a response body.
+    """
+    number = int(query.get('PageNumber') or 1)
+    size = int(query.get('PageSize') or 10)
+    body = {
+        list_name: {item_name: items[(number - 1) * size:number * size]},
+        'PageNumber': number,
+        'PageSize': size,
+    }
+    if total_count:
+        body['TotalCount'] = len(items)
+    return body
+
+def token_page(
+    items: List[Any],
+    query: Dict[str, Any],
+    list_name: str,
+    item_name: str,
+    default_size: int = 10,
+) -> Dict[str, Any]:
+    """
+    One NextToken/MaxResults page of `items` as a response body.
+    """
+    start = int(query.get('NextToken') or 0)
+    size = int(query.get('MaxResults') or default_size)
+    end = start + size
+    return {
+        list_name: {item_name: items[start:end]},
+        'NextToken': str(end) if end < len(items) else '',
+        'TotalCount': len(items),
+    }
+
+def sample_map(
+    model_name: str,
+    items: int = 2,
+) -> Dict[str, Any]:
+    """
+    A map for `model_name` with every field set, scalars cycling through
+    str, int and bool, and `items` entries in each nested list.
+    """
+    m = {}
+    for i, (wire_name, name, kind, nested) in enumerate(MODEL_FIELDS[model_name]):
+        if kind == SCALAR:
+            m[wire_name] = (f'{name}-value', i, True)[i % 3]
+        elif kind == MODEL:
+            m[wire_name] = sample_map(nested, items)
+        else:
+            m[wire_name] = [sample_map(nested, items) for _ in range(items)]
+    return m
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526._action_specs import ACTION_SPECS
+from alibabacloud_ecs20140526.client import Client
+from darabonba.runtime import RuntimeOptions
+from fakes import FakeEcs
+
+def test_every_action_has_named_methods():
+    # Generated names keep their quirks, e.g. disable_network_interface_qo_swith_options.
+    sync = [name for name in dir(Client) if name.endswith('with_options')]
+    assert len(sync) == len(ACTION_SPECS)
+    assert all(hasattr(Client, f'{name}_async') for name in sync)
+
+def test_queries_flatten_nested_and_repeated_fields():
+    fake = FakeEcs(lambda region_id, action, query: {'InstanceIdSets': {'InstanceIdSet': ['i-1']}})
+    client = fake.client()
+    client.set_client_token_mode(None)
+    client.run_instances(main_models.RunInstancesRequest(
+        region_id='cn-hangzhou',
+        instance_type='ecs.g7.large',
+        amount=2,
+        system_disk=main_models.RunInstancesRequestSystemDisk(category='cloud_essd', size=40),
+        security_group_ids=['sg-1', 'sg-2'],
+    ))
+    region_id, action, query = fake.calls[0]
+    assert action == 'RunInstances'
+    assert query == {
+        'RegionId': 'cn-hangzhou',
+        'InstanceType': 'ecs.g7.large',
+        'Amount': '2',
+        'SystemDisk.Category': 'cloud_essd',
+        'SystemDisk.Size': '40',
+        'SecurityGroupIds.1': 'sg-1',
+        'SecurityGroupIds.2': 'sg-2',
+    }
+
+def test_shrink_fields_are_sent_as_json():
+    fake = FakeEcs(lambda region_id, action, query: {'InvokeId': 't-1'})
+    client = fake.client()
+    request = main_models.RunCommandRequest(region_id='cn-hangzhou', type='RunShellScript', command_content='echo {{name}}',
+                                            instance_id=['i-1'], parameters={'name': 'x'})
+    response = asyncio.run(client.run_command_with_options_async(request, RuntimeOptions()))
+    query = fake.calls[0][2]
+    assert json.loads(query['Parameters']) == {'name': 'x'}
+    assert query['InstanceId.1'] == 'i-1'
+    assert response.body.invoke_id == 't-1'
+    assert request.parameters == {'name': 'x'}
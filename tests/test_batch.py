@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.batch import call_batched, call_batched_async
+from fakes import FakeEcs, listed, token_page
+
+FAILING = 'i-fail'
+
+def _instances_backend() -> FakeEcs:
+    def handler(region_id, action, query):
+        ids = json.loads(query['InstanceIds'])
+        if FAILING in ids:
+            raise RuntimeError('chunk failed')
+        instances = [{'InstanceId': instance_id, 'Status': 'Running'} for instance_id in ids]
+        return token_page(instances, query, 'Instances', 'Instance')
+    return FakeEcs(handler)
+
+def _ids(count: int):
+    return [f'i-{n}' for n in range(count)]
+
+def test_chunks_read_each_chunk_in_one_page():
+    fake = _instances_backend()
+    result = call_batched(fake.client(), 'DescribeInstances',
+                          main_models.DescribeInstancesRequest(region_id='cn-hangzhou'), _ids(500))
+    assert len(fake.calls) == 5
+    assert all(query['MaxResults'] == '100' for region_id, action, query in fake.calls)
+    assert [item.instance_id for item in result.response.body.instances.instance] == _ids(500)
+    assert result.response.body.total_count == 500
+    assert result.errors == []
+
+def test_caller_page_size_is_kept():
+    fake = _instances_backend()
+    call_batched(fake.client(), 'DescribeInstances',
+                 main_models.DescribeInstancesRequest(region_id='cn-hangzhou', max_results=20), _ids(100))
+    assert len(fake.calls) == 5
+    assert all(query['MaxResults'] == '20' for region_id, action, query in fake.calls)
+
+def test_small_chunks_ask_for_at_least_the_minimum_page():
+    fake = _instances_backend()
+    call_batched(fake.client(), 'DescribeInstances',
+                 main_models.DescribeInstancesRequest(region_id='cn-hangzhou'), _ids(3))
+    assert fake.calls[0][2]['MaxResults'] == '10'
+
+def test_failed_chunk_is_reported_and_others_merge():
+    fake = _instances_backend()
+    ids = _ids(150) + [FAILING]
+    result = asyncio.run(call_batched_async(fake.client(), 'DescribeInstances',
+                                            main_models.DescribeInstancesRequest(region_id='cn-hangzhou'), ids))
+    assert len(result.errors) == 1
+    assert result.errors[0].index == 1
+    assert FAILING in result.errors[0].ids
+    assert len(result.response.body.instances.instance) == 100
+
+def test_unpaginated_actions_are_split_by_their_limit():
+    fake = FakeEcs(lambda region_id, action, query: {'InstanceResponses': {'InstanceResponse': [
+        {'InstanceId': instance_id, 'Code': '200'} for instance_id in listed(query, 'InstanceId')]}})
+    result = call_batched(fake.client(), 'StartInstances',
+                          main_models.StartInstancesRequest(region_id='cn-hangzhou'), _ids(250), concurrency=3)
+    assert [len(listed(query, 'InstanceId')) for region_id, action, query in fake.calls] == [100, 100, 50]
+    assert len(result.response.body.instance_responses.instance_response) == 250
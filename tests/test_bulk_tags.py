@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from alibabacloud_ecs20140526.bulk_tags import MAX_TAGS, BulkTagger, TagChange, diff_tags, plan_calls
+from alibabacloud_ecs20140526.tag_index import ResourceRef
+from fakes import FakeEcs, listed, listed_models, token_page
+
+def _ref(resource_id: str, region_id: str = 'cn-hangzhou') -> ResourceRef:
+    return ResourceRef(region_id, 'instance', resource_id)
+
+class FakeTags:
+    def __init__(self, tags):
+        self.tags = {ref: dict(values) for ref, values in tags.items()}
+        # (action, resource ID) pairs whose calls fail.
+        self.failing = set()
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        refs = [ResourceRef(region_id, query['ResourceType'], resource_id)
+                for resource_id in listed(query, 'ResourceId')]
+        if any((action, ref.resource_id) in self.failing for ref in refs):
+            raise RuntimeError(f'{action} failed')
+        if action == 'ListTagResources':
+            rows = [{'ResourceId': ref.resource_id, 'ResourceType': ref.resource_type, 'TagKey': key, 'TagValue': value}
+                    for ref in refs for key, value in self.tags.get(ref, {}).items()]
+            return token_page(rows, query, 'TagResources', 'TagResource', default_size=50)
+        for ref in refs:
+            tags = self.tags.setdefault(ref, {})
+            if action == 'TagResources':
+                tags.update({tag['Key']: tag['Value'] for tag in listed_models(query, 'Tag')})
+            else:
+                for key in listed(query, 'TagKey'):
+                    tags.pop(key, None)
+        return {}
+
+def test_diff_tags_keeps_system_tags():
+    current = {'env': 'dev', 'team': 'search', 'old': 'x', 'acs:owner': 'ecs'}
+    change = diff_tags(_ref('i-1'), current, {'env': 'prod', 'team': 'search', 'old': None})
+    assert change == TagChange(_ref('i-1'), {'env': 'prod'}, ('old',))
+    pruned = diff_tags(_ref('i-1'), current, {'env': 'dev'}, prune=True)
+    assert pruned.untag == ('old', 'team')
+    assert diff_tags(_ref('i-1'), current, {'env': 'dev', 'acs:owner': None}) is None
+
+def test_plan_calls_share_and_split_calls():
+    same = [TagChange(_ref(f'i-{n}'), {'env': 'prod'}, ()) for n in range(120)]
+    many = [TagChange(_ref('i-x'), {f'k{n}': 'v' for n in range(MAX_TAGS + 5)}, ('gone',))]
+    calls = plan_calls(same + many)
+    tag_calls = [call for call in calls if call.action == 'TagResources' and call.tags == (('env', 'prod'),)]
+    assert [len(call.resource_ids) for call in tag_calls] == [50, 50, 20]
+    wide = [call for call in calls if call.resource_ids == ('i-x',) and call.action == 'TagResources']
+    assert [len(call.tags) for call in wide] == [MAX_TAGS, 5]
+    assert [call.keys for call in calls if call.action == 'UntagResources'] == [('gone',)]
+
+def test_sync_reaches_desired_tags_with_few_calls():
+    refs = [_ref(f'i-{n}') for n in range(120)]
+    backend = FakeTags({ref: {'env': 'dev', 'acs:owner': 'ecs'} for ref in refs[:60]})
+    tagger = BulkTagger(backend.fake.pool())
+    outcomes = tagger.sync({ref: {'env': 'prod'} for ref in refs}, prune=True)
+    assert all(backend.tags[ref] == {'env': 'prod', 'acs:owner': 'ecs'} for ref in refs[:60])
+    assert all(backend.tags[ref] == {'env': 'prod'} for ref in refs[60:])
+    # One listing per 50 resources; a chunk's tags may span several pages.
+    assert len([query for region_id, action, query in backend.fake.calls
+                if action == 'ListTagResources' and not query.get('NextToken')]) == 3
+    assert backend.fake.actions().count('TagResources') == 3
+    assert outcomes[refs[0]].tagged == {'env': 'prod'}
+    assert tagger.plan({ref: {'env': 'prod'} for ref in refs}).calls == []
+
+def test_failed_calls_are_reported_per_resource():
+    refs = [_ref(f'i-{n}') for n in range(60)]
+    backend = FakeTags({})
+    backend.failing.add(('TagResources', 'i-55'))
+    seen = []
+    outcomes = BulkTagger(backend.fake.pool()).sync(
+        {ref: {'env': 'prod'} for ref in refs}, progress=lambda call, error, done, total: seen.append((done, total)))
+    assert sorted(seen) == [(1, 2), (2, 2)]
+    assert [len(outcomes[ref].errors) for ref in (refs[0], refs[55])] == [0, 1]
+    assert backend.tags[refs[0]] == {'env': 'prod'}
+    assert refs[55] not in backend.tags
+
+def test_unlisted_resources_are_left_out_of_the_plan():
+    backend = FakeTags({})
+    backend.failing.add(('ListTagResources', 'i-1'))
+    plan = BulkTagger(backend.fake.pool()).plan({_ref('i-1'): {'env': 'prod'}, _ref('i-2', 'cn-beijing'): {'env': 'prod'}})
+    assert list(plan.errors) == [_ref('i-1')]
+    assert [change.ref for change in plan.changes] == [_ref('i-2', 'cn-beijing')]
+
+def test_async_sync_matches_sync():
+    refs = [_ref(f'i-{n}') for n in range(70)] + [_ref('i-b', 'cn-beijing')]
+    desired = {ref: {'env': 'prod', 'team': None} for ref in refs}
+    backend = FakeTags({ref: {'team': 'search'} for ref in refs})
+    async_backend = FakeTags({ref: {'team': 'search'} for ref in refs})
+    BulkTagger(backend.fake.pool()).sync(desired)
+    asyncio.run(BulkTagger(async_backend.fake.pool()).sync_async(desired))
+    assert backend.tags == async_backend.tags
+    assert all(tags == {'env': 'prod'} for tags in backend.tags.values())
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.rate_limiter import RateLimiter
+from alibabacloud_ecs20140526.retry import RetryPolicy
+from fakes import FakeEcs
+
+REGIONS = ['cn-hangzhou', 'cn-beijing', 'cn-shanghai']
+
+class FakeRegions:
+    """
+    Answers DescribeRegions with REGIONS and DescribeZones with one zone per
+    region, failing in `failing` regions, and tracks how many calls run at
+    once in each region.
+    """
+
+    def __init__(self, failing=(), delay=0.0):
+        self.failing = set(failing)
+        self.delay = delay
+        self.running = {}
+        self.peak = {}
+        self._lock = threading.Lock()
+        self.fake = FakeEcs(self.handle, delay=delay)
+
+    def handle(self, region_id, action, query):
+        if action == 'DescribeRegions':
+            return {'Regions': {'Region': [{'RegionId': region} for region in REGIONS]}}
+        with self._lock:
+            self.running[region_id] = self.running.get(region_id, 0) + 1
+            self.peak[region_id] = max(self.peak.get(region_id, 0), self.running[region_id])
+        try:
+            time.sleep(self.delay)
+            if region_id in self.failing:
+                raise RuntimeError(f'{region_id} is down')
+            return {'Zones': {'Zone': [{'ZoneId': f'{region_id}-a'}]}}
+        finally:
+            with self._lock:
+                self.running[region_id] -= 1
+
+def test_clients_are_built_once_per_region_with_shared_settings():
+    limiter, policy = RateLimiter(), RetryPolicy()
+    pool = FakeRegions().fake.pool(rate_limiter=limiter, retry_policy=policy)
+    client = pool.client('cn-beijing')
+    assert pool['cn-beijing'] is client
+    assert client._region_id == 'cn-beijing'
+    assert client._rate_limiter is limiter and client._retry_policy is policy
+    assert pool.hosts() == {'ecs.cn-beijing.example': ['cn-beijing']}
+
+def test_region_ids_are_fetched_once():
+    regions = FakeRegions()
+    pool = regions.fake.pool()
+    assert pool.region_ids() == REGIONS
+    assert pool.region_ids() == REGIONS
+    assert regions.fake.actions() == ['DescribeRegions']
+
+def test_fan_out_keeps_request_order_and_returns_errors():
+    regions = FakeRegions(failing=['cn-shanghai'], delay=0.01)
+    pool = regions.fake.pool()
+    results = pool.fan_out(
+        'DescribeZones',
+        lambda region_id: [main_models.DescribeZonesRequest(region_id=region_id) for _ in range(6)],
+        region_concurrency=2,
+    )
+    assert [result.region_id for result in results] == [region for region in REGIONS for _ in range(6)]
+    assert all(result.response.body.zones.zone[0].zone_id == f'{result.region_id}-a'
+               for result in results if result.region_id != 'cn-shanghai')
+    assert all(isinstance(result.error, Exception) for result in results if result.region_id == 'cn-shanghai')
+    assert max(regions.peak.values()) <= 2
+
+def test_fan_out_async_skips_regions_and_times_out():
+    regions = FakeRegions(delay=0.05)
+    pool = regions.fake.pool()
+    factory = lambda region_id: None if region_id == 'cn-beijing' else main_models.DescribeZonesRequest(region_id=region_id)
+    results = asyncio.run(pool.fan_out_async('DescribeZones', factory, regions=REGIONS, timeout=0.01))
+    assert [result.region_id for result in results] == ['cn-hangzhou', 'cn-shanghai']
+    assert all(isinstance(result.error, asyncio.TimeoutError) for result in results)
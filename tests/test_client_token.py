@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.retry import RetryPolicy
+from fakes import FakeEcs
+
+class Unavailable(Exception):
+    code = 'ServiceUnavailable'
+
+def _backend(failures: int = 0) -> FakeEcs:
+    state = {'failures': failures}
+
+    def handler(region_id, action, query):
+        if action == 'CreateDisk' and state['failures']:
+            state['failures'] -= 1
+            raise Unavailable()
+        return {'DiskId': 'd-1'}
+
+    return FakeEcs(handler)
+
+def _create_disk(client):
+    return client.create_disk(main_models.CreateDiskRequest(region_id='cn-hangzhou', zone_id='cn-hangzhou-h', size=40))
+
+def _tokens(fake: FakeEcs):
+    return [query.get('ClientToken') for region_id, action, query in fake.calls]
+
+def test_tokens_are_off_by_default():
+    fake = _backend()
+    _create_disk(fake.client())
+    assert _tokens(fake) == [None]
+
+def test_identical_calls_get_different_tokens():
+    fake = _backend()
+    client = fake.client()
+    client.set_client_token_mode('uuid')
+    request = main_models.CreateDiskRequest(region_id='cn-hangzhou', zone_id='cn-hangzhou-h', size=40)
+    client.create_disk(request)
+    client.create_disk(request)
+    first, second = _tokens(fake)
+    assert first and second and first != second
+    assert request.client_token is None
+
+def test_retries_reuse_the_token():
+    fake = _backend(failures=2)
+    client = fake.client()
+    client.set_client_token_mode('uuid')
+    client.set_retry_policy(RetryPolicy(base_delay=0, max_delay=0))
+    _create_disk(client)
+    tokens = _tokens(fake)
+    assert len(tokens) == 3 and len(set(tokens)) == 1
+
+def test_deterministic_tokens_collapse_identical_calls():
+    fake = _backend()
+    client = fake.client()
+    client.set_client_token_mode('deterministic')
+    _create_disk(client)
+    _create_disk(client)
+    first, second = _tokens(fake)
+    assert first == second
+
+def test_caller_tokens_and_reads_are_left_alone():
+    fake = _backend()
+    client = fake.client()
+    client.set_client_token_mode('uuid')
+    client.create_disk(main_models.CreateDiskRequest(region_id='cn-hangzhou', size=40, client_token='mine'))
+    client.describe_disks(main_models.DescribeDisksRequest(region_id='cn-hangzhou'))
+    assert _tokens(fake) == ['mine', None]
+    client.set_client_token_mode(None)
+    _create_disk(client)
+    assert _tokens(fake)[-1] is None
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.coalescing import RequestCoalescer
+from darabonba.runtime import RuntimeOptions
+from fakes import FakeEcs, listed, page
+
+def _status_backend() -> FakeEcs:
+    def handler(region_id, action, query):
+        ids = listed(query, 'InstanceId')
+        statuses = [{'InstanceId': instance_id, 'Status': 'Running'} for instance_id in ids]
+        return page(statuses, query, 'InstanceStatuses', 'InstanceStatus')
+    return FakeEcs(handler)
+
+def _client(fake: FakeEcs, **kwargs):
+    client = fake.client()
+    client.set_request_coalescer(RequestCoalescer(**kwargs))
+    return client
+
+def test_public_async_methods_merge_ids():
+    fake = _status_backend()
+    client = _client(fake, window=0.01)
+    ids = [f'i-{n}' for n in range(100)]
+
+    async def main():
+        return await asyncio.gather(*(
+            client.describe_instance_status_async(main_models.DescribeInstanceStatusRequest(
+                region_id='cn-hangzhou', instance_id=[instance_id]))
+            for instance_id in ids
+        ))
+
+    responses = asyncio.run(main())
+    # 100 IDs fit in one merged call, read in pages of MERGED_PAGE_SIZE.
+    assert len(fake.calls) <= 2
+    for instance_id, response in zip(ids, responses):
+        items = response.body.instance_statuses.instance_status
+        assert [item.instance_id for item in items] == [instance_id]
+
+def test_different_runtime_settings_are_not_merged():
+    fake = _status_backend()
+    client = _client(fake, window=0.01)
+
+    async def main():
+        await asyncio.gather(
+            client.call_action_async('DescribeInstanceStatus', main_models.DescribeInstanceStatusRequest(
+                region_id='cn-hangzhou', instance_id=['i-1']), RuntimeOptions(read_timeout=1000)),
+            client.call_action_async('DescribeInstanceStatus', main_models.DescribeInstanceStatusRequest(
+                region_id='cn-hangzhou', instance_id=['i-2']), RuntimeOptions(read_timeout=2000)),
+        )
+
+    asyncio.run(main())
+    assert len(fake.calls) == 2
+
+def test_identical_calls_share_one_request():
+    fake = FakeEcs(lambda region_id, action, query: {'Regions': {'Region': [{'RegionId': 'cn-hangzhou'}]}})
+    client = _client(fake)
+
+    async def main():
+        return await asyncio.gather(*(
+            client.describe_regions_async(main_models.DescribeRegionsRequest()) for _ in range(20)
+        ))
+
+    responses = asyncio.run(main())
+    assert len(fake.calls) == 1
+    assert all(response.body.regions.region[0].region_id == 'cn-hangzhou' for response in responses)
+
+def test_sync_calls_are_not_coalesced():
+    fake = _status_backend()
+    client = _client(fake)
+    for instance_id in ('i-1', 'i-2'):
+        client.describe_instance_status(main_models.DescribeInstanceStatusRequest(
+            region_id='cn-hangzhou', instance_id=[instance_id]))
+    assert len(fake.calls) == 2
+
+def test_cancelled_caller_does_not_cancel_sharers():
+    fake = FakeEcs(lambda region_id, action, query: {'Regions': {'Region': [{'RegionId': 'cn-hangzhou'}]}}, delay=0.05)
+    client = fake.client()
+    coalescer = RequestCoalescer()
+    client.set_request_coalescer(coalescer)
+
+    async def main():
+        leader = asyncio.ensure_future(asyncio.wait_for(client.describe_regions_async(main_models.DescribeRegionsRequest()), 0.01))
+        await asyncio.sleep(0)
+        followers = [client.describe_regions_async(main_models.DescribeRegionsRequest()) for _ in range(3)]
+        results = await asyncio.gather(leader, *followers, return_exceptions=True)
+        return results[0], results[1:]
+
+    leader, followers = asyncio.run(main())
+    assert isinstance(leader, asyncio.TimeoutError)
+    assert all(response.body.regions.region[0].region_id == 'cn-hangzhou' for response in followers)
+    # The first follower sent the call again and the others shared it; the
+    # cancelled call never got its response.
+    assert len(fake.calls) == 1
+    assert coalescer.stats()['DescribeRegions']['sent'] == 2
+
+def test_identical_calls_with_different_runtimes_are_not_shared():
+    fake = FakeEcs(lambda region_id, action, query: {'Regions': {'Region': []}}, delay=0.01)
+    client = _client(fake)
+
+    async def main():
+        await asyncio.gather(*(
+            client.call_action_async('DescribeRegions', main_models.DescribeRegionsRequest(), RuntimeOptions(read_timeout=timeout))
+            for timeout in (1000, 2000)
+        ))
+
+    asyncio.run(main())
+    assert len(fake.calls) == 2
+
+def test_cancelled_merged_send_fails_its_callers():
+    fake = _status_backend()
+    client = _client(fake, window=0.05)
+
+    async def main():
+        caller = asyncio.ensure_future(client.describe_instance_status_async(
+            main_models.DescribeInstanceStatusRequest(region_id='cn-hangzhou', instance_id=['i-1'])))
+        await asyncio.sleep(0.01)
+        for task in asyncio.all_tasks():
+            if task.get_coro().__qualname__ == 'RequestCoalescer._send':
+                task.cancel()
+        return await asyncio.wait_for(caller, 1)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+    assert fake.calls == []
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+
+from alibabacloud_ecs20140526 import _decoder
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.models._model_fields import MODEL_FIELDS
+from darabonba.core import DaraCore
+from darabonba.model import DaraModel
+from fakes import FakeEcs, sample_map
+
+def same(a, b) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if isinstance(a, DaraModel):
+        return list(vars(a)) == list(vars(b)) and all(same(vars(a)[name], vars(b)[name]) for name in vars(a))
+    return a == b
+
+def test_every_model_decodes_like_from_map():
+    for name in MODEL_FIELDS:
+        model_class = getattr(main_models, name)
+        for m in (sample_map(name), {}, None):
+            assert same(_decoder.from_map(model_class, m), model_class().from_map(m)), name
+
+def test_malformed_payload_falls_back_to_from_map():
+    response_class = main_models.DescribeInstancesResponse
+    bad = {'body': {'Instances': {'Instance': 'oops'}}}
+    decoded, generated = _decoder.from_map(response_class, bad), DaraCore.from_map(response_class(), bad)
+    assert same(decoded, generated)
+    assert decoded._map == generated._map
+
+def test_compact_models_keep_model_semantics():
+    m = sample_map('DescribeInstancesResponse')
+    response_class = main_models.DescribeInstancesResponse
+    compact = _decoder.from_map(response_class, m, compact=True)
+    instance = compact.body.instances.instance[0]
+    assert isinstance(compact, response_class)
+    assert isinstance(instance, main_models.DescribeInstancesResponseBodyInstancesInstance)
+    assert not vars(instance)
+    assert compact.to_map() == response_class().from_map(m).to_map()
+    compact.validate()
+    assert pickle.loads(pickle.dumps(compact)).to_map() == compact.to_map()
+    assert copy.deepcopy(compact).to_map() == compact.to_map()
+
+def test_compact_class_from_map():
+    m = sample_map('DescribeInstancesResponseBody')
+    body_class = main_models.DescribeInstancesResponseBody
+    assert _decoder.compact_class(body_class)().from_map(m).to_map() == body_class().from_map(m).to_map()
+
+def test_client_compact_models():
+    fake = FakeEcs(lambda region_id, action, query: sample_map('DescribeInstancesResponseBody', items=1))
+    client = fake.client()
+    client.set_compact_models(True)
+    response = client.describe_instances(main_models.DescribeInstancesRequest(region_id='cn-hangzhou'))
+    assert type(response.body.instances.instance[0]) is _decoder.compact_class(
+        main_models.DescribeInstancesResponseBodyInstancesInstance)
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_tables_match_the_models():
+    # _model_fields.py and _action_specs.py are what tools/generate_tables.py
+    # writes for the models in the tree.
+    result = subprocess.run([sys.executable, os.path.join('tools', 'generate_tables.py'), '--check'],
+                            cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    assert result.returncode == 0, result.stdout.decode()
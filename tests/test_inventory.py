@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import time
+
+import pytest
+
+from alibabacloud_ecs20140526.inventory import InventoryStore, InventorySync
+from fakes import FakeEcs, page, token_page
+
+def _instance(instance_id: str, status: str = 'Running', env: str = 'prod'):
+    return {
+        'InstanceId': instance_id, 'Status': status, 'ZoneId': 'cn-hangzhou-h',
+        'VpcAttributes': {'VpcId': 'vpc-1', 'VSwitchId': 'vsw-1'},
+        'Tags': {'Tag': [{'TagKey': 'env', 'TagValue': env}]},
+    }
+
+class FakeRegion:
+    def __init__(self, instances: int = 3, disks: int = 2):
+        self.instances = {f'i-{n}': _instance(f'i-{n}') for n in range(instances)}
+        self.disks = [{'DiskId': f'd-{n}', 'Status': 'In_use', 'ZoneId': 'cn-hangzhou-h'} for n in range(disks)]
+        self.failing = set()
+        # When each DescribeInstanceHistoryEvents query arrived.
+        self.event_queries = []
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        if action in self.failing:
+            raise RuntimeError(f'{action} failed')
+        if action == 'DescribeInstances':
+            items = list(self.instances.values())
+            if query.get('InstanceIds'):
+                ids = json.loads(query['InstanceIds'])
+                items = [item for item in items if item['InstanceId'] in ids]
+            return token_page(items, query, 'Instances', 'Instance')
+        if action == 'DescribeDisks':
+            return token_page(self.disks, query, 'Disks', 'Disk')
+        if action == 'DescribeInstancesFullStatus':
+            statuses = [{'InstanceId': item['InstanceId'], 'Status': {'Code': 1, 'Name': item['Status']}}
+                        for item in self.instances.values()]
+            return page(statuses, query, 'InstanceFullStatusSet', 'InstanceFullStatusType')
+        if action == 'DescribeInstanceHistoryEvents':
+            self.event_queries.append(time.time())
+            return token_page([], query, 'InstanceSystemEventSet', 'InstanceSystemEventType')
+        raise AssertionError(f'unexpected {action}')
+
+def _sync(region: FakeRegion, store: InventoryStore = None):
+    return InventorySync(region.fake.pool(), store or InventoryStore(), resource_types=['instance', 'disk'])
+
+def test_full_crawl_indexes_resources():
+    region = FakeRegion()
+    sync = _sync(region)
+    reports = sync.refresh(['cn-hangzhou'])
+    assert sorted((report.resource_type, report.mode, report.upserted) for report in reports) == [
+        ('disk', 'full', 2), ('instance', 'full', 3)]
+    store = sync.store
+    record = store.get('instance', 'i-1')
+    assert (record.region_id, record.zone_id, record.vpc_id, record.vswitch_id, record.status) == (
+        'cn-hangzhou', 'cn-hangzhou-h', 'vpc-1', 'vsw-1', 'Running')
+    assert record.data['InstanceId'] == 'i-1'
+    assert len(store.find(vpc_id='vpc-1')) == 3
+    assert len(store.find(zone_id='cn-hangzhou-h')) == 5
+    assert len(store.find(tags={'env': 'prod'})) == 3
+    assert store.find(tags={'env': 'dev'}) == []
+
+def test_incremental_refresh_describes_only_changed_instances():
+    region = FakeRegion()
+    sync = _sync(region)
+    sync.refresh(['cn-hangzhou'])
+    region.instances['i-1'] = _instance('i-1', status='Stopped')
+    del region.instances['i-2']
+    region.instances['i-9'] = _instance('i-9')
+    region.fake.calls.clear()
+    [report] = sync.refresh(['cn-hangzhou'])
+    assert (report.resource_type, report.mode, report.upserted, report.deleted) == ('instance', 'incremental', 2, 1)
+    assert 'DescribeDisks' not in region.fake.actions()
+    described = [json.loads(query['InstanceIds']) for region_id, action, query in region.fake.calls
+                 if action == 'DescribeInstances']
+    assert described == [['i-1', 'i-9']]
+    assert sync.store.get('instance', 'i-1').status == 'Stopped'
+    assert sync.store.get('instance', 'i-2') is None
+    assert sync.store.get('instance', 'i-9') is not None
+
+def test_incremental_refresh_lists_statuses_in_full_pages():
+    region = FakeRegion(instances=250)
+    sync = _sync(region)
+    sync.refresh(['cn-hangzhou'])
+    crawl = region.fake.actions().count('DescribeInstances')
+    region.fake.calls.clear()
+    sync.refresh(['cn-hangzhou'])
+    listing = [query for region_id, action, query in region.fake.calls if action == 'DescribeInstancesFullStatus']
+    assert all(query['PageSize'] == '100' for query in listing)
+    assert len(listing) <= crawl
+
+def test_watermark_is_taken_before_events_are_listed():
+    region = FakeRegion()
+    sync = _sync(region)
+    sync.refresh(['cn-hangzhou'])
+    sync.refresh(['cn-hangzhou'])
+    assert sync.store.last_sync('cn-hangzhou', 'instance', 'incremental') <= region.event_queries[-1]
+
+def test_full_crawl_drops_resources_that_are_gone():
+    region = FakeRegion()
+    sync = _sync(region)
+    sync.refresh(['cn-hangzhou'])
+    region.disks = region.disks[:1]
+    reports = sync.refresh(['cn-hangzhou'], force_full=True)
+    assert {report.resource_type: report.deleted for report in reports} == {'instance': 0, 'disk': 1}
+    assert [record.resource_id for record in sync.store.find('disk')] == ['d-0']
+
+def test_failures_are_reported_and_keep_stored_data():
+    region = FakeRegion()
+    sync = _sync(region)
+    sync.refresh(['cn-hangzhou'])
+    region.disks = []
+    region.failing.add('DescribeDisks')
+    reports = {report.resource_type: report for report in sync.refresh(['cn-hangzhou'], force_full=True)}
+    assert isinstance(reports['disk'].error, RuntimeError)
+    assert reports['instance'].error is None
+    assert len(sync.store.find('disk')) == 2
+
+def test_async_refresh_matches_sync():
+    sync = _sync(FakeRegion())
+    async_sync = _sync(FakeRegion())
+    sync.refresh(['cn-hangzhou'])
+    asyncio.run(async_sync.refresh_async(['cn-hangzhou']))
+    assert sorted(sync.store.find()) == sorted(async_sync.store.find())
+
+def test_store_persists_sync_times(tmp_path):
+    path = str(tmp_path / 'inventory.db')
+    sync = _sync(FakeRegion(), InventoryStore(path))
+    sync.refresh(['cn-hangzhou'])
+    reopened = InventoryStore(path)
+    assert reopened.last_sync('cn-hangzhou', 'disk') is not None
+    assert len(reopened.find('instance')) == 3
+
+def test_unknown_resource_type_raises():
+    with pytest.raises(ValueError):
+        InventorySync(FakeEcs(lambda *args: {}).pool(), InventoryStore(), resource_types=['bucket'])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importing the client may load the field tables, but no model classes.
+MAX_MODEL_MODULES = 5
+
+def _loaded_model_modules(code: str) -> int:
+    script = code + (
+        "\nimport sys"
+        "\nprint(len([name for name in sys.modules if name.startswith('alibabacloud_ecs20140526.models.')]))"
+    )
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT)
+    return int(output.decode().strip().splitlines()[-1])
+
+def test_import_client_loads_few_model_modules():
+    assert _loaded_model_modules('import alibabacloud_ecs20140526.client') <= MAX_MODEL_MODULES
+
+def test_model_classes_resolve_on_first_access():
+    loaded = _loaded_model_modules(
+        'from alibabacloud_ecs20140526 import models\n'
+        'assert models.DescribeInstancesRequest.__name__ == "DescribeInstancesRequest"\n'
+        'assert models.DescribeInstancesResponseBodyInstancesInstance.__name__ == "DescribeInstancesResponseBodyInstancesInstance"'
+    )
+    assert loaded <= MAX_MODEL_MODULES + 3
+
+def test_lazy_names_are_listed_and_unknown_names_raise():
+    from alibabacloud_ecs20140526 import models
+    assert 'DescribeInstancesRequest' in dir(models)
+    try:
+        models.NoSuchModel
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('expected AttributeError')
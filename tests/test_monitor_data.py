@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import calendar
+import time
+
+import pytest
+
+from alibabacloud_ecs20140526.monitor_data import MAX_POINTS, MonitorDataFetcher, metrics
+from fakes import FakeEcs
+
+START = 1_700_006_400
+
+def _epoch(timestamp: str) -> int:
+    return calendar.timegm(time.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ'))
+
+def _handler(region_id, action, query):
+    start, end, period = _epoch(query['StartTime']), _epoch(query['EndTime']), int(query['Period'])
+    # Both ends are included, so adjacent windows share a point.
+    points = [
+        {'InstanceId': query['InstanceId'], 'TimeStamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp)),
+         'CPU': (timestamp - START) // period % 100, 'IntranetRX': 10}
+        for timestamp in range(start, end + 1, period)
+    ]
+    return {'MonitorData': {'InstanceMonitorData': points}}
+
+def test_metric_columns_come_from_the_model():
+    names = dict(metrics('instance'))
+    assert names['CPU'] == 'cpu' and names['IntranetRX'] == 'intranet_rx' and names['IOPSRead'] == 'iops_read'
+    assert 'InstanceId' not in names and 'TimeStamp' not in names
+
+def test_windows_are_fetched_and_joined_per_resource():
+    fake = FakeEcs(_handler)
+    fetcher = MonitorDataFetcher(fake.client(), period=60)
+    end = START + 60 * 1000
+    tables = fetcher.fetch(['i-1', 'i-2', 'i-1'], START, end)
+    assert sorted(tables) == ['i-1', 'i-2']
+    # 1,000 points in windows of MAX_POINTS, for two instances.
+    assert len(fake.calls) == 2 * -(-1000 // MAX_POINTS)
+    timestamps = list(tables['i-1']['timestamp'])
+    assert timestamps == list(range(START, end + 1, 60))
+    assert list(tables['i-2']['cpu'])[:3] == [0, 1, 2]
+    assert tables['i-2'].row(0)['iops_read'] is None
+
+def test_async_fetch_matches_sync():
+    fake = FakeEcs(_handler)
+    fetcher = MonitorDataFetcher(fake.client(), period=300)
+    end = START + 300 * 500
+    sync = fetcher.fetch(['i-1'], START, end)['i-1']
+    tables = asyncio.run(fetcher.fetch_async(['i-1'], START, end))
+    assert list(tables['i-1']['cpu']) == list(sync['cpu'])
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError):
+        MonitorDataFetcher(FakeEcs(_handler).client(), kind='gpu')
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.paginator import ITEM_IDS, Paginator, pagination_spec
+from fakes import FakeEcs, page, token_page
+
+def _snapshots(count: int):
+    return [{'SnapshotId': f's-{n}', 'Status': 'accomplished'} for n in range(count)]
+
+def test_spec_prefers_explicit_item_ids():
+    assert pagination_spec('DescribeInstanceStatus').item_id == ('instance_id',)
+    assert pagination_spec('DescribeEipAddresses').item_id == ('allocation_id',)
+    assert pagination_spec('DescribeNetworkInterfaces').item_id == ('network_interface_id',)
+    assert all(pagination_spec(action) is not None for action in ITEM_IDS)
+
+def test_next_token_paging_and_max_items():
+    items = [{'PrefixListId': f'pl-{n}'} for n in range(25)]
+    fake = FakeEcs(lambda region_id, action, query: token_page(items, query, 'PrefixLists', 'PrefixList'))
+    client = fake.client()
+    paginator = Paginator(client, 'DescribePrefixLists', main_models.DescribePrefixListsRequest(region_id='cn-hangzhou'))
+    assert [item.prefix_list_id for item in paginator.items()] == [f'pl-{n}' for n in range(25)]
+    assert len(fake.calls) == 3
+    capped = Paginator(client, 'DescribePrefixLists', main_models.DescribePrefixListsRequest(region_id='cn-hangzhou'), max_items=12)
+    assert len(list(capped.items())) == 12
+
+def test_page_number_paging_leaves_request_unchanged():
+    items = _snapshots(23)
+    fake = FakeEcs(lambda region_id, action, query: page(items, query, 'Snapshots', 'Snapshot'))
+    request = main_models.DescribeSnapshotsRequest(region_id='cn-hangzhou', page_number=1, page_size=10)
+    pages = list(Paginator(fake.client(), 'DescribeSnapshots', request).pages())
+    assert len(pages) == 3
+    assert request.page_number == 1
+
+def test_concurrent_pages_keep_order_and_drop_shifted_items():
+    items = _snapshots(95)
+    # s-9 shows up again on the second page with a changed field, as when an
+    # item moves between pages while they are read.
+    shifted = items[:10] + [dict(items[9], Status='progressing')] + items[10:]
+    fake = FakeEcs(lambda region_id, action, query: page(shifted, query, 'Snapshots', 'Snapshot'), delay=0.001)
+    request = main_models.DescribeSnapshotsRequest(region_id='cn-hangzhou', page_size=10)
+    result = asyncio.run(Paginator(fake.client(), 'DescribeSnapshots', request).fetch_all_pages_concurrently(concurrency=4))
+    assert [item.snapshot_id for item in result] == [f's-{n}' for n in range(95)]
+    assert len(fake.calls) == 10
+
+def test_concurrent_pages_without_total_count_page_serially():
+    items = _snapshots(35)
+    fake = FakeEcs(lambda region_id, action, query: page(items, query, 'Snapshots', 'Snapshot', total_count=False))
+    request = main_models.DescribeSnapshotsRequest(region_id='cn-hangzhou', page_size=10)
+    result = asyncio.run(Paginator(fake.client(), 'DescribeSnapshots', request).fetch_all_pages_concurrently())
+    assert [item.snapshot_id for item in result] == [f's-{n}' for n in range(35)]
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from alibabacloud_ecs20140526.pricing import PriceMatrix, price_grid
+from alibabacloud_ecs20140526.response_cache import ResponseCache, SqliteStore
+from fakes import FakeEcs
+
+PRICES = {'ecs.g7.large': 0.5, 'ecs.g7.xlarge': 1.0}
+
+def _price_backend() -> FakeEcs:
+    def handler(region_id, action, query):
+        instance_type = query['InstanceType']
+        if instance_type not in PRICES:
+            raise RuntimeError(f'unknown instance type {instance_type}\nrequest id: 1')
+        trade_price = PRICES[instance_type]
+        return {'PriceInfo': {'Price': {'TradePrice': trade_price, 'OriginalPrice': trade_price * 2,
+                                        'DiscountPrice': trade_price, 'Currency': 'CNY'}}}
+    return FakeEcs(handler)
+
+def test_grid_drops_duplicate_cells():
+    cells = price_grid({'cn-hangzhou': ['cn-hangzhou-h', 'cn-hangzhou-h', '']}, ['ecs.g7.large'])
+    assert [cell.zone_id for cell in cells] == ['cn-hangzhou-h', None]
+
+def test_fetch_prices_cells_and_reports_errors():
+    fake = _price_backend()
+    cells = price_grid({'cn-hangzhou': ['cn-hangzhou-h'], 'cn-beijing': ['cn-beijing-a']},
+                       ['ecs.g7.large', 'ecs.g7.xlarge', 'ecs.unknown'])
+    table = PriceMatrix(fake.pool()).fetch(cells + cells[:2])
+    assert len(table) == 8
+    assert len(fake.calls) == 6
+    assert table.row(0)['trade_price'] == 0.5
+    assert table.row(2)['trade_price'] is None
+    assert table.row(2)['error'] == 'unknown instance type ecs.unknown'
+
+def test_supplied_cache_is_used_but_not_reconfigured(tmp_path):
+    fake = _price_backend()
+    cache = ResponseCache(store=SqliteStore(str(tmp_path / 'prices.db')))
+    matrix = PriceMatrix(fake.pool(), ttl=60, cache=cache)
+    cells = price_grid({'cn-hangzhou': ['cn-hangzhou-h']}, ['ecs.g7.large', 'ecs.g7.xlarge'])
+    first = matrix.fetch(cells)
+    second = matrix.fetch(cells)
+    assert len(fake.calls) == 2
+    assert list(first['trade_price']) == list(second['trade_price']) == [0.5, 1.0]
+    # Clients sharing the cache still do not cache DescribePrice.
+    assert 'DescribePrice' not in cache.ttls
+    client = fake.client()
+    client.set_response_cache(cache)
+    for _ in range(2):
+        client.describe_price(matrix.request(cells[0]))
+    assert len(fake.calls) == 4
+
+def test_supplied_cache_keeps_its_own_price_ttl():
+    cache = ResponseCache(ttls={'DescribePrice': 5})
+    matrix = PriceMatrix(_price_backend().pool(), ttl=60, cache=cache)
+    assert matrix.ttl == 5
+    assert cache.ttls['DescribePrice'] == 5
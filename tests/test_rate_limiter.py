@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+
+from alibabacloud_ecs20140526 import rate_limiter as rate_limiter_module
+from alibabacloud_ecs20140526.rate_limiter import FileLockBackend, RateLimiter
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def _clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter_module.time, 'time', clock)
+    return clock
+
+def test_bucket_allows_burst_then_spaces_calls(monkeypatch):
+    _clock(monkeypatch)
+    limiter = RateLimiter(rate=10, burst=5)
+    waits = [limiter.reserve('DescribeInstances', 'cn-hangzhou') for _ in range(7)]
+    assert waits[:5] == [0.0] * 5
+    assert waits[5:] == [0.1, 0.2]
+
+def test_rates_override_per_action_and_region(monkeypatch):
+    _clock(monkeypatch)
+    limiter = RateLimiter(rate=20, rates={'DescribePrice': 5, ('RunInstances', 'cn-hangzhou'): 2})
+    assert limiter.current_rate('DescribePrice', 'cn-beijing') == 5
+    assert limiter.current_rate('RunInstances', 'cn-hangzhou') == 2
+    assert limiter.current_rate('RunInstances', 'cn-beijing') == 20
+
+def test_throttles_in_one_refill_interval_decrease_once(monkeypatch):
+    clock = _clock(monkeypatch)
+    limiter = RateLimiter(rate=20)
+    for _ in range(10):
+        limiter.on_throttle('DescribeInstances')
+    assert limiter.current_rate('DescribeInstances') == 10
+    # The bucket of 20 tokens refills in 2 seconds at 10 calls per second.
+    clock.now += 1.9
+    limiter.on_throttle('DescribeInstances')
+    assert limiter.current_rate('DescribeInstances') == 10
+    clock.now += 0.2
+    limiter.on_throttle('DescribeInstances')
+    assert limiter.current_rate('DescribeInstances') == 5
+
+def test_successes_restore_the_rate(monkeypatch):
+    _clock(monkeypatch)
+    limiter = RateLimiter(rate=20, increase=4)
+    limiter.on_throttle('DescribeInstances')
+    limiter.on_success('DescribeInstances')
+    assert limiter.current_rate('DescribeInstances') == 14
+    for _ in range(5):
+        limiter.on_success('DescribeInstances')
+    assert limiter.current_rate('DescribeInstances') == 20
+
+def test_file_lock_backend_shares_buckets(monkeypatch, tmp_path):
+    _clock(monkeypatch)
+    path = str(tmp_path / 'buckets.json')
+    first = RateLimiter(rate=1, burst=1, backend=FileLockBackend(path))
+    second = RateLimiter(rate=1, burst=1, backend=FileLockBackend(path))
+    assert first.reserve('DescribeInstances') == 0.0
+    assert second.reserve('DescribeInstances') == 1.0
+
+class RecordingBackend(FileLockBackend):
+    def __init__(self, path):
+        super().__init__(path)
+        # The thread of each update.
+        self.threads = []
+
+    def update(self, key, fn):
+        self.threads.append(threading.get_ident())
+        return super().update(key, fn)
+
+def test_outcomes_are_applied_with_the_next_reservation(monkeypatch, tmp_path):
+    _clock(monkeypatch)
+    backend = RecordingBackend(str(tmp_path / 'buckets.json'))
+    limiter = RateLimiter(rate=20, increase=4, backend=backend)
+    limiter.reserve('DescribeInstances')
+    limiter.on_throttle('DescribeInstances')
+    limiter.on_success('DescribeInstances')
+    assert len(backend.threads) == 1
+    limiter.reserve('DescribeInstances')
+    assert len(backend.threads) == 2
+    # Read back through a second limiter on the same file.
+    assert RateLimiter(rate=20, backend=FileLockBackend(backend.path)).current_rate('DescribeInstances') == 14
+
+def test_async_acquire_keeps_file_locks_off_the_event_loop(tmp_path):
+    backend = RecordingBackend(str(tmp_path / 'buckets.json'))
+    limiter = RateLimiter(rate=100, backend=backend)
+
+    async def main():
+        await asyncio.gather(*(limiter.acquire_async('DescribeInstances') for _ in range(5)))
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert len(backend.threads) == 5
+    assert loop_thread not in backend.threads
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526._decoder import LazyModel
+from darabonba.runtime import RuntimeOptions
+from fakes import FakeEcs, sample_map
+
+def _instances_backend() -> FakeEcs:
+    return FakeEcs(lambda region_id, action, query: sample_map('DescribeInstancesResponseBody', items=2))
+
+def _request():
+    return main_models.DescribeInstancesRequest(region_id='cn-hangzhou')
+
+def test_lazy_responses_read_like_models():
+    fake = _instances_backend()
+    client = fake.client()
+    expected = client.describe_instances(_request())
+    client.set_lazy_responses(True)
+    lazy = client.describe_instances(_request())
+    assert isinstance(lazy, LazyModel)
+    instance = lazy.body.instances.instance[1]
+    expected_instance = expected.body.instances.instance[1]
+    assert instance.instance_id == expected_instance.instance_id
+    assert instance.vpc_attributes.vpc_id == expected_instance.vpc_attributes.vpc_id
+    assert lazy.to_map() == expected.to_map()
+    with pytest.raises(AttributeError):
+        lazy.body.no_such_field
+
+def test_raw_calls_return_the_response_map():
+    fake = _instances_backend()
+    client = fake.client()
+    raw = client.call_action_raw('DescribeInstances', _request(), RuntimeOptions())
+    assert raw['statusCode'] == 200
+    assert raw['body'] == sample_map('DescribeInstancesResponseBody', items=2)
+    raw_async = asyncio.run(client.call_action_raw_async('DescribeInstances', _request(), RuntimeOptions()))
+    assert raw_async['body'] == raw['body']
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526 import response_cache as response_cache_module
+from alibabacloud_ecs20140526.response_cache import ResponseCache, SqliteStore
+from darabonba.runtime import RuntimeOptions
+from fakes import FakeEcs
+
+def _zones_backend(delay: float = 0) -> FakeEcs:
+    return FakeEcs(lambda region_id, action, query: {'Zones': {'Zone': [{'ZoneId': f'{region_id}-a'}]}}, delay=delay)
+
+def test_metadata_calls_are_cached_per_endpoint_and_query():
+    fake = _zones_backend()
+    cache = ResponseCache()
+    hangzhou, beijing = fake.client('cn-hangzhou'), fake.client('cn-beijing')
+    for client in (hangzhou, beijing, hangzhou):
+        client.set_response_cache(cache)
+        client.describe_zones(main_models.DescribeZonesRequest(region_id=client._region_id))
+    hangzhou.describe_zones(main_models.DescribeZonesRequest(region_id='cn-hangzhou', spot_strategy='SpotAsPriceGo'))
+    assert len(fake.calls) == 3
+    assert cache.stats()['DescribeZones'] == {'misses': 3, 'hits': 1}
+
+def test_hits_are_copies():
+    fake = _zones_backend()
+    client = fake.client()
+    client.set_response_cache(ResponseCache())
+    first = client.call_action_raw('DescribeZones', main_models.DescribeZonesRequest(region_id='cn-hangzhou'),
+                                   RuntimeOptions())
+    first['body']['Zones']['Zone'].clear()
+    second = client.describe_zones(main_models.DescribeZonesRequest(region_id='cn-hangzhou'))
+    assert second.body.zones.zone[0].zone_id == 'cn-hangzhou-a'
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, 'time', lambda: now[0])
+    cache = ResponseCache(ttls={'DescribeZones': 60})
+    cache.set('k', 'DescribeZones', {'body': {}})
+    assert cache.get('k') == {'body': {}}
+    now[0] += 61
+    assert cache.get('k') is None
+
+def test_uncached_actions_go_through():
+    fake = FakeEcs(lambda region_id, action, query: {'RequestId': 'r'})
+    client = fake.client()
+    client.set_response_cache(ResponseCache())
+    for _ in range(2):
+        client.describe_instances(main_models.DescribeInstancesRequest(region_id='cn-hangzhou'))
+    assert len(fake.calls) == 2
+
+def test_concurrent_identical_calls_share_one_request():
+    fake = _zones_backend(delay=0.01)
+    client = fake.client()
+    cache = ResponseCache()
+    client.set_response_cache(cache)
+
+    async def main():
+        await asyncio.gather(*(
+            client.describe_zones_async(main_models.DescribeZonesRequest(region_id='cn-hangzhou')) for _ in range(10)
+        ))
+
+    asyncio.run(main())
+    assert len(fake.calls) == 1
+    assert cache.stats()['DescribeZones'] == {'misses': 1, 'coalesced': 9}
+
+def test_threads_share_one_request():
+    release = threading.Event()
+    cache = ResponseCache()
+    calls = []
+
+    def call():
+        calls.append(1)
+        release.wait(1)
+        return {'body': {'n': 1}}
+
+    threads = [threading.Thread(target=cache.get_or_call, args=('DescribeZones', {}, call)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+def test_sqlite_store_is_shared(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    ResponseCache(store=SqliteStore(path)).set('k', 'DescribeZones', {'body': {'n': 1}})
+    assert ResponseCache(store=SqliteStore(path)).get('k') == {'body': {'n': 1}}
+
+def test_cancelled_async_caller_does_not_cancel_waiters():
+    cache = ResponseCache()
+    calls = []
+
+    async def call():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return {'body': {'n': len(calls)}}
+
+    async def main():
+        leader = asyncio.ensure_future(asyncio.wait_for(cache.get_or_call_async('DescribeZones', {}, call), 0.01))
+        await asyncio.sleep(0)
+        waiters = [cache.get_or_call_async('DescribeZones', {}, call) for _ in range(3)]
+        results = await asyncio.gather(leader, *waiters, return_exceptions=True)
+        return results[0], results[1:]
+
+    leader, waiters = asyncio.run(main())
+    assert isinstance(leader, asyncio.TimeoutError)
+    # The first waiter made the call again and the others waited on it.
+    assert waiters == [{'body': {'n': 2}}] * 3
+    assert len(calls) == 2
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from alibabacloud_ecs20140526 import models as main_models
+from alibabacloud_ecs20140526.rate_limiter import RateLimiter
+from alibabacloud_ecs20140526.retry import RetryBudget, RetryPolicy
+from fakes import FakeEcs
+
+class EcsError(Exception):
+    def __init__(self, code, status_code=400):
+        super().__init__(code)
+        self.code = code
+        self.status_code = status_code
+
+def _flaky(errors) -> FakeEcs:
+    errors = list(errors)
+
+    def handler(region_id, action, query):
+        if errors:
+            raise errors.pop(0)
+        return {'RequestId': 'r', 'Regions': {'Region': []}}
+
+    return FakeEcs(handler)
+
+def _policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(base_delay=0, max_delay=0, **kwargs)
+
+def test_errors_are_classified_by_action():
+    policy = _policy()
+    assert policy.is_retryable('RunInstances', {}, EcsError('Throttling.User')) == 'throttling'
+    assert policy.is_retryable('DescribeInstances', {}, EcsError('ServiceUnavailable', 503)) == 'ServiceUnavailable'
+    assert policy.is_retryable('RunInstances', {}, EcsError('ServiceUnavailable', 503)) is None
+    assert policy.is_retryable('RunInstances', {'ClientToken': 't'}, EcsError('ServiceUnavailable', 503)) == 'ServiceUnavailable'
+    assert policy.is_retryable('StartInstance', {'ClientToken': 't'}, EcsError('IncorrectInstanceStatus')) is None
+    assert policy.is_retryable('DescribeInstances', {}, EcsError('InvalidParameter')) is None
+
+def test_reads_are_retried_and_counted():
+    fake = _flaky([EcsError('Throttling'), EcsError('InternalError', 500)])
+    client = fake.client()
+    policy = _policy()
+    limiter = RateLimiter(rate=1000)
+    client.set_retry_policy(policy)
+    client.set_rate_limiter(limiter)
+    asyncio.run(client.describe_regions_async(main_models.DescribeRegionsRequest()))
+    assert len(fake.calls) == 3
+    counters = policy.metrics.snapshot()['DescribeRegions']
+    assert counters == {'calls': 1, 'retries': 2, 'retries.throttling': 1, 'retries.InternalError': 1}
+    # The throttling error halved the rate; the success added back rate / 20.
+    assert limiter.current_rate('DescribeRegions', 'cn-hangzhou') == 550
+
+def test_attempts_are_capped():
+    fake = _flaky([EcsError('Throttling')] * 5)
+    client = fake.client()
+    client.set_retry_policy(_policy(max_attempts=3))
+    with pytest.raises(EcsError):
+        client.describe_regions(main_models.DescribeRegionsRequest())
+    assert len(fake.calls) == 3
+
+def test_budget_limits_retries_across_calls():
+    fake = _flaky([EcsError('Throttling')] * 20)
+    client = fake.client()
+    policy = _policy(budget=RetryBudget(ratio=0, max_tokens=2))
+    client.set_retry_policy(policy)
+    for _ in range(2):
+        with pytest.raises(EcsError):
+            client.describe_regions(main_models.DescribeRegionsRequest())
+    # Two retries from the budget, then each call fails on its first error.
+    assert len(fake.calls) == 4
+    assert policy.metrics.snapshot()['DescribeRegions']['budget_exhausted'] == 2
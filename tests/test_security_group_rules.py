@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+from alibabacloud_ecs20140526.security_group_rules import (
+    MAX_RULES,
+    Rule,
+    SecurityGroupReconciler,
+    diff_rules,
+    normalize,
+    plan_calls,
+)
+from fakes import FakeEcs, listed, listed_models, token_page
+
+GROUP = ('cn-hangzhou', 'sg-1')
+
+class FakeGroup:
+    """
+    One security group's permissions, changed by the authorize, modify and
+    revoke calls.
+    """
+
+    def __init__(self, permissions=()):
+        self.permissions = {}
+        for permission in permissions:
+            self.add(permission)
+        self.fake = FakeEcs(self.handle)
+
+    def add(self, permission):
+        rule_id = f'sgr-{len(self.permissions)}-{id(permission)}'
+        self.permissions[rule_id] = dict(permission, SecurityGroupRuleId=rule_id)
+
+    def handle(self, region_id, action, query):
+        if action == 'DescribeSecurityGroupAttribute':
+            return token_page(list(self.permissions.values()), query, 'Permissions', 'Permission', default_size=100)
+        if action.startswith('Authorize'):
+            direction = 'egress' if action.endswith('Egress') else 'ingress'
+            for permission in listed_models(query, 'Permissions'):
+                self.add(dict(permission, Direction=direction))
+        elif action.startswith('Revoke'):
+            for rule_id in listed(query, 'SecurityGroupRuleId'):
+                del self.permissions[rule_id]
+        else:
+            permission = self.permissions[query['SecurityGroupRuleId']]
+            permission.update({name: query[name] for name in ('Priority', 'Description') if name in query})
+        return {'RequestId': 'r'}
+
+def _ssh(**kwargs):
+    return Rule('ingress', 'tcp', '22', cidr_ip='10.0.0.1/8', **kwargs)
+
+def test_normalize_fills_defaults_and_canonical_forms():
+    rule = normalize(_ssh())
+    assert (rule.ip_protocol, rule.port_range, rule.cidr_ip) == ('TCP', '22/22', '10.0.0.0/8')
+    assert (rule.nic_type, rule.policy, rule.priority, rule.description) == ('intranet', 'accept', 1, '')
+    assert normalize(Rule('Egress', 'icmp', '8/8', cidr_ip='0.0.0.0/0')).port_range == '-1/-1'
+
+def test_diff_matches_by_key():
+    current = [('r1', normalize(_ssh())), ('r2', normalize(_ssh())),
+               ('r3', normalize(_ssh(description='old'))._replace(port_range='80/80'))]
+    diff = diff_rules(current, [_ssh(priority=5), Rule('ingress', 'tcp', '443', cidr_ip='0.0.0.0/0')])
+    assert [rule_id for rule_id, rule in diff.modify] == ['r1']
+    assert [rule_id for rule_id, rule in diff.revoke] == ['r2', 'r3']
+    assert [rule.port_range for rule in diff.authorize] == ['443/443']
+
+def test_plan_batches_authorize_and_revoke():
+    rules = [normalize(Rule('ingress', 'tcp', str(port), cidr_ip='0.0.0.0/0')) for port in range(1, 251)]
+    diff = diff_rules([(f'r{n}', rule._replace(direction='egress')) for n, rule in enumerate(rules)], rules)
+    calls = plan_calls(*GROUP, diff)
+    assert [(call.action, len(call.rules) or len(call.rule_ids)) for call in calls] == [
+        ('AuthorizeSecurityGroup', MAX_RULES), ('AuthorizeSecurityGroup', MAX_RULES), ('AuthorizeSecurityGroup', 50),
+        ('RevokeSecurityGroupEgress', MAX_RULES), ('RevokeSecurityGroupEgress', MAX_RULES), ('RevokeSecurityGroupEgress', 50),
+    ]
+    assert plan_calls(*GROUP, diff, revoke_first=True)[0].action == 'RevokeSecurityGroupEgress'
+
+def test_sync_converges():
+    group = FakeGroup([
+        {'Direction': 'ingress', 'IpProtocol': 'TCP', 'PortRange': '22/22', 'SourceCidrIp': '10.0.0.0/8',
+         'Priority': 1, 'Description': ''},
+        {'Direction': 'egress', 'IpProtocol': 'ALL', 'PortRange': '-1/-1', 'DestCidrIp': '0.0.0.0/0',
+         'Priority': 1, 'Description': ''},
+    ])
+    reconciler = SecurityGroupReconciler(group.fake.pool())
+    desired = {GROUP: [_ssh(priority=2, description='ssh'), Rule('ingress', 'tcp', '443', cidr_ip='0.0.0.0/0')]}
+    results = reconciler.sync(desired)
+    assert results[0].error is None and results[0].applied == 3
+    assert reconciler.plan(desired)[0].calls == []
+
+def test_clearing_a_description_converges():
+    group = FakeGroup([{'Direction': 'ingress', 'IpProtocol': 'TCP', 'PortRange': '22/22',
+                        'SourceCidrIp': '10.0.0.0/8', 'Priority': 1, 'Description': 'old'}])
+    reconciler = SecurityGroupReconciler(group.fake.pool())
+    desired = {GROUP: [_ssh()]}
+    reconciler.sync(desired)
+    modify = [query for region_id, action, query in group.fake.calls if action == 'ModifySecurityGroupRule']
+    assert modify[0]['Description'] == ''
+    assert reconciler.plan(desired)[0].calls == []
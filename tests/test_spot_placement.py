@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import calendar
+import math
+import time
+
+import pytest
+
+from alibabacloud_ecs20140526.columnar import Table, concat, outer_join
+from alibabacloud_ecs20140526.spot_placement import SpotPlacementAdvisor
+from fakes import FakeEcs
+
+ZONES = {
+    # zone -> (stock, interruption rate, spot price)
+    'cn-hangzhou-h': ('WithStock', 0.1, 0.3),
+    'cn-hangzhou-i': ('WithStock', 0.05, 0.4),
+    'cn-hangzhou-j': ('WithoutStock', 0.01, 0.1),
+}
+
+def _handler(region_id, action, query):
+    if action == 'DescribeSpotAdvice':
+        return {'AvailableSpotZones': {'AvailableSpotZone': [
+            {'ZoneId': zone_id, 'AvailableSpotResources': {'AvailableSpotResource': [
+                {'InstanceType': 'ecs.g7.large', 'InterruptionRate': rate, 'InterruptRateDesc': '0-5%',
+                 'AverageSpotDiscount': 80}]}}
+            for zone_id, (stock, rate, price) in ZONES.items()
+        ]}}
+    if action == 'DescribeAvailableResource':
+        return {'AvailableZones': {'AvailableZone': [
+            {'ZoneId': zone_id, 'AvailableResources': {'AvailableResource': [
+                {'SupportedResources': {'SupportedResource': [{'Value': 'ecs.g7.large', 'StatusCategory': stock}]}}]}}
+            for zone_id, (stock, rate, price) in ZONES.items()
+        ]}}
+    start = calendar.timegm(time.strptime(query['StartTime'], '%Y-%m-%dT%H:%M:%SZ'))
+    return {'SpotPrices': {'SpotPriceType': [
+        {'ZoneId': zone_id, 'Timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(start)),
+         'SpotPrice': price, 'OriginPrice': 1.0, 'NetworkType': 'vpc', 'InstanceType': query['InstanceType']}
+        for zone_id, (stock, rate, price) in ZONES.items()
+    ]}, 'NextOffset': 0}
+
+def test_placements_are_ranked_by_stock_interruption_and_price():
+    fake = FakeEcs(_handler)
+    advisor = SpotPlacementAdvisor(fake.pool())
+    table = advisor.advise('cn-hangzhou', ['ecs.g7.large'])
+    assert list(table['zone_id']) == ['cn-hangzhou-i', 'cn-hangzhou-h', 'cn-hangzhou-j']
+    assert table.row(0)['stock'] == 'WithStock'
+    assert abs(table.row(0)['mean_price'] - 0.4) < 1e-9
+    assert table.row(2)['stock_rank'] == 2
+
+def test_sources_are_reused_within_their_ttls():
+    fake = FakeEcs(_handler)
+    advisor = SpotPlacementAdvisor(fake.pool())
+    asyncio.run(advisor.advise_async('cn-hangzhou', ['ecs.g7.large']))
+    calls = len(fake.calls)
+    advisor.advise('cn-hangzhou', ['ecs.g7.large'])
+    assert len(fake.calls) == calls
+    advisor.invalidate()
+    advisor.advise('cn-hangzhou', ['ecs.g7.large'])
+    assert len(fake.calls) > calls
+
+def _missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def test_a_zone_seen_by_one_source_keeps_the_other_columns_missing():
+    def handler(region_id, action, query):
+        response = _handler(region_id, action, query)
+        if action == 'DescribeAvailableResource':
+            response['AvailableZones']['AvailableZone'].append(
+                {'ZoneId': 'cn-hangzhou-k', 'AvailableResources': {'AvailableResource': [
+                    {'SupportedResources': {'SupportedResource': [
+                        {'Value': 'ecs.g7.large', 'StatusCategory': 'ClosedWithStock'},
+                        {'Value': 'ecs.c7.large', 'StatusCategory': 'WithStock'},
+                    ]}}]}})
+        return response
+
+    advisor = SpotPlacementAdvisor(FakeEcs(handler).pool())
+    table = advisor.advise('cn-hangzhou', ['ecs.g7.large'])
+    assert list(table['zone_id']) == ['cn-hangzhou-i', 'cn-hangzhou-h', 'cn-hangzhou-k', 'cn-hangzhou-j']
+    assert set(table['instance_type']) == {'ecs.g7.large'}
+    row = table.row(2)
+    assert row['stock'] == 'ClosedWithStock' and row['stock_rank'] == 1
+    assert row['interruption_rate'] is None and row['mean_price'] is None
+
+def test_outer_join_aligns_rows_by_key():
+    left = Table({'k': ['b', 'a'], 'x': [2, 1]}, numeric=['x'])
+    right = Table({'k': ['c', 'b'], 'y': ['C', 'B']})
+    joined = outer_join([left, right], ['k'])
+    assert joined['k'] == ['a', 'b', 'c']
+    assert [row['x'] for row in joined.rows()] == [1.0, 2.0, None]
+    assert joined['y'] == [None, 'B', 'C']
+    assert joined.numeric == frozenset(['x'])
+    with pytest.raises(ValueError):
+        outer_join([left, Table({'k': ['a'], 'x': [3]})], ['k'])
+    with pytest.raises(ValueError):
+        outer_join([Table({'k': ['a', 'a']})], ['k'])
+
+def test_concat_keeps_numeric_columns():
+    first = Table({'k': ['a'], 'x': [1]}, numeric=['x'])
+    second = Table({'k': ['b'], 'x': [None]}, numeric=['x'])
+    table = concat([first, second], ['k', 'x'])
+    assert table['k'] == ['a', 'b']
+    assert table.row(0)['x'] == 1.0 and _missing(table['x'][1])
+    assert len(concat([], ['k'])) == 0
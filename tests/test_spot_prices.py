@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import calendar
+import sqlite3
+import time
+
+from alibabacloud_ecs20140526.spot_prices import SpotPriceStore, SpotSeries
+from fakes import FakeEcs
+
+DAY = 86400
+START = 1_700_006_400
+ZONE_PRICES = {'cn-hangzhou-h': 0.2, 'cn-hangzhou-i': 0.1}
+OS_PREMIUM = {'windows': 1.0}
+
+def _epoch(timestamp: str) -> int:
+    return calendar.timegm(time.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ'))
+
+class FakeHistory:
+    """
+    One price point per zone per hour; each page holds `page_size` points.
+    """
+
+    def __init__(self, page_size=20, failing_after=None):
+        self.page_size = page_size
+        self.failing_after = failing_after
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        start, end = _epoch(query['StartTime']), _epoch(query['EndTime'])
+        if self.failing_after is not None and start >= self.failing_after:
+            raise RuntimeError('slice failed')
+        points = [
+            {'ZoneId': zone_id, 'Timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp)),
+             'SpotPrice': price + (timestamp - START) / DAY / 100 + OS_PREMIUM.get(query.get('OSType'), 0),
+             'OriginPrice': 1.0, 'NetworkType': 'vpc', 'IoOptimized': 'optimized', 'InstanceType': query['InstanceType']}
+            for timestamp in range(start, end, 3600)
+            for zone_id, price in ZONE_PRICES.items()
+        ]
+        offset = int(query.get('Offset') or 0)
+        page = points[offset:offset + self.page_size]
+        next_offset = offset + len(page)
+        return {'SpotPrices': {'SpotPriceType': page}, 'NextOffset': next_offset if next_offset < len(points) else 0}
+
+SERIES = SpotSeries('cn-hangzhou', 'ecs.g7.large')
+
+def test_sync_is_incremental():
+    history = FakeHistory()
+    store = SpotPriceStore()
+    first = store.sync(history.fake.pool(), [SERIES], start=START, end=START + 2 * DAY)
+    assert first[0].fetched == 96 and first[0].error is None
+    assert store.watermark(SERIES) == START + 2 * DAY
+    calls = len(history.fake.calls)
+    second = asyncio.run(store.sync_async(history.fake.pool(), [SERIES], end=START + 3 * DAY))
+    assert second[0].fetched == 48
+    # One new slice of 48 points, in pages of 20.
+    assert len(history.fake.calls) - calls == 3
+    assert len(store.history('cn-hangzhou', 'ecs.g7.large')) == 144
+
+def test_failed_slice_stops_the_watermark():
+    store = SpotPriceStore()
+    result = store.sync(FakeHistory(failing_after=START + DAY).fake.pool(), [SERIES], start=START, end=START + 3 * DAY)
+    assert isinstance(result[0].error, RuntimeError)
+    assert store.watermark(SERIES) == START + DAY
+
+def test_zone_stats_and_cheapest_zone():
+    store = SpotPriceStore()
+    store.sync(FakeHistory().fake.pool(), [SERIES], start=START, end=START + DAY)
+    stats = store.zone_stats('cn-hangzhou', 'ecs.g7.large')
+    assert list(stats['zone_id']) == ['cn-hangzhou-h', 'cn-hangzhou-i']
+    assert list(stats['count']) == [24, 24]
+    assert abs(stats['min_price'][1] - 0.1) < 1e-9
+    assert store.cheapest_zone('cn-hangzhou', 'ecs.g7.large') == 'cn-hangzhou-i'
+
+def test_os_types_are_kept_apart():
+    store = SpotPriceStore()
+    windows = SERIES._replace(ostype='windows')
+    store.sync(FakeHistory().fake.pool(), [SERIES, windows], start=START, end=START + DAY)
+    linux_prices = store.history('cn-hangzhou', 'ecs.g7.large', zone_id='cn-hangzhou-i')['spot_price']
+    windows_prices = store.history('cn-hangzhou', 'ecs.g7.large', zone_id='cn-hangzhou-i', ostype='windows')['spot_price']
+    assert len(linux_prices) == len(windows_prices) == 24
+    assert abs(windows_prices[0] - linux_prices[0] - 1.0) < 1e-9
+    stats = store.zone_stats('cn-hangzhou', 'ecs.g7.large', ostype='windows', io_optimized='optimized')
+    assert abs(stats['min_price'][1] - 1.1) < 1e-9
+    assert len(store.history('cn-hangzhou', 'ecs.g7.large', io_optimized='none')) == 0
+
+def test_stores_without_ostype_are_refetched(tmp_path):
+    path = str(tmp_path / 'prices.db')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE spot_price (region_id TEXT, instance_type TEXT, network_type TEXT,'
+                       ' io_optimized TEXT, zone_id TEXT, timestamp INTEGER, spot_price REAL, origin_price REAL)')
+    connection.execute('CREATE TABLE spot_price_watermark (series TEXT PRIMARY KEY, synced_until INTEGER NOT NULL)')
+    connection.execute('INSERT INTO spot_price_watermark VALUES (?, ?)', (SERIES.key, START + DAY))
+    connection.commit()
+    connection.close()
+    store = SpotPriceStore(path)
+    assert store.watermark(SERIES) is None
+    store.sync(FakeHistory().fake.pool(), [SERIES], start=START, end=START + DAY)
+    assert len(store.history('cn-hangzhou', 'ecs.g7.large')) == 48
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from alibabacloud_ecs20140526.tag_index import HasTag, ResourceRef, TagIndex, TagQuery
+from fakes import FakeEcs, listed_models, token_page
+
+TAGS = {
+    ('cn-hangzhou', 'instance', 'i-1'): {'team': 'payments', 'env': 'prod'},
+    ('cn-hangzhou', 'instance', 'i-2'): {'team': 'payments', 'env': 'dev'},
+    ('cn-hangzhou', 'instance', 'i-3'): {'team': 'search'},
+    ('cn-beijing', 'instance', 'i-4'): {'team': 'payments', 'env': 'prod'},
+}
+
+class FakeTags:
+    def __init__(self):
+        self.failing = set()
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        key = listed_models(query, 'Tag')[0]['Key']
+        if (region_id, key) in self.failing:
+            raise RuntimeError('listing failed')
+        rows = [
+            {'ResourceId': resource_id, 'ResourceType': resource_type, 'TagKey': tag_key, 'TagValue': tag_value}
+            for (region, resource_type, resource_id), tags in TAGS.items()
+            if region == region_id and resource_type == query['ResourceType'] and key in tags
+            for tag_key, tag_value in tags.items()
+        ]
+        return token_page(rows, query, 'TagResources', 'TagResource', default_size=2)
+
+def _index(tags: FakeTags) -> TagIndex:
+    return TagIndex(tags.fake.pool(), keys=['team'], regions=['cn-hangzhou', 'cn-beijing'])
+
+def test_tag_query_is_abstract():
+    with pytest.raises(TypeError):
+        TagQuery()
+
+def test_queries_combine_leaves():
+    index = _index(FakeTags())
+    assert index.refresh() == {}
+    assert index.ids(HasTag('team', 'payments')) == ['i-1', 'i-2', 'i-4']
+    assert index.ids(HasTag('team', 'payments') & ~HasTag('env', 'dev')) == ['i-1', 'i-4']
+    assert index.ids(HasTag('team', 'search') | HasTag('env', 'dev')) == ['i-2', 'i-3']
+    assert index.ids(~HasTag('env'), region_id='cn-hangzhou') == ['i-3']
+    assert index.tags(ResourceRef('cn-beijing', 'instance', 'i-4')) == {'team': 'payments', 'env': 'prod'}
+
+def test_failed_listing_keeps_previous_rows():
+    tags = FakeTags()
+    index = _index(tags)
+    asyncio.run(index.refresh_async())
+    tags.failing.add(('cn-beijing', 'team'))
+    errors = index.refresh()
+    assert list(errors) == [('cn-beijing', 'instance', 'team')]
+    assert index.ids(HasTag('team', 'payments'), region_id='cn-beijing') == ['i-4']
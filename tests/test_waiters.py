@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+import pytest
+
+from alibabacloud_ecs20140526.waiters import OperationWaiter, WaiterTimeout, wait_for_instances, wait_for_instances_async
+from fakes import FakeEcs, listed, page
+
+class FakeTasks:
+    """
+    Tasks that report Processing for `polls` rounds, then `final`.
+    """
+
+    def __init__(self, final, polls=1):
+        self.final = final
+        self.polls = polls
+        self.seen = {}
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        tasks = []
+        for task_id in query['TaskIds'].split(','):
+            self.seen[task_id] = self.seen.get(task_id, 0) + 1
+            status = self.final.get(task_id, 'Processing') if self.seen[task_id] > self.polls else 'Processing'
+            tasks.append({'TaskId': task_id, 'TaskStatus': status})
+        return page(tasks, query, 'TaskSet', 'Task')
+
+def _waiter(tasks: FakeTasks, **kwargs) -> OperationWaiter:
+    return OperationWaiter(tasks.fake.client(), min_interval=0.001, max_interval=0.01, **kwargs)
+
+def test_task_waits_share_calls_and_report_failures():
+    ids = [f't-{n}' for n in range(150)]
+    tasks = FakeTasks(dict(dict.fromkeys(ids, 'Finished'), **{'t-7': 'Cancelled'}))
+    waiter = _waiter(tasks)
+
+    async def main():
+        return [result async for result in waiter.wait_all('task', ids)]
+
+    results = {result.operation_id: result for result in asyncio.run(main())}
+    assert len(results) == 150
+    assert results['t-7'].status == 'Cancelled' and not results['t-7'].succeeded
+    assert all(result.succeeded for operation_id, result in results.items() if operation_id != 't-7')
+    # Two rounds of two DescribeTasks calls (100 + 50 IDs).
+    assert len(tasks.fake.calls) == 4
+
+def test_waits_time_out_by_default():
+    waiter = _waiter(FakeTasks({}), timeout=0.05)
+    with pytest.raises(WaiterTimeout) as raised:
+        asyncio.run(waiter.wait('task', 't-1'))
+    assert raised.value.pending == {'t-1': 'Processing'}
+
+class FlakyTasks(FakeTasks):
+    """
+    FakeTasks whose first `failures` calls fail, as throttled calls do.
+    """
+
+    def __init__(self, final, failures, polls=1):
+        super().__init__(final, polls)
+        self.failures = failures
+
+    def handle(self, region_id, action, query):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError('Throttling')
+        return super().handle(region_id, action, query)
+
+def test_failed_poll_keeps_operations_pending():
+    ids = [f't-{n}' for n in range(120)]
+    tasks = FlakyTasks(dict.fromkeys(ids, 'Finished'), failures=2)
+    waiter = _waiter(tasks)
+
+    async def main():
+        return [result async for result in waiter.wait_all('task', ids)]
+
+    results = asyncio.run(main())
+    assert len(results) == 120 and all(result.succeeded for result in results)
+
+def test_persistent_poll_errors_are_raised_at_the_deadline():
+    waiter = _waiter(FlakyTasks({}, failures=10 ** 6), timeout=0.05)
+    with pytest.raises(WaiterTimeout) as raised:
+        asyncio.run(waiter.wait('task', 't-1'))
+    assert raised.value.pending == {'t-1': None}
+    assert [str(error.error) for error in raised.value.errors] == ['Throttling']
+    assert isinstance(raised.value.__cause__, RuntimeError)
+
+def test_waiter_can_be_used_from_several_event_loops():
+    waiter = _waiter(FakeTasks({'t-1': 'Finished', 't-2': 'Finished'}), concurrency=1)
+    assert asyncio.run(waiter.wait('task', 't-1')).succeeded
+    assert asyncio.run(waiter.wait('task', 't-2')).succeeded
+
+def test_unknown_kind_raises():
+    with pytest.raises(ValueError):
+        asyncio.run(_waiter(FakeTasks({})).wait('snapshot', 's-1'))
+
+class FakeInstances:
+    """
+    Instances that turn Running on their `polls`-th poll. Calls that include
+    an ID of `failing` fail while `failures` lasts.
+    """
+
+    def __init__(self, polls=2, failing=(), failures=1):
+        self.polls = polls
+        self.failing = set(failing)
+        self.failures = failures
+        self.seen = {}
+        self.fake = FakeEcs(self.handle)
+
+    def handle(self, region_id, action, query):
+        ids = listed(query, 'InstanceId')
+        if self.failing & set(ids) and self.failures:
+            self.failures -= 1
+            raise RuntimeError('chunk failed')
+        statuses = []
+        for instance_id in ids:
+            # A poll reads every page of its call; count it on the first.
+            if int(query.get('PageNumber') or 1) == 1:
+                self.seen[instance_id] = self.seen.get(instance_id, 0) + 1
+            status = 'Running' if self.seen[instance_id] >= self.polls else 'Starting'
+            statuses.append({'InstanceId': instance_id, 'Status': status})
+        return page(statuses, query, 'InstanceStatuses', 'InstanceStatus')
+
+def _wait(instances: FakeInstances, ids, **kwargs):
+    return list(wait_for_instances(instances.fake.client(), ids, 'Running', min_interval=0.001,
+                                   max_interval=0.01, **kwargs))
+
+def test_instances_converge_in_few_calls():
+    ids = [f'i-{n}' for n in range(2000)]
+    instances = FakeInstances()
+    events = _wait(instances, ids)
+    assert sorted(event.instance_id for event in events) == sorted(ids)
+    # Two rounds of 20 chunks of 100 IDs, read in pages of 50.
+    assert len(instances.fake.calls) == 80
+
+def test_failed_chunk_is_polled_again():
+    ids = [f'i-{n}' for n in range(250)]
+    instances = FakeInstances(polls=1, failing=['i-120'])
+    events = asyncio.run(_collect(wait_for_instances_async(
+        instances.fake.client(), ids, 'Running', min_interval=0.001, max_interval=0.01)))
+    assert sorted(event.instance_id for event in events) == sorted(ids)
+
+def test_persistent_errors_are_raised_at_the_deadline():
+    instances = FakeInstances(polls=1, failing=['i-0'], failures=10 ** 6)
+    with pytest.raises(WaiterTimeout) as raised:
+        _wait(instances, ['i-0', 'i-1'], timeout=0.05)
+    assert raised.value.pending == {'i-0': None, 'i-1': None}
+    assert raised.value.errors[0].ids == ['i-0', 'i-1']
+    assert isinstance(raised.value.__cause__, RuntimeError)
+
+async def _collect(events):
+    return [event async for event in events]
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Regenerates the tables the client is driven by from the generated model
+modules, so they follow the models when those are regenerated for a new
+API version:
+
+- alibabacloud_ecs20140526/models/_model_fields.py, the fields of every
+  model, read from its from_map;
+- alibabacloud_ecs20140526/_action_specs.py, the query fields of every
+  action, read from its request model.
+
+Run from the repository root:
+
+    python tools/generate_tables.py
+
+With --check, nothing is written and the exit status is 1 if either file
+is out of date.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.join(ROOT, 'alibabacloud_ecs20140526')
+MODELS = os.path.join(PACKAGE, 'models')
+MODEL_FIELDS_PATH = os.path.join(MODELS, '_model_fields.py')
+ACTION_SPECS_PATH = os.path.join(PACKAGE, '_action_specs.py')
+
+HEADER = """# -*- coding: utf-8 -*-
+# This file is generated by tools/generate_tables.py from the models; don't
+# edit it, rerun the script instead.
+from __future__ import annotations
+"""
+
+SCALAR, MODEL, MODEL_LIST = 'SCALAR', 'MODEL', 'MODEL_LIST'
+
+# Every ECS action is an RPC-style POST.
+METHOD, STYLE = 'POST', 'RPC'
+
+# Every *ShrinkRequest of this API version serializes its complex fields
+# as JSON.
+SHRINK_STYLE = 'json'
+
+# (wire name, attribute, kind, nested model name)
+Field = Tuple[str, str, str, Optional[str]]
+
+def _wire_name(test: ast.expr) -> Optional[str]:
+    # m.get('Name') is not None
+    if (isinstance(test, ast.Compare) and isinstance(test.left, ast.Call)
+            and isinstance(test.left.func, ast.Attribute) and test.left.func.attr == 'get'
+            and test.left.args and isinstance(test.left.args[0], ast.Constant)):
+        return test.left.args[0].value
+    return None
+
+def _self_attribute(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'self':
+        return node.attr
+    return None
+
+def _model_name(node: ast.AST) -> Optional[str]:
+    # temp_model = main_models.Name()
+    if (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)):
+        return node.value.func.attr
+    return None
+
+def _field(class_name: str, wire_name: str, body: List[ast.stmt]) -> Field:
+    if len(body) == 1 and isinstance(body[0], ast.For):
+        loop = body[0].body
+        append = loop[-1].value
+        return wire_name, _self_attribute(append.func.value), MODEL_LIST, _model_name(loop[0])
+    if len(body) == 2:
+        return wire_name, _self_attribute(body[1].targets[0]), MODEL, _model_name(body[0])
+    if len(body) == 1 and isinstance(body[0], ast.Assign):
+        return wire_name, _self_attribute(body[0].targets[0]), SCALAR, None
+    raise ValueError(f'{class_name}.from_map: unexpected code for {wire_name!r}')
+
+def model_fields() -> Dict[str, Tuple[Field, ...]]:
+    models = {}
+    for file_name in sorted(os.listdir(MODELS)):
+        if not file_name.endswith('.py') or file_name in ('__init__.py', '_model_fields.py'):
+            continue
+        with open(os.path.join(MODELS, file_name), encoding='utf-8') as f:
+            tree = ast.parse(f.read(), file_name)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            from_map = next(item for item in node.body if isinstance(item, ast.FunctionDef) and item.name == 'from_map')
+            fields = []
+            for statement in from_map.body:
+                wire_name = _wire_name(statement.test) if isinstance(statement, ast.If) else None
+                if wire_name is not None:
+                    fields.append(_field(node.name, wire_name, statement.body))
+            models[node.name] = tuple(fields)
+    return dict(sorted(models.items()))
+
+def action_specs(models: Dict[str, Tuple[Field, ...]]) -> Dict[str, Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]]:
+    specs = {}
+    for name in models:
+        action = name[:-len('Request')]
+        if not name.endswith('Request') or name.endswith('ShrinkRequest') or f'{action}Response' not in models:
+            continue
+        shrink_name = f'{action}ShrinkRequest'
+        request = models.get(shrink_name, models[name])
+        query = [(attribute, wire_name) for wire_name, attribute, kind, nested in request]
+        shrink = []
+        if shrink_name in models:
+            shrink = [(attribute[:-len('_shrink')], wire_name, SHRINK_STYLE)
+                      for wire_name, attribute, kind, nested in request if attribute.endswith('_shrink')]
+        specs[action] = query, shrink
+    return specs
+
+def render_model_fields(models: Dict[str, Tuple[Field, ...]]) -> str:
+    lines = [
+        HEADER,
+        '# Field kinds of MODEL_FIELDS entries.',
+        'SCALAR = 0',
+        'MODEL = 1',
+        'MODEL_LIST = 2',
+        '',
+        '# model name -> ((wire name, attribute, kind, nested model name), ...),',
+        '# mirroring the generated from_map of every model.',
+        'MODEL_FIELDS = {',
+    ]
+    for name, fields in models.items():
+        if not fields:
+            lines.append(f'    {name!r}: (),')
+            continue
+        lines.append(f'    {name!r}: (')
+        for wire_name, attribute, kind, nested in fields:
+            lines.append(f'        ({wire_name!r}, {attribute!r}, {kind}, {nested!r}),')
+        lines.append('    ),')
+    return _close('\n'.join(lines))
+
+def render_action_specs(specs: Dict[str, Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]]) -> str:
+    lines = [
+        HEADER,
+        'from typing import NamedTuple, Tuple',
+        '',
+        'class ActionSpec(NamedTuple):',
+        '    method: str',
+        '    style: str',
+        '    # (attribute, wire name) pairs copied into the query when not None.',
+        '    query: Tuple[Tuple[str, str], ...]',
+        '    # (attribute, wire name, style) of complex fields serialized into',
+        '    # `<attribute>_shrink` on the matching *ShrinkRequest.',
+        '    shrink: Tuple[Tuple[str, str, str], ...] = ()',
+        '',
+        'ACTION_SPECS = {',
+    ]
+    for action, (query, shrink) in sorted(specs.items()):
+        if not query:
+            lines.append(f'    {action!r}: ActionSpec({METHOD!r}, {STYLE!r}, ()),')
+            continue
+        lines.append(f'    {action!r}: ActionSpec({METHOD!r}, {STYLE!r}, (')
+        lines.extend(f'        {pair!r},' for pair in query)
+        if shrink:
+            lines.append('    ), (')
+            lines.extend(f'        {field!r},' for field in shrink)
+        lines.append('    )),')
+    return _close('\n'.join(lines))
+
+def _close(text: str) -> str:
+    # The last entry has no trailing comma.
+    return text[:-1] + '\n}\n'
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true', help='only report whether the files are up to date')
+    args = parser.parse_args(argv)
+    models = model_fields()
+    outputs = {
+        MODEL_FIELDS_PATH: render_model_fields(models),
+        ACTION_SPECS_PATH: render_action_specs(action_specs(models)),
+    }
+    stale = []
+    for path, text in outputs.items():
+        with open(path, encoding='utf-8') as f:
+            current = f.read()
+        if current == text:
+            continue
+        stale.append(os.path.relpath(path, ROOT))
+        if not args.check:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+    for path in stale:
+        print(f'{path} is out of date' if args.check else f'wrote {path}')
+    return 1 if args.check and stale else 0
+
+if __name__ == '__main__':
+    sys.exit(main())